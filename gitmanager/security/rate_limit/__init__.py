@@ -7,13 +7,23 @@ API 속도 제한(Rate Limiting) 모듈
 from gitmanager.security.rate_limit.core import RateLimiter
 from gitmanager.security.rate_limit.middleware import RateLimitMiddleware
 from gitmanager.security.rate_limit.storage import RateLimitStorage, RedisStorage, InMemoryStorage
+from gitmanager.security.rate_limit.engine import (
+    RateLimitBackend,
+    RateLimitResult,
+    MemoryRateLimitBackend,
+    RedisRateLimitBackend,
+)
 
 __all__ = [
     'RateLimiter',
     'RateLimitMiddleware',
     'RateLimitStorage',
     'RedisStorage',
-    'InMemoryStorage'
+    'InMemoryStorage',
+    'RateLimitBackend',
+    'RateLimitResult',
+    'MemoryRateLimitBackend',
+    'RedisRateLimitBackend'
 ]
 
 __version__ = "0.1.0" 
\ No newline at end of file
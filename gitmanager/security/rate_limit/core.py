@@ -1,15 +1,13 @@
 """
 속도 제한(Rate Limiting) 코어 모듈
 
-이 모듈은 토큰 버킷 알고리즘을 사용한 API 속도 제한 기능의 핵심 로직을 제공합니다.
+이 모듈은 GCRA 엔진을 사용한 API 속도 제한 기능의 핵심 로직을 제공합니다.
 """
 
-import time
 import logging
-from typing import Dict, Tuple, Any, Optional, Union, List
-from datetime import datetime, timedelta
-import threading
+from typing import Dict, Tuple, Any, Optional
 
+from gitmanager.security.rate_limit.engine import RateLimitResult
 from gitmanager.security.rate_limit.storage import RateLimitStorage, InMemoryStorage
 
 # 로거 설정
@@ -19,8 +17,10 @@ class RateLimiter:
     """
     API 요청에 대한 속도 제한을 관리하는 클래스
     
-    토큰 버킷 알고리즘을 사용하여 요청 속도를 제한합니다.
+    GCRA(슬라이딩 윈도우) 알고리즘을 사용하여 요청 속도를 제한합니다.
     기본적으로 인메모리 스토리지를 사용하지만, Redis 등의 외부 스토리지도 사용 가능합니다.
+    비동기 코드에서는 ``acheck_rate_limit`` 을 사용하며, 동기 메서드는 인메모리
+    스토리지에서만 동작합니다.
     """
     
     def __init__(
@@ -43,7 +43,6 @@ class RateLimiter:
         self.default_limit = default_limit
         self.default_window = default_window
         self.admin_limit_multiplier = admin_limit_multiplier
-        self._lock = threading.RLock()
         
         # API 엔드포인트별 기본 제한 설정
         self.endpoint_limits = {
@@ -78,6 +77,23 @@ class RateLimiter:
         
         return base_limit
         
+    def _storage_key(self, key: str, endpoint: str) -> str:
+        """키와 엔드포인트를 조합한 스토리지 키 생성"""
+        return f"{key}:{endpoint}"
+
+    def _sync_storage(self) -> InMemoryStorage:
+        """동기 메서드용 스토리지 (인메모리만 지원)"""
+        if not hasattr(self.storage, "hit_nowait"):
+            raise TypeError(
+                "동기 속도 제한 검사는 인메모리 스토리지에서만 지원됩니다. "
+                "acheck_rate_limit 을 사용하세요."
+            )
+        return self.storage
+
+    def _limit_info(self, result: RateLimitResult) -> Dict[str, Any]:
+        """검사 결과를 제한 정보로 변환"""
+        return result.to_limit_info()
+
     def check_rate_limit(
         self,
         key: str,
@@ -97,39 +113,36 @@ class RateLimiter:
         Returns:
             Tuple[bool, Dict]: (허용 여부, 제한 정보)
         """
-        if window is None:
-            window = self.default_window
-            
         limit = self.get_limit_for_endpoint(endpoint, is_admin)
+        result = self._sync_storage().hit_nowait(
+            self._storage_key(key, endpoint), limit, window or self.default_window
+        )
+        return result.allowed, self._limit_info(result)
+
+    async def acheck_rate_limit(
+        self,
+        key: str,
+        endpoint: str = "default",
+        is_admin: bool = False,
+        window: Optional[int] = None
+    ) -> Tuple[bool, Dict[str, Any]]:
+        """
+        ``check_rate_limit`` 의 비동기 버전 (모든 스토리지 지원)
         
-        # 스토리지에서 현재 요청 수 가져오기
-        with self._lock:
-            current_requests = self.storage.get(key, endpoint)
-            
-            if current_requests is None:
-                # 첫 요청인 경우
-                current_requests = 0
-                
-            # 허용 여부 결정
-            allowed = current_requests < limit
-            
-            # 카운터 증가
-            if allowed:
-                self.storage.increment(key, endpoint, window)
-                current_requests += 1
-                
-            # 제한 정보 구성
-            reset_time = int(time.time() + window)
-            remaining = max(0, limit - current_requests)
-            
-            limit_info = {
-                "limit": limit,
-                "remaining": remaining,
-                "reset": reset_time,
-                "window": window
-            }
+        Args:
+            key: 속도 제한을 적용할 키(사용자 ID, IP 등)
+            endpoint: API 엔드포인트 이름
+            is_admin: 관리자 사용자 여부
+            window: 시간 윈도우(초). 기본값은 self.default_window
             
-            return allowed, limit_info
+        Returns:
+            Tuple[bool, Dict]: (허용 여부, 제한 정보)
+        """
+        limit = self.get_limit_for_endpoint(endpoint, is_admin)
+        result = await self.storage.hit(
+            self._storage_key(key, endpoint), limit, window or self.default_window
+        )
+        return result.allowed, self._limit_info(result)
             
     def reset_counter(self, key: str, endpoint: str = "default") -> None:
         """
@@ -139,8 +152,17 @@ class RateLimiter:
             key: 초기화할 키
             endpoint: API 엔드포인트 이름
         """
-        with self._lock:
-            self.storage.delete(key, endpoint)
+        self._sync_storage().reset_nowait(self._storage_key(key, endpoint))
+
+    async def areset_counter(self, key: str, endpoint: str = "default") -> None:
+        """
+        ``reset_counter`` 의 비동기 버전
+        
+        Args:
+            key: 초기화할 키
+            endpoint: API 엔드포인트 이름
+        """
+        await self.storage.reset(self._storage_key(key, endpoint))
             
     def get_limit_info(self, key: str, endpoint: str = "default", is_admin: bool = False) -> Dict[str, Any]:
         """
@@ -155,20 +177,7 @@ class RateLimiter:
             Dict: 제한 정보
         """
         limit = self.get_limit_for_endpoint(endpoint, is_admin)
-        
-        with self._lock:
-            current_requests = self.storage.get(key, endpoint) or 0
-            window_expiry = self.storage.get_expiry(key, endpoint)
-            
-            # 만료 시간 계산
-            if window_expiry:
-                reset_time = window_expiry
-            else:
-                reset_time = int(time.time() + self.default_window)
-                
-            return {
-                "limit": limit,
-                "remaining": max(0, limit - current_requests),
-                "reset": reset_time,
-                "window": self.default_window
-            } 
\ No newline at end of file
+        result = self._sync_storage().peek_nowait(
+            self._storage_key(key, endpoint), limit, self.default_window
+        )
+        return self._limit_info(result)
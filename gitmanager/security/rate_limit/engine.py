@@ -0,0 +1,410 @@
+"""
+속도 제한(Rate Limiting) 엔진 모듈
+
+GCRA(Generic Cell Rate Algorithm) 기반의 공용 속도 제한 엔진을 제공합니다.
+GCRA 는 "window 동안 limit 회" 를 요청 간격(window / limit) 단위로 균등하게 배분하는
+슬라이딩 윈도우 방식으로, 키마다 이론적 도착 시각(TAT) 하나만 저장하므로
+요청당 비용과 키당 메모리가 모두 O(1) 입니다. 고정 윈도우와 달리 윈도우 경계에서
+두 배의 요청이 몰리는 문제가 없습니다.
+
+- MemoryRateLimitBackend: 크기가 제한된 인메모리 백엔드 (LRU 축출 + 백그라운드 만료)
+- RedisRateLimitBackend: 검사 1회당 Lua 스크립트 1회 실행으로 원자적 처리하는 Redis 백엔드
+"""
+
+import asyncio
+import inspect
+import logging
+import math
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+# 인메모리 백엔드 기본 최대 키 수
+DEFAULT_MAX_KEYS = 100_000
+
+# 인메모리 백엔드 만료 정리 주기(초)
+DEFAULT_CLEANUP_INTERVAL = 30.0
+
+
+@dataclass
+class RateLimitResult:
+    """속도 제한 검사 결과"""
+
+    allowed: bool
+    limit: int
+    remaining: int
+    retry_after: float
+    reset_after: float
+    window: int
+
+    @property
+    def reset(self) -> int:
+        """버킷이 완전히 비워지는 시각 (UNIX 타임스탬프)"""
+        return int(math.ceil(time.time() + self.reset_after))
+
+    def to_limit_info(self) -> Dict[str, Any]:
+        """
+        응답 헤더용 제한 정보로 변환합니다.
+
+        Returns:
+            Dict: limit, remaining, reset, window, retry_after
+        """
+        return {
+            "limit": self.limit,
+            "remaining": self.remaining,
+            "reset": self.reset,
+            "window": self.window,
+            "retry_after": int(math.ceil(self.retry_after)),
+        }
+
+
+def gcra(
+    tat: Optional[float], now: float, limit: int, window: float, cost: int = 1
+) -> Tuple[RateLimitResult, Optional[float]]:
+    """
+    GCRA 검사를 수행합니다.
+
+    Args:
+        tat: 저장된 이론적 도착 시각 (없으면 None)
+        now: 현재 시각(초)
+        limit: 윈도우당 허용 요청 수 (최대 버스트)
+        window: 윈도우 크기(초)
+        cost: 이번 요청의 비용
+
+    Returns:
+        Tuple[RateLimitResult, Optional[float]]: (검사 결과, 저장할 새 TAT. 거부 시 None)
+    """
+    interval = window / limit
+    tat = now if tat is None else max(tat, now)
+    new_tat = tat + interval * cost
+    allow_at = new_tat - window
+    diff = now - allow_at
+
+    if diff < 0:
+        remaining = max(0, int((now - (tat - window)) // interval))
+        result = RateLimitResult(
+            allowed=False,
+            limit=limit,
+            remaining=remaining,
+            retry_after=-diff,
+            reset_after=tat - now,
+            window=int(window),
+        )
+        return result, None
+
+    result = RateLimitResult(
+        allowed=True,
+        limit=limit,
+        remaining=int(diff // interval),
+        retry_after=0.0,
+        reset_after=new_tat - now,
+        window=int(window),
+    )
+    return result, new_tat
+
+
+class RateLimitBackend(ABC):
+    """속도 제한 상태 저장소의 추상 기본 클래스"""
+
+    @abstractmethod
+    async def hit(
+        self, key: str, limit: int, window: int, cost: int = 1
+    ) -> RateLimitResult:
+        """
+        요청 1건을 기록하고 허용 여부를 반환합니다.
+
+        Args:
+            key: 속도 제한 키 (클라이언트/엔드포인트 조합)
+            limit: 윈도우당 허용 요청 수
+            window: 윈도우 크기(초)
+            cost: 요청 비용
+
+        Returns:
+            RateLimitResult: 검사 결과
+        """
+
+    @abstractmethod
+    async def peek(self, key: str, limit: int, window: int) -> RateLimitResult:
+        """
+        요청을 기록하지 않고 현재 상태를 조회합니다.
+
+        Args:
+            key: 속도 제한 키
+            limit: 윈도우당 허용 요청 수
+            window: 윈도우 크기(초)
+
+        Returns:
+            RateLimitResult: 현재 상태
+        """
+
+    @abstractmethod
+    async def reset(self, key: str) -> None:
+        """
+        키의 상태를 초기화합니다.
+
+        Args:
+            key: 속도 제한 키
+        """
+
+    async def close(self) -> None:
+        """백엔드 자원을 정리합니다."""
+
+
+class MemoryRateLimitBackend(RateLimitBackend):
+    """
+    크기가 제한된 인메모리 속도 제한 백엔드
+
+    키마다 TAT 하나만 저장하며 TAT 가 지나면 만료된 키입니다. 키 수가 ``max_keys`` 를 넘으면 가장 오래
+    사용되지 않은 키를 축출하고, 만료된 키는 백그라운드 작업이 주기적으로 정리합니다.
+    단일 프로세스 기준이므로 다중 워커 환경에서는 Redis 백엔드를 사용해야 합니다.
+    """
+
+    def __init__(
+        self,
+        max_keys: int = DEFAULT_MAX_KEYS,
+        cleanup_interval: float = DEFAULT_CLEANUP_INTERVAL,
+    ):
+        """
+        MemoryRateLimitBackend 초기화
+
+        Args:
+            max_keys: 보관할 최대 키 수
+            cleanup_interval: 만료 키 정리 주기(초)
+        """
+        self.max_keys = max_keys
+        self.cleanup_interval = cleanup_interval
+        self._entries: "OrderedDict[str, float]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._cleanup_task: Optional[asyncio.Task] = None
+        self._last_cleanup = time.monotonic()
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def hit_nowait(
+        self, key: str, limit: int, window: int, cost: int = 1
+    ) -> RateLimitResult:
+        """
+        ``hit`` 의 동기 버전 (이벤트 루프 밖에서 사용)
+
+        Args:
+            key: 속도 제한 키
+            limit: 윈도우당 허용 요청 수
+            window: 윈도우 크기(초)
+            cost: 요청 비용
+
+        Returns:
+            RateLimitResult: 검사 결과
+        """
+        now = time.time()
+        with self._lock:
+            result, new_tat = gcra(self._entries.get(key), now, limit, window, cost)
+            if new_tat is not None:
+                self._entries[key] = new_tat
+                self._entries.move_to_end(key)
+                if len(self._entries) > self.max_keys:
+                    self._entries.popitem(last=False)
+                    self.evictions += 1
+        self._maybe_cleanup()
+        return result
+
+    def peek_nowait(self, key: str, limit: int, window: int) -> RateLimitResult:
+        """``peek`` 의 동기 버전"""
+        result, _ = gcra(self._entries.get(key), time.time(), limit, window, cost=0)
+        return result
+
+    def reset_nowait(self, key: str) -> None:
+        """``reset`` 의 동기 버전"""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    async def hit(
+        self, key: str, limit: int, window: int, cost: int = 1
+    ) -> RateLimitResult:
+        """요청 기록 및 허용 여부 확인"""
+        self._ensure_cleanup_task()
+        return self.hit_nowait(key, limit, window, cost)
+
+    async def peek(self, key: str, limit: int, window: int) -> RateLimitResult:
+        """현재 상태 조회"""
+        return self.peek_nowait(key, limit, window)
+
+    async def reset(self, key: str) -> None:
+        """키 상태 초기화"""
+        self.reset_nowait(key)
+
+    def cleanup_expired(self) -> int:
+        """
+        만료된 키를 정리합니다.
+
+        Returns:
+            int: 정리된 키 수
+        """
+        now = time.time()
+        with self._lock:
+            expired = [key for key, tat in self._entries.items() if tat <= now]
+            for key in expired:
+                del self._entries[key]
+        self._last_cleanup = time.monotonic()
+        return len(expired)
+
+    def _maybe_cleanup(self) -> None:
+        """백그라운드 작업이 없을 때 (동기 사용) 주기가 지나면 정리"""
+        if self._cleanup_task is None and (
+            time.monotonic() - self._last_cleanup >= self.cleanup_interval
+        ):
+            self.cleanup_expired()
+
+    def _ensure_cleanup_task(self) -> None:
+        """실행 중인 이벤트 루프에 만료 정리 작업 등록"""
+        if self._cleanup_task is not None and not self._cleanup_task.done():
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._cleanup_task = loop.create_task(self._cleanup_loop())
+
+    async def _cleanup_loop(self) -> None:
+        """만료 키 주기적 정리"""
+        while True:
+            await asyncio.sleep(self.cleanup_interval)
+            removed = self.cleanup_expired()
+            if removed:
+                logger.debug(f"만료된 속도 제한 키 {removed}개 정리")
+
+    async def close(self) -> None:
+        """백그라운드 정리 작업 중지"""
+        if self._cleanup_task is not None:
+            self._cleanup_task.cancel()
+            try:
+                await self._cleanup_task
+            except asyncio.CancelledError:
+                pass
+            self._cleanup_task = None
+
+
+# KEYS[1]: 키, ARGV: limit, window(초), cost
+# 반환: {허용 여부, 남은 요청 수, 재시도 대기(ms), 리셋까지 남은 시간(ms)}
+GCRA_LUA_SCRIPT = """
+local limit = tonumber(ARGV[1])
+local window_ms = tonumber(ARGV[2]) * 1000
+local cost = tonumber(ARGV[3])
+local interval = window_ms / limit
+
+local time = redis.call('TIME')
+local now = tonumber(time[1]) * 1000 + math.floor(tonumber(time[2]) / 1000)
+
+local tat = tonumber(redis.call('GET', KEYS[1]))
+if not tat or tat < now then
+    tat = now
+end
+
+local new_tat = tat + interval * cost
+local diff = now - (new_tat - window_ms)
+
+if diff < 0 then
+    local remaining = math.floor((now - (tat - window_ms)) / interval)
+    if remaining < 0 then
+        remaining = 0
+    end
+    return {0, remaining, math.ceil(-diff), math.ceil(tat - now)}
+end
+
+if cost > 0 then
+    redis.call('SET', KEYS[1], string.format('%.0f', new_tat), 'PX', math.ceil(new_tat - now))
+end
+return {1, math.floor(diff / interval), 0, math.ceil(new_tat - now)}
+"""
+
+
+class RedisRateLimitBackend(RateLimitBackend):
+    """
+    Redis 기반 속도 제한 백엔드
+
+    검사마다 GCRA Lua 스크립트를 한 번 실행하므로 왕복 1회로 원자적으로 처리되며,
+    시각은 Redis 서버 시간을 사용해 워커 간 시계 차이의 영향을 받지 않습니다.
+    ``redis.asyncio`` 클라이언트를 권장하며, 동기 클라이언트는 스레드에서 실행합니다.
+    """
+
+    def __init__(
+        self,
+        redis_client: Any,
+        key_prefix: str = "rate_limit",
+        fail_open: bool = True,
+    ):
+        """
+        RedisRateLimitBackend 초기화
+
+        Args:
+            redis_client: Redis 클라이언트 (``redis.asyncio.Redis`` 또는 ``redis.Redis``)
+            key_prefix: Redis 키 접두사
+            fail_open: Redis 오류 시 요청을 허용할지 여부
+        """
+        self.redis = redis_client
+        self.key_prefix = key_prefix
+        self.fail_open = fail_open
+        self._is_async = inspect.iscoroutinefunction(
+            getattr(redis_client, "execute_command", None)
+        )
+        self._script = redis_client.register_script(GCRA_LUA_SCRIPT)
+
+    def _redis_key(self, key: str) -> str:
+        """Redis 키 생성"""
+        return f"{self.key_prefix}:{key}"
+
+    async def _call(self, func: Any, *args: Any, **kwargs: Any) -> Any:
+        """비동기 클라이언트는 대기, 동기 클라이언트는 스레드에서 실행"""
+        if self._is_async:
+            return await func(*args, **kwargs)
+        return await asyncio.to_thread(func, *args, **kwargs)
+
+    async def _run(self, key: str, limit: int, window: int, cost: int) -> RateLimitResult:
+        """GCRA 스크립트 실행"""
+        try:
+            allowed, remaining, retry_ms, reset_ms = await self._call(
+                self._script,
+                keys=[self._redis_key(key)],
+                args=[limit, window, cost],
+            )
+        except Exception as e:
+            if not self.fail_open:
+                raise
+            logger.warning(f"Redis 속도 제한 검사 실패, 요청 허용: {str(e)}")
+            return RateLimitResult(
+                allowed=True,
+                limit=limit,
+                remaining=limit,
+                retry_after=0.0,
+                reset_after=0.0,
+                window=window,
+            )
+        return RateLimitResult(
+            allowed=bool(int(allowed)),
+            limit=limit,
+            remaining=int(remaining),
+            retry_after=int(retry_ms) / 1000,
+            reset_after=int(reset_ms) / 1000,
+            window=window,
+        )
+
+    async def hit(
+        self, key: str, limit: int, window: int, cost: int = 1
+    ) -> RateLimitResult:
+        """요청 기록 및 허용 여부 확인"""
+        return await self._run(key, limit, window, cost)
+
+    async def peek(self, key: str, limit: int, window: int) -> RateLimitResult:
+        """현재 상태 조회 (비용 0 으로 실행)"""
+        return await self._run(key, limit, window, 0)
+
+    async def reset(self, key: str) -> None:
+        """키 상태 초기화"""
+        await self._call(self.redis.delete, self._redis_key(key))
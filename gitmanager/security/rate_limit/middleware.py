@@ -4,7 +4,6 @@
 이 모듈은 FastAPI와 함께 사용할 수 있는 API 속도 제한 미들웨어를 제공합니다.
 """
 
-import time
 import logging
 from typing import Callable, Dict, Any, Optional, Union
 import json
@@ -85,7 +84,7 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         is_admin = await self._is_admin_request(request)
         
         # 속도 제한 확인
-        allowed, limit_info = self.rate_limiter.check_rate_limit(
+        allowed, limit_info = await self.rate_limiter.acheck_rate_limit(
             key=client_id,
             endpoint=endpoint,
             is_admin=is_admin
@@ -226,7 +225,7 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
                 "success": False,
                 "message": "요청 횟수가 너무 많습니다. 잠시 후 다시 시도하세요.",
                 "error_code": "RATE_LIMIT_EXCEEDED",
-                "retry_after": limit_info["reset"] - int(time.time())
+                "retry_after": limit_info["retry_after"]
             }
         )
         
@@ -234,6 +233,6 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         response.headers["X-RateLimit-Limit"] = str(limit_info["limit"])
         response.headers["X-RateLimit-Remaining"] = "0"
         response.headers["X-RateLimit-Reset"] = str(limit_info["reset"])
-        response.headers["Retry-After"] = str(limit_info["reset"] - int(time.time()))
+        response.headers["Retry-After"] = str(limit_info["retry_after"])
         
         return response 
\ No newline at end of file
@@ -0,0 +1,148 @@
+"""
+GCRA 속도 제한 엔진에 대한 테스트 모듈
+
+이 모듈은 GCRA 계산, 인메모리 백엔드의 거부/조회/초기화/축출/만료 정리와
+Redis 백엔드의 오류 처리(fail-open/fail-closed)를 테스트합니다.
+"""
+
+import asyncio
+import unittest
+from unittest.mock import patch
+
+from gitmanager.security.rate_limit.engine import (MemoryRateLimitBackend,
+                                                   RateLimitBackend,
+                                                   RedisRateLimitBackend, gcra)
+
+
+class FailingRedis:
+    """스크립트 실행이 항상 실패하는 Redis 클라이언트"""
+
+    def register_script(self, script):
+        def run(keys, args):
+            raise ConnectionError("redis unavailable")
+
+        return run
+
+    def delete(self, key):
+        raise ConnectionError("redis unavailable")
+
+
+class TestGcra(unittest.TestCase):
+    """gcra 함수 테스트"""
+
+    def test_burst_then_deny(self):
+        """limit 만큼 허용한 뒤 거부하고 재시도 대기 시간을 계산하는지 테스트"""
+        tat = None
+        for expected_remaining in (2, 1, 0):
+            result, tat = gcra(tat, 100.0, 3, 30)
+            self.assertTrue(result.allowed)
+            self.assertEqual(result.remaining, expected_remaining)
+
+        result, new_tat = gcra(tat, 100.0, 3, 30)
+        self.assertFalse(result.allowed)
+        self.assertIsNone(new_tat)
+        self.assertAlmostEqual(result.retry_after, 10.0)
+
+        # 간격(window / limit)만큼 지나면 다시 1건 허용
+        result, _ = gcra(tat, 110.0, 3, 30)
+        self.assertTrue(result.allowed)
+
+    def test_cost_larger_than_limit_is_denied(self):
+        """한 번에 limit 보다 큰 비용은 빈 버킷에서도 거부되는지 테스트"""
+        result, new_tat = gcra(None, 0.0, 3, 30, cost=4)
+        self.assertFalse(result.allowed)
+        self.assertIsNone(new_tat)
+
+    def test_peek_does_not_consume(self):
+        """비용 0 검사는 상태를 바꾸지 않는지 테스트"""
+        _, tat = gcra(None, 0.0, 2, 10)
+        result, new_tat = gcra(tat, 0.0, 2, 10, cost=0)
+        self.assertTrue(result.allowed)
+        self.assertEqual(result.remaining, 1)
+        self.assertEqual(new_tat, tat)
+
+
+class TestMemoryRateLimitBackend(unittest.TestCase):
+    """MemoryRateLimitBackend 클래스 테스트"""
+
+    def setUp(self):
+        """테스트 셋업"""
+        self.backend = MemoryRateLimitBackend(max_keys=2, cleanup_interval=3600)
+
+    def test_backend_interface_is_abstract(self):
+        """추상 기본 클래스는 생성할 수 없는지 테스트"""
+        with self.assertRaises(TypeError):
+            RateLimitBackend()
+
+    def test_deny_peek_and_reset(self):
+        """거부, 조회, 초기화 테스트"""
+
+        async def scenario():
+            first = await self.backend.hit("client", 1, 60)
+            denied = await self.backend.hit("client", 1, 60)
+            peeked = await self.backend.peek("client", 1, 60)
+            await self.backend.reset("client")
+            after_reset = await self.backend.hit("client", 1, 60)
+            await self.backend.close()
+            return first, denied, peeked, after_reset
+
+        first, denied, peeked, after_reset = asyncio.run(scenario())
+        self.assertTrue(first.allowed)
+        self.assertFalse(denied.allowed)
+        self.assertGreater(denied.to_limit_info()["retry_after"], 0)
+        self.assertEqual(peeked.remaining, 0)
+        self.assertTrue(after_reset.allowed)
+
+    def test_lru_eviction(self):
+        """최대 키 수를 넘으면 가장 오래 사용하지 않은 키를 축출하는지 테스트"""
+        for key in ("a", "b", "a", "c"):
+            self.backend.hit_nowait(key, 10, 60)
+        self.assertEqual(len(self.backend), 2)
+        self.assertEqual(self.backend.evictions, 1)
+        self.assertEqual(self.backend.peek_nowait("b", 10, 60).remaining, 10)
+        self.assertEqual(self.backend.peek_nowait("a", 10, 60).remaining, 8)
+
+    def test_cleanup_expired(self):
+        """TAT 가 지난 키만 정리하는지 테스트"""
+        with patch("gitmanager.security.rate_limit.engine.time.time", return_value=0.0):
+            self.backend.hit_nowait("short", 1, 1)
+            self.backend.hit_nowait("long", 1, 100)
+        with patch("gitmanager.security.rate_limit.engine.time.time", return_value=10.0):
+            self.assertEqual(self.backend.cleanup_expired(), 1)
+        self.assertEqual(len(self.backend), 1)
+
+    def test_close_stops_cleanup_task(self):
+        """close 가 백그라운드 정리 작업을 중지하는지 테스트"""
+
+        async def scenario():
+            await self.backend.hit("client", 1, 60)
+            task = self.backend._cleanup_task
+            await self.backend.close()
+            return task
+
+        task = asyncio.run(scenario())
+        self.assertTrue(task.cancelled())
+        self.assertIsNone(self.backend._cleanup_task)
+
+
+class TestRedisRateLimitBackend(unittest.TestCase):
+    """RedisRateLimitBackend 오류 처리 테스트"""
+
+    def test_fail_open_allows_request(self):
+        """fail_open 이면 Redis 오류 시 요청을 허용하는지 테스트"""
+        backend = RedisRateLimitBackend(FailingRedis())
+        result = asyncio.run(backend.hit("client", 5, 60))
+        self.assertTrue(result.allowed)
+        self.assertEqual(result.remaining, 5)
+
+    def test_fail_closed_raises(self):
+        """fail_open=False 이면 Redis 오류를 그대로 전달하는지 테스트"""
+        backend = RedisRateLimitBackend(FailingRedis(), fail_open=False)
+        with self.assertRaises(ConnectionError):
+            asyncio.run(backend.hit("client", 5, 60))
+        with self.assertRaises(ConnectionError):
+            asyncio.run(backend.reset("client"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -13,9 +13,8 @@ DB_URL = f"sqlite:///{DB_PATH}"
 
 def create_tables():
     try:
-        # 모델 임포트
-        from src.models.location import VehicleLocation
-        from src.models.base import Base
+        # 파티션 매니저 임포트 (VehicleLocation 모델은 매니저가 로드)
+        from src.core.partitioning import vehicle_location_partitions
         
         print("모델을 성공적으로 임포트했습니다.")
         print(f"데이터베이스 경로: {DB_PATH}")
@@ -25,7 +24,9 @@ def create_tables():
         
         # 테이블 생성 (VehicleLocation 모델만)
         # 주의: 이 방법은 해당 모델과 연관된 테이블만 생성합니다
-        VehicleLocation.__table__.create(engine, checkfirst=True)
+        # PostgreSQL 에서는 시간 범위 파티션 부모 테이블로 생성됩니다
+        with engine.begin() as conn:
+            vehicle_location_partitions().create_parent(conn)
         
         print("\nVehicleLocation 테이블이 성공적으로 생성되었습니다.")
         
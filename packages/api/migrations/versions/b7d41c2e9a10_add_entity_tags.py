@@ -0,0 +1,81 @@
+"""Add normalized entity tag index
+
+Revision ID: b7d41c2e9a10
+Revises: 980e6594b9b3
+Create Date: 2026-10-18 10:12:31.402118
+
+"""
+
+import json
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "b7d41c2e9a10"
+down_revision = "980e6594b9b3"
+branch_labels = None
+depends_on = None
+
+BACKFILL_BATCH_SIZE = 1000
+
+
+def upgrade() -> None:
+    op.create_table(
+        "entity_tags",
+        sa.Column("entity_type", sa.String(length=50), nullable=False),
+        sa.Column("entity_id", sa.String(length=36), nullable=False),
+        sa.Column("tag", sa.String(length=100), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("entity_type", "entity_id", "tag"),
+    )
+    op.create_index(
+        "idx_entity_tags_type_tag",
+        "entity_tags",
+        ["entity_type", "tag", "entity_id"],
+        unique=False,
+    )
+
+    # 기존 todos.tags / maintenance.tags(JSON) 값을 태그 인덱스로 이관
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    for table_name, entity_type in (("todos", "todo"), ("maintenance", "maintenance")):
+        if not inspector.has_table(table_name):
+            continue
+        columns = {column["name"] for column in inspector.get_columns(table_name)}
+        if "tags" not in columns:
+            continue
+        _backfill_tags(bind, table_name, entity_type)
+
+
+def _backfill_tags(bind, table_name: str, entity_type: str) -> None:
+    source = sa.table(
+        table_name, sa.column("id", sa.String), sa.column("tags", sa.JSON)
+    )
+    entity_tags = sa.table(
+        "entity_tags",
+        sa.column("entity_type", sa.String),
+        sa.column("entity_id", sa.String),
+        sa.column("tag", sa.String),
+    )
+    rows = bind.execute(
+        sa.select(source.c.id, source.c.tags).where(source.c.tags.isnot(None))
+    )
+    batch = []
+    for entity_id, tags in rows:
+        if isinstance(tags, str):
+            tags = json.loads(tags)
+        for tag in set(tags or []):
+            batch.append(
+                {"entity_type": entity_type, "entity_id": entity_id, "tag": tag}
+            )
+        if len(batch) >= BACKFILL_BATCH_SIZE:
+            bind.execute(entity_tags.insert(), batch)
+            batch = []
+    if batch:
+        bind.execute(entity_tags.insert(), batch)
+
+
+def downgrade() -> None:
+    op.drop_index("idx_entity_tags_type_tag", table_name="entity_tags")
+    op.drop_table("entity_tags")
@@ -0,0 +1,137 @@
+"""Add indexed reminder queue
+
+Revision ID: c3e8f1a5d720
+Revises: b7d41c2e9a10
+Create Date: 2026-10-18 11:02:47.518330
+
+"""
+
+import json
+import uuid
+from datetime import datetime, timezone
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "c3e8f1a5d720"
+down_revision = "b7d41c2e9a10"
+branch_labels = None
+depends_on = None
+
+BACKFILL_BATCH_SIZE = 1000
+
+
+def upgrade() -> None:
+    op.create_table(
+        "reminder_queue",
+        sa.Column("id", sa.String(length=36), nullable=False),
+        sa.Column("entity_type", sa.String(length=50), nullable=False),
+        sa.Column("entity_id", sa.String(length=36), nullable=False),
+        sa.Column("fire_at", sa.DateTime(), nullable=False),
+        sa.Column("status", sa.String(length=20), nullable=False),
+        sa.Column("reminder_type", sa.String(length=50), nullable=False),
+        sa.Column("payload", sa.JSON(), nullable=True),
+        sa.Column("claimed_by", sa.String(length=100), nullable=True),
+        sa.Column("claimed_at", sa.DateTime(), nullable=True),
+        sa.Column("attempts", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.Column("processed_at", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "idx_reminder_queue_status_fire_at",
+        "reminder_queue",
+        ["status", "fire_at"],
+        unique=False,
+    )
+    op.create_index(
+        "idx_reminder_queue_entity",
+        "reminder_queue",
+        ["entity_type", "entity_id"],
+        unique=False,
+    )
+
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+
+    if inspector.has_table("schedule_reminders"):
+        with op.batch_alter_table("schedule_reminders") as batch_op:
+            batch_op.add_column(
+                sa.Column("claimed_by", sa.String(length=100), nullable=True)
+            )
+            batch_op.add_column(sa.Column("claimed_at", sa.DateTime(), nullable=True))
+        op.create_index(
+            "idx_schedule_reminders_status_time",
+            "schedule_reminders",
+            ["status", "reminder_time"],
+            unique=False,
+        )
+
+    # todos.extra_metadata["reminders"] 의 대기 리마인더를 대기열로 이관
+    if not inspector.has_table("todos"):
+        return
+    todos = sa.table(
+        "todos", sa.column("id", sa.String), sa.column("extra_metadata", sa.JSON)
+    )
+    reminder_queue = sa.table(
+        "reminder_queue",
+        sa.column("id", sa.String),
+        sa.column("entity_type", sa.String),
+        sa.column("entity_id", sa.String),
+        sa.column("fire_at", sa.DateTime),
+        sa.column("status", sa.String),
+        sa.column("reminder_type", sa.String),
+        sa.column("payload", sa.JSON),
+        sa.column("attempts", sa.Integer),
+        sa.column("created_at", sa.DateTime),
+    )
+    rows = bind.execute(
+        sa.select(todos.c.id, todos.c.extra_metadata).where(
+            todos.c.extra_metadata.isnot(None)
+        )
+    )
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    batch = []
+    for todo_id, metadata in rows:
+        if isinstance(metadata, str):
+            metadata = json.loads(metadata)
+        for reminder in (metadata or {}).get("reminders", []):
+            if reminder.get("status") != "pending" or not reminder.get("time"):
+                continue
+            fire_at = datetime.fromisoformat(reminder["time"])
+            if fire_at.tzinfo is not None:
+                fire_at = fire_at.astimezone(timezone.utc).replace(tzinfo=None)
+            payload = {"message": reminder["message"]} if reminder.get("message") else {}
+            batch.append(
+                {
+                    "id": reminder.get("id") or str(uuid.uuid4()),
+                    "entity_type": "todo",
+                    "entity_id": todo_id,
+                    "fire_at": fire_at,
+                    "status": "pending",
+                    "reminder_type": reminder.get("type", "notification"),
+                    "payload": payload,
+                    "attempts": 0,
+                    "created_at": now,
+                }
+            )
+        if len(batch) >= BACKFILL_BATCH_SIZE:
+            bind.execute(reminder_queue.insert(), batch)
+            batch = []
+    if batch:
+        bind.execute(reminder_queue.insert(), batch)
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    if sa.inspect(bind).has_table("schedule_reminders"):
+        op.drop_index(
+            "idx_schedule_reminders_status_time", table_name="schedule_reminders"
+        )
+        with op.batch_alter_table("schedule_reminders") as batch_op:
+            batch_op.drop_column("claimed_at")
+            batch_op.drop_column("claimed_by")
+    op.drop_index("idx_reminder_queue_entity", table_name="reminder_queue")
+    op.drop_index("idx_reminder_queue_status_fire_at", table_name="reminder_queue")
+    op.drop_table("reminder_queue")
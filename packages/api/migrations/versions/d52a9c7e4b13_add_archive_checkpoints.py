@@ -0,0 +1,33 @@
+"""Add archive checkpoints
+
+Revision ID: d52a9c7e4b13
+Revises: c3e8f1a5d720
+Create Date: 2026-10-18 11:48:05.227941
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "d52a9c7e4b13"
+down_revision = "c3e8f1a5d720"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "archive_checkpoints",
+        sa.Column("job_name", sa.String(length=100), nullable=False),
+        sa.Column("last_key", sa.String(length=100), nullable=True),
+        sa.Column(
+            "processed_count", sa.Integer(), nullable=False, server_default="0"
+        ),
+        sa.Column("updated_at", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("job_name"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("archive_checkpoints")
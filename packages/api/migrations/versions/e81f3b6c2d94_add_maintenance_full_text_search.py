@@ -0,0 +1,93 @@
+"""Add maintenance full-text search index
+
+Revision ID: e81f3b6c2d94
+Revises: d52a9c7e4b13
+Create Date: 2026-10-18 12:20:13.604471
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "e81f3b6c2d94"
+down_revision = "d52a9c7e4b13"
+branch_labels = None
+depends_on = None
+
+# 이 리비전 시점의 색인 대상 컬럼 (애플리케이션 코드가 바뀌어도 마이그레이션은 고정)
+FIELDS = ["description", "notes", "type", "performed_by", "provider"]
+COLUMNS = ", ".join(FIELDS)
+DOCUMENT = " || ' ' || ".join(f"coalesce({field}, '')" for field in FIELDS)
+NEW_VALUES = ", ".join(f"new.{field}" for field in FIELDS)
+NEW_ROWID = "(SELECT fts_rowid FROM maintenance_fts_keys WHERE key = new.id)"
+OLD_ROWID = "(SELECT fts_rowid FROM maintenance_fts_keys WHERE key = old.id)"
+
+POSTGRESQL_UPGRADE = [
+    "ALTER TABLE maintenance ADD COLUMN IF NOT EXISTS search_vector tsvector "
+    f"GENERATED ALWAYS AS (to_tsvector('simple', {DOCUMENT})) STORED",
+    "CREATE INDEX IF NOT EXISTS idx_maintenance_search_vector "
+    "ON maintenance USING GIN (search_vector)",
+]
+
+POSTGRESQL_DOWNGRADE = [
+    "DROP INDEX IF EXISTS idx_maintenance_search_vector",
+    "ALTER TABLE maintenance DROP COLUMN IF EXISTS search_vector",
+]
+
+# 문자열 기본 키의 암시적 rowid 는 VACUUM 후 바뀔 수 있으므로 정수 키 매핑 테이블 사용
+SQLITE_UPGRADE = [
+    "CREATE TABLE IF NOT EXISTS maintenance_fts_keys ("
+    "fts_rowid INTEGER PRIMARY KEY, key TEXT NOT NULL UNIQUE)",
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS maintenance_fts USING fts5("
+    f"{COLUMNS}, tokenize='unicode61')",
+    "CREATE TRIGGER IF NOT EXISTS maintenance_fts_ai AFTER INSERT ON maintenance BEGIN "
+    "INSERT OR IGNORE INTO maintenance_fts_keys(key) VALUES (new.id); "
+    f"INSERT INTO maintenance_fts(rowid, {COLUMNS}) "
+    f"VALUES ({NEW_ROWID}, {NEW_VALUES}); END",
+    "CREATE TRIGGER IF NOT EXISTS maintenance_fts_ad AFTER DELETE ON maintenance BEGIN "
+    f"DELETE FROM maintenance_fts WHERE rowid = {OLD_ROWID}; "
+    "DELETE FROM maintenance_fts_keys WHERE key = old.id; END",
+    "CREATE TRIGGER IF NOT EXISTS maintenance_fts_au AFTER UPDATE ON maintenance BEGIN "
+    f"DELETE FROM maintenance_fts WHERE rowid = {OLD_ROWID}; "
+    "UPDATE maintenance_fts_keys SET key = new.id WHERE key = old.id; "
+    f"INSERT INTO maintenance_fts(rowid, {COLUMNS}) "
+    f"VALUES ({NEW_ROWID}, {NEW_VALUES}); END",
+    # 기존 데이터 색인
+    "INSERT OR IGNORE INTO maintenance_fts_keys(key) SELECT id FROM maintenance",
+    f"INSERT INTO maintenance_fts(rowid, {COLUMNS}) "
+    f"SELECT k.fts_rowid, {', '.join(f't.{field}' for field in FIELDS)} "
+    "FROM maintenance AS t JOIN maintenance_fts_keys AS k ON k.key = t.id",
+]
+
+SQLITE_DOWNGRADE = [
+    "DROP TRIGGER IF EXISTS maintenance_fts_ai",
+    "DROP TRIGGER IF EXISTS maintenance_fts_ad",
+    "DROP TRIGGER IF EXISTS maintenance_fts_au",
+    "DROP TABLE IF EXISTS maintenance_fts",
+    "DROP TABLE IF EXISTS maintenance_fts_keys",
+]
+
+
+def _execute(statements) -> None:
+    for statement in statements:
+        op.execute(sa.text(statement))
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if not sa.inspect(bind).has_table("maintenance"):
+        return
+    # PostgreSQL: tsvector 생성 컬럼 + GIN, SQLite: FTS5 + 동기화 트리거
+    if bind.dialect.name == "postgresql":
+        _execute(POSTGRESQL_UPGRADE)
+    elif bind.dialect.name == "sqlite":
+        _execute(SQLITE_UPGRADE)
+
+
+def downgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    if dialect == "postgresql":
+        _execute(POSTGRESQL_DOWNGRADE)
+    elif dialect == "sqlite":
+        _execute(SQLITE_DOWNGRADE)
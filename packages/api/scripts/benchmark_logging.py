@@ -0,0 +1,176 @@
+#!/usr/bin/env python
+"""
+로깅 호출 오버헤드 벤치마크 스크립트
+
+같은 구조화 로그를 다음 방식으로 기록하면서 로그 호출 한 번이 호출 스레드를 붙잡는
+시간(평균, p50, p99, 최대)을 비교합니다. 작은 ``--max-bytes`` 로 회전을 자주 일으켜
+회전 시 압축 지연도 함께 드러나게 합니다.
+
+- sync: 호출 스레드에서 json 직렬화 + 파일 기록 + 회전 시 gzip 압축 (기존 방식)
+- async: 큐에 넣고 반환, 직렬화/기록/압축은 전용 스레드 (core/log_pipeline.py)
+- async-sampled: async + DEBUG 1% 표본 추출 (시끄러운 디버그 경로)
+
+사용 예:
+    python scripts/benchmark_logging.py --calls 50000 --max-bytes 5000000
+"""
+import argparse
+import gzip
+import importlib.util
+import json
+import logging
+import os
+import shutil
+import tempfile
+import time
+from logging.handlers import RotatingFileHandler
+
+# 앱 패키지 초기화(설정/DB) 없이 로깅 파이프라인 모듈만 로드
+current_dir = os.path.dirname(os.path.realpath(__file__))
+pipeline_path = os.path.join(
+    os.path.dirname(current_dir), "src", "core", "log_pipeline.py"
+)
+spec = importlib.util.spec_from_file_location("log_pipeline", pipeline_path)
+log_pipeline = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(log_pipeline)
+
+
+class InlineJsonFormatter(logging.Formatter):
+    """기존 방식과 같은 필드를 json 으로 직렬화하는 포맷터"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "level": record.levelname,
+            "logger": record.name,
+            "module": record.module,
+            "function": record.funcName,
+            "line": record.lineno,
+            "thread": record.thread,
+            "thread_name": record.threadName,
+            "message": record.getMessage(),
+        }
+        entry.update(getattr(record, "fields", {}))
+        return json.dumps(entry, ensure_ascii=False)
+
+
+class InlineCompressingHandler(RotatingFileHandler):
+    """회전 시 호출 스레드에서 gzip 압축하는 핸들러 (기존 방식)"""
+
+    def rotate(self, source: str, dest: str) -> None:
+        if os.path.exists(source):
+            with open(source, "rb") as f_in, gzip.open(f"{dest}.gz", "wb") as f_out:
+                shutil.copyfileobj(f_in, f_out)
+            os.remove(source)
+
+
+def build_fields(index: int) -> dict:
+    """로그 추가 필드"""
+    return {
+        "request_id": f"req-{index}",
+        "method": "GET",
+        "path": "/api/v1/maintenance/records",
+        "status_code": 200,
+        "response_time": 0.0123,
+        "user_id": "a1b2c3d4-0000-0000-0000-000000000000",
+    }
+
+
+def make_logger(name: str) -> logging.Logger:
+    logger = logging.getLogger(name)
+    logger.handlers.clear()
+    logger.filters.clear()
+    logger.propagate = False
+    logger.setLevel(logging.DEBUG)
+    return logger
+
+
+def measure(logger: logging.Logger, args, level: int = logging.INFO) -> dict:
+    """로그 호출별 소요 시간 측정"""
+    durations = []
+    for index in range(args.calls):
+        started = time.perf_counter_ns()
+        logger.log(level, "HTTP GET %s", "/api/v1/maintenance/records",
+                   extra={"fields": build_fields(index)})
+        durations.append(time.perf_counter_ns() - started)
+    durations.sort()
+    return {
+        "mean_us": sum(durations) / len(durations) / 1000,
+        "p50_us": durations[len(durations) // 2] / 1000,
+        "p99_us": durations[int(len(durations) * 0.99)] / 1000,
+        "max_ms": durations[-1] / 1_000_000,
+    }
+
+
+def run_sync(args, directory: str) -> dict:
+    logger = make_logger("bench.sync")
+    handler = InlineCompressingHandler(
+        os.path.join(directory, "sync.log"), maxBytes=args.max_bytes, backupCount=3
+    )
+    handler.setFormatter(InlineJsonFormatter())
+    logger.addHandler(handler)
+    result = measure(logger, args)
+    handler.close()
+    return result
+
+
+def run_async(args, directory: str, sample_rate: float = 1.0) -> dict:
+    name = "async" if sample_rate >= 1.0 else "async-sampled"
+    logger = make_logger(f"bench.{name}")
+    handler = log_pipeline.BackgroundCompressingRotatingFileHandler(
+        os.path.join(directory, f"{name}.log"),
+        max_bytes=args.max_bytes,
+        backup_count=3,
+    )
+    handler.setFormatter(log_pipeline.FastJsonFormatter())
+    pipeline = log_pipeline.AsyncLogPipeline(args.queue_size)
+    pipeline.start([handler])
+    logger.addHandler(pipeline.handler)
+    level = logging.INFO
+    if sample_rate < 1.0:
+        logger.addFilter(log_pipeline.SamplingFilter({logging.DEBUG: sample_rate}))
+        level = logging.DEBUG
+    result = measure(logger, args, level)
+    drain_started = time.perf_counter()
+    pipeline.stop()
+    result["drain_s"] = time.perf_counter() - drain_started
+    return result
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="로깅 호출 오버헤드 벤치마크")
+    parser.add_argument("--calls", type=int, default=50000)
+    parser.add_argument("--max-bytes", type=int, default=5 * 1024 * 1024)
+    parser.add_argument("--queue-size", type=int, default=100000)
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    print(
+        f"호출 {args.calls}회, 회전 크기 {args.max_bytes / 1024 / 1024:.1f}MB, "
+        f"JSON 인코더: {'orjson' if log_pipeline.orjson else 'json'}"
+    )
+    directory = tempfile.mkdtemp(prefix="log-bench-")
+    try:
+        results = {
+            "sync": run_sync(args, directory),
+            "async": run_async(args, directory),
+            "async-sampled": run_async(args, directory, sample_rate=0.01),
+        }
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+    print(
+        f"{'방식':<15}{'평균(us)':>10}{'p50(us)':>10}{'p99(us)':>10}"
+        f"{'최대(ms)':>10}{'비우기(s)':>11}"
+    )
+    for name, result in results.items():
+        print(
+            f"{name:<15}{result['mean_us']:>10.2f}{result['p50_us']:>10.2f}"
+            f"{result['p99_us']:>10.2f}{result['max_ms']:>10.2f}"
+            f"{result.get('drain_s', 0.0):>11.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+#!/usr/bin/env python
+"""
+요청 메트릭 기록 오버헤드 벤치마크 스크립트
+
+ID 가 포함된 경로로 요청을 흉내 내며 요청 한 건을 기록하는 데 드는 시간과
+만들어지는 시계열 수를 비교합니다.
+
+- labels: 요청마다 ``Counter.labels(path)`` + ``Histogram.labels(path)`` 호출 (기존 방식)
+- route: 라우트 템플릿 레이블 + 워커별 누적 후 주기적 반영 (core/request_metrics.py)
+
+사용 예:
+    python scripts/benchmark_request_metrics.py --requests 200000 --ids 5000
+"""
+import argparse
+import importlib.util
+import os
+import random
+import time
+
+from prometheus_client import CollectorRegistry, Counter, Histogram
+
+# 앱 패키지 초기화(설정/DB) 없이 요청 메트릭 모듈만 로드
+current_dir = os.path.dirname(os.path.realpath(__file__))
+metrics_path = os.path.join(
+    os.path.dirname(current_dir), "src", "core", "request_metrics.py"
+)
+spec = importlib.util.spec_from_file_location("request_metrics", metrics_path)
+request_metrics = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(request_metrics)
+
+
+class FakeRoute:
+    """매칭된 라우트 (템플릿만 필요)"""
+
+    def __init__(self, path_format: str):
+        self.path_format = path_format
+
+
+ROUTES = [
+    ("GET", "/api/v1/vehicles/{vehicle_id}"),
+    ("GET", "/api/v1/vehicles/{vehicle_id}/history"),
+    ("PUT", "/api/v1/maintenance/{record_id}"),
+    ("GET", "/api/v1/todos/{todo_id}"),
+]
+
+
+def build_scopes(args) -> list:
+    """요청 스코프 목록 (라우팅 이후 상태)"""
+    rng = random.Random(42)
+    scopes = []
+    for _ in range(args.requests):
+        method, template = rng.choice(ROUTES)
+        object_id = rng.randrange(args.ids)
+        scopes.append(
+            {
+                "type": "http",
+                "method": method,
+                "path": template.split("{")[0] + str(object_id),
+                "route": FakeRoute(template),
+                "status": 200 if rng.random() > 0.02 else 500,
+                "duration": rng.expovariate(1 / 0.05),
+            }
+        )
+    return scopes
+
+
+def series_count(registry: CollectorRegistry) -> int:
+    return sum(len(metric.samples) for metric in registry.collect())
+
+
+def run_labels(scopes: list) -> dict:
+    registry = CollectorRegistry()
+    requests_total = Counter(
+        "bench_requests_total", "", ["method", "endpoint", "status"], registry=registry
+    )
+    duration = Histogram(
+        "bench_request_duration_seconds", "", ["method", "endpoint"], registry=registry
+    )
+    started = time.perf_counter()
+    for scope in scopes:
+        requests_total.labels(
+            method=scope["method"], endpoint=scope["path"], status=scope["status"]
+        ).inc()
+        duration.labels(method=scope["method"], endpoint=scope["path"]).observe(
+            scope["duration"]
+        )
+    elapsed = time.perf_counter() - started
+    return {"per_request_us": elapsed / len(scopes) * 1e6, "series": series_count(registry)}
+
+
+def run_route(scopes: list, flush_every: int) -> dict:
+    registry = CollectorRegistry()
+    metrics = request_metrics.RouteMetrics(registry=registry)
+    started = time.perf_counter()
+    for index, scope in enumerate(scopes, 1):
+        metrics.observe_scope(scope, scope["status"], scope["duration"])
+        if index % flush_every == 0:
+            metrics.flush()
+    metrics.flush()
+    elapsed = time.perf_counter() - started
+    return {"per_request_us": elapsed / len(scopes) * 1e6, "series": series_count(registry)}
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="요청 메트릭 기록 오버헤드 벤치마크")
+    parser.add_argument("--requests", type=int, default=200000)
+    parser.add_argument("--ids", type=int, default=5000, help="경로에 포함되는 ID 종류 수")
+    parser.add_argument(
+        "--flush-every", type=int, default=1000, help="반영 주기 (요청 수 기준)"
+    )
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    scopes = build_scopes(args)
+    print(f"요청 {args.requests}건, ID {args.ids}종, 반영 주기 {args.flush_every}건")
+
+    results = {
+        "labels": run_labels(scopes),
+        "route": run_route(scopes, args.flush_every),
+    }
+    print(f"{'방식':<10}{'요청당(us)':>12}{'시계열 수':>12}")
+    for name, result in results.items():
+        print(f"{name:<10}{result['per_request_us']:>12.2f}{result['series']:>12}")
+
+
+if __name__ == "__main__":
+    main()
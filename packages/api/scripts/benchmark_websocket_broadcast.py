@@ -0,0 +1,172 @@
+#!/usr/bin/env python
+"""
+웹소켓 브로드캐스트 벤치마크 스크립트
+
+가상 웹소켓 연결(기본 10,000개)에 메시지를 브로드캐스트하면서 다음 두 방식을 비교합니다.
+
+- sequential: 연결마다 메시지를 직렬화하고 순서대로 ``await send_json`` (기존 방식)
+- fanout: 한 번 직렬화 후 연결별 전송 큐로 동시 전송 (core/websocket_fanout.py)
+
+일부 연결은 느린 클라이언트(slow), 일부는 응답이 멈춘 클라이언트(stalled)로 시뮬레이션합니다.
+
+사용 예:
+    python scripts/benchmark_websocket_broadcast.py --connections 10000 --messages 5
+"""
+import argparse
+import asyncio
+import importlib.util
+import json
+import os
+import random
+import time
+
+# 앱 패키지 초기화(설정/DB) 없이 팬아웃 모듈만 로드
+current_dir = os.path.dirname(os.path.realpath(__file__))
+fanout_path = os.path.join(
+    os.path.dirname(current_dir), "src", "core", "websocket_fanout.py"
+)
+spec = importlib.util.spec_from_file_location("websocket_fanout", fanout_path)
+websocket_fanout = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(websocket_fanout)
+
+
+class SimulatedWebSocket:
+    """전송 지연을 흉내 내는 가상 웹소켓"""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.received = 0
+        self.closed = False
+
+    async def send_text(self, data: str) -> None:
+        await asyncio.sleep(self.delay)
+        self.received += 1
+
+    async def send_json(self, data) -> None:
+        await self.send_text(
+            json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+        )
+
+    async def close(self, code: int = 1000) -> None:
+        self.closed = True
+
+
+def build_connections(args) -> list:
+    """연결 목록 생성 (느린/멈춘 연결을 무작위로 섞음)"""
+    rng = random.Random(args.seed)
+    sockets = []
+    for _ in range(args.connections):
+        roll = rng.random()
+        if roll < args.stalled_ratio:
+            delay = args.stall_delay
+        elif roll < args.stalled_ratio + args.slow_ratio:
+            delay = args.slow_delay
+        else:
+            delay = 0.0
+        sockets.append(SimulatedWebSocket(delay))
+    return sockets
+
+
+def build_message(index: int) -> dict:
+    """브로드캐스트 메시지 생성"""
+    return {
+        "type": "broadcast",
+        "data": {
+            "event": "maintenance_updated",
+            "id": index,
+            "vehicle_id": "a1b2c3d4-0000-0000-0000-000000000000",
+            "status": "in_progress",
+            "description": "엔진 오일 교체 및 브레이크 패드 점검",
+        },
+        "timestamp": "2026-01-01T00:00:00",
+    }
+
+
+async def run_sequential(args) -> dict:
+    """기존 방식: 연결마다 직렬화 + 순차 전송"""
+    sockets = build_connections(args)
+    latencies = []
+    started = time.perf_counter()
+    for index in range(args.messages):
+        message_started = time.perf_counter()
+        for websocket in sockets:
+            await websocket.send_json(build_message(index))
+        latencies.append(time.perf_counter() - message_started)
+    return {
+        "total_seconds": time.perf_counter() - started,
+        "per_message_ms": sum(latencies) / len(latencies) * 1000,
+        "delivered": sum(websocket.received for websocket in sockets),
+    }
+
+
+async def run_fanout(args) -> dict:
+    """팬아웃 방식: 한 번 직렬화 + 연결별 큐 동시 전송"""
+    sockets = build_connections(args)
+    hub = websocket_fanout.FanoutHub(
+        max_queue=args.queue_size, send_timeout=args.send_timeout
+    )
+    for index, websocket in enumerate(sockets):
+        hub.add(index, websocket)
+
+    publish_latencies = []
+    started = time.perf_counter()
+    for index in range(args.messages):
+        message_started = time.perf_counter()
+        hub.publish_all(build_message(index))
+        publish_latencies.append(time.perf_counter() - message_started)
+        # 이벤트 루프에 전송 기회를 줌 (실제 서버에서는 다른 요청 처리와 섞임)
+        await asyncio.sleep(0)
+    await hub.drain(timeout=args.send_timeout * 2 + 5)
+    total = time.perf_counter() - started
+
+    result = {
+        "total_seconds": total,
+        "per_message_ms": sum(publish_latencies) / len(publish_latencies) * 1000,
+        "delivered": sum(websocket.received for websocket in sockets),
+        "metrics": hub.metrics.snapshot(),
+    }
+    await hub.close()
+    return result
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="웹소켓 브로드캐스트 벤치마크")
+    parser.add_argument("--connections", type=int, default=10000)
+    parser.add_argument("--messages", type=int, default=5)
+    parser.add_argument("--slow-ratio", type=float, default=0.01)
+    parser.add_argument("--slow-delay", type=float, default=0.005)
+    parser.add_argument("--stalled-ratio", type=float, default=0.0005)
+    parser.add_argument("--stall-delay", type=float, default=1.0)
+    parser.add_argument("--queue-size", type=int, default=256)
+    parser.add_argument("--send-timeout", type=float, default=0.5)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument(
+        "--skip-sequential", action="store_true", help="기존 방식 측정 생략"
+    )
+    return parser.parse_args()
+
+
+async def main():
+    args = parse_args()
+    print(
+        f"연결 {args.connections}개, 메시지 {args.messages}개, "
+        f"느린 연결 {args.slow_ratio:.1%} ({args.slow_delay * 1000:.0f}ms), "
+        f"멈춘 연결 {args.stalled_ratio:.1%} ({args.stall_delay * 1000:.0f}ms)"
+    )
+
+    results = {}
+    if not args.skip_sequential:
+        results["sequential"] = await run_sequential(args)
+    results["fanout"] = await run_fanout(args)
+
+    print(f"{'방식':<12}{'전체(s)':>10}{'메시지당(ms)':>14}{'전달 프레임':>14}")
+    for name, result in results.items():
+        print(
+            f"{name:<12}{result['total_seconds']:>10.3f}"
+            f"{result['per_message_ms']:>14.3f}{result['delivered']:>14}"
+        )
+    print("fanout 메트릭:", json.dumps(results["fanout"]["metrics"], indent=2))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,269 @@
+"""
+집계 통계 유틸리티 모듈
+
+대시보드 통계처럼 같은 테이블에 대해 여러 개의 ``COUNT`` 를 날리던 코드를
+조건부 집계(``FILTER (WHERE ...)``) 한 번과 분포 컬럼별 ``GROUP BY`` 로 계산하고,
+결과를 짧은 TTL 의 통계 캐시에 보관합니다. 캐시는 모델의 쓰기 이벤트
+(insert/update/delete)가 있었던 세션이 커밋된 뒤, 그리고 리포지토리의 일괄 쓰기
+작업 후에 무효화됩니다.
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Mapping, Optional, Sequence, Tuple
+
+from sqlalchemy import case, event, func
+from sqlalchemy.orm import Session, object_session
+from sqlalchemy.sql import ColumnElement
+
+logger = logging.getLogger(__name__)
+
+# FILTER (WHERE ...) 절을 지원하는 방언
+FILTER_CLAUSE_DIALECTS = {"postgresql", "sqlite"}
+
+# 기본 통계 캐시 유효 시간 (초)
+DEFAULT_STATS_TTL = 30
+
+
+def count_where(
+    condition: ColumnElement, dialect_name: Optional[str] = None
+) -> ColumnElement:
+    """
+    조건부 COUNT 식 생성
+
+    Args:
+        condition: 집계 조건
+        dialect_name: DB 방언 이름 (FILTER 절 지원 여부 판단)
+
+    Returns:
+        ColumnElement: ``COUNT(*) FILTER (WHERE ...)`` 또는 ``SUM(CASE ...)`` 식
+    """
+    if dialect_name in FILTER_CLAUSE_DIALECTS:
+        return func.count().filter(condition)
+    return func.coalesce(func.sum(case((condition, 1), else_=0)), 0)
+
+
+def aggregate_statistics(
+    db: Any,
+    model: Any,
+    group_by: Optional[Mapping[str, ColumnElement]] = None,
+    conditions: Optional[Mapping[str, ColumnElement]] = None,
+    filters: Sequence[ColumnElement] = (),
+) -> Dict[str, Any]:
+    """
+    전체/조건부 건수와 컬럼별 분포 집계
+
+    전체 건수와 조건부 건수는 ``FILTER`` 집계 한 번으로 계산하고, 분포는 컬럼마다
+    따로 GROUP BY 합니다. 여러 분포 컬럼을 한 GROUP BY 로 묶으면 그룹 수가 컬럼
+    값 조합만큼 늘어나므로 분포끼리는 섞지 않습니다.
+
+    Args:
+        db: 동기 SQLAlchemy 세션
+        model: 집계 대상 모델
+        group_by: 결과 키 이름별 분포를 구할 컬럼
+        conditions: 결과 키 이름별 조건부 건수 조건
+        filters: 전체 집계에 적용할 WHERE 조건
+
+    Returns:
+        Dict[str, Any]: ``total_count``, 그룹 키별 ``{값: 건수}``, 조건 키별 건수
+    """
+    group_by = dict(group_by or {})
+    conditions = dict(conditions or {})
+    bind = db.get_bind() if hasattr(db, "get_bind") else getattr(db, "bind", None)
+    dialect_name = bind.dialect.name if bind is not None else None
+
+    def query(*columns: ColumnElement) -> Any:
+        built = db.query(*columns).select_from(model)
+        return built.filter(*filters) if filters else built
+
+    counts = query(
+        func.count().label("total_count"),
+        *[
+            count_where(condition, dialect_name).label(f"c_{name}")
+            for name, condition in conditions.items()
+        ],
+    ).one()
+
+    result: Dict[str, Any] = {"total_count": int(counts[0] or 0)}
+    for name, count in zip(conditions, counts[1:]):
+        result[name] = int(count or 0)
+
+    for name, column in group_by.items():
+        distribution: Dict[Any, int] = {}
+        for key, count in query(column.label(f"g_{name}"), func.count()).group_by(
+            column
+        ):
+            key = getattr(key, "value", key)
+            distribution[key] = distribution.get(key, 0) + int(count or 0)
+        result[name] = distribution
+    return result
+
+
+class StatsCache:
+    """짧은 TTL 의 통계 결과 캐시 (쓰기 이벤트로 무효화)"""
+
+    def __init__(self, ttl: int = DEFAULT_STATS_TTL):
+        """
+        통계 캐시 초기화
+
+        Args:
+            ttl: 기본 유효 시간(초)
+        """
+        self.ttl = ttl
+        self._entries: Dict[Tuple[str, str], Tuple[float, Any]] = {}
+        self._versions: Dict[str, int] = {}
+        self._watched: set = set()
+        self._pending_key = f"stats_cache_pending:{id(self)}"
+        self._session_events = False
+        self._lock = threading.Lock()
+
+    def get_or_compute(
+        self,
+        namespace: str,
+        key: str,
+        compute: Callable[[], Any],
+        ttl: Optional[int] = None,
+    ) -> Any:
+        """
+        캐시된 통계 반환, 없거나 만료되었으면 계산 후 저장
+
+        계산 도중 무효화가 발생하면 결과를 저장하지 않습니다.
+
+        Args:
+            namespace: 무효화 단위 (예: 테이블 이름)
+            key: 네임스페이스 내 통계 키
+            compute: 통계 계산 함수
+            ttl: 유효 시간(초), None 이면 기본값
+
+        Returns:
+            Any: 통계 결과
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get((namespace, key))
+            version = self._versions.get(namespace, 0)
+        if entry is not None and entry[0] > now:
+            return entry[1]
+
+        value = compute()
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            if self._versions.get(namespace, 0) == version:
+                self._entries[(namespace, key)] = (expires_at, value)
+        return value
+
+    def get(self, namespace: str, key: str) -> Optional[Any]:
+        """
+        만료되지 않은 캐시 값 조회 (비동기 계산 경로용)
+
+        Args:
+            namespace: 네임스페이스
+            key: 네임스페이스 내 통계 키
+
+        Returns:
+            Optional[Any]: 캐시 값 (없거나 만료되었으면 None)
+        """
+        with self._lock:
+            entry = self._entries.get((namespace, key))
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+        return None
+
+    def set(
+        self, namespace: str, key: str, value: Any, ttl: Optional[int] = None
+    ) -> None:
+        """
+        캐시 값 저장
+
+        Args:
+            namespace: 네임스페이스
+            key: 네임스페이스 내 통계 키
+            value: 저장할 값
+            ttl: 유효 시간(초), None 이면 기본값
+        """
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._entries[(namespace, key)] = (expires_at, value)
+
+    def invalidate(self, namespace: str) -> None:
+        """
+        네임스페이스의 통계 캐시 무효화
+
+        Args:
+            namespace: 무효화할 네임스페이스
+        """
+        with self._lock:
+            self._versions[namespace] = self._versions.get(namespace, 0) + 1
+            for cache_key in [k for k in self._entries if k[0] == namespace]:
+                del self._entries[cache_key]
+        logger.debug(f"통계 캐시 무효화: {namespace}")
+
+    def clear(self) -> None:
+        """전체 통계 캐시 초기화"""
+        with self._lock:
+            for namespace in list(self._versions):
+                self._versions[namespace] += 1
+            self._entries.clear()
+
+    def watch(self, model: Any, namespace: str) -> None:
+        """
+        모델의 ORM 쓰기 이벤트에 무효화 리스너 등록
+
+        flush 시점에 무효화하면 커밋 전에 다른 요청이 옛 데이터로 캐시를 다시
+        채울 수 있으므로, 쓰기가 있었던 세션의 네임스페이스를 기록해 두었다가
+        커밋된 뒤 무효화하고 롤백되면 버립니다. 세션에 속하지 않은 쓰기는 바로
+        무효화합니다.
+
+        ``Query.update()`` / ``Query.delete()`` 같은 일괄 쓰기는 ORM 이벤트를
+        발생시키지 않으므로 호출 측에서 커밋 후 ``invalidate`` 를 직접 호출해야 합니다.
+
+        Args:
+            model: 감시할 매핑 모델
+            namespace: 무효화할 네임스페이스
+        """
+        if (model, namespace) in self._watched:
+            return
+        try:
+            self._listen_sessions()
+            for identifier in ("after_insert", "after_update", "after_delete"):
+                event.listen(
+                    model,
+                    identifier,
+                    lambda mapper, connection, target: self._defer_invalidate(
+                        target, namespace
+                    ),
+                )
+        except Exception as e:
+            logger.warning(f"통계 캐시 이벤트 등록 실패 ({namespace}): {str(e)}")
+            return
+        self._watched.add((model, namespace))
+
+    def _listen_sessions(self) -> None:
+        """세션 커밋/롤백 이벤트에 보류 중인 무효화 처리 리스너 등록 (한 번만)"""
+        if self._session_events:
+            return
+        event.listen(Session, "after_commit", self._invalidate_pending)
+        event.listen(Session, "after_rollback", self._discard_pending)
+        self._session_events = True
+
+    def _defer_invalidate(self, target: Any, namespace: str) -> None:
+        """쓰기 대상 객체의 세션이 커밋될 때 무효화하도록 기록"""
+        session = object_session(target)
+        if session is None:
+            self.invalidate(namespace)
+            return
+        session.info.setdefault(self._pending_key, set()).add(namespace)
+
+    def _invalidate_pending(self, session: Session) -> None:
+        """커밋된 세션에서 기록해 둔 네임스페이스 무효화"""
+        for namespace in session.info.pop(self._pending_key, ()):
+            self.invalidate(namespace)
+
+    def _discard_pending(self, session: Session) -> None:
+        """롤백된 세션에서 기록해 둔 무효화 취소"""
+        session.info.pop(self._pending_key, None)
+
+
+# 전역 통계 캐시 인스턴스
+stats_cache = StatsCache()
@@ -0,0 +1,269 @@
+"""
+집합 기반 아카이브 모듈
+
+오래된 행을 ORM 객체로 읽어 한 건씩 옮기던 방식 대신, 키 순서(keyset)로 나눈
+배치마다 ``INSERT INTO archive SELECT ...`` 와 ``DELETE ... RETURNING`` 을 DB 안에서
+실행합니다. 메모리 사용량은 배치 크기와 무관하게 일정하며, 배치마다 체크포인트
+(누적 처리 건수와 마지막 키)를 기록합니다.
+
+키는 UUID 처럼 조건과 무관한 순서일 수 있어, 중단 후 마지막 키부터 이어가면 그
+사이 조건을 만족하게 된 더 작은 키의 행을 건너뜁니다. 옮긴 행은 원본에서 삭제되어
+다시 읽히지 않으므로, 재개할 때는 처음부터 다시 스캔하고 한 실행 안에서만 keyset 을
+사용합니다.
+
+- PostgreSQL: ``WITH moved AS (DELETE ... RETURNING *) INSERT INTO archive SELECT ...``
+  한 문장으로 이동
+- 그 외: 같은 트랜잭션에서 ``INSERT ... SELECT`` 후 아카이브에 복사된 키만 ``DELETE``
+"""
+
+import logging
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Mapping, Optional
+
+from sqlalchemy import delete, func, insert, literal, select
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import ColumnElement
+from sqlalchemy.sql.util import ClauseAdapter
+
+logger = logging.getLogger(__name__)
+
+# 기본 배치 크기
+DEFAULT_ARCHIVE_BATCH_SIZE = 1000
+
+
+class ArchiveCheckpointStore:
+    """아카이브 작업별 마지막 처리 키 저장소"""
+
+    def __init__(self, checkpoint_model: Any):
+        """
+        체크포인트 저장소 초기화
+
+        Args:
+            checkpoint_model: ``archive_checkpoints`` 매핑 모델
+        """
+        self.checkpoint_model = checkpoint_model
+
+    def load(self, db: Session, job_name: str) -> Optional[Any]:
+        """
+        체크포인트 조회
+
+        Args:
+            db: 데이터베이스 세션
+            job_name: 작업 이름
+
+        Returns:
+            Optional[Any]: 체크포인트 (없으면 None)
+        """
+        return db.get(self.checkpoint_model, job_name)
+
+    def save(self, db: Session, job_name: str, last_key: Any, processed: int) -> None:
+        """
+        체크포인트 기록 (커밋은 호출 측에서 수행)
+
+        Args:
+            db: 데이터베이스 세션
+            job_name: 작업 이름
+            last_key: 마지막으로 처리한 키
+            processed: 누적 처리 건수
+        """
+        checkpoint = self.load(db, job_name)
+        if checkpoint is None:
+            checkpoint = self.checkpoint_model(job_name=job_name)
+            db.add(checkpoint)
+        checkpoint.last_key = str(last_key)
+        checkpoint.processed_count = processed
+        checkpoint.updated_at = datetime.now(timezone.utc).replace(tzinfo=None)
+
+    def clear(self, db: Session, job_name: str) -> None:
+        """
+        체크포인트 삭제 (커밋은 호출 측에서 수행)
+
+        Args:
+            db: 데이터베이스 세션
+            job_name: 작업 이름
+        """
+        checkpoint = self.load(db, job_name)
+        if checkpoint is not None:
+            db.delete(checkpoint)
+
+
+class SetBasedArchiver:
+    """keyset 배치 단위의 집합 기반 아카이버"""
+
+    def __init__(
+        self,
+        source: Any,
+        archive: Any,
+        columns: Mapping[str, Any],
+        key_column: Any,
+        archive_key: str,
+        checkpoints: Optional[ArchiveCheckpointStore] = None,
+        after_move: Optional[Callable[[Session, Any], Any]] = None,
+    ):
+        """
+        아카이버 초기화
+
+        Args:
+            source: 원본 테이블 (또는 매핑 모델)
+            archive: 아카이브 테이블 (또는 매핑 모델)
+            columns: 아카이브 컬럼 이름별 원본 컬럼/식 (또는 고정값)
+            key_column: 배치를 나눌 원본 키 컬럼 (고유, 정렬 가능)
+            archive_key: 원본 키를 저장하는 아카이브 컬럼 이름
+            checkpoints: 체크포인트 저장소 (없으면 재개 불가)
+            after_move: 배치를 옮긴 뒤 같은 트랜잭션에서 호출할 함수
+                ``(db, 옮긴 키 서브쿼리)`` (예: 태그 인덱스 정리)
+        """
+        self.source = getattr(source, "__table__", source)
+        self.archive = getattr(archive, "__table__", archive)
+        self.columns = {
+            name: (
+                value
+                if isinstance(value, ColumnElement)
+                or hasattr(value, "__clause_element__")
+                else literal(value)
+            )
+            for name, value in columns.items()
+        }
+        self.key_column = key_column
+        self.archive_key = archive_key
+        self.checkpoints = checkpoints
+        self.after_move = after_move
+
+    def _batch_upper_bound(
+        self, db: Session, condition: Any, last_key: Any, batch_size: int
+    ) -> Any:
+        """다음 배치의 마지막 키 조회 (키만 읽음)"""
+        keys = select(self.key_column.label("batch_key")).where(condition)
+        if last_key is not None:
+            keys = keys.where(self.key_column > last_key)
+        keys = keys.order_by(self.key_column).limit(batch_size).subquery()
+        return db.execute(select(func.max(keys.c.batch_key))).scalar()
+
+    @staticmethod
+    def _key_range(column: Any, last_key: Any, upper_key: Any) -> Any:
+        """배치 키 범위 조건 ``(last_key, upper_key]``"""
+        in_range = column <= upper_key
+        if last_key is not None:
+            in_range = (column > last_key) & in_range
+        return in_range
+
+    def _move_returning(self, db: Session, condition: Any) -> int:
+        """PostgreSQL: DELETE ... RETURNING 결과를 그대로 아카이브에 INSERT"""
+        moved = (
+            delete(self.source).where(condition).returning(*self.source.c).cte("moved")
+        )
+        adapter = ClauseAdapter(moved)
+        statement = (
+            insert(self.archive)
+            .from_select(
+                list(self.columns),
+                select(*[adapter.traverse(value) for value in self.columns.values()]),
+            )
+            .returning(self.archive.c[self.archive_key])
+        )
+        return len(db.execute(statement).all())
+
+    def _copy_then_delete(
+        self, db: Session, condition: Any, last_key: Any, upper_key: Any
+    ) -> int:
+        """INSERT ... SELECT 후 아카이브에 복사된 키만 삭제"""
+        db.execute(
+            insert(self.archive).from_select(
+                list(self.columns),
+                select(*self.columns.values()).where(condition),
+            )
+        )
+        archive_key = self.archive.c[self.archive_key]
+        copied = select(archive_key).where(
+            self._key_range(archive_key, last_key, upper_key)
+        )
+        statement = delete(self.source).where(condition, self.key_column.in_(copied))
+        if db.get_bind().dialect.delete_returning:
+            return len(db.execute(statement.returning(self.key_column)).all())
+        return db.execute(statement).rowcount
+
+    def run(
+        self,
+        db: Session,
+        condition: Any,
+        job_name: Optional[str] = None,
+        batch_size: int = DEFAULT_ARCHIVE_BATCH_SIZE,
+        throttle_seconds: float = 0.0,
+        max_batches: Optional[int] = None,
+    ) -> int:
+        """
+        조건에 맞는 행을 배치 단위로 아카이브
+
+        배치마다 커밋하고 체크포인트를 남기며, 모든 행을 처리하면 체크포인트를
+        삭제합니다. ``max_batches`` 로 중단된 작업은 다음 실행 때 처음부터 다시
+        스캔해 남은 행과 그 사이 조건을 만족하게 된 행을 함께 처리하고, 처리 건수는
+        체크포인트에 이어서 누적됩니다.
+
+        Args:
+            db: 데이터베이스 세션
+            condition: 아카이브 대상 조건
+            job_name: 체크포인트 작업 이름 (없으면 재개하지 않음)
+            batch_size: 배치당 최대 행 수
+            throttle_seconds: 배치 사이 대기 시간 (운영 부하 완화)
+            max_batches: 이번 실행에서 처리할 최대 배치 수
+
+        Returns:
+            int: 이번 실행에서 이동한 행 수
+        """
+        use_checkpoint = self.checkpoints is not None and job_name is not None
+        last_key = None
+        previous_total = 0
+        if use_checkpoint:
+            checkpoint = self.checkpoints.load(db, job_name)
+            if checkpoint is not None:
+                previous_total = checkpoint.processed_count or 0
+                logger.info(
+                    f"아카이브 작업 재개: {job_name} "
+                    f"(이전 마지막 키 {checkpoint.last_key}, 처음부터 다시 스캔)"
+                )
+
+        returning = db.get_bind().dialect.name == "postgresql"
+        total = 0
+        batches = 0
+        while max_batches is None or batches < max_batches:
+            upper_key = self._batch_upper_bound(db, condition, last_key, batch_size)
+            if upper_key is None:
+                if use_checkpoint:
+                    self.checkpoints.clear(db, job_name)
+                    db.commit()
+                break
+
+            batch_condition = condition & self._key_range(
+                self.key_column, last_key, upper_key
+            )
+            try:
+                if returning:
+                    moved = self._move_returning(db, batch_condition)
+                else:
+                    moved = self._copy_then_delete(
+                        db, batch_condition, last_key, upper_key
+                    )
+                if self.after_move is not None and moved:
+                    archive_key = self.archive.c[self.archive_key]
+                    self.after_move(
+                        db,
+                        select(archive_key).where(
+                            self._key_range(archive_key, last_key, upper_key)
+                        ),
+                    )
+                total += moved
+                last_key = upper_key
+                if use_checkpoint:
+                    self.checkpoints.save(db, job_name, last_key, previous_total + total)
+                db.commit()
+            except Exception:
+                db.rollback()
+                raise
+
+            batches += 1
+            logger.debug(f"아카이브 처리 중: {total}개 완료 (마지막 키 {last_key})")
+            if throttle_seconds > 0:
+                time.sleep(throttle_seconds)
+
+        return total
@@ -9,7 +9,7 @@ import gc
 import logging
 import os
 import time
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Any, Awaitable, Callable, Coroutine, Dict, List, Optional, Set
 
 import psutil
@@ -17,6 +17,7 @@ from fastapi import FastAPI
 
 # 병렬 처리 모듈 추가
 from packages.api.src.coreparallel_processor import ParallelProcessor
+from packagescore.reminder_queue import DueTimeQueue, default_worker_id
 
 logger = logging.getLogger(__name__)
 
@@ -108,6 +109,213 @@ async def collect_system_stats(app: FastAPI):
             await asyncio.sleep(60)  # 오류 발생 시 1분 후 재시도
 
 
+# 리마인더 발송 스케줄러 설정
+REMINDER_REFRESH_INTERVAL = 60  # 대기 알림 목록 갱신 간격 (초)
+REMINDER_LOOKAHEAD = timedelta(minutes=5)  # 미리 큐에 올릴 범위
+REMINDER_MAX_SLEEP = 30  # 최대 대기 시간 (초)
+REMINDER_BATCH_SIZE = 50  # 한 번에 선점할 알림 수
+REMINDER_PRELOAD_LIMIT = 1000  # 한 번에 큐에 올릴 최대 알림 수
+
+
+async def _run_reminder_dispatcher(
+    label: str,
+    load_upcoming: Callable[[timedelta, int], List[Any]],
+    process_due: Callable[[str, List[Any]], Awaitable[int]],
+) -> None:
+    """
+    ``DueTimeQueue`` 기반 리마인더 발송 루프
+
+    곧 발송될 리마인더를 힙에 올려 두고 가장 이른 발송 시각까지 잠들었다가,
+    깨어나면 힙에서 꺼낸 ID 만 선점하여 발송합니다. 여러 워커가 함께 실행되어도
+    선점 단계에서 중복 발송이 걸러집니다. 갱신 이후 추가되거나 앞당겨진 리마인더는
+    다음 갱신 때 힙에 올라갑니다.
+
+    Args:
+        label: 로그에 표시할 스케줄러 이름
+        load_upcoming: ``(lookahead, limit)`` 을 받아 ``(id, 발송 시각)`` 목록을 반환 (스레드에서 실행)
+        process_due: ``(worker_id, ids)`` 를 받아 발송 수를 반환하는 코루틴 함수
+    """
+    due_queue = DueTimeQueue()
+    worker_id = default_worker_id()
+    next_refresh = 0.0
+    saturated = False
+
+    while True:
+        try:
+            # 미리 올린 목록이 한도에 걸렸다면 큐가 비는 즉시 다시 갱신
+            if time.monotonic() >= next_refresh or (saturated and not due_queue):
+                upcoming = await asyncio.to_thread(
+                    load_upcoming, REMINDER_LOOKAHEAD, REMINDER_PRELOAD_LIMIT
+                )
+                for reminder_id, fire_at in upcoming:
+                    due_queue.push(reminder_id, fire_at)
+                saturated = len(upcoming) >= REMINDER_PRELOAD_LIMIT
+                next_refresh = time.monotonic() + REMINDER_REFRESH_INTERVAL
+
+            due_ids = due_queue.pop_due(limit=REMINDER_BATCH_SIZE)
+            if due_ids:
+                processed = await process_due(worker_id, due_ids)
+                logger.debug(f"{label}: {len(due_ids)}건 중 {processed}건 발송")
+
+            await asyncio.sleep(due_queue.seconds_until_next(REMINDER_MAX_SLEEP))
+        except asyncio.CancelledError:
+            logger.info(f"{label} 작업이 취소되었습니다.")
+            break
+        except Exception as e:
+            logger.error(f"{label} 오류 발생: {str(e)}")
+            await asyncio.sleep(60)  # 오류 발생 시 1분 후 재시도
+
+
+def _load_upcoming_reminders(lookahead: timedelta, limit: int) -> List[Any]:
+    """곧 발송될 일정 알림의 ID 와 발송 시각 조회 (스레드에서 실행)"""
+    from packagesdatabase import SessionLocal
+    from packagesmodels.schedule import ReminderStatus, ScheduleReminderModel
+
+    until = datetime.now(timezone.utc).replace(tzinfo=None) + lookahead
+    db = SessionLocal()
+    try:
+        return (
+            db.query(ScheduleReminderModel.id, ScheduleReminderModel.reminder_time)
+            .filter(
+                ScheduleReminderModel.status == ReminderStatus.PENDING.value,
+                ScheduleReminderModel.reminder_time <= until,
+            )
+            .order_by(ScheduleReminderModel.reminder_time)
+            .limit(limit)
+            .all()
+        )
+    finally:
+        db.close()
+
+
+def _process_due_reminders(worker_id: str, reminder_ids: List[str]) -> int:
+    """힙에서 꺼낸 일정 알림을 선점하여 발송 (스레드에서 실행)"""
+    from packagesdatabase import SessionLocal
+    from packagesmodules.schedule_service import ScheduleService
+
+    db = SessionLocal()
+    try:
+        return ScheduleService(db).process_pending_reminders(
+            limit=len(reminder_ids), worker_id=worker_id, reminder_ids=reminder_ids
+        )
+    finally:
+        db.close()
+
+
+@register_background_task("reminder_dispatcher")
+async def dispatch_due_reminders(app: FastAPI):
+    """
+    일정 알림 발송 스케줄러 (``_run_reminder_dispatcher`` 참고)
+
+    Args:
+        app: FastAPI 애플리케이션 인스턴스
+    """
+
+    async def process_due(worker_id: str, reminder_ids: List[str]) -> int:
+        return await asyncio.to_thread(_process_due_reminders, worker_id, reminder_ids)
+
+    await _run_reminder_dispatcher(
+        "알림 발송 스케줄러", _load_upcoming_reminders, process_due
+    )
+
+
+def _load_upcoming_todo_reminders(lookahead: timedelta, limit: int) -> List[Any]:
+    """곧 발송될 Todo 리마인더의 ID 와 발송 시각 조회 (스레드에서 실행)"""
+    from packagesdatabase import SessionLocal
+    from packagesrepositories.todo_repository import TodoRepository
+
+    until = datetime.now(timezone.utc).replace(tzinfo=None) + lookahead
+    db = SessionLocal()
+    try:
+        return TodoRepository(db).get_upcoming_reminders(until, limit)
+    finally:
+        db.close()
+
+
+def _claim_todo_reminders(
+    worker_id: str, reminder_ids: List[str]
+) -> List[Dict[str, Any]]:
+    """힙에서 꺼낸 Todo 리마인더 선점 (스레드에서 실행)"""
+    from packagesdatabase import SessionLocal
+    from packagesrepositories.todo_repository import TodoRepository
+
+    db = SessionLocal()
+    try:
+        return TodoRepository(db).claim_pending_reminders(
+            worker_id, len(reminder_ids), reminder_ids
+        )
+    finally:
+        db.close()
+
+
+def _finish_todo_reminders(sent_ids: List[str], failed_ids: List[str]) -> None:
+    """선점한 Todo 리마인더의 발송 결과 기록 (스레드에서 실행)"""
+    from packagesdatabase import SessionLocal
+    from packagesrepositories.todo_repository import TodoRepository
+
+    db = SessionLocal()
+    try:
+        repository = TodoRepository(db)
+        repository.complete_reminders(sent_ids)
+        repository.fail_reminders(failed_ids)
+    finally:
+        db.close()
+
+
+async def _deliver_todo_reminders(worker_id: str, reminder_ids: List[str]) -> int:
+    """
+    Todo 리마인더 선점 → 발송 → 완료/실패 기록
+
+    담당자(없으면 작성자)에게 WebSocket 으로 보내며, 오프라인 사용자는
+    오프라인 큐에 저장되어 재접속 시 전달됩니다. 발송 중 예외가 난 리마인더는
+    ``fail_reminders`` 로 재시도 한도 내에서 다시 대기 상태가 됩니다.
+
+    Args:
+        worker_id: 워커 식별자
+        reminder_ids: 힙에서 꺼낸 리마인더 ID 목록
+
+    Returns:
+        int: 발송한 리마인더 수
+    """
+    from packagescore.websocket_manager import websocket_manager
+
+    reminders = await asyncio.to_thread(_claim_todo_reminders, worker_id, reminder_ids)
+    sent_ids: List[str] = []
+    failed_ids: List[str] = []
+    for entry in reminders:
+        reminder_id = entry["reminder"]["id"]
+        recipient = entry["assignee_id"] or entry["user_id"]
+        try:
+            if recipient:
+                await websocket_manager.send_personal_message(
+                    entry, str(recipient), message_type="todo_reminder"
+                )
+            else:
+                logger.info(f"수신자 없는 Todo 리마인더: {reminder_id} ({entry['todo_id']})")
+            sent_ids.append(reminder_id)
+        except Exception as e:
+            failed_ids.append(reminder_id)
+            logger.error(f"Todo 리마인더 발송 중 오류 발생: {str(e)}")
+
+    await asyncio.to_thread(_finish_todo_reminders, sent_ids, failed_ids)
+    return len(sent_ids)
+
+
+@register_background_task("todo_reminder_dispatcher")
+async def dispatch_due_todo_reminders(app: FastAPI):
+    """
+    Todo 리마인더 발송 스케줄러 (``_run_reminder_dispatcher`` 참고)
+
+    Args:
+        app: FastAPI 애플리케이션 인스턴스
+    """
+    await _run_reminder_dispatcher(
+        "Todo 리마인더 발송 스케줄러",
+        _load_upcoming_todo_reminders,
+        _deliver_todo_reminders,
+    )
+
+
 async def start_background_tasks(app: FastAPI) -> Set[asyncio.Task]:
     """
     등록된 모든 백그라운드 작업을 시작합니다.
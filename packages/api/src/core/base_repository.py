@@ -2,13 +2,20 @@
 기본 리포지토리 클래스 모듈.
 """
 
-from typing import Any, Dict, Generic, List, Type, TypeVar
+from contextlib import nullcontext
+from typing import Any, Dict, Generic, List, Optional, Type, TypeVar
 
 from pydantic import BaseModel
-from sqlalchemy import and_, select
+from sqlalchemy import and_, func, select
 from sqlalchemy.orm import Session
 
 from packages.api.src.corelogging import get_logger
+from packages.api.src.corereplication import replication_manager
+# 통계 캐시는 리포지토리들과 같은 인스턴스를 쓰도록 같은 경로로 import
+from packagescore.aggregates import stats_cache
+from packagescore.pagination import (COUNT_CACHE_TTL, CountMode, CursorPage,
+                                     apply_keyset, build_page, cursor_scope,
+                                     watch_counts)
 
 # 제네릭 타입 정의
 T = TypeVar("T")
@@ -55,19 +62,129 @@ class BaseRepository(Generic[ModelType, CreateSchemaType]):
         self, skip: int = 0, limit: int = 100, filters: Dict[str, Any] = None
     ) -> List[ModelType]:
         """Find all records with optional filters"""
+        query = self._filtered_select(filters).offset(skip).limit(limit)
+        async with self._read_session() as db:
+            result = await db.execute(query)
+            return await self._attach(db, result.scalars().all())
+
+    def _read_session(self):
+        """
+        읽기 전용 조회 세션
+
+        정상 복제본이 있으면 복제본 세션을, 현재 세션에 반영 전 변경이 있거나
+        최근 쓰기로 주 데이터베이스에 고정된 경우에는 현재 세션을 사용합니다.
+        """
+        if self.db.new or self.db.dirty or self.db.deleted:
+            return nullcontext(self.db)
+        return replication_manager.read_session(self.db)
+
+    async def _attach(self, db: Any, rows: Any) -> List[ModelType]:
+        """
+        복제본 세션에서 읽은 객체를 현재 세션에 연결
+
+        복제본 세션이 닫히면 객체가 분리되어 지연 로딩이나 수정 후 커밋이 동작하지
+        않으므로, 추가 조회 없이(``load=False``) 현재 세션의 객체로 바꿉니다.
+        """
+        if db is self.db:
+            return list(rows)
+        return [await self.db.merge(row, load=False) for row in rows]
+
+    def _filtered_select(self, filters: Optional[Dict[str, Any]] = None):
+        """동등 조건 필터가 적용된 SELECT"""
         query = select(self.model)
-
         if filters:
             conditions = [
                 getattr(self.model, key) == value for key, value in filters.items()
             ]
-
             if conditions:
                 query = query.where(and_(*conditions))
-
-        query = query.offset(skip).limit(limit)
-        result = await self.db.execute(query)
-        return list(result.scalars().all())
+        return query
+
+    async def count(
+        self,
+        filters: Dict[str, Any] = None,
+        count_mode: CountMode = CountMode.EXACT,
+    ) -> Optional[int]:
+        """
+        필터에 맞는 레코드 수 조회
+
+        Args:
+            filters: 동등 조건 필터
+            count_mode: ``exact`` / ``cached`` / ``estimate`` / ``none``
+                (비동기 경로에서 ``estimate`` 는 ``cached`` 와 같음)
+
+        Returns:
+            Optional[int]: 레코드 수 (``none`` 이면 None)
+        """
+        count_mode = CountMode(count_mode)
+        if count_mode == CountMode.NONE:
+            return None
+
+        cache_key = f"{self.model.__name__}:{sorted((filters or {}).items(), key=str)}"
+        if count_mode != CountMode.EXACT:
+            namespace = watch_counts(self.model)
+            cached = stats_cache.get(namespace, cache_key)
+            if cached is not None:
+                return cached
+
+        statement = select(func.count()).select_from(
+            self._filtered_select(filters).subquery()
+        )
+        async with self._read_session() as db:
+            total = (await db.execute(statement)).scalar_one()
+        if count_mode != CountMode.EXACT:
+            stats_cache.set(namespace, cache_key, total, ttl=COUNT_CACHE_TTL)
+        return total
+
+    async def find_page(
+        self,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        filters: Dict[str, Any] = None,
+        sort_field: str = "created_at",
+        descending: bool = True,
+        count_mode: CountMode = CountMode.NONE,
+    ) -> CursorPage[ModelType]:
+        """
+        커서 기반 페이지 조회
+
+        ``(sort_field, id)`` 순서로 정렬하고 이전 페이지의 ``next_cursor`` 이후 행만
+        조회하므로 페이지 깊이와 무관하게 일정한 비용으로 동작합니다.
+
+        Args:
+            cursor: 이전 페이지의 ``next_cursor`` (첫 페이지는 None)
+            limit: 페이지 크기
+            filters: 동등 조건 필터
+            sort_field: 정렬 필드 (NULL 값은 마지막에 정렬)
+            descending: 내림차순 여부
+            count_mode: 전체 개수 계산 방식 (기본값: 계산하지 않음)
+
+        Returns:
+            CursorPage[ModelType]: 페이지 결과
+        """
+        sort_column = getattr(self.model, sort_field)
+        filtered = self._filtered_select(filters)
+        scope = cursor_scope(filtered)
+        statement = apply_keyset(
+            filtered,
+            sort_column,
+            self.model.id,
+            cursor,
+            limit,
+            descending,
+            scope=scope,
+        )
+        async with self._read_session() as db:
+            rows = await self._attach(db, (await db.execute(statement)).scalars().all())
+        page = build_page(
+            rows, limit, sort_field, descending=descending, scope=scope
+        )
+        page.total = await self.count(filters, count_mode)
+        page.total_is_estimate = CountMode(count_mode) in (
+            CountMode.CACHED,
+            CountMode.ESTIMATE,
+        )
+        return page
 
     async def create(self, obj_in: ModelType) -> ModelType:
         """Create a new record"""
@@ -78,5 +195,5 @@ class BaseRepository(Generic[ModelType, CreateSchemaType]):
 
     async def delete(self, obj: ModelType) -> None:
         """Delete a record"""
-        self.db.delete(obj)
+        await self.db.delete(obj)
         await self.db.commit()
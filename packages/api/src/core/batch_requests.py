@@ -0,0 +1,458 @@
+"""
+배치 요청 실행 모듈
+
+``/batch`` 요청에 담긴 여러 하위 요청을 같은 프로세스의 ASGI 앱으로 직접 전달해
+실행합니다. 네트워크 왕복 없이 라우팅/의존성/미들웨어를 그대로 거칩니다.
+
+- 의존성이 없는 조회(GET/HEAD/OPTIONS) 요청은 동시 실행 수 제한 안에서 병렬로 실행
+- 변경 요청(POST/PUT/PATCH/DELETE)은 배치 안의 순서대로 하나씩 실행
+- ``depends_on`` 으로 다른 항목이 끝난 뒤 실행하도록 지정하고, 경로/파라미터/본문의
+  ``${항목ID.body.필드}`` 참조를 앞선 응답 값으로 치환 (의존 항목이 실패하면 424)
+- 결과는 배치 순서대로 완료되는 즉시 JSON 배열로 스트리밍하며, JSON 하위 응답 본문은
+  다시 파싱하지 않고 그대로 이어 붙임 (압축 등 ``content-encoding`` 이 있는 본문은
+  base64 문자열로 담음)
+- 하위 요청에는 원본/항목 헤더 중 본문 길이·인코딩·연결 관련 헤더를 넘기지 않음
+"""
+
+import asyncio
+import base64
+import json
+import re
+import time
+from dataclasses import dataclass, field
+from typing import (Any, AsyncIterator, Collection, Dict, List, Optional,
+                    Sequence, Set)
+from urllib.parse import urlencode
+
+from starlette.types import ASGIApp, Message, Scope
+
+# 배치 1회당 최대 항목 수
+MAX_BATCH_ITEMS = 50
+
+# 조회 요청 동시 실행 수
+DEFAULT_BATCH_CONCURRENCY = 8
+
+# 동시에 실행해도 안전한 메서드
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+ALLOWED_METHODS = SAFE_METHODS | {"POST", "PUT", "PATCH", "DELETE"}
+
+# 배치 엔드포인트 기본 경로
+DEFAULT_BATCH_PATH = "/batch"
+
+# 하위 요청에 넘기지 않는 원본/항목 헤더 (본문 길이·인코딩과 연결 관련 헤더)
+_EXCLUDED_HEADERS = frozenset(
+    {
+        b"content-length",
+        b"content-type",
+        b"content-encoding",
+        b"accept-encoding",
+        b"transfer-encoding",
+        b"te",
+        b"trailer",
+        b"connection",
+        b"keep-alive",
+        b"proxy-connection",
+        b"upgrade",
+    }
+)
+
+# ${항목ID.body.필드} 참조
+_REFERENCE_PATTERN = re.compile(r"\$\{([^.}]+)\.([^}]+)\}")
+
+_MISSING = object()
+
+
+class BatchValidationError(ValueError):
+    """배치 요청 형식 오류"""
+
+
+@dataclass
+class BatchItem:
+    """배치 항목"""
+
+    index: int
+    id: Any
+    method: str = "GET"
+    path: str = "/"
+    params: Dict[str, Any] = field(default_factory=dict)
+    headers: Dict[str, str] = field(default_factory=dict)
+    body: Any = None
+    depends_on: List[int] = field(default_factory=list)
+    # 실패 여부와 관계없이 먼저 끝나야 하는 항목 (변경 요청 순서 보장)
+    after: List[int] = field(default_factory=list)
+    error: Optional[str] = None
+
+    @property
+    def key(self) -> str:
+        """참조에 쓰는 항목 키 (id 가 없으면 인덱스)"""
+        return str(self.id) if self.id is not None else str(self.index)
+
+
+@dataclass
+class SubResponse:
+    """하위 요청 응답"""
+
+    status: int
+    headers: Dict[str, str] = field(default_factory=dict)
+    body: bytes = b""
+    elapsed: float = 0.0
+    _parsed: Any = field(default=_MISSING, repr=False)
+
+    @property
+    def is_json(self) -> bool:
+        return "json" in self.headers.get("content-type", "")
+
+    def json(self) -> Any:
+        """본문 JSON (참조 치환에 필요할 때만 파싱)"""
+        if self._parsed is _MISSING:
+            try:
+                self._parsed = json.loads(self.body) if self.body else None
+            except ValueError:
+                self._parsed = self.body.decode("utf-8", "replace")
+        return self._parsed
+
+    def encode(self, item_id: Any) -> bytes:
+        """
+        결과 항목 JSON 직렬화
+
+        JSON 본문은 그대로 이어 붙이고, ``content-encoding`` 이 있는 본문(압축 등)은
+        그대로 이어 붙이면 배치 응답이 깨지므로 base64 문자열로 담고
+        ``"body_encoding": "base64"`` 를 추가합니다.
+        """
+        head = {"status": self.status, "headers": self.headers, "time": self.elapsed}
+        if item_id is not None:
+            head["id"] = item_id
+        if not self.body:
+            body = b"null"
+        elif self.headers.get("content-encoding", "identity") != "identity":
+            head["body_encoding"] = "base64"
+            body = b'"' + base64.b64encode(self.body) + b'"'
+        elif self.is_json:
+            body = self.body
+        else:
+            body = json.dumps(self.body.decode("utf-8", "replace")).encode("utf-8")
+        encoded = json.dumps(head, default=str).encode("utf-8")
+        return encoded[:-1] + b',"body":' + body + b"}"
+
+
+def error_response(status: int, message: str) -> SubResponse:
+    """오류 결과 생성"""
+    return SubResponse(
+        status=status,
+        headers={"content-type": "application/json"},
+        body=json.dumps({"error": message}, ensure_ascii=False).encode("utf-8"),
+    )
+
+
+def is_batch_path(path: str, batch_paths: Collection[str]) -> bool:
+    """
+    배치 엔드포인트 경로 여부 (경로가 정확히 일치할 때만, 끝의 '/' 무시)
+
+    Args:
+        path: 요청 경로 (쿼리 문자열 포함 가능)
+        batch_paths: 배치 엔드포인트 경로 목록
+
+    Returns:
+        bool: 배치 엔드포인트 경로이면 True
+    """
+    path = path.split("?", 1)[0].rstrip("/") or "/"
+    return path in batch_paths
+
+
+def parse_batch(
+    payload: Any,
+    max_items: int = MAX_BATCH_ITEMS,
+    batch_paths: Collection[str] = (DEFAULT_BATCH_PATH,),
+) -> List[BatchItem]:
+    """
+    배치 요청 본문을 항목 목록으로 변환하고 실행 순서 의존성 계산
+
+    형식이 잘못된 항목은 ``error`` 가 설정된 채로 반환되어 400 결과가 됩니다.
+
+    Args:
+        payload: 요청 본문 (항목 배열 또는 ``{"requests": [...]}``)
+        max_items: 최대 항목 수
+        batch_paths: 배치 엔드포인트 경로 목록 (중첩 배치 거부용)
+
+    Returns:
+        List[BatchItem]: 배치 항목 목록
+
+    Raises:
+        BatchValidationError: 본문 형식 오류 또는 항목 수 초과
+    """
+    if isinstance(payload, dict):
+        payload = payload.get("requests")
+    if not isinstance(payload, list):
+        raise BatchValidationError("배치 요청은 배열 형식이어야 합니다")
+    if len(payload) > max_items:
+        raise BatchValidationError(f"배치 항목은 최대 {max_items}개까지 허용됩니다")
+
+    items: List[BatchItem] = []
+    for index, raw in enumerate(payload):
+        if not isinstance(raw, dict) or "method" not in raw or "path" not in raw:
+            item_id = raw.get("id") if isinstance(raw, dict) else None
+            items.append(
+                BatchItem(
+                    index, item_id, error="각 배치 항목은 method와 path를 포함해야 합니다"
+                )
+            )
+            continue
+        item = BatchItem(
+            index=index,
+            id=raw.get("id"),
+            method=str(raw["method"]).upper(),
+            path=str(raw["path"]),
+            params=raw.get("params") or {},
+            headers=raw.get("headers") or {},
+            body=raw.get("body"),
+        )
+        if item.method not in ALLOWED_METHODS:
+            item.error = f"지원하지 않는 메서드: {item.method}"
+        elif not item.path.startswith("/"):
+            item.error = "path는 '/'로 시작해야 합니다"
+        elif is_batch_path(item.path, batch_paths):
+            item.error = "배치 요청은 중첩할 수 없습니다"
+        items.append(item)
+
+    _resolve_dependencies(items, payload)
+    return items
+
+
+def _resolve_dependencies(items: List[BatchItem], payload: List[Any]) -> None:
+    """``depends_on`` 을 인덱스로 변환하고 변경 요청 간 순서 의존성 추가"""
+    by_key = {item.key: item.index for item in items}
+    previous_mutation: Optional[int] = None
+
+    for item, raw in zip(items, payload):
+        if item.error:
+            continue
+        depends = raw.get("depends_on") or []
+        if not isinstance(depends, list):
+            depends = [depends]
+        # 참조 문자열에 쓰인 항목도 의존성으로 간주
+        depends = list(depends) + [
+            key for key, _ in _REFERENCE_PATTERN.findall(json.dumps(raw))
+        ]
+        for key in depends:
+            index = by_key.get(str(key))
+            if index is None or index == item.index:
+                item.error = f"알 수 없는 의존 항목: {key}"
+                break
+            if index not in item.depends_on:
+                item.depends_on.append(index)
+
+        if item.method not in SAFE_METHODS:
+            if previous_mutation is not None:
+                item.after.append(previous_mutation)
+            previous_mutation = item.index
+
+    # 순환 의존 검사 (Kahn)
+    pending = {
+        item.index: set(item.depends_on) | set(item.after)
+        for item in items
+        if not item.error
+    }
+    resolved: Set[int] = {item.index for item in items if item.error}
+    progress = True
+    while pending and progress:
+        progress = False
+        for index in list(pending):
+            if pending[index] <= resolved:
+                resolved.add(index)
+                del pending[index]
+                progress = True
+    for index in pending:
+        items[index].error = "순환 의존이 있습니다"
+
+
+def _lookup(value: Any, path: str) -> Any:
+    """``body.a.0.b`` 형식 경로로 값 조회"""
+    for part in path.split("."):
+        if isinstance(value, list) and part.isdigit():
+            value = value[int(part)] if int(part) < len(value) else None
+        elif isinstance(value, dict):
+            value = value.get(part)
+        else:
+            return None
+    return value
+
+
+class BatchExecutor:
+    """배치 항목을 ASGI 앱으로 실행"""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        scope: Scope,
+        items: Sequence[BatchItem],
+        concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    ):
+        """
+        실행기 초기화
+
+        Args:
+            app: 하위 요청을 처리할 ASGI 앱
+            scope: 원본 배치 요청 scope (인증 헤더 등을 물려받음)
+            items: 배치 항목
+            concurrency: 조회 요청 동시 실행 수
+        """
+        self.app = app
+        self.scope = scope
+        self.items = list(items)
+        self.semaphore = asyncio.Semaphore(max(1, concurrency))
+        self.results: Dict[int, "asyncio.Future[SubResponse]"] = {}
+        self.inherited_headers = [
+            (name, value)
+            for name, value in scope.get("headers", [])
+            if name.lower() not in _EXCLUDED_HEADERS
+        ]
+
+    async def stream(self) -> AsyncIterator[bytes]:
+        """
+        모든 항목을 실행하고 결과를 배치 순서대로 스트리밍
+
+        Yields:
+            bytes: JSON 배열 조각
+        """
+        loop = asyncio.get_running_loop()
+        self.results = {item.index: loop.create_future() for item in self.items}
+        tasks = [asyncio.create_task(self._run_item(item)) for item in self.items]
+        try:
+            yield b"["
+            for item in self.items:
+                response = await self.results[item.index]
+                if item.index:
+                    yield b","
+                yield response.encode(item.id)
+            yield b"]"
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _run_item(self, item: BatchItem) -> None:
+        """의존 항목 완료 대기 후 하위 요청 실행"""
+        future = self.results[item.index]
+        try:
+            if item.error:
+                response = error_response(400, item.error)
+            else:
+                dependencies = [await self.results[i] for i in item.depends_on]
+                for index in item.after:
+                    await self.results[index]
+                failed = [
+                    self.items[i].key
+                    for i, dependency in zip(item.depends_on, dependencies)
+                    if dependency.status >= 400
+                ]
+                if failed:
+                    response = error_response(
+                        424, f"의존 항목 실패: {', '.join(failed)}"
+                    )
+                elif item.method in SAFE_METHODS:
+                    async with self.semaphore:
+                        response = await self._call(item)
+                else:
+                    response = await self._call(item)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            response = error_response(500, str(e))
+        if not future.done():
+            future.set_result(response)
+
+    def _substitute(self, value: Any) -> Any:
+        """``${항목ID.body.필드}`` 참조를 의존 항목 응답 값으로 치환"""
+        if isinstance(value, str):
+            match = _REFERENCE_PATTERN.fullmatch(value)
+            if match:
+                return self._reference(match.group(1), match.group(2))
+            return _REFERENCE_PATTERN.sub(
+                lambda m: str(self._reference(m.group(1), m.group(2))), value
+            )
+        if isinstance(value, dict):
+            return {key: self._substitute(item) for key, item in value.items()}
+        if isinstance(value, list):
+            return [self._substitute(item) for item in value]
+        return value
+
+    def _reference(self, key: str, path: str) -> Any:
+        for item in self.items:
+            if item.key == key:
+                response = self.results[item.index].result()
+                field_name, _, rest = path.partition(".")
+                if field_name == "status":
+                    return response.status
+                if field_name == "headers":
+                    return response.headers.get(rest.lower())
+                return _lookup(response.json(), rest) if rest else response.json()
+        return None
+
+    async def _call(self, item: BatchItem) -> SubResponse:
+        """하위 요청을 ASGI 앱으로 실행하고 응답 수집"""
+        path = self._substitute(item.path)
+        path, _, query = path.partition("?")
+        params = self._substitute(item.params)
+        if params:
+            extra = urlencode(params, doseq=True)
+            query = f"{query}&{extra}" if query else extra
+
+        body = b""
+        headers = list(self.inherited_headers)
+        for name, value in item.headers.items():
+            name = name.lower().encode("latin-1")
+            if name not in _EXCLUDED_HEADERS:
+                headers.append((name, str(value).encode("latin-1")))
+        if item.body is not None:
+            body = json.dumps(self._substitute(item.body), default=str).encode("utf-8")
+            headers.append((b"content-type", b"application/json"))
+        headers.append((b"content-length", str(len(body)).encode("latin-1")))
+
+        scope = dict(self.scope)
+        scope.update(
+            method=item.method,
+            path=path,
+            raw_path=path.encode("utf-8"),
+            query_string=query.encode("latin-1"),
+            headers=headers,
+            state={},
+        )
+
+        done = asyncio.Event()
+        request_sent = False
+
+        async def receive() -> Message:
+            nonlocal request_sent
+            if not request_sent:
+                request_sent = True
+                return {"type": "http.request", "body": body, "more_body": False}
+            await done.wait()
+            return {"type": "http.disconnect"}
+
+        status = 500
+        response_headers: Dict[str, str] = {}
+        chunks: List[bytes] = []
+
+        async def send(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                for name, value in message.get("headers", []):
+                    response_headers[name.decode("latin-1").lower()] = value.decode(
+                        "latin-1"
+                    )
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            done.set()
+        return SubResponse(
+            status=status,
+            headers=response_headers,
+            body=b"".join(chunks),
+            elapsed=round(time.perf_counter() - started, 6),
+        )
@@ -0,0 +1,705 @@
+"""
+대량 적재(bulk ingest) 모듈
+
+CSV/NDJSON 입력을 한 줄씩 읽어 배치로 묶고, 배치 단위로 컬럼별 변환/검증을 수행한 뒤
+PostgreSQL ``COPY`` (그 외 DB 는 ``executemany``) 로 기록합니다.
+
+- 전체 적재는 하나의 트랜잭션이며 배치마다 SAVEPOINT 를 사용합니다.
+- 배치 기록이 DB 오류로 실패하면 해당 SAVEPOINT 만 되돌리고 배치를 반으로 나누어
+  다시 기록하므로, 문제 행만 오류로 보고되고 나머지 행은 적재됩니다.
+- 검증/기록 오류는 행 번호와 함께 ``IngestReport`` 에 기록되며 적재를 중단하지 않습니다.
+  ``atomic=True`` 이면 오류가 하나라도 있을 때 전체를 롤백하고 ``BulkIngestError`` 를
+  발생시킵니다.
+"""
+
+import csv
+import io
+import json
+import logging
+import math
+import os
+import time
+import uuid
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import date, datetime, timezone
+from enum import Enum
+from typing import (Any, Callable, Dict, Iterable, Iterator, List, Mapping,
+                    Optional, Sequence, Tuple, Union)
+
+from sqlalchemy import JSON, Boolean, Date, DateTime, Float, Integer, Numeric
+from sqlalchemy import String, insert
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+# 기본 배치 크기
+DEFAULT_INGEST_BATCH_SIZE = 1000
+
+# 보고서에 보관할 최대 오류 상세 수 (건수는 모두 집계)
+MAX_ERROR_DETAILS = 1000
+
+# 배치 단위 추가 검증 함수: (세션, 행 목록) -> (행 인덱스, 오류 메시지) 목록
+BatchCheck = Callable[[Session, List[Dict[str, Any]]], Iterable[Tuple[int, str]]]
+
+# 묶음 기록 직후 같은 SAVEPOINT 안에서 실행할 함수: (세션, 기록한 행 목록) -> None
+AfterWrite = Callable[[Session, List[Dict[str, Any]]], None]
+
+
+class IngestMethod(str, Enum):
+    """기록 방식"""
+
+    AUTO = "auto"
+    COPY = "copy"
+    EXECUTEMANY = "executemany"
+
+
+@dataclass
+class RowError:
+    """행 단위 오류"""
+
+    row_number: int
+    errors: List[str]
+    record: Optional[Dict[str, Any]] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """딕셔너리로 변환"""
+        return {"row": self.row_number, "errors": self.errors, "record": self.record}
+
+
+@dataclass
+class IngestReport:
+    """적재 결과 보고서"""
+
+    total: int = 0
+    inserted: int = 0
+    failed: int = 0
+    method: str = ""
+    duration_seconds: float = 0.0
+    errors: List[RowError] = field(default_factory=list)
+    inserted_ids: List[Any] = field(default_factory=list)
+
+    def add_error(self, error: RowError) -> None:
+        """오류 추가 (상세는 ``MAX_ERROR_DETAILS`` 개까지만 보관)"""
+        self.failed += 1
+        if len(self.errors) < MAX_ERROR_DETAILS:
+            self.errors.append(error)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """딕셔너리로 변환"""
+        return {
+            "total": self.total,
+            "inserted": self.inserted,
+            "failed": self.failed,
+            "method": self.method,
+            "duration_seconds": round(self.duration_seconds, 3),
+            "errors": [error.to_dict() for error in self.errors],
+        }
+
+
+class BulkIngestError(Exception):
+    """``atomic`` 적재에서 오류가 발생해 전체를 롤백했을 때 발생하는 예외"""
+
+    def __init__(self, report: IngestReport):
+        self.report = report
+        super().__init__(f"{report.failed}개 행에서 오류가 발생해 적재를 취소했습니다.")
+
+
+# ----------------------------------------------------------------------
+# 입력 스트림
+# ----------------------------------------------------------------------
+
+
+@contextmanager
+def _open_text(source: Any, encoding: str) -> Iterator[Any]:
+    """경로 또는 파일 객체를 텍스트 스트림으로 열기"""
+    if isinstance(source, (str, bytes, os.PathLike)):
+        with open(source, "r", encoding=encoding, newline="") as handle:
+            yield handle
+    elif isinstance(source, (io.RawIOBase, io.BufferedIOBase)) or "b" in getattr(
+        source, "mode", ""
+    ):
+        yield io.TextIOWrapper(source, encoding=encoding, newline="")
+    else:
+        yield source
+
+
+def iter_csv(
+    source: Any, encoding: str = "utf-8", **reader_options: Any
+) -> Iterator[Dict[str, Any]]:
+    """
+    CSV 행을 딕셔너리로 스트리밍 (첫 줄은 헤더, 빈 값은 None)
+
+    Args:
+        source: 파일 경로 또는 파일 객체
+        encoding: 파일 인코딩
+        **reader_options: ``csv.DictReader`` 옵션
+
+    Returns:
+        Iterator[Dict[str, Any]]: 행 딕셔너리
+    """
+    with _open_text(source, encoding) as handle:
+        for row in csv.DictReader(handle, **reader_options):
+            yield {
+                key.strip(): (value if value != "" else None)
+                for key, value in row.items()
+                if key is not None
+            }
+
+
+def iter_ndjson(
+    source: Any, encoding: str = "utf-8"
+) -> Iterator[Union[Dict[str, Any], RowError]]:
+    """
+    NDJSON 행을 딕셔너리로 스트리밍
+
+    해석할 수 없는 줄은 ``RowError`` 로 전달되어 해당 행만 오류 처리됩니다.
+
+    Args:
+        source: 파일 경로 또는 파일 객체
+        encoding: 파일 인코딩
+
+    Returns:
+        Iterator: 행 딕셔너리 또는 ``RowError``
+    """
+    with _open_text(source, encoding) as handle:
+        for line in handle:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError as e:
+                yield RowError(0, [f"JSON 형식 오류: {e}"])
+                continue
+            if isinstance(record, dict):
+                yield record
+            else:
+                yield RowError(0, ["JSON 객체가 아닙니다"])
+
+
+def iter_records(
+    source: Any, fmt: str = "csv", encoding: str = "utf-8"
+) -> Iterator[Union[Dict[str, Any], RowError]]:
+    """
+    형식에 맞는 입력 스트림 선택
+
+    Args:
+        source: 파일 경로 또는 파일 객체
+        fmt: ``csv`` 또는 ``ndjson`` (``jsonl``)
+        encoding: 파일 인코딩
+
+    Returns:
+        Iterator: 행 스트림
+    """
+    fmt = fmt.lower()
+    if fmt == "csv":
+        return iter_csv(source, encoding)
+    if fmt in ("ndjson", "jsonl"):
+        return iter_ndjson(source, encoding)
+    raise ValueError(f"지원하지 않는 입력 형식: {fmt}")
+
+
+# ----------------------------------------------------------------------
+# 컬럼 변환
+# ----------------------------------------------------------------------
+
+_TRUE_VALUES = {"1", "true", "t", "y", "yes"}
+_FALSE_VALUES = {"0", "false", "f", "n", "no"}
+
+
+def _to_datetime(value: Any) -> datetime:
+    if isinstance(value, datetime):
+        parsed = value
+    elif isinstance(value, date):
+        parsed = datetime(value.year, value.month, value.day)
+    else:
+        parsed = datetime.fromisoformat(str(value).strip().replace("Z", "+00:00"))
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+def _to_date(value: Any) -> date:
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return date.fromisoformat(str(value).strip()[:10])
+
+
+def _to_bool(value: Any) -> bool:
+    if isinstance(value, bool):
+        return value
+    text_value = str(value).strip().lower()
+    if text_value in _TRUE_VALUES:
+        return True
+    if text_value in _FALSE_VALUES:
+        return False
+    raise ValueError(f"불리언 값이 아닙니다: {value}")
+
+
+def _to_float(value: Any) -> float:
+    if isinstance(value, bool):
+        raise ValueError("숫자가 아닙니다")
+    number = float(value)
+    # "1e400"/"nan" 같은 문자열도 float() 는 통과하므로 유한한 값만 허용
+    if not math.isfinite(number):
+        raise ValueError(f"유한한 숫자가 아닙니다: {value}")
+    return number
+
+
+def _to_int(value: Any) -> int:
+    if isinstance(value, bool):
+        raise ValueError("정수가 아닙니다")
+    number = _to_float(value) if isinstance(value, str) else value
+    if isinstance(number, float) and not math.isfinite(number):
+        raise ValueError(f"유한한 숫자가 아닙니다: {value}")
+    if int(number) != number:
+        raise ValueError(f"정수가 아닙니다: {value}")
+    return int(number)
+
+
+def _to_json(value: Any) -> Any:
+    return json.loads(value) if isinstance(value, str) else value
+
+
+def _to_string(value: Any) -> str:
+    return value.value if isinstance(value, Enum) else str(value)
+
+
+def _column_coercer(column: Any) -> Callable[[Any], Any]:
+    """컬럼 타입에 맞는 변환 함수"""
+    column_type = column.type
+    if isinstance(column_type, DateTime):
+        return _to_datetime
+    if isinstance(column_type, Date):
+        return _to_date
+    if isinstance(column_type, Boolean):
+        return _to_bool
+    if isinstance(column_type, Integer):
+        return _to_int
+    if isinstance(column_type, (Float, Numeric)):
+        return _to_float
+    if isinstance(column_type, JSON):
+        return _to_json
+    if isinstance(column_type, String):
+        return _to_string
+    return lambda value: value
+
+
+def _column_default(column: Any) -> Optional[Callable[[], Any]]:
+    """COPY 는 ORM 기본값을 적용하지 않으므로 Python 측 기본값을 직접 계산"""
+    default = column.default
+    if default is None:
+        return None
+    if getattr(default, "is_scalar", False):
+        return lambda: default.arg
+    if getattr(default, "is_callable", False):
+        return lambda: default.arg(None)
+    return None
+
+
+class BulkIngestor:
+    """테이블 단위 대량 적재기"""
+
+    def __init__(
+        self,
+        model: Any,
+        defaults: Optional[Mapping[str, Any]] = None,
+        checks: Sequence[BatchCheck] = (),
+        key_column: str = "id",
+        ignore_unknown: bool = False,
+        after_write: Optional[AfterWrite] = None,
+    ):
+        """
+        대량 적재기 초기화
+
+        Args:
+            model: 매핑 모델 또는 테이블
+            defaults: 값이 없을 때 채울 기본값 (호출 가능 객체는 행마다 호출)
+            checks: 타입 변환 이후 실행할 배치 단위 추가 검증 목록
+            key_column: 적재된 ID 로 보고할 컬럼
+            ignore_unknown: True 이면 테이블에 없는 필드를 오류 대신 무시
+            after_write: 묶음 기록 직후 실행할 함수 (태그 인덱스 동기화 등).
+                기록과 같은 SAVEPOINT 에서 실행되므로 실패하면 묶음과 함께 되돌려짐
+        """
+        self.table = getattr(model, "__table__", model)
+        self.key_column = key_column
+        self.checks = list(checks)
+        self.ignore_unknown = ignore_unknown
+        self.after_write = after_write
+        self.columns = [
+            column
+            for column in self.table.columns
+            if column.computed is None and not column.system
+        ]
+        self.column_names = [column.name for column in self.columns]
+        self.coercers = {column.name: _column_coercer(column) for column in self.columns}
+        self.lengths = {
+            column.name: column.type.length
+            for column in self.columns
+            if isinstance(column.type, String) and column.type.length
+        }
+        self.required = {
+            column.name
+            for column in self.columns
+            if not column.nullable and column.server_default is None
+        }
+
+        self.defaults: Dict[str, Callable[[], Any]] = {}
+        for column in self.columns:
+            column_default = _column_default(column)
+            if column_default is not None:
+                self.defaults[column.name] = column_default
+        if key_column in self.column_names and isinstance(
+            self.table.c[key_column].type, String
+        ):
+            self.defaults.setdefault(key_column, lambda: str(uuid.uuid4()))
+        for name, value in (defaults or {}).items():
+            self.defaults[name] = value if callable(value) else (lambda v=value: v)
+
+    # ------------------------------------------------------------------
+    # 검증
+    # ------------------------------------------------------------------
+
+    def validate_batch(
+        self, db: Session, records: List[Dict[str, Any]]
+    ) -> Tuple[List[Dict[str, Any]], Dict[int, List[str]]]:
+        """
+        배치 단위 변환/검증
+
+        행 단위가 아니라 컬럼 단위로 변환 함수를 적용하므로 컬럼별 준비 비용은
+        배치당 한 번만 듭니다.
+
+        Args:
+            db: 데이터베이스 세션 (추가 검증용)
+            records: 원본 행 목록
+
+        Returns:
+            Tuple: ``(변환된 행 목록, 행 인덱스별 오류 메시지)``
+        """
+        errors: Dict[int, List[str]] = {}
+        rows: List[Dict[str, Any]] = [{} for _ in records]
+
+        if not self.ignore_unknown:
+            for index, record in enumerate(records):
+                unknown = [key for key in record if key not in self.coercers]
+                if unknown:
+                    errors.setdefault(index, []).append(
+                        f"알 수 없는 필드: {', '.join(sorted(unknown))}"
+                    )
+
+        for name in self.column_names:
+            coerce = self.coercers[name]
+            max_length = self.lengths.get(name)
+            default = self.defaults.get(name)
+            required = name in self.required
+            for index, record in enumerate(records):
+                value = record.get(name)
+                if value is None:
+                    if default is not None:
+                        value = default()
+                    elif required:
+                        errors.setdefault(index, []).append(f"필수 필드 누락: {name}")
+                        continue
+                if value is not None:
+                    try:
+                        value = coerce(value)
+                    except (TypeError, ValueError, OverflowError) as e:
+                        errors.setdefault(index, []).append(
+                            f"{name} 필드 형식 오류: {e}"
+                        )
+                        continue
+                    if max_length and len(value) > max_length:
+                        errors.setdefault(index, []).append(
+                            f"{name} 필드가 최대 길이({max_length})를 초과했습니다"
+                        )
+                        continue
+                rows[index][name] = value
+
+        pending = [index for index in range(len(records)) if index not in errors]
+        if self.checks and pending:
+            candidates = [rows[index] for index in pending]
+            for check in self.checks:
+                for position, message in check(db, candidates):
+                    errors.setdefault(pending[position], []).append(message)
+
+        return rows, errors
+
+    # ------------------------------------------------------------------
+    # 기록
+    # ------------------------------------------------------------------
+
+    def resolve_method(self, db: Session, method: Union[str, IngestMethod]) -> str:
+        """
+        기록 방식 결정 (``auto`` 는 COPY 가능 여부로 판단)
+
+        Args:
+            db: 데이터베이스 세션
+            method: 요청한 기록 방식
+
+        Returns:
+            str: ``copy`` 또는 ``executemany``
+        """
+        method = IngestMethod(method)
+        if method != IngestMethod.AUTO:
+            return method.value
+        if db.get_bind().dialect.name != "postgresql":
+            return IngestMethod.EXECUTEMANY.value
+        cursor = db.connection().connection.driver_connection.cursor()
+        try:
+            supports_copy = hasattr(cursor, "copy_expert") or hasattr(cursor, "copy")
+        finally:
+            cursor.close()
+        return (
+            IngestMethod.COPY.value if supports_copy else IngestMethod.EXECUTEMANY.value
+        )
+
+    @staticmethod
+    def _copy_value(value: Any) -> str:
+        """COPY text 형식 값 인코딩"""
+        if value is None:
+            return "\\N"
+        if isinstance(value, bool):
+            return "t" if value else "f"
+        if isinstance(value, datetime):
+            text_value = value.isoformat(sep=" ")
+        elif isinstance(value, (dict, list)):
+            text_value = json.dumps(value, ensure_ascii=False, default=str)
+        else:
+            text_value = str(value)
+        return (
+            text_value.replace("\\", "\\\\")
+            .replace("\t", "\\t")
+            .replace("\n", "\\n")
+            .replace("\r", "\\r")
+        )
+
+    def _copy_rows(self, db: Session, rows: List[Dict[str, Any]]) -> None:
+        """
+        PostgreSQL COPY FROM STDIN 기록
+
+        드라이버 커서를 직접 사용하므로 드라이버 예외를 ``DBAPIError`` 로 감싸
+        ``executemany`` 경로와 같은 방식으로 문제 행 격리가 동작하게 합니다.
+        """
+        dialect = db.get_bind().dialect
+        dbapi = getattr(dialect, "loaded_dbapi", None) or dialect.dbapi
+        preparer = dialect.identifier_preparer
+        columns = ", ".join(preparer.quote(name) for name in self.column_names)
+        statement = f"COPY {preparer.format_table(self.table)} ({columns}) FROM STDIN"
+        payload = "".join(
+            "\t".join(self._copy_value(row.get(name)) for name in self.column_names)
+            + "\n"
+            for row in rows
+        )
+        cursor = db.connection().connection.driver_connection.cursor()
+        try:
+            if hasattr(cursor, "copy_expert"):
+                cursor.copy_expert(statement, io.StringIO(payload))
+            else:
+                with cursor.copy(statement) as copy:
+                    copy.write(payload)
+        except dbapi.Error as e:
+            raise DBAPIError.instance(
+                statement, None, e, dbapi.Error, dialect=dialect
+            ) from e
+        finally:
+            cursor.close()
+
+    def _write(self, db: Session, rows: List[Dict[str, Any]], method: str) -> None:
+        """한 묶음 기록"""
+        if method == IngestMethod.COPY.value:
+            self._copy_rows(db, rows)
+        else:
+            full_rows = [
+                {name: row.get(name) for name in self.column_names} for row in rows
+            ]
+            db.execute(insert(self.table), full_rows)
+        if self.after_write is not None:
+            self.after_write(db, rows)
+
+    def _write_isolated(
+        self,
+        db: Session,
+        numbered_rows: List[Tuple[int, Dict[str, Any]]],
+        method: str,
+        report: IngestReport,
+        collect_ids: bool,
+    ) -> None:
+        """SAVEPOINT 안에서 기록하고, 실패하면 반으로 나누어 문제 행을 격리"""
+        try:
+            with db.begin_nested():
+                self._write(db, [row for _, row in numbered_rows], method)
+        except DBAPIError as e:
+            if len(numbered_rows) == 1:
+                row_number, row = numbered_rows[0]
+                message = str(getattr(e, "orig", e)).strip().splitlines()[0]
+                report.add_error(RowError(row_number, [f"DB 오류: {message}"], row))
+                return
+            middle = len(numbered_rows) // 2
+            self._write_isolated(
+                db, numbered_rows[:middle], method, report, collect_ids
+            )
+            self._write_isolated(
+                db, numbered_rows[middle:], method, report, collect_ids
+            )
+            return
+
+        report.inserted += len(numbered_rows)
+        if collect_ids:
+            report.inserted_ids.extend(
+                row.get(self.key_column) for _, row in numbered_rows
+            )
+
+    def _process_batch(
+        self,
+        db: Session,
+        batch: List[Tuple[int, Dict[str, Any]]],
+        method: str,
+        report: IngestReport,
+        collect_ids: bool,
+    ) -> None:
+        """배치 검증 후 유효한 행 기록"""
+        records = [record for _, record in batch]
+        rows, errors = self.validate_batch(db, records)
+        valid_rows = []
+        for position, (row_number, record) in enumerate(batch):
+            if position in errors:
+                report.add_error(RowError(row_number, errors[position], record))
+            else:
+                valid_rows.append((row_number, rows[position]))
+        if valid_rows:
+            self._write_isolated(db, valid_rows, method, report, collect_ids)
+
+    def ingest(
+        self,
+        db: Session,
+        records: Iterable[Union[Dict[str, Any], RowError]],
+        batch_size: int = DEFAULT_INGEST_BATCH_SIZE,
+        method: Union[str, IngestMethod] = IngestMethod.AUTO,
+        atomic: bool = False,
+        collect_ids: bool = False,
+        commit: bool = True,
+    ) -> IngestReport:
+        """
+        행 스트림 적재
+
+        Args:
+            db: 데이터베이스 세션
+            records: 행 딕셔너리 스트림 (``iter_records`` 결과 등)
+            batch_size: 검증/기록 배치 크기
+            method: 기록 방식 (``auto``/``copy``/``executemany``)
+            atomic: True 이면 오류가 하나라도 있을 때 전체 롤백 후 예외 발생
+            collect_ids: 적재된 행의 키 수집 여부
+            commit: 완료 후 커밋 여부
+
+        Returns:
+            IngestReport: 적재 결과
+
+        Raises:
+            BulkIngestError: ``atomic`` 적재에서 오류가 발생한 경우
+        """
+        return self.ingest_routed(
+            {None: db},
+            lambda record: None,
+            records,
+            batch_size=batch_size,
+            method=method,
+            atomic=atomic,
+            collect_ids=collect_ids,
+            commit=commit,
+        )
+
+    def ingest_routed(
+        self,
+        sessions: Mapping[Any, Session],
+        route: Callable[[Dict[str, Any]], Any],
+        records: Iterable[Union[Dict[str, Any], RowError]],
+        batch_size: int = DEFAULT_INGEST_BATCH_SIZE,
+        method: Union[str, IngestMethod] = IngestMethod.AUTO,
+        atomic: bool = False,
+        collect_ids: bool = False,
+        commit: bool = True,
+    ) -> IngestReport:
+        """
+        행마다 ``route`` 가 고른 세션(샤드)으로 나누어 적재
+
+        세션마다 따로 배치를 모아 검증/기록하며, 행 번호는 입력 스트림 기준으로
+        보고됩니다. 커밋은 세션별로 이뤄지므로 세션 사이의 원자성은 보장하지
+        않지만, ``atomic`` 적재에서 오류가 있으면 커밋 전에 모든 세션을 롤백합니다.
+
+        Args:
+            sessions: 라우팅 키별 데이터베이스 세션
+            route: 행 딕셔너리로 ``sessions`` 의 키를 고르는 함수
+            records: 행 딕셔너리 스트림 (``iter_records`` 결과 등)
+            batch_size: 검증/기록 배치 크기 (세션별)
+            method: 기록 방식 (``auto``/``copy``/``executemany``)
+            atomic: True 이면 오류가 하나라도 있을 때 전체 롤백 후 예외 발생
+            collect_ids: 적재된 행의 키 수집 여부
+            commit: 완료 후 커밋 여부
+
+        Returns:
+            IngestReport: 적재 결과
+
+        Raises:
+            BulkIngestError: ``atomic`` 적재에서 오류가 발생한 경우
+        """
+        started = time.monotonic()
+        report = IngestReport()
+        try:
+            methods = {
+                key: self.resolve_method(db, method) for key, db in sessions.items()
+            }
+            report.method = ",".join(sorted(set(methods.values())))
+            batches: Dict[Any, List[Tuple[int, Dict[str, Any]]]] = {}
+            for row_number, record in enumerate(records, start=1):
+                report.total += 1
+                if isinstance(record, RowError):
+                    record.row_number = row_number
+                    report.add_error(record)
+                    continue
+                key = route(record)
+                batch = batches.setdefault(key, [])
+                batch.append((row_number, record))
+                if len(batch) >= batch_size:
+                    self._process_batch(
+                        sessions[key], batch, methods[key], report, collect_ids
+                    )
+                    batches[key] = []
+                    logger.debug(
+                        f"{self.table.name} 적재 중: {report.inserted}/{report.total}"
+                    )
+            for key, batch in batches.items():
+                if batch:
+                    self._process_batch(
+                        sessions[key], batch, methods[key], report, collect_ids
+                    )
+            # 세션별로 처리한 오류를 입력 순서로 정렬
+            report.errors.sort(key=lambda error: error.row_number)
+
+            if atomic and report.failed:
+                for db in sessions.values():
+                    db.rollback()
+                report.inserted = 0
+                report.inserted_ids = []
+                raise BulkIngestError(report)
+            if commit:
+                for db in sessions.values():
+                    db.commit()
+        except BulkIngestError:
+            raise
+        except Exception:
+            for db in sessions.values():
+                db.rollback()
+            raise
+        finally:
+            report.duration_seconds = time.monotonic() - started
+
+        logger.info(
+            f"{self.table.name} 적재 완료: {report.inserted}건 성공, "
+            f"{report.failed}건 실패 ({report.method}, "
+            f"{report.duration_seconds:.2f}초)"
+        )
+        return report
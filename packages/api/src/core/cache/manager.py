@@ -96,6 +96,16 @@ class CacheManager:
 
         self._cleanup_memory_cache()
 
+    @property
+    def redis_client(self):
+        """동기 Redis 클라이언트 (Redis 백엔드가 아니면 None)"""
+        return self._redis_client if self.backend == CacheBackend.REDIS else None
+
+    @property
+    def redis_async_client(self):
+        """비동기 Redis 클라이언트 (Redis 백엔드가 아니면 None)"""
+        return self._redis_async_client if self.backend == CacheBackend.REDIS else None
+
     def _init_redis(self):
         """Redis 클라이언트를 초기화합니다."""
         try:
@@ -43,6 +43,7 @@ from packages.api.src.corecache_keys import (
     get_cache_namespace_for_user,
 )
 from packages.api.src.coremetrics_collector import metrics_collector
+from packages.api.src.corerequest_metrics import route_metrics
 
 logger = logging.getLogger(__name__)
 config = get_cache_config()
@@ -366,14 +367,11 @@ def cache_response(
 
                 # 실행 시간 메트릭 기록
                 if request is not None:
-                    metrics_collector.track_request(
-                        method=request.method,
-                        endpoint=request.url.path,
-                        status_code=getattr(response, "status_code", 200),
+                    route_metrics.observe_handler(
+                        request.scope,
+                        getattr(response, "status_code", 200),
+                        execution_time,
                     )
-                    metrics_collector.http_request_duration_seconds.labels(
-                        method=request.method, endpoint=request.url.path
-                    ).observe(execution_time)
 
                 return response
 
@@ -384,14 +382,9 @@ def cache_response(
                 execution_time = time.time() - start_time
 
                 # 실행 시간 메트릭 기록
-                metrics_collector.track_request(
-                    method=request.method,
-                    endpoint=request.url.path,
-                    status_code=getattr(response, "status_code", 200),
+                route_metrics.observe_handler(
+                    request.scope, getattr(response, "status_code", 200), execution_time
                 )
-                metrics_collector.http_request_duration_seconds.labels(
-                    method=request.method, endpoint=request.url.path
-                ).observe(execution_time)
 
                 return response
 
@@ -469,14 +462,9 @@ def cache_response(
             execution_time = time.time() - start_time
 
             # 실행 시간 메트릭 기록
-            metrics_collector.track_request(
-                method=request.method,
-                endpoint=request.url.path,
-                status_code=getattr(response, "status_code", 200),
+            route_metrics.observe_handler(
+                request.scope, getattr(response, "status_code", 200), execution_time
             )
-            metrics_collector.http_request_duration_seconds.labels(
-                method=request.method, endpoint=request.url.path
-            ).observe(execution_time)
 
             # 응답 캐싱
             if isinstance(response, StarletteResponse):
@@ -0,0 +1,219 @@
+"""
+응답 압축 코덱 모듈
+
+``Accept-Encoding`` 협상과 청크 단위(증분) 압축기를 제공합니다.
+
+- 코덱: zstd(``zstandard``), br(``brotli``), gzip(표준 라이브러리 zlib).
+  선택 의존성이 설치되지 않은 코덱은 협상 대상에서 제외됩니다.
+- 압축기는 ``compress`` 로 받은 데이터를 내부 상태에 이어 붙이고, ``flush`` 로
+  지금까지의 데이터를 클라이언트가 풀 수 있는 블록으로 내보내며, ``finish`` 로
+  스트림을 닫습니다. 스트리밍 응답을 청크마다 보낼 수 있도록 합니다.
+- 압축 레벨은 응답 크기로 정합니다. 작은 응답은 높은 레벨로 크기를 줄이고,
+  큰 응답과 크기를 모르는 스트리밍 응답은 낮은 레벨로 처리량을 우선합니다.
+"""
+
+import zlib
+from abc import ABC, abstractmethod
+from typing import Dict, Optional, Tuple
+
+from prometheus_client import Counter
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - 선택 의존성
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - 선택 의존성
+    zstandard = None
+
+# 이 크기 이상의 청크는 이벤트 루프 밖(스레드)에서 압축 (바이트)
+COMPRESSION_OFFLOAD_SIZE = 64 * 1024
+
+# 스트리밍 응답에서 이만큼 입력이 모이면 압축 블록을 내보냄 (바이트)
+STREAM_FLUSH_SIZE = 16 * 1024
+
+COMPRESSION_BYTES = Counter(
+    "http_response_compression_bytes_total",
+    "Response bytes before (in) and after (out) compression",
+    ["encoding", "direction"],
+)
+
+# 동순위 q 값일 때의 서버 선호 순서
+ENCODING_PREFERENCE: Tuple[str, ...] = ("zstd", "br", "gzip")
+
+# 크기 구간 상한 (바이트): 이하이면 해당 구간 레벨 사용
+SMALL_RESPONSE_SIZE = 256 * 1024
+MEDIUM_RESPONSE_SIZE = 4 * 1024 * 1024
+
+# 코덱별 (작은 응답, 중간 응답, 큰 응답/스트리밍) 압축 레벨
+COMPRESSION_LEVELS: Dict[str, Tuple[int, int, int]] = {
+    "zstd": (6, 3, 1),
+    "br": (5, 4, 2),
+    "gzip": (6, 5, 3),
+}
+
+
+def available_encodings() -> Tuple[str, ...]:
+    """설치된 코덱 (서버 선호 순서)"""
+    return tuple(
+        encoding
+        for encoding in ENCODING_PREFERENCE
+        if encoding == "gzip"
+        or (encoding == "br" and brotli is not None)
+        or (encoding == "zstd" and zstandard is not None)
+    )
+
+
+def negotiate_encoding(
+    accept_encoding: str, supported: Optional[Tuple[str, ...]] = None
+) -> Optional[str]:
+    """
+    ``Accept-Encoding`` 헤더로 응답 코덱 선택
+
+    q 값이 가장 높은 코덱을 고르고, 같으면 서버 선호 순서를 따릅니다.
+    ``q=0`` 은 거부로, ``*`` 는 명시되지 않은 코덱 전체로 해석합니다.
+
+    Args:
+        accept_encoding: 요청 ``Accept-Encoding`` 헤더 값
+        supported: 사용할 수 있는 코덱 (기본값: 설치된 코덱)
+
+    Returns:
+        Optional[str]: 선택한 코덱 (압축하지 않으면 None)
+    """
+    if not accept_encoding:
+        return None
+    if supported is None:
+        supported = available_encodings()
+
+    weights: Dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        weights[name] = q
+
+    wildcard = weights.get("*")
+    best: Optional[str] = None
+    best_q = 0.0
+    for encoding in supported:
+        q = weights.get(encoding, wildcard if wildcard is not None else 0.0)
+        if q > best_q:
+            best, best_q = encoding, q
+    return best
+
+
+def choose_level(encoding: str, size: Optional[int]) -> int:
+    """
+    응답 크기에 맞는 압축 레벨
+
+    Args:
+        encoding: 코덱
+        size: 응답 크기 (바이트, 스트리밍이라 모르면 None)
+
+    Returns:
+        int: 압축 레벨
+    """
+    small, medium, large = COMPRESSION_LEVELS[encoding]
+    if size is None:
+        return large
+    if size <= SMALL_RESPONSE_SIZE:
+        return small
+    if size <= MEDIUM_RESPONSE_SIZE:
+        return medium
+    return large
+
+
+class Compressor(ABC):
+    """증분 압축기 인터페이스"""
+
+    @abstractmethod
+    def compress(self, data: bytes) -> bytes:
+        """데이터 추가 (내부 버퍼에 남은 부분은 반환되지 않을 수 있음)"""
+
+    @abstractmethod
+    def flush(self) -> bytes:
+        """지금까지 추가한 데이터를 풀 수 있는 블록으로 내보냄 (스트림은 유지)"""
+
+    @abstractmethod
+    def finish(self) -> bytes:
+        """스트림 종료"""
+
+
+class GzipCompressor(Compressor):
+    """gzip 증분 압축기"""
+
+    def __init__(self, level: int):
+        # wbits=31: gzip 헤더/트레일러 포함
+        self._obj = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._obj.compress(data)
+
+    def flush(self) -> bytes:
+        return self._obj.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._obj.flush(zlib.Z_FINISH)
+
+
+class BrotliCompressor(Compressor):
+    """brotli 증분 압축기"""
+
+    def __init__(self, level: int):
+        self._obj = brotli.Compressor(quality=level)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._obj.process(data)
+
+    def flush(self) -> bytes:
+        return self._obj.flush()
+
+    def finish(self) -> bytes:
+        return self._obj.finish()
+
+
+class ZstdCompressor(Compressor):
+    """zstd 증분 압축기"""
+
+    def __init__(self, level: int):
+        self._obj = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        return self._obj.compress(data)
+
+    def flush(self) -> bytes:
+        return self._obj.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+    def finish(self) -> bytes:
+        return self._obj.flush(zstandard.COMPRESSOBJ_FLUSH_FINISH)
+
+
+_COMPRESSORS = {
+    "gzip": GzipCompressor,
+    "br": BrotliCompressor,
+    "zstd": ZstdCompressor,
+}
+
+
+def create_compressor(encoding: str, size: Optional[int] = None) -> Compressor:
+    """
+    코덱과 응답 크기에 맞는 압축기 생성
+
+    Args:
+        encoding: 코덱 (``zstd``, ``br``, ``gzip``)
+        size: 응답 크기 (바이트, 모르면 None)
+
+    Returns:
+        Compressor: 압축기
+    """
+    return _COMPRESSORS[encoding](choose_level(encoding, size))
@@ -82,6 +82,26 @@ class Settings(BaseSettings):
     DB_PASSWORD: Optional[str] = "postgres"
     DB_NAME: Optional[str] = "maintenance"
     DB_MAX_CONNECTIONS: Optional[int] = 10
+    # 읽기 복제본 비동기 연결 URL 목록 (쉼표 구분)
+    DB_REPLICA_URLS: Optional[str] = None
+    # 정비 기록 샤드 연결 URL 목록 (쉼표 구분, ``이름=URL``)
+    DB_SHARD_URLS: Optional[str] = None
+
+    # 비밀번호 해시 설정
+    BCRYPT_ROUNDS: int = 12
+    PASSWORD_HASH_WORKERS: Optional[int] = None
+    PASSWORD_HASH_MAX_PENDING: Optional[int] = None
+
+    # 검증 토큰 캐시 설정
+    TOKEN_CACHE_TTL: int = 30
+    TOKEN_CACHE_SIZE: int = 10000
+
+    # 공유 실행기 풀 설정
+    EXECUTOR_IO_WORKERS: Optional[int] = None
+    EXECUTOR_CPU_WORKERS: Optional[int] = None
+    EXECUTOR_MAX_PENDING: Optional[int] = None
+    # 프로세스 풀 작업자 시작 방식 (forkserver / spawn, 기본값: forkserver)
+    EXECUTOR_PROCESS_START_METHOD: Optional[str] = None
 
     # Redis 설정
     REDIS_HOST: Optional[str] = "redis"
@@ -124,6 +144,14 @@ class Settings(BaseSettings):
     LOG_LEVEL: str = os.getenv("LOG_LEVEL", AppConstants.DEFAULT_LOG_LEVEL)
     LOG_FORMAT: str = AppConstants.DEFAULT_LOG_FORMAT
     LOG_FILE: str = AppConstants.DEFAULT_LOG_FILE
+    LOG_ASYNC: bool = True
+    LOG_QUEUE_SIZE: int = 10000
+    LOG_DEBUG_SAMPLE_RATE: float = 1.0
+    LOG_RATE_LIMIT_PER_SECOND: Optional[float] = None
+    LOG_RATE_LIMIT_BURST: int = 20
+
+    # 요청 메트릭 설정 (워커별 누적값 반영 주기, 초)
+    METRICS_FLUSH_INTERVAL: float = 1.0
 
     # 이메일 설정
     SMTP_TLS: bool = AppConstants.DEFAULT_SMTP_TLS
@@ -0,0 +1,316 @@
+"""
+공유 실행기 풀 모듈
+
+병렬 처리 도우미(ParallelProcessor, ResilientParallelProcessor, DataBatcher 등)가
+호출마다 스레드/프로세스 풀을 만들고 버리지 않도록 애플리케이션 수명 동안 유지되는
+풀을 제공합니다.
+
+- ``io``: 블로킹 I/O 용 스레드 풀
+- ``cpu``: CPU 연산용 프로세스 풀 (첫 사용 시 생성)
+
+프로세스 풀은 스레드가 이미 떠 있는 서버 프로세스를 fork 하지 않도록 ``forkserver``
+(지원하지 않는 플랫폼은 ``spawn``) 방식으로 작업자를 띄우며, 기본적으로 예열하지
+않습니다.
+
+각 풀은 대기 + 실행 중 작업 수를 ``max_pending`` 으로 제한합니다. 상한에 도달하면
+제출자는 자리가 날 때까지 기다리고(백프레셔), ``acquire_timeout`` 안에 자리가 나지
+않으면 ``ExecutorPoolOverloaded`` 가 발생합니다. 대기열 깊이, 사용률, 대기/실행 시간,
+거부 수는 Prometheus 메트릭으로 노출됩니다.
+"""
+
+import asyncio
+import multiprocessing
+import os
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import structlog
+from prometheus_client import Counter, Gauge, Histogram
+
+from packages.api.src.coreconfig import settings
+
+logger = structlog.get_logger()
+
+# 작업자 수 대비 대기 + 실행 중 작업 상한 배수
+DEFAULT_PENDING_PER_WORKER = 8
+
+# 자리가 날 때까지 기다리는 최대 시간 (초)
+DEFAULT_ACQUIRE_TIMEOUT = 30.0
+
+# 프로세스 풀 작업자 시작 방식 (fork 는 스레드가 있는 프로세스에서 안전하지 않음)
+DEFAULT_START_METHOD = (
+    "forkserver"
+    if "forkserver" in multiprocessing.get_all_start_methods()
+    else "spawn"
+)
+
+EXECUTOR_QUEUE_DEPTH = Gauge(
+    "executor_pool_queue_depth", "Jobs waiting for a pool worker", ["pool"]
+)
+EXECUTOR_ACTIVE = Gauge("executor_pool_active", "Jobs running on pool workers", ["pool"])
+EXECUTOR_UTILIZATION = Gauge(
+    "executor_pool_utilization", "Busy workers divided by pool size", ["pool"]
+)
+EXECUTOR_WAIT = Histogram(
+    "executor_pool_wait_seconds", "Time jobs wait before a worker starts them", ["pool"]
+)
+EXECUTOR_DURATION = Histogram(
+    "executor_pool_job_duration_seconds", "Job run time on pool workers", ["pool"]
+)
+EXECUTOR_REJECTED = Counter(
+    "executor_pool_rejected_total", "Jobs rejected by pool backpressure", ["pool"]
+)
+
+
+class ExecutorPoolOverloaded(Exception):
+    """풀 자리를 제한 시간 안에 얻지 못한 경우"""
+
+    def __init__(self, pool: str, pending: int):
+        self.pool = pool
+        self.pending = pending
+        super().__init__(f"'{pool}' 실행기 풀이 가득 찼습니다 (대기 {pending}건)")
+
+
+def _timed_call(func: Callable, args: Tuple) -> Tuple[Any, float, float]:
+    """작업 실행 (작업자에서 실행, 프로세스 풀용으로 모듈 함수)"""
+    started_at = time.time()
+    started = time.perf_counter()
+    result = func(*args)
+    return result, started_at, time.perf_counter() - started
+
+
+def _warm_up() -> int:
+    """작업자 기동용 빈 작업"""
+    return os.getpid()
+
+
+class ManagedExecutor:
+    """수명 관리되는 실행기 풀 (백프레셔 + 메트릭)"""
+
+    def __init__(
+        self,
+        name: str,
+        use_processes: bool = False,
+        max_workers: Optional[int] = None,
+        max_pending: Optional[int] = None,
+        acquire_timeout: float = DEFAULT_ACQUIRE_TIMEOUT,
+        start_method: Optional[str] = None,
+    ):
+        """
+        실행기 풀 초기화 (풀은 ``start`` 또는 첫 사용 시 생성)
+
+        Args:
+            name: 풀 이름 (메트릭 레이블)
+            use_processes: 스레드 대신 프로세스 풀 사용
+            max_workers: 작업자 수 (기본값: 프로세스 풀은 CPU 수, 스레드 풀은 CPU 수 + 4, 최대 32)
+            max_pending: 대기 + 실행 중 작업 상한 (기본값: 작업자 수 × 8)
+            acquire_timeout: 상한 도달 시 자리를 기다리는 최대 시간 (초)
+            start_method: 프로세스 풀 작업자 시작 방식 (기본값: forkserver, 없으면 spawn)
+        """
+        cpu_count = os.cpu_count() or 1
+        self.name = name
+        self.use_processes = use_processes
+        self.max_workers = max_workers or (
+            cpu_count if use_processes else min(32, cpu_count + 4)
+        )
+        self.max_pending = max_pending or self.max_workers * DEFAULT_PENDING_PER_WORKER
+        self.acquire_timeout = acquire_timeout
+        self.start_method = start_method or DEFAULT_START_METHOD
+        self.pending = 0
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+        self._executor: Optional[Executor] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+
+    @property
+    def executor(self) -> Executor:
+        """내부 실행기 (없으면 생성)"""
+        if self._executor is None:
+            if self.use_processes:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context(self.start_method),
+                )
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix=f"{self.name}-pool"
+                )
+        return self._executor
+
+    def _get_slots(self) -> asyncio.Semaphore:
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_pending)
+        return self._slots
+
+    def _update_gauges(self) -> None:
+        active = min(self.pending, self.max_workers)
+        EXECUTOR_ACTIVE.labels(self.name).set(active)
+        EXECUTOR_QUEUE_DEPTH.labels(self.name).set(self.pending - active)
+        EXECUTOR_UTILIZATION.labels(self.name).set(active / self.max_workers)
+
+    async def start(self) -> None:
+        """풀 생성 및 작업자 예열 (프로세스 풀은 모든 작업자를 미리 기동)"""
+        executor = self.executor
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(
+            *[
+                loop.run_in_executor(executor, _warm_up)
+                for _ in range(self.max_workers if self.use_processes else 1)
+            ]
+        )
+        logger.info(
+            "executor_pool_started",
+            pool=self.name,
+            workers=self.max_workers,
+            max_pending=self.max_pending,
+        )
+
+    async def run(self, func: Callable, *args: Any) -> Any:
+        """
+        풀에서 함수 실행
+
+        Args:
+            func: 실행할 함수 (프로세스 풀이면 피클 가능해야 함)
+            *args: 함수 인자
+
+        Returns:
+            Any: 함수 결과
+
+        Raises:
+            ExecutorPoolOverloaded: 제한 시간 안에 자리를 얻지 못한 경우
+        """
+        slots = self._get_slots()
+        try:
+            await asyncio.wait_for(slots.acquire(), timeout=self.acquire_timeout)
+        except asyncio.TimeoutError:
+            self.rejected += 1
+            EXECUTOR_REJECTED.labels(self.name).inc()
+            logger.warning("executor_pool_rejected", pool=self.name, pending=self.pending)
+            raise ExecutorPoolOverloaded(self.name, self.pending)
+
+        self.pending += 1
+        self._update_gauges()
+        submitted_at = time.time()
+        try:
+            result, started_at, duration = await asyncio.get_running_loop().run_in_executor(
+                self.executor, _timed_call, func, args
+            )
+        except Exception:
+            self.failed += 1
+            raise
+        finally:
+            self.pending -= 1
+            self._update_gauges()
+            slots.release()
+        self.completed += 1
+        EXECUTOR_WAIT.labels(self.name).observe(max(0.0, started_at - submitted_at))
+        EXECUTOR_DURATION.labels(self.name).observe(duration)
+        return result
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        풀 상태
+
+        Returns:
+            Dict[str, Any]: 작업자 수, 대기/실행 중 작업 수, 사용률 등
+        """
+        active = min(self.pending, self.max_workers)
+        return {
+            "name": self.name,
+            "executor": "process" if self.use_processes else "thread",
+            "start_method": self.start_method if self.use_processes else None,
+            "started": self._executor is not None,
+            "max_workers": self.max_workers,
+            "max_pending": self.max_pending,
+            "pending": self.pending,
+            "active": active,
+            "queued": self.pending - active,
+            "utilization": active / self.max_workers,
+            "completed": self.completed,
+            "failed": self.failed,
+            "rejected": self.rejected,
+        }
+
+    def shutdown(self, wait: bool = False) -> None:
+        """
+        풀 종료
+
+        Args:
+            wait: 실행 중인 작업 완료 대기 여부
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait, cancel_futures=True)
+            self._executor = None
+        self._slots = None
+
+
+class ExecutorPools:
+    """애플리케이션 공유 실행기 풀 묶음"""
+
+    def __init__(
+        self,
+        io_workers: Optional[int] = None,
+        cpu_workers: Optional[int] = None,
+        max_pending: Optional[int] = None,
+        start_method: Optional[str] = None,
+    ):
+        """
+        풀 묶음 초기화
+
+        Args:
+            io_workers: I/O 스레드 풀 작업자 수
+            cpu_workers: CPU 프로세스 풀 작업자 수
+            max_pending: 풀별 대기 + 실행 중 작업 상한
+            start_method: 프로세스 풀 작업자 시작 방식
+        """
+        self.io = ManagedExecutor("io", max_workers=io_workers, max_pending=max_pending)
+        self.cpu = ManagedExecutor(
+            "cpu",
+            use_processes=True,
+            max_workers=cpu_workers,
+            max_pending=max_pending,
+            start_method=start_method,
+        )
+
+    def get(self, use_process_pool: bool = False) -> ManagedExecutor:
+        """
+        용도에 맞는 풀 조회
+
+        Args:
+            use_process_pool: CPU 프로세스 풀 여부
+
+        Returns:
+            ManagedExecutor: 실행기 풀
+        """
+        return self.cpu if use_process_pool else self.io
+
+    async def start(self, warm_cpu: bool = False) -> None:
+        """
+        풀 시작 (프로세스 풀은 기본적으로 첫 사용 시 생성)
+
+        Args:
+            warm_cpu: 프로세스 풀 작업자를 미리 기동할지 여부
+        """
+        await self.io.start()
+        if warm_cpu:
+            await self.cpu.start()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """풀별 상태"""
+        return {"io": self.io.get_stats(), "cpu": self.cpu.get_stats()}
+
+    def shutdown(self, wait: bool = False) -> None:
+        """모든 풀 종료"""
+        self.io.shutdown(wait=wait)
+        self.cpu.shutdown(wait=wait)
+
+
+# 전역 공유 실행기 풀
+executor_pools = ExecutorPools(
+    io_workers=getattr(settings, "EXECUTOR_IO_WORKERS", None),
+    cpu_workers=getattr(settings, "EXECUTOR_CPU_WORKERS", None),
+    max_pending=getattr(settings, "EXECUTOR_MAX_PENDING", None),
+    start_method=getattr(settings, "EXECUTOR_PROCESS_START_METHOD", None),
+)
@@ -0,0 +1,426 @@
+"""
+전문 검색(Full-text search) 인덱스 모듈
+
+여러 텍스트 컬럼에 ``ILIKE '%term%'`` 를 OR 로 거는 검색은 인덱스를 쓸 수 없으므로
+DB 의 전문 검색 기능으로 대체합니다.
+
+- PostgreSQL: ``tsvector`` 생성 컬럼 + GIN 인덱스, ``ts_rank_cd`` 순위, ``ts_headline`` 스니펫
+- SQLite: FTS5 테이블 + 원본 테이블 트리거, ``bm25`` 순위, ``snippet`` 스니펫.
+  문자열 기본 키 테이블의 암시적 ``rowid`` 는 VACUUM 후 바뀔 수 있으므로 FTS 행은
+  ``<table>_fts_keys`` 의 정수 키(``fts_rowid``)로 원본 키와 연결합니다.
+- 그 외: ``ILIKE`` 검색으로 대체 (순위/스니펫 없음)
+
+두 방식 모두 원본 테이블 쓰기 시 DB 가 직접 인덱스를 갱신하므로 애플리케이션의
+쓰기 경로와 무관하게 항상 최신 상태를 유지합니다. 스니펫은 원문을 HTML 이스케이프한
+뒤 일치 구간에만 ``<mark>`` 태그를 넣습니다.
+"""
+
+import html
+import logging
+import re
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence
+
+from sqlalchemy import inspect, text
+
+logger = logging.getLogger(__name__)
+
+# 검색어 토큰 패턴 (유니코드 단어 문자)
+TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+# 하이라이트 태그
+HIGHLIGHT_START = "<mark>"
+HIGHLIGHT_END = "</mark>"
+
+# DB 스니펫 함수에 넘기는 일치 구간 표시 문자 (이스케이프 후 하이라이트 태그로 교체)
+MATCH_START = "\x02"
+MATCH_END = "\x03"
+
+# PostgreSQL 텍스트 검색 설정 (한국어 형태소 사전이 없으므로 simple 사용)
+PG_TEXT_SEARCH_CONFIG = "simple"
+
+# 정비 기록 전문 검색 대상 컬럼
+MAINTENANCE_SEARCH_FIELDS = ["description", "notes", "type", "performed_by", "provider"]
+
+
+@dataclass
+class SearchHit:
+    """전문 검색 결과 항목"""
+
+    key: Any
+    rank: float
+    snippet: Optional[str] = None
+
+
+def highlight(snippet: Optional[str]) -> Optional[str]:
+    """
+    DB 스니펫을 HTML 이스케이프한 뒤 일치 구간 표시를 하이라이트 태그로 교체
+
+    Args:
+        snippet: ``MATCH_START``/``MATCH_END`` 로 일치 구간을 표시한 스니펫
+
+    Returns:
+        Optional[str]: 안전하게 출력할 수 있는 HTML 스니펫
+    """
+    if snippet is None:
+        return None
+    return (
+        html.escape(snippet)
+        .replace(MATCH_START, HIGHLIGHT_START)
+        .replace(MATCH_END, HIGHLIGHT_END)
+    )
+
+
+def tokenize(term: str) -> List[str]:
+    """
+    검색어를 토큰으로 분리
+
+    Args:
+        term: 사용자 입력 검색어
+
+    Returns:
+        List[str]: 소문자 토큰 목록
+    """
+    return [token.lower() for token in TOKEN_PATTERN.findall(term or "")]
+
+
+class FullTextIndex:
+    """테이블 단위 전문 검색 인덱스"""
+
+    def __init__(
+        self,
+        table_name: str,
+        fields: Sequence[str],
+        key_column: str = "id",
+        vector_column: str = "search_vector",
+    ):
+        """
+        전문 검색 인덱스 초기화
+
+        Args:
+            table_name: 원본 테이블 이름
+            fields: 색인할 텍스트 컬럼 목록
+            key_column: 결과로 반환할 키 컬럼
+            vector_column: PostgreSQL ``tsvector`` 컬럼 이름
+        """
+        self.table_name = table_name
+        self.fields = list(fields)
+        self.key_column = key_column
+        self.vector_column = vector_column
+        self.fts_table = f"{table_name}_fts"
+        self.keys_table = f"{table_name}_fts_keys"
+        self.index_name = f"idx_{table_name}_{vector_column}"
+
+    def _document(self, prefix: str = "", fields: Optional[Sequence[str]] = None) -> str:
+        """색인 필드(또는 그 일부)를 공백으로 이은 SQL 텍스트 식"""
+        return " || ' ' || ".join(
+            f"coalesce({prefix}{field}, '')" for field in fields or self.fields
+        )
+
+    def _search_fields(self, fields: Optional[Sequence[str]]) -> Optional[List[str]]:
+        """
+        검색 대상 필드 확인 (None 또는 전체면 None)
+
+        Raises:
+            ValueError: 색인되지 않은 필드가 포함된 경우
+        """
+        if not fields:
+            return None
+        unknown = [field for field in fields if field not in self.fields]
+        if unknown:
+            raise ValueError(f"색인되지 않은 필드입니다: {', '.join(unknown)}")
+        selected = [field for field in self.fields if field in fields]
+        return None if selected == self.fields else selected
+
+    # ------------------------------------------------------------------
+    # 설치/제거
+    # ------------------------------------------------------------------
+
+    def install(self, connection: Any) -> None:
+        """
+        전문 검색 인덱스 생성 (이미 있으면 무시)
+
+        Args:
+            connection: DB 연결
+        """
+        dialect = connection.dialect.name
+        if dialect == "postgresql":
+            self._install_postgresql(connection)
+        elif dialect == "sqlite":
+            self._install_sqlite(connection)
+        else:
+            logger.warning(f"{dialect} 방언은 전문 검색 인덱스를 지원하지 않습니다.")
+
+    def _install_postgresql(self, connection: Any) -> None:
+        """tsvector 생성 컬럼과 GIN 인덱스 생성"""
+        connection.execute(
+            text(
+                f"ALTER TABLE {self.table_name} "
+                f"ADD COLUMN IF NOT EXISTS {self.vector_column} tsvector "
+                f"GENERATED ALWAYS AS (to_tsvector('{PG_TEXT_SEARCH_CONFIG}', "
+                f"{self._document()})) STORED"
+            )
+        )
+        connection.execute(
+            text(
+                f"CREATE INDEX IF NOT EXISTS {self.index_name} "
+                f"ON {self.table_name} USING GIN ({self.vector_column})"
+            )
+        )
+
+    def _install_sqlite(self, connection: Any) -> None:
+        """FTS5 테이블, 정수 키 매핑 테이블, 동기화 트리거 생성"""
+        existing = connection.execute(
+            text("SELECT sql FROM sqlite_master WHERE name = :name"),
+            {"name": self.fts_table},
+        ).scalar()
+        if existing and "content_rowid" in existing:
+            # 원본 rowid 에 의존하던 이전 외부 콘텐츠 테이블 교체
+            self.uninstall(connection)
+
+        key = self.key_column
+        columns = ", ".join(self.fields)
+        new_values = ", ".join(f"new.{field}" for field in self.fields)
+        new_rowid = f"(SELECT fts_rowid FROM {self.keys_table} WHERE key = new.{key})"
+        old_rowid = f"(SELECT fts_rowid FROM {self.keys_table} WHERE key = old.{key})"
+        statements = [
+            f"CREATE TABLE IF NOT EXISTS {self.keys_table} ("
+            f"fts_rowid INTEGER PRIMARY KEY, key TEXT NOT NULL UNIQUE)",
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {self.fts_table} USING fts5("
+            f"{columns}, tokenize='unicode61')",
+            f"CREATE TRIGGER IF NOT EXISTS {self.fts_table}_ai "
+            f"AFTER INSERT ON {self.table_name} BEGIN "
+            f"INSERT OR IGNORE INTO {self.keys_table}(key) VALUES (new.{key}); "
+            f"INSERT INTO {self.fts_table}(rowid, {columns}) "
+            f"VALUES ({new_rowid}, {new_values}); END",
+            f"CREATE TRIGGER IF NOT EXISTS {self.fts_table}_ad "
+            f"AFTER DELETE ON {self.table_name} BEGIN "
+            f"DELETE FROM {self.fts_table} WHERE rowid = {old_rowid}; "
+            f"DELETE FROM {self.keys_table} WHERE key = old.{key}; END",
+            f"CREATE TRIGGER IF NOT EXISTS {self.fts_table}_au "
+            f"AFTER UPDATE ON {self.table_name} BEGIN "
+            f"DELETE FROM {self.fts_table} WHERE rowid = {old_rowid}; "
+            f"UPDATE {self.keys_table} SET key = new.{key} WHERE key = old.{key}; "
+            f"INSERT INTO {self.fts_table}(rowid, {columns}) "
+            f"VALUES ({new_rowid}, {new_values}); END",
+        ]
+        for statement in statements:
+            connection.execute(text(statement))
+        self.rebuild(connection)
+
+    def rebuild(self, connection: Any) -> None:
+        """
+        기존 데이터로 인덱스 재구성 (SQLite 전용, PostgreSQL 은 생성 컬럼이 자동 계산)
+
+        Args:
+            connection: DB 연결
+        """
+        if connection.dialect.name != "sqlite":
+            return
+        key = self.key_column
+        columns = ", ".join(self.fields)
+        values = ", ".join(f"t.{field}" for field in self.fields)
+        statements = [
+            f"DELETE FROM {self.fts_table}",
+            f"DELETE FROM {self.keys_table} WHERE key NOT IN "
+            f"(SELECT {key} FROM {self.table_name})",
+            f"INSERT OR IGNORE INTO {self.keys_table}(key) "
+            f"SELECT {key} FROM {self.table_name}",
+            f"INSERT INTO {self.fts_table}(rowid, {columns}) "
+            f"SELECT k.fts_rowid, {values} "
+            f"FROM {self.table_name} AS t "
+            f"JOIN {self.keys_table} AS k ON k.key = t.{key}",
+        ]
+        for statement in statements:
+            connection.execute(text(statement))
+
+    def uninstall(self, connection: Any) -> None:
+        """
+        전문 검색 인덱스 제거
+
+        Args:
+            connection: DB 연결
+        """
+        dialect = connection.dialect.name
+        if dialect == "postgresql":
+            connection.execute(text(f"DROP INDEX IF EXISTS {self.index_name}"))
+            connection.execute(
+                text(
+                    f"ALTER TABLE {self.table_name} "
+                    f"DROP COLUMN IF EXISTS {self.vector_column}"
+                )
+            )
+        elif dialect == "sqlite":
+            for suffix in ("ai", "ad", "au"):
+                connection.execute(
+                    text(f"DROP TRIGGER IF EXISTS {self.fts_table}_{suffix}")
+                )
+            connection.execute(text(f"DROP TABLE IF EXISTS {self.fts_table}"))
+            connection.execute(text(f"DROP TABLE IF EXISTS {self.keys_table}"))
+
+    def is_installed(self, connection: Any) -> bool:
+        """
+        전문 검색 인덱스 존재 여부
+
+        Args:
+            connection: DB 연결
+
+        Returns:
+            bool: 현재 방언의 인덱스가 있으면 True
+        """
+        dialect = connection.dialect.name
+        inspector = inspect(connection)
+        if dialect == "postgresql":
+            return any(
+                column["name"] == self.vector_column
+                for column in inspector.get_columns(self.table_name)
+            )
+        if dialect == "sqlite":
+            return inspector.has_table(self.fts_table) and inspector.has_table(
+                self.keys_table
+            )
+        return False
+
+    # ------------------------------------------------------------------
+    # 검색
+    # ------------------------------------------------------------------
+
+    def search(
+        self,
+        db: Any,
+        term: str,
+        limit: int = 100,
+        prefix: bool = True,
+        snippet_words: int = 12,
+        fields: Optional[Sequence[str]] = None,
+    ) -> List[SearchHit]:
+        """
+        관련도 순 전문 검색
+
+        모든 토큰을 포함하는 행만 반환하며, ``prefix`` 가 True 이면 각 토큰을
+        접두어로 취급합니다 (예: ``brak`` → ``brake``, ``braking``).
+
+        Args:
+            db: 데이터베이스 세션 또는 연결
+            term: 검색어
+            limit: 최대 반환 개수
+            prefix: 접두어 검색 여부
+            snippet_words: 스니펫 길이 (토큰 수)
+            fields: 검색할 색인 필드 (None 이면 전체)
+
+        Returns:
+            List[SearchHit]: 키, 순위(클수록 관련도 높음), HTML 이스케이프된 하이라이트 스니펫
+
+        Raises:
+            ValueError: 색인되지 않은 필드를 지정한 경우
+        """
+        fields = self._search_fields(fields)
+        tokens = tokenize(term)
+        if not tokens:
+            return []
+
+        bind = db.get_bind() if hasattr(db, "get_bind") else db
+        dialect = bind.dialect.name
+        if dialect == "postgresql":
+            statement, params = self._postgresql_query(
+                tokens, prefix, snippet_words, fields
+            )
+        elif dialect == "sqlite":
+            statement, params = self._sqlite_query(tokens, prefix, snippet_words, fields)
+        else:
+            statement, params = self._fallback_query(tokens, fields)
+        params["limit"] = limit
+
+        rows = db.execute(statement, params).all()
+        return [
+            SearchHit(key=row[0], rank=float(row[1] or 0), snippet=highlight(row[2]))
+            for row in rows
+        ]
+
+    def _postgresql_query(
+        self,
+        tokens: List[str],
+        prefix: bool,
+        snippet_words: int,
+        fields: Optional[List[str]] = None,
+    ):
+        """tsquery 검색 쿼리 (필드 일부만 검색하면 해당 필드로 tsvector 를 계산)"""
+        suffix = ":*" if prefix else ""
+        query = " & ".join(f"{token}{suffix}" for token in tokens)
+        vector = (
+            f"to_tsvector('{PG_TEXT_SEARCH_CONFIG}', {self._document(fields=fields)})"
+            if fields
+            else self.vector_column
+        )
+        statement = text(
+            f"SELECT {self.key_column}, "
+            f"ts_rank_cd({vector}, q) AS rank, "
+            f"ts_headline('{PG_TEXT_SEARCH_CONFIG}', {self._document(fields=fields)}, "
+            f"q, :headline_options) AS snippet "
+            f"FROM {self.table_name}, "
+            f"to_tsquery('{PG_TEXT_SEARCH_CONFIG}', :query) AS q "
+            f"WHERE {vector} @@ q "
+            f"ORDER BY rank DESC LIMIT :limit"
+        )
+        options = (
+            f"StartSel={MATCH_START}, StopSel={MATCH_END}, "
+            f"MaxWords={snippet_words}, MinWords={max(1, snippet_words // 3)}"
+        )
+        return statement, {"query": query, "headline_options": options}
+
+    def _sqlite_query(
+        self,
+        tokens: List[str],
+        prefix: bool,
+        snippet_words: int,
+        fields: Optional[List[str]] = None,
+    ):
+        """FTS5 MATCH 검색 쿼리 (필드 일부만 검색하면 컬럼 필터 적용)"""
+        suffix = "*" if prefix else ""
+        query = " ".join(f'"{token}"{suffix}' for token in tokens)
+        if fields:
+            query = f"{{{' '.join(fields)}}} : ({query})"
+        statement = text(
+            f"SELECT k.key, -bm25({self.fts_table}) AS rank, "
+            f"snippet({self.fts_table}, -1, :match_start, :match_end, '…', "
+            f"{snippet_words}) AS snippet "
+            f"FROM {self.fts_table} "
+            f"JOIN {self.keys_table} AS k ON k.fts_rowid = {self.fts_table}.rowid "
+            f"WHERE {self.fts_table} MATCH :query "
+            f"ORDER BY bm25({self.fts_table}) LIMIT :limit"
+        )
+        return statement, {
+            "query": query,
+            "match_start": MATCH_START,
+            "match_end": MATCH_END,
+        }
+
+    def _fallback_query(self, tokens: List[str], fields: Optional[List[str]] = None):
+        """전문 검색 미지원 방언용 LIKE 검색 쿼리"""
+        conditions = []
+        params: Dict[str, Any] = {}
+        for i, token in enumerate(tokens):
+            params[f"token_{i}"] = f"%{token}%"
+            conditions.append(
+                "("
+                + " OR ".join(
+                    f"lower({field}) LIKE :token_{i}" for field in fields or self.fields
+                )
+                + ")"
+            )
+        statement = text(
+            f"SELECT {self.key_column}, 0 AS rank, NULL AS snippet "
+            f"FROM {self.table_name} WHERE {' AND '.join(conditions)} "
+            f"LIMIT :limit"
+        )
+        return statement, params
+
+
+def maintenance_search_index() -> FullTextIndex:
+    """
+    정비 기록 전문 검색 인덱스
+
+    Returns:
+        FullTextIndex: ``maintenance`` 테이블 인덱스
+    """
+    return FullTextIndex("maintenance", MAINTENANCE_SEARCH_FIELDS)
@@ -20,8 +20,15 @@ from packages.api.src.corecache import (
 )
 from packages.api.src.corecache_optimizer import initialize_cache_optimizer
 from packages.api.src.coreconfig import settings
+from packages.api.src.coreexecutor_pools import executor_pools
 from packages.api.src.corelogging_setup import setup_logging
 from packages.api.src.coremetrics_collector import metrics_collector
+from packages.api.src.corepassword_hashing import password_hasher
+from packages.api.src.corereplication import replication_manager
+from packages.api.src.corerequest_metrics import exposition_registry, route_metrics
+from packages.api.src.coresharding import sharding_manager
+from packages.api.src.coretoken_cache import token_revocation_bus
+from packages.api.src.corewebsocket_manager import websocket_manager
 
 # 로깅 설정
 logger = logging.getLogger(__name__)
@@ -59,6 +66,18 @@ def configure_lifespan():
         _cache_manager = get_cache_manager()
         logger.info(f"캐시 시스템 초기화 완료: {settings.CACHE_BACKEND}")
 
+        # 공유 실행기 풀 시작 (프로세스 풀은 첫 사용 시 생성)
+        await executor_pools.start()
+        logger.info(f"공유 실행기 풀 시작: {executor_pools.get_stats()}")
+
+        # 토큰 무효화 구독 시작 (검증 토큰 캐시 동기화)
+        try:
+            await token_revocation_bus.start(
+                getattr(_cache_manager, "redis_async_client", None)
+            )
+        except Exception as e:
+            logger.error(f"토큰 무효화 구독 실패: {str(e)}")
+
         # 백그라운드 태스크 시작
         global _background_tasks
         tasks = await start_background_tasks(app)
@@ -68,11 +87,15 @@ def configure_lifespan():
         # 메트릭 서버 시작 (별도 포트)
         if settings.METRICS_ENABLED:
             try:
-                start_http_server(settings.METRICS_PORT)
+                # 멀티프로세스 모드에서는 모든 워커 값을 합산해 노출
+                start_http_server(settings.METRICS_PORT, registry=exposition_registry())
                 logger.info(f"메트릭 서버 시작됨 (포트: {settings.METRICS_PORT})")
             except Exception as e:
                 logger.error(f"메트릭 서버 시작 실패: {str(e)}")
 
+        # 요청 메트릭 주기적 반영 시작
+        route_metrics.start(settings.METRICS_FLUSH_INTERVAL)
+
         # 메트릭 수집기 초기화
         metrics_collector.update_system_metrics()
         logger.info("메트릭 수집기 초기화 완료")
@@ -91,6 +114,30 @@ def configure_lifespan():
         except Exception as e:
             logger.error(f"Redis 캐시 연결 중 오류 발생: {str(e)}")
 
+        # 읽기 복제본 등록 및 상태 확인 시작
+        replica_urls = replication_manager.replica_urls_from_settings()
+        if replica_urls:
+            replication_manager.register_nodes([{"url": url} for url in replica_urls])
+            await replication_manager.check_all()
+            await replication_manager.start()
+            logger.info(f"읽기 복제본 {len(replica_urls)}개 라우팅 시작")
+
+        # 정비 기록 샤드 등록 (vehicle_id 기준 라우팅)
+        shard_nodes = sharding_manager.shard_nodes_from_settings()
+        if shard_nodes:
+            sharding_manager.initialize(
+                {"strategy": "consistent_hashing", "virtual_nodes": 1024}
+            )
+            sharding_manager.register_nodes(shard_nodes)
+            sharding_manager.set_shard_key("vehicle_id")
+            logger.info(f"정비 기록 샤드 {len(shard_nodes)}개 라우팅 시작")
+
+        # 웹소켓 Redis 구독/오프라인 큐 시작 (워커 간 메시지 전달)
+        try:
+            await websocket_manager.initialize()
+        except Exception as e:
+            logger.error(f"웹소켓 매니저 초기화 실패: {str(e)}")
+
         # 메트릭 수집 시작
         await metrics_collector.start_system_metrics_collection()
 
@@ -103,6 +150,22 @@ def configure_lifespan():
 
         # 메트릭 수집 중지
         await metrics_collector.stop_system_metrics_collection()
+        await route_metrics.stop()
+
+        # 토큰 무효화 구독 중지
+        await token_revocation_bus.stop()
+
+        # 웹소켓 구독/전송 큐 정리
+        await websocket_manager.close()
+
+        # 복제본 상태 확인 중지
+        await replication_manager.stop()
+
+        # 샤드 엔진 정리
+        sharding_manager.dispose()
+
+        # 비밀번호 해시 풀 종료
+        password_hasher.shutdown()
 
         # Redis 캐시 연결 종료
         try:
@@ -116,6 +179,9 @@ def configure_lifespan():
         await cancel_background_tasks(_background_tasks)
         logger.info("모든 백그라운드 태스크가 취소되었습니다")
 
+        # 공유 실행기 풀 종료 (백그라운드 태스크 취소 이후)
+        executor_pools.shutdown()
+
         # 캐시 연결 종료
         if _cache_manager:
             await _cache_manager.close()
@@ -0,0 +1,353 @@
+"""
+비동기 로깅 파이프라인 모듈
+
+로그 호출 스레드(요청 처리 스레드/이벤트 루프)에서는 레코드를 큐에 넣기만 하고,
+JSON 직렬화와 파일/콘솔 기록은 전용 작성 스레드(``QueueListener``)에서 처리합니다.
+
+- ``NonBlockingQueueHandler``: 호출 스레드에서 메시지 문자열만 만들고 큐에 넣음.
+  큐가 가득 차면 기다리지 않고 버림(``log_dropped_total{reason="queue_full"}``).
+- ``FastJsonFormatter``: 딕셔너리를 직접 만들어 orjson(없으면 json)으로 직렬화.
+- ``SamplingFilter`` / ``RateLimitFilter``: 시끄러운 디버그 경로를 표본 추출하거나
+  호출 위치별로 초당 건수를 제한. 호출 스레드에서 큐에 넣기 전에 걸러냄.
+- ``BackgroundCompressingRotatingFileHandler``: 회전 시 파일 이름만 바꾸고 gzip 압축은
+  백그라운드 스레드에서 수행.
+"""
+
+import atexit
+import copy
+import gzip
+import logging
+import os
+import queue
+import random
+import shutil
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import Any, Dict, List, Optional, Tuple
+
+from prometheus_client import Counter, Gauge, Histogram
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - 선택 의존성
+    orjson = None
+    import json
+
+# 기본 큐 크기 (초과분은 버림)
+DEFAULT_LOG_QUEUE_SIZE = 10000
+
+LOG_QUEUE_DEPTH = Gauge("log_queue_depth", "Log records waiting for the writer thread")
+LOG_DROPPED = Counter("log_dropped_total", "Log records dropped", ["reason"])
+LOG_COMPRESSION_SECONDS = Histogram(
+    "log_rotation_compress_seconds", "Background compression time of rotated logs"
+)
+
+# LogRecord 기본 속성 (나머지는 extra 로 전달된 값)
+_STANDARD_ATTRS = frozenset(
+    vars(logging.LogRecord("", 0, "", 0, "", (), None)).keys()
+) | {"message", "asctime", "taskName"}
+
+
+def fast_dumps(value: Any) -> str:
+    """
+    JSON 직렬화 (orjson 우선, 직렬화할 수 없는 값은 문자열로)
+
+    Args:
+        value: 직렬화할 값
+
+    Returns:
+        str: JSON 문자열
+    """
+    if orjson is not None:
+        return orjson.dumps(
+            value, default=str, option=orjson.OPT_NON_STR_KEYS
+        ).decode("utf-8")
+    return json.dumps(value, default=str, ensure_ascii=False, separators=(",", ":"))
+
+
+class FastJsonFormatter(logging.Formatter):
+    """딕셔너리를 직접 구성하는 JSON 포맷터"""
+
+    def __init__(self, static_fields: Optional[Dict[str, Any]] = None):
+        """
+        포맷터 초기화
+
+        Args:
+            static_fields: 모든 레코드에 추가할 고정 필드 (환경, 서비스 이름 등)
+        """
+        super().__init__()
+        self.static_fields = static_fields or {}
+
+    def to_dict(self, record: logging.LogRecord) -> Dict[str, Any]:
+        """로그 레코드를 딕셔너리로 변환"""
+        entry: Dict[str, Any] = {
+            "timestamp": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "module": record.module,
+            "function": record.funcName,
+            "line": record.lineno,
+            "thread": record.thread,
+            "thread_name": record.threadName,
+            "message": record.getMessage(),
+            **self.static_fields,
+        }
+        for key, value in record.__dict__.items():
+            if key not in _STANDARD_ATTRS and not key.startswith("_"):
+                entry[key] = value
+        if record.exc_info and record.exc_info[0] is not None:
+            entry["exception"] = {
+                "type": record.exc_info[0].__name__,
+                "message": str(record.exc_info[1]),
+                "traceback": self.formatException(record.exc_info),
+            }
+        return entry
+
+    def format(self, record: logging.LogRecord) -> str:
+        return fast_dumps(self.to_dict(record))
+
+
+class SamplingFilter(logging.Filter):
+    """레벨별 표본 추출 필터"""
+
+    def __init__(self, rates: Dict[int, float]):
+        """
+        필터 초기화
+
+        Args:
+            rates: logging 레벨 -> 남길 비율 (0.0~1.0, 지정하지 않은 레벨은 모두 남김)
+        """
+        super().__init__()
+        self.rates = rates
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        rate = self.rates.get(record.levelno)
+        if rate is None or rate >= 1.0 or random.random() < rate:
+            return True
+        LOG_DROPPED.labels("sampled").inc()
+        return False
+
+
+class RateLimitFilter(logging.Filter):
+    """호출 위치(로거, 파일, 줄)별 토큰 버킷 속도 제한 필터
+
+    ``max_level`` 이하 레벨에만 적용되며, 제한으로 버려진 건수는 다음에 통과하는
+    같은 위치의 레코드에 ``suppressed`` 로 붙습니다.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int = 20,
+        max_level: int = logging.INFO,
+        max_keys: int = 10000,
+    ):
+        """
+        필터 초기화
+
+        Args:
+            rate: 위치별 초당 허용 건수
+            burst: 순간 허용 건수
+            max_level: 제한을 적용할 최고 레벨 (경고 이상은 기본적으로 제한하지 않음)
+            max_keys: 추적할 최대 위치 수 (초과 시 초기화)
+        """
+        super().__init__()
+        self.rate = rate
+        self.burst = burst
+        self.max_level = max_level
+        self.max_keys = max_keys
+        # 위치 -> [토큰, 마지막 갱신 시각, 버려진 건수]
+        self._buckets: Dict[Tuple[str, str, int], List[float]] = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > self.max_level:
+            return True
+        key = (record.name, record.pathname, record.lineno)
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                if len(self._buckets) >= self.max_keys:
+                    self._buckets.clear()
+                bucket = self._buckets[key] = [float(self.burst), now, 0]
+            bucket[0] = min(self.burst, bucket[0] + (now - bucket[1]) * self.rate)
+            bucket[1] = now
+            if bucket[0] < 1.0:
+                bucket[2] += 1
+                LOG_DROPPED.labels("rate_limited").inc()
+                return False
+            bucket[0] -= 1.0
+            suppressed, bucket[2] = bucket[2], 0
+        if suppressed:
+            record.suppressed = int(suppressed)
+        return True
+
+
+class NonBlockingQueueHandler(QueueHandler):
+    """큐가 가득 차면 버리는 큐 핸들러 (호출 스레드에서 직렬화하지 않음)"""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # 기본 구현은 호출 스레드에서 format() 을 실행하므로 메시지 문자열만 확정
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            LOG_DROPPED.labels("queue_full").inc()
+
+
+class _DrainingQueueListener(QueueListener):
+    """큐가 가득 차 있어도 종료 신호를 넣을 수 있는 리스너"""
+
+    def enqueue_sentinel(self) -> None:
+        self.queue.put(self._sentinel, timeout=5)
+
+
+def _compress_file(source: str, dest: str) -> None:
+    """회전된 로그 파일 gzip 압축 (임시 파일에 쓴 뒤 교체)"""
+    started = time.perf_counter()
+    tmp = f"{dest}.tmp"
+    with open(source, "rb") as f_in, gzip.open(tmp, "wb") as f_out:
+        shutil.copyfileobj(f_in, f_out, 1024 * 1024)
+    os.replace(tmp, dest)
+    os.remove(source)
+    LOG_COMPRESSION_SECONDS.observe(time.perf_counter() - started)
+
+
+class BackgroundCompressingRotatingFileHandler(RotatingFileHandler):
+    """회전된 파일을 백그라운드 스레드에서 압축하는 회전 파일 핸들러
+
+    회전 시 현재 파일은 즉시 이름만 바뀌고(``.1``), 압축(``.1.gz``)은 전용 스레드에서
+    진행됩니다. 이전 압축이 끝나기 전에 다시 회전해야 하면 그 압축을 기다린 뒤
+    백업 번호를 옮깁니다.
+    """
+
+    def __init__(
+        self,
+        filename: str,
+        max_bytes: int = 10 * 1024 * 1024,  # 10MB
+        backup_count: int = 5,
+        encoding: Optional[str] = None,
+        delay: bool = False,
+        compress: bool = True,
+    ):
+        """
+        로그 파일 핸들러 초기화
+
+        Args:
+            filename: 로그 파일 경로
+            max_bytes: 최대 파일 크기 (바이트)
+            backup_count: 백업 파일 수
+            encoding: 파일 인코딩
+            delay: 지연된 파일 생성 여부
+            compress: 압축 여부
+        """
+        super().__init__(
+            filename, maxBytes=max_bytes, backupCount=backup_count,
+            encoding=encoding, delay=delay,
+        )
+        self.compress = compress
+        self._compressor: Optional[ThreadPoolExecutor] = None
+        self._pending: Optional[Future] = None
+        if compress:
+            # 백업 번호 이동이 압축된 파일 이름(.N.gz)을 기준으로 이루어지도록 함
+            self.namer = lambda name: f"{name}.gz"
+
+    def rotate(self, source: str, dest: str) -> None:
+        """로그 파일 회전 (압축은 백그라운드에서)"""
+        if not os.path.exists(source):
+            return
+        if not self.compress:
+            os.replace(source, dest)
+            return
+        plain = dest[: -len(".gz")]
+        os.replace(source, plain)
+        if self._compressor is None:
+            self._compressor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="log-compress"
+            )
+        self._pending = self._compressor.submit(_compress_file, plain, dest)
+
+    def doRollover(self) -> None:
+        if self._pending is not None and not self._pending.done():
+            # 작성 스레드에서만 기다리므로 로그 호출에는 영향 없음
+            self._pending.result()
+        super().doRollover()
+
+    def close(self) -> None:
+        super().close()
+        if self._compressor is not None:
+            self._compressor.shutdown(wait=True)
+            self._compressor = None
+
+
+class AsyncLogPipeline:
+    """큐 + 전용 작성 스레드 로깅 파이프라인"""
+
+    def __init__(self, queue_size: int = DEFAULT_LOG_QUEUE_SIZE):
+        """
+        파이프라인 초기화
+
+        Args:
+            queue_size: 큐 크기 (가득 차면 새 레코드를 버림)
+        """
+        self.queue: "queue.Queue[logging.LogRecord]" = queue.Queue(queue_size)
+        self.handler = NonBlockingQueueHandler(self.queue)
+        self.handlers: List[logging.Handler] = []
+        self._listener: Optional[QueueListener] = None
+        self._lock = threading.Lock()
+        LOG_QUEUE_DEPTH.set_function(self.queue.qsize)
+
+    @property
+    def running(self) -> bool:
+        """작성 스레드 실행 여부"""
+        return self._listener is not None
+
+    def start(self, handlers: List[logging.Handler]) -> None:
+        """
+        작성 스레드 시작 (이미 실행 중이면 무시)
+
+        Args:
+            handlers: 작성 스레드에서 실행할 실제 핸들러
+        """
+        with self._lock:
+            if self._listener is not None:
+                return
+            self.handlers = list(handlers)
+            self._listener = _DrainingQueueListener(
+                self.queue, *self.handlers, respect_handler_level=True
+            )
+            self._listener.start()
+            atexit.register(self.stop)
+
+    def stop(self) -> None:
+        """남은 레코드를 모두 기록하고 작성 스레드와 핸들러 종료"""
+        with self._lock:
+            if self._listener is None:
+                return
+            self._listener.stop()
+            self._listener = None
+            for handler in self.handlers:
+                handler.close()
+            self.handlers = []
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        파이프라인 상태
+
+        Returns:
+            Dict[str, Any]: 큐 크기, 대기 레코드 수, 실행 여부
+        """
+        return {
+            "running": self.running,
+            "queue_size": self.queue.maxsize,
+            "queued": self.queue.qsize(),
+        }
@@ -14,7 +14,7 @@ from datetime import datetime
 from typing import Any, Callable, Dict, List, Optional
 
 import psutil
-from fastapi import FastAPI, Request, Response
+from fastapi import FastAPI, Response
 from prometheus_client import (
     CollectorRegistry,
     Counter,
@@ -24,6 +24,7 @@ from prometheus_client import (
 )
 
 from packages.api.src.core import test_metrics
+from packages.api.src.corerequest_metrics import RouteMetricsMiddleware, route_metrics
 
 logger = logging.getLogger(__name__)
 
@@ -315,6 +316,7 @@ def init_metrics(app: FastAPI, port: int = 9090):
     @app.on_event("startup")
     async def startup_event():
         logger.info("시스템 메트릭 모니터링을 시작합니다.")
+        route_metrics.start()
         try:
             metrics_collector.update_metrics()
         except Exception as e:
@@ -324,19 +326,9 @@ def init_metrics(app: FastAPI, port: int = 9090):
     @app.on_event("shutdown")
     async def shutdown_event():
         logger.info("메트릭 시스템을 종료합니다.")
+        await route_metrics.stop()
 
-    # 모든 요청에 대한 메트릭 미들웨어
-    @app.middleware("http")
-    async def metrics_middleware(request: Request, call_next):
-        method = request.method
-        endpoint = request.url.path
-
-        with track_request_duration(method, endpoint):
-            response = await call_next(request)
-            try:
-                metrics_collector.track_request(method, endpoint, response.status_code)
-            except Exception as e:
-                logger.warning(f"요청 메트릭 기록 실패: {str(e)}")
-            return response
+    # 모든 요청에 대한 메트릭 미들웨어 (라우트 템플릿 레이블, 워커별 누적)
+    app.add_middleware(RouteMetricsMiddleware, metrics=route_metrics)
 
     return app
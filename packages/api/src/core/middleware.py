@@ -1,20 +1,28 @@
-import gzip
-import json
-import logging
 import time
-from datetime import datetime, timezone
-from typing import Any, Callable, Dict, List, Optional, Set
+from typing import Callable, List, Optional, Sequence, Set
 
 import structlog
 from fastapi import FastAPI, Request, Response
+from starlette.datastructures import Headers, MutableHeaders
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.middleware.cors import CORSMiddleware
-from starlette.responses import JSONResponse
-from starlette.types import ASGIApp
-
+from starlette.responses import JSONResponse, StreamingResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from packages.api.src.corebatch_requests import (DEFAULT_BATCH_CONCURRENCY,
+                                                 DEFAULT_BATCH_PATH,
+                                                 MAX_BATCH_ITEMS, BatchExecutor,
+                                                 BatchValidationError,
+                                                 is_batch_path, parse_batch)
+from packages.api.src.corecompression import (COMPRESSION_BYTES,
+                                              COMPRESSION_OFFLOAD_SIZE,
+                                              STREAM_FLUSH_SIZE, Compressor,
+                                              create_compressor,
+                                              negotiate_encoding)
 from packages.api.src.coreconfig import settings
+from packages.api.src.coreexecutor_pools import (ExecutorPoolOverloaded,
+                                                 executor_pools)
 from packages.api.src.corelogger import logger
-from packages.api.src.coremetrics_collector import metrics_collector
 from packages.api.src.coremonitoring.middleware import MonitoringMiddleware
 from packages.api.src.corerate_limiter import RateLimiter
 from packages.api.src.coresecurity import SecurityService, get_security_service
@@ -48,17 +56,7 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
             f"Time: {formatted_process_time}ms"
         )
 
-        # 메트릭 수집
-        metrics_collector.track_request(
-            method=request.method,
-            endpoint=request.url.path,
-            status_code=response.status_code,
-        )
-        metrics_collector.http_request_duration_seconds.labels(
-            method=request.method, endpoint=request.url.path
-        ).observe(
-            process_time / 1000
-        )  # 초 단위로 변환
+        # 요청 메트릭은 RouteMetricsMiddleware 가 라우트 템플릿 기준으로 기록
 
         return response
 
@@ -118,12 +116,14 @@ class SecurityMiddleware(BaseHTTPMiddleware):
             return Response(content="보안 검증 중 오류가 발생했습니다", status_code=500)
 
 
-class CompressionMiddleware(BaseHTTPMiddleware):
+class CompressionMiddleware:
     """
     응답 압축 미들웨어
 
-    특정 크기 이상의 응답을 gzip으로 압축합니다.
-    클라이언트가 압축을 지원하는 경우에만 압축이 적용됩니다.
+    클라이언트가 지원하는 코덱(zstd, br, gzip)으로 응답 본문을 청크 단위로 압축합니다.
+    본문 전체를 모았다가 한 번에 압축하지 않으므로 스트리밍 응답(내보내기, 큰 목록)도
+    압축되며, 큰 청크의 압축은 공유 I/O 풀에서 실행해 이벤트 루프를 막지 않습니다.
+    코덱 협상과 크기별 압축 레벨은 ``core/compression.py`` 를 참고하세요.
     """
 
     def __init__(
@@ -131,6 +131,8 @@ class CompressionMiddleware(BaseHTTPMiddleware):
         app: ASGIApp,
         minimum_size: int = 1024,
         compress_types: Optional[Set[str]] = None,
+        offload_size: int = COMPRESSION_OFFLOAD_SIZE,
+        stream_flush_size: int = STREAM_FLUSH_SIZE,
     ):
         """
         압축 미들웨어 초기화
@@ -139,115 +141,316 @@ class CompressionMiddleware(BaseHTTPMiddleware):
             app: ASGI 애플리케이션
             minimum_size: 압축 적용 최소 크기 (바이트)
             compress_types: 압축 적용 콘텐츠 타입 집합
+            offload_size: 이 크기 이상의 청크는 스레드에서 압축 (바이트)
+            stream_flush_size: 스트리밍 응답에서 압축 블록을 내보내는 입력 크기 (바이트)
         """
-        super().__init__(app)
+        self.app = app
         self.minimum_size = minimum_size
+        self.offload_size = offload_size
+        self.stream_flush_size = stream_flush_size
         self.compress_types = compress_types or {
             "text/html",
             "text/css",
             "text/javascript",
             "application/javascript",
             "application/json",
+            "application/x-ndjson",
+            "text/csv",
             "text/plain",
             "text/xml",
             "application/xml",
         }
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
-        요청 처리 및 응답 압축
+        요청 처리
 
         Args:
-            request: 요청 객체
-            call_next: 다음 미들웨어 또는 라우트 핸들러
+            scope: ASGI scope
+            receive: ASGI receive
+            send: ASGI send
+        """
+        if scope["type"] != "http" or scope["method"] == "HEAD":
+            await self.app(scope, receive, send)
+            return
 
-        Returns:
-            압축된 응답 또는 원본 응답
+        # 코덱을 지원하지 않는 클라이언트도 압축 대상 응답에는 Vary 를 붙이도록 감쌈
+        encoding = negotiate_encoding(
+            Headers(scope=scope).get("accept-encoding", "")
+        )
+        responder = _CompressionResponder(self, encoding, send)
+        await self.app(scope, receive, responder.send)
+
+    def is_compressible(self, message: Message) -> bool:
         """
-        # 클라이언트 압축 지원 여부 확인
-        accept_encoding = request.headers.get("Accept-Encoding", "")
-        supports_gzip = "gzip" in accept_encoding
+        응답 시작 메시지로 압축 가능한 응답인지 판단 (크기 제외)
 
-        # 압축 지원하지 않으면 원본 응답 반환
-        if not supports_gzip:
-            return await call_next(request)
+        압축 가능한 응답은 실제로 압축하지 않더라도 ``Vary: Accept-Encoding`` 을 붙입니다.
 
-        # 원본 응답 처리
-        response = await call_next(request)
+        Args:
+            message: ``http.response.start`` 메시지
 
-        # 응답 압축 가능 여부 확인
-        content_type = response.headers.get("Content-Type", "")
-        content_encoding = response.headers.get("Content-Encoding", "")
+        Returns:
+            bool: 압축 가능 여부
+        """
+        status = message["status"]
+        if status < 200 or status in (204, 304):
+            return False
+        headers = Headers(raw=message.get("headers", []))
+        if "content-encoding" in headers:
+            return False
+        if "no-transform" in headers.get("cache-control", ""):
+            return False
+        content_type = headers.get("content-type", "").split(";")[0].strip().lower()
+        return content_type in self.compress_types
+
+    def should_compress(self, message: Message) -> bool:
+        """
+        응답 시작 메시지로 압축 대상 여부 판단
 
-        # 이미 압축되었거나, 압축 불가능한 유형이거나, 너무 작은 경우 원본 반환
-        if (
-            content_encoding
-            or not any(ctype in content_type for ctype in self.compress_types)
-            or "content-length" in response.headers
-            and int(response.headers["content-length"]) < self.minimum_size
-        ):
-            return response
+        Args:
+            message: ``http.response.start`` 메시지
 
-        # 응답 본문 압축
-        if hasattr(response, "body"):
-            body = response.body
-            if len(body) >= self.minimum_size:
-                compressed_body = gzip.compress(body)
-
-                # 새 응답 생성
-                new_response = Response(
-                    content=compressed_body,
-                    status_code=response.status_code,
-                    headers=dict(response.headers),
-                    media_type=response.media_type,
-                )
+        Returns:
+            bool: 압축 대상 여부 (본문 크기는 별도로 확인)
+        """
+        if not self.is_compressible(message):
+            return False
+        content_length = _content_length(message)
+        return content_length is None or content_length >= self.minimum_size
 
-                # 압축 헤더 추가
-                new_response.headers["Content-Encoding"] = "gzip"
-                new_response.headers["Content-Length"] = str(len(compressed_body))
-                new_response.headers["Vary"] = "Accept-Encoding"
 
-                # 압축률 측정
-                compression_ratio = (len(body) - len(compressed_body)) / len(body) * 100
-                logger.debug(
-                    f"응답 압축: {len(body)} -> {len(compressed_body)} 바이트 ({compression_ratio:.1f}% 감소)"
-                )
+def _content_length(message: Message) -> Optional[int]:
+    """응답 시작 메시지의 Content-Length (없거나 잘못된 값이면 None)"""
+    value = Headers(raw=message.get("headers", [])).get("content-length")
+    if value is None:
+        return None
+    try:
+        length = int(value)
+    except ValueError:
+        return None
+    return length if length >= 0 else None
 
-                # 압축 메트릭 기록
-                metrics_collector.cache_memory_usage.set(len(compressed_body))
 
-                return new_response
+class _CompressionResponder:
+    """응답 하나의 압축 상태"""
 
-        return response
+    def __init__(
+        self, middleware: CompressionMiddleware, encoding: Optional[str], send: Send
+    ):
+        self.middleware = middleware
+        self.encoding = encoding
+        self._send = send
+        self.start_message: Optional[Message] = None
+        self.passthrough = False
+        self.compressor: Optional[Compressor] = None
+        self.unflushed = 0
+        self.bytes_in = 0
+        self.bytes_out = 0
+
+    async def send(self, message: Message) -> None:
+        message_type = message["type"]
+        if message_type == "http.response.start":
+            if self.encoding is not None and self.middleware.should_compress(message):
+                # 첫 본문을 보고 크기/스트리밍 여부를 확인한 뒤 헤더 결정
+                self.start_message = message
+            else:
+                self.start_message = message
+                await self._send_passthrough_start()
+            return
+
+        if self.passthrough:
+            await self._send(message)
+            return
+
+        if message_type != "http.response.body":
+            # pathsend/trailers 등 본문 외 메시지: 보류한 시작 메시지를 압축 없이 먼저 전송
+            if self.compressor is None:
+                await self._send_passthrough_start()
+            await self._send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self.compressor is None:
+            if not more_body:
+                await self._send_complete(body)
+            else:
+                await self._start_stream(body)
+            return
+
+        await self._send_chunk(body, more_body)
+
+    def _start_headers(self, content_length: Optional[int]) -> MutableHeaders:
+        headers = MutableHeaders(raw=list(self.start_message.get("headers", [])))
+        headers["Content-Encoding"] = self.encoding
+        headers.add_vary_header("Accept-Encoding")
+        if content_length is None:
+            del headers["Content-Length"]
+        else:
+            headers["Content-Length"] = str(content_length)
+        return headers
+
+    async def _send_start(self, headers: MutableHeaders) -> None:
+        await self._send({**self.start_message, "headers": headers.raw})
+
+    async def _send_passthrough_start(self) -> None:
+        """압축하지 않는 응답의 시작 메시지 전송 (압축 가능한 응답이면 Vary 추가)"""
+        self.passthrough = True
+        if not self.middleware.is_compressible(self.start_message):
+            await self._send(self.start_message)
+            return
+        headers = MutableHeaders(raw=list(self.start_message.get("headers", [])))
+        headers.add_vary_header("Accept-Encoding")
+        await self._send_start(headers)
+
+    async def _send_complete(self, body: bytes) -> None:
+        """본문 전체가 한 메시지로 온 응답"""
+        if len(body) < self.middleware.minimum_size:
+            await self._send_passthrough_start()
+            await self._send({"type": "http.response.body", "body": body})
+            return
+
+        self.compressor = create_compressor(self.encoding, len(body))
+        compressed = await self._run(self._compress_final, body)
+        await self._send_start(self._start_headers(len(compressed)))
+        await self._send({"type": "http.response.body", "body": compressed})
+        self._record()
+
+    async def _start_stream(self, body: bytes) -> None:
+        """여러 메시지로 나뉘어 오는 응답 (길이는 전송 중 결정)"""
+        self.compressor = create_compressor(
+            self.encoding, _content_length(self.start_message)
+        )
+        await self._send_start(self._start_headers(None))
+        await self._send_chunk(body, True)
+
+    async def _send_chunk(self, body: bytes, more_body: bool) -> None:
+        if not more_body:
+            compressed = await self._run(self._compress_final, body)
+            await self._send({"type": "http.response.body", "body": compressed})
+            self._record()
+            return
+
+        self.unflushed += len(body)
+        if self.unflushed >= self.middleware.stream_flush_size:
+            # 모인 입력이 충분하면 클라이언트가 바로 풀 수 있는 블록으로 내보냄
+            self.unflushed = 0
+            compressed = await self._run(self._compress_flush, body)
+        else:
+            compressed = await self._run(self._compress, body)
+        if compressed:
+            await self._send(
+                {"type": "http.response.body", "body": compressed, "more_body": True}
+            )
+
+    def _compress(self, body: bytes) -> bytes:
+        self.bytes_in += len(body)
+        compressed = self.compressor.compress(body)
+        self.bytes_out += len(compressed)
+        return compressed
+
+    def _compress_flush(self, body: bytes) -> bytes:
+        compressed = self._compress(body)
+        tail = self.compressor.flush()
+        self.bytes_out += len(tail)
+        return compressed + tail
+
+    def _compress_final(self, body: bytes) -> bytes:
+        compressed = self._compress(body)
+        tail = self.compressor.finish()
+        self.bytes_out += len(tail)
+        return compressed + tail
+
+    async def _run(self, func: Callable[[bytes], bytes], body: bytes) -> bytes:
+        """큰 청크는 공유 I/O 풀에서 압축 (풀이 가득 차면 직접 압축)"""
+        if len(body) < self.middleware.offload_size:
+            return func(body)
+        try:
+            return await executor_pools.io.run(func, body)
+        except ExecutorPoolOverloaded:
+            return func(body)
+
+    def _record(self) -> None:
+        COMPRESSION_BYTES.labels(self.encoding, "in").inc(self.bytes_in)
+        COMPRESSION_BYTES.labels(self.encoding, "out").inc(self.bytes_out)
+        if self.bytes_in:
+            logger.debug(
+                "response_compressed",
+                encoding=self.encoding,
+                original_bytes=self.bytes_in,
+                compressed_bytes=self.bytes_out,
+            )
 
 
-class BatchRequestMiddleware(BaseHTTPMiddleware):
+class BatchRequestMiddleware:
     """
     요청 묶음 처리 미들웨어
 
     여러 API 요청을 하나의 요청으로 묶어서 처리합니다.
-    '/batch' 경로에 대한 POST 요청을 통해 여러 API 작업을 한 번에 처리할 수 있습니다.
+    배치 경로('/batch', '{API_V1_STR}/batch')에 대한 POST 요청을 통해 여러 API 작업을
+    한 번에 처리할 수 있습니다. 경로가 정확히 일치할 때만 가로채므로
+    ``POST /vehicles/batch`` 같은 라우트는 그대로 앱으로 전달됩니다.
+
+    하위 요청은 같은 프로세스의 ASGI 앱으로 직접 전달되어 라우팅과 안쪽 미들웨어를
+    그대로 거치며, 조회 요청은 동시에 실행되고 결과는 완료되는 대로 스트리밍됩니다.
+    항목 형식과 의존성 규칙은 ``core/batch_requests.py`` 를 참고하세요.
     """
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    def __init__(
+        self,
+        app: ASGIApp,
+        max_items: Optional[int] = None,
+        concurrency: Optional[int] = None,
+        paths: Optional[Sequence[str]] = None,
+    ):
         """
-        요청 처리
+        미들웨어 초기화
 
         Args:
-            request: 요청 객체
-            call_next: 다음 미들웨어 또는 라우트 핸들러
+            app: ASGI 애플리케이션
+            max_items: 배치 1회당 최대 항목 수
+            concurrency: 조회 요청 동시 실행 수
+            paths: 배치 엔드포인트 경로 목록 (기본값: '/batch', '{API_V1_STR}/batch')
+        """
+        self.app = app
+        self.paths = frozenset(
+            paths
+            or (
+                DEFAULT_BATCH_PATH,
+                f"{getattr(settings, 'API_V1_STR', '')}{DEFAULT_BATCH_PATH}",
+            )
+        )
+        self.max_items = max_items or getattr(
+            settings, "BATCH_MAX_ITEMS", MAX_BATCH_ITEMS
+        )
+        self.concurrency = concurrency or getattr(
+            settings, "BATCH_CONCURRENCY", DEFAULT_BATCH_CONCURRENCY
+        )
 
-        Returns:
-            응답 객체
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        요청 처리
+
+        Args:
+            scope: ASGI scope
+            receive: ASGI receive
+            send: ASGI send
         """
         # 배치 요청 경로 확인
-        if request.method == "POST" and request.url.path.endswith("/batch"):
-            return await self._handle_batch_request(request)
+        if (
+            scope["type"] != "http"
+            or scope["method"] != "POST"
+            or not is_batch_path(scope["path"], self.paths)
+        ):
+            await self.app(scope, receive, send)
+            return
 
-        # 일반 요청 처리
-        return await call_next(request)
+        response = await self._handle_batch_request(Request(scope, receive))
+        await response(scope, receive, send)
 
-    async def _handle_batch_request(self, request: Request) -> JSONResponse:
+    async def _handle_batch_request(self, request: Request) -> Response:
         """
         배치 요청 처리
 
@@ -255,133 +458,15 @@ class BatchRequestMiddleware(BaseHTTPMiddleware):
             request: 배치 요청 객체
 
         Returns:
-            배치 작업 결과 응답
+            배치 작업 결과 응답 (항목 결과 JSON 배열 스트리밍)
         """
         try:
-            # 요청 본문 파싱
-            batch_data = await request.json()
-
-            if not isinstance(batch_data, list):
-                return JSONResponse(
-                    status_code=400,
-                    content={"error": "배치 요청은 배열 형식이어야 합니다"},
-                )
-
-            # 각 요청 처리 결과를 저장할 리스트
-            results = []
-
-            # 모든 배치 요청 처리
-            for idx, item in enumerate(batch_data):
-                # 필수 필드 확인
-                if (
-                    not isinstance(item, dict)
-                    or "method" not in item
-                    or "path" not in item
-                ):
-                    results.append(
-                        {
-                            "status": 400,
-                            "body": {
-                                "error": "각 배치 항목은 method와 path를 포함해야 합니다"
-                            },
-                            "id": item.get("id"),
-                        }
-                    )
-                    continue
-
-                # 요청 항목 정보 추출
-                method = item["method"].upper()
-                path = item["path"]
-                headers = item.get("headers", {})
-                params = item.get("params", {})
-                body = item.get("body")
-                request_id = item.get("id")
-
-                # 내부 요청 처리
-                try:
-                    start_time = time.time()
-                    response = await self._process_subrequest(
-                        request, method, path, headers, params, body
-                    )
-                    process_time = time.time() - start_time
+            items = parse_batch(await request.json(), self.max_items, self.paths)
+        except (BatchValidationError, ValueError) as e:
+            return JSONResponse(status_code=400, content={"error": str(e)})
 
-                    # 응답 본문 추출
-                    response_body = None
-                    if hasattr(response, "body"):
-                        try:
-                            response_body = json.loads(response.body)
-                        except:
-                            response_body = response.body.decode("utf-8")
-
-                    # 응답 정보 저장
-                    result = {
-                        "status": response.status_code,
-                        "headers": dict(response.headers),
-                        "body": response_body,
-                        "time": process_time,
-                    }
-
-                    # 요청 ID가 있으면 포함
-                    if request_id is not None:
-                        result["id"] = request_id
-
-                    results.append(result)
-
-                except Exception as e:
-                    # 하위 요청 처리 오류
-                    error_result = {
-                        "status": 500,
-                        "body": {"error": str(e)},
-                    }
-
-                    if request_id is not None:
-                        error_result["id"] = request_id
-
-                    results.append(error_result)
-
-            # 모든 결과 반환
-            return JSONResponse(content=results, status_code=200)
-
-        except Exception as e:
-            # 전체 배치 처리 오류
-            logger.error(f"배치 요청 처리 오류: {str(e)}")
-            return JSONResponse(
-                status_code=500, content={"error": f"배치 요청 처리 오류: {str(e)}"}
-            )
-
-    async def _process_subrequest(
-        self,
-        original_request: Request,
-        method: str,
-        path: str,
-        headers: Dict[str, str],
-        params: Dict[str, str],
-        body: Any = None,
-    ) -> Response:
-        """
-        하위 요청 처리 (실제 구현은 애플리케이션 상황에 맞게 개발 필요)
-
-        Args:
-            original_request: 원본 요청 객체
-            method: HTTP 메서드
-            path: 요청 경로
-            headers: 요청 헤더
-            params: 쿼리 파라미터
-            body: 요청 본문
-
-        Returns:
-            하위 요청 처리 응답
-        """
-        # 기본 가상 응답 반환 (실제 구현 필요)
-        return JSONResponse(
-            content={
-                "success": True,
-                "message": f"{method} {path} 처리됨",
-                "params": params,
-                "body": body,
-            },
-            status_code=200,
-        )
+        executor = BatchExecutor(self.app, request.scope, items, self.concurrency)
+        return StreamingResponse(executor.stream(), media_type="application/json")
 
 
 class CircuitBreakerMiddleware(BaseHTTPMiddleware):
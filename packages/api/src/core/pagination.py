@@ -0,0 +1,488 @@
+"""
+커서 기반(keyset) 페이지네이션 모듈
+
+``OFFSET/LIMIT`` 페이지네이션은 깊은 페이지일수록 앞쪽 행을 읽고 버려야 하고,
+매 페이지마다 별도의 ``COUNT`` 쿼리가 실행됩니다. 이 모듈은 ``(정렬 키, id)``
+조합의 마지막 값을 불투명(opaque) 커서로 인코딩하여 다음 페이지를
+``WHERE (sort, id) < (:sort, :id) ORDER BY sort, id LIMIT n`` 으로 조회합니다.
+
+커서에는 정렬 기준, 정렬 방향, 필터 조건 구조의 지문이 함께 들어가며 ``SECRET_KEY``
+로 서명됩니다. 다른 정렬/필터 구조로 재사용하거나 변조한 커서는
+``InvalidCursorError`` 가 됩니다. 필터 값은 지문에 넣지 않으므로 요청 시각으로 계산한
+조건(예: ``date >= now - 30일``)이 있어도 커서가 다음 페이지에서 유효합니다. NULL 이
+허용된 정렬 컬럼은 NULL 을 방향과 관계없이 마지막에 둡니다.
+
+전체 개수는 선택 사항이며 다음 방식 중에서 고를 수 있습니다.
+
+- ``exact``: ``COUNT(*)`` 실행
+- ``cached``: 정확한 개수를 테이블별로 ``COUNT_CACHE_TTL`` 동안 캐시. ORM 으로 행을
+  추가/수정/삭제하면 무효화되지만 ``Query.update()/delete()`` 같은 일괄 쓰기는 TTL 이
+  지나야 반영되므로 근사값(``total_is_estimate``)으로 표시
+- ``estimate``: PostgreSQL 실행 계획의 예상 행 수 (그 외 DB 는 ``cached``)
+- ``none``: 개수를 계산하지 않음
+"""
+
+import base64
+import hashlib
+import hmac
+import json
+import logging
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from enum import Enum
+from typing import Any, Dict, Generic, List, Optional, Tuple, TypeVar
+
+from sqlalchemy import and_, or_
+
+from packages.api.src.coreconfig import settings
+from packagescore.aggregates import stats_cache
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# 캐시된 개수의 유효 시간 (초)
+COUNT_CACHE_TTL = 60
+
+# 커서 서명 길이 (바이트)
+CURSOR_SIGNATURE_BYTES = 16
+
+
+class CountMode(str, Enum):
+    """전체 개수 계산 방식"""
+
+    EXACT = "exact"
+    CACHED = "cached"
+    ESTIMATE = "estimate"
+    NONE = "none"
+
+
+class InvalidCursorError(ValueError):
+    """커서를 해석할 수 없거나 정렬 기준과 맞지 않을 때 발생하는 예외"""
+
+    pass
+
+
+@dataclass
+class CursorPage(Generic[T]):
+    """커서 페이지 결과"""
+
+    items: List[T]
+    limit: int
+    next_cursor: Optional[str] = None
+    total: Optional[int] = None
+    total_is_estimate: bool = False
+    extra: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def has_next(self) -> bool:
+        """다음 페이지 존재 여부"""
+        return self.next_cursor is not None
+
+
+def _encode_value(value: Any) -> Any:
+    """커서 값 JSON 직렬화"""
+    if isinstance(value, datetime):
+        return {"$dt": value.isoformat()}
+    if isinstance(value, date):
+        return {"$d": value.isoformat()}
+    if isinstance(value, Enum):
+        return value.value
+    return value
+
+
+def _decode_value(value: Any) -> Any:
+    """커서 값 JSON 역직렬화"""
+    if isinstance(value, dict):
+        if "$dt" in value:
+            return datetime.fromisoformat(value["$dt"])
+        if "$d" in value:
+            return date.fromisoformat(value["$d"])
+    return value
+
+
+def _b64encode(raw: bytes) -> str:
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def _b64decode(text: str) -> bytes:
+    return base64.urlsafe_b64decode((text + "=" * (-len(text) % 4)).encode("ascii"))
+
+
+def _sign(body: bytes) -> bytes:
+    """커서 본문 HMAC 서명"""
+    key = (getattr(settings, "SECRET_KEY", None) or "").encode("utf-8")
+    digest = hmac.new(key, b"cursor:" + body, hashlib.sha256).digest()
+    return digest[:CURSOR_SIGNATURE_BYTES]
+
+
+def cursor_scope(statement: Any) -> str:
+    """
+    커서를 발급한 쿼리의 대상 테이블과 필터 조건 구조 지문
+
+    파라미터 값은 제외하므로 요청마다 달라지는 값(현재 시각 기준 기간 등)으로 필터해도
+    같은 커서를 계속 사용할 수 있습니다.
+
+    Args:
+        statement: 정렬/페이지네이션 적용 전 ORM ``Query`` 또는 Core ``Select``
+
+    Returns:
+        str: 대상 테이블과 ``WHERE`` 절 구조(컬럼, 연산자, 파라미터 이름)의 해시
+    """
+    select_statement = getattr(statement, "statement", statement)
+    parts = [",".join(sorted(str(f) for f in select_statement.get_final_froms()))]
+    where = select_statement.whereclause
+    if where is not None:
+        compiled = where.compile()
+        parts.append(str(compiled))
+        parts.append(",".join(sorted(compiled.params)))
+    return hashlib.sha256("|".join(parts).encode("utf-8")).hexdigest()[:16]
+
+
+def count_cache_namespace(table_name: str) -> str:
+    """
+    ``cached`` 개수의 테이블별 무효화 네임스페이스
+
+    Args:
+        table_name: 테이블 이름
+
+    Returns:
+        str: ``stats_cache`` 네임스페이스
+    """
+    return f"pagination_count:{table_name}"
+
+
+def watch_counts(model: Any) -> str:
+    """
+    모델의 ORM 쓰기 시 캐시된 개수가 무효화되도록 등록
+
+    Args:
+        model: 매핑 모델
+
+    Returns:
+        str: 모델 테이블의 개수 캐시 네임스페이스
+    """
+    namespace = count_cache_namespace(model.__table__.name)
+    stats_cache.watch(model, namespace)
+    return namespace
+
+
+def encode_cursor(
+    sort_name: str,
+    sort_value: Any,
+    id_value: Any,
+    descending: bool = True,
+    scope: Optional[str] = None,
+) -> str:
+    """
+    커서 인코딩 (서명 포함)
+
+    Args:
+        sort_name: 정렬 기준 이름 (다른 정렬의 커서 재사용 방지)
+        sort_value: 마지막 항목의 정렬 키 값
+        id_value: 마지막 항목의 ID
+        descending: 내림차순 여부
+        scope: 필터 조건 지문 (``cursor_scope``)
+
+    Returns:
+        str: URL 에 안전한 불투명 커서 문자열
+    """
+    payload = {
+        "s": sort_name,
+        "d": "desc" if descending else "asc",
+        "f": scope,
+        "k": [_encode_value(sort_value), _encode_value(id_value)],
+    }
+    body = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return f"{_b64encode(body)}.{_b64encode(_sign(body))}"
+
+
+def decode_cursor(
+    cursor: str,
+    sort_name: str,
+    descending: bool = True,
+    scope: Optional[str] = None,
+) -> Tuple[Any, Any]:
+    """
+    커서 디코딩
+
+    Args:
+        cursor: ``encode_cursor`` 로 만든 커서
+        sort_name: 현재 요청의 정렬 기준 이름
+        descending: 현재 요청의 내림차순 여부
+        scope: 현재 요청의 필터 조건 지문
+
+    Returns:
+        Tuple[Any, Any]: ``(정렬 키 값, ID)``
+
+    Raises:
+        InvalidCursorError: 커서 형식/서명이 잘못되었거나 정렬 기준, 방향, 필터가 다른 경우
+    """
+    try:
+        encoded_body, encoded_signature = cursor.split(".", 1)
+        body = _b64decode(encoded_body)
+        signature = _b64decode(encoded_signature)
+    except Exception as e:
+        raise InvalidCursorError("유효하지 않은 커서입니다.") from e
+    if not hmac.compare_digest(signature, _sign(body)):
+        raise InvalidCursorError("유효하지 않은 커서입니다.")
+    try:
+        payload = json.loads(body)
+        sort_value, id_value = payload["k"]
+    except Exception as e:
+        raise InvalidCursorError("유효하지 않은 커서입니다.") from e
+    if payload.get("s") != sort_name:
+        raise InvalidCursorError("커서의 정렬 기준이 요청과 일치하지 않습니다.")
+    if payload.get("d") != ("desc" if descending else "asc"):
+        raise InvalidCursorError("커서의 정렬 방향이 요청과 일치하지 않습니다.")
+    if payload.get("f") != scope:
+        raise InvalidCursorError("커서의 필터 조건이 요청과 일치하지 않습니다.")
+    return _decode_value(sort_value), _decode_value(id_value)
+
+
+def _is_nullable(column: Any) -> bool:
+    """정렬 컬럼의 NULL 허용 여부 (알 수 없으면 허용으로 간주)"""
+    expression = getattr(column, "expression", column)
+    return bool(getattr(expression, "nullable", True))
+
+
+def keyset_condition(
+    sort_column: Any,
+    id_column: Any,
+    sort_value: Any,
+    id_value: Any,
+    descending: bool = True,
+) -> Any:
+    """
+    ``(sort, id)`` 가 커서 위치 이후인 행 조건
+
+    NULL 이 허용된 정렬 컬럼은 ``keyset_order`` 와 같이 NULL 을 마지막에 둡니다.
+
+    Args:
+        sort_column: 정렬 컬럼
+        id_column: ID 컬럼 (동순위 구분용)
+        sort_value: 커서의 정렬 키 값
+        id_value: 커서의 ID
+        descending: 내림차순 여부
+
+    Returns:
+        조건식
+    """
+    after_id = id_column < id_value if descending else id_column > id_value
+    if sort_value is None:
+        # 커서가 NULL 구간에 있으면 남은 NULL 행만 ID 순으로
+        return and_(sort_column.is_(None), after_id)
+    after_sort = sort_column < sort_value if descending else sort_column > sort_value
+    condition = or_(after_sort, and_(sort_column == sort_value, after_id))
+    if _is_nullable(sort_column):
+        condition = or_(condition, sort_column.is_(None))
+    return condition
+
+
+def keyset_order(
+    sort_column: Any, id_column: Any, descending: bool = True
+) -> List[Any]:
+    """
+    keyset 정렬 순서 (NULL 허용 컬럼은 NULL 을 마지막에)
+
+    Args:
+        sort_column: 정렬 컬럼
+        id_column: ID 컬럼
+        descending: 내림차순 여부
+
+    Returns:
+        List[Any]: ``ORDER BY`` 절 식 목록
+    """
+    if descending:
+        order = [sort_column.desc(), id_column.desc()]
+    else:
+        order = [sort_column.asc(), id_column.asc()]
+    if _is_nullable(sort_column):
+        order[0] = order[0].nulls_last()
+    return order
+
+
+def apply_keyset(
+    statement: Any,
+    sort_column: Any,
+    id_column: Any,
+    cursor: Optional[str],
+    limit: int,
+    descending: bool = True,
+    sort_name: Optional[str] = None,
+    scope: Optional[str] = None,
+) -> Any:
+    """
+    쿼리에 커서 조건, 정렬, ``LIMIT limit + 1`` 적용
+
+    ORM ``Query`` 와 Core ``Select`` 모두 사용할 수 있습니다. 기존 정렬은 제거됩니다.
+
+    Args:
+        statement: 필터가 적용된 쿼리
+        sort_column: 정렬 컬럼
+        id_column: ID 컬럼
+        cursor: 이전 페이지의 ``next_cursor`` (첫 페이지는 None)
+        limit: 페이지 크기
+        descending: 내림차순 여부
+        sort_name: 정렬 기준 이름 (기본값: 정렬 컬럼 키)
+        scope: 필터 조건 지문 (기본값: ``cursor_scope(statement)``)
+
+    Returns:
+        keyset 이 적용된 쿼리 (다음 페이지 확인용으로 1건 더 조회)
+    """
+    sort_name = sort_name or sort_column.key
+    if cursor:
+        if scope is None:
+            scope = cursor_scope(statement)
+        sort_value, id_value = decode_cursor(cursor, sort_name, descending, scope)
+        statement = statement.where(
+            keyset_condition(sort_column, id_column, sort_value, id_value, descending)
+        )
+    return (
+        statement.order_by(None)
+        .order_by(*keyset_order(sort_column, id_column, descending))
+        .limit(limit + 1)
+    )
+
+
+def build_page(
+    rows: List[T],
+    limit: int,
+    sort_attr: str,
+    id_attr: str = "id",
+    sort_name: Optional[str] = None,
+    descending: bool = True,
+    scope: Optional[str] = None,
+) -> CursorPage[T]:
+    """
+    ``apply_keyset`` 결과로 커서 페이지 구성
+
+    Args:
+        rows: ``limit + 1`` 개까지 조회된 행
+        limit: 페이지 크기
+        sort_attr: 행의 정렬 키 속성 이름
+        id_attr: 행의 ID 속성 이름
+        sort_name: 정렬 기준 이름 (기본값: ``sort_attr``)
+        descending: 내림차순 여부
+        scope: 필터 조건 지문 (``cursor_scope``)
+
+    Returns:
+        CursorPage: 항목과 다음 커서
+    """
+    items = list(rows[:limit])
+    next_cursor = None
+    if len(rows) > limit and items:
+        last = items[-1]
+        next_cursor = encode_cursor(
+            sort_name or sort_attr,
+            getattr(last, sort_attr),
+            getattr(last, id_attr),
+            descending,
+            scope,
+        )
+    return CursorPage(items=items, limit=limit, next_cursor=next_cursor)
+
+
+def _estimate_rows(query: Any) -> Optional[int]:
+    """PostgreSQL 실행 계획의 예상 행 수"""
+    session = query.session
+    bind = session.get_bind()
+    if bind.dialect.name != "postgresql":
+        return None
+    compiled = query.statement.compile(dialect=bind.dialect)
+    plan = (
+        session.connection()
+        .exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled}", compiled.params)
+        .scalar()
+    )
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+def count_query(
+    query: Any,
+    mode: CountMode = CountMode.EXACT,
+    cache_key: Optional[str] = None,
+) -> Tuple[Optional[int], bool]:
+    """
+    ORM 쿼리의 전체 개수 계산
+
+    Args:
+        query: 필터가 적용된 ORM ``Query`` (정렬/페이지네이션 적용 전)
+        mode: 개수 계산 방식
+        cache_key: ``cached`` 방식의 캐시 키 (기본값: 컴파일된 SQL 과 파라미터)
+
+    Returns:
+        Tuple[Optional[int], bool]: ``(개수, 근사값 여부)``, ``none`` 이면 ``(None, False)``
+    """
+    mode = CountMode(mode)
+    if mode == CountMode.NONE:
+        return None, False
+
+    unordered = query.order_by(None)
+    if mode == CountMode.EXACT:
+        return unordered.count(), False
+
+    if mode == CountMode.ESTIMATE:
+        try:
+            estimate = _estimate_rows(unordered)
+            if estimate is not None:
+                return estimate, True
+        except Exception as e:
+            logger.warning(f"예상 행 수 조회 실패, 캐시된 개수 사용: {str(e)}")
+
+    if cache_key is None:
+        compiled = unordered.statement.compile()
+        cache_key = f"{compiled}|{sorted(compiled.params.items(), key=str)}"
+    entity = unordered.column_descriptions[0].get("entity")
+    namespace = (
+        watch_counts(entity) if entity is not None else count_cache_namespace("")
+    )
+    total = stats_cache.get_or_compute(
+        namespace,
+        cache_key,
+        unordered.count,
+        ttl=COUNT_CACHE_TTL,
+    )
+    return total, True
+
+
+def paginate_query(
+    query: Any,
+    sort_column: Any,
+    id_column: Any,
+    cursor: Optional[str] = None,
+    limit: int = 100,
+    descending: bool = True,
+    count_mode: CountMode = CountMode.NONE,
+    sort_name: Optional[str] = None,
+) -> CursorPage:
+    """
+    동기 ORM 쿼리를 커서 페이지로 조회
+
+    Args:
+        query: 필터가 적용된 ORM ``Query``
+        sort_column: 정렬 컬럼 (매핑 속성)
+        id_column: ID 컬럼 (매핑 속성)
+        cursor: 이전 페이지의 ``next_cursor``
+        limit: 페이지 크기
+        descending: 내림차순 여부
+        count_mode: 전체 개수 계산 방식
+        sort_name: 정렬 기준 이름 (기본값: 정렬 컬럼 키)
+
+    Returns:
+        CursorPage: 페이지 결과
+    """
+    sort_name = sort_name or sort_column.key
+    scope = cursor_scope(query)
+    total, is_estimate = count_query(query, count_mode)
+    rows = apply_keyset(
+        query, sort_column, id_column, cursor, limit, descending, sort_name, scope
+    ).all()
+    page = build_page(
+        rows, limit, sort_column.key, id_column.key, sort_name, descending, scope
+    )
+    page.total = total
+    page.total_is_estimate = is_estimate
+    return page
@@ -8,7 +8,7 @@ import functools
 import inspect
 import logging
 import time
-from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures import Executor
 from contextlib import contextmanager
 from typing import (
     Any,
@@ -23,6 +23,10 @@ from typing import (
     Union,
 )
 
+from packages.api.src.coreexecutor_pools import (ExecutorPools,
+                                                 ManagedExecutor,
+                                                 executor_pools)
+
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
@@ -32,8 +36,12 @@ R = TypeVar("R")
 class ParallelExecutionError(Exception):
     """병렬 실행 중 발생한 오류를 표현하는 예외 클래스"""
 
-    def __init__(self, errors: Dict[str, Exception]):
+    def __init__(
+        self, errors: Dict[str, Exception], results: Optional[Dict[str, Any]] = None
+    ):
         self.errors = errors
+        # 성공한 작업의 결과
+        self.results = results or {}
         error_messages = "\n".join(
             [f"{key}: {str(err)}" for key, err in errors.items()]
         )
@@ -44,34 +52,42 @@ class ParallelProcessor:
     """
     병렬 처리를 위한 클래스
     여러 작업을 동시에 실행하여 API 성능을 향상시킵니다.
+
+    동기 작업은 애플리케이션 공유 풀(``executor_pools``)에서 실행되고,
+    코루틴 함수는 이벤트 루프에서 바로 실행됩니다.
     """
 
-    def __init__(self, max_workers: int = None, use_process_pool: bool = False):
+    def __init__(
+        self,
+        max_workers: int = None,
+        use_process_pool: bool = False,
+        pools: Optional[ExecutorPools] = None,
+    ):
         """
         ParallelProcessor 초기화
 
         Args:
-            max_workers: 동시 실행할 최대 작업자 수 (None인 경우 시스템 기본값 사용)
-            use_process_pool: 프로세스 풀 사용 여부 (True: ProcessPoolExecutor, False: ThreadPoolExecutor)
+            max_workers: 호출당 동시 실행할 최대 작업 수 (None인 경우 풀 크기만큼)
+            use_process_pool: 프로세스 풀 사용 여부 (True: CPU 프로세스 풀, False: I/O 스레드 풀)
+            pools: 사용할 실행기 풀 묶음 (기본값: 전역 공유 풀)
         """
         self.max_workers = max_workers
         self.use_process_pool = use_process_pool
-        self._executor = None
+        self.pools = pools or executor_pools
+
+    @property
+    def pool(self) -> ManagedExecutor:
+        """설정에 맞는 공유 실행기 풀"""
+        return self.pools.get(self.use_process_pool)
 
     @contextmanager
     def executor(self):
         """
         실행기 컨텍스트 매니저
-        사용 후 자동으로 정리합니다.
+        공유 풀의 실행기를 돌려주며 종료하지 않습니다.
         """
-        executor_class = (
-            ProcessPoolExecutor if self.use_process_pool else ThreadPoolExecutor
-        )
-        executor = executor_class(max_workers=self.max_workers)
-        try:
-            yield executor
-        finally:
-            executor.shutdown(wait=False)
+        executor: Executor = self.pool.executor
+        yield executor
 
     async def execute_parallel(self, tasks: Dict[str, Callable[[], T]]) -> Dict[str, T]:
         """
@@ -87,38 +103,40 @@ class ParallelProcessor:
             ParallelExecutionError: 하나 이상의 작업에서 오류 발생 시
         """
         start_time = time.time()
-        loop = asyncio.get_event_loop()
         results = {}
         errors = {}
 
-        # 프로세스 풀을 사용하는 경우 ThreadPool로 대체
-        # 프로세스 풀은 로컬 함수나 람다를 직렬화할 수 없음
+        # 프로세스 풀은 로컬 함수나 람다를 직렬화할 수 없으므로 스레드 풀로 대체
+        pool = self.pool
         if self.use_process_pool and any(
-            not inspect.isfunction(task) for task in tasks.values()
+            not inspect.isfunction(task) or "<" in task.__qualname__
+            for task in tasks.values()
         ):
             logger.warning(
                 "프로세스 풀에서 로컬 함수나 람다를 실행할 수 없어 스레드 풀로 대체합니다."
             )
-            original_setting = self.use_process_pool
-            self.use_process_pool = False
-            try:
-                return await self.execute_parallel(tasks)
-            finally:
-                self.use_process_pool = original_setting
-
-        with self.executor() as executor:
-            # 모든 작업을 실행기에 제출
-            futures = {
-                key: loop.run_in_executor(executor, task) for key, task in tasks.items()
-            }
-
-            # 모든 작업 완료 대기
-            for key, future in futures.items():
-                try:
-                    results[key] = await future
-                except Exception as e:
-                    logger.error(f"병렬 실행 작업 '{key}' 중 오류 발생: {str(e)}")
-                    errors[key] = e
+            pool = self.pools.io
+
+        limiter = asyncio.Semaphore(self.max_workers) if self.max_workers else None
+
+        async def run_task(task: Callable[[], T]) -> T:
+            if limiter is not None:
+                async with limiter:
+                    return await self._run_task(pool, task)
+            return await self._run_task(pool, task)
+
+        keys = list(tasks.keys())
+        outcomes = await asyncio.gather(
+            *[run_task(tasks[key]) for key in keys], return_exceptions=True
+        )
+        for key, outcome in zip(keys, outcomes):
+            if isinstance(outcome, Exception):
+                logger.error(f"병렬 실행 작업 '{key}' 중 오류 발생: {str(outcome)}")
+                errors[key] = outcome
+            elif isinstance(outcome, BaseException):
+                raise outcome
+            else:
+                results[key] = outcome
 
         execution_time = time.time() - start_time
         logger.debug(
@@ -127,10 +145,20 @@ class ParallelProcessor:
 
         # 오류가 있는 경우 예외 발생
         if errors:
-            raise ParallelExecutionError(errors)
+            raise ParallelExecutionError(errors, results)
 
         return results
 
+    @staticmethod
+    async def _run_task(pool: ManagedExecutor, task: Callable[[], T]) -> T:
+        """코루틴 함수는 이벤트 루프에서, 동기 함수는 공유 풀에서 실행"""
+        if inspect.iscoroutinefunction(task):
+            return await task()
+        result = await pool.run(task)
+        if inspect.isawaitable(result):
+            return await result
+        return result
+
     async def execute_all(self, tasks: List[Callable[[], T]]) -> List[T]:
         """
         여러 작업을 병렬로 실행하고 결과 목록을 반환합니다.
@@ -174,8 +202,7 @@ async def parallel_map(
         if is_coroutine:
             return await func(item)
         else:
-            loop = asyncio.get_event_loop()
-            return await loop.run_in_executor(None, func, item)
+            return await executor_pools.get(use_process_pool).run(func, item)
 
     tasks = [wrapper(item) for item in items]
     return await asyncio.gather(*tasks)
@@ -186,14 +213,16 @@ class DataBatcher:
     대량 데이터 처리를 위한 배치 처리 클래스
     """
 
-    def __init__(self, batch_size: int = 1000):
+    def __init__(self, batch_size: int = 1000, pools: Optional[ExecutorPools] = None):
         """
         DataBatcher 초기화
 
         Args:
             batch_size: 각 배치의 크기
+            pools: 사용할 실행기 풀 묶음 (기본값: 전역 공유 풀)
         """
         self.batch_size = batch_size
+        self.pools = pools or executor_pools
 
     def create_batches(self, items: List[T]) -> List[List[T]]:
         """
@@ -227,7 +256,7 @@ class DataBatcher:
         batches = self.create_batches(items)
         logger.info(f"{len(items)} 항목을 {len(batches)}개 배치로 나누어 처리합니다.")
 
-        parallel = ParallelProcessor(max_workers=max_workers)
+        parallel = ParallelProcessor(max_workers=max_workers, pools=self.pools)
         tasks = {
             f"batch_{i}": functools.partial(processor, batch)
             for i, batch in enumerate(batches)
@@ -302,12 +331,10 @@ def parallel_db_query(max_concurrency: int = 3):
             if is_async:
                 result = await func(*args, **kwargs)
             else:
-                # 동기 함수를 별도 스레드에서 실행
-                loop = asyncio.get_event_loop()
-                with ThreadPoolExecutor(max_workers=1) as executor:
-                    result = await loop.run_in_executor(
-                        executor, functools.partial(func, *args, **kwargs)
-                    )
+                # 동기 함수를 공유 I/O 풀에서 실행
+                result = await executor_pools.io.run(
+                    functools.partial(func, *args, **kwargs)
+                )
 
             execution_time = time.time() - start_time
             logger.debug(
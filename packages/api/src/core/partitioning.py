@@ -0,0 +1,579 @@
+"""
+시간 기반 테이블 파티셔닝 모듈
+
+위치 이력처럼 시간 순으로 계속 쌓이는 테이블을 일/월 단위 파티션으로 나누어 관리합니다.
+
+- PostgreSQL: 부모 테이블이 ``PARTITION BY RANGE`` 로 선언된 경우 네이티브 파티션을 사용합니다.
+  조회 시 파티션 프루닝은 플래너가 자동으로 수행합니다.
+- 그 외(SQLite, 파티션되지 않은 PostgreSQL 테이블): 파티션마다 물리 테이블
+  (``<base>_pYYYYMM`` / ``<base>_pYYYYMMDD``)을 만들고, 조회 시 범위에 걸치는
+  파티션만 ``UNION ALL`` 로 묶습니다.
+
+보존 기간 정리는 ``DELETE`` 대신 만료된 파티션 전체를 ``DROP TABLE`` 합니다.
+파티션 밖(대체 모드의 기본 테이블, 네이티브 모드의 DEFAULT 파티션)에 남은 행만
+배치 단위 ``DELETE`` 로 정리합니다.
+"""
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from enum import Enum
+from typing import Any, Dict, List, Mapping, Optional, Set
+
+from sqlalchemy import (
+    BigInteger,
+    Column,
+    Index,
+    Integer,
+    MetaData,
+    Table,
+    and_,
+    column,
+    inspect,
+    select,
+    text,
+    union_all,
+)
+from sqlalchemy.engine import Connection
+from sqlalchemy.sql import FromClause
+from sqlalchemy.sql import table as table_clause
+
+logger = logging.getLogger(__name__)
+
+# 대체 파티션 테이블의 ID 구간 크기 (파티션 시작일 ordinal * ID_BLOCK_SIZE 부터 할당)
+# int4 범위를 넘으므로 대체 파티션의 정수 기본 키는 bigint 로 생성
+ID_BLOCK_SIZE = 10**10
+
+# 파티션 밖에 남은 행을 정리할 때 DELETE 한 번에 지우는 행 수
+DELETE_BATCH_SIZE = 10000
+
+# 존재하는 파티션 목록 캐시 유효 시간 (초)
+PARTITION_CACHE_TTL = 60.0
+
+# 조회 범위의 파티션이 캐시에 없을 때(다른 워커가 방금 만든 경우 등) 다시 읽는 최소 간격 (초)
+PARTITION_MISS_REFRESH_INTERVAL = 1.0
+
+
+class PartitionGranularity(str, Enum):
+    """파티션 단위"""
+
+    DAILY = "daily"
+    MONTHLY = "monthly"
+
+
+@dataclass(frozen=True)
+class TimePartition:
+    """단일 시간 파티션 정보 (start 이상 end 미만)"""
+
+    name: str
+    start: datetime
+    end: datetime
+
+
+class TimePartitionManager:
+    """시간 범위 파티션 관리 클래스"""
+
+    def __init__(
+        self,
+        table: Table,
+        column: str = "timestamp",
+        granularity: PartitionGranularity = PartitionGranularity.MONTHLY,
+    ):
+        """
+        파티션 매니저 초기화
+
+        Args:
+            table: 파티션 대상 기본 테이블
+            column: 파티션 키(시간) 컬럼 이름
+            granularity: 파티션 단위 (일/월)
+        """
+        self.table = table
+        self.column = column
+        self.granularity = PartitionGranularity(granularity)
+        self.logger = logger
+        self._metadata = MetaData()
+        self._tables: Dict[str, Table] = {}
+        self._known: Set[str] = set()
+        self._native: Optional[bool] = None
+        self._lock = threading.Lock()
+        # 이름별 존재 파티션 캐시 (None 이면 아직 읽지 않음)
+        self._existing: Optional[Dict[str, TimePartition]] = None
+        self._existing_loaded_at = 0.0
+
+    # ------------------------------------------------------------------
+    # 파티션 경계 계산
+    # ------------------------------------------------------------------
+
+    def partition_for(self, value: datetime) -> TimePartition:
+        """
+        시각이 속한 파티션 계산
+
+        Args:
+            value: 파티션 키 값
+
+        Returns:
+            TimePartition: 해당 파티션 정보
+        """
+        if self.granularity == PartitionGranularity.DAILY:
+            start = datetime(value.year, value.month, value.day)
+            end = start + timedelta(days=1)
+            suffix = start.strftime("%Y%m%d")
+        else:
+            start = datetime(value.year, value.month, 1)
+            end = (
+                datetime(start.year + 1, 1, 1)
+                if start.month == 12
+                else datetime(start.year, start.month + 1, 1)
+            )
+            suffix = start.strftime("%Y%m")
+        return TimePartition(f"{self.table.name}_p{suffix}", start, end)
+
+    def partitions_between(
+        self, start: datetime, end: datetime
+    ) -> List[TimePartition]:
+        """
+        범위 [start, end] 에 걸치는 파티션 목록
+
+        Args:
+            start: 시작 시각
+            end: 종료 시각
+
+        Returns:
+            List[TimePartition]: 시간 순 파티션 목록
+        """
+        partitions = []
+        current = self.partition_for(start)
+        while current.start <= end:
+            partitions.append(current)
+            current = self.partition_for(current.end)
+        return partitions
+
+    def _parse_partition(self, name: str) -> Optional[TimePartition]:
+        """테이블 이름에서 파티션 정보 복원"""
+        prefix = f"{self.table.name}_p"
+        if not name.startswith(prefix):
+            return None
+        suffix = name[len(prefix):]
+        fmt = "%Y%m%d" if self.granularity == PartitionGranularity.DAILY else "%Y%m"
+        try:
+            partition = self.partition_for(datetime.strptime(suffix, fmt))
+        except ValueError:
+            return None
+        return partition if partition.name == name else None
+
+    # ------------------------------------------------------------------
+    # 스키마 관리
+    # ------------------------------------------------------------------
+
+    def is_native(self, conn: Connection) -> bool:
+        """
+        네이티브(선언적) 파티셔닝 사용 여부
+
+        Args:
+            conn: 데이터베이스 연결
+
+        Returns:
+            bool: PostgreSQL 파티션 부모 테이블이면 True
+        """
+        if self._native is None:
+            native = False
+            if conn.dialect.name == "postgresql":
+                native = bool(
+                    conn.execute(
+                        text(
+                            "SELECT 1 FROM pg_partitioned_table p "
+                            "JOIN pg_class c ON c.oid = p.partrelid "
+                            "WHERE c.relname = :name"
+                        ),
+                        {"name": self.table.name},
+                    ).scalar()
+                )
+                if not native:
+                    self.logger.warning(
+                        f"{self.table.name} 테이블이 파티션 테이블이 아닙니다. "
+                        "테이블 단위 파티션으로 대체합니다."
+                    )
+            self._native = native
+        return self._native
+
+    def create_parent(self, conn: Connection) -> None:
+        """
+        파티션 부모 테이블 생성
+
+        PostgreSQL 에서는 ``PARTITION BY RANGE`` 부모 테이블과 DEFAULT 파티션을 만들고,
+        그 외 DB 에서는 기본 테이블(기존 데이터 보관용)을 생성합니다.
+
+        Args:
+            conn: 데이터베이스 연결
+        """
+        if conn.dialect.name != "postgresql":
+            self.table.create(conn, checkfirst=True)
+            return
+
+        if inspect(conn).has_table(self.table.name):
+            self.is_native(conn)
+            return
+
+        # 파티션 테이블의 기본 키에는 파티션 키가 포함되어야 함
+        columns = [
+            Column(
+                col.name,
+                col.type,
+                primary_key=col.primary_key or col.name == self.column,
+                nullable=col.nullable,
+                autoincrement=col.autoincrement if col.primary_key else False,
+                server_default=(
+                    col.server_default.arg if col.server_default is not None else None
+                ),
+            )
+            for col in self.table.columns
+        ]
+        parent = Table(
+            self.table.name,
+            MetaData(),
+            *columns,
+            postgresql_partition_by=f"RANGE ({self.column})",
+        )
+        parent.create(conn)
+        conn.execute(
+            text(
+                f"CREATE TABLE IF NOT EXISTS {self.table.name}_default "
+                f"PARTITION OF {self.table.name} DEFAULT"
+            )
+        )
+        self._native = True
+        self.logger.info(f"파티션 부모 테이블 생성 완료: {self.table.name}")
+
+    def partition_table(self, partition: TimePartition) -> Table:
+        """
+        대체 파티션의 테이블 객체 반환
+
+        Args:
+            partition: 파티션 정보
+
+        Returns:
+            Table: 기본 테이블과 같은 컬럼을 가진 파티션 테이블
+        """
+        table = self._tables.get(partition.name)
+        if table is None:
+            with self._lock:
+                table = self._tables.get(partition.name)
+                if table is None:
+                    columns = [
+                        Column(
+                            col.name,
+                            self._partition_column_type(col),
+                            primary_key=col.primary_key,
+                            nullable=col.nullable,
+                            server_default=(
+                                col.server_default.arg
+                                if col.server_default is not None
+                                else None
+                            ),
+                        )
+                        for col in self.table.columns
+                    ]
+                    table = Table(
+                        partition.name,
+                        self._metadata,
+                        *columns,
+                        sqlite_autoincrement=True,
+                    )
+                    if "vehicle_id" in table.c:
+                        Index(
+                            f"ix_{partition.name}_vehicle_{self.column}",
+                            table.c.vehicle_id,
+                            table.c[self.column],
+                        )
+                    else:
+                        Index(f"ix_{partition.name}_{self.column}", table.c[self.column])
+                    self._tables[partition.name] = table
+        return table
+
+    @staticmethod
+    def _partition_column_type(col: Column) -> Any:
+        """대체 파티션 컬럼 타입 (ID 구간이 int4 를 넘으므로 정수 기본 키는 bigint)"""
+        if col.primary_key and isinstance(col.type, Integer):
+            # SQLite 는 INTEGER PRIMARY KEY 만 rowid 별칭(자동 증가)이며 이미 64비트
+            return BigInteger().with_variant(Integer(), "sqlite")
+        return col.type
+
+    def ensure_partition(self, conn: Connection, value: datetime) -> TimePartition:
+        """
+        시각이 속한 파티션이 없으면 생성
+
+        Args:
+            conn: 데이터베이스 연결
+            value: 파티션 키 값
+
+        Returns:
+            TimePartition: 생성(또는 기존) 파티션 정보
+        """
+        partition = self.partition_for(value)
+        if partition.name in self._known:
+            return partition
+
+        if self.is_native(conn):
+            conn.execute(
+                text(
+                    f"CREATE TABLE IF NOT EXISTS {partition.name} "
+                    f"PARTITION OF {self.table.name} "
+                    f"FOR VALUES FROM ('{partition.start.isoformat()}') "
+                    f"TO ('{partition.end.isoformat()}')"
+                )
+            )
+        elif not inspect(conn).has_table(partition.name):
+            table = self.partition_table(partition)
+            table.create(conn, checkfirst=True)
+            self._seed_id_block(conn, partition)
+            self.logger.info(f"파티션 테이블 생성 완료: {partition.name}")
+
+        self._known.add(partition.name)
+        if self._existing is not None:
+            self._existing[partition.name] = partition
+        return partition
+
+    def _forget(self, name: str) -> None:
+        """파티션 캐시에서 제거 (삭제되었거나 생성 트랜잭션이 롤백된 경우)"""
+        self._known.discard(name)
+        self._tables.pop(name, None)
+        if self._existing is not None:
+            self._existing.pop(name, None)
+
+    def _seed_id_block(self, conn: Connection, partition: TimePartition) -> None:
+        """
+        대체 파티션의 ID 시작값 설정
+
+        파티션 테이블마다 독립적인 자동 증가 값을 쓰면 ID 가 겹치므로,
+        파티션 시작일 기준으로 겹치지 않는 ID 구간을 할당합니다.
+        """
+        offset = partition.start.toordinal() * ID_BLOCK_SIZE
+        if conn.dialect.name == "sqlite":
+            conn.execute(
+                text("INSERT INTO sqlite_sequence (name, seq) VALUES (:name, :seq)"),
+                {"name": partition.name, "seq": offset},
+            )
+        elif conn.dialect.name == "postgresql":
+            conn.execute(
+                text("SELECT setval(pg_get_serial_sequence(:name, 'id'), :seq)"),
+                {"name": partition.name, "seq": offset},
+            )
+
+    def existing_partitions(
+        self,
+        conn: Connection,
+        until: Optional[datetime] = None,
+        refresh: bool = False,
+    ) -> List[TimePartition]:
+        """
+        DB 에 존재하는 파티션 목록 (캐시 사용)
+
+        스키마 조회는 ``PARTITION_CACHE_TTL`` 마다 한 번만 수행하고, 이 프로세스에서
+        만들거나 삭제한 파티션은 캐시에 바로 반영합니다. ``until`` 이 속한 파티션이
+        캐시에 없으면 다른 워커가 만들었을 수 있으므로
+        ``PARTITION_MISS_REFRESH_INTERVAL`` 간격으로 다시 읽습니다.
+
+        Args:
+            conn: 데이터베이스 연결
+            until: 조회 범위의 끝 (없으면 현재 시각)
+            refresh: True 면 캐시를 무시하고 다시 읽음
+
+        Returns:
+            List[TimePartition]: 시간 순 파티션 목록
+        """
+        age = time.monotonic() - self._existing_loaded_at
+        existing = self._existing
+        if (
+            refresh
+            or existing is None
+            or age > PARTITION_CACHE_TTL
+            or (
+                age > PARTITION_MISS_REFRESH_INTERVAL
+                and self.partition_for(until or datetime.utcnow()).name
+                not in existing
+            )
+        ):
+            existing = {
+                partition.name: partition
+                for partition in map(
+                    self._parse_partition, inspect(conn).get_table_names()
+                )
+                if partition is not None
+            }
+            self._existing = existing
+            self._existing_loaded_at = time.monotonic()
+        return sorted(existing.values(), key=lambda p: p.start)
+
+    # ------------------------------------------------------------------
+    # 쓰기 / 조회
+    # ------------------------------------------------------------------
+
+    def insert(self, conn: Connection, values: Mapping[str, Any]) -> Any:
+        """
+        행을 해당 파티션에 삽입
+
+        Args:
+            conn: 데이터베이스 연결
+            values: 컬럼 값
+
+        Returns:
+            Any: 생성된 기본 키 값
+        """
+        partition = self.ensure_partition(conn, values[self.column])
+        target = self.table if self.is_native(conn) else self.partition_table(partition)
+        try:
+            result = conn.execute(target.insert().values(**values))
+        except Exception:
+            # 파티션 생성이 같은 트랜잭션에서 롤백될 수 있으므로 다음 삽입 때 다시 확인
+            self._forget(partition.name)
+            raise
+        return result.inserted_primary_key[0]
+
+    def range_source(
+        self,
+        conn: Connection,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        filters: Optional[Mapping[str, Any]] = None,
+    ) -> FromClause:
+        """
+        범위 조회용 FROM 절 생성 (파티션 프루닝 포함)
+
+        네이티브 파티션은 기본 테이블을 그대로 반환합니다(플래너가 프루닝).
+        대체 파티션은 범위에 걸치는 파티션과 기본 테이블(파티션 이전 데이터)만
+        ``UNION ALL`` 한 서브쿼리를 반환하며, 시간 범위와 ``filters`` 는 각 분기에 적용됩니다.
+        범위를 생략하면 존재하는 모든 파티션이 대상입니다.
+
+        Args:
+            conn: 데이터베이스 연결
+            start: 시작 시각
+            end: 종료 시각
+            filters: 컬럼 이름별 일치 조건
+
+        Returns:
+            FromClause: 기본 테이블 또는 파티션 UNION 서브쿼리
+        """
+        if self.is_native(conn):
+            return self.table
+
+        tables = [self.table] + [
+            self.partition_table(partition)
+            for partition in self.existing_partitions(conn, until=end)
+            if (start is None or partition.end > start)
+            and (end is None or partition.start <= end)
+        ]
+
+        branches = []
+        for table in tables:
+            criteria = []
+            if start is not None:
+                criteria.append(table.c[self.column] >= start)
+            if end is not None:
+                criteria.append(table.c[self.column] <= end)
+            for name, value in (filters or {}).items():
+                criteria.append(table.c[name] == value)
+            branches.append(
+                select(*[table.c[col.name] for col in self.table.columns]).where(
+                    and_(True, *criteria)
+                )
+            )
+        return union_all(*branches).subquery(f"{self.table.name}_range")
+
+    # ------------------------------------------------------------------
+    # 보존 기간 관리
+    # ------------------------------------------------------------------
+
+    def drop_before(
+        self,
+        conn: Connection,
+        cutoff: datetime,
+        batch_size: int = DELETE_BATCH_SIZE,
+    ) -> int:
+        """
+        cutoff 이전에 끝나는 파티션 전체 삭제
+
+        cutoff 가 걸쳐 있는 파티션은 파티션 전체가 만료될 때까지 유지됩니다.
+        파티션 밖에 남은 행(대체 모드의 기본 테이블, 네이티브 모드의 DEFAULT
+        파티션)은 ``batch_size`` 행씩 나누어 삭제합니다.
+
+        Args:
+            conn: 데이터베이스 연결
+            cutoff: 보존 기준 시각
+            batch_size: DELETE 한 번에 지울 최대 행 수
+
+        Returns:
+            int: 삭제된 레코드 수
+        """
+        removed = 0
+        for partition in self.existing_partitions(conn, refresh=True):
+            if partition.end > cutoff:
+                break
+            removed += conn.execute(
+                text(f"SELECT COUNT(*) FROM {partition.name}")
+            ).scalar() or 0
+            conn.execute(text(f"DROP TABLE IF EXISTS {partition.name}"))
+            self._forget(partition.name)
+            self.logger.info(f"만료 파티션 삭제: {partition.name}")
+
+        if self.is_native(conn):
+            leftover = f"{self.table.name}_default"
+            if not inspect(conn).has_table(leftover):
+                return removed
+        else:
+            leftover = self.table.name
+        removed += self._delete_rows_before(conn, leftover, cutoff, batch_size)
+        return removed
+
+    def _delete_rows_before(
+        self, conn: Connection, table_name: str, cutoff: datetime, batch_size: int
+    ) -> int:
+        """파티션 밖 테이블에서 cutoff 이전 행을 배치 단위로 삭제"""
+        key = next(iter(self.table.primary_key.columns)).name
+        target = table_clause(table_name, column(key), column(self.column))
+        removed = 0
+        while True:
+            batch = (
+                select(target.c[key])
+                .where(target.c[self.column] < cutoff)
+                .limit(batch_size)
+                .scalar_subquery()
+            )
+            deleted = (
+                conn.execute(target.delete().where(target.c[key].in_(batch))).rowcount
+                or 0
+            )
+            removed += deleted
+            if deleted < batch_size:
+                break
+        if removed:
+            self.logger.info(f"{table_name} 에서 만료 행 {removed}건 삭제")
+        return removed
+
+
+def vehicle_location_partitions(
+    granularity: PartitionGranularity = PartitionGranularity.MONTHLY,
+) -> TimePartitionManager:
+    """
+    차량 위치 이력 테이블용 파티션 매니저 반환
+
+    Args:
+        granularity: 파티션 단위
+
+    Returns:
+        TimePartitionManager: 단위별 공유 인스턴스
+    """
+    granularity = PartitionGranularity(granularity)
+    manager = _vehicle_location_managers.get(granularity)
+    if manager is None:
+        from src.models.location import VehicleLocation
+
+        manager = TimePartitionManager(
+            VehicleLocation.__table__, "timestamp", granularity
+        )
+        _vehicle_location_managers[granularity] = manager
+    return manager
+
+
+_vehicle_location_managers: Dict[PartitionGranularity, TimePartitionManager] = {}
@@ -0,0 +1,268 @@
+"""
+비동기 비밀번호 해시 모듈
+
+bcrypt 해시/검증은 한 번에 100~300ms 의 CPU 를 사용하므로 이벤트 루프에서 직접
+호출하면 그동안 워커의 다른 요청이 모두 멈춥니다. ``PasswordHasher`` 는 해시 작업을
+전용 풀(기본: 스레드 풀, bcrypt 는 해시 중 GIL 을 해제)에서 실행하고,
+
+- 대기 중인 작업 수가 ``max_pending`` 을 넘으면 즉시 ``PasswordHasherOverloaded`` 를
+  발생시켜(로드 셰딩) 로그인 폭주 시 대기열이 끝없이 늘어나지 않게 하며,
+- 대기열 깊이/대기 시간/해시 시간/거부 수를 Prometheus 메트릭으로 노출하고,
+- 저장된 해시의 cost 가 현재 설정과 다르면 검증 성공 시 새 해시를 돌려줍니다
+  (투명한 재해시).
+"""
+
+import asyncio
+import os
+import re
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Dict, Optional, Tuple
+
+import bcrypt
+import structlog
+from prometheus_client import Counter, Gauge, Histogram
+
+from packages.api.src.coreconfig import settings
+
+logger = structlog.get_logger()
+
+# 기본 bcrypt cost (2^12 라운드)
+DEFAULT_BCRYPT_ROUNDS = 12
+
+# 대기 + 실행 중 작업 상한의 작업자 수 대비 배수
+DEFAULT_PENDING_PER_WORKER = 16
+
+# bcrypt 는 72바이트까지만 사용 (초과분은 잘라서 일관되게 처리)
+BCRYPT_MAX_PASSWORD_BYTES = 72
+
+_BCRYPT_HASH_PATTERN = re.compile(r"^\$2[abxy]?\$(\d{2})\$")
+
+PASSWORD_HASH_QUEUE_DEPTH = Gauge(
+    "password_hash_queue_depth", "Password hash jobs waiting or running"
+)
+PASSWORD_HASH_WAIT = Histogram(
+    "password_hash_wait_seconds", "Time password hash jobs wait for a worker"
+)
+PASSWORD_HASH_DURATION = Histogram(
+    "password_hash_duration_seconds",
+    "Password hash job duration",
+    ["operation"],
+)
+PASSWORD_HASH_REJECTED = Counter(
+    "password_hash_rejected_total", "Password hash jobs rejected by load shedding"
+)
+PASSWORD_REHASHED = Counter(
+    "password_rehashed_total", "Password hashes upgraded to the current cost"
+)
+
+
+class PasswordHasherOverloaded(Exception):
+    """해시 대기열이 가득 차 요청을 거부한 경우"""
+
+    def __init__(self, pending: int, retry_after: int = 1):
+        self.pending = pending
+        self.retry_after = retry_after
+        super().__init__(f"비밀번호 해시 대기열이 가득 찼습니다 (대기 {pending}건)")
+
+
+def _encode(password: str) -> bytes:
+    return password.encode("utf-8")[:BCRYPT_MAX_PASSWORD_BYTES]
+
+
+def _hash_sync(password: str, rounds: int) -> Tuple[str, float]:
+    """해시 생성 (풀 작업자에서 실행, 프로세스 풀용으로 모듈 함수)"""
+    started = time.perf_counter()
+    hashed = bcrypt.hashpw(_encode(password), bcrypt.gensalt(rounds)).decode("utf-8")
+    return hashed, time.perf_counter() - started
+
+
+def _verify_sync(password: str, hashed_password: str) -> Tuple[bool, float]:
+    """해시 검증 (풀 작업자에서 실행)"""
+    started = time.perf_counter()
+    try:
+        valid = bcrypt.checkpw(_encode(password), hashed_password.encode("utf-8"))
+    except ValueError:
+        # 잘못된 형식의 해시
+        valid = False
+    return valid, time.perf_counter() - started
+
+
+def get_hash_rounds(hashed_password: str) -> Optional[int]:
+    """
+    bcrypt 해시의 cost 조회
+
+    Args:
+        hashed_password: bcrypt 해시
+
+    Returns:
+        Optional[int]: cost (bcrypt 해시가 아니면 None)
+    """
+    match = _BCRYPT_HASH_PATTERN.match(hashed_password or "")
+    return int(match.group(1)) if match else None
+
+
+class PasswordHasher:
+    """전용 풀에서 실행되는 비동기 bcrypt 해시 서비스"""
+
+    def __init__(
+        self,
+        rounds: Optional[int] = None,
+        max_workers: Optional[int] = None,
+        max_pending: Optional[int] = None,
+        use_processes: bool = False,
+    ):
+        """
+        해시 서비스 초기화 (풀은 첫 사용 시 생성)
+
+        Args:
+            rounds: bcrypt cost (기본값: 설정 ``BCRYPT_ROUNDS`` 또는 12)
+            max_workers: 풀 작업자 수 (기본값: CPU 수)
+            max_pending: 대기 + 실행 중 작업 상한 (기본값: 작업자 수 × 16)
+            use_processes: 스레드 대신 프로세스 풀 사용
+        """
+        self.rounds = rounds or getattr(settings, "BCRYPT_ROUNDS", DEFAULT_BCRYPT_ROUNDS)
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.max_pending = max_pending or self.max_workers * DEFAULT_PENDING_PER_WORKER
+        self.use_processes = use_processes
+        self.pending = 0
+        self.rejected = 0
+        self._executor: Optional[Executor] = None
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.use_processes:
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="password-hash"
+                )
+        return self._executor
+
+    async def _submit(self, operation: str, func, *args) -> Any:
+        """작업을 풀에 제출 (상한 초과 시 즉시 거부)"""
+        if self.pending >= self.max_pending:
+            self.rejected += 1
+            PASSWORD_HASH_REJECTED.inc()
+            logger.warning(
+                "password_hash_rejected", pending=self.pending, operation=operation
+            )
+            raise PasswordHasherOverloaded(self.pending)
+
+        self.pending += 1
+        PASSWORD_HASH_QUEUE_DEPTH.inc()
+        submitted = time.perf_counter()
+        try:
+            result, duration = await asyncio.get_running_loop().run_in_executor(
+                self._get_executor(), func, *args
+            )
+        finally:
+            self.pending -= 1
+            PASSWORD_HASH_QUEUE_DEPTH.dec()
+        PASSWORD_HASH_DURATION.labels(operation).observe(duration)
+        PASSWORD_HASH_WAIT.observe(max(0.0, time.perf_counter() - submitted - duration))
+        return result
+
+    async def hash(self, password: str) -> str:
+        """
+        비밀번호 해시 생성
+
+        Args:
+            password: 비밀번호
+
+        Returns:
+            str: bcrypt 해시
+
+        Raises:
+            PasswordHasherOverloaded: 대기열이 가득 찬 경우
+        """
+        return await self._submit("hash", _hash_sync, password, self.rounds)
+
+    async def verify(self, password: str, hashed_password: str) -> bool:
+        """
+        비밀번호 검증
+
+        Args:
+            password: 비밀번호
+            hashed_password: 저장된 해시
+
+        Returns:
+            bool: 일치 여부
+
+        Raises:
+            PasswordHasherOverloaded: 대기열이 가득 찬 경우
+        """
+        if not hashed_password or get_hash_rounds(hashed_password) is None:
+            return False
+        return await self._submit("verify", _verify_sync, password, hashed_password)
+
+    def needs_rehash(self, hashed_password: str) -> bool:
+        """
+        저장된 해시의 cost 가 현재 설정과 다른지 확인
+
+        Args:
+            hashed_password: 저장된 해시
+
+        Returns:
+            bool: 재해시 필요 여부
+        """
+        return get_hash_rounds(hashed_password) != self.rounds
+
+    async def verify_and_update(
+        self, password: str, hashed_password: str
+    ) -> Tuple[bool, Optional[str]]:
+        """
+        비밀번호 검증 후 필요하면 현재 cost 로 재해시
+
+        재해시가 대기열 상한에 걸리면 로그인은 성공시키고 재해시는 다음 로그인으로
+        미룹니다.
+
+        Args:
+            password: 비밀번호
+            hashed_password: 저장된 해시
+
+        Returns:
+            Tuple[bool, Optional[str]]: (일치 여부, 저장할 새 해시 또는 None)
+
+        Raises:
+            PasswordHasherOverloaded: 검증 요청이 거부된 경우
+        """
+        if not await self.verify(password, hashed_password):
+            return False, None
+        if not self.needs_rehash(hashed_password):
+            return True, None
+        try:
+            new_hash = await self.hash(password)
+        except PasswordHasherOverloaded:
+            return True, None
+        PASSWORD_REHASHED.inc()
+        return True, new_hash
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        해시 서비스 상태
+
+        Returns:
+            Dict[str, Any]: 작업자 수, 대기 작업 수, 거부 수 등
+        """
+        return {
+            "rounds": self.rounds,
+            "max_workers": self.max_workers,
+            "max_pending": self.max_pending,
+            "pending": self.pending,
+            "rejected": self.rejected,
+            "executor": "process" if self.use_processes else "thread",
+        }
+
+    def shutdown(self) -> None:
+        """풀 종료"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+# 전역 비밀번호 해시 서비스 인스턴스
+password_hasher = PasswordHasher(
+    max_workers=getattr(settings, "PASSWORD_HASH_WORKERS", None),
+    max_pending=getattr(settings, "PASSWORD_HASH_MAX_PENDING", None),
+)
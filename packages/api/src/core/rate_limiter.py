@@ -2,14 +2,20 @@
 API 요청 속도 제한 모듈
 
 API 요청에 대한 속도 제한을 관리하는 미들웨어와 유틸리티를 제공합니다.
+속도 제한 계산은 gitmanager 의 공용 GCRA 엔진을 사용합니다.
 """
 
+import math
 import time
 from datetime import datetime
-from typing import Any, Callable, Dict, Optional, Tuple, Union
+from typing import Any, Callable, Optional, Union
 
 import redis
 from fastapi import Request, Response, status
+from gitmanager.security.rate_limit.engine import (MemoryRateLimitBackend,
+                                                   RateLimitBackend,
+                                                   RateLimitResult,
+                                                   RedisRateLimitBackend)
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.types import ASGIApp
 
@@ -31,26 +37,28 @@ class RateLimiter(BaseHTTPMiddleware):
     """
     API 요청 속도 제한 미들웨어
 
-    지정된 시간 내에 허용된 요청 수를 제한합니다.
+    지정된 시간 내에 허용된 요청 수를 GCRA(슬라이딩 윈도우) 방식으로 제한합니다.
     """
 
     def __init__(
         self,
         app: ASGIApp,
-        redis_client: Optional[redis.Redis] = None,
+        redis_client: Optional[Union[redis.Redis, Any]] = None,
         rate_limit_per_minute: int = 60,
         admin_rate_limit_per_minute: int = 300,
         enable_rate_limit: bool = True,
+        backend: Optional[RateLimitBackend] = None,
     ):
         """
         속도 제한 미들웨어 초기화
 
         Args:
             app: ASGI 애플리케이션
-            redis_client: Redis 클라이언트 (메모리 기반으로 사용하려면 None)
+            redis_client: Redis 클라이언트 (메모리 기반으로 사용하려면 None, redis.asyncio 권장)
             rate_limit_per_minute: 분당 허용되는 일반 요청 수
             admin_rate_limit_per_minute: 분당 허용되는 관리자 요청 수
             enable_rate_limit: 속도 제한 활성화 여부
+            backend: 속도 제한 백엔드 (지정 시 redis_client 무시)
         """
         super().__init__(app)
         self.redis_client = redis_client
@@ -58,8 +66,12 @@ class RateLimiter(BaseHTTPMiddleware):
         self.admin_rate_limit = admin_rate_limit_per_minute
         self.window = 60  # 1분 (초 단위)
         self.enable_rate_limit = enable_rate_limit
-        self._rate_limits: Dict[str, int] = {}
-        self._rate_reset_time = int(time.time()) + self.window
+        if backend is not None:
+            self.backend = backend
+        elif redis_client is not None:
+            self.backend = RedisRateLimitBackend(redis_client, key_prefix="rate")
+        else:
+            self.backend = MemoryRateLimitBackend()
 
         logger.info(
             f"속도 제한 미들웨어 초기화: 일반 사용자 {rate_limit_per_minute}회/분, 관리자 {admin_rate_limit_per_minute}회/분"
@@ -97,31 +109,32 @@ class RateLimiter(BaseHTTPMiddleware):
         is_admin = await self._is_admin_user(request)
 
         # 속도 제한 검사
-        allowed, current_count, reset_time = await self._check_rate_limit(
+        result = await self._check_rate_limit(
             client_id, self.admin_rate_limit if is_admin else self.rate_limit
         )
 
         # 속도 제한 초과 시
-        if not allowed:
-            logger.warning(f"속도 제한 초과: {client_id}, 요청 수: {current_count}")
+        if not result.allowed:
+            retry_after = int(math.ceil(result.retry_after))
+            logger.warning(
+                f"속도 제한 초과: {client_id}, {retry_after}초 후 재시도 가능"
+            )
 
             # 429 응답 생성
             response = Response(
-                content=self._create_rate_limit_error(reset_time),
+                content=self._create_rate_limit_error(int(time.time()) + retry_after),
                 status_code=status.HTTP_429_TOO_MANY_REQUESTS,
                 media_type="application/json",
             )
+            response.headers["Retry-After"] = str(retry_after)
         else:
             # 요청 처리
             response = await call_next(request)
 
         # 속도 제한 헤더 추가
-        rate_limit = self.admin_rate_limit if is_admin else self.rate_limit
-        response.headers["X-RateLimit-Limit"] = str(rate_limit)
-        response.headers["X-RateLimit-Remaining"] = str(
-            max(0, rate_limit - current_count)
-        )
-        response.headers["X-RateLimit-Reset"] = str(reset_time)
+        response.headers["X-RateLimit-Limit"] = str(result.limit)
+        response.headers["X-RateLimit-Remaining"] = str(result.remaining)
+        response.headers["X-RateLimit-Reset"] = str(result.reset)
 
         return response
 
@@ -161,9 +174,7 @@ class RateLimiter(BaseHTTPMiddleware):
         # 여기서는 간단히 요청 헤더 확인
         return request.headers.get("X-Admin-Role") == "true"
 
-    async def _check_rate_limit(
-        self, client_id: str, limit: int
-    ) -> Tuple[bool, int, int]:
+    async def _check_rate_limit(self, client_id: str, limit: int) -> RateLimitResult:
         """
         속도 제한 확인
 
@@ -172,52 +183,9 @@ class RateLimiter(BaseHTTPMiddleware):
             limit: 적용할 요청 제한 수
 
         Returns:
-            Tuple[bool, int, int]: (허용 여부, 현재 요청 수, 다음 리셋 시간)
+            RateLimitResult: 허용 여부, 남은 요청 수, 재시도 대기 시간
         """
-        current_time = int(time.time())
-        window_key = f"{current_time // self.window}"
-        rate_key = f"rate:{client_id}:{window_key}"
-
-        if self.redis_client:
-            # Redis 기반 구현
-            return await self._check_rate_limit_redis(rate_key, limit, current_time)
-        else:
-            # 메모리 기반 구현 (간단한 구현)
-            return self._check_rate_limit_memory(rate_key, limit, current_time)
-
-    async def _check_rate_limit_redis(
-        self, rate_key: str, limit: int, current_time: int
-    ) -> Tuple[bool, int, int]:
-        """Redis 기반 속도 제한 확인"""
-        pipeline = self.redis_client.pipeline()
-        pipeline.incr(rate_key)
-        pipeline.expire(rate_key, self.window)
-        results = pipeline.execute()
-
-        count = results[0]
-
-        # 다음 리셋 시간 계산
-        reset_time = current_time + (self.window - (current_time % self.window))
-
-        return count <= limit, count, reset_time
-
-    def _check_rate_limit_memory(
-        self, rate_key: str, limit: int, current_time: int
-    ) -> Tuple[bool, int, int]:
-        """메모리 기반 속도 제한 확인"""
-        # 새 시간 창으로 리셋
-        if current_time >= self._rate_reset_time:
-            self._rate_limits = {}
-            self._rate_reset_time = current_time + self.window
-
-        # 카운트 증가
-        self._rate_limits[rate_key] = self._rate_limits.get(rate_key, 0) + 1
-
-        return (
-            self._rate_limits[rate_key] <= limit,
-            self._rate_limits[rate_key],
-            self._rate_reset_time,
-        )
+        return await self.backend.hit(client_id, limit, self.window)
 
     def _create_rate_limit_error(self, reset_time: int) -> str:
         """속도 제한 오류 응답 생성"""
@@ -0,0 +1,554 @@
+"""
+리마인더 대기열 모듈
+
+리마인더를 엔티티 메타데이터(JSON)에 넣어 두고 전체 행을 스캔하던 방식 대신
+``(status, fire_at)`` 인덱스가 있는 전용 테이블에 저장합니다. 발송 워커는
+``LIMIT`` 으로 발송 시각이 지난 행만 가져와 원자적으로 선점(claim)하므로
+여러 워커가 같은 대기열을 나눠 처리할 수 있습니다.
+
+- PostgreSQL: ``SELECT ... FOR UPDATE SKIP LOCKED`` 로 다른 워커가 잡은 행을 건너뜀
+- 그 외(SQLite 등): ``status = 'pending'`` 조건부 UPDATE 로 한 워커만 선점에 성공
+
+스케줄러 루프는 ``DueTimeQueue`` (발송 시각 기준 힙)로 다음 발송 시각까지 잠들었다가
+깨어나 힙에서 꺼낸 리마인더만 선점합니다.
+
+이 모듈의 함수는 커밋/롤백하지 않습니다. 트랜잭션 경계는 호출 측(리포지토리)이
+정하며, 선점 직후 커밋해야 다른 워커에게 ``processing`` 상태가 보입니다.
+"""
+
+import heapq
+import itertools
+import logging
+import os
+import socket
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Hashable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import and_
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+# 리마인더 상태
+STATUS_PENDING = "pending"
+STATUS_PROCESSING = "processing"
+STATUS_SENT = "sent"
+STATUS_FAILED = "failed"
+STATUS_CANCELLED = "cancelled"
+
+# 한 번에 선점할 기본 리마인더 수
+DEFAULT_CLAIM_LIMIT = 50
+
+# 선점 후 이 시간이 지나도 완료되지 않으면 다시 대기 상태로 되돌림
+DEFAULT_CLAIM_TIMEOUT = timedelta(minutes=5)
+
+
+def _utcnow() -> datetime:
+    """DB 에 저장되는 naive UTC 현재 시각"""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def _naive_utc(value: datetime) -> datetime:
+    """aware datetime 을 naive UTC 로 변환"""
+    if value.tzinfo is not None:
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def default_worker_id() -> str:
+    """호스트 이름과 프로세스 ID 로 만든 워커 식별자"""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def claim_due(
+    db: Session,
+    model: Any,
+    worker_id: str,
+    limit: int = DEFAULT_CLAIM_LIMIT,
+    now: Optional[datetime] = None,
+    time_column: str = "fire_at",
+    ids: Optional[Sequence[Any]] = None,
+    filters: Sequence[Any] = (),
+) -> List[Any]:
+    """
+    발송 시각이 지난 대기 리마인더를 원자적으로 선점 (커밋은 호출 측에서 수행)
+
+    ``model`` 은 ``id``, ``status``, ``claimed_by``, ``claimed_at`` 컬럼과
+    ``time_column`` 발송 시각 컬럼을 가져야 합니다. 선점된 행은 ``processing``
+    상태가 되며 처리 후 ``complete`` / ``fail`` 로 마무리합니다.
+
+    Args:
+        db: 데이터베이스 세션
+        model: 리마인더 모델
+        worker_id: 선점하는 워커 식별자
+        limit: 최대 선점 수
+        now: 기준 시각 (기본값: 현재 UTC)
+        time_column: 발송 시각 컬럼 이름
+        ids: 지정 시 이 ID 중에서만 선점 (``DueTimeQueue`` 에서 꺼낸 항목)
+        filters: 추가 조건 (예: 엔티티 유형)
+
+    Returns:
+        List[Any]: 이 워커가 선점한 리마인더 목록 (발송 시각 순)
+    """
+    fire_at = getattr(model, time_column)
+    now = _naive_utc(now) if now else _utcnow()
+    due = and_(model.status == STATUS_PENDING, fire_at <= now, *filters)
+    if ids is not None:
+        if not ids:
+            return []
+        due = and_(due, model.id.in_(list(ids)))
+
+    candidates = (
+        db.query(model.id)
+        .filter(due)
+        .order_by(fire_at)
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+        .all()
+    )
+    ids = [row[0] for row in candidates]
+    if not ids:
+        return []
+
+    # 조건부 UPDATE: 그 사이 다른 워커가 선점한 행은 갱신되지 않음
+    claimed_at = _utcnow()
+    db.query(model).filter(model.id.in_(ids), due).update(
+        {
+            model.status: STATUS_PROCESSING,
+            model.claimed_by: worker_id,
+            model.claimed_at: claimed_at,
+        },
+        synchronize_session=False,
+    )
+
+    claimed = (
+        db.query(model)
+        .filter(
+            model.id.in_(ids),
+            model.status == STATUS_PROCESSING,
+            model.claimed_by == worker_id,
+            model.claimed_at == claimed_at,
+        )
+        .order_by(fire_at)
+        .all()
+    )
+    logger.debug(f"리마인더 선점: {worker_id} {len(claimed)}/{len(ids)}건")
+    return claimed
+
+
+def release_stale(
+    db: Session,
+    model: Any,
+    timeout: timedelta = DEFAULT_CLAIM_TIMEOUT,
+    now: Optional[datetime] = None,
+    filters: Sequence[Any] = (),
+) -> int:
+    """
+    오래된 선점을 대기 상태로 되돌림 (처리 중 종료된 워커 복구, 커밋은 호출 측에서 수행)
+
+    Args:
+        db: 데이터베이스 세션
+        model: 리마인더 모델
+        timeout: 선점 유효 시간
+        now: 기준 시각 (기본값: 현재 UTC)
+        filters: 추가 조건 (예: 엔티티 유형)
+
+    Returns:
+        int: 되돌린 리마인더 수
+    """
+    now = _naive_utc(now) if now else _utcnow()
+    released = (
+        db.query(model)
+        .filter(
+            model.status == STATUS_PROCESSING,
+            model.claimed_at < now - timeout,
+            *filters,
+        )
+        .update(
+            {
+                model.status: STATUS_PENDING,
+                model.claimed_by: None,
+                model.claimed_at: None,
+            },
+            synchronize_session=False,
+        )
+    )
+    if released:
+        logger.warning(f"만료된 리마인더 선점 {released}건을 대기 상태로 되돌렸습니다.")
+    return released
+
+
+class ReminderQueue:
+    """엔티티 유형별 리마인더 대기열 접근 클래스"""
+
+    def __init__(self, queue_model: Any, entity_type: str):
+        """
+        리마인더 대기열 초기화
+
+        Args:
+            queue_model: ``reminder_queue`` 매핑 모델
+            entity_type: 엔티티 유형 (예: "todo")
+        """
+        self.queue_model = queue_model
+        self.entity_type = entity_type
+
+    @property
+    def _filters(self) -> Tuple[Any, ...]:
+        """현재 엔티티 유형 조건"""
+        return (self.queue_model.entity_type == self.entity_type,)
+
+    def _scope(self, db: Session):
+        """현재 엔티티 유형으로 제한된 리마인더 쿼리"""
+        return db.query(self.queue_model).filter(*self._filters)
+
+    def enqueue(
+        self,
+        db: Session,
+        entity_id: str,
+        fire_at: datetime,
+        reminder_type: str = "notification",
+        payload: Optional[Dict[str, Any]] = None,
+    ) -> Any:
+        """
+        리마인더 등록 (커밋은 호출 측에서 수행)
+
+        Args:
+            db: 데이터베이스 세션
+            entity_id: 엔티티 ID
+            fire_at: 발송 시각
+            reminder_type: 알림 유형
+            payload: 발송 시 함께 전달할 데이터
+
+        Returns:
+            Any: 생성된 대기열 항목
+        """
+        item = self.queue_model(
+            id=str(uuid.uuid4()),
+            entity_type=self.entity_type,
+            entity_id=entity_id,
+            fire_at=_naive_utc(fire_at),
+            status=STATUS_PENDING,
+            reminder_type=reminder_type,
+            payload=payload or {},
+            attempts=0,
+            created_at=_utcnow(),
+        )
+        db.add(item)
+        return item
+
+    def cancel(
+        self, db: Session, reminder_id: str, entity_id: Optional[str] = None
+    ) -> bool:
+        """
+        대기 중인 리마인더 취소 (커밋은 호출 측에서 수행)
+
+        Args:
+            db: 데이터베이스 세션
+            reminder_id: 리마인더 ID
+            entity_id: 지정 시 해당 엔티티의 리마인더만 취소
+
+        Returns:
+            bool: 취소 여부
+        """
+        query = self._scope(db).filter(
+            self.queue_model.id == reminder_id,
+            self.queue_model.status == STATUS_PENDING,
+        )
+        if entity_id is not None:
+            query = query.filter(self.queue_model.entity_id == entity_id)
+        cancelled = query.update(
+            {
+                self.queue_model.status: STATUS_CANCELLED,
+                self.queue_model.processed_at: _utcnow(),
+            },
+            synchronize_session=False,
+        )
+        return cancelled > 0
+
+    def clear(self, db: Session, entity_id: str) -> None:
+        """
+        엔티티의 대기 중인 리마인더 모두 취소 (커밋은 호출 측에서 수행)
+
+        Args:
+            db: 데이터베이스 세션
+            entity_id: 엔티티 ID
+        """
+        self._scope(db).filter(
+            self.queue_model.entity_id == entity_id,
+            self.queue_model.status == STATUS_PENDING,
+        ).update(
+            {
+                self.queue_model.status: STATUS_CANCELLED,
+                self.queue_model.processed_at: _utcnow(),
+            },
+            synchronize_session=False,
+        )
+
+    def pending(
+        self, db: Session, before: datetime, limit: Optional[int] = None
+    ) -> List[Any]:
+        """
+        발송 시각이 지난 대기 리마인더 조회 (선점하지 않음)
+
+        Args:
+            db: 데이터베이스 세션
+            before: 이 시각 이전 리마인더 조회
+            limit: 최대 조회 수
+
+        Returns:
+            List[Any]: 대기열 항목 목록 (발송 시각 순)
+        """
+        query = (
+            self._scope(db)
+            .filter(
+                self.queue_model.status == STATUS_PENDING,
+                self.queue_model.fire_at <= _naive_utc(before),
+            )
+            .order_by(self.queue_model.fire_at)
+        )
+        if limit is not None:
+            query = query.limit(limit)
+        return query.all()
+
+    def upcoming(self, db: Session, until: datetime, limit: int) -> List[Any]:
+        """
+        ``until`` 이전에 발송될 대기 리마인더의 ID 와 발송 시각 조회
+
+        스케줄러가 ``DueTimeQueue`` 를 채울 때 사용합니다.
+
+        Args:
+            db: 데이터베이스 세션
+            until: 조회 기준 시각
+            limit: 최대 조회 수
+
+        Returns:
+            List[Any]: ``(id, fire_at)`` 행 목록
+        """
+        return (
+            db.query(self.queue_model.id, self.queue_model.fire_at)
+            .filter(
+                self.queue_model.status == STATUS_PENDING,
+                self.queue_model.fire_at <= _naive_utc(until),
+                *self._filters,
+            )
+            .order_by(self.queue_model.fire_at)
+            .limit(limit)
+            .all()
+        )
+
+    def claim_due(
+        self,
+        db: Session,
+        worker_id: str,
+        limit: int = DEFAULT_CLAIM_LIMIT,
+        now: Optional[datetime] = None,
+        ids: Optional[Sequence[str]] = None,
+    ) -> List[Any]:
+        """
+        발송 시각이 지난 리마인더 선점 (``claim_due`` 참고, 커밋은 호출 측에서 수행)
+
+        Args:
+            db: 데이터베이스 세션
+            worker_id: 선점하는 워커 식별자
+            limit: 최대 선점 수
+            now: 기준 시각
+            ids: 지정 시 이 ID 중에서만 선점
+
+        Returns:
+            List[Any]: 선점된 대기열 항목 목록
+        """
+        return claim_due(
+            db, self.queue_model, worker_id, limit, now, ids=ids, filters=self._filters
+        )
+
+    def release_stale(
+        self, db: Session, timeout: timedelta = DEFAULT_CLAIM_TIMEOUT
+    ) -> int:
+        """
+        오래된 선점을 대기 상태로 되돌림 (``release_stale`` 참고, 커밋은 호출 측에서 수행)
+
+        Args:
+            db: 데이터베이스 세션
+            timeout: 선점 유효 시간
+
+        Returns:
+            int: 되돌린 리마인더 수
+        """
+        return release_stale(db, self.queue_model, timeout, filters=self._filters)
+
+    def complete(self, db: Session, reminder_ids: List[str]) -> None:
+        """
+        선점한 리마인더를 발송 완료로 표시 (커밋은 호출 측에서 수행)
+
+        Args:
+            db: 데이터베이스 세션
+            reminder_ids: 완료된 리마인더 ID 목록
+        """
+        self._finish(db, reminder_ids, STATUS_SENT)
+
+    def fail(
+        self, db: Session, reminder_ids: List[str], max_attempts: int = 3
+    ) -> None:
+        """
+        발송 실패 처리 (시도 횟수 미만이면 다시 대기 상태로, 커밋은 호출 측에서 수행)
+
+        Args:
+            db: 데이터베이스 세션
+            reminder_ids: 실패한 리마인더 ID 목록
+            max_attempts: 최대 시도 횟수
+        """
+        if not reminder_ids:
+            return
+        model = self.queue_model
+        db.query(model).filter(model.id.in_(reminder_ids)).update(
+            {model.attempts: model.attempts + 1}, synchronize_session=False
+        )
+        retry = model.attempts < max_attempts
+        db.query(model).filter(model.id.in_(reminder_ids), retry).update(
+            {model.status: STATUS_PENDING, model.claimed_by: None, model.claimed_at: None},
+            synchronize_session=False,
+        )
+        self._finish(db, reminder_ids, STATUS_FAILED, only_processing=True)
+
+    def discard(self, db: Session, reminder_ids: List[str]) -> None:
+        """
+        선점했지만 발송 대상이 사라진 리마인더를 취소로 표시 (커밋은 호출 측에서 수행)
+
+        Args:
+            db: 데이터베이스 세션
+            reminder_ids: 취소할 리마인더 ID 목록
+        """
+        self._finish(db, reminder_ids, STATUS_CANCELLED, only_processing=True)
+
+    def _finish(
+        self,
+        db: Session,
+        reminder_ids: List[str],
+        status: str,
+        only_processing: bool = False,
+    ) -> None:
+        """선점된 리마인더의 최종 상태 기록"""
+        if not reminder_ids:
+            return
+        query = db.query(self.queue_model).filter(
+            self.queue_model.id.in_(reminder_ids)
+        )
+        if only_processing:
+            query = query.filter(self.queue_model.status == STATUS_PROCESSING)
+        query.update(
+            {self.queue_model.status: status, self.queue_model.processed_at: _utcnow()},
+            synchronize_session=False,
+        )
+
+
+class DueTimeQueue:
+    """발송 시각 기준 우선순위 큐 (스케줄러용 최소 힙)
+
+    같은 키를 다시 넣거나 제거하면 이전 항목은 무효화되며, 꺼낼 때 건너뜁니다.
+    무효 항목이 유효 항목보다 많아지면 힙을 다시 만들어 메모리를 회수합니다.
+    """
+
+    def __init__(self):
+        self._heap: List[Tuple[datetime, int, Hashable]] = []
+        self._entries: Dict[Hashable, Tuple[datetime, int]] = {}
+        self._counter = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def push(self, key: Hashable, due_at: datetime) -> None:
+        """
+        항목 추가 또는 발송 시각 갱신
+
+        Args:
+            key: 항목 키 (예: 리마인더 ID)
+            due_at: 발송 시각
+        """
+        entry = (_naive_utc(due_at), next(self._counter))
+        self._entries[key] = entry
+        heapq.heappush(self._heap, (entry[0], entry[1], key))
+        self._compact()
+
+    def remove(self, key: Hashable) -> None:
+        """
+        항목 제거 (힙에서는 꺼낼 때 건너뜀)
+
+        Args:
+            key: 제거할 항목 키
+        """
+        self._entries.pop(key, None)
+        self._compact()
+
+    def _compact(self) -> None:
+        """무효 항목이 절반을 넘으면 유효 항목만으로 힙 재구성"""
+        if len(self._heap) <= 2 * len(self._entries) + 64:
+            return
+        self._heap = [
+            (due_at, seq, key) for key, (due_at, seq) in self._entries.items()
+        ]
+        heapq.heapify(self._heap)
+
+    def _prune(self) -> None:
+        """힙 top 의 무효화된 항목 정리"""
+        while self._heap:
+            due_at, seq, key = self._heap[0]
+            if self._entries.get(key) == (due_at, seq):
+                return
+            heapq.heappop(self._heap)
+
+    def next_due(self) -> Optional[datetime]:
+        """
+        가장 이른 발송 시각
+
+        Returns:
+            Optional[datetime]: 비어 있으면 None
+        """
+        self._prune()
+        return self._heap[0][0] if self._heap else None
+
+    def pop_due(
+        self, now: Optional[datetime] = None, limit: Optional[int] = None
+    ) -> List[Hashable]:
+        """
+        발송 시각이 지난 항목을 꺼냄
+
+        Args:
+            now: 기준 시각 (기본값: 현재 UTC)
+            limit: 최대 개수 (기본값: 제한 없음)
+
+        Returns:
+            List[Hashable]: 발송 시각 순 항목 키 목록
+        """
+        now = _naive_utc(now) if now else _utcnow()
+        due = []
+        while limit is None or len(due) < limit:
+            self._prune()
+            if not self._heap or self._heap[0][0] > now:
+                return due
+            _, _, key = heapq.heappop(self._heap)
+            del self._entries[key]
+            due.append(key)
+        return due
+
+    def seconds_until_next(
+        self, default: float, now: Optional[datetime] = None
+    ) -> float:
+        """
+        다음 발송 시각까지 대기할 시간(초)
+
+        Args:
+            default: 큐가 비었거나 다음 시각이 더 늦을 때의 최대 대기 시간
+            now: 기준 시각 (기본값: 현재 UTC)
+
+        Returns:
+            float: 대기 시간(초)
+        """
+        next_due = self.next_due()
+        if next_due is None:
+            return default
+        now = _naive_utc(now) if now else _utcnow()
+        return max(0.0, min(default, (next_due - now).total_seconds()))
@@ -1,15 +1,122 @@
 """
 데이터베이스 복제 관리 모듈
+
+읽기 전용 조회를 복제본(read replica)으로 분산합니다.
+
+- 백그라운드 상태 확인이 복제본마다 복제 지연(lag)과 응답 시간을 측정하고,
+  연속 실패 시 회로 차단기(``CircuitBreaker``)를 열어 일정 시간 제외합니다.
+- 읽기는 지연이 임계값 이하인 복제본 중 ``(진행 중 요청 + 1) × 응답 시간 / 가중치``
+  가 가장 작은 곳으로 보냅니다. 한 번도 확인되지 않은 복제본은 사용하지 않습니다.
+- 쓰기 직후 일정 시간(read-your-writes 창) 동안은 같은 요청 컨텍스트 또는 같은 키
+  (예: 사용자 ID)의 읽기를 주 데이터베이스에 고정합니다. 쓰기는 세션 이벤트
+  (flush, DML 실행, 커밋)로 감지하므로 리포지토리 메서드마다 기록할 필요가 없습니다.
 """
 
 import asyncio
+import contextvars
 import logging
-from typing import Any, Dict, List, Optional, Set
+import time
+from contextlib import asynccontextmanager, suppress
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Dict, List, Optional, Set
+
+from sqlalchemy import event, text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import (AsyncEngine, AsyncSession,
+                                    async_sessionmaker, create_async_engine)
+from sqlalchemy.orm import ORMExecuteState, Session
+from sqlalchemy.sql.elements import TextClause
 
 from packages.api.src.coreconfig import settings
+from packages.api.src.coreresilience import (CircuitBreaker,
+                                             CircuitBreakerConfig,
+                                             CircuitState)
 
 logger = logging.getLogger(__name__)
 
+# PostgreSQL 복제본 지연 (초). 수신한 WAL 을 모두 재생했으면 0
+POSTGRES_LAG_QUERY = """
+SELECT CASE
+    WHEN NOT pg_is_in_recovery() THEN 0
+    WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+    ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+END
+"""
+
+# 상태 확인 주기 (초)
+DEFAULT_HEALTH_CHECK_INTERVAL = 5
+
+# 상태 확인 쿼리 제한 시간 (초)
+DEFAULT_HEALTH_CHECK_TIMEOUT = 2
+
+# 쓰기 후 주 데이터베이스 고정 시간 (초)
+DEFAULT_READ_YOUR_WRITES_WINDOW = 5
+
+# 응답 시간 지수 이동 평균 계수
+LATENCY_EWMA_ALPHA = 0.3
+
+# 세션 ``info`` 키: 커밋 전 쓰기 여부 / read-your-writes 키 (예: 사용자 ID)
+SESSION_WROTE_KEY = "replication_wrote"
+SESSION_PIN_KEY = "read_your_writes_key"
+
+# 요청 컨텍스트별 주 데이터베이스 고정 만료 시각 (monotonic)
+_primary_until: contextvars.ContextVar[float] = contextvars.ContextVar(
+    "replication_primary_until", default=0.0
+)
+
+
+@dataclass
+class ReplicaNode:
+    """복제본 노드 상태"""
+
+    name: str
+    url: str
+    weight: float = 1.0
+    lag_query: Optional[str] = None
+    engine: Optional[AsyncEngine] = None
+    session_factory: Optional[async_sessionmaker] = None
+    breaker: Optional[CircuitBreaker] = None
+    # 마지막 상태 확인 결과 (None: 확인 전)
+    healthy: Optional[bool] = None
+    lag: Optional[float] = None
+    latency: float = 0.0
+    in_flight: int = 0
+    last_checked: float = 0.0
+    last_error: Optional[str] = None
+
+    def score(self) -> float:
+        """부하 점수 (작을수록 우선)"""
+        return (self.in_flight + 1) * max(self.latency, 1e-4) / max(self.weight, 1e-6)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "weight": self.weight,
+            "healthy": bool(self.healthy),
+            "lag": self.lag,
+            "latency_ms": round(self.latency * 1000, 2),
+            "in_flight": self.in_flight,
+            "circuit": self.breaker.state.value if self.breaker else None,
+            "last_error": self.last_error,
+        }
+
+
+def _node_url(node: Dict[str, Any]) -> str:
+    """노드 설정에서 비동기 연결 URL 생성"""
+    if node.get("url"):
+        return node["url"]
+    connection = node.get("connection", {})
+    if isinstance(connection, str):
+        return connection
+    user = connection.get("user", settings.DB_USER)
+    password = connection.get("password", settings.DB_PASSWORD)
+    return (
+        f"postgresql+asyncpg://{user}:{password}@"
+        f"{connection.get('host', settings.DB_HOST)}:"
+        f"{connection.get('port', settings.DB_PORT)}/"
+        f"{connection.get('database', settings.DB_NAME)}"
+    )
+
 
 class ReplicationManager:
     """데이터베이스 복제 관리 클래스"""
@@ -18,22 +125,37 @@ class ReplicationManager:
         """복제 매니저 초기화"""
         self.primary_db = None
         self.replica_dbs = set()
+        self.replicas: Dict[str, ReplicaNode] = {}
         self.logger = logger
         self.replication_lag_threshold = 5  # 초
+        self.read_your_writes_window = DEFAULT_READ_YOUR_WRITES_WINDOW
+        self.health_check_interval = DEFAULT_HEALTH_CHECK_INTERVAL
+        self.health_check_timeout = DEFAULT_HEALTH_CHECK_TIMEOUT
+        self.breaker_config = CircuitBreakerConfig(
+            failure_threshold=3, recovery_timeout=30.0
+        )
         self.config = {}
+        # 키(예: 사용자 ID)별 주 데이터베이스 고정 만료 시각 (창마다 만료 항목 정리)
+        self._recent_writes: Dict[str, float] = {}
+        self._prune_at = 0.0
+        self._watched: Set[Any] = set()
+        self._monitor_task: Optional[asyncio.Task] = None
 
     def initialize(self, config: dict = None) -> bool:
         """
         복제 매니저 구성 초기화
 
         Args:
-            config: 복제 설정 정보
+            config: 복제 설정 정보 (``read_your_writes_window`` 등)
 
         Returns:
             bool: 초기화 성공 여부
         """
         try:
             self.config = config or {}
+            self.read_your_writes_window = self.config.get(
+                "read_your_writes_window", self.read_your_writes_window
+            )
             self.logger.info("복제 매니저 초기화 완료")
             return True
         except Exception as e:
@@ -42,19 +164,27 @@ class ReplicationManager:
 
     def register_nodes(self, nodes: list) -> bool:
         """
-        복제 노드 등록
+        복제 노드 등록 (이미 등록된 노드는 유지)
 
         Args:
-            nodes: 복제 노드 목록
+            nodes: 복제 노드 목록 (``role``, ``weight``, ``url`` 또는 ``connection``,
+                선택적으로 ``name``, ``lag_query``)
 
         Returns:
             bool: 등록 성공 여부
         """
         try:
             for node in nodes:
-                connection_string = node.get("connection", {})
-                if connection_string:
-                    self.replica_dbs.add(str(connection_string))
+                url = _node_url(node)
+                if node.get("role") == "primary":
+                    self.primary_db = url
+                    continue
+                self._add_node(
+                    url,
+                    name=node.get("name"),
+                    weight=float(node.get("weight", 1.0)),
+                    lag_query=node.get("lag_query"),
+                )
 
             self.logger.info(f"복제 노드 등록 완료: {len(self.replica_dbs)}개 노드")
             return True
@@ -62,9 +192,48 @@ class ReplicationManager:
             self.logger.error(f"복제 노드 등록 실패: {str(e)}")
             return False
 
+    def _add_node(
+        self,
+        url: str,
+        name: Optional[str] = None,
+        weight: float = 1.0,
+        lag_query: Optional[str] = None,
+    ) -> ReplicaNode:
+        """복제본 노드 추가 (엔진은 첫 상태 확인 때 생성)"""
+        node = self.replicas.get(url)
+        if node is None:
+            node = ReplicaNode(
+                name=name or url.rsplit("@", 1)[-1],
+                url=url,
+                weight=weight,
+                lag_query=lag_query,
+                breaker=CircuitBreaker(f"replica:{url}", self.breaker_config),
+            )
+            self.replicas[url] = node
+            self.replica_dbs.add(url)
+        return node
+
+    def _ensure_engine(self, node: ReplicaNode) -> None:
+        if node.engine is not None:
+            return
+        options: Dict[str, Any] = {"pool_pre_ping": True}
+        if not node.url.startswith("sqlite"):
+            options.update(
+                pool_size=settings.DB_POOL_SIZE or 5,
+                max_overflow=settings.DB_MAX_OVERFLOW or 10,
+                pool_recycle=1800,
+            )
+        node.engine = create_async_engine(node.url, **options)
+        node.session_factory = async_sessionmaker(
+            node.engine,
+            class_=AsyncSession,
+            expire_on_commit=False,
+            autoflush=False,
+        )
+
     async def add_replica(self, connection_string: str) -> bool:
         """
-        복제본 데이터베이스 추가
+        복제본 데이터베이스 추가 (연결과 복제 지연 확인 후 사용)
 
         Args:
             connection_string: 데이터베이스 연결 문자열
@@ -73,11 +242,14 @@ class ReplicationManager:
             bool: 추가 성공 여부
         """
         try:
-            # 복제본 연결 테스트
-            # TODO: 실제 연결 테스트 구현
-            self.replica_dbs.add(connection_string)
-            self.logger.info(f"복제본 데이터베이스 추가됨: {connection_string}")
-            return True
+            self._add_node(connection_string)
+            if await self._check_replica_health(connection_string):
+                self.logger.info(f"복제본 데이터베이스 추가됨: {connection_string}")
+                return True
+            self.logger.warning(
+                f"복제본 데이터베이스 추가됨 (비정상 상태): {connection_string}"
+            )
+            return False
         except Exception as e:
             self.logger.error(f"복제본 데이터베이스 추가 실패: {str(e)}")
             return False
@@ -94,12 +266,34 @@ class ReplicationManager:
         """
         try:
             self.replica_dbs.discard(connection_string)
+            node = self.replicas.pop(connection_string, None)
+            if node is not None and node.engine is not None:
+                await node.engine.dispose()
             self.logger.info(f"복제본 데이터베이스 제거됨: {connection_string}")
             return True
         except Exception as e:
             self.logger.error(f"복제본 데이터베이스 제거 실패: {str(e)}")
             return False
 
+    def _is_available(self, node: ReplicaNode) -> bool:
+        """읽기 라우팅 대상 여부"""
+        if not node.healthy or node.breaker.state == CircuitState.OPEN:
+            return False
+        return node.lag is not None and node.lag <= self.replication_lag_threshold
+
+    def choose_replica(self) -> Optional[ReplicaNode]:
+        """
+        부하 점수가 가장 낮은 정상 복제본 선택 (I/O 없이 마지막 확인 결과 사용)
+
+        Returns:
+            Optional[ReplicaNode]: 복제본 (없으면 None)
+        """
+        best = None
+        for node in self.replicas.values():
+            if self._is_available(node) and (best is None or node.score() < best.score()):
+                best = node
+        return best
+
     async def get_healthy_replica(self) -> Optional[str]:
         """
         정상 작동하는 복제본 데이터베이스 반환
@@ -107,62 +301,114 @@ class ReplicationManager:
         Returns:
             Optional[str]: 복제본 데이터베이스 연결 문자열
         """
-        for replica in self.replica_dbs:
-            if await self._check_replica_health(replica):
-                return replica
-        return None
+        node = self.choose_replica()
+        return node.url if node else None
+
+    async def _probe(self, node: ReplicaNode) -> float:
+        """복제 지연 조회 (초)"""
+        self._ensure_engine(node)
+        query = node.lag_query
+        if query is None:
+            query = (
+                POSTGRES_LAG_QUERY
+                if node.engine.dialect.name == "postgresql"
+                else "SELECT 0"
+            )
+        async with node.engine.connect() as connection:
+            lag = (await connection.execute(text(query))).scalar()
+        return float(lag or 0)
 
     async def _check_replica_health(self, connection_string: str) -> bool:
         """
         복제본 데이터베이스 상태 확인
 
+        연결 가능 여부, 복제 지연, 응답 시간을 측정합니다. 회로가 열린 동안은
+        데이터베이스에 접속하지 않습니다.
+
         Args:
             connection_string: 데이터베이스 연결 문자열
 
         Returns:
             bool: 정상 작동 여부
         """
+        node = self.replicas.get(connection_string)
+        if node is None:
+            return False
+        started = time.perf_counter()
+
+        async def probe() -> float:
+            return await asyncio.wait_for(self._probe(node), self.health_check_timeout)
+
         try:
-            # TODO: 실제 상태 확인 구현
-            # - 복제 지연 확인
-            # - 연결 상태 확인
-            # - 디스크 공간 확인 등
-            return True
+            lag = await node.breaker.execute(probe)
         except Exception as e:
-            self.logger.error(f"복제본 상태 확인 실패: {str(e)}")
+            node.healthy = False
+            node.last_error = str(e) or type(e).__name__
+            node.last_checked = time.monotonic()
+            self.logger.error(f"복제본 상태 확인 실패 ({node.name}): {node.last_error}")
             return False
 
+        elapsed = time.perf_counter() - started
+        node.latency = (
+            elapsed
+            if not node.latency
+            else LATENCY_EWMA_ALPHA * elapsed + (1 - LATENCY_EWMA_ALPHA) * node.latency
+        )
+        node.lag = lag
+        node.healthy = lag <= self.replication_lag_threshold
+        node.last_error = None if node.healthy else f"복제 지연 {lag:.1f}초"
+        node.last_checked = time.monotonic()
+        return node.healthy
+
+    async def check_all(self) -> int:
+        """
+        모든 복제본 상태를 동시에 확인
+
+        Returns:
+            int: 정상 복제본 수
+        """
+        results = await asyncio.gather(
+            *(self._check_replica_health(url) for url in list(self.replicas))
+        )
+        return sum(results)
+
     async def get_replication_status(self) -> Dict[str, Any]:
         """
-        복제 상태 정보 반환
+        복제 상태 정보 반환 (마지막 상태 확인 결과)
 
         Returns:
             Dict[str, Any]: 복제 상태 정보
         """
-        status = {
+        nodes = [node.to_dict() for node in self.replicas.values()]
+        return {
             "primary": self.primary_db,
             "replicas": list(self.replica_dbs),
-            "healthy_replicas": 0,
+            "healthy_replicas": sum(
+                1 for node in self.replicas.values() if self._is_available(node)
+            ),
             "total_replicas": len(self.replica_dbs),
+            "nodes": nodes,
         }
 
-        for replica in self.replica_dbs:
-            if await self._check_replica_health(replica):
-                status["healthy_replicas"] += 1
-
-        return status
-
     def configure_failover(self, config: Dict[str, Any]) -> bool:
         """
         장애 조치 구성 설정
 
         Args:
-            config: 장애 조치 설정 정보
+            config: 장애 조치 설정 정보 (``failover_timeout`` 은 회로 복구 대기 시간,
+                ``recovery_options.max_retry_attempts`` 는 회로를 여는 연속 실패 수)
 
         Returns:
             bool: 설정 성공 여부
         """
         try:
+            recovery = config.get("recovery_options", {})
+            self.breaker_config.recovery_timeout = float(
+                config.get("failover_timeout", self.breaker_config.recovery_timeout)
+            )
+            self.breaker_config.failure_threshold = int(
+                recovery.get("max_retry_attempts", self.breaker_config.failure_threshold)
+            )
             self.logger.info("장애 조치 설정 완료")
             return True
         except Exception as e:
@@ -174,12 +420,19 @@ class ReplicationManager:
         모니터링 구성 설정
 
         Args:
-            config: 모니터링 설정 정보
+            config: 모니터링 설정 정보 (``sync_lag_threshold``,
+                ``health_check_interval``)
 
         Returns:
             bool: 설정 성공 여부
         """
         try:
+            self.replication_lag_threshold = config.get(
+                "sync_lag_threshold", self.replication_lag_threshold
+            )
+            self.health_check_interval = config.get(
+                "health_check_interval", self.health_check_interval
+            )
             self.logger.info("모니터링 설정 완료")
             return True
         except Exception as e:
@@ -187,20 +440,170 @@ class ReplicationManager:
             return False
 
     async def monitor_replication(self) -> None:
-        """복제 상태 모니터링"""
+        """복제 상태 모니터링 (주기적으로 모든 복제본 상태 확인)"""
         while True:
             try:
-                status = await self.get_replication_status()
-                if status["healthy_replicas"] < status["total_replicas"]:
+                healthy = await self.check_all()
+                if healthy < len(self.replicas):
                     self.logger.warning(
                         f"일부 복제본이 비정상 상태입니다: "
-                        f"{status['healthy_replicas']}/{status['total_replicas']}"
+                        f"{healthy}/{len(self.replicas)}"
                     )
             except Exception as e:
                 self.logger.error(f"복제 모니터링 중 오류 발생: {str(e)}")
 
-            await asyncio.sleep(60)  # 1분마다 확인
+            await asyncio.sleep(self.health_check_interval)
+
+    async def start(self) -> None:
+        """백그라운드 상태 확인 시작"""
+        if self._monitor_task is None and self.replicas:
+            self._monitor_task = asyncio.create_task(self.monitor_replication())
+
+    async def stop(self) -> None:
+        """백그라운드 상태 확인 중지 및 복제본 엔진 정리"""
+        if self._monitor_task is not None:
+            self._monitor_task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._monitor_task
+            self._monitor_task = None
+        for node in self.replicas.values():
+            if node.engine is not None:
+                await node.engine.dispose()
+                node.engine = None
+                node.session_factory = None
+            node.healthy = None
+
+    def mark_write(self, key: Optional[str] = None) -> None:
+        """
+        쓰기 기록 (read-your-writes 창 동안 읽기를 주 데이터베이스에 고정)
+
+        Args:
+            key: 요청을 넘어 고정할 키 (예: 사용자 ID). None 이면 현재 컨텍스트만
+        """
+        now = time.monotonic()
+        until = now + self.read_your_writes_window
+        _primary_until.set(until)
+        if key is not None:
+            self._recent_writes[key] = until
+        if now >= self._prune_at:
+            self._prune_recent_writes(now)
+
+    def _prune_recent_writes(self, now: float) -> None:
+        """만료된 키 정리 (창마다 한 번, 키 수는 창 동안 쓰기한 키로 제한)"""
+        self._recent_writes = {
+            key: until for key, until in self._recent_writes.items() if until > now
+        }
+        self._prune_at = now + self.read_your_writes_window
+
+    def watch_writes(self, target: Any = Session) -> None:
+        """
+        세션 쓰기 이벤트 감시 등록 (flush, DML 실행, 커밋 시 ``mark_write``)
+
+        세션 ``info`` 에 ``read_your_writes_key`` 가 있으면 그 키로도 고정합니다.
+
+        Args:
+            target: 이벤트를 등록할 세션 클래스 또는 sessionmaker (기본값: 모든 세션)
+        """
+        if target in self._watched:
+            return
+        event.listen(target, "do_orm_execute", self._on_execute)
+        event.listen(target, "after_flush", self._on_flush)
+        event.listen(target, "after_commit", self._on_commit)
+        event.listen(target, "after_rollback", self._on_rollback)
+        self._watched.add(target)
+
+    def _record_write(self, session: Session) -> None:
+        session.info[SESSION_WROTE_KEY] = True
+        self.mark_write(session.info.get(SESSION_PIN_KEY))
+
+    def _on_execute(self, state: ORMExecuteState) -> None:
+        statement = state.statement
+        if isinstance(statement, TextClause):
+            # 텍스트 SQL 은 SELECT 로 시작하지 않으면 쓰기로 간주
+            writes = not statement.text.lstrip().upper().startswith("SELECT")
+        else:
+            writes = state.is_insert or state.is_update or state.is_delete
+        if writes:
+            self._record_write(state.session)
+
+    def _on_flush(self, session: Session, flush_context: Any) -> None:
+        self._record_write(session)
+
+    def _on_commit(self, session: Session) -> None:
+        # 창은 커밋 시점부터 다시 계산
+        if session.info.pop(SESSION_WROTE_KEY, False):
+            self.mark_write(session.info.get(SESSION_PIN_KEY))
+
+    def _on_rollback(self, session: Session) -> None:
+        session.info.pop(SESSION_WROTE_KEY, None)
+
+    def is_pinned_to_primary(self, key: Optional[str] = None) -> bool:
+        """
+        주 데이터베이스 고정 여부
+
+        Args:
+            key: 쓰기 시 사용한 키
+
+        Returns:
+            bool: 고정 여부
+        """
+        now = time.monotonic()
+        if _primary_until.get() > now:
+            return True
+        if key is None:
+            return False
+        until = self._recent_writes.get(key)
+        if until is None:
+            return False
+        if until <= now:
+            # 만료된 키는 조회 시 정리
+            self._recent_writes.pop(key, None)
+            return False
+        return True
+
+    @asynccontextmanager
+    async def read_session(
+        self, primary: AsyncSession, key: Optional[str] = None
+    ) -> AsyncIterator[AsyncSession]:
+        """
+        읽기 전용 세션 (정상 복제본이 없거나 주 데이터베이스 고정 중이면 ``primary``)
+
+        복제본 세션에서 읽은 ORM 객체는 세션 종료 후 분리(detached) 상태이므로
+        호출 측에서 ``primary.merge(obj, load=False)`` 로 주 세션에 연결해 반환합니다.
+
+        Args:
+            primary: 주 데이터베이스 세션 (대체 세션)
+            key: read-your-writes 키 (예: 사용자 ID)
+
+        Yields:
+            AsyncSession: 읽기 세션
+        """
+        node = None if self.is_pinned_to_primary(key) else self.choose_replica()
+        if node is None or node.session_factory is None:
+            yield primary
+            return
+
+        node.in_flight += 1
+        try:
+            async with node.session_factory() as session:
+                yield session
+        except DBAPIError as e:
+            if e.connection_invalidated or isinstance(e.orig, OSError):
+                # 연결 오류: 다음 상태 확인 전까지 라우팅에서 제외
+                node.healthy = False
+                node.last_error = str(e)
+            raise
+        finally:
+            node.in_flight -= 1
+
+    def replica_urls_from_settings(self) -> List[str]:
+        """설정(``DB_REPLICA_URLS``)의 복제본 URL 목록"""
+        urls = getattr(settings, "DB_REPLICA_URLS", None) or []
+        if isinstance(urls, str):
+            urls = [url.strip() for url in urls.split(",")]
+        return [url for url in urls if url]
 
 
 # 전역 복제 매니저 인스턴스
 replication_manager = ReplicationManager()
+replication_manager.watch_writes()
@@ -0,0 +1,332 @@
+"""
+라우트 템플릿 기반 요청 메트릭 모듈
+
+요청 경로(``/vehicles/123``) 대신 매칭된 라우트 템플릿(``/vehicles/{vehicle_id}``)을
+레이블로 사용해 시계열 수를 라우트 수로 제한합니다.
+
+- 요청마다 ``.labels()`` 를 호출하지 않고, 워커(프로세스)별 일반 딕셔너리에
+  건수와 히스토그램 버킷 값을 누적합니다. 이벤트 루프 스레드에서만 갱신하므로
+  잠금이 필요 없습니다.
+- ``flush()`` 가 주기적으로 누적값을 한 번에 Prometheus 메트릭에 반영하며,
+  레이블 자식 객체는 키별로 한 번만 만들어 재사용합니다.
+- ``PROMETHEUS_MULTIPROC_DIR`` 이 설정된 경우 prometheus_client 가 워커별 파일에
+  값을 기록하고, ``exposition_registry()`` 가 모든 워커 값을 합산해 노출합니다.
+- 메트릭 기록 자체에 든 시간(``http_route_metrics_overhead_seconds_total``)을 함께
+  남겨 요청당 오버헤드를 확인할 수 있습니다.
+"""
+
+import asyncio
+import logging
+import os
+import time
+from bisect import bisect_left
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from prometheus_client import REGISTRY, CollectorRegistry, Counter, Histogram
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+# 라우트에 매칭되지 않은 요청(404 등)의 레이블
+UNMATCHED_ROUTE = "<unmatched>"
+
+# 표준 외 메서드의 레이블
+OTHER_METHOD = "OTHER"
+
+# 미들웨어가 기록 중인 요청 표시 (데코레이터 중복 기록 방지)
+SCOPE_KEY = "route_metrics"
+
+# 기본 반영 주기 (초)
+DEFAULT_FLUSH_INTERVAL = 1.0
+
+_METHODS = frozenset(
+    {"GET", "HEAD", "POST", "PUT", "PATCH", "DELETE", "OPTIONS", "TRACE", "CONNECT"}
+)
+
+
+def route_template(scope: Scope) -> str:
+    """
+    요청에 매칭된 라우트 템플릿
+
+    Args:
+        scope: ASGI 스코프 (라우팅 이후)
+
+    Returns:
+        str: 라우트 템플릿 (매칭되지 않았으면 ``UNMATCHED_ROUTE``)
+    """
+    route = scope.get("route")
+    if route is None:
+        return UNMATCHED_ROUTE
+    return getattr(route, "path_format", None) or getattr(
+        route, "path", UNMATCHED_ROUTE
+    )
+
+
+def exposition_registry(registry: CollectorRegistry = REGISTRY) -> CollectorRegistry:
+    """
+    노출용 레지스트리
+
+    멀티프로세스 모드(``PROMETHEUS_MULTIPROC_DIR``)에서는 모든 워커 값을 합산하는
+    레지스트리를, 아니면 전달된 레지스트리를 반환합니다.
+
+    Args:
+        registry: 단일 프로세스 모드에서 사용할 레지스트리
+
+    Returns:
+        CollectorRegistry: 노출용 레지스트리
+    """
+    if not os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        return registry
+    from prometheus_client import multiprocess
+
+    merged = CollectorRegistry()
+    multiprocess.MultiProcessCollector(merged)
+    return merged
+
+
+class RouteMetrics:
+    """라우트 템플릿별 요청 수/처리 시간 메트릭"""
+
+    def __init__(
+        self,
+        registry: Optional[CollectorRegistry] = REGISTRY,
+        buckets: Sequence[float] = Histogram.DEFAULT_BUCKETS,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+    ):
+        """
+        메트릭 초기화
+
+        Args:
+            registry: 메트릭을 등록할 레지스트리
+            buckets: 처리 시간 히스토그램 버킷 (초)
+            flush_interval: 누적값 반영 주기 (초)
+        """
+        self.requests_total = Counter(
+            "http_route_requests_total",
+            "HTTP requests by route template",
+            ["method", "route", "status"],
+            registry=registry,
+        )
+        self.request_duration = Histogram(
+            "http_route_request_duration_seconds",
+            "HTTP request duration by route template",
+            ["method", "route"],
+            buckets=buckets,
+            registry=registry,
+        )
+        self.overhead_seconds = Counter(
+            "http_route_metrics_overhead_seconds_total",
+            "Time spent recording route metrics",
+            registry=registry,
+        )
+        self.flush_interval = flush_interval
+        # 히스토그램과 같은 상한 목록 (+Inf 포함)
+        self._upper_bounds: List[float] = [float(b) for b in buckets]
+        if self._upper_bounds[-1] != float("inf"):
+            self._upper_bounds.append(float("inf"))
+
+        # 워커별 누적값 (flush 시 새 딕셔너리로 교체)
+        self._counts: Dict[Tuple[str, str, int], int] = {}
+        # (메서드, 라우트) -> [버킷별 건수..., 합계]
+        self._observations: Dict[Tuple[str, str], List[float]] = {}
+        self._overhead = 0.0
+        self._observed = 0
+
+        # 레이블 자식 캐시
+        self._counter_children: Dict[Tuple[str, str, int], Any] = {}
+        self._histogram_children: Dict[Tuple[str, str], Any] = {}
+
+        self._task: Optional[asyncio.Task] = None
+        self._total_overhead = 0.0
+        self._total_observed = 0
+
+    def observe(self, method: str, route: str, status: int, duration: float) -> None:
+        """
+        요청 기록 (이벤트 루프 스레드에서 호출)
+
+        Args:
+            method: HTTP 메서드
+            route: 라우트 템플릿
+            status: 응답 상태 코드
+            duration: 처리 시간 (초)
+        """
+        if method not in _METHODS:
+            method = OTHER_METHOD
+        key = (method, route, status)
+        counts = self._counts
+        counts[key] = counts.get(key, 0) + 1
+
+        route_key = (method, route)
+        acc = self._observations.get(route_key)
+        if acc is None:
+            acc = self._observations[route_key] = [0] * (len(self._upper_bounds) + 1)
+        acc[bisect_left(self._upper_bounds, duration)] += 1
+        acc[-1] += duration
+
+    def observe_scope(self, scope: Scope, status: int, duration: float) -> None:
+        """
+        ASGI 스코프 기준 요청 기록 (기록 시간을 오버헤드로 누적)
+
+        Args:
+            scope: ASGI 스코프 (라우팅 이후)
+            status: 응답 상태 코드
+            duration: 처리 시간 (초)
+        """
+        started = time.perf_counter()
+        self.observe(scope.get("method", "GET"), route_template(scope), status, duration)
+        self._overhead += time.perf_counter() - started
+        self._observed += 1
+
+    def observe_handler(self, scope: Scope, status: int, duration: float) -> None:
+        """
+        핸들러 데코레이터용 기록 (미들웨어가 기록하는 요청은 건너뜀)
+
+        Args:
+            scope: ASGI 스코프
+            status: 응답 상태 코드
+            duration: 핸들러 실행 시간 (초)
+        """
+        if scope.get(SCOPE_KEY):
+            return
+        self.observe_scope(scope, status, duration)
+
+    def _counter_child(self, key: Tuple[str, str, int]):
+        child = self._counter_children.get(key)
+        if child is None:
+            method, route, status = key
+            child = self._counter_children[key] = self.requests_total.labels(
+                method=method, route=route, status=str(status)
+            )
+        return child
+
+    def _histogram_child(self, key: Tuple[str, str]):
+        child = self._histogram_children.get(key)
+        if child is None:
+            method, route = key
+            child = self._histogram_children[key] = self.request_duration.labels(
+                method=method, route=route
+            )
+        return child
+
+    def flush(self) -> int:
+        """
+        누적값을 Prometheus 메트릭에 반영
+
+        Returns:
+            int: 반영한 요청 수
+        """
+        counts, self._counts = self._counts, {}
+        observations, self._observations = self._observations, {}
+        overhead, self._overhead = self._overhead, 0.0
+        observed, self._observed = self._observed, 0
+
+        for key, count in counts.items():
+            self._counter_child(key).inc(count)
+        for key, acc in observations.items():
+            child = self._histogram_child(key)
+            # observe() 를 건수만큼 반복하지 않고 버킷별 증가분을 한 번에 더함
+            for index, count in enumerate(acc[:-1]):
+                if count:
+                    child._buckets[index].inc(count)
+            child._sum.inc(acc[-1])
+        if overhead:
+            self.overhead_seconds.inc(overhead)
+        self._total_overhead += overhead
+        self._total_observed += observed
+        return sum(counts.values())
+
+    async def _flush_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error(f"요청 메트릭 반영 실패: {str(e)}")
+
+    def start(self, flush_interval: Optional[float] = None) -> None:
+        """
+        주기적 반영 태스크 시작 (이미 실행 중이면 무시)
+
+        Args:
+            flush_interval: 반영 주기 (초, 기본값: 생성 시 지정한 값)
+        """
+        if flush_interval is not None:
+            self.flush_interval = flush_interval
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._flush_loop())
+
+    async def stop(self) -> None:
+        """반영 태스크 중지 후 남은 누적값 반영"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self.flush()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        메트릭 상태
+
+        Returns:
+            Dict[str, Any]: 라우트 수, 반영 대기 요청 수, 요청당 평균 기록 오버헤드
+        """
+        observed = self._total_observed + self._observed
+        overhead = self._total_overhead + self._overhead
+        return {
+            "routes": len(self._histogram_children),
+            "pending": sum(self._counts.values()),
+            "observed": observed,
+            "overhead_us_per_request": (
+                overhead / observed * 1_000_000 if observed else 0.0
+            ),
+        }
+
+
+class RouteMetricsMiddleware:
+    """라우트 템플릿별 요청 메트릭 ASGI 미들웨어"""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        metrics: Optional[RouteMetrics] = None,
+        exclude_paths: Sequence[str] = ("/metrics",),
+    ):
+        """
+        미들웨어 초기화
+
+        Args:
+            app: ASGI 애플리케이션
+            metrics: 기록할 메트릭 (기본값: 전역 ``route_metrics``)
+            exclude_paths: 기록하지 않을 경로
+        """
+        self.app = app
+        self.metrics = metrics or route_metrics
+        self.exclude_paths = frozenset(exclude_paths)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] in self.exclude_paths:
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        # 라우터는 같은 스코프 딕셔너리에 매칭된 route 를 기록함
+        scope[SCOPE_KEY] = True
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            self.metrics.observe_scope(scope, status, time.perf_counter() - started)
+
+
+# 전역 요청 메트릭 인스턴스
+route_metrics = RouteMetrics()
@@ -10,6 +10,7 @@ import logging
 import time
 from typing import Any, Callable, Dict, List, Optional, Set, TypeVar, Union
 
+from packages.api.src.coreexecutor_pools import ExecutorPools
 from packages.api.src.coreparallel_processor import (
     AsyncQueryBatcher,
     DataBatcher,
@@ -45,6 +46,7 @@ class ResilientParallelProcessor(ParallelProcessor):
         circuit_breaker_enabled: bool = True,
         failure_threshold: int = 5,
         recovery_timeout: float = 30.0,
+        pools: Optional[ExecutorPools] = None,
     ):
         """
         ResilientParallelProcessor 초기화
@@ -57,8 +59,9 @@ class ResilientParallelProcessor(ParallelProcessor):
             circuit_breaker_enabled: 회로 차단기 활성화 여부
             failure_threshold: 회로 차단기 실패 임계값
             recovery_timeout: 회로 차단기 회복 시간
+            pools: 사용할 실행기 풀 묶음 (기본값: 전역 공유 풀)
         """
-        super().__init__(max_workers, use_process_pool)
+        super().__init__(max_workers, use_process_pool, pools)
         self.max_retries = max_retries
         self.retry_delay = retry_delay
         self.circuit_breaker_enabled = circuit_breaker_enabled
@@ -109,8 +112,9 @@ class ResilientParallelProcessor(ParallelProcessor):
                     else None
                 ),
             )
-            async def resilient_task():
-                return task()
+            async def resilient_task(task=task):
+                # 코루틴 함수는 직접 await, 동기 함수는 재시도마다 공유 I/O 풀에서 실행
+                return await self._run_task(self.pools.io, task)
 
             resilient_tasks[key] = resilient_task
 
@@ -163,6 +167,7 @@ class ResilientDataBatcher(DataBatcher):
         circuit_breaker_enabled: bool = True,
         failure_threshold: int = 5,
         recovery_timeout: float = 30.0,
+        pools: Optional[ExecutorPools] = None,
     ):
         """
         ResilientDataBatcher 초기화
@@ -174,8 +179,9 @@ class ResilientDataBatcher(DataBatcher):
             circuit_breaker_enabled: 회로 차단기 활성화 여부
             failure_threshold: 회로 차단기 실패 임계값
             recovery_timeout: 회로 차단기 회복 시간
+            pools: 사용할 실행기 풀 묶음 (기본값: 전역 공유 풀)
         """
-        super().__init__(batch_size)
+        super().__init__(batch_size, pools)
         self.max_retries = max_retries
         self.retry_delay = retry_delay
         self.circuit_breaker_enabled = circuit_breaker_enabled
@@ -214,6 +220,7 @@ class ResilientDataBatcher(DataBatcher):
             circuit_breaker_enabled=self.circuit_breaker_enabled,
             failure_threshold=self.failure_threshold,
             recovery_timeout=self.recovery_timeout,
+            pools=self.pools,
         )
 
         # 각 배치에 대한 작업 생성
@@ -27,6 +27,16 @@ class PaginationInfo(BaseModel):
     has_prev: bool
 
 
+class CursorPaginationInfo(BaseModel):
+    """커서 기반 페이지네이션 정보"""
+
+    limit: int
+    next_cursor: Optional[str] = None
+    has_next: bool
+    total_items: Optional[int] = None
+    total_is_estimate: bool = False
+
+
 class ErrorDetail(BaseModel):
     """오류 상세 정보"""
 
@@ -51,7 +61,7 @@ class ApiResponse(BaseModel, Generic[T]):
     data: Optional[T] = None
     error: Optional[ErrorDetail] = None
     meta: Meta = Field(default_factory=Meta)
-    pagination: Optional[PaginationInfo] = None
+    pagination: Optional[Union[PaginationInfo, CursorPaginationInfo]] = None
 
 
 class ApiListResponse(ApiResponse[List[T]], Generic[T]):
@@ -64,7 +74,7 @@ class ApiListResponse(ApiResponse[List[T]], Generic[T]):
 def success_response(
     data: Any,
     status_code: int = status.HTTP_200_OK,
-    pagination: Optional[PaginationInfo] = None,
+    pagination: Optional[Union[PaginationInfo, CursorPaginationInfo]] = None,
     headers: Optional[Dict[str, str]] = None,
 ) -> JSONResponse:
     """성공 응답을 반환합니다."""
@@ -136,3 +146,14 @@ def pagination_info(page: int, page_size: int, total_items: int) -> PaginationIn
         has_next=page < total_pages,
         has_prev=page > 1,
     )
+
+
+def cursor_pagination_info(page: Any) -> CursorPaginationInfo:
+    """커서 페이지 결과로 페이지네이션 정보를 생성합니다."""
+    return CursorPaginationInfo(
+        limit=page.limit,
+        next_cursor=page.next_cursor,
+        has_next=page.has_next,
+        total_items=page.total,
+        total_is_estimate=page.total_is_estimate,
+    )
@@ -4,6 +4,7 @@
 
 import os
 import re
+import time
 import uuid
 from datetime import datetime, timedelta, timezone
 from enum import Enum
@@ -32,6 +33,15 @@ from packages.api.src.coremetrics import (record_token_blacklisted,
                                           record_token_refreshed)
 from packages.api.src.coremetrics_collector import metrics_collector
 from packages.api.src.coremodels.token import TokenPayload
+from packages.api.src.corepassword_hashing import (PasswordHasher,
+                                                   PasswordHasherOverloaded,
+                                                   password_hasher)
+from packages.api.src.coresession_store import (SESSION_KEY_PREFIX,
+                                                RedisSessionStore, SessionStore,
+                                                create_session_store)
+from packages.api.src.coretoken_cache import (VerifiedTokenCache,
+                                              token_revocation_bus,
+                                              verified_token_cache)
 
 # 로거 설정
 logger = structlog.get_logger()
@@ -45,6 +55,8 @@ def get_password_hash(password: str) -> str:
     """
     비밀번호를 해시화합니다.
 
+    이벤트 루프를 막으므로 요청 처리 중에는 ``password_hasher.hash`` 를 사용합니다.
+
     Args:
         password: 해시화할 비밀번호
 
@@ -54,7 +66,7 @@ def get_password_hash(password: str) -> str:
     # return pwd_context.hash(password)
     # 직접 bcrypt 사용
     password_bytes = password.encode("utf-8")
-    salt = bcrypt.gensalt()
+    salt = bcrypt.gensalt(password_hasher.rounds)
     hashed_password = bcrypt.hashpw(password_bytes, salt)
     return hashed_password.decode("utf-8")
 
@@ -63,6 +75,8 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
     비밀번호를 검증합니다.
 
+    이벤트 루프를 막으므로 요청 처리 중에는 ``password_hasher.verify`` 를 사용합니다.
+
     Args:
         plain_password: 검증할 비밀번호
         hashed_password: 해시화된 비밀번호
@@ -83,6 +97,9 @@ async def authenticate_user(
     """
     사용자를 인증합니다.
 
+    비밀번호 검증은 해시 전용 풀에서 실행되며, 저장된 해시의 cost 가 현재 설정과
+    다르면 새 해시로 교체합니다.
+
     Args:
         username: 사용자 이름
         password: 비밀번호
@@ -90,12 +107,21 @@ async def authenticate_user(
 
     Returns:
         Optional[User]: 인증된 사용자 객체 또는 None
+
+    Raises:
+        PasswordHasherOverloaded: 해시 대기열이 가득 찬 경우
     """
     user = db.query(User).filter(User.username == username).first()
     if not user:
         return None
-    if not verify_password(password, user.hashed_password):
+    valid, new_hash = await password_hasher.verify_and_update(
+        password, user.hashed_password
+    )
+    if not valid:
         return None
+    if new_hash:
+        user.hashed_password = new_hash
+        db.commit()
     return user
 
 
@@ -282,16 +308,39 @@ class TokenValidationError(Exception):
 
 
 class SessionManager:
-    """세션 관리 클래스"""
+    """세션 관리 클래스
+
+    세션은 ``SessionStore`` 에 jti 단위로 원자적으로 추가/제거됩니다
+    (Redis 가 있으면 만료 시각을 점수로 하는 정렬 집합, 없으면 공유 메모리 저장소).
+    """
 
-    def __init__(self, cache_manager: CacheManager):
+    def __init__(
+        self, cache_manager: CacheManager, store: Optional[SessionStore] = None
+    ):
         self.cache_manager = cache_manager
+        self.store = store or create_session_store(
+            getattr(cache_manager, "redis_client", None)
+        )
         self.logger = logger.bind(service="session_manager")
         self.metrics = security_metrics
 
     def get_cache_key(self, user_id: str) -> str:
         """세션 캐시 키 생성"""
-        return f"app:session:{user_id}"
+        return f"{SESSION_KEY_PREFIX}:{user_id}"
+
+    def add_session_check(self, pipeline: Any, user_id: str, token_jti: str) -> None:
+        """세션 확인 명령(ZSCORE)을 Redis 파이프라인에 추가"""
+        pipeline.zscore(self.get_cache_key(user_id), token_jti)
+
+    def parse_session_check(self, raw: Any, token_jti: str) -> bool:
+        """파이프라인 결과(세션 만료 시각)에서 세션 유효 여부 판단"""
+        return RedisSessionStore.parse_check(raw)
+
+    def _publish_revocation(self, message: Dict[str, Any]) -> None:
+        """세션 무효화를 검증 토큰 캐시에 전파"""
+        token_revocation_bus.publish(
+            getattr(self.cache_manager, "redis_client", None), message
+        )
 
     def create_session(
         self, user_id: str, token_jti: str, expires_in: int
@@ -299,21 +348,11 @@ class SessionManager:
         """세션 생성"""
         try:
             with self.metrics.token_operations.labels("create_session").time():
-                cache_key = self.get_cache_key(user_id)
-                active_sessions = self.cache_manager.get(cache_key) or set()
-
-                if isinstance(active_sessions, str):
-                    active_sessions = {active_sessions}
-
-                active_sessions.add(token_jti)
-                success = self.cache_manager.set(cache_key, active_sessions, expires_in)
-
-                if success:
-                    self.logger.info(
-                        "session_created", user_id=user_id, token_jti=token_jti
-                    )
-                    return Result.ok(True)
-                return Result.fail("세션 생성 실패")
+                self.store.add(str(user_id), token_jti, time.time() + expires_in)
+                self.logger.info(
+                    "session_created", user_id=user_id, token_jti=token_jti
+                )
+                return Result.ok(True)
 
         except Exception as e:
             self.logger.error("session_creation_failed", error=str(e), user_id=user_id)
@@ -323,18 +362,7 @@ class SessionManager:
         """세션 유효성 검증"""
         try:
             with self.metrics.token_operations.labels("validate_session").time():
-                cache_key = self.get_cache_key(user_id)
-                active_sessions = self.cache_manager.get(cache_key)
-
-                if not active_sessions:
-                    return Result.fail("세션이 존재하지 않습니다")
-
-                if isinstance(active_sessions, str):
-                    active_sessions = {active_sessions}
-
-                is_valid = token_jti in active_sessions
-
-                if not is_valid:
+                if not self.store.contains(str(user_id), token_jti):
                     self.logger.warning(
                         "invalid_session", user_id=user_id, token_jti=token_jti
                     )
@@ -348,30 +376,26 @@ class SessionManager:
             )
             return Result.fail(f"세션 검증 중 오류 발생: {str(e)}")
 
+    def get_active_sessions(self, user_id: str) -> Result[List[str]]:
+        """만료되지 않은 세션 목록 조회"""
+        try:
+            return Result.ok(self.store.active(str(user_id)))
+        except Exception as e:
+            self.logger.error("session_list_failed", error=str(e), user_id=user_id)
+            return Result.fail(f"세션 조회 중 오류 발생: {str(e)}")
+
     def invalidate_session(self, user_id: str, token_jti: str) -> Result[bool]:
-        """세션 무효화"""
+        """세션 무효화 (이미 없는 세션이면 그대로 성공)"""
         try:
             with self.metrics.token_operations.labels("invalidate_session").time():
-                cache_key = self.get_cache_key(user_id)
-                active_sessions = self.cache_manager.get(cache_key)
+                removed = self.store.remove(str(user_id), token_jti)
+                self._publish_revocation({"jti": token_jti})
 
-                if not active_sessions:
-                    return Result.ok(True)  # 이미 세션이 없음
-
-                if isinstance(active_sessions, str):
-                    active_sessions = {active_sessions}
-
-                if token_jti in active_sessions:
-                    active_sessions.remove(token_jti)
-                    success = self.cache_manager.set(cache_key, active_sessions)
-
-                    if success:
-                        self.logger.info(
-                            "session_invalidated", user_id=user_id, token_jti=token_jti
-                        )
-                        return Result.ok(True)
-
-                return Result.fail("세션 무효화 실패")
+                if removed:
+                    self.logger.info(
+                        "session_invalidated", user_id=user_id, token_jti=token_jti
+                    )
+                return Result.ok(True)
 
         except Exception as e:
             self.logger.error(
@@ -383,14 +407,10 @@ class SessionManager:
         """모든 세션 무효화"""
         try:
             with self.metrics.token_operations.labels("invalidate_all_sessions").time():
-                cache_key = self.get_cache_key(user_id)
-                success = self.cache_manager.delete(cache_key)
-
-                if success:
-                    self.logger.info("all_sessions_invalidated", user_id=user_id)
-                    return Result.ok(True)
-
-                return Result.fail("모든 세션 무효화 실패")
+                self.store.remove_all(str(user_id))
+                self._publish_revocation({"sub": str(user_id)})
+                self.logger.info("all_sessions_invalidated", user_id=user_id)
+                return Result.ok(True)
 
         except Exception as e:
             self.logger.error(
@@ -413,12 +433,35 @@ class TokenManager:
         TokenType.BACKUP: lambda: timedelta(minutes=15),  # 백업 코드는 15분만 유효
     }
 
-    def __init__(self, cache_manager: CacheManager, session_manager: SessionManager):
+    def __init__(
+        self,
+        cache_manager: CacheManager,
+        session_manager: SessionManager,
+        token_cache: Optional[VerifiedTokenCache] = None,
+    ):
         self.cache_manager = cache_manager
         self.session_manager = session_manager
+        self.token_cache = token_cache or verified_token_cache
         self.logger = logger.bind(service="token_manager")
         self.metrics = security_metrics
 
+    @property
+    def redis_client(self) -> Optional[Any]:
+        """파이프라인용 동기 Redis 클라이언트 (없으면 None)"""
+        return getattr(self.cache_manager, "redis_client", None)
+
+    def _blacklist_key(self, jti: str) -> str:
+        return f"{CacheKeyPrefix.TOKEN_BLACKLIST.value}{jti}"
+
+    def _token_cache_enabled(self) -> bool:
+        """
+        검증 토큰 캐시 사용 여부
+
+        Redis 를 쓰는 경우 무효화 구독 중일 때만 사용합니다 (다른 워커의 무효화를
+        받지 못하는 동안에는 캐시하지 않음).
+        """
+        return self.redis_client is None or token_revocation_bus.listening
+
     def create_payload(
         self,
         subject: Union[str, Any],
@@ -538,9 +581,26 @@ class TokenManager:
         validate_claims: bool = True,
         validate_session: bool = True,
     ) -> Result[Dict[str, Any]]:
-        """토큰 검증"""
+        """
+        토큰 검증
+
+        전체 검증(클레임 + 세션)을 통과한 토큰은 ``jti`` 기준으로 잠시 캐시되어,
+        같은 토큰의 다음 요청은 디코딩과 Redis 조회 없이 처리됩니다.
+        """
         try:
             with self.metrics.token_operations.labels("verify_token").time():
+                use_cache = (
+                    validate_claims and validate_session and self._token_cache_enabled()
+                )
+                if use_cache:
+                    cached = self._get_cached_claims(token)
+                    if cached is not None:
+                        if expected_type and cached["token_type"] != expected_type:
+                            return Result.fail(
+                                f"잘못된 토큰 타입: {cached['token_type']}"
+                            )
+                        return Result.ok(cached)
+
                 # 토큰 디코딩
                 decode_result = self.decode_token(token)
                 if not decode_result.success:
@@ -558,24 +618,72 @@ class TokenManager:
                 if expected_type and payload["token_type"] != expected_type:
                     return Result.fail(f"잘못된 토큰 타입: {payload['token_type']}")
 
-                # 블랙리스트 확인
-                if self.is_blacklisted(payload):
-                    return Result.fail("무효화된 토큰")
-
-                # 세션 검증
-                if validate_session and payload["token_type"] == TokenType.ACCESS:
-                    session_result = self.session_manager.validate_session(
-                        payload["sub"], payload["jti"]
-                    )
-                    if not session_result.success:
-                        return session_result
+                # 블랙리스트 및 세션 확인 (Redis 왕복 1회)
+                state_result = self._check_token_state(
+                    payload,
+                    validate_session and payload["token_type"] == TokenType.ACCESS,
+                )
+                if not state_result.success:
+                    return state_result
 
+                if use_cache:
+                    self.token_cache.put(token, payload)
                 return Result.ok(payload)
 
         except Exception as e:
             self.logger.error("token_verification_failed", error=str(e))
             return Result.fail(f"토큰 검증 중 오류 발생: {str(e)}")
 
+    def _get_cached_claims(self, token: str) -> Optional[Dict[str, Any]]:
+        """검증 토큰 캐시 조회 (서명 검증 없이 jti 만 읽음)"""
+        try:
+            jti = jwt.get_unverified_claims(token).get("jti")
+        except JWTError:
+            return None
+        return self.token_cache.get(jti, token) if jti else None
+
+    def _check_token_state(
+        self, payload: Dict[str, Any], check_session: bool
+    ) -> Result[bool]:
+        """
+        블랙리스트와 세션 확인
+
+        Redis 를 쓰면 두 조회를 한 파이프라인으로 보내고, 아니면 개별 조회합니다.
+        """
+        redis_client = self.redis_client
+        if redis_client is None:
+            if self.is_blacklisted(payload):
+                return Result.fail("무효화된 토큰")
+            if check_session:
+                session_result = self.session_manager.validate_session(
+                    payload["sub"], payload["jti"]
+                )
+                if not session_result.success:
+                    return session_result
+            return Result.ok(True)
+
+        pipeline = redis_client.pipeline(transaction=False)
+        pipeline.exists(self._blacklist_key(payload["jti"]))
+        if check_session:
+            self.session_manager.add_session_check(
+                pipeline, str(payload["sub"]), payload["jti"]
+            )
+        # 이전 형식 세션 키의 WRONGTYPE 오류는 세션 없음으로 처리
+        results = pipeline.execute(raise_on_error=False)
+
+        if isinstance(results[0], Exception):
+            raise results[0]
+        if results[0]:
+            return Result.fail("무효화된 토큰")
+        if check_session and not self.session_manager.parse_session_check(
+            results[1], payload["jti"]
+        ):
+            self.logger.warning(
+                "invalid_session", user_id=payload["sub"], token_jti=payload["jti"]
+            )
+            return Result.fail("유효하지 않은 세션입니다")
+        return Result.ok(True)
+
     def is_blacklisted(self, payload: Dict[str, Any]) -> bool:
         """토큰 블랙리스트 확인"""
         cache_key = self.cache_manager.get_cache_key(
@@ -594,10 +702,19 @@ class TokenManager:
                 now = datetime.now(timezone.UTC)
                 expires_in = max(0, int((exp - now).total_seconds()))
 
-            cache_key = self.cache_manager.get_cache_key(
-                CacheKeyPrefix.TOKEN_BLACKLIST, payload["jti"]
-            )
-            success = self.cache_manager.set(cache_key, "1", expires_in)
+            redis_client = self.redis_client
+            if redis_client is not None:
+                success = bool(
+                    redis_client.set(
+                        self._blacklist_key(payload["jti"]), "1", ex=max(1, expires_in)
+                    )
+                )
+            else:
+                cache_key = self.cache_manager.get_cache_key(
+                    CacheKeyPrefix.TOKEN_BLACKLIST, payload["jti"]
+                )
+                success = self.cache_manager.set(cache_key, "1", expires_in)
+            token_revocation_bus.publish(redis_client, {"jti": payload["jti"]})
 
             if success:
                 record_token_blacklisted()
@@ -757,9 +874,11 @@ class PasswordManager:
         self,
         policy: Optional[PasswordPolicy] = None,
         cache_manager: Optional[CacheManager] = None,
+        hasher: Optional[PasswordHasher] = None,
     ):
         self.policy = policy or PasswordPolicy()
         self.cache_manager = cache_manager
+        self.hasher = hasher or password_hasher
         self.pwd_context = CryptContext(
             schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=12
         )
@@ -781,6 +900,22 @@ class PasswordManager:
             self.logger.error("password_hashing_failed", error=str(e))
             return Result.fail("비밀번호 해시 생성 실패")
 
+    async def verify_and_update(
+        self, plain_password: str, hashed_password: str
+    ) -> Tuple[bool, Optional[str]]:
+        """비밀번호 검증 (해시 전용 풀, cost 변경 시 새 해시 반환)"""
+        return await self.hasher.verify_and_update(plain_password, hashed_password)
+
+    async def hash_async(self, password: str) -> Result[str]:
+        """비밀번호 해시 (해시 전용 풀)"""
+        try:
+            return Result.ok(await self.hasher.hash(password))
+        except PasswordHasherOverloaded:
+            raise
+        except Exception as e:
+            self.logger.error("password_hashing_failed", error=str(e))
+            return Result.fail("비밀번호 해시 생성 실패")
+
     async def add_to_history(self, user_id: str, hashed_password: str) -> Result[bool]:
         """비밀번호 히스토리 추가"""
         if not self.cache_manager:
@@ -954,11 +1089,17 @@ class SecurityService:
                     return Result.fail("잘못된 사용자명 또는 비밀번호")
 
                 # 비밀번호 검증
-                if not self.password_manager.verify(password, user.hashed_password):
+                valid, new_hash = await self.password_manager.verify_and_update(
+                    password, user.hashed_password
+                )
+                if not valid:
                     self.metrics.auth_failures.labels(
                         "invalid_password", username
                     ).inc()
                     return Result.fail("잘못된 사용자명 또는 비밀번호")
+                if new_hash:
+                    user.hashed_password = new_hash
+                    await user.save()
 
                 # 2FA 검증
                 if user.two_factor_enabled:
@@ -990,6 +1131,8 @@ class SecurityService:
                 self.logger.info("user_authenticated", username=username)
                 return Result.ok((user, tokens.data))
 
+        except PasswordHasherOverloaded:
+            return Result.fail("로그인 요청이 많습니다. 잠시 후 다시 시도하세요")
         except Exception as e:
             self.logger.error("authentication_failed", error=str(e), username=username)
             return Result.fail("인증 중 오류 발생")
@@ -1074,7 +1217,10 @@ class SecurityService:
         """비밀번호 변경"""
         try:
             # 현재 비밀번호 확인
-            if not self.password_manager.verify(current_password, user.hashed_password):
+            valid, _ = await self.password_manager.verify_and_update(
+                current_password, user.hashed_password
+            )
+            if not valid:
                 return Result.fail("현재 비밀번호가 일치하지 않습니다")
 
             # 비밀번호 정책 검증
@@ -1087,7 +1233,7 @@ class SecurityService:
                 return validate_result
 
             # 새 비밀번호 해시
-            hash_result = self.password_manager.hash(new_password)
+            hash_result = await self.password_manager.hash_async(new_password)
             if not hash_result.success:
                 return hash_result
 
@@ -1105,6 +1251,8 @@ class SecurityService:
             self.logger.info("password_changed", user_id=user.id)
             return Result.ok(True)
 
+        except PasswordHasherOverloaded:
+            return Result.fail("요청이 많습니다. 잠시 후 다시 시도하세요")
         except Exception as e:
             self.logger.error("password_change_failed", error=str(e), user_id=user.id)
             return Result.fail("비밀번호 변경 중 오류 발생")
@@ -0,0 +1,237 @@
+"""
+세션 저장소 모듈
+
+사용자별 활성 세션(액세스 토큰 jti)을 보관합니다. 세션 하나를 추가/제거할 때
+전체 목록을 읽고 다시 쓰지 않으므로 동시 로그인에서도 갱신이 유실되지 않습니다.
+
+- RedisSessionStore: 사용자별 정렬 집합(ZSET), 점수는 토큰 만료 시각(epoch 초).
+  ``ZADD``/``ZREM``/``ZSCORE`` 로 원자적으로 갱신/조회하고, 만료된 jti 는 세션을
+  추가하거나 목록을 조회할 때 ``ZREMRANGEBYSCORE`` 로 정리합니다. 키 자체는 가장 늦은
+  만료 시각에 사라집니다.
+- InMemorySessionStore: 단일 노드/테스트용. 각 연산이 딕셔너리 연산 한 번이라
+  잠금 없이 동작합니다.
+"""
+
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional
+
+import structlog
+
+logger = structlog.get_logger()
+
+# 세션 키 접두사
+SESSION_KEY_PREFIX = "app:session"
+
+
+class SessionStore(ABC):
+    """사용자별 세션 저장소"""
+
+    @abstractmethod
+    def add(self, user_id: str, token_jti: str, expires_at: float) -> None:
+        """
+        세션 추가
+
+        Args:
+            user_id: 사용자 ID
+            token_jti: 토큰 ID
+            expires_at: 만료 시각 (epoch 초)
+        """
+
+    @abstractmethod
+    def contains(self, user_id: str, token_jti: str) -> bool:
+        """
+        만료되지 않은 세션인지 확인
+
+        Args:
+            user_id: 사용자 ID
+            token_jti: 토큰 ID
+
+        Returns:
+            bool: 유효 여부
+        """
+
+    @abstractmethod
+    def remove(self, user_id: str, token_jti: str) -> bool:
+        """
+        세션 제거
+
+        Args:
+            user_id: 사용자 ID
+            token_jti: 토큰 ID
+
+        Returns:
+            bool: 제거된 세션이 있었는지 여부
+        """
+
+    @abstractmethod
+    def remove_all(self, user_id: str) -> int:
+        """
+        사용자의 모든 세션 제거
+
+        Args:
+            user_id: 사용자 ID
+
+        Returns:
+            int: 제거된 키 수
+        """
+
+    @abstractmethod
+    def active(self, user_id: str) -> List[str]:
+        """
+        만료되지 않은 세션 목록 (만료된 세션 정리)
+
+        Args:
+            user_id: 사용자 ID
+
+        Returns:
+            List[str]: 토큰 ID 목록 (만료 시각 순)
+        """
+
+
+class RedisSessionStore(SessionStore):
+    """Redis 정렬 집합 기반 세션 저장소"""
+
+    def __init__(self, redis: Any, key_prefix: str = SESSION_KEY_PREFIX):
+        """
+        Redis 세션 저장소 초기화
+
+        Args:
+            redis: 동기 ``redis.Redis`` 클라이언트
+            key_prefix: 세션 키 접두사
+        """
+        self.redis = redis
+        self.key_prefix = key_prefix
+
+    def key(self, user_id: str) -> str:
+        return f"{self.key_prefix}:{user_id}"
+
+    def add(self, user_id: str, token_jti: str, expires_at: float) -> None:
+        """ZADD 후 만료 세션 정리, 키 만료 시각은 가장 늦은 세션에 맞춤"""
+        key = self.key(user_id)
+        expire_at = int(expires_at) + 1
+        pipeline = self.redis.pipeline(transaction=True)
+        pipeline.zadd(key, {token_jti: expires_at})
+        pipeline.zremrangebyscore(key, "-inf", time.time())
+        # 만료가 없으면 설정(NX), 있으면 더 늦을 때만 연장(GT)
+        pipeline.expireat(key, expire_at, nx=True)
+        pipeline.expireat(key, expire_at, gt=True)
+        try:
+            pipeline.execute()
+        except Exception as e:
+            if "WRONGTYPE" not in str(e):
+                raise
+            # 이전 형식(직렬화된 집합 문자열) 키는 버리고 다시 기록
+            logger.warning("session_key_migrated", user_id=user_id)
+            self.redis.delete(key)
+            self.add(user_id, token_jti, expires_at)
+
+    @staticmethod
+    def parse_check(result: Any) -> bool:
+        """
+        세션 ZSCORE 결과 해석 (파이프라인 결과용)
+
+        Args:
+            result: ZSCORE 결과 (만료 시각 또는 None, 오류 객체)
+
+        Returns:
+            bool: 유효 여부
+        """
+        if result is None or isinstance(result, Exception):
+            return False
+        return float(result) > time.time()
+
+    def contains(self, user_id: str, token_jti: str) -> bool:
+        """ZSCORE 로 만료 시각 확인"""
+        try:
+            score = self.redis.zscore(self.key(user_id), token_jti)
+        except Exception as e:
+            if "WRONGTYPE" not in str(e):
+                raise
+            return False
+        return self.parse_check(score)
+
+    def remove(self, user_id: str, token_jti: str) -> bool:
+        """ZREM"""
+        return bool(self.redis.zrem(self.key(user_id), token_jti))
+
+    def remove_all(self, user_id: str) -> int:
+        """키 삭제"""
+        return int(self.redis.delete(self.key(user_id)))
+
+    def active(self, user_id: str) -> List[str]:
+        """만료 세션 정리 후 남은 세션 조회"""
+        key = self.key(user_id)
+        pipeline = self.redis.pipeline(transaction=True)
+        pipeline.zremrangebyscore(key, "-inf", time.time())
+        pipeline.zrange(key, 0, -1)
+        _, members = pipeline.execute()
+        return [
+            member.decode("utf-8") if isinstance(member, bytes) else member
+            for member in members
+        ]
+
+
+class InMemorySessionStore(SessionStore):
+    """프로세스 메모리 세션 저장소 (잠금 없음)
+
+    GIL 아래에서 원자적인 딕셔너리 연산(``setdefault``, 항목 대입, ``pop``)만
+    사용하고, 순회는 복사본에서 합니다.
+    """
+
+    def __init__(self):
+        """메모리 세션 저장소 초기화"""
+        # 사용자 ID -> {jti: 만료 시각}
+        self._sessions: Dict[str, Dict[str, float]] = {}
+
+    def _prune(self, user_id: str, sessions: Dict[str, float]) -> None:
+        now = time.time()
+        for token_jti, expires_at in list(sessions.items()):
+            if expires_at <= now:
+                sessions.pop(token_jti, None)
+        if not sessions:
+            # 그 사이 추가된 세션이 있으면 되돌려 놓음
+            removed = self._sessions.pop(user_id, None)
+            if removed:
+                self._sessions.setdefault(user_id, {}).update(removed)
+
+    def add(self, user_id: str, token_jti: str, expires_at: float) -> None:
+        sessions = self._sessions.setdefault(user_id, {})
+        sessions[token_jti] = expires_at
+        self._prune(user_id, sessions)
+
+    def contains(self, user_id: str, token_jti: str) -> bool:
+        expires_at = self._sessions.get(user_id, {}).get(token_jti)
+        return expires_at is not None and expires_at > time.time()
+
+    def remove(self, user_id: str, token_jti: str) -> bool:
+        return self._sessions.get(user_id, {}).pop(token_jti, None) is not None
+
+    def remove_all(self, user_id: str) -> int:
+        return int(self._sessions.pop(user_id, None) is not None)
+
+    def active(self, user_id: str) -> List[str]:
+        sessions = self._sessions.get(user_id)
+        if not sessions:
+            return []
+        self._prune(user_id, sessions)
+        return [jti for jti, _ in sorted(list(sessions.items()), key=lambda x: x[1])]
+
+
+def create_session_store(redis: Optional[Any] = None) -> SessionStore:
+    """
+    세션 저장소 생성
+
+    Args:
+        redis: 동기 Redis 클라이언트 (None 이면 공유 메모리 저장소)
+
+    Returns:
+        SessionStore: 세션 저장소
+    """
+    if redis is not None:
+        return RedisSessionStore(redis)
+    return memory_session_store
+
+
+# 단일 노드용 공유 메모리 세션 저장소
+memory_session_store = InMemorySessionStore()
@@ -1,15 +1,152 @@
 """
 데이터베이스 샤딩 관리 모듈
+
+- HashRing: 가중치와 가상 노드를 지원하는 일관된 해시(consistent hashing) 링.
+  노드를 추가/제거해도 전체 키 중 약 1/N 만 다른 샤드로 이동합니다.
+- ShardingManager: 샤드 키(예: ``vehicle_id``)로 샤드를 고르고, 샤드별 엔진/세션 풀을
+  지연 생성하며, 여러 샤드에 같은 조회를 동시에 실행해 결과를 정렬/페이지 단위로
+  병합(scatter-gather)합니다.
+
+샤드 노드는 ``url`` (예: ``sqlite:///shard1.db``) 또는 ``connection``
+(host/port/database) 으로 지정합니다. 노드 등록은 애플리케이션 시작 시 한 번
+(``DB_SHARD_URLS`` 설정) 수행하며, 같은 노드를 다시 등록하면 아무 작업도 하지 않습니다.
 """
 
+import asyncio
+import bisect
 import hashlib
+import heapq
 import logging
-from typing import Any, Dict, List, Optional, Tuple, Union
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from operator import attrgetter, itemgetter
+from typing import (Any, Callable, Dict, Iterator, List, Optional, Sequence,
+                    Tuple, TypeVar, Union)
+
+from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session, sessionmaker
 
 from packages.api.src.coreconfig import settings
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# 노드 가중치 1.0 당 기본 가상 노드 수
+DEFAULT_VIRTUAL_NODES = 160
+
+# scatter-gather 동시 실행 수
+DEFAULT_SCATTER_WORKERS = 8
+
+
+class ShardRoutingError(LookupError):
+    """샤드 키를 담당하는 등록된 노드를 찾을 수 없음"""
+
+
+class ShardQueryError(Exception):
+    """샤드 조회 실패"""
+
+    def __init__(self, errors: Dict[str, Exception]):
+        self.errors = errors
+        details = ", ".join(f"{shard}: {error}" for shard, error in errors.items())
+        super().__init__(f"샤드 조회 실패 ({details})")
+
+
+def _hash(value: str) -> int:
+    """링 위치용 64비트 해시"""
+    return int.from_bytes(
+        hashlib.blake2b(value.encode("utf-8"), digest_size=8).digest(), "big"
+    )
+
+
+class HashRing:
+    """가중치 일관된 해시 링"""
+
+    def __init__(self, virtual_nodes: int = DEFAULT_VIRTUAL_NODES):
+        """
+        해시 링 초기화
+
+        Args:
+            virtual_nodes: 가중치 1.0 당 가상 노드 수
+        """
+        self.virtual_nodes = virtual_nodes
+        self.weights: Dict[str, float] = {}
+        self._hashes: List[int] = []
+        self._owners: List[str] = []
+
+    def __len__(self) -> int:
+        return len(self.weights)
+
+    def add_node(self, name: str, weight: float = 1.0) -> None:
+        """
+        노드 추가 (가중치에 비례한 수의 가상 노드 배치)
+
+        Args:
+            name: 노드 이름
+            weight: 가중치
+        """
+        self.weights[name] = weight
+        self._rebuild()
+
+    def remove_node(self, name: str) -> None:
+        """
+        노드 제거
+
+        Args:
+            name: 노드 이름
+        """
+        if self.weights.pop(name, None) is not None:
+            self._rebuild()
+
+    def _rebuild(self) -> None:
+        """가상 노드 배치 재계산"""
+        if not self.weights:
+            self._hashes, self._owners = [], []
+            return
+        # 평균 가중치 노드가 virtual_nodes 개를 갖도록 정규화
+        mean_weight = sum(self.weights.values()) / len(self.weights)
+        points = []
+        for name, weight in self.weights.items():
+            replicas = max(1, round(self.virtual_nodes * weight / mean_weight))
+            points.extend((_hash(f"{name}#{i}"), name) for i in range(replicas))
+        points.sort()
+        self._hashes = [point for point, _ in points]
+        self._owners = [name for _, name in points]
+
+    def get_node(self, key: Union[str, int]) -> str:
+        """
+        키를 담당하는 노드 조회 (O(log n))
+
+        Args:
+            key: 샤드 키 값
+
+        Returns:
+            str: 노드 이름
+
+        Raises:
+            LookupError: 등록된 노드가 없는 경우
+        """
+        if not self._hashes:
+            raise LookupError("등록된 샤드 노드가 없습니다")
+        index = bisect.bisect(self._hashes, _hash(str(key)))
+        return self._owners[index % len(self._owners)]
+
+    def distribution(self) -> Dict[str, float]:
+        """
+        노드별 링 점유 비율
+
+        Returns:
+            Dict[str, float]: 노드 이름별 비율 (합계 1.0)
+        """
+        share = {name: 0 for name in self.weights}
+        ring_size = 1 << 64
+        for i, point in enumerate(self._hashes):
+            previous = self._hashes[i - 1] if i else self._hashes[-1] - ring_size
+            share[self._owners[i]] += point - previous
+        return {name: value / ring_size for name, value in share.items()}
+
 
 class ShardingManager:
     """데이터베이스 샤딩 관리 클래스"""
@@ -19,7 +156,7 @@ class ShardingManager:
         샤딩 매니저 초기화
 
         Args:
-            num_shards: 샤드 수
+            num_shards: 샤드 수 (노드가 등록되기 전 해시 분산에 사용)
         """
         self.num_shards = num_shards
         self.logger = logger
@@ -27,19 +164,28 @@ class ShardingManager:
         self.nodes = []
         self.shard_key = None
         self.distribution_strategy = None
+        self.ring = HashRing()
+        self._engines: Dict[str, Engine] = {}
+        self._sessions: Dict[str, sessionmaker] = {}
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
 
     def initialize(self, config: dict) -> bool:
         """
         샤딩 매니저 구성 초기화
 
         Args:
-            config: 샤딩 설정 정보
+            config: 샤딩 설정 정보 (``strategy``, ``virtual_nodes`` 등)
 
         Returns:
             bool: 초기화 성공 여부
         """
         try:
+            if config == self.config:
+                return True
             self.config = config
+            self.ring.virtual_nodes = config.get("virtual_nodes", DEFAULT_VIRTUAL_NODES)
+            self.ring._rebuild()
             self.logger.info(f"샤딩 매니저 초기화 완료: {config}")
             return True
         except Exception as e:
@@ -48,16 +194,26 @@ class ShardingManager:
 
     def register_nodes(self, nodes: list) -> bool:
         """
-        샤드 노드 등록
+        샤드 노드 등록 (해시 링 재구성, 기존 엔진 정리)
+
+        이미 같은 노드가 등록되어 있으면 엔진을 유지하고 아무 작업도 하지 않습니다.
 
         Args:
-            nodes: 샤드 노드 목록
+            nodes: 샤드 노드 목록 (``name``, ``weight``, ``url`` 또는 ``connection``)
 
         Returns:
             bool: 등록 성공 여부
         """
         try:
+            if nodes == self.nodes:
+                return True
+            self.dispose()
             self.nodes = nodes
+            self.num_shards = len(nodes)
+            self.ring.weights = {
+                node["name"]: float(node.get("weight", 1.0)) for node in nodes
+            }
+            self.ring._rebuild()
             self.logger.info(f"샤드 노드 등록 완료: {len(nodes)}개 노드")
             return True
         except Exception as e:
@@ -86,6 +242,9 @@ class ShardingManager:
         """
         분산 전략 설정
 
+        ``initialize`` 의 ``strategy`` 가 ``range`` 일 때만 범위 규칙을 사용하며,
+        그 외에는 일관된 해시 링으로 분산합니다.
+
         Args:
             strategy: 분산 전략 정보
 
@@ -139,10 +298,22 @@ class ShardingManager:
             shard_key: 샤드 키
 
         Returns:
-            int: 샤드 ID
+            int: 샤드 ID (등록된 노드 목록의 인덱스)
+
+        Raises:
+            ShardRoutingError: 샤드 키가 등록되지 않은 노드로 라우팅되는 경우
         """
-        # 샤드 키의 첫 8자리를 16진수로 해석하여 샤드 수로 나눈 나머지 사용
-        return int(shard_key[:8], 16) % self.num_shards
+        if not self.nodes:
+            # 노드 등록 전: 샤드 키의 첫 8자리를 샤드 수로 나눈 나머지
+            return int(shard_key[:8], 16) % self.num_shards
+        name = self._route_key(shard_key)
+        for i, node in enumerate(self.nodes):
+            if node["name"] == name:
+                return i
+        raise ShardRoutingError(
+            f"샤드 키 {shard_key} 를 담당하는 샤드 {name} 가 등록되어 있지 않습니다 "
+            f"(등록된 샤드: {', '.join(self.shard_names)})"
+        )
 
     def get_shard_info(self, value: Union[str, int]) -> Tuple[str, int]:
         """
@@ -158,20 +329,77 @@ class ShardingManager:
         shard_id = self.get_shard_id(shard_key)
         return shard_key, shard_id
 
-    def get_connection_string(self, shard_id: int) -> str:
+    def _route_key(self, shard_key: str) -> str:
+        """
+        샤드 키(md5 16진수)를 담당하는 노드 이름
+
+        Raises:
+            ShardRoutingError: 등록된 노드가 없는 경우
+        """
+        strategy = self.distribution_strategy or {}
+        if self.config.get("strategy") == "range" and strategy.get("type") == "range":
+            prefix = shard_key[:8]
+            for rule in strategy.get("ranges", []):
+                if rule["min"] <= prefix <= rule["max"]:
+                    return rule["shard"]
+        try:
+            return self.ring.get_node(shard_key)
+        except LookupError as e:
+            raise ShardRoutingError(str(e)) from e
+
+    def shard_for(self, value: Any) -> str:
+        """
+        값 또는 레코드를 담당하는 샤드 이름
+
+        Args:
+            value: 샤드 키 값, 또는 샤드 키(예: ``vehicle_id``) 필드가 있는 dict/객체
+
+        Returns:
+            str: 샤드 이름
+        """
+        if self.shard_key and not isinstance(value, (str, int)):
+            value = (
+                value.get(self.shard_key)
+                if isinstance(value, dict)
+                else getattr(value, self.shard_key)
+            )
+        return self._route_key(self.get_shard_key(value))
+
+    def _node(self, shard: Union[str, int]) -> Dict[str, Any]:
+        if isinstance(shard, int):
+            return self.nodes[shard]
+        for node in self.nodes:
+            if node["name"] == shard:
+                return node
+        raise KeyError(f"알 수 없는 샤드: {shard}")
+
+    def get_connection_string(self, shard_id: Union[int, str]) -> str:
         """
         샤드별 데이터베이스 연결 문자열 반환
 
         Args:
-            shard_id: 샤드 ID
+            shard_id: 샤드 ID 또는 이름
 
         Returns:
             str: 데이터베이스 연결 문자열
         """
-        base_url = settings.DATABASE_URL
-        if "?" in base_url:
-            return f"{base_url}&shard={shard_id}"
-        return f"{base_url}?shard={shard_id}"
+        if not self.nodes:
+            base_url = settings.DATABASE_URL
+            if "?" in base_url:
+                return f"{base_url}&shard={shard_id}"
+            return f"{base_url}?shard={shard_id}"
+
+        node = self._node(shard_id)
+        if node.get("url"):
+            return node["url"]
+        connection = node.get("connection", {})
+        user = connection.get("user", settings.DB_USER)
+        password = connection.get("password", settings.DB_PASSWORD)
+        return (
+            f"postgresql://{user}:{password}@{connection.get('host', settings.DB_HOST)}"
+            f":{connection.get('port', settings.DB_PORT)}"
+            f"/{connection.get('database', settings.DB_NAME)}"
+        )
 
     def get_all_shards(self) -> List[Dict[str, Any]]:
         """
@@ -180,11 +408,263 @@ class ShardingManager:
         Returns:
             List[Dict[str, Any]]: 샤드 정보 목록
         """
+        if not self.nodes:
+            return [
+                {"shard_id": i, "connection_string": self.get_connection_string(i)}
+                for i in range(self.num_shards)
+            ]
+        share = self.ring.distribution()
         return [
-            {"shard_id": i, "connection_string": self.get_connection_string(i)}
-            for i in range(self.num_shards)
+            {
+                "shard_id": i,
+                "name": node["name"],
+                "weight": node.get("weight", 1.0),
+                "ring_share": round(share.get(node["name"], 0.0), 4),
+                "connection_string": self.get_connection_string(i),
+            }
+            for i, node in enumerate(self.nodes)
         ]
 
+    def shard_nodes_from_settings(self) -> List[Dict[str, Any]]:
+        """
+        설정(``DB_SHARD_URLS``)의 샤드 노드 목록
+
+        항목은 쉼표로 구분하며 ``이름=URL`` 형식입니다 (이름을 생략하면 ``shard1``,
+        ``shard2`` ... 순서로 붙입니다).
+
+        Returns:
+            List[Dict[str, Any]]: ``register_nodes`` 에 넘길 노드 목록
+        """
+        entries = getattr(settings, "DB_SHARD_URLS", None) or []
+        if isinstance(entries, str):
+            entries = [entry.strip() for entry in entries.split(",")]
+        nodes = []
+        for entry in filter(None, entries):
+            name, sep, url = entry.partition("=")
+            if not sep or "://" in name:
+                name, url = f"shard{len(nodes) + 1}", entry
+            nodes.append({"name": name.strip(), "url": url.strip()})
+        return nodes
+
+    @property
+    def enabled(self) -> bool:
+        """샤드 노드가 등록되어 라우팅 중인지 여부"""
+        return bool(self.nodes)
+
+    @property
+    def shard_names(self) -> List[str]:
+        """등록된 샤드 이름 목록"""
+        return [node["name"] for node in self.nodes]
+
+    def get_engine(self, shard: Union[str, int]) -> Engine:
+        """
+        샤드 엔진 조회 (샤드별 커넥션 풀, 최초 사용 시 생성)
+
+        Args:
+            shard: 샤드 이름 또는 ID
+
+        Returns:
+            Engine: SQLAlchemy 엔진
+        """
+        name = self._node(shard)["name"]
+        engine = self._engines.get(name)
+        if engine is not None:
+            return engine
+        with self._lock:
+            engine = self._engines.get(name)
+            if engine is None:
+                url = self.get_connection_string(name)
+                options: Dict[str, Any] = {"pool_pre_ping": True}
+                if not url.startswith("sqlite"):
+                    options.update(
+                        pool_size=settings.DB_POOL_SIZE,
+                        max_overflow=settings.DB_MAX_OVERFLOW,
+                    )
+                engine = create_engine(url, **options)
+                self._engines[name] = engine
+                self._sessions[name] = sessionmaker(bind=engine, expire_on_commit=False)
+        return engine
+
+    @contextmanager
+    def session(self, shard: Union[str, int]) -> Iterator[Session]:
+        """
+        샤드 세션 컨텍스트 (예외 시 롤백)
+
+        Args:
+            shard: 샤드 이름 또는 ID
+
+        Yields:
+            Session: 샤드 세션
+        """
+        name = self._node(shard)["name"]
+        self.get_engine(name)
+        db = self._sessions[name]()
+        try:
+            yield db
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    def session_for(self, value: Any):
+        """
+        값 또는 레코드를 담당하는 샤드의 세션 컨텍스트
+
+        Args:
+            value: 샤드 키 값 또는 레코드 (예: ``vehicle_id``)
+
+        Returns:
+            세션 컨텍스트 매니저
+        """
+        return self.session(self.shard_for(value))
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=max(DEFAULT_SCATTER_WORKERS, len(self.nodes)),
+                        thread_name_prefix="shard-scatter",
+                    )
+        return self._executor
+
+    def scatter(
+        self,
+        func: Callable[[Session], T],
+        shards: Optional[Sequence[str]] = None,
+        allow_partial: bool = False,
+    ) -> Dict[str, T]:
+        """
+        여러 샤드에서 같은 작업을 동시에 실행
+
+        Args:
+            func: 샤드 세션을 받아 결과를 반환하는 함수
+            shards: 대상 샤드 이름 (기본값: 전체)
+            allow_partial: True 면 실패한 샤드는 로그만 남기고 제외
+
+        Returns:
+            Dict[str, T]: 샤드 이름별 결과
+
+        Raises:
+            ShardQueryError: 실패한 샤드가 있고 allow_partial 이 False 인 경우
+        """
+        names = list(shards or self.shard_names)
+
+        def run(name: str) -> T:
+            with self.session(name) as db:
+                return func(db)
+
+        futures = {name: self._get_executor().submit(run, name) for name in names}
+        results: Dict[str, T] = {}
+        errors: Dict[str, Exception] = {}
+        for name, future in futures.items():
+            try:
+                results[name] = future.result()
+            except Exception as e:
+                errors[name] = e
+        if errors:
+            if not allow_partial:
+                raise ShardQueryError(errors)
+            self.logger.warning(f"일부 샤드 조회 실패: {ShardQueryError(errors)}")
+        return results
+
+    async def ascatter(
+        self,
+        func: Callable[[Session], T],
+        shards: Optional[Sequence[str]] = None,
+        allow_partial: bool = False,
+    ) -> Dict[str, T]:
+        """``scatter`` 의 비동기 버전 (이벤트 루프를 막지 않음)"""
+        return await asyncio.get_running_loop().run_in_executor(
+            None, lambda: self.scatter(func, shards, allow_partial)
+        )
+
+    def query_all(
+        self,
+        build: Callable[[Session, int], List[Any]],
+        order_by: Sequence[Union[str, Tuple[str, bool]]] = (),
+        skip: int = 0,
+        limit: Optional[int] = None,
+        shards: Optional[Sequence[str]] = None,
+        allow_partial: bool = False,
+    ) -> List[Any]:
+        """
+        여러 샤드의 목록 조회 결과를 정렬 병합 후 페이지 단위로 반환
+
+        ``build(db, fetch)`` 는 각 샤드에서 ``order_by`` 와 같은 순서로 정렬된
+        상위 ``fetch`` (= skip + limit) 개를 반환해야 합니다. 각 샤드 결과는
+        이미 정렬되어 있으므로 k-way 병합만 합니다.
+
+        Args:
+            build: 샤드 세션과 조회 개수를 받아 정렬된 목록을 반환하는 함수
+            order_by: 정렬 필드 목록 (``"field"`` 또는 ``("field", 내림차순 여부)``)
+            skip: 건너뛸 항목 수
+            limit: 최대 항목 수 (None 이면 전체)
+            shards: 대상 샤드 이름 (기본값: 전체)
+            allow_partial: 실패한 샤드 제외 여부
+
+        Returns:
+            List[Any]: 병합된 페이지
+        """
+        fetch = skip + limit if limit is not None else None
+        per_shard = self.scatter(lambda db: build(db, fetch), shards, allow_partial)
+        lists = [rows for rows in per_shard.values() if rows]
+
+        fields = [(f, False) if isinstance(f, str) else tuple(f) for f in order_by]
+        if not fields:
+            merged: List[Any] = [row for rows in lists for row in rows]
+        else:
+            sample = lists[0][0] if lists else None
+            getter = itemgetter if isinstance(sample, dict) else attrgetter
+            key = getter(*[name for name, _ in fields])
+            descending = {desc for _, desc in fields}
+            if len(descending) == 1:
+                merged = list(
+                    heapq.merge(*lists, key=key, reverse=descending.pop())
+                )
+            else:
+                # 방향이 섞인 정렬은 뒤쪽 필드부터 안정 정렬
+                merged = [row for rows in lists for row in rows]
+                for name, desc in reversed(fields):
+                    merged.sort(key=getter(name), reverse=desc)
+
+        end = skip + limit if limit is not None else None
+        return merged[skip:end]
+
+    def aggregate(
+        self,
+        func: Callable[[Session], T],
+        combine: Callable[[List[T]], Any] = sum,
+        shards: Optional[Sequence[str]] = None,
+        allow_partial: bool = False,
+    ) -> Any:
+        """
+        여러 샤드의 집계 결과 결합 (예: COUNT/SUM 합계, MAX 최댓값)
+
+        Args:
+            func: 샤드 세션을 받아 부분 집계를 반환하는 함수
+            combine: 부분 집계 목록을 결합하는 함수
+            shards: 대상 샤드 이름 (기본값: 전체)
+            allow_partial: 실패한 샤드 제외 여부
+
+        Returns:
+            Any: 결합된 집계 값
+        """
+        partials = self.scatter(func, shards, allow_partial)
+        return combine([value for value in partials.values() if value is not None])
+
+    def dispose(self) -> None:
+        """샤드 엔진과 스캐터 실행기 정리"""
+        with self._lock:
+            for engine in self._engines.values():
+                engine.dispose()
+            self._engines.clear()
+            self._sessions.clear()
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+                self._executor = None
+
 
 # 전역 샤딩 매니저 인스턴스
 sharding_manager = ShardingManager()
@@ -2,6 +2,10 @@
 구조화된 로깅 유틸리티
 
 표준화된 로그 형식을 제공하는 유틸리티 모듈입니다.
+
+기본적으로 로그는 비동기 파이프라인(``core.log_pipeline``)을 거칩니다. 로그 호출은
+큐에 레코드를 넣고 바로 돌아오며, JSON 직렬화와 콘솔/파일 기록, 회전 파일 압축은
+전용 스레드에서 처리됩니다. ``LOG_ASYNC=False`` 이면 호출 스레드에서 바로 기록합니다.
 """
 
 import gzip
@@ -10,14 +14,18 @@ import logging
 import os
 import shutil
 import sys
+import threading
 import traceback
 import uuid
 from datetime import datetime, timedelta, timezone
 from enum import Enum
-from logging.handlers import RotatingFileHandler
 from typing import Any, Dict, Iterator, List, Optional, Set, Union
 
 from core.config import settings
+from core.log_pipeline import (DEFAULT_LOG_QUEUE_SIZE, AsyncLogPipeline,
+                               BackgroundCompressingRotatingFileHandler,
+                               FastJsonFormatter, RateLimitFilter,
+                               SamplingFilter)
 from elasticsearch import AsyncElasticsearch
 from fastapi import Request
 from prometheus_client import Counter, Gauge, Histogram
@@ -201,6 +209,18 @@ class CustomJsonFormatter(jsonlogger.JsonFormatter):
         log_record.update(base_fields)
 
 
+class MetricsJsonFormatter(FastJsonFormatter):
+    """메트릭스를 갱신하는 빠른 JSON 포맷터 (작성 스레드에서 실행)"""
+
+    def to_dict(self, record: logging.LogRecord) -> Dict[str, Any]:
+        """로그 레코드를 딕셔너리로 변환"""
+        entry = super().to_dict(record)
+        if "exception" in entry:
+            LOG_ERRORS.labels(error_type=entry["exception"]["type"]).inc()
+        LOG_ENTRIES.labels(level=record.levelname, module=record.module).inc()
+        return entry
+
+
 class RequestContextFilter(logging.Filter):
     def __init__(self, request: Optional[Request] = None):
         super().__init__()
@@ -331,44 +351,8 @@ class LogSearcher:
         return [hit["_source"] for hit in result["hits"]["hits"]]
 
 
-class CompressedRotatingFileHandler(RotatingFileHandler):
-    """압축 지원 로그 회전 핸들러"""
-
-    def __init__(
-        self,
-        filename: str,
-        max_bytes: int = 10 * 1024 * 1024,  # 10MB
-        backup_count: int = 5,
-        encoding: Optional[str] = None,
-        delay: bool = False,
-        compress: bool = True,
-    ):
-        """
-        로그 파일 핸들러 초기화
-
-        Args:
-            filename: 로그 파일 경로
-            max_bytes: 최대 파일 크기 (바이트)
-            backup_count: 백업 파일 수
-            encoding: 파일 인코딩
-            delay: 지연된 파일 생성 여부
-            compress: 압축 여부
-        """
-        super().__init__(
-            filename, max_bytes, backup_count, encoding=encoding, delay=delay
-        )
-        self.compress = compress
-
-    def rotate(self, source: str, dest: str) -> None:
-        """로그 파일 회전"""
-        if os.path.exists(source):
-            if self.compress:
-                with open(source, "rb") as f_in:
-                    with gzip.open(f"{dest}.gz", "wb") as f_out:
-                        shutil.copyfileobj(f_in, f_out)
-            else:
-                shutil.copy2(source, dest)
-            os.remove(source)
+class CompressedRotatingFileHandler(BackgroundCompressingRotatingFileHandler):
+    """압축 지원 로그 회전 핸들러 (회전된 파일은 백그라운드 스레드에서 압축)"""
 
 
 class StructuredLogger:
@@ -381,6 +365,8 @@ class StructuredLogger:
         log_filter: Optional[LogFilter] = None,
         archive_config: Optional[Dict[str, Any]] = None,
         es_client: Optional[AsyncElasticsearch] = None,
+        sample_rates: Optional[Dict[LogLevel, float]] = None,
+        rate_limit: Optional[float] = None,
     ):
         """
         구조화된 로거 초기화
@@ -391,34 +377,42 @@ class StructuredLogger:
             log_filter: 로그 필터
             archive_config: 아카이브 설정
             es_client: Elasticsearch 클라이언트
+            sample_rates: 레벨별 남길 비율 (기본값: DEBUG 는 ``LOG_DEBUG_SAMPLE_RATE``)
+            rate_limit: 호출 위치별 초당 허용 건수 (INFO 이하, 기본값: ``LOG_RATE_LIMIT_PER_SECOND``)
         """
         self.logger = logging.getLogger(name)
         self.logger.setLevel(logging.INFO)
         self.name = name
 
-        # JSON 포맷터 설정
-        formatter = CustomJsonFormatter("%(timestamp)s %(level)s %(name)s %(message)s")
-
-        # 콘솔 핸들러
-        console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setFormatter(formatter)
-        self.logger.addHandler(console_handler)
+        # 같은 이름의 로거를 여러 번 만들어도 핸들러/필터는 한 번만 추가
+        if not getattr(self.logger, "_structured_configured", False):
+            for handler in _get_handlers(rotation_config):
+                self.logger.addHandler(handler)
 
-        # 파일 핸들러 (회전 및 압축 지원)
-        if settings.LOG_FILE_PATH:
-            rotation_config = rotation_config or LogRotationConfig()
-            file_handler = CompressedRotatingFileHandler(
-                settings.LOG_FILE_PATH,
-                max_bytes=rotation_config.max_bytes,
-                backup_count=rotation_config.backup_count,
-                compress=rotation_config.compress,
-            )
-            file_handler.setFormatter(formatter)
-            self.logger.addHandler(file_handler)
+            # 로그 필터 설정
+            if log_filter:
+                self.logger.addFilter(log_filter)
 
-        # 로그 필터 설정
-        if log_filter:
-            self.logger.addFilter(log_filter)
+            # 표본 추출 및 속도 제한 (큐에 넣기 전에 호출 스레드에서 걸러냄)
+            if sample_rates is None:
+                sample_rates = {
+                    LogLevel.DEBUG: getattr(settings, "LOG_DEBUG_SAMPLE_RATE", 1.0)
+                }
+            rates = {
+                LogLevel.to_logging_level(level): rate
+                for level, rate in sample_rates.items()
+                if rate < 1.0
+            }
+            if rates:
+                self.logger.addFilter(SamplingFilter(rates))
+            rate_limit = rate_limit or getattr(settings, "LOG_RATE_LIMIT_PER_SECOND", None)
+            if rate_limit:
+                self.logger.addFilter(
+                    RateLimitFilter(
+                        rate_limit, burst=getattr(settings, "LOG_RATE_LIMIT_BURST", 20)
+                    )
+                )
+            self.logger._structured_configured = True
 
         # 아카이브 설정
         if archive_config and settings.LOG_ARCHIVE_DIR:
@@ -436,6 +430,10 @@ class StructuredLogger:
         """메트릭스 업데이트"""
         LOG_LEVEL_GAUGE.labels(logger=self.name).set(self.logger.getEffectiveLevel())
 
+    def set_context(self, context: LogContext) -> None:
+        """로그 컨텍스트 설정"""
+        self.context = context
+
     def set_level(self, level: LogLevel) -> None:
         """로그 레벨 설정"""
         self.logger.setLevel(LogLevel.to_logging_level(level))
@@ -449,11 +447,16 @@ class StructuredLogger:
         exc_info: Optional[Exception] = None,
     ) -> None:
         """로그 메시지 기록"""
+        # 기록되지 않을 레벨이면 컨텍스트를 만들지 않음
+        if not self.logger.isEnabledFor(level):
+            return
+
         extra = extra or {}
         context_data = self.context.get_all()
         extra.update(context_data)
 
-        self.logger.log(level, message, extra=extra, exc_info=exc_info)
+        # 호출 위치(파일/줄)가 info() 등을 부른 코드로 기록되도록 래퍼 두 단계를 건너뜀
+        self.logger.log(level, message, extra=extra, exc_info=exc_info, stacklevel=3)
 
     def info(self, message: str, extra: Optional[Dict[str, Any]] = None) -> None:
         """정보 레벨 로그"""
@@ -528,6 +531,75 @@ class StructuredLogger:
         self.error(f"에러 발생: {str(error)}", extra=extra)
 
 
+# 비동기 로깅 파이프라인 (모든 구조화된 로거가 공유)
+log_pipeline = AsyncLogPipeline(
+    getattr(settings, "LOG_QUEUE_SIZE", DEFAULT_LOG_QUEUE_SIZE)
+)
+
+
+# 모든 구조화된 로거가 공유하는 핸들러 (처음 만든 로거의 회전 설정으로 한 번 생성)
+_shared_handlers: Optional[List[logging.Handler]] = None
+_shared_rotation: Optional[Dict[str, Any]] = None
+_handlers_lock = threading.Lock()
+
+
+def _build_handlers(rotation_config: LogRotationConfig) -> List[logging.Handler]:
+    """콘솔/파일 핸들러 생성 (비동기 모드면 공유 파이프라인을 시작하고 큐 핸들러 반환)"""
+    # JSON 포맷터 설정
+    formatter = MetricsJsonFormatter(
+        {
+            "environment": settings.ENVIRONMENT,
+            "service": getattr(settings, "SERVICE_NAME", None),
+        }
+    )
+
+    # 콘솔 핸들러
+    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler.setFormatter(formatter)
+    handlers: List[logging.Handler] = [console_handler]
+
+    # 파일 핸들러 (회전 및 압축 지원)
+    log_file_path = getattr(settings, "LOG_FILE_PATH", None)
+    if log_file_path:
+        file_handler = CompressedRotatingFileHandler(
+            log_file_path,
+            max_bytes=rotation_config.max_bytes,
+            backup_count=rotation_config.backup_count,
+            compress=rotation_config.compress,
+        )
+        file_handler.setFormatter(formatter)
+        handlers.append(file_handler)
+
+    if not getattr(settings, "LOG_ASYNC", True):
+        return handlers
+
+    if not log_pipeline.running:
+        log_pipeline.start(handlers)
+    return [log_pipeline.handler]
+
+
+def _get_handlers(
+    rotation_config: Optional[LogRotationConfig] = None,
+) -> List[logging.Handler]:
+    """
+    로거에 추가할 핸들러 반환
+
+    핸들러는 처음 한 번만 만들어 모든 로거가 공유합니다. 로그 파일은 하나이므로
+    이후 로거가 다른 회전 설정을 넘기면 경고만 남기고 기존 설정을 유지합니다.
+    """
+    global _shared_handlers, _shared_rotation
+    with _handlers_lock:
+        if _shared_handlers is None:
+            rotation_config = rotation_config or LogRotationConfig()
+            _shared_handlers = _build_handlers(rotation_config)
+            _shared_rotation = vars(rotation_config).copy()
+        elif rotation_config is not None and vars(rotation_config) != _shared_rotation:
+            logging.getLogger(__name__).warning(
+                f"로그 회전 설정은 처음 설정된 값을 사용합니다: {_shared_rotation}"
+            )
+        return _shared_handlers
+
+
 # 로깅 컨텍스트 관리 함수
 _current_context = LogContext()
 
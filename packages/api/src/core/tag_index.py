@@ -0,0 +1,227 @@
+"""
+정규화된 태그 인덱스 모듈
+
+엔티티의 JSON 태그 배열을 ``entity_tags(entity_type, entity_id, tag)`` 테이블에
+행 단위로 유지하여 태그 검색과 인기 태그 집계를 인덱스 기반 쿼리로 처리합니다.
+"""
+
+import logging
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Mapping, Optional
+
+from sqlalchemy import and_, distinct, func, insert
+from sqlalchemy.orm import Query, Session
+
+logger = logging.getLogger(__name__)
+
+
+class TagIndex:
+    """엔티티 유형별 태그 인덱스 접근 클래스"""
+
+    def __init__(self, tag_model: Any, entity_type: str):
+        """
+        태그 인덱스 초기화
+
+        Args:
+            tag_model: ``entity_tags`` 매핑 모델
+            entity_type: 엔티티 유형 (예: "todo", "maintenance")
+        """
+        self.tag_model = tag_model
+        self.entity_type = entity_type
+
+    def _scope(self, db: Session) -> Query:
+        """현재 엔티티 유형으로 제한된 태그 쿼리"""
+        return db.query(self.tag_model).filter(
+            self.tag_model.entity_type == self.entity_type
+        )
+
+    def add(self, db: Session, entity_id: str, tag: str) -> None:
+        """
+        태그 추가 (커밋은 호출 측에서 수행)
+
+        Args:
+            db: 데이터베이스 세션
+            entity_id: 엔티티 ID
+            tag: 추가할 태그
+        """
+        exists = (
+            self._scope(db)
+            .filter(self.tag_model.entity_id == entity_id, self.tag_model.tag == tag)
+            .first()
+        )
+        if exists is None:
+            db.add(
+                self.tag_model(
+                    entity_type=self.entity_type,
+                    entity_id=entity_id,
+                    tag=tag,
+                    created_at=datetime.now(timezone.utc),
+                )
+            )
+
+    def remove(self, db: Session, entity_id: str, tag: str) -> None:
+        """
+        태그 제거 (커밋은 호출 측에서 수행)
+
+        Args:
+            db: 데이터베이스 세션
+            entity_id: 엔티티 ID
+            tag: 제거할 태그
+        """
+        self._scope(db).filter(
+            self.tag_model.entity_id == entity_id, self.tag_model.tag == tag
+        ).delete(synchronize_session=False)
+
+    def replace(self, db: Session, entity_id: str, tags: Iterable[str]) -> None:
+        """
+        엔티티의 태그 집합 교체 (커밋은 호출 측에서 수행)
+
+        Args:
+            db: 데이터베이스 세션
+            entity_id: 엔티티 ID
+            tags: 새 태그 목록
+        """
+        self.clear(db, entity_id)
+        now = datetime.now(timezone.utc)
+        db.add_all(
+            [
+                self.tag_model(
+                    entity_type=self.entity_type,
+                    entity_id=entity_id,
+                    tag=tag,
+                    created_at=now,
+                )
+                for tag in dict.fromkeys(tags or [])
+            ]
+        )
+
+    def insert_many(
+        self, db: Session, entity_tags: Mapping[str, Optional[Iterable[str]]]
+    ) -> int:
+        """
+        새로 생성된 엔티티들의 태그를 한 번의 INSERT 로 기록 (커밋은 호출 측에서 수행)
+
+        기존 태그를 조회하거나 지우지 않으므로 방금 생성한 엔티티에만 사용합니다.
+
+        Args:
+            db: 데이터베이스 세션
+            entity_tags: 엔티티 ID 별 태그 목록
+
+        Returns:
+            int: 기록한 태그 행 수
+        """
+        now = datetime.now(timezone.utc)
+        rows = [
+            {
+                "entity_type": self.entity_type,
+                "entity_id": entity_id,
+                "tag": tag,
+                "created_at": now,
+            }
+            for entity_id, tags in entity_tags.items()
+            for tag in dict.fromkeys(tags or [])
+        ]
+        if rows:
+            db.execute(insert(self.tag_model), rows)
+        return len(rows)
+
+    def clear(self, db: Session, entity_id: str) -> None:
+        """
+        엔티티의 모든 태그 제거 (커밋은 호출 측에서 수행)
+
+        Args:
+            db: 데이터베이스 세션
+            entity_id: 엔티티 ID
+        """
+        self._scope(db).filter(self.tag_model.entity_id == entity_id).delete(
+            synchronize_session=False
+        )
+
+    def clear_many(self, db: Session, entity_ids: Any) -> int:
+        """
+        여러 엔티티의 모든 태그 제거 (커밋은 호출 측에서 수행)
+
+        엔티티 행을 지우는 세션(샤드)과 같은 세션으로 호출해야 같은 트랜잭션에서
+        함께 반영됩니다.
+
+        Args:
+            db: 데이터베이스 세션
+            entity_ids: 엔티티 ID 목록 또는 ID 단일 컬럼 서브쿼리
+
+        Returns:
+            int: 삭제한 태그 행 수
+        """
+        return (
+            self._scope(db)
+            .filter(self.tag_model.entity_id.in_(entity_ids))
+            .delete(synchronize_session=False)
+        )
+
+    def entity_ids_query(
+        self, db: Session, tags: List[str], match_all: bool = False
+    ) -> Query:
+        """
+        태그와 일치하는 엔티티 ID 서브쿼리
+
+        Args:
+            db: 데이터베이스 세션
+            tags: 검색할 태그 목록
+            match_all: True 면 모든 태그를 가진 엔티티만
+
+        Returns:
+            Query: ``entity_id`` 단일 컬럼 쿼리
+        """
+        tags = list(dict.fromkeys(tags))
+        query = db.query(self.tag_model.entity_id).filter(
+            and_(
+                self.tag_model.entity_type == self.entity_type,
+                self.tag_model.tag.in_(tags),
+            )
+        )
+        if match_all:
+            query = query.group_by(self.tag_model.entity_id).having(
+                func.count(distinct(self.tag_model.tag)) == len(tags)
+            )
+        else:
+            query = query.distinct()
+        return query
+
+    def filter_by_tags(
+        self, query: Query, id_column: Any, tags: List[str], match_all: bool = False
+    ) -> Query:
+        """
+        엔티티 쿼리에 태그 조건 적용
+
+        Args:
+            query: 엔티티 쿼리
+            id_column: 엔티티 ID 컬럼
+            tags: 검색할 태그 목록
+            match_all: True 면 모든 태그를 가진 엔티티만
+
+        Returns:
+            Query: 태그 조건이 적용된 쿼리
+        """
+        subquery = self.entity_ids_query(query.session, tags, match_all).subquery()
+        return query.filter(id_column.in_(subquery.select()))
+
+    def popular(self, db: Session, limit: int = 10) -> List[Dict[str, Any]]:
+        """
+        가장 많이 사용된 태그 조회
+
+        Args:
+            db: 데이터베이스 세션
+            limit: 반환할 최대 태그 수
+
+        Returns:
+            List[Dict[str, Any]]: 태그 이름과 사용 횟수 목록
+        """
+        usage = func.count(self.tag_model.entity_id).label("count")
+        rows = (
+            db.query(self.tag_model.tag, usage)
+            .filter(self.tag_model.entity_type == self.entity_type)
+            .group_by(self.tag_model.tag)
+            .order_by(usage.desc(), self.tag_model.tag)
+            .limit(limit)
+            .all()
+        )
+        return [{"name": tag, "count": count} for tag, count in rows]
@@ -0,0 +1,249 @@
+"""
+검증된 토큰 캐시 모듈
+
+인증된 요청마다 JWT 디코딩, 블랙리스트 조회, 세션 조회를 반복하지 않도록 검증을
+통과한 토큰의 클레임을 프로세스 안에 잠시 보관합니다.
+
+- 키는 ``jti`` 이며 같은 토큰 문자열로 요청한 경우에만 적중합니다.
+- 항목 수는 ``max_size`` 로 제한되고(LRU), 보관 시간은 ``min(exp, ttl)`` 입니다.
+- 토큰/세션 무효화는 Redis pub/sub(``token:revocations``)으로 모든 워커에 전파되어
+  각 워커의 캐시에서 즉시 제거됩니다. 메시지가 유실되더라도 ``ttl`` 이 지나면
+  다시 Redis 에서 확인합니다.
+"""
+
+import asyncio
+import json
+import threading
+import time
+from collections import OrderedDict
+from contextlib import suppress
+from typing import Any, Dict, Optional, Tuple
+
+import structlog
+
+from packages.api.src.coreconfig import settings
+
+logger = structlog.get_logger()
+
+# 토큰 무효화 전파 채널
+REVOCATION_CHANNEL = "token:revocations"
+
+# 검증된 토큰 최대 보관 시간 (초, 무효화 메시지 유실 시 최대 지연)
+DEFAULT_TOKEN_CACHE_TTL = 30
+
+# 최대 보관 토큰 수
+DEFAULT_TOKEN_CACHE_SIZE = 10000
+
+
+class VerifiedTokenCache:
+    """jti 기반 검증 토큰 캐시 (LRU + TTL)"""
+
+    def __init__(
+        self,
+        max_size: int = DEFAULT_TOKEN_CACHE_SIZE,
+        ttl: float = DEFAULT_TOKEN_CACHE_TTL,
+    ):
+        """
+        캐시 초기화
+
+        Args:
+            max_size: 최대 보관 토큰 수
+            ttl: 최대 보관 시간 (초)
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        # jti -> (토큰, 클레임, 만료 시각)
+        self._entries: "OrderedDict[str, Tuple[str, Dict[str, Any], float]]" = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, jti: str, token: str) -> Optional[Dict[str, Any]]:
+        """
+        검증된 클레임 조회
+
+        Args:
+            jti: 토큰 ID
+            token: 요청에 포함된 토큰 문자열
+
+        Returns:
+            Optional[Dict[str, Any]]: 클레임 (없거나 만료되었으면 None)
+        """
+        with self._lock:
+            entry = self._entries.get(jti)
+            if entry is None or entry[0] != token:
+                self.misses += 1
+                return None
+            if entry[2] <= time.time():
+                del self._entries[jti]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(jti)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, token: str, claims: Dict[str, Any]) -> None:
+        """
+        검증된 클레임 저장
+
+        Args:
+            token: 토큰 문자열
+            claims: 검증된 클레임 (``jti``, ``exp`` 포함)
+        """
+        expires_at = min(float(claims["exp"]), time.time() + self.ttl)
+        with self._lock:
+            self._entries[claims["jti"]] = (token, claims, expires_at)
+            self._entries.move_to_end(claims["jti"])
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def revoke(self, jti: str) -> None:
+        """
+        토큰 제거
+
+        Args:
+            jti: 토큰 ID
+        """
+        with self._lock:
+            self._entries.pop(jti, None)
+
+    def revoke_subject(self, subject: str) -> None:
+        """
+        사용자의 모든 토큰 제거 (드문 작업이므로 전체 순회)
+
+        Args:
+            subject: 토큰 ``sub``
+        """
+        with self._lock:
+            for jti in [
+                jti
+                for jti, (_, claims, _) in self._entries.items()
+                if str(claims.get("sub")) == subject
+            ]:
+                del self._entries[jti]
+
+    def apply(self, message: Dict[str, Any]) -> None:
+        """
+        무효화 메시지 적용
+
+        Args:
+            message: ``{"jti": ...}`` 또는 ``{"sub": ...}``
+        """
+        if message.get("jti"):
+            self.revoke(message["jti"])
+        elif message.get("sub") is not None:
+            self.revoke_subject(str(message["sub"]))
+
+    def clear(self) -> None:
+        """캐시 비우기"""
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        캐시 통계
+
+        Returns:
+            Dict[str, Any]: 크기, 적중/실패 수
+        """
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+class TokenRevocationBus:
+    """토큰 무효화 전파 (Redis pub/sub)"""
+
+    def __init__(self, cache: VerifiedTokenCache, channel: str = REVOCATION_CHANNEL):
+        """
+        전파 버스 초기화
+
+        Args:
+            cache: 무효화를 적용할 로컬 캐시
+            channel: pub/sub 채널
+        """
+        self.cache = cache
+        self.channel = channel
+        self._task: Optional[asyncio.Task] = None
+        self._pubsub: Optional[Any] = None
+
+    @property
+    def listening(self) -> bool:
+        """무효화 구독 중 여부"""
+        return self._task is not None and not self._task.done()
+
+    def publish(self, redis_client: Optional[Any], message: Dict[str, Any]) -> None:
+        """
+        무효화 적용 및 전파
+
+        로컬 캐시에는 즉시 적용하고, Redis 가 있으면 다른 워커에 전파합니다.
+
+        Args:
+            redis_client: 동기 Redis 클라이언트 (None 이면 로컬에만 적용)
+            message: ``{"jti": ...}`` 또는 ``{"sub": ...}``
+        """
+        self.cache.apply(message)
+        if redis_client is None:
+            return
+        try:
+            redis_client.publish(self.channel, json.dumps(message))
+        except Exception as e:
+            logger.error("token_revocation_publish_failed", error=str(e))
+
+    async def start(self, redis_async_client: Any) -> None:
+        """
+        무효화 구독 시작
+
+        Args:
+            redis_async_client: ``redis.asyncio.Redis`` 클라이언트
+        """
+        if self._task is None and redis_async_client is not None:
+            self._pubsub = redis_async_client.pubsub()
+            await self._pubsub.subscribe(self.channel)
+            self._task = asyncio.create_task(self._listen(self._pubsub))
+
+    async def stop(self) -> None:
+        """무효화 구독 중지"""
+        if self._task is not None:
+            self._task.cancel()
+            # 종료가 연결 정리에 묶이지 않도록 대기 시간 제한
+            await asyncio.wait({self._task}, timeout=1)
+            self._task = None
+        if self._pubsub is not None:
+            close = getattr(self._pubsub, "aclose", None) or self._pubsub.close
+            with suppress(Exception):
+                await asyncio.wait_for(close(), timeout=1)
+            self._pubsub = None
+
+    async def _listen(self, pubsub: Any) -> None:
+        try:
+            async for item in pubsub.listen():
+                if item.get("type") != "message":
+                    continue
+                try:
+                    self.cache.apply(json.loads(item["data"]))
+                except Exception as e:
+                    logger.error("token_revocation_apply_failed", error=str(e))
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            # 구독이 끊기면 로컬 캐시를 믿을 수 없으므로 비움 (listening 이 False 가 됨)
+            self.cache.clear()
+            logger.error("token_revocation_listener_failed", error=str(e))
+
+
+# 전역 검증 토큰 캐시 및 무효화 버스
+verified_token_cache = VerifiedTokenCache(
+    max_size=getattr(settings, "TOKEN_CACHE_SIZE", DEFAULT_TOKEN_CACHE_SIZE),
+    ttl=getattr(settings, "TOKEN_CACHE_TTL", DEFAULT_TOKEN_CACHE_TTL),
+)
+token_revocation_bus = TokenRevocationBus(verified_token_cache)
@@ -0,0 +1,411 @@
+"""
+웹소켓 팬아웃(fan-out) 모듈
+
+하나의 메시지를 여러 웹소켓 연결로 보내는 경로를 제공합니다.
+
+- 메시지는 한 번만 JSON 으로 직렬화하고, 같은 텍스트 프레임을 모든 연결에 전달합니다.
+- 연결마다 크기가 제한된 전송 큐와 전송 작업을 두어 모든 연결에 동시에 전송합니다.
+  발행(publish)은 큐에 넣기만 하므로 느린 클라이언트가 다른 클라이언트를 막지 않습니다.
+- 큐가 가득 차거나 전송이 제한 시간을 넘는 느린 소비자(slow consumer)는 연결을 끊습니다.
+- 발행 소요 시간과 프레임 전달 지연(큐 삽입 → 전송 완료)을 메트릭으로 제공합니다.
+
+발행은 큐에 넣은 시점에 성공으로 간주합니다. 이후 축출/전송 실패로 보내지 못한
+프레임은 다시 시도하지 않고 ``frames_discarded`` 메트릭과 로그로만 남습니다.
+전달 보장이 필요하면 ``on_sent`` 로 전송 완료를 확인해야 합니다.
+"""
+
+import asyncio
+import json
+import logging
+import time
+from collections import deque
+from typing import (Any, Awaitable, Callable, Deque, Dict, Hashable, Iterable,
+                    Optional, Tuple)
+
+logger = logging.getLogger(__name__)
+
+# 연결당 전송 큐 크기
+DEFAULT_SEND_QUEUE_SIZE = 256
+
+# 프레임 1개 전송 제한 시간 (초)
+DEFAULT_SEND_TIMEOUT = 5.0
+
+# 느린 소비자 연결 종료 코드 (1013: Try Again Later)
+SLOW_CONSUMER_CLOSE_CODE = 1013
+
+# 지연 시간 백분위 계산용 표본 수
+LATENCY_SAMPLE_SIZE = 2048
+
+# 프레임 전송 완료 콜백: (연결 키) -> None
+SentCallback = Callable[[Hashable], None]
+
+
+def encode_message(payload: Any) -> str:
+    """
+    메시지를 웹소켓 텍스트 프레임으로 직렬화 (``send_json`` 과 같은 형식)
+
+    Args:
+        payload: 메시지 데이터
+
+    Returns:
+        str: JSON 문자열
+    """
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":"), default=str)
+
+
+def _percentile(samples: Iterable[float], percentile: float) -> float:
+    """정렬된 표본의 백분위 값"""
+    ordered = sorted(samples)
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, int(round(percentile / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+class FanoutMetrics:
+    """팬아웃 메트릭"""
+
+    def __init__(self, sample_size: int = LATENCY_SAMPLE_SIZE):
+        """
+        메트릭 초기화
+
+        Args:
+            sample_size: 지연 시간 표본 보관 수
+        """
+        self.messages = 0
+        self.frames_enqueued = 0
+        self.frames_sent = 0
+        self.frames_dropped = 0
+        self.frames_discarded = 0
+        self.send_errors = 0
+        self.evictions = 0
+        self.publish_seconds: Deque[float] = deque(maxlen=sample_size)
+        self.delivery_seconds: Deque[float] = deque(maxlen=sample_size)
+
+    def record_publish(self, recipients: int, enqueued: int, seconds: float) -> None:
+        """발행 1건 기록"""
+        self.messages += 1
+        self.frames_enqueued += enqueued
+        self.frames_dropped += recipients - enqueued
+        self.publish_seconds.append(seconds)
+
+    def record_delivery(self, seconds: float) -> None:
+        """프레임 전송 완료 기록"""
+        self.frames_sent += 1
+        self.delivery_seconds.append(seconds)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        현재 메트릭 조회
+
+        Returns:
+            Dict[str, Any]: 카운터와 지연 시간 백분위 (밀리초)
+        """
+        publish = list(self.publish_seconds)
+        delivery = list(self.delivery_seconds)
+        return {
+            "messages": self.messages,
+            "frames_enqueued": self.frames_enqueued,
+            "frames_sent": self.frames_sent,
+            "frames_dropped": self.frames_dropped,
+            "frames_discarded": self.frames_discarded,
+            "send_errors": self.send_errors,
+            "evictions": self.evictions,
+            "publish_ms": {
+                f"p{p}": round(_percentile(publish, p) * 1000, 3) for p in (50, 95, 99)
+            },
+            "delivery_ms": {
+                f"p{p}": round(_percentile(delivery, p) * 1000, 3) for p in (50, 95, 99)
+            },
+        }
+
+
+class ConnectionSender:
+    """연결별 전송 큐와 전송 작업"""
+
+    def __init__(
+        self,
+        key: Hashable,
+        websocket: Any,
+        hub: "FanoutHub",
+        max_queue: int = DEFAULT_SEND_QUEUE_SIZE,
+        send_timeout: float = DEFAULT_SEND_TIMEOUT,
+    ):
+        """
+        전송기 초기화
+
+        Args:
+            key: 연결 키
+            websocket: ``send_text`` 를 지원하는 웹소켓
+            hub: 소속 팬아웃 허브
+            max_queue: 전송 큐 크기
+            send_timeout: 프레임 1개 전송 제한 시간 (초)
+        """
+        self.key = key
+        self.websocket = websocket
+        self.hub = hub
+        self.send_timeout = send_timeout
+        self.queue: "asyncio.Queue[Tuple[str, float, Optional[SentCallback]]]" = (
+            asyncio.Queue(max_queue)
+        )
+        self.task: Optional[asyncio.Task] = None
+        self.closed = False
+        self._timed_out = False
+
+    def start(self) -> None:
+        """전송 작업 시작"""
+        self.task = asyncio.get_running_loop().create_task(self._run())
+
+    def offer(
+        self,
+        frame: str,
+        enqueued_at: float,
+        on_sent: Optional[SentCallback] = None,
+    ) -> bool:
+        """
+        프레임을 전송 큐에 추가 (대기하지 않음)
+
+        Args:
+            frame: 직렬화된 프레임
+            enqueued_at: 발행 시각 (``time.perf_counter``)
+            on_sent: 전송 완료 후 호출할 함수 (연결 키를 인자로 받음)
+
+        Returns:
+            bool: 추가 여부 (큐가 가득 차면 느린 소비자로 연결을 끊고 False)
+        """
+        if self.closed:
+            return False
+        try:
+            self.queue.put_nowait((frame, enqueued_at, on_sent))
+            return True
+        except asyncio.QueueFull:
+            self.hub.evict(self, "전송 큐 초과")
+            return False
+
+    def _on_send_timeout(self, task: asyncio.Task) -> None:
+        """전송 제한 시간 초과 시 전송 작업 취소"""
+        self._timed_out = True
+        task.cancel()
+
+    async def _run(self) -> None:
+        """큐의 프레임을 순서대로 전송"""
+        metrics = self.hub.metrics
+        loop = asyncio.get_running_loop()
+        task = asyncio.current_task()
+        while True:
+            frame, enqueued_at, on_sent = await self.queue.get()
+            # wait_for 는 프레임마다 작업을 새로 만들므로 타이머 콜백으로 제한 시간 적용
+            self._timed_out = False
+            timer = loop.call_later(self.send_timeout, self._on_send_timeout, task)
+            try:
+                await self.websocket.send_text(frame)
+            except asyncio.CancelledError:
+                if not self._timed_out:
+                    metrics.frames_discarded += 1
+                    raise
+                metrics.frames_discarded += 1
+                self.hub.evict(self, "전송 제한 시간 초과")
+                return
+            except Exception as e:
+                metrics.send_errors += 1
+                metrics.frames_discarded += 1
+                self.hub.evict(self, f"전송 실패: {str(e)}")
+                return
+            finally:
+                timer.cancel()
+                self.queue.task_done()
+            metrics.record_delivery(time.perf_counter() - enqueued_at)
+            if on_sent is not None:
+                try:
+                    on_sent(self.key)
+                except Exception as e:
+                    logger.error(f"전송 완료 콜백 실패 ({self.key}): {str(e)}")
+
+    async def join(self) -> None:
+        """큐에 남은 프레임 전송 완료 대기"""
+        await self.queue.join()
+
+    async def stop(self) -> None:
+        """전송 작업 중지 (남은 프레임은 버리고 ``frames_discarded`` 에 기록)"""
+        self.closed = True
+        task, self.task = self.task, None
+        if task is not None and task is not asyncio.current_task():
+            task.cancel()
+            try:
+                await task
+            except (asyncio.CancelledError, Exception):
+                pass
+        discarded = 0
+        while not self.queue.empty():
+            self.queue.get_nowait()
+            self.queue.task_done()
+            discarded += 1
+        if discarded:
+            self.hub.metrics.frames_discarded += discarded
+            logger.warning(f"웹소켓 미전송 프레임 {discarded}건 폐기 ({self.key})")
+
+
+class FanoutHub:
+    """연결 전송기 모음과 발행 경로"""
+
+    def __init__(
+        self,
+        max_queue: int = DEFAULT_SEND_QUEUE_SIZE,
+        send_timeout: float = DEFAULT_SEND_TIMEOUT,
+        on_evict: Optional[Callable[[Hashable], Awaitable[None]]] = None,
+    ):
+        """
+        팬아웃 허브 초기화
+
+        Args:
+            max_queue: 연결당 전송 큐 크기
+            send_timeout: 프레임 1개 전송 제한 시간 (초)
+            on_evict: 느린 소비자 축출 시 호출할 코루틴 함수 (없으면 연결만 닫음)
+        """
+        self.max_queue = max_queue
+        self.send_timeout = send_timeout
+        self.on_evict = on_evict
+        self.senders: Dict[Hashable, ConnectionSender] = {}
+        self.metrics = FanoutMetrics()
+        self._background: set = set()
+
+    def __len__(self) -> int:
+        return len(self.senders)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self.senders
+
+    def add(self, key: Hashable, websocket: Any) -> ConnectionSender:
+        """
+        연결 등록 및 전송 작업 시작
+
+        Args:
+            key: 연결 키
+            websocket: 웹소켓
+
+        Returns:
+            ConnectionSender: 전송기
+        """
+        sender = ConnectionSender(
+            key, websocket, self, self.max_queue, self.send_timeout
+        )
+        sender.start()
+        previous = self.senders.pop(key, None)
+        if previous is not None:
+            self._spawn(previous.stop())
+        self.senders[key] = sender
+        return sender
+
+    async def remove(self, key: Hashable) -> None:
+        """
+        연결 등록 해제 및 전송 작업 중지
+
+        Args:
+            key: 연결 키
+        """
+        sender = self.senders.pop(key, None)
+        if sender is not None:
+            await sender.stop()
+
+    def publish(
+        self,
+        payload: Any,
+        keys: Iterable[Hashable],
+        on_sent: Optional[SentCallback] = None,
+    ) -> int:
+        """
+        메시지를 한 번 직렬화해 대상 연결의 전송 큐에 추가
+
+        Args:
+            payload: 메시지 데이터 (문자열이면 이미 직렬화된 프레임으로 간주)
+            keys: 대상 연결 키
+            on_sent: 연결마다 전송이 완료되면 호출할 함수 (연결 키를 인자로 받음)
+
+        Returns:
+            int: 큐에 추가된 연결 수
+        """
+        started = time.perf_counter()
+        frame = payload if isinstance(payload, str) else encode_message(payload)
+        recipients = 0
+        enqueued = 0
+        for key in keys:
+            sender = self.senders.get(key)
+            if sender is None:
+                continue
+            recipients += 1
+            if sender.offer(frame, started, on_sent):
+                enqueued += 1
+        self.metrics.record_publish(
+            recipients, enqueued, time.perf_counter() - started
+        )
+        return enqueued
+
+    def publish_all(self, payload: Any) -> int:
+        """
+        모든 연결에 발행
+
+        Args:
+            payload: 메시지 데이터
+
+        Returns:
+            int: 큐에 추가된 연결 수
+        """
+        return self.publish(payload, list(self.senders))
+
+    def evict(self, sender: ConnectionSender, reason: str) -> None:
+        """
+        느린 소비자 축출 (등록 해제 후 연결 종료)
+
+        같은 키로 재연결해 등록된 새 전송기는 이전 전송기의 축출에 영향받지 않습니다.
+
+        Args:
+            sender: 축출할 전송기
+            reason: 축출 사유
+        """
+        if self.senders.get(sender.key) is not sender:
+            return
+        del self.senders[sender.key]
+        sender.closed = True
+        self.metrics.evictions += 1
+        logger.warning(f"느린 웹소켓 소비자 연결 종료 ({sender.key}): {reason}")
+        self._spawn(self._close_evicted(sender))
+
+    async def _close_evicted(self, sender: ConnectionSender) -> None:
+        """축출된 연결 정리"""
+        await sender.stop()
+        try:
+            # 그 사이 같은 키로 재연결했다면 새 연결은 두고 이전 웹소켓만 닫음
+            if self.on_evict is not None and sender.key not in self.senders:
+                await self.on_evict(sender.key)
+            else:
+                await asyncio.wait_for(
+                    sender.websocket.close(code=SLOW_CONSUMER_CLOSE_CODE),
+                    timeout=self.send_timeout,
+                )
+        except Exception as e:
+            logger.debug(f"축출된 웹소켓 종료 중 오류 ({sender.key}): {str(e)}")
+
+    def _spawn(self, coroutine: Awaitable[None]) -> None:
+        """참조를 유지하는 백그라운드 작업 생성"""
+        task = asyncio.ensure_future(coroutine)
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+
+    async def drain(self, timeout: Optional[float] = None) -> None:
+        """
+        모든 전송 큐가 빌 때까지 대기
+
+        Args:
+            timeout: 최대 대기 시간 (초)
+        """
+        waiters = [sender.join() for sender in list(self.senders.values())]
+        if waiters:
+            await asyncio.wait_for(asyncio.gather(*waiters), timeout=timeout)
+
+    async def close(self) -> None:
+        """모든 전송 작업 중지"""
+        senders = list(self.senders.values())
+        self.senders.clear()
+        await asyncio.gather(*(sender.stop() for sender in senders))
+        if self._background:
+            await asyncio.gather(*self._background, return_exceptions=True)
@@ -3,6 +3,15 @@
 
 실시간 양방향 통신을 위한 WebSocket 관리 기능을 제공합니다.
 연결 관리, 이벤트 처리, 메시지 큐잉 등을 지원합니다.
+
+오프라인 사용자에게 보낸 메시지는 사용자별 오프라인 큐(Redis Stream, Redis 가 없으면
+로컬 파일)에 오프셋과 함께 저장되고, ``websocket_events`` 채널로 다른 워커에 알려
+해당 사용자가 연결된 워커가 즉시 전달합니다. 재연결 시 클라이언트가 마지막으로 받은
+오프셋을 넘기면 그 이후 메시지만 다시 보냅니다. 큐의 메시지는 연결로 전송이 끝나면
+수신 확인(ack)되어 다음 재연결 때 다시 보내지 않습니다. Redis 연결과 구독은
+애플리케이션 시작 시 ``initialize`` 에서 시작합니다. Redis 가 없으면 파일 큐는 워커
+전용 디렉터리를 사용하므로 다른 워커에 연결된 사용자에게는 재연결 전까지 전달되지
+않습니다.
 """
 
 import asyncio
@@ -10,18 +19,30 @@ import json
 import logging
 from collections import defaultdict
 from datetime import datetime, timedelta
-from typing import Any, Callable, Dict, List, Optional, Set
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
 
-from fastapi import WebSocket, WebSocketDisconnect
+from fastapi import WebSocket
 from redis.asyncio import Redis
 from redis.exceptions import RedisError
 
 from packages.api.src.coreconfig import settings
 from packages.api.src.corelogging import get_logger
 from packages.api.src.coremetrics import metrics_collector
+from packages.api.src.corewebsocket_fanout import (DEFAULT_SEND_QUEUE_SIZE,
+                                                   DEFAULT_SEND_TIMEOUT,
+                                                   FanoutHub)
+from packages.api.src.corewebsocket_offline_queue import (
+    DEFAULT_QUEUE_MAXLEN, DEFAULT_QUEUE_TTL, REPLAY_BATCH_SIZE, FileMessageQueue,
+    OfflineMessageQueue, RedisStreamMessageQueue)
 
 logger = get_logger(__name__)
 
+# 워커 간 웹소켓 이벤트 채널
+EVENTS_CHANNEL = "websocket_events"
+
+# 오프라인 메시지 전달 이벤트 유형
+DELIVER_EVENT = "ws_deliver"
+
 
 class WebSocketManager:
     """웹소켓 연결 및 이벤트 관리 클래스"""
@@ -33,51 +54,131 @@ class WebSocketManager:
         self.user_rooms: Dict[str, Set[str]] = defaultdict(set)
         self.room_subscribers: Dict[str, Set[str]] = defaultdict(set)
 
-        # 메시지 큐
-        self.message_queue: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
-        self.queue_size_limit = getattr(settings, "WS_QUEUE_SIZE_LIMIT", 1000)
+        # 연결별 전송 큐 (메시지는 한 번만 직렬화하고 모든 연결에 동시 전송)
+        self.fanout = FanoutHub(
+            max_queue=getattr(settings, "WS_SEND_QUEUE_SIZE", DEFAULT_SEND_QUEUE_SIZE),
+            send_timeout=getattr(settings, "WS_SEND_TIMEOUT", DEFAULT_SEND_TIMEOUT),
+            on_evict=self._evict_connection,
+        )
+
+        # 오프라인 메시지 큐 (Redis 연결 시 Redis Stream 으로 교체)
+        self.queue_size_limit = getattr(
+            settings, "WS_QUEUE_SIZE_LIMIT", DEFAULT_QUEUE_MAXLEN
+        )
+        self.queue_ttl = getattr(settings, "WS_OFFLINE_TTL", DEFAULT_QUEUE_TTL)
+        self.offline_dir = getattr(
+            settings, "WS_OFFLINE_DIR", "offline_storage/websocket"
+        )
+        self.offline_queue: OfflineMessageQueue = FileMessageQueue(
+            self.offline_dir, maxlen=self.queue_size_limit
+        )
 
         # Redis Pub/Sub
         self.redis: Optional[Redis] = None
         self.pubsub = None
+        self._listener_task: Optional[asyncio.Task] = None
+        self._monitor_task: Optional[asyncio.Task] = None
 
         # 재연결 설정
         self.max_reconnect_attempts = 3
         self.reconnect_delay = 5  # 초
 
+        # 전송이 끝나 수신 확인할 사용자별 오프셋과 진행 중인 확인 작업
+        self._delivered_offsets: Dict[str, str] = {}
+        self._ack_tasks: Dict[str, asyncio.Task] = {}
+
         # 이벤트 핸들러
         self.event_handlers: Dict[str, List[Callable]] = defaultdict(list)
+        self.register_event_handler(DELIVER_EVENT, self._deliver_queued_message)
+
+    async def initialize(self) -> None:
+        """
+        비동기 초기화 (애플리케이션 시작 시 lifespan 에서 호출)
 
-    async def initialize(self):
-        """비동기 초기화"""
+        Redis 에 연결되면 워커 간 공유되는 Redis Stream 큐와 ``websocket_events``
+        구독을 사용하고, 연결되지 않으면 워커 전용 디렉터리의 파일 큐를 사용합니다.
+        """
         await self._setup_redis()
+        if self.redis is None:
+            self.offline_queue = FileMessageQueue.for_worker(
+                self.offline_dir, maxlen=self.queue_size_limit
+            )
+            logger.warning(
+                f"Redis 없이 워커 전용 오프라인 큐 사용: {self.offline_queue.base_dir}"
+            )
         await self._start_connection_monitor()
 
+    async def close(self) -> None:
+        """수신/모니터링 작업, Redis 연결, 연결별 전송 큐 정리 (애플리케이션 종료 시)"""
+        for task in (self._monitor_task, self._listener_task):
+            if task is not None:
+                task.cancel()
+        self._monitor_task = self._listener_task = None
+        await self._close_redis()
+        await self.fanout.close()
+        close_queue = getattr(self.offline_queue, "close", None)
+        if close_queue is not None:
+            close_queue()
+
     async def _setup_redis(self) -> None:
-        """Redis Pub/Sub 설정"""
+        """Redis Pub/Sub 설정 (구독에 성공한 경우에만 Redis 큐로 전환)"""
+        redis = Redis(
+            host=settings.REDIS_HOST,
+            port=settings.REDIS_PORT,
+            db=settings.REDIS_DB,
+            password=settings.REDIS_PASSWORD,
+            decode_responses=True,
+        )
+        pubsub = redis.pubsub()
         try:
-            self.redis = Redis(
-                host=settings.REDIS_HOST,
-                port=settings.REDIS_PORT,
-                db=settings.REDIS_DB,
-                password=settings.REDIS_PASSWORD,
-                decode_responses=True,
-            )
-            self.pubsub = self.redis.pubsub()
-            await self.pubsub.subscribe("websocket_events")
-            logger.info("Redis Pub/Sub 연결 성공")
-
-            # 메시지 수신 루프 시작
-            asyncio.create_task(self._redis_message_handler())
+            await pubsub.subscribe(EVENTS_CHANNEL)
         except Exception as e:
             logger.error(f"Redis Pub/Sub 연결 실패: {str(e)}")
+            await pubsub.close()
+            await redis.close()
+            return
+
+        await self._close_redis()
+        self.redis, self.pubsub = redis, pubsub
+        logger.info("Redis Pub/Sub 연결 성공")
+
+        # 워커 간 공유되는 오프라인 큐 사용
+        close_queue = getattr(self.offline_queue, "close", None)
+        if close_queue is not None:
+            close_queue()
+        self.offline_queue = RedisStreamMessageQueue(
+            self.redis, maxlen=self.queue_size_limit, ttl=self.queue_ttl
+        )
+
+        # 메시지 수신 루프 시작
+        self._listener_task = asyncio.create_task(self._redis_message_handler())
+
+    async def _close_redis(self) -> None:
+        """이전 수신 루프와 Redis 연결 정리"""
+        if self._listener_task is not None:
+            self._listener_task.cancel()
+            self._listener_task = None
+        pubsub, redis = self.pubsub, self.redis
+        self.pubsub = self.redis = None
+        try:
+            if pubsub is not None:
+                await pubsub.close()
+            if redis is not None:
+                await redis.close()
+        except RedisError as e:
+            logger.debug(f"Redis 연결 종료 중 오류: {str(e)}")
 
     async def _start_connection_monitor(self) -> None:
         """연결 상태 모니터링 시작"""
-        asyncio.create_task(self._monitor_connections())
+        if self._monitor_task is None:
+            self._monitor_task = asyncio.create_task(self._monitor_connections())
 
     async def connect(
-        self, websocket: WebSocket, client_id: str, user_id: Optional[str] = None
+        self,
+        websocket: WebSocket,
+        client_id: str,
+        user_id: Optional[str] = None,
+        last_offset: Optional[str] = None,
     ) -> None:
         """
         새로운 웹소켓 연결 수락
@@ -86,16 +187,19 @@ class WebSocketManager:
             websocket: WebSocket 인스턴스
             client_id: 클라이언트 식별자
             user_id: 사용자 ID (선택)
+            last_offset: 클라이언트가 마지막으로 받은 오프라인 메시지 오프셋 (선택)
         """
         await websocket.accept()
-        self.active_connections[user_id or "anonymous"][client_id] = websocket
+        user_key = user_id or "anonymous"
+        self.active_connections[user_key][client_id] = websocket
+        self.fanout.add((user_key, client_id), websocket)
 
         # 연결 메트릭 업데이트
         metrics_collector.update_connection_count(self._get_total_connections())
 
         # 큐에 있는 메시지 전송
-        if user_id and user_id in self.message_queue:
-            await self._send_queued_messages(user_id)
+        if user_id:
+            await self._send_queued_messages(user_id, client_id, last_offset)
 
     async def disconnect(self, client_id: str, user_id: Optional[str] = None) -> None:
         """
@@ -105,15 +209,22 @@ class WebSocketManager:
             client_id: 클라이언트 식별자
             user_id: 사용자 ID (선택)
         """
-        user_connections = self.active_connections[user_id or "anonymous"]
+        user_key = user_id or "anonymous"
+        user_connections = self.active_connections[user_key]
+        await self.fanout.remove((user_key, client_id))
         if client_id in user_connections:
-            websocket = user_connections[client_id]
-            await websocket.close()
-            del user_connections[client_id]
+            websocket = user_connections.pop(client_id)
 
             # 사용자의 연결이 없으면 제거
             if not user_connections:
-                del self.active_connections[user_id or "anonymous"]
+                self.active_connections.pop(user_key, None)
+
+            try:
+                await asyncio.wait_for(
+                    websocket.close(), timeout=self.fanout.send_timeout
+                )
+            except Exception as e:
+                logger.debug(f"웹소켓 종료 중 오류 (클라이언트 ID: {client_id}): {str(e)}")
 
             # 룸 구독 해제
             for room in list(self.user_rooms.get(user_id, set())):
@@ -139,36 +250,28 @@ class WebSocketManager:
             retry: 재시도 여부
 
         Returns:
-            전송 성공 여부
+            사용자 연결의 전송 큐에 추가되었으면 True. 실제 전송은 비동기로 진행되며,
+            이후 축출/전송 실패로 보내지 못한 메시지는 다시 큐에 넣지 않고
+            팬아웃 메트릭(``frames_discarded``)과 로그로만 남습니다. 오프라인
+            사용자는 오프라인 큐에 저장하고 False 를 반환합니다.
         """
         if user_id not in self.active_connections:
             # 오프라인 사용자면 메시지 큐에 저장
-            self._queue_message(user_id, message, message_type)
+            await self._queue_message(user_id, message, message_type)
             return False
 
-        try:
-            message_data = {
-                "type": message_type,
-                "data": message,
-                "timestamp": datetime.now().isoformat(),
-            }
-
-            for websocket in self.active_connections[user_id].values():
-                try:
-                    await websocket.send_json(message_data)
-                except WebSocketDisconnect:
-                    continue
-                except Exception as e:
-                    logger.error(f"메시지 전송 실패 (사용자 ID: {user_id}): {str(e)}")
-                    if retry:
-                        self._queue_message(user_id, message, message_type)
-                    return False
+        message_data = {
+            "type": message_type,
+            "data": message,
+            "timestamp": datetime.now().isoformat(),
+        }
+        if self.fanout.publish(message_data, self._connection_keys([user_id])):
             return True
-        except Exception as e:
-            logger.error(f"메시지 전송 중 오류 발생: {str(e)}")
-            if retry:
-                self._queue_message(user_id, message, message_type)
-            return False
+
+        logger.error(f"메시지 전송 실패 (사용자 ID: {user_id}): 전송 가능한 연결 없음")
+        if retry:
+            await self._queue_message(user_id, message, message_type)
+        return False
 
     async def broadcast(
         self,
@@ -179,6 +282,9 @@ class WebSocketManager:
         """
         모든 연결된 클라이언트에게 메시지 브로드캐스트
 
+        메시지는 한 번만 직렬화되어 연결별 전송 큐에 추가되며, 전송은 연결마다
+        동시에 진행됩니다.
+
         Args:
             message: 전송할 메시지
             exclude: 제외할 사용자 ID 목록
@@ -191,15 +297,10 @@ class WebSocketManager:
             "timestamp": datetime.now().isoformat(),
         }
 
-        for user_id, connections in self.active_connections.items():
-            if user_id in exclude:
-                continue
-
-            for websocket in connections.values():
-                try:
-                    await websocket.send_json(message_data)
-                except Exception as e:
-                    logger.error(f"브로드캐스트 실패 (사용자 ID: {user_id}): {str(e)}")
+        user_ids = [
+            user_id for user_id in self.active_connections if user_id not in exclude
+        ]
+        self.fanout.publish(message_data, self._connection_keys(user_ids))
 
     async def join_room(self, user_id: str, room: str) -> None:
         """
@@ -254,10 +355,32 @@ class WebSocketManager:
             "timestamp": datetime.now().isoformat(),
         }
 
+        online = []
+        offline = []
         for user_id in self.room_subscribers[room]:
             if user_id == sender_id:
                 continue
-            await self.send_personal_message(message_data, user_id, message_type)
+            if user_id in self.active_connections:
+                online.append(user_id)
+            else:
+                offline.append(user_id)
+
+        self.fanout.publish(message_data, self._connection_keys(online))
+        for user_id in offline:
+            await self._queue_message(user_id, message_data, message_type)
+
+    async def ack_offline_messages(self, user_id: str, offset: str) -> None:
+        """
+        오프라인 메시지 수신 확인 (오프셋까지의 메시지 삭제)
+
+        Args:
+            user_id: 사용자 ID
+            offset: 클라이언트가 마지막으로 처리한 메시지 오프셋
+        """
+        try:
+            await self.offline_queue.ack(user_id, offset)
+        except (RedisError, OSError, ValueError) as e:
+            logger.error(f"오프라인 메시지 확인 실패 (사용자 ID: {user_id}): {str(e)}")
 
     def register_event_handler(self, event_type: str, handler: Callable) -> None:
         """
@@ -284,62 +407,202 @@ class WebSocketManager:
                 except Exception as e:
                     logger.error(f"이벤트 핸들러 실행 실패 ({event_type}): {str(e)}")
 
-    def _queue_message(self, user_id: str, message: Any, message_type: str) -> None:
-        """메시지를 큐에 추가"""
-        if len(self.message_queue[user_id]) >= self.queue_size_limit:
-            self.message_queue[user_id].pop(0)  # 가장 오래된 메시지 제거
+    async def _queue_message(
+        self, user_id: str, message: Any, message_type: str
+    ) -> Optional[str]:
+        """
+        메시지를 오프라인 큐에 추가하고 다른 워커에 전달 이벤트 발행
 
-        self.message_queue[user_id].append(
-            {
-                "type": message_type,
-                "data": message,
-                "timestamp": datetime.now().isoformat(),
+        Args:
+            user_id: 수신자 ID
+            message: 메시지
+            message_type: 메시지 유형
+
+        Returns:
+            Optional[str]: 메시지 오프셋 (저장 실패 시 None)
+        """
+        message_data = {
+            "type": message_type,
+            "data": message,
+            "timestamp": datetime.now().isoformat(),
+        }
+        try:
+            offset = await self.offline_queue.append(user_id, message_data)
+        except (RedisError, OSError) as e:
+            logger.error(f"오프라인 메시지 저장 실패 (사용자 ID: {user_id}): {str(e)}")
+            return None
+
+        # 사용자가 다른 워커에 연결되어 있으면 그 워커가 전달
+        if self.redis is not None:
+            event = {
+                "event_type": DELIVER_EVENT,
+                "data": {"user_id": user_id, "offset": offset, "message": message_data},
             }
+            try:
+                await self.redis.publish(
+                    EVENTS_CHANNEL, json.dumps(event, ensure_ascii=False, default=str)
+                )
+            except RedisError as e:
+                logger.warning(f"오프라인 메시지 전달 이벤트 발행 실패: {str(e)}")
+        return offset
+
+    def _ack_when_sent(self, user_id: str, offset: str) -> Callable[[Any], None]:
+        """
+        전송 완료 시 오프라인 큐 수신 확인을 예약하는 콜백 생성
+
+        전송 완료는 연결 순서대로 들어오므로 사용자별로 마지막 오프셋만 남기고,
+        확인 작업은 사용자당 하나만 실행해 전송마다 큐 I/O 가 쌓이지 않게 합니다.
+
+        Args:
+            user_id: 사용자 ID
+            offset: 메시지 오프셋
+
+        Returns:
+            Callable[[Any], None]: 팬아웃 전송 완료 콜백
+        """
+
+        def on_sent(_key: Any) -> None:
+            self._delivered_offsets[user_id] = offset
+            if user_id not in self._ack_tasks:
+                self._ack_tasks[user_id] = asyncio.ensure_future(
+                    self._flush_delivered(user_id)
+                )
+
+        return on_sent
+
+    async def _flush_delivered(self, user_id: str) -> None:
+        """전송 완료된 마지막 오프셋까지 수신 확인"""
+        try:
+            while user_id in self._delivered_offsets:
+                offset = self._delivered_offsets.pop(user_id)
+                await self.ack_offline_messages(user_id, offset)
+        finally:
+            self._ack_tasks.pop(user_id, None)
+
+    async def _deliver_queued_message(self, data: Dict[str, Any]) -> None:
+        """다른 워커가 큐에 넣은 메시지를 이 워커의 연결로 전달 (전달 이벤트 핸들러)"""
+        user_id = data["user_id"]
+        if user_id not in self.active_connections:
+            return
+        offset = data["offset"]
+        message_data = dict(data["message"], offset=offset)
+        self.fanout.publish(
+            message_data,
+            self._connection_keys([user_id]),
+            on_sent=self._ack_when_sent(user_id, offset),
         )
 
-    async def _send_queued_messages(self, user_id: str) -> None:
-        """큐에 있는 메시지 전송"""
-        if user_id in self.message_queue:
-            for message in self.message_queue[user_id]:
-                await self.send_personal_message(
-                    message["data"], user_id, message["type"], retry=False
+    async def _send_queued_messages(
+        self, user_id: str, client_id: str, last_offset: Optional[str] = None
+    ) -> None:
+        """
+        오프라인 큐의 메시지를 새 연결로 재전송
+
+        클라이언트가 오프셋을 넘기면 그 오프셋까지는 수신 확인으로 보고 이후 메시지만
+        보냅니다. 오프셋을 모르는 클라이언트에게는 전체를 보냅니다. 각 메시지는
+        전송이 끝나면 수신 확인되므로 중간에 끊겨도 보내지 못한 메시지만 남습니다.
+
+        Args:
+            user_id: 사용자 ID
+            client_id: 클라이언트 식별자
+            last_offset: 클라이언트가 마지막으로 받은 오프셋
+        """
+        key = (user_id, client_id)
+        after = last_offset
+        try:
+            if last_offset:
+                await self.offline_queue.ack(user_id, last_offset)
+            while True:
+                batch = await self.offline_queue.read(
+                    user_id, after, REPLAY_BATCH_SIZE
                 )
-            del self.message_queue[user_id]
+                for offset, message_data in batch:
+                    if not self.fanout.publish(
+                        dict(message_data, offset=offset),
+                        [key],
+                        on_sent=self._ack_when_sent(user_id, offset),
+                    ):
+                        return
+                    after = offset
+                if len(batch) < REPLAY_BATCH_SIZE:
+                    break
+                # 전송 큐가 넘치지 않도록 배치마다 전송 완료 대기
+                sender = self.fanout.senders.get(key)
+                if sender is None:
+                    return
+                await sender.join()
+        except (RedisError, OSError, ValueError) as e:
+            logger.error(f"오프라인 메시지 재전송 실패 (사용자 ID: {user_id}): {str(e)}")
 
     async def _redis_message_handler(self) -> None:
-        """Redis Pub/Sub 메시지 처리"""
+        """Redis Pub/Sub 메시지 처리 (받을 메시지가 없을 때만 대기)"""
+        pubsub = self.pubsub
         while True:
             try:
-                message = await self.pubsub.get_message(ignore_subscribe_messages=True)
-                if message and message["type"] == "message":
-                    data = json.loads(message["data"])
-                    await self.trigger_event(data["event_type"], data["data"])
+                message = await pubsub.get_message(
+                    ignore_subscribe_messages=True, timeout=1.0
+                )
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Redis 메시지 수신 실패: {str(e)}")
+                await asyncio.sleep(1)
+                continue
+            if message is None:
+                await asyncio.sleep(0.01)
+                continue
+            if message["type"] != "message":
+                continue
+            try:
+                data = json.loads(message["data"])
+                await self.trigger_event(data["event_type"], data["data"])
             except Exception as e:
                 logger.error(f"Redis 메시지 처리 실패: {str(e)}")
-            await asyncio.sleep(0.1)
 
     async def _monitor_connections(self) -> None:
         """연결 상태 주기적 모니터링"""
         while True:
             try:
-                # 연결 상태 확인
-                for user_id, connections in list(self.active_connections.items()):
-                    for client_id, websocket in list(connections.items()):
-                        try:
-                            await websocket.send_json({"type": "ping"})
-                        except Exception:
-                            await self.disconnect(client_id, user_id)
+                # 연결 상태 확인 (전송 실패/지연 연결은 팬아웃 허브가 정리)
+                self.fanout.publish({"type": "ping"}, list(self.fanout.senders))
 
                 # Redis 연결 확인
                 if not self.redis or not await self.redis.ping():
                     logger.warning("Redis 연결 끊김, 재연결 시도")
                     await self._setup_redis()
+            except RedisError as e:
+                logger.warning(f"Redis 연결 끊김, 재연결 시도: {str(e)}")
+                await self._setup_redis()
 
             except Exception as e:
                 logger.error(f"연결 모니터링 중 오류 발생: {str(e)}")
 
             await asyncio.sleep(30)  # 30초마다 확인
 
+    def _connection_keys(self, user_ids: Iterable[str]) -> List[Tuple[str, str]]:
+        """사용자 ID 목록의 연결 키 목록"""
+        return [
+            (user_id, client_id)
+            for user_id in user_ids
+            for client_id in self.active_connections.get(user_id, {})
+        ]
+
+    async def _evict_connection(self, key: Tuple[str, str]) -> None:
+        """느린 소비자 연결 정리 (팬아웃 허브 콜백)"""
+        user_key, client_id = key
+        await self.disconnect(client_id, None if user_key == "anonymous" else user_key)
+
+    def get_fanout_metrics(self) -> Dict[str, Any]:
+        """
+        팬아웃 메트릭 조회
+
+        Returns:
+            Dict[str, Any]: 발행/전달 건수, 축출 수, 지연 시간 백분위
+        """
+        metrics = self.fanout.metrics.snapshot()
+        metrics["connections"] = len(self.fanout)
+        return metrics
+
     def _get_total_connections(self) -> int:
         """전체 활성 연결 수 반환"""
         return sum(len(connections) for connections in self.active_connections.values())
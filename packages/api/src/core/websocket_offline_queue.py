@@ -0,0 +1,420 @@
+"""
+웹소켓 오프라인 메시지 큐 모듈
+
+연결되어 있지 않은 사용자에게 보낸 메시지를 사용자별 링 버퍼에 보관하고,
+재연결 시 마지막으로 받은 오프셋 이후의 메시지를 다시 보냅니다.
+
+- RedisStreamMessageQueue: 사용자별 Redis Stream. ``XADD MAXLEN ~`` 으로 추가와 동시에
+  상한을 유지하며(분할 상환 O(1)), 스트림 ID 가 오프셋입니다. 워커 간 공유되고
+  재시작 후에도 유지됩니다.
+- FileMessageQueue: Redis 가 없을 때 사용하는 로컬 추가 전용(append-only) 파일 큐.
+  사용자별로 세그먼트 파일에 한 줄씩 추가하고, 상한을 넘으면 가장 오래된 세그먼트
+  파일을 통째로 삭제하므로 추가/정리 모두 O(1) 입니다. 오프셋은 일련번호입니다.
+  수신 확인은 확인된 마지막 오프셋을 사용자별 ``ack`` 파일에 기록해 세그먼트 중간까지
+  반영하고(이후 조회에서 제외), 모두 확인된 세그먼트 파일은 삭제합니다.
+  디렉터리는 첫 기록 시점에 만듭니다. 오프셋/세그먼트 상태를 프로세스 메모리에 두므로
+  여러 워커는 ``FileMessageQueue.for_worker`` 로 워커마다 다른 디렉터리를 사용합니다.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import threading
+from abc import ABC, abstractmethod
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+# 사용자별 최대 보관 메시지 수
+DEFAULT_QUEUE_MAXLEN = 1000
+
+# 사용자 큐 보관 기간 (초, 마지막 추가 기준)
+DEFAULT_QUEUE_TTL = 7 * 24 * 3600
+
+# 재연결 시 한 번에 읽을 메시지 수 (연결 전송 큐 크기보다 작게)
+REPLAY_BATCH_SIZE = 100
+
+# 워커 전용 디렉터리 슬롯 수 (base_dir/worker-N)
+MAX_WORKER_SLOTS = 64
+
+# (오프셋, 메시지)
+QueuedMessage = Tuple[str, Dict[str, Any]]
+
+
+class OfflineMessageQueue(ABC):
+    """사용자별 오프라인 메시지 큐"""
+
+    @abstractmethod
+    async def append(self, user_id: str, message: Dict[str, Any]) -> str:
+        """
+        메시지 추가 (상한을 넘으면 가장 오래된 메시지부터 제거)
+
+        Args:
+            user_id: 수신자 ID
+            message: 메시지
+
+        Returns:
+            str: 메시지 오프셋
+        """
+
+    @abstractmethod
+    async def read(
+        self, user_id: str, after: Optional[str] = None, limit: int = REPLAY_BATCH_SIZE
+    ) -> List[QueuedMessage]:
+        """
+        오프셋 이후 메시지 조회
+
+        Args:
+            user_id: 수신자 ID
+            after: 마지막으로 받은 오프셋 (None 이면 처음부터)
+            limit: 최대 조회 수
+
+        Returns:
+            List[QueuedMessage]: 오프셋 순 ``(오프셋, 메시지)`` 목록
+        """
+
+    @abstractmethod
+    async def ack(self, user_id: str, offset: str) -> None:
+        """
+        오프셋까지의 메시지 삭제 (수신 확인)
+
+        Args:
+            user_id: 수신자 ID
+            offset: 마지막으로 처리한 오프셋
+        """
+
+    @abstractmethod
+    async def clear(self, user_id: str) -> None:
+        """
+        사용자 큐 삭제
+
+        Args:
+            user_id: 수신자 ID
+        """
+
+    async def replay(self, user_id: str, after: Optional[str] = None):
+        """
+        오프셋 이후 메시지를 배치 단위로 순회
+
+        Args:
+            user_id: 수신자 ID
+            after: 마지막으로 받은 오프셋
+
+        Yields:
+            QueuedMessage: ``(오프셋, 메시지)``
+        """
+        while True:
+            batch = await self.read(user_id, after, REPLAY_BATCH_SIZE)
+            for item in batch:
+                yield item
+            if len(batch) < REPLAY_BATCH_SIZE:
+                return
+            after = batch[-1][0]
+
+
+class RedisStreamMessageQueue(OfflineMessageQueue):
+    """Redis Stream 기반 오프라인 메시지 큐"""
+
+    def __init__(
+        self,
+        redis: Any,
+        maxlen: int = DEFAULT_QUEUE_MAXLEN,
+        ttl: int = DEFAULT_QUEUE_TTL,
+        key_prefix: str = "ws:offline",
+    ):
+        """
+        Redis Stream 큐 초기화
+
+        Args:
+            redis: ``redis.asyncio.Redis`` 클라이언트 (decode_responses=True)
+            maxlen: 사용자별 최대 보관 메시지 수 (근사 상한)
+            ttl: 마지막 추가 후 큐 보관 기간 (초)
+            key_prefix: 스트림 키 접두사
+        """
+        self.redis = redis
+        self.maxlen = maxlen
+        self.ttl = ttl
+        self.key_prefix = key_prefix
+
+    def _key(self, user_id: str) -> str:
+        return f"{self.key_prefix}:{user_id}"
+
+    async def append(self, user_id: str, message: Dict[str, Any]) -> str:
+        """XADD MAXLEN ~ 로 추가"""
+        key = self._key(user_id)
+        pipeline = self.redis.pipeline(transaction=False)
+        pipeline.xadd(
+            key,
+            {"data": json.dumps(message, ensure_ascii=False, default=str)},
+            maxlen=self.maxlen,
+            approximate=True,
+        )
+        pipeline.expire(key, self.ttl)
+        offset, _ = await pipeline.execute()
+        return offset
+
+    async def read(
+        self, user_id: str, after: Optional[str] = None, limit: int = REPLAY_BATCH_SIZE
+    ) -> List[QueuedMessage]:
+        """XRANGE (after, +] 조회"""
+        entries = await self.redis.xrange(
+            self._key(user_id), min=f"({after}" if after else "-", max="+", count=limit
+        )
+        return [(entry_id, json.loads(fields["data"])) for entry_id, fields in entries]
+
+    async def ack(self, user_id: str, offset: str) -> None:
+        """오프셋 다음 ID 를 MINID 로 XTRIM"""
+        milliseconds, _, sequence = offset.partition("-")
+        await self.redis.xtrim(
+            self._key(user_id), minid=f"{milliseconds}-{int(sequence or 0) + 1}"
+        )
+
+    async def clear(self, user_id: str) -> None:
+        """스트림 삭제"""
+        await self.redis.delete(self._key(user_id))
+
+
+@dataclass
+class _UserLog:
+    """파일 큐의 사용자별 상태"""
+
+    directory: str
+    next_offset: int = 1
+    # 수신 확인된 마지막 오프셋 (이하 오프셋은 조회하지 않음)
+    acked: int = 0
+    # (세그먼트 첫 오프셋, 메시지 수)
+    segments: Deque[List[int]] = field(default_factory=deque)
+    size: int = 0
+
+
+class FileMessageQueue(OfflineMessageQueue):
+    """로컬 추가 전용 세그먼트 파일 기반 오프라인 메시지 큐"""
+
+    def __init__(
+        self,
+        base_dir: str,
+        maxlen: int = DEFAULT_QUEUE_MAXLEN,
+        segment_size: Optional[int] = None,
+    ):
+        """
+        파일 큐 초기화
+
+        Args:
+            base_dir: 저장 디렉터리
+            maxlen: 사용자별 최대 보관 메시지 수 (세그먼트 단위 근사 상한)
+            segment_size: 세그먼트당 메시지 수 (기본값: maxlen 의 1/4)
+        """
+        self.base_dir = base_dir
+        self.maxlen = maxlen
+        self.segment_size = segment_size or max(1, maxlen // 4)
+        self._logs: Dict[str, _UserLog] = {}
+        self._lock = threading.Lock()
+        self._slot_handle = None
+
+    @classmethod
+    def for_worker(
+        cls, base_dir: str, maxlen: int = DEFAULT_QUEUE_MAXLEN, **kwargs: Any
+    ) -> "FileMessageQueue":
+        """
+        워커 전용 디렉터리(``base_dir/worker-N``)를 선점한 파일 큐 생성
+
+        같은 디렉터리를 여러 워커가 쓰면 워커마다 오프셋을 따로 매겨 중복되고 서로의
+        세그먼트를 지우므로, 비어 있는 슬롯의 잠금 파일에 배타 잠금(``flock``)을 걸어
+        워커마다 다른 슬롯을 사용합니다. 잠금은 프로세스가 종료되면 풀리므로 재시작한
+        워커가 슬롯(과 남은 메시지)을 다시 사용합니다. ``fcntl`` 이 없는 환경에서는
+        프로세스 ID 디렉터리를 사용합니다.
+
+        Args:
+            base_dir: 슬롯 디렉터리의 상위 디렉터리
+            maxlen: 사용자별 최대 보관 메시지 수
+            **kwargs: ``FileMessageQueue`` 추가 인자
+
+        Returns:
+            FileMessageQueue: 워커 전용 파일 큐
+
+        Raises:
+            OSError: 비어 있는 슬롯이 없는 경우
+        """
+        if fcntl is None:
+            return cls(os.path.join(base_dir, f"pid-{os.getpid()}"), maxlen, **kwargs)
+
+        os.makedirs(base_dir, exist_ok=True)
+        for slot in range(MAX_WORKER_SLOTS):
+            directory = os.path.join(base_dir, f"worker-{slot}")
+            handle = open(f"{directory}.lock", "a")
+            try:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                handle.close()
+                continue
+            queue = cls(directory, maxlen, **kwargs)
+            queue._slot_handle = handle
+            return queue
+        raise OSError(f"오프라인 큐 워커 슬롯이 모두 사용 중입니다: {base_dir}")
+
+    def close(self) -> None:
+        """워커 슬롯 잠금 해제"""
+        handle, self._slot_handle = self._slot_handle, None
+        if handle is not None:
+            handle.close()
+
+    def _user_dir(self, user_id: str) -> str:
+        """사용자 디렉터리 (ID 를 해시해 경로 문자 문제 방지)"""
+        digest = hashlib.sha1(user_id.encode("utf-8")).hexdigest()
+        return os.path.join(self.base_dir, digest)
+
+    @staticmethod
+    def _segment_path(directory: str, first_offset: int) -> str:
+        return os.path.join(directory, f"{first_offset:020d}.log")
+
+    @staticmethod
+    def _ack_path(directory: str) -> str:
+        return os.path.join(directory, "ack")
+
+    def _load(self, user_id: str) -> _UserLog:
+        """사용자 상태 로드 (최초 접근 시 세그먼트 목록에서 복원)"""
+        log = self._logs.get(user_id)
+        if log is not None:
+            return log
+
+        directory = self._user_dir(user_id)
+        log = _UserLog(directory=directory)
+        if os.path.isdir(directory):
+            for name in sorted(os.listdir(directory)):
+                if not name.endswith(".log"):
+                    continue
+                first_offset = int(name[:-4])
+                with open(os.path.join(directory, name), "rb") as handle:
+                    count = sum(1 for _ in handle)
+                log.segments.append([first_offset, count])
+                log.size += count
+                log.next_offset = first_offset + count
+            try:
+                with open(self._ack_path(directory), encoding="utf-8") as handle:
+                    log.acked = int(handle.read().strip() or 0)
+            except (FileNotFoundError, ValueError):
+                pass
+        self._logs[user_id] = log
+        return log
+
+    def _append_sync(self, user_id: str, message: Dict[str, Any]) -> str:
+        with self._lock:
+            log = self._load(user_id)
+            if not log.segments or log.segments[-1][1] >= self.segment_size:
+                os.makedirs(log.directory, exist_ok=True)
+                log.segments.append([log.next_offset, 0])
+
+            offset = log.next_offset
+            line = json.dumps(
+                {"offset": offset, "message": message}, ensure_ascii=False, default=str
+            )
+            path = self._segment_path(log.directory, log.segments[-1][0])
+            with open(path, "a", encoding="utf-8") as handle:
+                handle.write(line + "\n")
+            log.segments[-1][1] += 1
+            log.size += 1
+            log.next_offset += 1
+
+            # 상한 초과 시 가장 오래된 세그먼트 삭제 (마지막 세그먼트는 유지)
+            while log.size - log.segments[0][1] >= self.maxlen and len(log.segments) > 1:
+                self._drop_oldest_segment(log)
+            return str(offset)
+
+    def _drop_oldest_segment(self, log: _UserLog) -> None:
+        first_offset, count = log.segments.popleft()
+        log.size -= count
+        try:
+            os.remove(self._segment_path(log.directory, first_offset))
+        except FileNotFoundError:
+            pass
+
+    def _keep_next_offset(self, log: _UserLog) -> None:
+        """큐가 비면 빈 세그먼트를 남겨 재시작 후에도 오프셋이 이어지게 함"""
+        if log.segments:
+            return
+        os.makedirs(log.directory, exist_ok=True)
+        open(self._segment_path(log.directory, log.next_offset), "a").close()
+        log.segments.append([log.next_offset, 0])
+
+    def _read_sync(
+        self, user_id: str, after: Optional[str], limit: int
+    ) -> List[QueuedMessage]:
+        with self._lock:
+            log = self._load(user_id)
+            segments = [list(segment) for segment in log.segments]
+            directory = log.directory
+
+            acked = log.acked
+
+        after_offset = max(int(after) if after else 0, acked)
+        result: List[QueuedMessage] = []
+        for first_offset, count in segments:
+            if first_offset + count - 1 <= after_offset:
+                continue
+            try:
+                with open(
+                    self._segment_path(directory, first_offset), encoding="utf-8"
+                ) as handle:
+                    for line in handle:
+                        entry = json.loads(line)
+                        if entry["offset"] <= after_offset:
+                            continue
+                        result.append((str(entry["offset"]), entry["message"]))
+                        if len(result) >= limit:
+                            return result
+            except FileNotFoundError:
+                # 읽는 동안 정리된 세그먼트
+                continue
+        return result
+
+    def _ack_sync(self, user_id: str, offset: str) -> None:
+        with self._lock:
+            log = self._load(user_id)
+            acked = min(int(offset), log.next_offset - 1)
+            if acked <= log.acked:
+                return
+            # 세그먼트 중간까지 확인된 경우를 위해 확인 오프셋 기록
+            log.acked = acked
+            os.makedirs(log.directory, exist_ok=True)
+            path = self._ack_path(log.directory)
+            with open(f"{path}.tmp", "w", encoding="utf-8") as handle:
+                handle.write(str(acked))
+            os.replace(f"{path}.tmp", path)
+            # 모든 메시지가 확인된 세그먼트 파일 삭제
+            while log.segments and log.segments[0][0] + log.segments[0][1] - 1 <= acked:
+                self._drop_oldest_segment(log)
+            self._keep_next_offset(log)
+
+    def _clear_sync(self, user_id: str) -> None:
+        with self._lock:
+            log = self._load(user_id)
+            while log.segments:
+                self._drop_oldest_segment(log)
+            self._keep_next_offset(log)
+
+    async def append(self, user_id: str, message: Dict[str, Any]) -> str:
+        """세그먼트 파일에 한 줄 추가"""
+        return await asyncio.to_thread(self._append_sync, user_id, message)
+
+    async def read(
+        self, user_id: str, after: Optional[str] = None, limit: int = REPLAY_BATCH_SIZE
+    ) -> List[QueuedMessage]:
+        """오프셋 이후 메시지 조회"""
+        return await asyncio.to_thread(self._read_sync, user_id, after, limit)
+
+    async def ack(self, user_id: str, offset: str) -> None:
+        """확인 오프셋 기록 후 모두 확인된 세그먼트 삭제"""
+        await asyncio.to_thread(self._ack_sync, user_id, offset)
+
+    async def clear(self, user_id: str) -> None:
+        """사용자 큐 삭제"""
+        await asyncio.to_thread(self._clear_sync, user_id)
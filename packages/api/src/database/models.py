@@ -24,6 +24,7 @@ from sqlalchemy import (
     Enum,
     Float,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
@@ -265,4 +266,75 @@ class Todo(BaseModel):
         return f"<Todo {self.title}>"
 
 
+class EntityTag(BaseModel):
+    """엔티티 태그 인덱스 모델
+
+    Todo/정비 기록의 태그를 정규화해 저장하여 태그 검색과 인기 태그 집계를
+    인덱스 기반 쿼리로 처리합니다.
+    """
+
+    __tablename__ = "entity_tags"
+
+    entity_type = Column(String(50), primary_key=True)
+    entity_id = Column(String(36), primary_key=True)
+    tag = Column(String(100), primary_key=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+    __table_args__ = (
+        Index("idx_entity_tags_type_tag", "entity_type", "tag", "entity_id"),
+    )
+
+    def __repr__(self):
+        return f"<EntityTag {self.entity_type}:{self.entity_id} {self.tag}>"
+
+
+class ReminderQueueItem(BaseModel):
+    """리마인더 대기열 모델
+
+    엔티티 메타데이터를 스캔하지 않고 ``(status, fire_at)`` 인덱스로 발송 시각이
+    지난 리마인더를 조회하고, 여러 워커가 행 단위로 선점(claim)해 처리합니다.
+    """
+
+    __tablename__ = "reminder_queue"
+
+    id = Column(String(36), primary_key=True)
+    entity_type = Column(String(50), nullable=False)
+    entity_id = Column(String(36), nullable=False)
+    fire_at = Column(DateTime, nullable=False)
+    status = Column(String(20), nullable=False, default="pending")
+    reminder_type = Column(String(50), nullable=False, default="notification")
+    payload = Column(JSON, nullable=True)
+    claimed_by = Column(String(100), nullable=True)
+    claimed_at = Column(DateTime, nullable=True)
+    attempts = Column(Integer, nullable=False, default=0)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    processed_at = Column(DateTime, nullable=True)
+
+    __table_args__ = (
+        Index("idx_reminder_queue_status_fire_at", "status", "fire_at"),
+        Index("idx_reminder_queue_entity", "entity_type", "entity_id"),
+    )
+
+    def __repr__(self):
+        return f"<ReminderQueueItem {self.entity_type}:{self.entity_id} {self.fire_at}>"
+
+
+class ArchiveCheckpoint(BaseModel):
+    """아카이브 작업 체크포인트 모델
+
+    배치 아카이브 작업이 마지막으로 처리한 키를 기록하여 중단된 작업을 이어서
+    처리할 수 있게 합니다.
+    """
+
+    __tablename__ = "archive_checkpoints"
+
+    job_name = Column(String(100), primary_key=True)
+    last_key = Column(String(100), nullable=True)
+    processed_count = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, default=datetime.utcnow)
+
+    def __repr__(self):
+        return f"<ArchiveCheckpoint {self.job_name} {self.last_key}>"
+
+
 logger.info("데이터베이스 모델 로드 완료")
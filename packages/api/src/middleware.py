@@ -14,6 +14,7 @@ from packages.api.srccore.config import settings
 from packages.api.srccore.logging_setup import setup_logging
 from packages.api.srccore.middleware import setup_middlewares
 from packages.api.srccore.monitoring.middleware import MonitoringMiddleware
+from packages.api.srccore.request_metrics import RouteMetricsMiddleware
 
 # 로깅 설정
 logger = setup_logging()
@@ -55,6 +56,8 @@ def setup_security_middleware(app: FastAPI) -> None:
 def setup_monitoring_middleware(app: FastAPI) -> None:
     """모니터링 미들웨어 설정"""
     app.add_middleware(MonitoringMiddleware)
+    # 라우트 템플릿별 요청 메트릭
+    app.add_middleware(RouteMetricsMiddleware)
     logger.debug("모니터링 미들웨어가 설정되었습니다")
 
 
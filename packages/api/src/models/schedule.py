@@ -8,7 +8,7 @@ from typing import Any, Dict, List, Optional
 
 from sqlalchemy import Boolean, Column, DateTime
 from sqlalchemy import Enum as SQLAlchemyEnum
-from sqlalchemy import Float, ForeignKey, Integer, String, Text
+from sqlalchemy import Float, ForeignKey, Index, Integer, String, Text
 from sqlalchemy.orm import relationship
 
 from .base import Base
@@ -54,6 +54,7 @@ class ReminderStatus(str, Enum):
     """알림 상태 열거형"""
 
     PENDING = "pending"
+    PROCESSING = "processing"  # 워커가 선점하여 발송 중
     SENT = "sent"
     FAILED = "failed"
 
@@ -256,11 +257,17 @@ class ScheduleReminderModel(Base):
     )  # email, sms, push, in-app
     status = Column(
         String(50), default=ReminderStatus.PENDING.value
-    )  # pending, sent, failed
+    )  # pending, processing, sent, failed
+    claimed_by = Column(String(100), nullable=True)
+    claimed_at = Column(DateTime, nullable=True)
     created_at = Column(
         DateTime, default=lambda: datetime.now(timezone.utc), nullable=False
     )
 
+    __table_args__ = (
+        Index("idx_schedule_reminders_status_time", "status", "reminder_time"),
+    )
+
     # 관계 설정
     schedule = relationship("MaintenanceScheduleModel", back_populates="reminders")
 
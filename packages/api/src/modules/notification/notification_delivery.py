@@ -0,0 +1,204 @@
+"""
+알림 발송(fan-out) 모듈
+
+배치로 생성된 알림을 푸시/이메일로 발송합니다. 발송 작업은 지연 생성되어 고정된 수의
+작업자(worker)가 나눠 처리하므로, 수신자가 수만 명이어도 동시에 진행되는 발송 수와
+메모리 사용량이 ``concurrency`` 로 제한됩니다.
+
+- 푸시: 같은 알림의 디바이스 토큰을 멀티캐스트 한도(500개) 단위로 묶어 한 번에 발송
+- 이메일: 수신자별 발송
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import (Any, Awaitable, Callable, Dict, Iterable, Iterator, List,
+                    Optional, Sequence, Tuple)
+
+logger = logging.getLogger(__name__)
+
+# 동시 발송 작업자 수
+DEFAULT_DELIVERY_CONCURRENCY = 32
+
+# 푸시 멀티캐스트 1회당 최대 토큰 수 (FCM 제한)
+PUSH_MULTICAST_LIMIT = 500
+
+DeliveryJob = Callable[[], Awaitable[bool]]
+
+
+@dataclass
+class DeliveryContact:
+    """수신자 연락처"""
+
+    email: Optional[str] = None
+    device_token: Optional[str] = None
+
+
+@dataclass
+class DeliveryReport:
+    """발송 결과"""
+
+    attempted: int = 0
+    succeeded: int = 0
+    failed: int = 0
+
+    def to_dict(self) -> Dict[str, int]:
+        return {
+            "attempted": self.attempted,
+            "succeeded": self.succeeded,
+            "failed": self.failed,
+        }
+
+
+async def run_bounded(
+    jobs: Iterable[DeliveryJob], concurrency: int = DEFAULT_DELIVERY_CONCURRENCY
+) -> DeliveryReport:
+    """
+    발송 작업을 최대 ``concurrency`` 개씩 동시에 실행
+
+    작업자들이 같은 이터레이터에서 작업을 하나씩 꺼내므로 작업 목록 전체를
+    미리 만들거나 작업마다 태스크를 만들지 않습니다.
+
+    Args:
+        jobs: 성공 여부를 반환하는 발송 작업 (지연 생성 가능)
+        concurrency: 동시 작업자 수
+
+    Returns:
+        DeliveryReport: 발송 결과
+    """
+    report = DeliveryReport()
+    iterator: Iterator[DeliveryJob] = iter(jobs)
+
+    async def worker() -> None:
+        for job in iterator:
+            report.attempted += 1
+            try:
+                succeeded = await job()
+            except Exception as e:
+                logger.error(f"알림 발송 작업 실패: {str(e)}")
+                succeeded = False
+            if succeeded:
+                report.succeeded += 1
+            else:
+                report.failed += 1
+
+    await asyncio.gather(*(worker() for _ in range(max(1, concurrency))))
+    return report
+
+
+class NotificationDelivery:
+    """푸시/이메일 발송 파이프라인"""
+
+    def __init__(
+        self,
+        push_service: Optional[Any] = None,
+        email_service: Optional[Any] = None,
+        concurrency: int = DEFAULT_DELIVERY_CONCURRENCY,
+    ):
+        """
+        발송 파이프라인 초기화
+
+        Args:
+            push_service: ``send_bulk_push`` 를 제공하는 푸시 서비스
+            email_service: ``send_email`` 을 제공하는 이메일 서비스
+            concurrency: 동시 발송 작업자 수
+        """
+        self.push_service = push_service
+        self.email_service = email_service
+        self.concurrency = concurrency
+
+    @property
+    def enabled(self) -> bool:
+        """발송 채널 설정 여부"""
+        return self.push_service is not None or self.email_service is not None
+
+    def _jobs(
+        self,
+        messages: Sequence[Tuple[str, str, List[Any]]],
+        contacts: Dict[Any, DeliveryContact],
+    ) -> Iterator[DeliveryJob]:
+        """알림별 발송 작업 생성"""
+        for title, body, user_ids in messages:
+            recipients = [contacts[u] for u in user_ids if u in contacts]
+
+            if self.push_service is not None:
+                tokens = [c.device_token for c in recipients if c.device_token]
+                for start in range(0, len(tokens), PUSH_MULTICAST_LIMIT):
+                    chunk = tokens[start : start + PUSH_MULTICAST_LIMIT]
+                    yield lambda chunk=chunk, title=title, body=body: (
+                        self.push_service.send_bulk_push(chunk, title, body)
+                    )
+
+            if self.email_service is not None:
+                for contact in recipients:
+                    if contact.email:
+                        yield lambda email=contact.email, title=title, body=body: (
+                            self.email_service.send_email(email, title, body)
+                        )
+
+    async def deliver(
+        self,
+        messages: Sequence[Tuple[str, str, List[Any]]],
+        contacts: Dict[Any, DeliveryContact],
+    ) -> DeliveryReport:
+        """
+        알림 발송
+
+        Args:
+            messages: ``(제목, 내용, 수신자 ID 목록)`` 목록
+            contacts: 수신자 ID 별 연락처
+
+        Returns:
+            DeliveryReport: 발송 결과
+        """
+        report = await run_bounded(self._jobs(messages, contacts), self.concurrency)
+        logger.info(f"알림 발송 완료: {report.to_dict()}")
+        return report
+
+
+# 설정에서 만든 기본 발송 파이프라인 (프로세스당 1개)
+_default_delivery: Optional[NotificationDelivery] = None
+
+
+def get_default_delivery() -> NotificationDelivery:
+    """
+    설정된 푸시/이메일 서비스로 기본 발송 파이프라인 생성 (최초 1회)
+
+    ``FIREBASE_CREDENTIALS_PATH`` 가 있으면 푸시를, ``SMTP_HOST`` 가 있으면 이메일을
+    사용합니다. 서비스 초기화에 실패한 채널은 경고를 남기고 제외합니다.
+
+    Returns:
+        NotificationDelivery: 발송 파이프라인
+    """
+    global _default_delivery
+    if _default_delivery is not None:
+        return _default_delivery
+
+    from src.core.config import settings
+
+    push_service = None
+    if getattr(settings, "FIREBASE_CREDENTIALS_PATH", None):
+        try:
+            from src.modules.notification.services.push_service import PushService
+
+            push_service = PushService()
+        except Exception as e:
+            logger.warning(f"푸시 서비스 초기화 실패 (푸시 발송 비활성화): {str(e)}")
+
+    email_service = None
+    if getattr(settings, "SMTP_HOST", None):
+        try:
+            from src.modules.notification.services.email_service import EmailService
+
+            email_service = EmailService(settings)
+        except Exception as e:
+            logger.warning(f"이메일 서비스 초기화 실패 (이메일 발송 비활성화): {str(e)}")
+
+    _default_delivery = NotificationDelivery(
+        push_service=push_service,
+        email_service=email_service,
+        concurrency=getattr(
+            settings, "NOTIFICATION_DELIVERY_CONCURRENCY", DEFAULT_DELIVERY_CONCURRENCY
+        ),
+    )
+    return _default_delivery
@@ -45,7 +45,8 @@ class Notification(Base):
         DateTime(timezone=True), nullable=False, default=datetime.utcnow
     )
     read_at = Column(DateTime(timezone=True), nullable=True)
-    metadata = Column(JSON, nullable=True)
+    # 'metadata' 는 Declarative 예약 속성이라 컬럼 이름만 유지
+    meta = Column("metadata", JSON, nullable=True)
 
     # 관계 설정
     user = relationship("User", back_populates="notifications")
@@ -0,0 +1,608 @@
+"""
+예약 알림 스케줄러 모듈
+
+예약된 알림을 다음 실행 시각 기준 최소 힙(``DueTimeQueue``)에 올려 두고, 가장 이른
+실행 시각까지 정확히 잠들었다가 깨어나 실행 시각이 지난 알림을 배치로 발송합니다.
+더 이른 예약이 들어오면 즉시 깨어나 대기 시간을 다시 계산합니다.
+
+예약 목록은 추가 전용(append-only) JSON Lines 저널에 기록되어 재시작 후에도 복원됩니다.
+여러 워커가 같은 저널을 공유하면 리더 잠금(Redis 또는 저널 옆 파일 잠금)을 잡은
+워커 하나만 발송합니다. 다른 워커는 예약 추가/취소를 저널에 기록만 하고, 리더는
+저널이 바뀌면 다시 읽어 반영합니다. 리더가 종료되면 다른 워커가 잠금을 이어받습니다.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from contextlib import contextmanager, suppress
+from datetime import datetime, timedelta, timezone
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+from src.core.reminder_queue import DueTimeQueue
+from src.modules.notification.models import NotificationCreate
+
+logger = logging.getLogger(__name__)
+
+# 한 번에 발송할 최대 예약 알림 수
+DEFAULT_DISPATCH_BATCH_SIZE = 100
+
+# 예약이 없을 때 최대 대기 시간 (초)
+MAX_IDLE_SLEEP = 3600
+
+# 기본 예약 저널 경로
+DEFAULT_SCHEDULE_JOURNAL = "offline_storage/notification_schedules.jsonl"
+
+# 리더 잠금 Redis 키와 유효 시간 (초)
+LEADER_LOCK_KEY = "notification:scheduler:leader"
+LEADER_LOCK_TTL = 30
+
+# 리더 잠금 갱신/재시도 간격 (초)
+LEADER_RENEW_INTERVAL = 10
+
+# 리더가 다른 워커의 저널 변경을 확인하는 간격 (초)
+JOURNAL_POLL_INTERVAL = 5
+
+
+class ScheduledNotification:
+    """예약된 알림 클래스"""
+
+    def __init__(
+        self,
+        notification: NotificationCreate,
+        user_id: int,
+        scheduled_at: datetime,
+        repeat_interval: Optional[timedelta] = None,
+        max_repeats: Optional[int] = None,
+        schedule_id: Optional[str] = None,
+    ):
+        self.schedule_id = schedule_id or uuid.uuid4().hex
+        self.notification = notification
+        self.user_id = user_id
+        self.scheduled_at = scheduled_at
+        self.repeat_interval = repeat_interval
+        self.max_repeats = max_repeats
+        self.repeat_count = 0
+        self.is_cancelled = False
+        self.last_run_at: Optional[datetime] = None
+
+    @property
+    def next_run_time(self) -> Optional[datetime]:
+        """다음 실행 시간"""
+        if self.is_cancelled:
+            return None
+
+        if not self.last_run_at:
+            return self.scheduled_at
+
+        if not self.repeat_interval:
+            return None
+
+        if self.max_repeats and self.repeat_count >= self.max_repeats:
+            return None
+
+        return self.last_run_at + self.repeat_interval
+
+    def to_dict(self) -> Dict[str, Any]:
+        """저널 기록용 딕셔너리 변환"""
+        return {
+            "schedule_id": self.schedule_id,
+            "notification": self.notification.model_dump(mode="json"),
+            "user_id": self.user_id,
+            "scheduled_at": self.scheduled_at.isoformat(),
+            "repeat_interval": (
+                self.repeat_interval.total_seconds() if self.repeat_interval else None
+            ),
+            "max_repeats": self.max_repeats,
+            "repeat_count": self.repeat_count,
+            "last_run_at": self.last_run_at.isoformat() if self.last_run_at else None,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ScheduledNotification":
+        """저널 기록에서 복원"""
+        scheduled = cls(
+            NotificationCreate.model_validate(data["notification"]),
+            data["user_id"],
+            datetime.fromisoformat(data["scheduled_at"]),
+            (
+                timedelta(seconds=data["repeat_interval"])
+                if data.get("repeat_interval")
+                else None
+            ),
+            data.get("max_repeats"),
+            schedule_id=data["schedule_id"],
+        )
+        scheduled.repeat_count = data.get("repeat_count", 0)
+        if data.get("last_run_at"):
+            scheduled.last_run_at = datetime.fromisoformat(data["last_run_at"])
+        return scheduled
+
+
+class ScheduleJournal:
+    """예약 알림 저널 (JSON Lines, 추가 전용)
+
+    예약 추가/갱신은 ``put``, 완료/취소는 ``delete`` 레코드로 기록하고, 로드할 때
+    마지막 상태만 남깁니다. 무효 레코드가 유효 레코드보다 많으면 로드 시 압축합니다.
+    여러 워커가 같은 파일을 쓰므로 읽기/쓰기는 옆의 ``.wlock`` 파일 잠금으로 직렬화합니다.
+    """
+
+    def __init__(self, path: str = DEFAULT_SCHEDULE_JOURNAL):
+        """
+        저널 초기화
+
+        Args:
+            path: 저널 파일 경로
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        # 마지막 load() 가 반영한 저널 상태 (변경 감지용)
+        self.loaded_signature: Optional[Tuple[int, int]] = None
+
+    @contextmanager
+    def _locked(self):
+        """스레드/프로세스 간 저널 접근 잠금"""
+        with self._lock:
+            if fcntl is None:
+                yield
+                return
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(f"{self.path}.wlock", "a") as lock_file:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+    def load(self) -> List[ScheduledNotification]:
+        """
+        저널을 읽어 살아 있는 예약 복원
+
+        Returns:
+            List[ScheduledNotification]: 예약 목록
+        """
+        with self._locked():
+            self.loaded_signature = self.signature()
+            if not os.path.exists(self.path):
+                return []
+
+            live: Dict[str, Dict[str, Any]] = {}
+            records = 0
+            with open(self.path, encoding="utf-8") as handle:
+                for line in handle:
+                    if not line.strip():
+                        continue
+                    records += 1
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        # 비정상 종료로 잘린 마지막 줄
+                        logger.warning(f"손상된 예약 저널 레코드 무시: {self.path}")
+                        continue
+                    if record["op"] == "put":
+                        live[record["schedule"]["schedule_id"]] = record["schedule"]
+                    else:
+                        live.pop(record["schedule_id"], None)
+
+            if records > 2 * len(live):
+                self._rewrite(live.values())
+                self.loaded_signature = self.signature()
+
+        schedules = []
+        for data in live.values():
+            try:
+                schedules.append(ScheduledNotification.from_dict(data))
+            except Exception as e:
+                logger.error(f"예약 알림 복원 실패 ({data.get('schedule_id')}): {str(e)}")
+        return schedules
+
+    def _rewrite(self, schedules) -> None:
+        """살아 있는 예약만으로 저널 재작성 (임시 파일 후 교체)"""
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as handle:
+            for data in schedules:
+                handle.write(json.dumps({"op": "put", "schedule": data}) + "\n")
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(temp_path, self.path)
+
+    def signature(self) -> Optional[Tuple[int, int]]:
+        """
+        저널 변경 감지용 ``(크기, 수정 시각)``
+
+        Returns:
+            Optional[Tuple[int, int]]: 파일이 없으면 None
+        """
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        return stat.st_size, stat.st_mtime_ns
+
+    def write(
+        self,
+        put: Optional[List[ScheduledNotification]] = None,
+        delete: Optional[List[str]] = None,
+    ) -> Tuple[Optional[Tuple[int, int]], Optional[Tuple[int, int]]]:
+        """
+        예약 변경 기록 (한 번의 쓰기로 배치 기록)
+
+        Args:
+            put: 추가/갱신된 예약 목록
+            delete: 완료/취소된 예약 ID 목록
+
+        Returns:
+            기록 직전과 직후의 ``signature()`` (기록할 내용이 없으면 둘 다 현재 값)
+        """
+        lines = [
+            json.dumps({"op": "put", "schedule": scheduled.to_dict()})
+            for scheduled in put or []
+        ]
+        lines.extend(
+            json.dumps({"op": "delete", "schedule_id": schedule_id})
+            for schedule_id in delete or []
+        )
+        with self._locked():
+            before = self.signature()
+            if not lines:
+                return before, before
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as handle:
+                handle.write("\n".join(lines) + "\n")
+            return before, self.signature()
+
+
+class RedisLeaderLock:
+    """Redis 키 기반 리더 잠금 (여러 호스트의 워커용)
+
+    ``SET NX PX`` 로 잡고, 자신의 토큰일 때만 만료 시각을 연장하거나 해제합니다.
+    리더가 갱신하지 못하고 종료되면 ``ttl`` 이 지난 뒤 다른 워커가 잡습니다.
+    """
+
+    _RENEW_SCRIPT = (
+        "if redis.call('get', KEYS[1]) == ARGV[1] then "
+        "return redis.call('pexpire', KEYS[1], ARGV[2]) else return 0 end"
+    )
+    _RELEASE_SCRIPT = (
+        "if redis.call('get', KEYS[1]) == ARGV[1] then "
+        "return redis.call('del', KEYS[1]) else return 0 end"
+    )
+
+    def __init__(self, redis: Any, key: str = LEADER_LOCK_KEY, ttl: int = LEADER_LOCK_TTL):
+        """
+        Redis 리더 잠금 초기화
+
+        Args:
+            redis: ``redis.asyncio.Redis`` 클라이언트
+            key: 잠금 키
+            ttl: 잠금 유효 시간 (초)
+        """
+        self.redis = redis
+        self.key = key
+        self.ttl_ms = int(ttl * 1000)
+        self.token = uuid.uuid4().hex
+
+    async def acquire(self) -> bool:
+        """잠금 획득 시도 (대기하지 않음)"""
+        return bool(await self.redis.set(self.key, self.token, nx=True, px=self.ttl_ms))
+
+    async def renew(self) -> bool:
+        """잠금 연장 (다른 워커가 가져갔으면 False)"""
+        renewed = await self.redis.eval(
+            self._RENEW_SCRIPT, 1, self.key, self.token, self.ttl_ms
+        )
+        return bool(renewed)
+
+    async def release(self) -> None:
+        """잠금 해제 (자신의 잠금일 때만)"""
+        await self.redis.eval(self._RELEASE_SCRIPT, 1, self.key, self.token)
+
+
+class FileLeaderLock:
+    """파일 잠금(``flock``) 기반 리더 잠금 (같은 저널을 쓰는 한 호스트의 워커용)
+
+    프로세스가 종료되면 운영체제가 잠금을 해제합니다. ``fcntl`` 이 없는 환경에서는
+    항상 획득에 성공하므로 워커를 하나만 실행해야 합니다.
+    """
+
+    def __init__(self, path: str):
+        """
+        파일 리더 잠금 초기화
+
+        Args:
+            path: 잠금 파일 경로
+        """
+        self.path = path
+        self._handle = None
+
+    async def acquire(self) -> bool:
+        """잠금 획득 시도 (대기하지 않음)"""
+        if fcntl is None:
+            return True
+        if self._handle is not None:
+            return True
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        handle = open(self.path, "a")
+        try:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            handle.close()
+            return False
+        self._handle = handle
+        return True
+
+    async def renew(self) -> bool:
+        """잠금 유지 여부 (파일 잠금은 만료되지 않음)"""
+        return fcntl is None or self._handle is not None
+
+    async def release(self) -> None:
+        """잠금 해제"""
+        handle, self._handle = self._handle, None
+        if handle is not None:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+            handle.close()
+
+
+def create_leader_lock(
+    redis: Optional[Any] = None, journal_path: str = DEFAULT_SCHEDULE_JOURNAL
+) -> Any:
+    """
+    스케줄러 리더 잠금 생성
+
+    Args:
+        redis: ``redis.asyncio.Redis`` 클라이언트 (None 이면 저널 옆 파일 잠금)
+        journal_path: 예약 저널 경로
+
+    Returns:
+        ``RedisLeaderLock`` 또는 ``FileLeaderLock``
+    """
+    if redis is not None:
+        return RedisLeaderLock(redis)
+    return FileLeaderLock(f"{journal_path}.lock")
+
+
+class NotificationScheduler:
+    """최소 힙 기반 예약 알림 스케줄러"""
+
+    def __init__(
+        self,
+        dispatch: Callable[[List[ScheduledNotification]], Awaitable[None]],
+        journal: Optional[ScheduleJournal] = None,
+        batch_size: int = DEFAULT_DISPATCH_BATCH_SIZE,
+        leader_lock: Optional[Any] = None,
+    ):
+        """
+        스케줄러 초기화
+
+        Args:
+            dispatch: 실행 시각이 지난 예약 배치를 발송하는 코루틴 함수
+            journal: 예약 저널 (None 이면 메모리에만 보관)
+            batch_size: 한 번에 발송할 최대 예약 수
+            leader_lock: 리더 잠금 (None 이면 항상 이 워커가 발송)
+        """
+        self.dispatch = dispatch
+        self.journal = journal
+        self.batch_size = batch_size
+        self.leader_lock = leader_lock
+        self.is_leader = leader_lock is None
+        self.schedules: Dict[str, ScheduledNotification] = {}
+        self._queue = DueTimeQueue()
+        self._wakeup = asyncio.Event()
+        # 저널 재로드와 예약 변경(힙 수정 + 저널 기록)이 서로 끼어들지 않도록 직렬화
+        self._lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+        self._renewed_at = 0.0
+        self._journal_seen: Optional[Tuple[int, int]] = None
+
+    def __len__(self) -> int:
+        return len(self.schedules)
+
+    async def start(self) -> None:
+        """저널에서 예약을 복원하고 스케줄러 실행"""
+        if self._task is not None:
+            return
+        await self._reload()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """스케줄러 중지 (리더 잠금 해제)"""
+        if self._task:
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        if self.leader_lock is not None and self.is_leader:
+            self.is_leader = False
+            try:
+                await self.leader_lock.release()
+            except Exception as e:
+                logger.warning(f"예약 알림 스케줄러 리더 잠금 해제 실패: {str(e)}")
+
+    async def _reload(self) -> None:
+        """저널의 예약으로 힙을 다시 구성"""
+        if self.journal is None:
+            return
+        async with self._lock:
+            schedules = await asyncio.to_thread(self.journal.load)
+            self.schedules = {}
+            self._queue = DueTimeQueue()
+            for scheduled in schedules:
+                self._enqueue(scheduled)
+            self._journal_seen = self.journal.loaded_signature
+
+    async def _write_journal(self, **changes: Any) -> None:
+        """저널 기록 (그 사이 다른 워커의 기록이 없었다면 변경 감지에서 제외)"""
+        before, after = await asyncio.to_thread(self.journal.write, **changes)
+        if before == self._journal_seen:
+            self._journal_seen = after
+
+    async def _ensure_leader(self) -> bool:
+        """
+        리더 잠금 획득/갱신
+
+        새로 리더가 되면 다른 워커가 기록한 예약까지 반영하도록 저널을 다시 읽습니다.
+
+        Returns:
+            bool: 이 워커가 리더인지 여부
+        """
+        if self.leader_lock is None:
+            return True
+        now = time.monotonic()
+        try:
+            if self.is_leader:
+                if now - self._renewed_at < LEADER_RENEW_INTERVAL:
+                    return True
+                if await self.leader_lock.renew():
+                    self._renewed_at = now
+                    return True
+                self.is_leader = False
+                logger.warning("예약 알림 스케줄러 리더 잠금을 잃었습니다.")
+                return False
+            if not await self.leader_lock.acquire():
+                return False
+        except Exception as e:
+            self.is_leader = False
+            logger.error(f"예약 알림 스케줄러 리더 잠금 오류: {str(e)}")
+            return False
+
+        self.is_leader = True
+        self._renewed_at = now
+        logger.info("예약 알림 스케줄러 리더가 되었습니다.")
+        await self._reload()
+        return True
+
+    async def _refresh_from_journal(self) -> None:
+        """다른 워커가 저널에 기록한 예약 추가/취소 반영"""
+        if self.journal is None or self.leader_lock is None:
+            return
+        if await asyncio.to_thread(self.journal.signature) != self._journal_seen:
+            await self._reload()
+
+    def _enqueue(self, scheduled: ScheduledNotification) -> bool:
+        """힙에 예약 추가 (다음 실행 시각이 없으면 False)"""
+        next_run_time = scheduled.next_run_time
+        if next_run_time is None:
+            self.schedules.pop(scheduled.schedule_id, None)
+            self._queue.remove(scheduled.schedule_id)
+            return False
+        self.schedules[scheduled.schedule_id] = scheduled
+        self._queue.push(scheduled.schedule_id, next_run_time)
+        return True
+
+    async def add(self, scheduled: ScheduledNotification) -> ScheduledNotification:
+        """
+        예약 추가 (O(log n))
+
+        Args:
+            scheduled: 예약된 알림
+
+        Returns:
+            ScheduledNotification: 예약된 알림
+        """
+        async with self._lock:
+            if not self._enqueue(scheduled):
+                return scheduled
+            if self.journal is not None:
+                await self._write_journal(put=[scheduled])
+        # 더 이른 예약일 수 있으므로 대기 시간 재계산
+        self._wakeup.set()
+        return scheduled
+
+    async def cancel(self, schedule_id: str) -> bool:
+        """
+        예약 취소 (O(log n) 분할 상환)
+
+        저널을 쓰면 이 워커의 힙에 없는 예약(다른 워커가 추가한 예약)이어도 삭제
+        레코드를 기록하고, 리더가 저널 변경을 감지해 반영합니다.
+
+        Args:
+            schedule_id: 예약 ID
+
+        Returns:
+            bool: 취소 성공 여부 (저널을 쓰면 삭제 레코드 기록 여부)
+        """
+        async with self._lock:
+            scheduled = self.schedules.pop(schedule_id, None)
+            if scheduled is not None:
+                scheduled.is_cancelled = True
+                self._queue.remove(schedule_id)
+            if self.journal is None:
+                return scheduled is not None
+            try:
+                await self._write_journal(delete=[schedule_id])
+            except OSError as e:
+                logger.error(f"예약 알림 취소 기록 실패 ({schedule_id}): {str(e)}")
+                return False
+            return True
+
+    async def _run(self) -> None:
+        """리더일 때만 다음 실행 시각까지 대기 후 배치 발송"""
+        while True:
+            try:
+                if not await self._ensure_leader():
+                    await asyncio.sleep(LEADER_RENEW_INTERVAL)
+                    continue
+                await self._refresh_from_journal()
+
+                self._wakeup.clear()
+                max_sleep = MAX_IDLE_SLEEP
+                if self.leader_lock is not None:
+                    # 잠금 갱신과 다른 워커의 예약 반영을 위해 주기적으로 깨어남
+                    max_sleep = min(JOURNAL_POLL_INTERVAL, LEADER_RENEW_INTERVAL)
+                timeout = self._queue.seconds_until_next(max_sleep)
+                if timeout > 0:
+                    with suppress(asyncio.TimeoutError):
+                        await asyncio.wait_for(self._wakeup.wait(), timeout=timeout)
+                    continue
+
+                await self._dispatch_due()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"예약 알림 스케줄러 오류: {str(e)}")
+                await asyncio.sleep(1)
+
+    async def _dispatch_due(self) -> None:
+        """실행 시각이 지난 예약을 배치로 발송하고 다음 실행 시각으로 다시 등록"""
+        now = datetime.now(timezone.utc)
+        batch = [
+            self.schedules[schedule_id]
+            for schedule_id in self._queue.pop_due(now, limit=self.batch_size)
+            if schedule_id in self.schedules
+        ]
+        if not batch:
+            return
+
+        try:
+            await self.dispatch(batch)
+        except Exception as e:
+            logger.error(
+                f"예약 알림 배치 발송 실패 ({len(batch)}건): {str(e)}",
+                extra={"schedule_ids": [s.schedule_id for s in batch]},
+            )
+
+        put, delete = [], []
+        async with self._lock:
+            for scheduled in batch:
+                scheduled.last_run_at = now
+                scheduled.repeat_count += 1
+                if self._enqueue(scheduled):
+                    put.append(scheduled)
+                else:
+                    delete.append(scheduled.schedule_id)
+            if self.journal is not None:
+                await self._write_journal(put=put, delete=delete)
@@ -5,8 +5,8 @@
 """
 
 import asyncio
+import itertools
 import logging
-from contextlib import suppress
 from datetime import datetime, timedelta, timezone
 from enum import Enum, IntEnum
 from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
@@ -14,7 +14,7 @@ from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
 from fastapi import Depends
 from jinja2 import Template
 from packages.apiuser.user_model import User
-from sqlalchemy import and_, case, func, or_, select
+from sqlalchemy import and_, case, func, insert, or_, select
 from sqlalchemy.orm import Session
 from src.core.config import Settings
 from src.core.database import AsyncSession, Base, get_db
@@ -24,8 +24,18 @@ from src.modules.notification.models import NotificationCreate
 from src.modules.notification.models import NotificationInDB as Notification
 from src.modules.notification.models import (NotificationResponse,
                                              NotificationUpdate)
+from src.modules.notification.notification_delivery import (
+    DeliveryContact, DeliveryReport, NotificationDelivery, get_default_delivery)
 from src.modules.notification.notification_repository import \
     NotificationRepository
+from src.modules.notification.notification_scheduler import (
+    NotificationScheduler, ScheduledNotification, ScheduleJournal,
+    create_leader_lock)
+
+logger = logging.getLogger(__name__)
+
+# 배치 알림 INSERT 문 1개당 행 수
+DEFAULT_INSERT_CHUNK_SIZE = 1000
 
 
 class NotificationType(str, Enum):
@@ -56,6 +66,14 @@ class NotificationCategory(str, Enum):
     NEWS = "news"
 
 
+def _notification_type(value: Optional[str]) -> NotificationType:
+    """알림 요청의 ``type`` 문자열을 저장용 알림 타입으로 변환 (모르는 값은 INFO)"""
+    try:
+        return NotificationType(value)
+    except ValueError:
+        return NotificationType.INFO
+
+
 class NotificationGroup:
     """알림 그룹 클래스"""
 
@@ -81,7 +99,7 @@ class NotificationSubscription:
         self.user_id = user_id
         self.categories = categories
         self.preferences = preferences
-        self.created_at = datetime.now(timezone.UTC)
+        self.created_at = datetime.now(timezone.utc)
         self.updated_at = self.created_at
 
 
@@ -180,44 +198,6 @@ class NotificationTemplate:
         return self.get_version(version).render(**kwargs)
 
 
-class ScheduledNotification:
-    """예약된 알림 클래스"""
-
-    def __init__(
-        self,
-        notification: NotificationCreate,
-        user_id: int,
-        scheduled_at: datetime,
-        repeat_interval: Optional[timedelta] = None,
-        max_repeats: Optional[int] = None,
-    ):
-        self.notification = notification
-        self.user_id = user_id
-        self.scheduled_at = scheduled_at
-        self.repeat_interval = repeat_interval
-        self.max_repeats = max_repeats
-        self.repeat_count = 0
-        self.is_cancelled = False
-        self.last_run_at: Optional[datetime] = None
-
-    @property
-    def next_run_time(self) -> Optional[datetime]:
-        """다음 실행 시간"""
-        if self.is_cancelled:
-            return None
-
-        if not self.last_run_at:
-            return self.scheduled_at
-
-        if not self.repeat_interval:
-            return None
-
-        if self.max_repeats and self.repeat_count >= self.max_repeats:
-            return None
-
-        return self.last_run_at + self.repeat_interval
-
-
 class NotificationService:
     """알림 서비스 클래스"""
 
@@ -235,65 +215,75 @@ class NotificationService:
         ),
     }
 
-    def __init__(self, db: AsyncSession):
+    def __init__(
+        self,
+        db: AsyncSession,
+        schedule_journal: Optional[ScheduleJournal] = None,
+        delivery: Optional[NotificationDelivery] = None,
+        redis: Optional[Any] = None,
+    ):
+        """
+        알림 서비스 초기화
+
+        Args:
+            db: 데이터베이스 세션
+            schedule_journal: 예약 저널 (기본값: 기본 경로의 JSON Lines 저널)
+            delivery: 알림 전달 채널
+            redis: ``redis.asyncio.Redis`` 클라이언트 (있으면 Redis 로, 없으면 저널 옆
+                파일 잠금으로 예약 발송 워커를 하나로 제한)
+        """
         self.db = db
+        self.delivery = delivery or get_default_delivery()
+        self._delivery_tasks: Set[asyncio.Task] = set()
         self.repository = NotificationRepository(db)
         self.batch_size = 100
         self.templates = self.DEFAULT_TEMPLATES.copy()
         self.subscriptions: Dict[int, NotificationSubscription] = {}
-        self.scheduled_notifications: List[ScheduledNotification] = []
-        self._scheduler_task: Optional[asyncio.Task] = None
+        journal = schedule_journal or ScheduleJournal()
+        self.scheduler = NotificationScheduler(
+            self._dispatch_scheduled,
+            journal=journal,
+            batch_size=self.batch_size,
+            leader_lock=create_leader_lock(redis, journal.path),
+        )
+
+    @property
+    def scheduled_notifications(self) -> List[ScheduledNotification]:
+        """대기 중인 예약 알림 목록"""
+        return list(self.scheduler.schedules.values())
 
     async def start_scheduler(self):
-        """알림 스케줄러 시작"""
-        if self._scheduler_task is None:
-            self._scheduler_task = asyncio.create_task(self._run_scheduler())
+        """알림 스케줄러 시작 (저장된 예약 복원)"""
+        await self.scheduler.start()
 
     async def stop_scheduler(self):
         """알림 스케줄러 중지"""
-        if self._scheduler_task:
-            self._scheduler_task.cancel()
-            with suppress(asyncio.CancelledError):
-                await self._scheduler_task
-            self._scheduler_task = None
-
-    async def _run_scheduler(self):
-        """알림 스케줄러 실행"""
-        while True:
-            now = datetime.now(timezone.UTC)
-
-            # 실행할 알림 찾기
-            to_run = [
-                notification
-                for notification in self.scheduled_notifications
-                if notification.next_run_time and notification.next_run_time <= now
-            ]
-
-            for notification in to_run:
-                try:
-                    # 알림 전송
-                    await self.create_notification(
-                        notification.notification, notification.user_id
-                    )
-
-                    # 상태 업데이트
-                    notification.last_run_at = now
-                    notification.repeat_count += 1
-
-                except Exception as e:
-                    self.logger.error(
-                        f"예약된 알림 전송 실패: {str(e)}",
-                        extra={"notification": notification.__dict__},
-                    )
-
-            # 완료된 알림 제거
-            self.scheduled_notifications = [
-                notification
-                for notification in self.scheduled_notifications
-                if notification.next_run_time is not None
-            ]
-
-            await asyncio.sleep(60)  # 1분마다 체크
+        await self.scheduler.stop()
+
+    async def _dispatch_scheduled(self, batch: List[ScheduledNotification]) -> None:
+        """
+        실행 시각이 지난 예약 알림 배치 발송
+
+        같은 내용의 알림은 수신자를 모아 한 번의 배치 생성으로 발송합니다.
+
+        Args:
+            batch: 예약 알림 목록
+        """
+        groups: Dict[str, Tuple[NotificationCreate, List[int]]] = {}
+        for scheduled in batch:
+            key = scheduled.notification.model_dump_json()
+            if key not in groups:
+                groups[key] = (scheduled.notification, [])
+            groups[key][1].append(scheduled.user_id)
+
+        for notification, user_ids in groups.values():
+            try:
+                await self.create_notifications_batch([notification], user_ids)
+            except Exception as e:
+                logger.error(
+                    f"예약된 알림 전송 실패: {str(e)}",
+                    extra={"user_ids": user_ids},
+                )
 
     async def schedule_notification(
         self,
@@ -319,8 +309,7 @@ class NotificationService:
         scheduled = ScheduledNotification(
             notification, user_id, scheduled_at, repeat_interval, max_repeats
         )
-        self.scheduled_notifications.append(scheduled)
-        return scheduled
+        return await self.scheduler.add(scheduled)
 
     async def cancel_scheduled_notification(
         self, notification: ScheduledNotification
@@ -334,12 +323,7 @@ class NotificationService:
         Returns:
             취소 성공 여부
         """
-        if notification not in self.scheduled_notifications:
-            return False
-
-        notification.is_cancelled = True
-        self.scheduled_notifications.remove(notification)
-        return True
+        return await self.scheduler.cancel(notification.schedule_id)
 
     def register_template(self, template_id: str, content: str) -> None:
         """
@@ -428,7 +412,7 @@ class NotificationService:
 
         subscription = self.subscriptions[user_id]
         subscription.categories -= categories
-        subscription.updated_at = datetime.now(timezone.UTC)
+        subscription.updated_at = datetime.now(timezone.utc)
 
         if not subscription.categories:
             del self.subscriptions[user_id]
@@ -497,14 +481,13 @@ class NotificationService:
             생성된 알림 객체 또는 None (구독하지 않은 경우)
         """
         # 구독 확인
-        subscription = self.subscriptions.get(user_id)
-        if subscription and notification.category not in subscription.categories:
+        if not self._is_subscribed(user_id, notification.category):
             return None
 
         db_notification = Notification(
             **notification.model_dump(),
             user_id=user_id,
-            created_at=datetime.now(timezone.UTC),
+            created_at=datetime.now(timezone.utc),
             notification_type=notification.notification_type or NotificationType.INFO,
             priority=notification.priority or NotificationPriority.NORMAL,
             category=notification.category,
@@ -515,40 +498,171 @@ class NotificationService:
         return db_notification
 
     async def create_notifications_batch(
-        self, notifications: List[NotificationCreate], user_ids: List[int]
+        self,
+        notifications: List[NotificationCreate],
+        user_ids: List[int],
+        contacts: Optional[Dict[int, DeliveryContact]] = None,
+        chunk_size: int = DEFAULT_INSERT_CHUNK_SIZE,
     ) -> List[Notification]:
         """
         여러 알림을 배치로 생성
 
+        알림 x 사용자 행을 ``chunk_size`` 개씩 한 번의 ``INSERT ... RETURNING`` 으로
+        ``notifications`` 테이블에 저장하므로 행마다 새로고침(SELECT)하지 않습니다.
+        RETURNING 을 여러 행에 쓸 수 없는 DB 에서는 묶음 executemany 로 저장하고 ID 없는
+        객체를 반환합니다. 구독에서 시스템 카테고리를 뺀 사용자는 제외하고, 커밋 후
+        푸시/이메일 발송을 백그라운드에서 진행합니다.
+
         Args:
             notifications: 생성할 알림 데이터 목록
             user_ids: 알림을 받을 사용자 ID 목록
+            contacts: 사용자 ID 별 발송 연락처 (없으면 활성 사용자의 이메일을 조회)
+            chunk_size: INSERT 문 1개당 행 수
 
         Returns:
-            생성된 알림 객체 목록
+            생성된 알림 레코드 목록
         """
-        now = datetime.now(timezone.UTC)
-        db_notifications = []
+        # notification_model 이 이 모듈의 열거형을 가져가므로 순환 import 를 피해 지연 로드
+        from src.modules.notification.notification_model import \
+            Notification as NotificationRecord
 
-        for notification in notifications:
-            for user_id in user_ids:
-                db_notification = Notification(
-                    **notification.model_dump(),
-                    user_id=user_id,
-                    created_at=now,
-                    notification_type=notification.notification_type
-                    or NotificationType.INFO,
-                )
-                db_notifications.append(db_notification)
+        user_ids = [
+            user_id
+            for user_id in user_ids
+            if self._is_subscribed(user_id, NotificationCategory.SYSTEM)
+        ]
+        if not notifications or not user_ids:
+            return []
+
+        now = datetime.now(timezone.utc)
+        rows = (
+            {
+                "user_id": user_id,
+                "content": notification.message,
+                "notification_type": _notification_type(notification.type),
+                "priority": NotificationPriority.NORMAL,
+                "category": NotificationCategory.SYSTEM,
+                "is_read": notification.is_read,
+                "created_at": now,
+                "meta": {
+                    "title": notification.title,
+                    "vehicle_id": notification.vehicle_id,
+                },
+            }
+            for notification in notifications
+            for user_id in user_ids
+        )
 
-        self.db.add_all(db_notifications)
+        connection = await self.db.connection()
+        use_returning = connection.dialect.insert_executemany_returning
+        db_notifications: List[Any] = []
+        while True:
+            chunk = list(itertools.islice(rows, chunk_size))
+            if not chunk:
+                break
+            if use_returning:
+                result = await self.db.scalars(
+                    insert(NotificationRecord).returning(NotificationRecord), chunk
+                )
+                records = result.all()
+                # 커밋 시 만료되어 비동기 세션에서 다시 로드되지 않도록 분리
+                for record in records:
+                    self.db.expunge(record)
+                db_notifications.extend(records)
+            else:
+                await self.db.execute(insert(NotificationRecord), chunk)
+                db_notifications.extend(NotificationRecord(**row) for row in chunk)
         await self.db.commit()
 
-        for notification in db_notifications:
-            await self.db.refresh(notification)
+        if self.delivery.enabled:
+            if contacts is None:
+                contacts = await self._load_contacts(user_ids, chunk_size)
+            contacts = self._apply_preferences(contacts)
+            if contacts:
+                self._spawn_delivery(
+                    [
+                        (notification.title, notification.message, user_ids)
+                        for notification in notifications
+                    ],
+                    contacts,
+                )
 
         return db_notifications
 
+    def _is_subscribed(self, user_id: int, category: NotificationCategory) -> bool:
+        """구독이 없거나 구독 카테고리에 ``category`` 가 있으면 수신 대상"""
+        subscription = self.subscriptions.get(user_id)
+        return subscription is None or category in subscription.categories
+
+    async def _load_contacts(
+        self, user_ids: Sequence[int], chunk_size: int = DEFAULT_INSERT_CHUNK_SIZE
+    ) -> Dict[int, DeliveryContact]:
+        """
+        활성 사용자의 발송 연락처 조회
+
+        사용자 테이블에는 디바이스 토큰이 없으므로 이메일만 채웁니다.
+
+        Args:
+            user_ids: 사용자 ID 목록
+            chunk_size: 조회 1회당 ID 수
+
+        Returns:
+            사용자 ID 별 연락처
+        """
+        ids = list(dict.fromkeys(user_ids))
+        contacts: Dict[int, DeliveryContact] = {}
+        for start in range(0, len(ids), chunk_size):
+            result = await self.db.execute(
+                select(User.id, User.email).where(
+                    User.id.in_(ids[start : start + chunk_size]),
+                    User.is_active.is_(True),
+                )
+            )
+            for user_id, email in result.all():
+                if email:
+                    contacts[user_id] = DeliveryContact(email=email)
+        return contacts
+
+    def _apply_preferences(
+        self, contacts: Dict[int, DeliveryContact]
+    ) -> Dict[int, DeliveryContact]:
+        """구독 설정에서 끈 채널(``email``/``push`` 가 False)을 연락처에서 제외"""
+        filtered: Dict[int, DeliveryContact] = {}
+        for user_id, contact in contacts.items():
+            subscription = self.subscriptions.get(user_id)
+            preferences = subscription.preferences if subscription else {}
+            allowed = DeliveryContact(
+                email=contact.email if preferences.get("email", True) else None,
+                device_token=(
+                    contact.device_token if preferences.get("push", True) else None
+                ),
+            )
+            if allowed.email or allowed.device_token:
+                filtered[user_id] = allowed
+        return filtered
+
+    def _spawn_delivery(
+        self,
+        messages: List[Tuple[str, str, List[int]]],
+        contacts: Dict[int, DeliveryContact],
+    ) -> None:
+        """발송 파이프라인을 백그라운드 작업으로 실행 (참조 유지)"""
+        task = asyncio.create_task(self.delivery.deliver(messages, contacts))
+        self._delivery_tasks.add(task)
+        task.add_done_callback(self._delivery_tasks.discard)
+
+    async def wait_for_deliveries(self) -> List[DeliveryReport]:
+        """
+        진행 중인 발송 완료 대기
+
+        Returns:
+            List[DeliveryReport]: 발송 결과 목록
+        """
+        if not self._delivery_tasks:
+            return []
+        results = await asyncio.gather(*self._delivery_tasks, return_exceptions=True)
+        return [result for result in results if isinstance(result, DeliveryReport)]
+
     async def get_notifications(
         self,
         user_id: int,
@@ -623,7 +737,7 @@ class NotificationService:
         Returns:
             업데이트된 알림 객체 목록
         """
-        now = datetime.now(timezone.UTC)
+        now = datetime.now(timezone.utc)
         query = select(Notification).where(
             and_(
                 Notification.id.in_(notification_ids),
@@ -9,6 +9,7 @@ from datetime import date, datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional, Tuple, Union, cast
 
 from packagescore.exceptions import NotFoundException, ValidationException
+from packagescore.reminder_queue import default_worker_id
 from packagesmodels.schedule import (RecurrencePattern, ReminderStatus,
                                      ReminderType, ScheduleModel,
                                      ScheduleNoteModel, SchedulePriority,
@@ -576,28 +577,42 @@ class ScheduleService:
             include_relations=True,
         )
 
-    def process_pending_reminders(self, limit: int = 50) -> int:
-        """대기 중인 알림 처리"""
-        now = datetime.now(timezone.utc)
-        pending_reminders = (
-            self.db.query(ScheduleReminderModel)
-            .filter(
-                ScheduleReminderModel.reminder_time <= now,
-                ScheduleReminderModel.status == "pending",
-            )
-            .limit(limit)
-            .all()
+    def process_pending_reminders(
+        self,
+        limit: int = 50,
+        worker_id: Optional[str] = None,
+        reminder_ids: Optional[List[str]] = None,
+    ) -> int:
+        """
+        대기 중인 알림 처리
+
+        알림을 선점한 뒤 발송하므로 여러 워커에서 동시에 실행해도 중복 발송되지 않습니다.
+
+        Args:
+            limit: 한 번에 처리할 최대 알림 수
+            worker_id: 워커 식별자 (기본값: 호스트:PID)
+            reminder_ids: 지정 시 이 알림 중에서만 처리
+
+        Returns:
+            발송에 성공한 알림 수
+        """
+        pending_reminders = self.repository.claim_pending_reminders(
+            worker_id or default_worker_id(), limit, reminder_ids
         )
 
-        processed_count = 0
+        sent_ids: List[str] = []
+        failed_ids: List[str] = []
         for reminder in pending_reminders:
             try:
                 self._send_reminder(reminder)
-                processed_count += 1
+                sent_ids.append(reminder.id)
             except Exception as e:
+                failed_ids.append(reminder.id)
                 logger.error(f"알림 처리 중 오류 발생: {str(e)}")
 
-        return processed_count
+        self.repository.finish_reminders(sent_ids, ReminderStatus.SENT.value)
+        self.repository.finish_reminders(failed_ids, ReminderStatus.FAILED.value)
+        return len(sent_ids)
 
     def _send_reminder(self, reminder: ScheduleReminderModel) -> None:
         """알림 발송 처리"""
@@ -63,6 +63,7 @@ except ImportError:
 
 from packagesmodels.schemas import (ShopCreate, ShopReviewCreate, ShopStatus,
                                     ShopUpdate)
+from packagescore.aggregates import aggregate_statistics, stats_cache
 
 T = TypeVar("T")
 ShopData = Dict[str, Any]
@@ -369,6 +370,8 @@ class ShopService:
             setattr(shop, field, value)
 
         db.commit()
+        # 서비스 일괄 삭제는 ORM 이벤트가 없으므로 통계 캐시를 직접 무효화
+        stats_cache.invalidate("shop")
         db.refresh(shop)
 
         return self.get_shop_by_id(shop_id)
@@ -398,6 +401,7 @@ class ShopService:
         # 정비소 삭제
         db.delete(shop)
         db.commit()
+        stats_cache.invalidate("shop")
 
         return True
 
@@ -691,42 +695,53 @@ class ShopService:
         }
 
     def get_shop_statistics(self) -> Dict[str, Any]:
-        """정비소 통계 정보를 조회합니다."""
-        db = get_db()
-
-        # 통계 데이터 수집
-        total_shops = db.query(Shop).count()
-        active_shops = db.query(Shop).filter(Shop.status == ShopStatus.ACTIVE).count()
+        """정비소 통계 정보를 조회합니다.
 
-        # 정비소 유형별 통계
-        shop_type_stats = (
-            db.query(Shop.type, sql_func.count(Shop.id).label("count"))
-            .group_by(Shop.type)
-            .all()
+        테이블마다 조건부 집계 한 번과 분포별 GROUP BY 로 집계하며, 결과는
+        정비소/서비스 쓰기가 커밋되면 무효화되는 통계 캐시에 보관됩니다.
+        """
+        shop_model = self.shop_model
+        shop_service_model = self.shop_service_model
+        stats_cache.watch(shop_model, "shop")
+        stats_cache.watch(shop_service_model, "shop")
+        return stats_cache.get_or_compute(
+            "shop",
+            "statistics",
+            lambda: self._compute_shop_statistics(shop_model, shop_service_model),
         )
 
-        type_distribution = {
-            str(shop_type): count for shop_type, count in shop_type_stats
-        }
+    def _compute_shop_statistics(
+        self, shop_model: Type[Shop], shop_service_model: Type[ShopService]
+    ) -> Dict[str, Any]:
+        """정비소 통계를 테이블별 집계 쿼리로 계산합니다."""
+        db = get_db()
 
-        # 서비스 유형별 통계
-        service_type_stats = (
-            db.query(
-                ShopService.service_type, sql_func.count(ShopService.id).label("count")
-            )
-            .group_by(ShopService.service_type)
-            .all()
+        # 정비소 수, 활성 정비소 수, 유형별 분포
+        shop_stats = aggregate_statistics(
+            db,
+            shop_model,
+            group_by={"type_distribution": shop_model.type},
+            conditions={"active_shops": shop_model.status == ShopStatus.ACTIVE},
         )
 
-        service_distribution = {
-            str(service_type): count for service_type, count in service_type_stats
-        }
+        # 서비스 유형별 통계
+        service_stats = aggregate_statistics(
+            db,
+            shop_service_model,
+            group_by={"service_distribution": shop_service_model.service_type},
+        )
 
         return {
-            "total_shops": total_shops,
-            "active_shops": active_shops,
-            "type_distribution": type_distribution,
-            "service_distribution": service_distribution,
+            "total_shops": shop_stats["total_count"],
+            "active_shops": shop_stats["active_shops"],
+            "type_distribution": {
+                str(shop_type): count
+                for shop_type, count in shop_stats["type_distribution"].items()
+            },
+            "service_distribution": {
+                str(service_type): count
+                for service_type, count in service_stats["service_distribution"].items()
+            },
             "updated_at": datetime.now(timezone.utc),
         }
 
@@ -7,7 +7,8 @@ from typing import Any, Dict, List, Optional, Tuple, Type, TypeVar
 
 from packagescore.base_repository import BaseRepository
 from packagescore.logging import get_logger
-from packagesdatabase.models import Todo
+from packagescore.tag_index import TagIndex
+from packagesdatabase.models import EntityTag, Todo
 from packagesmodels.schemas import (TodoCreate, TodoPriority, TodoStatus,
                                     TodoUpdate)
 from sqlalchemy import and_, asc, desc, func, or_
@@ -27,6 +28,7 @@ class TodoRepository(BaseRepository[Todo, TodoCreate]):
             db: 데이터베이스 세션
         """
         super().__init__(db, Todo)
+        self.tag_index = TagIndex(EntityTag, "todo")
 
     def get_todo_list(
         self,
@@ -176,12 +178,11 @@ class TodoRepository(BaseRepository[Todo, TodoCreate]):
                 )
 
             elif key == "tags" and value:
-                # JSON 필드에서 태그 검색
-                if isinstance(value, list):
-                    for tag in value:
-                        query = query.filter(self.model.tags.contains([tag]))
-                else:
-                    query = query.filter(self.model.tags.contains([value]))
+                # 태그 인덱스에서 모든 태그를 가진 항목 검색
+                tags = value if isinstance(value, list) else [value]
+                query = self.tag_index.filter_by_tags(
+                    query, self.model.id, tags, match_all=True
+                )
 
             elif key == "category" and value:
                 query = query.filter(self.model.category == value)
@@ -235,6 +236,10 @@ class TodoRepository(BaseRepository[Todo, TodoCreate]):
             category=getattr(todo_create, "category", None),
         )
 
+        # 태그 인덱스 동기화 (Todo 와 같은 트랜잭션에서 커밋)
+        if todo.tags:
+            self.tag_index.replace(self.db, todo.id, todo.tags)
+
         # Todo 저장
         return self.create(todo)
 
@@ -260,6 +265,10 @@ class TodoRepository(BaseRepository[Todo, TodoCreate]):
         for key, value in update_data.items():
             setattr(todo, key, value)
 
+        # 태그가 변경된 경우 태그 인덱스 동기화
+        if "tags" in update_data:
+            self.tag_index.replace(self.db, todo.id, update_data["tags"] or [])
+
         # 업데이트 시간 설정
         todo.updated_at = datetime.now()
 
@@ -282,6 +291,8 @@ class TodoRepository(BaseRepository[Todo, TodoCreate]):
             logger.warning(f"삭제할 Todo를 찾을 수 없음: {todo_id}")
             return False
 
+        self.tag_index.clear(self.db, todo_id)
+
         # Todo 삭제
         return self.delete(todo)
 
@@ -432,11 +443,12 @@ class TodoRepository(BaseRepository[Todo, TodoCreate]):
         Returns:
             태그가 포함된 할 일 목록
         """
-        query = self.db.query(self.model)
-
-        for tag in tags:
-            query = query.filter(self.model.tags.contains([tag]))
+        if not tags:
+            return []
 
+        query = self.tag_index.filter_by_tags(
+            self.db.query(self.model), self.model.id, tags, match_all=True
+        )
         return query.all()
 
     def get_todo_stats(self, user_id: Optional[str] = None) -> Dict[str, Any]:
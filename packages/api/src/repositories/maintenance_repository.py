@@ -4,16 +4,20 @@
 
 import json
 import logging
+import uuid
 from datetime import datetime, timedelta, timezone
 from enum import Enum
+from contextlib import ExitStack, contextmanager
 from functools import wraps
-from typing import Any, Dict, List, Optional, Tuple, Type, Union
+from typing import (Any, Callable, Dict, Iterator, List, Optional, Sequence,
+                    Tuple, Type, Union)
 
 from fastapi import HTTPException, status
 from packagescore.logging import get_logger
 from packagescore.metrics import track_db_query_time
-from sqlalchemy import (Index, and_, asc, delete, desc, func, not_, or_,
-                        select, text, update)
+from sqlalchemy import (Index, and_, asc, case, delete, desc, func, not_,
+                        or_, select, text, update)
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 
@@ -59,7 +63,9 @@ except ImportError:
         OTHER = "other"
 
 
-from packagesdatabase.models import Shop, Todo, User, Vehicle
+from packagesdatabase.models import (ArchiveCheckpoint, EntityTag, Shop, Todo,
+                                     User, Vehicle)
+from packagesmodels.maintenance import MaintenanceArchiveModel
 
 try:
     from packagesdatabase.models import Maintenance
@@ -68,10 +74,18 @@ except ImportError:
 
 from enum import Enum
 
-from packagescore.base_repository import BaseRepository
+from packagescore.aggregates import aggregate_statistics, stats_cache
+from packagescore.archiver import ArchiveCheckpointStore, SetBasedArchiver
+from packagescore.bulk_ingest import (DEFAULT_INGEST_BATCH_SIZE,
+                                      BulkIngestError, BulkIngestor,
+                                      IngestMethod, IngestReport, iter_records)
+from packagescore.full_text import maintenance_search_index
+from packagescore.base_repository import BaseRepository, DatabaseOperationError
+from packagescore.exceptions import ValidationException
 from packagescore.logging import get_logger
 # MetricsCollector 대신 metrics_collector 인스턴스를 직접 임포트
 from packagescore.metrics_collector import metrics_collector
+from packagescore.tag_index import TagIndex
 
 # 로거 설정
 logger = get_logger(__name__)
@@ -85,7 +99,7 @@ try:
     from packagescore.events import EventEmitter
     from packagescore.query_optimizer import QueryOptimizer
     from packagescore.replication import ReplicationManager
-    from packagescore.sharding import ShardingManager
+    from packagescore.sharding import ShardingManager, sharding_manager
 except ImportError:
     # 더미 클래스 정의
     class DummyManager:
@@ -143,6 +157,7 @@ except ImportError:
 
     # 더미 매니저 인스턴스 생성
     ShardingManager = DummyManager
+    sharding_manager = DummyManager()
     ReplicationManager = DummyManager
     DashboardManager = DummyManager
 
@@ -176,8 +191,7 @@ if "Maintenance" not in globals():
                 setattr(self, key, value)
 
 
-# 매니저 인스턴스 생성
-sharding_manager = ShardingManager()
+# 매니저 인스턴스 생성 (샤딩 매니저는 애플리케이션 시작 시 노드를 등록한 전역 인스턴스)
 replication_manager = ReplicationManager()
 dashboard_manager = DashboardManager()
 
@@ -257,6 +271,8 @@ class MaintenanceRepository(BaseRepository[Maintenance, MaintenanceCreate]):
         self.encryption_service = EncryptionService()
         self.audit_logger = AuditLogger()
         self.query_optimizer = QueryOptimizer()
+        self.tag_index = TagIndex(EntityTag, "maintenance")
+        self.search_index = maintenance_search_index()
 
         # 이벤트 리스너 등록
         self.event_emitter.on("maintenance.created", self._on_maintenance_created)
@@ -266,15 +282,15 @@ class MaintenanceRepository(BaseRepository[Maintenance, MaintenanceCreate]):
         # 성능 모니터링 초기화
         self._init_performance_monitoring()
 
-        # 샤딩 초기화
-        self._init_sharding()
-
         # 복제 초기화
         self._init_replication()
 
         # 대시보드 초기화
         self._init_dashboard()
 
+        # ORM 쓰기 이벤트 발생 시 통계 캐시 무효화
+        stats_cache.watch(Maintenance, "maintenance")
+
     def _create_indexes(self):
         """필요한 인덱스를 생성합니다."""
         try:
@@ -286,7 +302,7 @@ class MaintenanceRepository(BaseRepository[Maintenance, MaintenanceCreate]):
             # 상태 인덱스
             Index("idx_maintenance_status", Maintenance.status).create(self.db.bind)
 
-            # 태그 인덱스 (GIN)
+            # 태그 인덱스 (GIN) - tags 컬럼을 직접 조회하는 경로용
             self.db.execute(
                 text(
                     "CREATE INDEX IF NOT EXISTS idx_maintenance_tags ON maintenance USING gin(tags)"
@@ -439,17 +455,111 @@ class MaintenanceRepository(BaseRepository[Maintenance, MaintenanceCreate]):
         except Exception as e:
             logger.error(f"캐시 무효화 중 오류: {str(e)}")
 
+    @contextmanager
+    def _vehicle_db(self, vehicle_id: Any) -> Iterator[Any]:
+        """
+        차량의 정비 기록을 담당하는 세션 컨텍스트 (예외 시 롤백)
+
+        샤드 노드가 등록되어 있으면 ``vehicle_id`` 로 고른 샤드 세션을, 아니면
+        리포지토리 세션을 사용합니다.
+
+        Args:
+            vehicle_id: 차량 ID
+
+        Yields:
+            샤드 세션 또는 리포지토리 세션
+        """
+        if getattr(self.sharding_manager, "enabled", False):
+            with self.sharding_manager.session_for(str(vehicle_id)) as db:
+                yield db
+            return
+        try:
+            yield self.db
+        except Exception:
+            self.db.rollback()
+            raise
+
+    def _locate_maintenance(self, maintenance_id: str) -> Optional[str]:
+        """
+        정비 기록을 저장한 샤드 이름 조회 (모든 샤드에서 기본 키로 조회)
+
+        Args:
+            maintenance_id: 정비 기록 ID
+
+        Returns:
+            Optional[str]: 샤드 이름 (어느 샤드에도 없으면 None)
+        """
+        found = self.sharding_manager.scatter(
+            lambda db: db.query(Maintenance.id)
+            .filter(Maintenance.id == maintenance_id)
+            .first()
+            is not None
+        )
+        return next((name for name, hit in found.items() if hit), None)
+
+    @contextmanager
+    def _maintenance_db(
+        self, maintenance_id: str
+    ) -> Iterator[Tuple[Any, Optional[Maintenance]]]:
+        """
+        정비 기록과 그 기록을 저장한 세션 컨텍스트 (예외 시 롤백)
+
+        샤드 노드가 등록되어 있으면 기록을 가진 샤드의 세션을 사용하므로
+        ``create_maintenance`` 가 차량 담당 샤드에 저장한 기록도 ID 로
+        조회/수정/삭제할 수 있습니다. 태그 인덱스도 이 세션에 기록합니다.
+
+        Args:
+            maintenance_id: 정비 기록 ID
+
+        Yields:
+            (세션, 정비 기록) - 기록이 없으면 정비 기록은 None
+        """
+        if getattr(self.sharding_manager, "enabled", False):
+            shard = self._locate_maintenance(maintenance_id)
+            if shard is None:
+                yield None, None
+                return
+            with self.sharding_manager.session(shard) as db:
+                yield db, db.get(Maintenance, maintenance_id)
+            return
+        try:
+            yield self.db, self.db.get(Maintenance, maintenance_id)
+        except Exception:
+            self.db.rollback()
+            raise
+
+    def _query_maintenance(
+        self,
+        build: Callable[[Any, Optional[int]], List[Maintenance]],
+        order_by: Sequence[Tuple[str, bool]] = (),
+        limit: Optional[int] = None,
+    ) -> List[Maintenance]:
+        """
+        정비 기록 목록 조회 (샤드 노드가 있으면 모든 샤드에서 조회 후 병합)
+
+        Args:
+            build: 세션과 조회 개수를 받아 ``order_by`` 순서로 정렬된 목록을 반환하는 함수
+            order_by: 병합 정렬 필드 목록 (``(필드, 내림차순 여부)``)
+            limit: 최대 항목 수 (None 이면 전체)
+
+        Returns:
+            List[Maintenance]: 정비 기록 목록
+        """
+        if getattr(self.sharding_manager, "enabled", False):
+            return self.sharding_manager.query_all(build, order_by, limit=limit)
+        return build(self.db, limit)
+
     @track_db_query_time
     @cache_decorator(ttl=None)
     async def get_maintenance_by_id(
         self, maintenance_id: str
     ) -> Optional[Dict[str, Any]]:
-        """ID로 정비 기록 조회"""
+        """ID로 정비 기록 조회 (기록을 저장한 샤드에서 조회)"""
         try:
-            maintenance = await self.find_by_id(maintenance_id)
-            if not maintenance:
-                return None
-            return self._model_to_dict(maintenance)
+            with self._maintenance_db(maintenance_id) as (_, maintenance):
+                if maintenance is None:
+                    return None
+                return self._model_to_dict(maintenance)
         except Exception as e:
             logger.error(f"정비 ID {maintenance_id} 조회 중 오류: {str(e)}")
             return None
@@ -458,14 +568,15 @@ class MaintenanceRepository(BaseRepository[Maintenance, MaintenanceCreate]):
     async def get_maintenance_by_vehicle_id(
         self, vehicle_id: str
     ) -> List[Dict[str, Any]]:
-        """차량 ID로 정비 기록 목록 조회"""
+        """차량 ID로 정비 기록 목록 조회 (차량 담당 샤드에서 조회)"""
         try:
-            records = (
-                self.db.query(Maintenance)
-                .filter(Maintenance.vehicle_id == vehicle_id)
-                .order_by(Maintenance.date.desc())
-                .all()
-            )
+            with self._vehicle_db(vehicle_id) as db:
+                records = (
+                    db.query(Maintenance)
+                    .filter(Maintenance.vehicle_id == vehicle_id)
+                    .order_by(Maintenance.date.desc())
+                    .all()
+                )
 
             return [self._model_to_dict(record) for record in records]
         except Exception as e:
@@ -476,19 +587,20 @@ class MaintenanceRepository(BaseRepository[Maintenance, MaintenanceCreate]):
     async def get_maintenance_by_vehicle_id_and_status(
         self, vehicle_id: str, status_list: List[str]
     ) -> List[Dict[str, Any]]:
-        """차량 ID와 상태로 정비 기록 목록 조회"""
+        """차량 ID와 상태로 정비 기록 목록 조회 (차량 담당 샤드에서 조회)"""
         try:
-            records = (
-                self.db.query(Maintenance)
-                .filter(
-                    and_(
-                        Maintenance.vehicle_id == vehicle_id,
-                        Maintenance.status.in_(status_list),
+            with self._vehicle_db(vehicle_id) as db:
+                records = (
+                    db.query(Maintenance)
+                    .filter(
+                        and_(
+                            Maintenance.vehicle_id == vehicle_id,
+                            Maintenance.status.in_(status_list),
+                        )
                     )
+                    .order_by(Maintenance.date.desc())
+                    .all()
                 )
-                .order_by(Maintenance.date.desc())
-                .all()
-            )
 
             return [self._model_to_dict(record) for record in records]
         except SQLAlchemyError as e:
@@ -507,10 +619,10 @@ class MaintenanceRepository(BaseRepository[Maintenance, MaintenanceCreate]):
 
     @track_db_query_time
     async def create_maintenance(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        """새 정비 기록 생성"""
+        """새 정비 기록 생성 (차량 담당 샤드에 저장)"""
         try:
             # 데이터 유효성 검사
-            errors = self.validate_maintenance_data(data)
+            errors = await self.validate_maintenance_data(data)
             if errors:
                 raise ValueError(f"유효하지 않은 데이터: {', '.join(errors)}")
 
@@ -523,12 +635,18 @@ class MaintenanceRepository(BaseRepository[Maintenance, MaintenanceCreate]):
             data["created_at"] = current_time
             data["updated_at"] = current_time
 
+            # 태그는 tags 컬럼과 정규화된 태그 인덱스에 함께 저장
+            tags = data.get("tags")
+
             # 모델 생성
             new_maintenance = Maintenance(**data)
 
-            self.db.add(new_maintenance)
-            self.db.commit()
-            self.db.refresh(new_maintenance)
+            with self._vehicle_db(new_maintenance.vehicle_id) as db:
+                db.add(new_maintenance)
+                if tags:
+                    self.tag_index.replace(db, new_maintenance.id, tags)
+                db.commit()
+                db.refresh(new_maintenance)
 
             # 이벤트 발행
             self.event_emitter.emit(
@@ -545,8 +663,6 @@ class MaintenanceRepository(BaseRepository[Maintenance, MaintenanceCreate]):
 
             return self._model_to_dict(new_maintenance)
         except Exception as e:
-            if "db" in locals():
-                self.db.rollback()
             logger.error(f"정비 기록 생성 중 오류: {str(e)}")
             raise
 
@@ -554,30 +670,36 @@ class MaintenanceRepository(BaseRepository[Maintenance, MaintenanceCreate]):
     async def update_maintenance(
         self, maintenance_id: str, data: Dict[str, Any]
     ) -> Dict[str, Any]:
-        """정비 기록 업데이트"""
+        """정비 기록 업데이트 (기록을 저장한 샤드에서 수정)"""
         try:
             # 데이터 유효성 검사
-            errors = self.validate_maintenance_data(data, is_update=True)
+            errors = await self.validate_maintenance_data(data, is_update=True)
             if errors:
                 raise ValueError(f"유효하지 않은 데이터: {', '.join(errors)}")
 
-            maintenance = await self.find_by_id(maintenance_id)
-            if not maintenance:
-                raise ValueError(f"ID {maintenance_id}인 정비 기록을 찾을 수 없습니다.")
+            with self._maintenance_db(maintenance_id) as (db, maintenance):
+                if maintenance is None:
+                    raise ValueError(
+                        f"ID {maintenance_id}인 정비 기록을 찾을 수 없습니다."
+                    )
 
-            # 이전 상태 저장
-            old_status = maintenance.status
+                # 이전 상태 저장
+                old_status = maintenance.status
 
-            # 업데이트 시간 기록 (UTC 사용)
-            data["updated_at"] = datetime.now(timezone.utc)
+                # 업데이트 시간 기록 (UTC 사용)
+                data["updated_at"] = datetime.now(timezone.utc)
 
-            # 필드 업데이트
-            for key, value in data.items():
-                if hasattr(maintenance, key):
-                    setattr(maintenance, key, value)
+                # 태그가 변경된 경우 태그 인덱스 동기화 (tags 컬럼은 아래에서 갱신)
+                if "tags" in data:
+                    self.tag_index.replace(db, maintenance_id, data["tags"] or [])
 
-            self.db.commit()
-            self.db.refresh(maintenance)
+                # 필드 업데이트
+                for key, value in data.items():
+                    if hasattr(maintenance, key):
+                        setattr(maintenance, key, value)
+
+                db.commit()
+                db.refresh(maintenance)
 
             # 상태 변경 처리
             if "status" in data and data["status"] != old_status:
@@ -591,36 +713,27 @@ class MaintenanceRepository(BaseRepository[Maintenance, MaintenanceCreate]):
 
             return self._model_to_dict(maintenance)
         except Exception as e:
-            if "db" in locals():
-                self.db.rollback()
             logger.error(f"정비 기록 업데이트 중 오류: {str(e)}")
             raise
 
     @track_db_query_time
     async def delete_maintenance(self, maintenance_id: str) -> bool:
-        """정비 기록 삭제"""
+        """정비 기록 삭제 (기록을 저장한 샤드에서 삭제)"""
         try:
-            maintenance = (
-                await self.db.query(Maintenance)
-                .filter(Maintenance.id == maintenance_id)
-                .first()
-            )
-
-            if not maintenance:
-                return False
+            with self._maintenance_db(maintenance_id) as (db, maintenance):
+                if maintenance is None:
+                    return False
 
-            await self.db.delete(maintenance)
-            await self.db.commit()
+                self.tag_index.clear(db, maintenance_id)
+                db.delete(maintenance)
+                db.commit()
 
             # 캐시 무효화
             await self.invalidate_cache(f"maintenance_{maintenance_id}")
-            if hasattr(maintenance, "vehicle_id"):
-                await self.invalidate_cache(f"vehicle_{maintenance.vehicle_id}")
+            await self.invalidate_cache(f"vehicle_{maintenance.vehicle_id}")
 
             return True
         except SQLAlchemyError as e:
-            if "db" in locals():
-                await self.db.rollback()
             logger.error(f"정비 기록 삭제 중 오류: {str(e)}")
             return False
 
@@ -629,14 +742,16 @@ class MaintenanceRepository(BaseRepository[Maintenance, MaintenanceCreate]):
     async def get_maintenance_by_status(
         self, status: str, limit: int = 100
     ) -> List[Dict[str, Any]]:
-        """상태별 정비 기록 조회"""
+        """상태별 정비 기록 조회 (샤드 노드가 있으면 모든 샤드에서 조회 후 병합)"""
         try:
-            records = (
-                await self.db.query(Maintenance)
+            records = self._query_maintenance(
+                lambda db, fetch: db.query(Maintenance)
                 .filter(Maintenance.status == status)
-                .order_by(Maintenance.date.desc())
-                .limit(limit)
-                .all()
+                .order_by(Maintenance.date.desc(), Maintenance.id.desc())
+                .limit(fetch)
+                .all(),
+                order_by=[("date", True), ("id", True)],
+                limit=limit,
             )
 
             return [self._model_to_dict(record) for record in records]
@@ -865,6 +980,7 @@ class MaintenanceRepository(BaseRepository[Maintenance, MaintenanceCreate]):
                 )
 
             self.db.commit()
+            stats_cache.invalidate("maintenance")
             logger.debug(
                 f"유지보수 기록 일괄 상태 업데이트 완료: {result}개 항목 업데이트됨"
             )
@@ -877,62 +993,61 @@ class MaintenanceRepository(BaseRepository[Maintenance, MaintenanceCreate]):
         """
         유지보수 기록 통계를 조회합니다.
 
+        상태/차량/월별 분포를 분포마다 따로 GROUP BY 해 계산하며, 결과는 정비 기록
+        쓰기가 커밋되면 무효화되는 통계 캐시에 보관됩니다.
+
         Returns:
             Dict[str, Any]: 통계 정보
         """
         try:
             logger.debug("유지보수 기록 통계 조회 시작")
-
-            # 전체 유지보수 기록 수
-            total_count = self.db.query(func.count(Maintenance.id)).scalar()
-
-            # 상태별 유지보수 기록 수
-            status_counts = {}
-            for status in MaintenanceStatus:
-                count = (
-                    self.db.query(func.count(Maintenance.id))
-                    .filter(Maintenance.status == status)
-                    .scalar()
-                )
-                status_counts[status.value] = count
-
-            # 차량별 유지보수 기록 수
-            vehicle_counts = (
-                self.db.query(
-                    Maintenance.vehicle_id, func.count(Maintenance.id).label("count")
-                )
-                .group_by(Maintenance.vehicle_id)
-                .all()
-            )
-
-            # 월별 유지보수 기록 수 (최근 12개월)
-            now = datetime.now(timezone.utc)
-            start_date = now - timedelta(days=365)
-            monthly_counts = (
-                self.db.query(
-                    func.date_trunc("month", Maintenance.created_at).label("month"),
-                    func.count(Maintenance.id).label("count"),
-                )
-                .filter(Maintenance.created_at >= start_date)
-                .group_by("month")
-                .order_by("month")
-                .all()
+            return stats_cache.get_or_compute(
+                "maintenance", "statistics", self._compute_maintenance_statistics
             )
-
-            return {
-                "total_count": total_count,
-                "status_distribution": status_counts,
-                "vehicle_distribution": {
-                    str(vid): count for vid, count in vehicle_counts
-                },
-                "monthly_trend": {
-                    str(month.date()): count for month, count in monthly_counts
-                },
-            }
         except Exception as e:
             logger.error(f"유지보수 기록 통계 조회 중 오류 발생: {str(e)}")
             raise
 
+    def _compute_maintenance_statistics(self) -> Dict[str, Any]:
+        """유지보수 기록 통계를 분포별 집계 쿼리로 계산합니다."""
+        # 월별 유지보수 기록 수 (최근 12개월, 그 이전 레코드는 NULL 그룹)
+        now = datetime.now(timezone.utc)
+        start_date = now - timedelta(days=365)
+        recent_month = case(
+            (
+                Maintenance.created_at >= start_date,
+                func.date_trunc("month", Maintenance.created_at),
+            )
+        )
+
+        stats = aggregate_statistics(
+            self.db,
+            Maintenance,
+            group_by={
+                "status_distribution": Maintenance.status,
+                "vehicle_distribution": Maintenance.vehicle_id,
+                "monthly_trend": recent_month,
+            },
+        )
+
+        return {
+            "total_count": stats["total_count"],
+            "status_distribution": {
+                status.value: stats["status_distribution"].get(status.value, 0)
+                for status in MaintenanceStatus
+            },
+            "vehicle_distribution": {
+                str(vid): count for vid, count in stats["vehicle_distribution"].items()
+            },
+            "monthly_trend": {
+                str(month.date()): count
+                for month, count in sorted(
+                    (item for item in stats["monthly_trend"].items() if item[0] is not None),
+                    key=lambda item: item[0],
+                )
+            },
+        }
+
     def _get_active_maintenance_query(self):
         """활성 상태의 유지보수 기록 쿼리를 반환합니다."""
         return self.db.query(self.model).filter(
@@ -1004,134 +1119,156 @@ class MaintenanceRepository(BaseRepository[Maintenance, MaintenanceCreate]):
 
         Returns:
             List[Dict[str, Any]]: 생성된 유지보수 기록 목록
-        """
-        try:
-            logger.debug(f"유지보수 기록 일괄 생성 시작: {len(data_list)}개 항목")
-
-            current_time = datetime.now(timezone.utc)
-            created_records = []
-
-            for data in data_list:
-                # ID 생성
-                if "id" not in data:
-                    data["id"] = str(uuid.uuid4())
-
-                # 시간 정보 추가
-                data["created_at"] = current_time
-                data["updated_at"] = current_time
 
-                # 모델 생성
-                new_maintenance = Maintenance(**data)
-                self.db.add(new_maintenance)
-                created_records.append(new_maintenance)
-
-            self.db.commit()
-
-            # 생성된 레코드 새로고침
-            for record in created_records:
-                self.db.refresh(record)
-
-            result = [self._model_to_dict(record) for record in created_records]
-            logger.debug(f"유지보수 기록 일괄 생성 완료: {len(result)}개 항목")
-            return result
+        Raises:
+            BulkIngestError: 유효하지 않은 항목이 있는 경우 (아무것도 생성하지 않음)
+        """
+        logger.debug(f"유지보수 기록 일괄 생성 시작: {len(data_list)}개 항목")
 
-        except Exception as e:
-            if "db" in locals():
-                self.db.rollback()
-            logger.error(f"유지보수 기록 일괄 생성 중 오류: {str(e)}")
-            raise
+        report = self.ingest_maintenance(data_list, atomic=True, collect_ids=True)
+        records = self._query_maintenance(
+            lambda db, fetch: db.query(Maintenance)
+            .filter(Maintenance.id.in_(report.inserted_ids))
+            .all()
+        )
+        result = [self._model_to_dict(record) for record in records]
+        logger.debug(f"유지보수 기록 일괄 생성 완료: {len(result)}개 항목")
+        return result
 
     @track_db_query_time
     def batch_delete_maintenance(self, maintenance_ids: List[str]) -> int:
         """
         여러 유지보수 기록을 일괄 삭제합니다.
 
+        기록과 태그 인덱스(entity_tags)를 같은 세션(샤드)에서 함께 삭제합니다.
+
         Args:
             maintenance_ids: 삭제할 유지보수 기록 ID 목록
 
         Returns:
             int: 삭제된 레코드 수
         """
-        try:
-            logger.debug(f"유지보수 기록 일괄 삭제 시작: {len(maintenance_ids)}개 항목")
 
-            result = (
-                self.db.query(Maintenance)
+        def delete_on(db: Any) -> int:
+            self.tag_index.clear_many(db, maintenance_ids)
+            deleted = (
+                db.query(Maintenance)
                 .filter(Maintenance.id.in_(maintenance_ids))
                 .delete(synchronize_session=False)
             )
+            db.commit()
+            return deleted
 
-            self.db.commit()
+        try:
+            logger.debug(f"유지보수 기록 일괄 삭제 시작: {len(maintenance_ids)}개 항목")
+
+            if getattr(self.sharding_manager, "enabled", False):
+                result = sum(self.sharding_manager.scatter(delete_on).values())
+            else:
+                result = delete_on(self.db)
+            stats_cache.invalidate("maintenance")
             logger.debug(f"유지보수 기록 일괄 삭제 완료: {result}개 항목 삭제됨")
             return result
 
         except Exception as e:
-            if "db" in locals():
+            if self.db is not None:
                 self.db.rollback()
             logger.error(f"유지보수 기록 일괄 삭제 중 오류: {str(e)}")
             raise
 
     @track_db_query_time
     def search_maintenance(
-        self, search_term: str, fields: Optional[List[str]] = None, limit: int = 100
+        self,
+        search_term: str,
+        fields: Optional[List[str]] = None,
+        limit: int = 100,
+        prefix: bool = True,
     ) -> List[Dict[str, Any]]:
         """
         유지보수 기록 전문 검색
 
+        전문 검색 인덱스(PostgreSQL tsvector/GIN, SQLite FTS5)로 검색하여 관련도 순으로
+        반환하며 각 결과에 ``rank`` 와 하이라이트된 ``snippet`` 을 포함합니다.
+        색인되지 않은 필드를 지정하거나 인덱스가 아직 설치되지 않은 DB(마이그레이션
+        전, 미지원 방언)에서는 ``ILIKE`` 검색을 수행합니다.
+
         Args:
             search_term: 검색어
-            fields: 검색할 필드 목록 (None인 경우 모든 문자열 필드 검색)
+            fields: 검색할 필드 목록 (None인 경우 색인된 모든 필드 검색)
             limit: 최대 반환 개수
+            prefix: 검색어를 접두어로 취급할지 여부
 
         Returns:
             검색된 유지보수 기록 목록
+
+        Raises:
+            DatabaseOperationError: 데이터베이스 오류가 발생한 경우
         """
         try:
             logger.debug(
                 f"유지보수 기록 검색 시작: search_term={search_term}, fields={fields}"
             )
 
-            # 검색 가능한 문자열 필드 목록
-            searchable_fields = [
-                "title",
-                "description",
-                "technician_notes",
-                "parts_used",
-                "service_type",
-                "location",
-            ]
-
-            # 검색할 필드 결정
-            target_fields = fields if fields else searchable_fields
-
-            # 검색 조건 생성
-            conditions = []
-            for field in target_fields:
-                if hasattr(self.model, field):
-                    conditions.append(
-                        getattr(self.model, field).ilike(f"%{search_term}%")
-                    )
-
-            # 검색 쿼리 실행
-            if conditions:
-                records = (
-                    self.db.query(self.model)
-                    .filter(or_(*conditions))
-                    .order_by(self.model.updated_at.desc())
-                    .limit(limit)
-                    .all()
+            if fields and not set(fields) <= set(self.search_index.fields):
+                return self._search_maintenance_like(search_term, fields, limit)
+            if not self.search_index.is_installed(self.db.connection()):
+                logger.warning("전문 검색 인덱스가 없어 ILIKE 검색으로 대체합니다.")
+                return self._search_maintenance_like(
+                    search_term, fields or self.search_index.fields, limit
                 )
 
-                result = [self._model_to_dict(record) for record in records]
-                logger.debug(f"유지보수 기록 검색 완료: {len(result)}건 검색됨")
-                return result
+            hits = self.search_index.search(
+                self.db, search_term, limit, prefix, fields=fields
+            )
+            if not hits:
+                return []
 
-            return []
+            records = {
+                record.id: record
+                for record in self.db.query(self.model)
+                .filter(self.model.id.in_([hit.key for hit in hits]))
+                .all()
+            }
+            result = []
+            for hit in hits:
+                record = records.get(hit.key)
+                if record is None:
+                    continue
+                item = self._model_to_dict(record)
+                item["rank"] = hit.rank
+                item["snippet"] = hit.snippet
+                result.append(item)
+
+            logger.debug(f"유지보수 기록 검색 완료: {len(result)}건 검색됨")
+            return result
 
-        except Exception as e:
+        except SQLAlchemyError as e:
             logger.error(f"유지보수 기록 검색 중 오류: {str(e)}")
+            raise DatabaseOperationError(
+                f"검색어 '{search_term}'의 정비 기록 검색 중 오류: {str(e)}"
+            )
+
+    def _search_maintenance_like(
+        self, search_term: str, fields: List[str], limit: int
+    ) -> List[Dict[str, Any]]:
+        """색인되지 않은 필드에 대한 ILIKE 검색"""
+        conditions = [
+            getattr(self.model, field).ilike(f"%{search_term}%")
+            for field in fields
+            if hasattr(self.model, field)
+        ]
+        if not conditions:
             return []
 
+        records = (
+            self.db.query(self.model)
+            .filter(or_(*conditions))
+            .order_by(self.model.updated_at.desc())
+            .limit(limit)
+            .all()
+        )
+        return [self._model_to_dict(record) for record in records]
+
     @track_db_query_time
     def search_by_tags(
         self, tags: List[str], match_all: bool = False
@@ -1151,17 +1288,19 @@ class MaintenanceRepository(BaseRepository[Maintenance, MaintenanceCreate]):
                 f"태그 기반 유지보수 기록 검색 시작: tags={tags}, match_all={match_all}"
             )
 
-            query = self.db.query(self.model)
+            if not tags:
+                return []
 
-            if match_all:
-                # 모든 태그가 일치하는 항목 검색
-                for tag in tags:
-                    query = query.filter(self.model.tags.contains([tag]))
-            else:
-                # 하나라도 일치하는 항목 검색
-                query = query.filter(self.model.tags.overlap(tags))
-
-            records = query.order_by(self.model.updated_at.desc()).all()
+            # 태그 인덱스(entity_tags)는 기록과 같은 샤드에 있으므로 샤드마다
+            # 그 샤드의 태그 인덱스로 거른 뒤 병합
+            records = self._query_maintenance(
+                lambda db, fetch: self.tag_index.filter_by_tags(
+                    db.query(self.model), self.model.id, tags, match_all
+                )
+                .order_by(self.model.updated_at.desc(), self.model.id.desc())
+                .all(),
+                order_by=[("updated_at", True), ("id", True)],
+            )
 
             result = [self._model_to_dict(record) for record in records]
             logger.debug(f"태그 기반 유지보수 기록 검색 완료: {len(result)}건")
@@ -1289,50 +1428,29 @@ class MaintenanceRepository(BaseRepository[Maintenance, MaintenanceCreate]):
     @track_db_query_time
     def bulk_insert_maintenance(
         self, records: List[Dict[str, Any]], chunk_size: int = 1000
-    ) -> int:
+    ) -> IngestReport:
         """
         대량의 유지보수 기록을 효율적으로 삽입합니다.
 
+        유효하지 않은 행은 건너뛰고 나머지 행만 삽입하며, 건너뛴 행은 결과의
+        ``failed`` 건수와 ``errors`` (행 번호, 오류, 원본 행)로 반환합니다.
+
         Args:
             records: 삽입할 레코드 목록
             chunk_size: 한 번에 처리할 레코드 수
 
         Returns:
-            int: 삽입된 레코드 수
+            IngestReport: 삽입된 레코드 수와 거부된 행 목록을 담은 적재 결과
         """
-        try:
-            logger.debug(f"대량 유지보수 기록 삽입 시작: {len(records)}개 항목")
-
-            inserted_count = 0
-            current_time = datetime.now(timezone.utc)
-
-            # 청크 단위로 처리
-            for i in range(0, len(records), chunk_size):
-                chunk = records[i : i + chunk_size]
-
-                # 기본 필드 설정
-                for record in chunk:
-                    if "id" not in record:
-                        record["id"] = str(uuid.uuid4())
-                    record["created_at"] = current_time
-                    record["updated_at"] = current_time
-
-                # 벌크 삽입 실행
-                self.db.bulk_insert_mappings(Maintenance, chunk)
-                inserted_count += len(chunk)
-
-                # 청크 단위로 커밋
-                self.db.commit()
-                logger.debug(f"청크 처리 완료: {inserted_count}/{len(records)}")
+        logger.debug(f"대량 유지보수 기록 삽입 시작: {len(records)}개 항목")
 
-            logger.debug(f"대량 유지보수 기록 삽입 완료: {inserted_count}개 항목")
-            return inserted_count
-
-        except Exception as e:
-            if "db" in locals():
-                self.db.rollback()
-            logger.error(f"대량 유지보수 기록 삽입 중 오류: {str(e)}")
-            raise
+        report = self.ingest_maintenance(records, batch_size=chunk_size)
+        if report.failed:
+            logger.warning(
+                f"대량 유지보수 기록 삽입 중 {report.failed}개 항목 실패: "
+                f"{[error.to_dict() for error in report.errors[:10]]}"
+            )
+        return report
 
     @track_db_query_time
     async def bulk_create_maintenance(
@@ -1348,60 +1466,161 @@ class MaintenanceRepository(BaseRepository[Maintenance, MaintenanceCreate]):
         Returns:
             Tuple[int, List[str]]: 생성된 레코드 수와 생성된 ID 목록
         """
+        logger.debug(f"정비 기록 일괄 생성 시작: {len(records)}개 레코드")
+
         try:
-            logger.debug(f"정비 기록 일괄 생성 시작: {len(records)}개 레코드")
+            report = self.ingest_maintenance(
+                records, batch_size=batch_size, atomic=True, collect_ids=True
+            )
+        except BulkIngestError as e:
+            errors = [
+                f"{error.row_number}행: {', '.join(error.errors)}"
+                for error in e.report.errors
+            ]
+            raise ValidationException(
+                message=f"유효하지 않은 데이터: {'; '.join(errors)}",
+                details=e.report.to_dict(),
+            )
 
-            created_ids = []
-            total_created = 0
+        return report.inserted, report.inserted_ids
 
-            # 데이터 유효성 검사
-            for record in records:
-                errors = self.validate_maintenance_data(record)
-                if errors:
-                    raise ValidationError(f"유효하지 않은 데이터: {', '.join(errors)}")
+    def _check_maintenance_values(
+        self, db: Any, rows: List[Dict[str, Any]]
+    ) -> List[Tuple[int, str]]:
+        """대량 적재용 값 범위 검증 (상태, 비용, 주행거리)"""
+        valid_statuses = {status.value for status in MaintenanceStatus}
+        errors = []
+        for index, row in enumerate(rows):
+            if row.get("status") not in valid_statuses:
+                errors.append((index, f"잘못된 상태 값: {row.get('status')}"))
+            cost = row.get("cost")
+            if cost is not None and not 0 <= cost <= 1000000000:
+                errors.append((index, "비용이 허용 범위를 벗어났습니다"))
+            mileage = row.get("mileage")
+            if mileage is not None and mileage < 0:
+                errors.append((index, "주행거리는 0 이상이어야 합니다"))
+        return errors
 
-            # 배치 단위로 처리
-            for i in range(0, len(records), batch_size):
-                batch = records[i : i + batch_size]
-                current_time = datetime.now(timezone.utc)
-
-                # 각 레코드에 필수 필드 추가
-                maintenance_objects = []
-                batch_vehicle_ids = set()  # 캐시 무효화를 위한 차량 ID 수집
-
-                for record in batch:
-                    record_id = str(uuid.uuid4())
-                    maintenance_obj = Maintenance(
-                        id=record_id,
-                        created_at=current_time,
-                        updated_at=current_time,
-                        **record,
-                    )
-                    maintenance_objects.append(maintenance_obj)
-                    created_ids.append(record_id)
+    def _check_vehicles_exist(
+        self, db: Any, rows: List[Dict[str, Any]]
+    ) -> List[Tuple[int, str]]:
+        """대량 적재용 차량 존재 검증 (배치당 한 번의 IN 쿼리)"""
+        vehicle_ids = {row["vehicle_id"] for row in rows if row.get("vehicle_id")}
+        if not vehicle_ids:
+            return []
+        existing = set(
+            db.execute(select(Vehicle.id).where(Vehicle.id.in_(vehicle_ids))).scalars()
+        )
+        return [
+            (index, f"존재하지 않는 차량 ID: {row['vehicle_id']}")
+            for index, row in enumerate(rows)
+            if row.get("vehicle_id") not in existing
+        ]
+
+    def _maintenance_ingestor(self) -> BulkIngestor:
+        """정비 기록 대량 적재기 생성"""
+        return BulkIngestor(
+            Maintenance,
+            defaults={
+                "created_at": lambda: datetime.now(timezone.utc).replace(tzinfo=None),
+                "updated_at": lambda: datetime.now(timezone.utc).replace(tzinfo=None),
+            },
+            checks=[self._check_maintenance_values, self._check_vehicles_exist],
+            after_write=self._index_ingested_tags,
+        )
 
-                    if "vehicle_id" in record:
-                        batch_vehicle_ids.add(record["vehicle_id"])
+    def _index_ingested_tags(self, db: Any, rows: List[Dict[str, Any]]) -> None:
+        """대량 적재한 정비 기록의 태그를 태그 인덱스(entity_tags)에 기록"""
+        self.tag_index.insert_many(
+            db,
+            {
+                row["id"]: row["tags"]
+                for row in rows
+                if isinstance(row.get("tags"), list)
+            },
+        )
+
+    def _ingest_shard(self, record: Dict[str, Any]) -> str:
+        """대량 적재 행을 기록할 샤드 (차량 ID 가 없는 행은 첫 샤드에서 검증 오류로 보고)"""
+        vehicle_id = record.get("vehicle_id")
+        if vehicle_id in (None, ""):
+            return self.sharding_manager.shard_names[0]
+        return self.sharding_manager.shard_for(str(vehicle_id))
+
+    @track_db_query_time
+    def ingest_maintenance(
+        self,
+        records: Any,
+        batch_size: int = DEFAULT_INGEST_BATCH_SIZE,
+        method: IngestMethod = IngestMethod.AUTO,
+        atomic: bool = False,
+        collect_ids: bool = False,
+    ) -> IngestReport:
+        """
+        정비 기록 스트림을 대량 적재합니다.
+
+        하나의 트랜잭션에서 배치마다 검증 후 COPY(PostgreSQL) 또는 executemany 로
+        기록하며, 실패한 행은 행 번호와 함께 보고서에 기록됩니다. 샤드 노드가
+        등록되어 있으면 행마다 ``vehicle_id`` 로 고른 샤드에 기록합니다.
+
+        Args:
+            records: 정비 기록 딕셔너리 스트림
+            batch_size: 배치 크기
+            method: 기록 방식
+            atomic: True 이면 오류가 있을 때 전체 롤백 후 BulkIngestError 발생
+            collect_ids: 적재된 ID 수집 여부
 
-                # 배치 저장 최적화
-                await self.db.bulk_save_objects(
-                    maintenance_objects, return_defaults=True, update_changed_only=True
+        Returns:
+            IngestReport: 적재 결과
+        """
+        ingestor = self._maintenance_ingestor()
+        options = dict(
+            batch_size=batch_size,
+            method=method,
+            atomic=atomic,
+            collect_ids=collect_ids,
+        )
+        if getattr(self.sharding_manager, "enabled", False):
+            with ExitStack() as stack:
+                sessions = {
+                    name: stack.enter_context(self.sharding_manager.session(name))
+                    for name in self.sharding_manager.shard_names
+                }
+                report = ingestor.ingest_routed(
+                    sessions, self._ingest_shard, records, **options
                 )
-                await self.db.commit()
+        else:
+            report = ingestor.ingest(self.db, records, **options)
+        if report.inserted:
+            stats_cache.invalidate("maintenance")
+        return report
 
-                # 배치 저장
-                self.db.bulk_save_objects(maintenance_objects)
-                self.db.commit()
+    def import_maintenance_file(
+        self,
+        source: Any,
+        fmt: str = "csv",
+        batch_size: int = DEFAULT_INGEST_BATCH_SIZE,
+        method: IngestMethod = IngestMethod.AUTO,
+        encoding: str = "utf-8",
+    ) -> IngestReport:
+        """
+        CSV/NDJSON 파일에서 정비 기록을 가져옵니다 (야간 일괄 가져오기용).
 
-                total_created += len(batch)
-                logger.debug(f"배치 처리 완료: {len(batch)}개 레코드")
+        파일은 한 줄씩 읽으므로 크기와 무관하게 메모리 사용량이 일정합니다.
 
-            return total_created, created_ids
+        Args:
+            source: 파일 경로 또는 파일 객체
+            fmt: ``csv`` 또는 ``ndjson``
+            batch_size: 배치 크기
+            method: 기록 방식
+            encoding: 파일 인코딩
 
-        except Exception as e:
-            self.db.rollback()
-            logger.error(f"정비 기록 일괄 생성 중 오류: {str(e)}")
-            raise
+        Returns:
+            IngestReport: 적재 결과
+        """
+        return self.ingest_maintenance(
+            iter_records(source, fmt, encoding), batch_size=batch_size, method=method
+        )
 
     @track_db_query_time
     def bulk_update_status(
@@ -1448,6 +1667,7 @@ class MaintenanceRepository(BaseRepository[Maintenance, MaintenanceCreate]):
                 )
 
                 self.db.commit()
+                stats_cache.invalidate("maintenance")
                 updated_ids.extend(batch_ids)
                 total_updated += result
 
@@ -1470,6 +1690,10 @@ class MaintenanceRepository(BaseRepository[Maintenance, MaintenanceCreate]):
         """
         중복된 정비 기록을 찾습니다.
 
+        SQL 에서 검사 필드로 GROUP BY 하여 2건 이상인 키만 추린 뒤, 같은 키(버킷)의
+        기록만 생성 시각 순으로 비교합니다. 인접한 기록 간 간격이 ``time_window``
+        이내이면 같은 중복 그룹으로 묶습니다.
+
         Args:
             vehicle_id: 차량 ID (선택)
             time_window: 중복 검사 시간 범위 (시간)
@@ -1485,47 +1709,88 @@ class MaintenanceRepository(BaseRepository[Maintenance, MaintenanceCreate]):
             if not fields:
                 fields = ["vehicle_id", "service_type", "description"]
 
-            # 기본 쿼리 구성
-            query = self.db.query(Maintenance)
+            columns = []
+            for field in fields:
+                column = getattr(Maintenance, field, None)
+                if column is None:
+                    raise ValueError(f"알 수 없는 중복 검사 필드: {field}")
+                columns.append(column)
 
-            # 차량 ID 필터 적용
+            # 시간 범위 조건
+            time_limit = datetime.now(timezone.utc) - timedelta(hours=time_window)
+            conditions = [Maintenance.created_at >= time_limit]
             if vehicle_id:
-                query = query.filter(Maintenance.vehicle_id == vehicle_id)
+                conditions.append(Maintenance.vehicle_id == vehicle_id)
 
-            # 시간 범위 내 레코드 조회
-            time_limit = datetime.now(timezone.utc) - timedelta(hours=time_window)
-            query = query.filter(Maintenance.created_at >= time_limit)
+            # 2건 이상 존재하는 키만 후보로 조회
+            duplicate_keys = (
+                self.db.query(
+                    *[column.label(f"key_{i}") for i, column in enumerate(columns)]
+                )
+                .filter(*conditions)
+                .group_by(*columns)
+                .having(func.count(Maintenance.id) > 1)
+                .subquery()
+            )
+            rows = (
+                self.db.query(Maintenance.id, Maintenance.created_at, *columns)
+                .filter(*conditions)
+                .join(
+                    duplicate_keys,
+                    and_(
+                        *[
+                            column.is_not_distinct_from(duplicate_keys.c[f"key_{i}"])
+                            for i, column in enumerate(columns)
+                        ]
+                    ),
+                )
+                .order_by(Maintenance.created_at)
+                .all()
+            )
+
+            # 키별 버킷에 생성 시각 순으로 적재
+            buckets: Dict[Tuple[Any, ...], List[Tuple[Any, datetime]]] = {}
+            for row in rows:
+                buckets.setdefault(tuple(row[2:]), []).append((row[0], row[1]))
+
+            window = timedelta(hours=time_window)
+            groups: List[Tuple[Tuple[Any, ...], List[Tuple[Any, datetime]]]] = []
+            for key, members in buckets.items():
+                current = [members[0]]
+                for member in members[1:]:
+                    if member[1] - current[-1][1] <= window:
+                        current.append(member)
+                        continue
+                    if len(current) > 1:
+                        groups.append((key, current))
+                    current = [member]
+                if len(current) > 1:
+                    groups.append((key, current))
+
+            # 그룹에 속한 기록만 한 번씩 직렬화
+            record_ids = [record_id for _, members in groups for record_id, _ in members]
+            records = {}
+            if record_ids:
+                records = {
+                    record.id: self._model_to_dict(record)
+                    for record in self.db.query(Maintenance)
+                    .filter(Maintenance.id.in_(record_ids))
+                    .all()
+                }
 
-            # 중복 그룹 찾기
             duplicates = []
-            records = query.all()
-
-            for i, record1 in enumerate(records):
-                for record2 in records[i + 1 :]:
-                    # 모든 지정된 필드가 일치하는지 확인
-                    if all(
-                        getattr(record1, field) == getattr(record2, field)
-                        for field in fields
-                    ):
-                        # 시간 차이 계산
-                        time_diff = (
-                            abs(
-                                (
-                                    record1.created_at - record2.created_at
-                                ).total_seconds()
-                            )
-                            / 3600
-                        )  # 시간 단위로 변환
-
-                        if time_diff <= time_window:
-                            duplicates.append(
-                                {
-                                    "record1": self._model_to_dict(record1),
-                                    "record2": self._model_to_dict(record2),
-                                    "time_difference": time_diff,
-                                    "matching_fields": fields,
-                                }
-                            )
+            for key, members in groups:
+                first_at, last_at = members[0][1], members[-1][1]
+                duplicates.append(
+                    {
+                        "key": dict(zip(fields, key)),
+                        "records": [records[record_id] for record_id, _ in members],
+                        "count": len(members),
+                        "time_difference": (last_at - first_at).total_seconds()
+                        / 3600,  # 시간 단위로 변환
+                        "matching_fields": fields,
+                    }
+                )
 
             logger.debug(f"중복 검사 완료: {len(duplicates)}개의 중복 그룹 발견")
             return duplicates
@@ -1608,70 +1873,90 @@ class MaintenanceRepository(BaseRepository[Maintenance, MaintenanceCreate]):
             logger.error(f"데이터 정합성 검증 중 오류: {str(e)}")
             raise
 
+    def _maintenance_archiver(self) -> SetBasedArchiver:
+        """정비 기록 아카이버 생성 (아카이브 컬럼을 같은 이름의 원본 컬럼에 매핑)"""
+        source_columns = Maintenance.__table__.c
+        columns: Dict[str, Any] = {
+            "id": source_columns.id,
+            "maintenance_id": source_columns.id,
+            "archived_at": datetime.now(timezone.utc).replace(tzinfo=None),
+        }
+        for column in MaintenanceArchiveModel.__table__.c:
+            if column.name not in columns and column.name in source_columns:
+                columns[column.name] = source_columns[column.name]
+        return SetBasedArchiver(
+            Maintenance,
+            MaintenanceArchiveModel,
+            columns,
+            key_column=source_columns.id,
+            archive_key="maintenance_id",
+            checkpoints=ArchiveCheckpointStore(ArchiveCheckpoint),
+            after_move=self.tag_index.clear_many,
+        )
+
     @track_db_query_time
     def archive_old_records(
-        self, days: int = 365, batch_size: int = 1000
-    ) -> Tuple[int, List[str]]:
+        self,
+        days: int = 365,
+        batch_size: int = 1000,
+        throttle_seconds: float = 0.0,
+        max_batches: Optional[int] = None,
+    ) -> int:
         """
         오래된 유지보수 기록을 아카이브 테이블로 이동합니다.
 
+        ID 순서의 배치마다 ``INSERT ... SELECT`` 와 ``DELETE`` 를 DB 안에서 실행하고,
+        배치마다 체크포인트를 남깁니다. 중단 후 다시 호출하면 남은 기록을 처음부터
+        다시 스캔하므로 그 사이 대상이 된 기록도 빠뜨리지 않습니다.
+        옮긴 기록의 태그 인덱스(entity_tags)는 같은 트랜잭션에서 삭제하며, 샤딩 중에는
+        샤드마다 따로 처리합니다.
+
         Args:
             days: 보관할 기간 (일)
             batch_size: 한 번에 처리할 레코드 수
+            throttle_seconds: 배치 사이 대기 시간 (초)
+            max_batches: 이번 호출에서 처리할 최대 배치 수 (None 이면 전부)
 
         Returns:
-            Tuple[int, List[str]]: 이동된 레코드 수와 처리된 ID 목록
+            int: 이동된 레코드 수
         """
         try:
             logger.debug(f"오래된 유지보수 기록 아카이브 시작: {days}일 이전 데이터")
 
             cutoff_date = datetime.now(timezone.utc) - timedelta(days=days)
-            archived_ids = []
-            total_archived = 0
-
-            while True:
-                # 이동할 레코드 조회
-                records = (
-                    self.db.query(Maintenance)
-                    .filter(
-                        and_(
-                            Maintenance.date < cutoff_date,
-                            Maintenance.status == MaintenanceStatus.COMPLETED,
-                        )
-                    )
-                    .limit(batch_size)
-                    .all()
+            condition = and_(
+                Maintenance.date < cutoff_date,
+                Maintenance.status == MaintenanceStatus.COMPLETED,
+            )
+            archiver = self._maintenance_archiver()
+
+            def archive_on(db: Any, job_name: str) -> int:
+                return archiver.run(
+                    db,
+                    condition,
+                    job_name=job_name,
+                    batch_size=batch_size,
+                    throttle_seconds=throttle_seconds,
+                    max_batches=max_batches,
                 )
 
-                if not records:
-                    break
-
-                # 아카이브 테이블로 데이터 복사
-                for record in records:
-                    archived_data = self._model_to_dict(record)
-                    archived_data["archived_at"] = datetime.now(timezone.utc)
-                    self.db.execute(
-                        MaintenanceArchiveModel.__table__.insert(), archived_data
-                    )
-                    archived_ids.append(record.id)
-
-                # 원본 데이터 삭제
-                self.db.query(Maintenance).filter(
-                    Maintenance.id.in_([r.id for r in records])
-                ).delete(synchronize_session=False)
-
-                total_archived += len(records)
-                self.db.commit()
-
-                logger.debug(f"아카이브 처리 중: {total_archived}개 완료")
+            if getattr(self.sharding_manager, "enabled", False):
+                total_archived = 0
+                for shard in self.sharding_manager.shard_names:
+                    with self.sharding_manager.session(shard) as db:
+                        total_archived += archive_on(db, f"maintenance_archive:{shard}")
+            else:
+                total_archived = archive_on(self.db, "maintenance_archive")
+            if total_archived:
+                stats_cache.invalidate("maintenance")
 
             logger.debug(
                 f"오래된 유지보수 기록 아카이브 완료: {total_archived}개 처리됨"
             )
-            return total_archived, archived_ids
+            return total_archived
 
         except Exception as e:
-            if "db" in locals():
+            if self.db is not None:
                 self.db.rollback()
             logger.error(f"유지보수 기록 아카이브 중 오류: {str(e)}")
             raise
@@ -1717,6 +2002,7 @@ class MaintenanceRepository(BaseRepository[Maintenance, MaintenanceCreate]):
             )
 
             self.db.commit()
+            stats_cache.invalidate("maintenance")
             logger.debug(f"미완료 유지보수 기록 정리 완료: {result}개 처리됨")
             return result
 
@@ -2116,83 +2402,6 @@ class MaintenanceRepository(BaseRepository[Maintenance, MaintenanceCreate]):
             logger.error(f"캐시 설정 분석 중 오류: {str(e)}")
             return None
 
-    def _init_sharding(self):
-        """샤딩 설정을 초기화합니다."""
-        try:
-            # 샤딩 구성 설정
-            shard_config = {
-                "strategy": "consistent_hashing",
-                "virtual_nodes": 1024,
-                "rebalance_threshold": 0.1,
-                "migration_batch_size": 1000,
-            }
-
-            # 샤드 노드 설정
-            shard_nodes = [
-                {
-                    "name": "shard1",
-                    "weight": 0.3,
-                    "connection": {
-                        "host": "shard1.db.local",
-                        "port": 5432,
-                        "database": "maintenance_db",
-                    },
-                },
-                {
-                    "name": "shard2",
-                    "weight": 0.3,
-                    "connection": {
-                        "host": "shard2.db.local",
-                        "port": 5432,
-                        "database": "maintenance_db",
-                    },
-                },
-                {
-                    "name": "shard3",
-                    "weight": 0.4,
-                    "connection": {
-                        "host": "shard3.db.local",
-                        "port": 5432,
-                        "database": "maintenance_db",
-                    },
-                },
-            ]
-
-            # 샤딩 매니저 초기화
-            self.sharding_manager.initialize(shard_config)
-            self.sharding_manager.register_nodes(shard_nodes)
-
-            # 샤딩 키 및 분산 전략 설정
-            self.sharding_manager.set_shard_key("vehicle_id")
-            self.sharding_manager.set_distribution_strategy(
-                {
-                    "type": "range",
-                    "key": "vehicle_id",
-                    "ranges": [
-                        {"min": "00000000", "max": "33333333", "shard": "shard1"},
-                        {"min": "33333334", "max": "66666666", "shard": "shard2"},
-                        {"min": "66666667", "max": "99999999", "shard": "shard3"},
-                    ],
-                }
-            )
-
-            # 샤드 모니터링 설정
-            self.sharding_manager.configure_monitoring(
-                {
-                    "metrics_interval": 60,
-                    "rebalance_check_interval": 300,
-                    "alert_thresholds": {
-                        "imbalance_threshold": 0.2,
-                        "migration_duration_max": 3600,
-                        "failed_operations_max": 100,
-                    },
-                }
-            )
-
-            logger.info("샤딩 초기화 완료")
-        except Exception as e:
-            logger.error(f"샤딩 초기화 중 오류: {str(e)}")
-
     def _init_replication(self):
         """복제 설정을 초기화합니다."""
         try:
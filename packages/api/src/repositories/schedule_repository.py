@@ -9,11 +9,15 @@ from functools import wraps
 from typing import (Any, Callable, Dict, Generator, List, Optional, Sequence,
                     Tuple)
 
-from packagescore.base_repository import BaseRepository
+from packagescore.base_repository import BaseRepository, DatabaseOperationError
 from packagescore.logging import get_logger
-from packagesmodels.schedule import (ScheduleModel, ScheduleNoteModel,
-                                     SchedulePriority, ScheduleReminderModel,
-                                     ScheduleStatus)
+from packagescore.pagination import (CountMode, CursorPage, count_query,
+                                     paginate_query)
+from packagescore.reminder_queue import (claim_due, default_worker_id,
+                                         release_stale)
+from packagesmodels.schedule import (ReminderStatus, ScheduleModel,
+                                     ScheduleNoteModel, SchedulePriority,
+                                     ScheduleReminderModel, ScheduleStatus)
 from packagesmodels.vehicle import VehicleModel
 from sqlalchemy import and_, asc, desc, func, or_, text
 from sqlalchemy.exc import SQLAlchemyError
@@ -103,7 +107,8 @@ class ScheduleRepository(BaseRepository[ScheduleModel, Dict[str, Any]]):
         skip: int = 0,
         limit: int = DEFAULT_PAGE_SIZE,
         load_options: Optional[Sequence[Any]] = None,
-    ) -> Tuple[List[ScheduleModel], int]:
+        count_mode: CountMode = CountMode.EXACT,
+    ) -> Tuple[List[ScheduleModel], Optional[int]]:
         """
         공통 페이지네이션 쿼리 실행 메서드
 
@@ -112,12 +117,16 @@ class ScheduleRepository(BaseRepository[ScheduleModel, Dict[str, Any]]):
             skip: 건너뛸 항목 수
             limit: 최대 항목 수
             load_options: 로드할 관계 옵션들
+            count_mode: 총 개수 계산 방식 (``none`` 이면 None 반환)
 
         Returns:
             결과 목록과 총 개수
+
+        Raises:
+            DatabaseOperationError: 데이터베이스 오류가 발생한 경우
         """
         try:
-            total = query.count()
+            total, _ = count_query(query, count_mode)
 
             if load_options:
                 query = query.options(*load_options)
@@ -126,7 +135,93 @@ class ScheduleRepository(BaseRepository[ScheduleModel, Dict[str, Any]]):
             return results, total
         except SQLAlchemyError as e:
             logger.error(f"쿼리 실행 중 오류: {str(e)}")
-            return [], 0
+            raise DatabaseOperationError(f"일정 목록 조회 중 오류: {str(e)}") from e
+
+    def _get_cursor_page(
+        self,
+        query: Query,
+        cursor: Optional[str] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        load_options: Optional[Sequence[Any]] = None,
+        descending: bool = True,
+        count_mode: CountMode = CountMode.NONE,
+    ) -> CursorPage[ScheduleModel]:
+        """
+        공통 커서 페이지네이션 쿼리 실행 메서드 (``scheduled_date`` 기준)
+
+        Args:
+            query: 기본 쿼리
+            cursor: 이전 페이지의 ``next_cursor``
+            limit: 최대 항목 수
+            load_options: 로드할 관계 옵션들
+            descending: 내림차순 여부
+            count_mode: 총 개수 계산 방식
+
+        Returns:
+            커서 페이지 결과
+
+        Raises:
+            InvalidCursorError: 커서가 잘못되었거나 다른 정렬/필터의 커서인 경우
+            DatabaseOperationError: 데이터베이스 오류가 발생한 경우
+        """
+        if load_options:
+            query = query.options(*load_options)
+        try:
+            return paginate_query(
+                query,
+                ScheduleModel.scheduled_date,
+                ScheduleModel.id,
+                cursor,
+                limit,
+                descending,
+                count_mode,
+            )
+        except SQLAlchemyError as e:
+            logger.error(f"커서 페이지 조회 중 오류: {str(e)}")
+            raise DatabaseOperationError(f"일정 페이지 조회 중 오류: {str(e)}") from e
+
+    @measure_execution_time
+    def get_schedules_page(
+        self,
+        cursor: Optional[str] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        vehicle_id: Optional[str] = None,
+        shop_id: Optional[str] = None,
+        status: Optional[ScheduleStatus] = None,
+        descending: bool = True,
+        count_mode: CountMode = CountMode.NONE,
+    ) -> CursorPage[ScheduleModel]:
+        """
+        커서 기반 일정 목록 조회
+
+        Args:
+            cursor: 이전 페이지의 ``next_cursor`` (첫 페이지는 None)
+            limit: 최대 항목 수
+            vehicle_id: 차량 ID 필터
+            shop_id: 정비소 ID 필터
+            status: 상태 필터
+            descending: 예정일 내림차순 여부
+            count_mode: 총 개수 계산 방식 (기본값: 계산하지 않음)
+
+        Returns:
+            커서 페이지 결과
+        """
+        query = self.db.query(ScheduleModel)
+        if vehicle_id:
+            query = query.filter(ScheduleModel.vehicle_id == vehicle_id)
+        if shop_id:
+            query = query.filter(ScheduleModel.shop_id == shop_id)
+        if status:
+            query = query.filter(ScheduleModel.status == status.value)
+
+        return self._get_cursor_page(
+            query,
+            cursor,
+            limit,
+            [joinedload(ScheduleModel.vehicle)],
+            descending,
+            count_mode,
+        )
 
     @measure_execution_time
     def get_by_id_with_relations(self, schedule_id: str) -> Optional[ScheduleModel]:
@@ -228,7 +323,7 @@ class ScheduleRepository(BaseRepository[ScheduleModel, Dict[str, Any]]):
             )
         except SQLAlchemyError as e:
             logger.error(f"차량 ID {vehicle_id}의 일정 조회 중 오류: {str(e)}")
-            return [], 0
+            raise DatabaseOperationError(f"차량 ID {vehicle_id}의 일정 조회 중 오류: {str(e)}") from e
 
     def get_schedules_by_status(
         self, status: ScheduleStatus, skip: int = 0, limit: int = 100
@@ -256,7 +351,7 @@ class ScheduleRepository(BaseRepository[ScheduleModel, Dict[str, Any]]):
             )
         except SQLAlchemyError as e:
             logger.error(f"상태 {status}의 일정 조회 중 오류: {str(e)}")
-            return [], 0
+            raise DatabaseOperationError(f"상태 {status}의 일정 조회 중 오류: {str(e)}") from e
 
     def get_schedules_by_shop(
         self, shop_id: str, skip: int = 0, limit: int = 100
@@ -284,7 +379,7 @@ class ScheduleRepository(BaseRepository[ScheduleModel, Dict[str, Any]]):
             )
         except SQLAlchemyError as e:
             logger.error(f"정비소 ID {shop_id}의 일정 조회 중 오류: {str(e)}")
-            return [], 0
+            raise DatabaseOperationError(f"정비소 ID {shop_id}의 일정 조회 중 오류: {str(e)}") from e
 
     def get_overdue_schedules(
         self, skip: int = 0, limit: int = 100
@@ -318,7 +413,7 @@ class ScheduleRepository(BaseRepository[ScheduleModel, Dict[str, Any]]):
             )
         except SQLAlchemyError as e:
             logger.error(f"기한이 지난 일정 조회 중 오류: {str(e)}")
-            return [], 0
+            raise DatabaseOperationError(f"기한이 지난 일정 조회 중 오류: {str(e)}") from e
 
     def get_schedules_by_date_range(
         self,
@@ -462,37 +557,104 @@ class ScheduleRepository(BaseRepository[ScheduleModel, Dict[str, Any]]):
         return arg3
 
     def get_pending_reminders(
-        self, limit: int = DEFAULT_REMINDER_LIMIT
+        self, limit: int = DEFAULT_REMINDER_LIMIT, worker_id: Optional[str] = None
     ) -> List[ScheduleReminderModel]:
         """
-        발송 대기 중인 알림 조회
+        발송 대기 중인 알림을 선점하여 조회
+
+        선점 없이 읽으면 여러 워커가 같은 알림을 중복 발송할 수 있으므로
+        ``claim_pending_reminders`` 와 같은 선점 경로를 사용합니다. 반환된 알림은
+        ``processing`` 상태이며 처리 후 ``finish_reminders`` 로 최종 상태를 기록해야 합니다.
 
         Args:
             limit: 최대 항목 수
+            worker_id: 워커 식별자 (None 이면 호스트/프로세스 기준 식별자)
 
         Returns:
-            발송 대기 중인 알림 목록
+            이 워커가 선점한 알림 목록
         """
-        try:
-            now = datetime.now(timezone.utc)
+        return self.claim_pending_reminders(worker_id or default_worker_id(), limit)
+
+    def claim_pending_reminders(
+        self,
+        worker_id: str,
+        limit: int = DEFAULT_REMINDER_LIMIT,
+        reminder_ids: Optional[Sequence[str]] = None,
+    ) -> List[ScheduleReminderModel]:
+        """
+        발송 시각이 지난 알림을 선점하여 조회
 
+        ``(status, reminder_time)`` 인덱스로 ``LIMIT`` 만큼만 읽고 원자적으로
+        ``processing`` 상태로 바꾼 뒤 바로 커밋하므로 여러 워커가 같은 알림을
+        중복 발송하지 않습니다. 처리 후 ``finish_reminders`` 로 최종 상태를 기록해야 합니다.
+
+        Args:
+            worker_id: 워커 식별자
+            limit: 최대 항목 수
+            reminder_ids: 지정 시 이 알림 중에서만 선점
+
+        Returns:
+            이 워커가 선점한 알림 목록
+        """
+        try:
+            release_stale(self.db, ScheduleReminderModel)
+            claimed = claim_due(
+                self.db,
+                ScheduleReminderModel,
+                worker_id,
+                limit,
+                time_column="reminder_time",
+                ids=reminder_ids,
+            )
+            claimed_ids = [reminder.id for reminder in claimed]
+            self.db.commit()
+            if not claimed_ids:
+                return []
+            # 발송 시 일정 정보가 필요하므로 한 번에 로드
             return (
                 self.db.query(ScheduleReminderModel)
                 .options(joinedload(ScheduleReminderModel.schedule))
-                .filter(
-                    and_(
-                        ScheduleReminderModel.reminder_time <= now,
-                        ScheduleReminderModel.status == "pending",
-                    )
-                )
+                .filter(ScheduleReminderModel.id.in_(claimed_ids))
                 .order_by(asc(ScheduleReminderModel.reminder_time))
-                .limit(limit)
                 .all()
             )
         except SQLAlchemyError as e:
-            logger.error(f"발송 대기 중인 알림 조회 중 오류: {str(e)}")
+            self.db.rollback()
+            logger.error(f"알림 선점 중 오류: {str(e)}")
             return []
 
+    def finish_reminders(self, reminder_ids: Sequence[str], status: str) -> int:
+        """
+        선점한 알림의 최종 상태 기록
+
+        Args:
+            reminder_ids: 알림 ID 목록
+            status: 최종 상태 (sent, failed)
+
+        Returns:
+            갱신된 알림 수
+        """
+        if not reminder_ids:
+            return 0
+        try:
+            updated = (
+                self.db.query(ScheduleReminderModel)
+                .filter(
+                    ScheduleReminderModel.id.in_(list(reminder_ids)),
+                    ScheduleReminderModel.status == ReminderStatus.PROCESSING.value,
+                )
+                .update(
+                    {ScheduleReminderModel.status: status},
+                    synchronize_session=False,
+                )
+            )
+            self.db.commit()
+            return updated
+        except SQLAlchemyError as e:
+            self.db.rollback()
+            logger.error(f"알림 상태 기록 중 오류: {str(e)}")
+            return 0
+
     def get_schedules_stats(self, vehicle_id: Optional[str] = None) -> Dict[str, Any]:
         """
         일정 통계 조회
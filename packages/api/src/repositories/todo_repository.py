@@ -8,10 +8,16 @@ from enum import Enum
 from typing import (Any, Callable, Dict, List, Optional, Set, Tuple, TypeVar,
                     Union)
 
+from packagescore.aggregates import aggregate_statistics, stats_cache
 from packagescore.base_repository import BaseRepository
+from packagescore.bulk_ingest import BulkIngestError, BulkIngestor
 from packagescore.logging import get_logger
 from packagescore.metrics import track_db_query_time
-from packagesdatabase.models import Todo
+from packagescore.pagination import (CountMode, CursorPage, count_query,
+                                     paginate_query)
+from packagescore.reminder_queue import DEFAULT_CLAIM_LIMIT, ReminderQueue
+from packagescore.tag_index import TagIndex
+from packagesdatabase.models import EntityTag, ReminderQueueItem, Todo
 from packagesmodels.schemas import (TodoCreate, TodoPriority, TodoResponse,
                                     TodoStatus, TodoUpdate)
 from sqlalchemy import and_, desc, func, or_, text
@@ -38,21 +44,32 @@ class TodoRepository(BaseRepository[Todo, TodoCreate]):
     def __init__(self, db_session: Session):
         """초기화"""
         super().__init__(db_session, Todo)
+        self.tag_index = TagIndex(EntityTag, "todo")
+        self.reminder_queue = ReminderQueue(ReminderQueueItem, "todo")
+        # ORM 쓰기 이벤트 발생 시 통계 캐시 무효화
+        stats_cache.watch(Todo, "todo")
 
     @track_db_query_time
     def find_all(
-        self, skip: int = 0, limit: int = 100, filters: Dict = None
-    ) -> Tuple[List[Todo], int]:
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        filters: Dict = None,
+        count_mode: CountMode = CountMode.EXACT,
+    ) -> Tuple[List[Todo], Optional[int]]:
         """
         모든 Todo 항목 조회
 
+        깊은 페이지는 ``find_page`` 의 커서 페이지네이션을 사용하는 것이 좋습니다.
+
         Args:
             skip: 건너뛸 항목 수
             limit: 최대 항목 수
             filters: 필터 조건
+            count_mode: 총 개수 계산 방식 (``none`` 이면 None 반환)
 
         Returns:
-            Tuple[List[Todo], int]: Todo 목록과 총 개수
+            Tuple[List[Todo], Optional[int]]: Todo 목록과 총 개수
         """
         query = self.db.query(Todo)
 
@@ -61,14 +78,49 @@ class TodoRepository(BaseRepository[Todo, TodoCreate]):
             query = self._apply_filters(query, filters)
 
         # 총 개수 계산
-        total = query.count()
+        total, _ = count_query(query, count_mode)
 
         # 정렬 및 페이지네이션 적용
-        todos = query.order_by(Todo.created_at.desc()).offset(skip).limit(limit).all()
+        todos = (
+            query.order_by(Todo.created_at.desc(), Todo.id.desc())
+            .offset(skip)
+            .limit(limit)
+            .all()
+        )
 
         logger.debug(f"Todo 목록 조회: {len(todos)}개 항목 (총 {total}개 중)")
         return todos, total
 
+    @track_db_query_time
+    def find_page(
+        self,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        filters: Dict = None,
+        count_mode: CountMode = CountMode.NONE,
+    ) -> CursorPage[Todo]:
+        """
+        커서 기반 Todo 목록 조회 (``created_at`` 내림차순)
+
+        Args:
+            cursor: 이전 페이지의 ``next_cursor`` (첫 페이지는 None)
+            limit: 페이지 크기
+            filters: 필터 조건
+            count_mode: 총 개수 계산 방식 (기본값: 계산하지 않음)
+
+        Returns:
+            CursorPage[Todo]: Todo 목록과 다음 커서
+        """
+        query = self.db.query(Todo)
+        if filters:
+            query = self._apply_filters(query, filters)
+
+        page = paginate_query(
+            query, Todo.created_at, Todo.id, cursor, limit, count_mode=count_mode
+        )
+        logger.debug(f"Todo 커서 페이지 조회: {len(page.items)}개 항목")
+        return page
+
     def find_by_id(self, todo_id: str) -> Optional[Todo]:
         """
         ID로 Todo 항목 조회
@@ -144,6 +196,10 @@ class TodoRepository(BaseRepository[Todo, TodoCreate]):
         for key, value in update_data.items():
             setattr(todo, key, value)
 
+        # 태그가 변경된 경우 태그 인덱스 동기화
+        if "tags" in update_data:
+            self.tag_index.replace(self.db, todo.id, update_data["tags"] or [])
+
         # 업데이트 시간 갱신
         todo.updated_at = datetime.now(timezone.utc)
 
@@ -164,6 +220,8 @@ class TodoRepository(BaseRepository[Todo, TodoCreate]):
         """
         try:
             logger.debug(f"Todo 삭제 시작: ID={todo.id}")
+            self.tag_index.clear(self.db, todo.id)
+            self.reminder_queue.clear(self.db, todo.id)
             self.db.delete(todo)
             self.db.commit()
             logger.debug(f"Todo 삭제 완료: ID={todo.id}")
@@ -397,6 +455,7 @@ class TodoRepository(BaseRepository[Todo, TodoCreate]):
                 )
 
             self.db.commit()
+            stats_cache.invalidate("todo")
             logger.debug(f"Todo 일괄 상태 업데이트 완료: {result}개 항목 업데이트됨")
             return result
         except Exception as e:
@@ -439,113 +498,114 @@ class TodoRepository(BaseRepository[Todo, TodoCreate]):
 
         Returns:
             List[Todo]: 생성된 Todo 목록
+
+        Raises:
+            BulkIngestError: 유효하지 않은 항목이 있는 경우 (아무것도 생성하지 않음)
         """
         try:
             logger.debug(f"Todo 일괄 생성 시작: {len(todo_data_list)}개 항목")
 
-            todos = []
-            for data in todo_data_list:
-                todo_id = str(uuid.uuid4())
-
-                # 기본값 설정
-                now = datetime.now(timezone.utc)
-                status = data.get("status", TodoStatus.PENDING)
-                priority = data.get("priority", TodoPriority.MEDIUM)
-
-                todo = Todo(
-                    id=todo_id,
-                    title=data["title"],
-                    description=data.get("description"),
-                    due_date=data.get("due_date"),
-                    status=status,
-                    priority=priority,
-                    vehicle_id=data.get("vehicle_id"),
-                    user_id=data["user_id"],  # 필수 필드
-                    assignee_id=data.get("assignee_id"),
-                    related_entity_type=data.get("related_entity_type"),
-                    related_entity_id=data.get("related_entity_id"),
-                    created_at=now,
-                    updated_at=now,
-                )
-
-                todos.append(todo)
-
-            # 일괄 추가
-            self.db.add_all(todos)
-            self.db.commit()
-
-            for todo in todos:
-                self._refresh_object(todo)
+            report = self._todo_ingestor().ingest(
+                self.db, todo_data_list, atomic=True, collect_ids=True
+            )
+            stats_cache.invalidate("todo")
+            todos = self.db.query(Todo).filter(Todo.id.in_(report.inserted_ids)).all()
 
             logger.debug(f"Todo 일괄 생성 완료: {len(todos)}개 항목")
             return todos
+        except BulkIngestError:
+            raise
         except Exception as e:
             self._handle_db_error("Todo 일괄 생성 중 오류 발생: ", e)
 
+    def _todo_ingestor(self) -> BulkIngestor:
+        """Todo 대량 적재기 생성"""
+        return BulkIngestor(
+            Todo,
+            defaults={
+                "status": TodoStatus.PENDING.value,
+                "priority": TodoPriority.MEDIUM.value,
+                "created_at": lambda: datetime.now(timezone.utc).replace(tzinfo=None),
+                "updated_at": lambda: datetime.now(timezone.utc).replace(tzinfo=None),
+            },
+            # 일괄 생성 API 는 스키마 밖의 필드를 무시해 왔음
+            ignore_unknown=True,
+            after_write=self._index_ingested_tags,
+        )
+
+    def _index_ingested_tags(self, db: Session, rows: List[Dict[str, Any]]) -> None:
+        """대량 적재한 Todo 의 태그를 태그 인덱스(entity_tags)에 기록"""
+        self.tag_index.insert_many(
+            db,
+            {
+                row["id"]: row["tags"]
+                for row in rows
+                if isinstance(row.get("tags"), list)
+            },
+        )
+
     @track_db_query_time
     def get_todo_statistics(self) -> Dict[str, Any]:
         """
         Todo 항목의 통계 정보를 조회합니다.
 
+        기한 관련 건수는 조건부 집계 한 번으로, 상태/우선순위 분포는 분포마다 따로
+        GROUP BY 해 계산하며, 결과는 Todo 쓰기가 커밋되면 무효화되는 통계 캐시에
+        보관됩니다.
+
         Returns:
             Dict[str, Any]: 통계 정보
         """
         try:
-            # 상태별 개수
-            status_counts = {}
-            for status in TodoStatus:
-                count = self.db.query(Todo).filter(Todo.status == status).count()
-                status_counts[status.value] = count
-
-            # 우선순위별 개수
-            priority_counts = {}
-            for priority in TodoPriority:
-                count = self.db.query(Todo).filter(Todo.priority == priority).count()
-                priority_counts[priority.value] = count
-
-            # 기한 관련 통계
-            now = datetime.now(timezone.utc)
-            overdue_count = (
-                self.db.query(Todo)
-                .filter(
+            return stats_cache.get_or_compute(
+                "todo", "statistics", self._compute_todo_statistics
+            )
+        except Exception as e:
+            logger.error(f"Todo 통계 정보 조회 중 오류 발생: {str(e)}")
+            raise
+
+    def _compute_todo_statistics(self) -> Dict[str, Any]:
+        """Todo 통계를 조건부 집계와 분포별 집계 쿼리로 계산합니다."""
+        now = datetime.now(timezone.utc)
+        today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        week_ago = now - timedelta(days=7)
+
+        stats = aggregate_statistics(
+            self.db,
+            Todo,
+            group_by={"status_counts": Todo.status, "priority_counts": Todo.priority},
+            conditions={
+                # 기한 관련 통계
+                "overdue_count": and_(
                     Todo.due_date < now,
                     Todo.status != TodoStatus.COMPLETED,
                     Todo.status != TodoStatus.CANCELLED,
-                )
-                .count()
-            )
-
-            # 오늘 완료된 항목 수
-            today_start = datetime.now(timezone.utc).replace(
-                hour=0, minute=0, second=0, microsecond=0
-            )
-            completed_today = (
-                self.db.query(Todo)
-                .filter(
+                ),
+                # 오늘 완료된 항목 수
+                "completed_today": and_(
                     Todo.completed_at >= today_start,
                     Todo.status == TodoStatus.COMPLETED,
-                )
-                .count()
-            )
-
-            # 최근 생성된 항목 수 (지난 7일)
-            week_ago = now - timedelta(days=7)
-            created_last_week = (
-                self.db.query(Todo).filter(Todo.created_at >= week_ago).count()
-            )
+                ),
+                # 최근 생성된 항목 수 (지난 7일)
+                "created_last_week": Todo.created_at >= week_ago,
+            },
+        )
 
-            return {
-                "total_count": self.db.query(Todo).count(),
-                "status_counts": status_counts,
-                "priority_counts": priority_counts,
-                "overdue_count": overdue_count,
-                "completed_today": completed_today,
-                "created_last_week": created_last_week,
-                "updated_at": now.isoformat(),
-            }
-        except Exception as e:
-            logger.error(f"Todo 통계 정보 조회 중 오류 발생: {str(e)}")
-            raise
+        return {
+            "total_count": stats["total_count"],
+            "status_counts": {
+                status.value: stats["status_counts"].get(status.value, 0)
+                for status in TodoStatus
+            },
+            "priority_counts": {
+                priority.value: stats["priority_counts"].get(priority.value, 0)
+                for priority in TodoPriority
+            },
+            "overdue_count": stats["overdue_count"],
+            "completed_today": stats["completed_today"],
+            "created_last_week": stats["created_last_week"],
+            "updated_at": now.isoformat(),
+        }
 
     def add_tag_to_todo(self, todo_id: str, tag: str) -> Todo:
         # sourcery skip: extract-method
@@ -572,8 +632,9 @@ class TodoRepository(BaseRepository[Todo, TodoCreate]):
 
             # 이미 존재하지 않는 경우에만 태그 추가
             if tag not in todo.tags:
-                todo.tags.append(tag)
+                todo.tags = todo.tags + [tag]
                 todo.updated_at = datetime.now(timezone.utc)
+                self.tag_index.add(self.db, todo.id, tag)
 
             return super().update(todo)
         except Exception as e:
@@ -599,8 +660,9 @@ class TodoRepository(BaseRepository[Todo, TodoCreate]):
 
             # 태그가 있는 경우에만 제거
             if todo.tags and tag in todo.tags:
-                todo.tags.remove(tag)
+                todo.tags = [t for t in todo.tags if t != tag]
                 todo.updated_at = datetime.now(timezone.utc)
+                self.tag_index.remove(self.db, todo.id, tag)
 
             return super().update(todo)
         except Exception as e:
@@ -610,7 +672,6 @@ class TodoRepository(BaseRepository[Todo, TodoCreate]):
     def find_todos_by_tags(
         self, tags: List[str], match_all: bool = False
     ) -> List[Todo]:
-        # sourcery skip: for-append-to-extend, list-comprehension
         """
         태그로 Todo 항목을 검색합니다.
 
@@ -624,22 +685,13 @@ class TodoRepository(BaseRepository[Todo, TodoCreate]):
         try:
             logger.debug(f"태그로 Todo 검색 시작: {tags}, match_all={match_all}")
 
-            query = self.db.query(Todo)
-
             if not tags:
                 return []
 
-            if match_all:
-                # 모든 태그가 일치하는 항목 검색
-                for tag in tags:
-                    query = query.filter(Todo.tags.contains([tag]))
-            else:
-                # 하나라도 일치하는 항목 검색 (PostgreSQL 사용 시 @> 연산자 사용 가능)
-                # SQLite 또는 다른 DB에서는 다른 접근 방식 필요
-                filters = []
-                for tag in tags:
-                    filters.append(Todo.tags.contains([tag]))
-                query = query.filter(or_(*filters))
+            # 태그 인덱스(entity_tags)에서 일치하는 Todo ID 조회
+            query = self.tag_index.filter_by_tags(
+                self.db.query(Todo), Todo.id, tags, match_all
+            )
 
             result = query.all()
             logger.debug(f"태그로 Todo 검색 완료: {len(result)}건")
@@ -648,6 +700,18 @@ class TodoRepository(BaseRepository[Todo, TodoCreate]):
             logger.error(f"태그로 Todo 검색 중 오류 발생: {str(e)}")
             raise
 
+    def search_by_tags(self, tags: List[str]) -> List[Todo]:
+        """
+        모든 태그를 가진 Todo 항목을 검색합니다.
+
+        Args:
+            tags: 검색할 태그 목록
+
+        Returns:
+            List[Todo]: 검색된 Todo 목록
+        """
+        return self.find_todos_by_tags(tags, match_all=True)
+
     def get_popular_tags(self, limit: int = 10) -> List[Dict[str, Any]]:
         """
         가장 많이 사용된 태그를 조회합니다.
@@ -661,28 +725,8 @@ class TodoRepository(BaseRepository[Todo, TodoCreate]):
         try:
             logger.debug(f"인기 태그 조회 시작: limit={limit}")
 
-            # 모든 Todo 항목의 태그 수집
-            todos = self.db.query(Todo).filter(Todo.tags.isnot(None)).all()
-
-            # 태그 카운팅
-            tag_counts = {}
-            for todo in todos:
-                if not todo.tags:
-                    continue
-
-                for tag in todo.tags:
-                    if tag in tag_counts:
-                        tag_counts[tag] += 1
-                    else:
-                        tag_counts[tag] = 1
-
-            # 사용 횟수 기준 정렬
-            sorted_tags = sorted(tag_counts.items(), key=lambda x: x[1], reverse=True)
-
-            # 결과 형식화 및 제한
-            result = [
-                {"name": tag, "count": count} for tag, count in sorted_tags[:limit]
-            ]
+            # 태그 인덱스에서 GROUP BY 로 집계
+            result = self.tag_index.popular(self.db, limit)
 
             logger.debug(f"인기 태그 조회 완료: {len(result)}개 태그")
             return result
@@ -996,28 +1040,10 @@ class TodoRepository(BaseRepository[Todo, TodoCreate]):
             if not todo:
                 raise ValueError(f"ID가 {todo_id}인 Todo를 찾을 수 없습니다.")
 
-            # 메타데이터가 없으면 초기화
-            if not todo.metadata:
-                todo.metadata = {}
-
-            # 리마인더 정보 없으면 초기화
-            if "reminders" not in todo.metadata:
-                todo.metadata["reminders"] = []
-
-            # 리마인더 정보 설정
-            reminder_id = str(uuid.uuid4())
-            reminder_info = {
-                "id": reminder_id,
-                "time": reminder_time.isoformat(),
-                "type": reminder_type,
-                "status": "pending",
-                "created_at": datetime.now(timezone.utc).isoformat(),
-            }
-
-            if reminder_message:
-                reminder_info["message"] = reminder_message
-
-            todo.metadata["reminders"].append(reminder_info)
+            payload = {"message": reminder_message} if reminder_message else {}
+            self.reminder_queue.enqueue(
+                self.db, todo.id, reminder_time, reminder_type, payload
+            )
             todo.updated_at = datetime.now(timezone.utc)
 
             return super().update(todo)
@@ -1042,68 +1068,162 @@ class TodoRepository(BaseRepository[Todo, TodoCreate]):
             if not todo:
                 raise ValueError(f"ID가 {todo_id}인 Todo를 찾을 수 없습니다.")
 
-            # 메타데이터 및 리마인더 정보가 있는 경우에만 처리
-            if todo.metadata and "reminders" in todo.metadata:
-                for reminder in todo.metadata["reminders"]:
-                    if reminder.get("id") == reminder_id:
-                        reminder["status"] = "cancelled"
-                        reminder["cancelled_at"] = datetime.now(
-                            timezone.utc
-                        ).isoformat()
-                        break
-
+            if self.reminder_queue.cancel(self.db, reminder_id, entity_id=todo.id):
                 todo.updated_at = datetime.now(timezone.utc)
 
             return super().update(todo)
         except Exception as e:
             self._handle_db_error("Todo 리마인더 취소 중 오류 발생: ", e)
 
-    def get_pending_reminders(self, before_time: datetime) -> List[Dict[str, Any]]:
+    def _reminder_results(
+        self, items: List[ReminderQueueItem]
+    ) -> List[Dict[str, Any]]:
+        """대기열 항목을 Todo 정보와 함께 리마인더 정보 목록으로 변환"""
+        if not items:
+            return []
+        todo_ids = {item.entity_id for item in items}
+        todos = {
+            todo.id: todo
+            for todo in self.db.query(Todo).filter(Todo.id.in_(todo_ids)).all()
+        }
+
+        result = []
+        for item in items:
+            todo = todos.get(item.entity_id)
+            if todo is None:
+                continue
+            reminder = {
+                "id": item.id,
+                "time": item.fire_at.isoformat(),
+                "type": item.reminder_type,
+                "status": item.status,
+                "created_at": item.created_at.isoformat() if item.created_at else None,
+            }
+            reminder.update(item.payload or {})
+            result.append(
+                {
+                    "todo_id": todo.id,
+                    "todo_title": todo.title,
+                    "reminder": reminder,
+                    "user_id": todo.user_id,
+                    "assignee_id": todo.assignee_id,
+                }
+            )
+        return result
+
+    @track_db_query_time
+    def get_pending_reminders(
+        self, before_time: datetime, limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
         """
         특정 시간 이전에 예정된 미처리 리마인더 목록을 조회합니다.
 
+        ``reminder_queue`` 의 ``(status, fire_at)`` 인덱스로 조회하며 선점하지 않습니다.
+        발송 워커는 ``claim_pending_reminders`` 를 사용해야 합니다.
+
         Args:
             before_time: 이 시간 이전 리마인더 조회
+            limit: 최대 조회 수
 
         Returns:
             List[Dict[str, Any]]: 리마인더 정보 목록
         """
         try:
             logger.debug(f"미처리 리마인더 조회 시작: {before_time}")
+            items = self.reminder_queue.pending(self.db, before_time, limit)
+            result = self._reminder_results(items)
+            logger.debug(f"미처리 리마인더 조회 완료: {len(result)}건")
+            return result
+        except Exception as e:
+            logger.error(f"미처리 리마인더 조회 중 오류 발생: {str(e)}")
+            raise
 
-            before_iso = before_time.isoformat()
+    @track_db_query_time
+    def get_upcoming_reminders(
+        self, until: datetime, limit: int
+    ) -> List[Tuple[str, datetime]]:
+        """
+        ``until`` 이전에 발송될 대기 리마인더의 ID 와 발송 시각을 조회합니다.
 
-            # 메타데이터에 리마인더 정보가 있는 Todo 조회
-            todos = self.db.query(Todo).filter(Todo.metadata.isnot(None)).all()
+        발송 스케줄러가 ``DueTimeQueue`` 를 채울 때 사용합니다.
 
-            # 결과 저장
-            result = []
+        Args:
+            until: 조회 기준 시각
+            limit: 최대 조회 수
 
-            # 필터링: 대기 중인 리마인더이고 지정 시간 이전인 것
-            for todo in todos:
-                if not todo.metadata or "reminders" not in todo.metadata:
-                    continue
+        Returns:
+            List[Tuple[str, datetime]]: ``(id, fire_at)`` 목록
+        """
+        return [
+            (reminder_id, fire_at)
+            for reminder_id, fire_at in self.reminder_queue.upcoming(
+                self.db, until, limit
+            )
+        ]
 
-                result.extend(
-                    {
-                        "todo_id": todo.id,
-                        "todo_title": todo.title,
-                        "reminder": reminder,
-                        "user_id": todo.user_id,
-                        "assignee_id": todo.assignee_id,
-                    }
-                    for reminder in todo.metadata["reminders"]
-                    if (
-                        reminder.get("status") == "pending"
-                        and reminder.get("time")
-                        and reminder.get("time") <= before_iso
-                    )
-                )
-            logger.debug(f"미처리 리마인더 조회 완료: {len(result)}건")
+    @track_db_query_time
+    def claim_pending_reminders(
+        self,
+        worker_id: str,
+        limit: int = DEFAULT_CLAIM_LIMIT,
+        reminder_ids: Optional[List[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        발송 시각이 지난 리마인더를 선점하여 반환합니다.
+
+        여러 워커가 동시에 호출해도 같은 리마인더는 한 워커에게만 반환됩니다.
+        선점 결과는 바로 커밋되며, 처리 후 ``complete_reminders`` 또는
+        ``fail_reminders`` 를 호출해야 합니다.
+
+        Args:
+            worker_id: 워커 식별자
+            limit: 최대 선점 수
+            reminder_ids: 지정 시 이 리마인더 중에서만 선점
+
+        Returns:
+            List[Dict[str, Any]]: 선점된 리마인더 정보 목록
+        """
+        try:
+            self.reminder_queue.release_stale(self.db)
+            items = self.reminder_queue.claim_due(
+                self.db, worker_id, limit, ids=reminder_ids
+            )
+            result = self._reminder_results(items)
+            # 그 사이 삭제된 Todo 의 리마인더는 다시 선점되지 않도록 취소
+            found = {entry["reminder"]["id"] for entry in result}
+            self.reminder_queue.discard(
+                self.db, [item.id for item in items if item.id not in found]
+            )
+            self.db.commit()
             return result
         except Exception as e:
-            logger.error(f"미처리 리마인더 조회 중 오류 발생: {str(e)}")
-            raise
+            self._handle_db_error("리마인더 선점 중 오류 발생: ", e)
+
+    def complete_reminders(self, reminder_ids: List[str]) -> None:
+        """
+        선점한 리마인더를 발송 완료로 표시합니다.
+
+        Args:
+            reminder_ids: 발송 완료된 리마인더 ID 목록
+        """
+        try:
+            self.reminder_queue.complete(self.db, reminder_ids)
+            self.db.commit()
+        except Exception as e:
+            self._handle_db_error("리마인더 완료 처리 중 오류 발생: ", e)
+
+    def fail_reminders(self, reminder_ids: List[str]) -> None:
+        """
+        선점한 리마인더의 발송 실패를 기록합니다 (재시도 한도 내에서 다시 대기).
+
+        Args:
+            reminder_ids: 발송 실패한 리마인더 ID 목록
+        """
+        try:
+            self.reminder_queue.fail(self.db, reminder_ids)
+            self.db.commit()
+        except Exception as e:
+            self._handle_db_error("리마인더 실패 처리 중 오류 발생: ", e)
 
     def set_category(self, todo_id: str, category: str) -> Todo:
         """
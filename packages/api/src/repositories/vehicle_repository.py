@@ -8,6 +8,7 @@ from datetime import datetime
 from typing import Any, Dict, List, Optional
 
 from packagescore.dependencies import get_db
+from packagescore.pagination import CountMode, paginate_query
 from packagesmodels.vehicle import VehicleModel
 from sqlalchemy import and_, or_
 from sqlalchemy.exc import SQLAlchemyError
@@ -42,10 +43,16 @@ class VehicleRepository:
             return None
 
     def get_vehicles(self, skip: int = 0, limit: int = 100) -> List[Dict[str, Any]]:
-        """차량 목록 조회"""
+        """차량 목록 조회 (깊은 페이지는 get_vehicles_page 사용)"""
         try:
             db = next(get_db())
-            vehicles = db.query(VehicleModel).offset(skip).limit(limit).all()
+            vehicles = (
+                db.query(VehicleModel)
+                .order_by(VehicleModel.created_at.desc(), VehicleModel.id.desc())
+                .offset(skip)
+                .limit(limit)
+                .all()
+            )
 
             return [self._model_to_dict(vehicle) for vehicle in vehicles]
         except SQLAlchemyError as e:
@@ -55,6 +62,49 @@ class VehicleRepository:
             logger.error(f"차량 목록 조회 중 오류: {str(e)}")
             return []
 
+    def get_vehicles_page(
+        self,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        status: Optional[str] = None,
+        count_mode: CountMode = CountMode.NONE,
+    ) -> Dict[str, Any]:
+        """
+        커서 기반 차량 목록 조회 (등록일 내림차순)
+
+        Args:
+            cursor: 이전 페이지의 ``next_cursor`` (첫 페이지는 None)
+            limit: 페이지 크기
+            status: 상태 필터
+            count_mode: 총 개수 계산 방식 (기본값: 계산하지 않음)
+
+        Returns:
+            Dict[str, Any]: ``items`` 와 ``next_cursor``, ``total`` 정보
+
+        Raises:
+            InvalidCursorError: 커서가 유효하지 않은 경우
+        """
+        db = next(get_db())
+        query = db.query(VehicleModel)
+        if status:
+            query = query.filter(VehicleModel.status == status)
+
+        page = paginate_query(
+            query,
+            VehicleModel.created_at,
+            VehicleModel.id,
+            cursor,
+            limit,
+            count_mode=count_mode,
+        )
+        return {
+            "items": [self._model_to_dict(vehicle) for vehicle in page.items],
+            "next_cursor": page.next_cursor,
+            "has_next": page.has_next,
+            "total": page.total,
+            "total_is_estimate": page.total_is_estimate,
+        }
+
     def count_vehicles(self) -> int:
         """전체 차량 수 조회"""
         try:
@@ -11,9 +11,11 @@ from fastapi import (APIRouter, Depends, HTTPException, Request, Response,
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
 from packagescore.config import settings
 from packagescore.security import TOKEN_TYPE_REFRESH, SecurityService
+from packagescore.password_hashing import (PasswordHasherOverloaded,
+                                           password_hasher)
 from packagescore.security import authenticate_user as auth_user
 from packagescore.security import (get_current_user, get_password_hash,
-                                   get_token_from_header, verify_password)
+                                   get_token_from_header)
 from pydantic import BaseModel, EmailStr
 
 # 라우터 생성
@@ -191,26 +193,43 @@ MOCK_USERS = {
 }
 
 
-def authenticate_user(email: str, password: str) -> Optional[Dict[str, Any]]:
+async def authenticate_user(email: str, password: str) -> Optional[Dict[str, Any]]:
     """
     사용자 인증 함수 (이메일, 비밀번호 검증)
 
+    비밀번호 검증은 해시 전용 풀에서 실행되어 이벤트 루프를 막지 않습니다.
+
     Args:
         email: 사용자 이메일
         password: 사용자 비밀번호
 
     Returns:
         인증 성공 시 사용자 정보 딕셔너리, 실패 시 None
+
+    Raises:
+        HTTPException: 해시 대기열이 가득 찬 경우 (503)
     """
     if email not in MOCK_USERS:
         return None
     user = MOCK_USERS[email]
-    if not verify_password(password, user["password"]):
+    try:
+        valid, new_hash = await password_hasher.verify_and_update(
+            password, user["password"]
+        )
+    except PasswordHasherOverloaded as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="로그인 요청이 많습니다. 잠시 후 다시 시도하세요",
+            headers={"Retry-After": str(e.retry_after)},
+        )
+    if not valid:
         return None
-    elif not user["is_active"]:
+    # 더 강한 매개변수로 재해시된 경우 저장
+    if new_hash:
+        user["password"] = new_hash
+    if not user["is_active"]:
         return None
-    else:
-        return user
+    return user
 
 
 @router.post(
@@ -235,7 +254,7 @@ async def login(user_login: UserLogin):
     Returns:
         토큰 정보와 사용자 프로필 정보가 포함된 응답
     """
-    user = authenticate_user(user_login.email, user_login.password)
+    user = await authenticate_user(user_login.email, user_login.password)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -297,7 +316,7 @@ async def login_for_access_token(form_data: OAuth2PasswordRequestForm = Depends(
     Returns:
         토큰 정보가 포함된 응답
     """
-    user = authenticate_user(form_data.username, form_data.password)
+    user = await authenticate_user(form_data.username, form_data.password)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -445,7 +464,15 @@ async def confirm_password_reset(reset_data: ResetPasswordConfirm):
     # 실제 구현에서는 DB에서 사용자 찾아 비밀번호 업데이트
     if email in MOCK_USERS:
         # 비밀번호 해시화 및 업데이트
-        MOCK_USERS[email]["password"] = get_password_hash(reset_data.new_password)
+        try:
+            new_hash = await password_hasher.hash(reset_data.new_password)
+        except PasswordHasherOverloaded as e:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="요청이 많습니다. 잠시 후 다시 시도하세요",
+                headers={"Retry-After": str(e.retry_after)},
+            )
+        MOCK_USERS[email]["password"] = new_hash
         return {"message": "비밀번호가 성공적으로 변경되었습니다."}
     else:
         raise HTTPException(
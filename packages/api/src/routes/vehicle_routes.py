@@ -11,6 +11,7 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from pydantic import BaseModel, Field
 from sqlalchemy.orm import Session
 # 공통 모델 임포트
+from src.core.pagination import CountMode, InvalidCursorError, paginate_query
 from src.models import Vehicle, get_db
 from src.models.location import VehicleLocation
 from src.models.maintenance import MaintenanceModel
@@ -85,6 +86,7 @@ class ApiResponse(BaseModel):
     success: bool = True
     message: str = "요청이 성공적으로 처리되었습니다"
     data: Optional[dict] = None
+    pagination: Optional[dict] = None
 
 
 # CRUD 함수들
@@ -122,7 +124,27 @@ def get_vehicles(db: Session, skip: int = 0, limit: int = 100, status: str = Non
     query = db.query(Vehicle)
     if status:
         query = query.filter(Vehicle.status == status)
-    return query.offset(skip).limit(limit).all()
+    return (
+        query.order_by(Vehicle.created_at.desc(), Vehicle.id.desc())
+        .offset(skip)
+        .limit(limit)
+        .all()
+    )
+
+
+def get_vehicles_page(
+    db: Session,
+    cursor: Optional[str] = None,
+    limit: int = 100,
+    status: str = None,
+    count_mode: CountMode = CountMode.NONE,
+):
+    query = db.query(Vehicle)
+    if status:
+        query = query.filter(Vehicle.status == status)
+    return paginate_query(
+        query, Vehicle.created_at, Vehicle.id, cursor, limit, count_mode=count_mode
+    )
 
 
 def update_vehicle(db: Session, vehicle_id: str, vehicle_update: VehicleUpdate):
@@ -189,10 +211,35 @@ async def get_vehicles_endpoint(
     status: Optional[str] = None,
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = None,
+    count: CountMode = CountMode.NONE,
     db: Session = Depends(get_db),
 ):
-    """차량 목록 조회"""
-    vehicles = get_vehicles(db, skip=skip, limit=limit, status=status)
+    """
+    차량 목록 조회
+
+    ``skip`` 이 0 이면 커서(keyset) 페이지네이션을 사용하며, 응답의
+    ``pagination.next_cursor`` 를 다음 요청의 ``cursor`` 로 전달합니다.
+    ``skip`` 은 기존 클라이언트 호환용입니다.
+    """
+    pagination = None
+    if cursor or skip == 0:
+        try:
+            page = get_vehicles_page(
+                db, cursor=cursor, limit=limit, status=status, count_mode=count
+            )
+        except InvalidCursorError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        vehicles = page.items
+        pagination = {
+            "limit": page.limit,
+            "next_cursor": page.next_cursor,
+            "has_next": page.has_next,
+            "total_items": page.total,
+            "total_is_estimate": page.total_is_estimate,
+        }
+    else:
+        vehicles = get_vehicles(db, skip=skip, limit=limit, status=status)
     vehicles_response = []
 
     for vehicle in vehicles:
@@ -220,6 +267,7 @@ async def get_vehicles_endpoint(
         "message": "차량 목록을 성공적으로 조회했습니다",
         "data": vehicles_response,
         "count": len(vehicles_response),
+        "pagination": pagination,
     }
 
 
@@ -2,10 +2,11 @@
 FastAPI 라우팅 구성 모듈
 """
 
+import json
 import logging
 import os
 from datetime import datetime, timezone
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from fastapi import APIRouter, Depends, FastAPI, WebSocket, WebSocketDisconnect
 from fastapi.responses import JSONResponse
@@ -15,7 +16,8 @@ from packages.api.srccore.config import settings
 from packages.api.srccore.dependencies import get_current_user
 from packages.api.srccore.logging_setup import setup_logging
 from packages.api.srccore.router_loader import load_routers
-from packages.api.srccore.websocket_manager import WebSocketManager
+from packages.api.srccore.security import TokenType, get_security_service
+from packages.api.srccore.websocket_manager import websocket_manager
 from packages.api.srcmodules.notification import router as notification_router
 # 라우터 import
 from packages.api.srcrouters import (auth, maintenance_records, notifications,
@@ -114,18 +116,55 @@ def _setup_health_endpoints(app: FastAPI) -> None:
     logger.debug("헬스 체크 엔드포인트가 설정되었습니다")
 
 
+def _websocket_user_id(websocket: WebSocket) -> Optional[str]:
+    """연결 쿼리의 액세스 토큰(``token``)으로 사용자 ID 확인 (없거나 무효하면 None)"""
+    token = websocket.query_params.get("token")
+    if not token:
+        return None
+    result = get_security_service().token_manager.verify_token(
+        token, expected_type=TokenType.ACCESS
+    )
+    if not result.success:
+        logger.debug(f"WebSocket 토큰 검증 실패: {result.error}")
+        return None
+    return str(result.data["sub"])
+
+
 def _setup_websocket_endpoints(app: FastAPI) -> None:
-    """WebSocket 엔드포인트 설정"""
-    websocket_manager = WebSocketManager()
+    """
+    WebSocket 엔드포인트 설정
+
+    연결 쿼리로 ``token`` (액세스 토큰)과 ``last_offset`` (마지막으로 받은 오프라인
+    메시지 오프셋)을 받고, 클라이언트는 ``{"type": "ack", "offset": ...}`` 메시지로
+    수신을 확인할 수 있습니다.
+    """
 
     @app.websocket("/ws/{client_id}")
     async def websocket_endpoint(websocket: WebSocket, client_id: str):
-        await websocket_manager.connect(websocket, client_id)
+        user_id = _websocket_user_id(websocket)
+        await websocket_manager.connect(
+            websocket,
+            client_id,
+            user_id,
+            last_offset=websocket.query_params.get("last_offset"),
+        )
         try:
             while True:
                 data = await websocket.receive_text()
-                await websocket_manager.process_message(client_id, data)
+                try:
+                    message = json.loads(data)
+                except ValueError:
+                    continue
+                if (
+                    user_id
+                    and isinstance(message, dict)
+                    and message.get("type") == "ack"
+                    and message.get("offset")
+                ):
+                    await websocket_manager.ack_offline_messages(
+                        user_id, str(message["offset"])
+                    )
         except WebSocketDisconnect:
-            websocket_manager.disconnect(client_id)
+            await websocket_manager.disconnect(client_id, user_id)
 
     logger.debug("WebSocket 엔드포인트가 설정되었습니다")
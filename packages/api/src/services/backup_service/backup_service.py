@@ -2,6 +2,10 @@
 백업 서비스 모듈
 
 백업 생성, 저장, 복원, 삭제 등의 작업을 처리하는 서비스 클래스를 제공합니다.
+
+새 백업은 스트리밍 형식(``streaming`` 모듈: 테이블별 zstd NDJSON 청크 + 매니페스트)으로
+기록되고, 메타데이터는 SQLite 인덱스(``index`` 모듈)에 보관됩니다. 이전 형식인
+단일 JSON 파일 백업도 계속 조회/복원/삭제할 수 있습니다.
 """
 
 import json
@@ -10,8 +14,11 @@ import os
 import shutil
 import uuid
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple
+from typing import (Any, Callable, Dict, Iterable, Iterator, List, Optional,
+                    Tuple)
 
+from sqlalchemy import MetaData, Table, select
+from sqlalchemy.engine import Connection
 from src.config.settings import settings
 from src.schemas.backup.backup_schemas import (BackupCleanupResponse,
                                                BackupCreate,
@@ -19,6 +26,20 @@ from src.schemas.backup.backup_schemas import (BackupCleanupResponse,
                                                BackupDetail, BackupList,
                                                BackupMeta, BackupResponse,
                                                BackupRestoreResponse)
+from src.services.backup_service.index import INDEX_FILENAME, BackupIndex
+from src.services.backup_service.streaming import (DEFAULT_CHUNK_ROWS,
+                                                   MANIFEST_FILENAME,
+                                                   StreamBackupWriter,
+                                                   iter_row_batches,
+                                                   iter_table_rows,
+                                                   read_manifest)
+
+# 요청 본문 백업에서 목록이 아닌 값 / 객체가 아닌 목록 항목을 담은 테이블 표시
+SCALAR_TABLE = "scalar"
+WRAPPED_TABLE = "wrapped"
+
+# 복원 시 기본 배치 크기
+DEFAULT_RESTORE_BATCH = 1000
 
 
 class BackupService:
@@ -28,59 +49,189 @@ class BackupService:
     백업 생성, 조회, 복원, 삭제 등 백업 관련 기능을 제공합니다.
     """
 
-    def __init__(self):
-        """서비스 초기화 및 백업 디렉토리 설정"""
+    def __init__(self, chunk_rows: int = DEFAULT_CHUNK_ROWS):
+        """
+        서비스 초기화 및 백업 디렉토리 설정
+
+        Args:
+            chunk_rows: 스트리밍 백업 청크당 행 수
+        """
         self.logger = logging.getLogger(__name__)
         self.backup_dir = os.path.join(settings.DATA_DIR, "backups")
+        self.chunk_rows = chunk_rows
 
         # 백업 디렉토리가 없으면 생성
         if not os.path.exists(self.backup_dir):
             os.makedirs(self.backup_dir, exist_ok=True)
             self.logger.info(f"백업 디렉토리 생성: {self.backup_dir}")
 
+        self.index = BackupIndex(os.path.join(self.backup_dir, INDEX_FILENAME))
+        if self.index.is_empty():
+            self._import_existing_backups()
+
     def create_backup(self, backup_data: BackupCreate) -> BackupResponse:
         """
         새 백업 생성 및 저장
 
+        ``data`` 의 목록 값은 테이블로, 나머지 값은 한 행짜리 테이블로 기록합니다.
+
         Args:
             backup_data: 백업 생성 요청 데이터
 
         Returns:
             생성된 백업 정보
         """
-        backup_id = str(uuid.uuid4())
-        created_at = datetime.now().isoformat()
-
-        # 메타데이터 및 백업 데이터 준비
-        backup_meta = {
-            "id": backup_id,
-            "type": backup_data.type,
-            "created_at": created_at,
-            "filename": f"{backup_id}.json",
-        }
 
-        backup_content = {"meta": backup_meta, "data": backup_data.data}
+        def document_table(name: str, value: Any):
+            if not isinstance(value, list):
+                return name, [{"value": value}], {SCALAR_TABLE: True}
+            if all(isinstance(row, dict) for row in value):
+                return name, value, {}
+            return name, ({"value": row} for row in value), {WRAPPED_TABLE: True}
 
-        # 백업 파일 저장
-        backup_path = os.path.join(self.backup_dir, f"{backup_id}.json")
         try:
-            with open(backup_path, "w") as f:
-                json.dump(backup_content, f, indent=2)
-
-            # 메타데이터 인덱스 업데이트
-            self._update_meta_index(backup_meta)
+            manifest = self.create_stream_backup(
+                backup_data.type,
+                (
+                    document_table(name, value)
+                    for name, value in backup_data.data.items()
+                ),
+                source="document",
+            )
 
-            self.logger.info(f"백업 생성 완료: {backup_id}")
             return BackupResponse(
-                backup_id=backup_id,
+                backup_id=manifest["id"],
                 type=backup_data.type,
-                created_at=created_at,
+                created_at=manifest["created_at"],
                 message="백업이 성공적으로 생성되었습니다.",
             )
         except Exception as e:
             self.logger.error(f"백업 생성 실패: {str(e)}")
             raise RuntimeError(f"백업 생성 중 오류 발생: {str(e)}")
 
+    def create_stream_backup(
+        self,
+        backup_type: str,
+        tables: Iterable[Tuple[str, Iterable[Dict[str, Any]], Dict[str, Any]]],
+        watermark_column: Optional[str] = None,
+        parent_id: Optional[str] = None,
+        source: str = "database",
+    ) -> Dict[str, Any]:
+        """
+        스트리밍 백업 생성
+
+        Args:
+            backup_type: 백업 유형
+            tables: (테이블 이름, 행 이터러블, 매니페스트 추가 항목) 목록
+            watermark_column: 테이블별 워터마크로 기록할 컬럼
+            parent_id: 증분 백업의 기준 백업 ID
+            source: 백업 원본 (``document``: 요청 본문, ``database``: DB 테이블)
+
+        Returns:
+            매니페스트
+        """
+        backup_id = str(uuid.uuid4())
+        writer = StreamBackupWriter(self.backup_dir, backup_id, chunk_rows=self.chunk_rows)
+        try:
+            for name, rows, table_meta in tables:
+                columns = set(table_meta.pop("columns", ()))
+                writer.write_table(
+                    name,
+                    rows,
+                    watermark_column if watermark_column in columns else None,
+                    **table_meta,
+                )
+            manifest = writer.commit(
+                {
+                    "id": backup_id,
+                    "type": backup_type,
+                    "created_at": datetime.now().isoformat(),
+                    "parent_id": parent_id,
+                    "incremental": parent_id is not None,
+                    "source": source,
+                }
+            )
+        except Exception:
+            writer.abort()
+            raise
+
+        self.index.add(
+            {**manifest, "filename": f"{backup_id}/{MANIFEST_FILENAME}"},
+            {
+                name: table
+                for name, table in manifest["tables"].items()
+                if table.get("watermark_column")
+            },
+        )
+        self.logger.info(
+            f"백업 생성 완료: {backup_id} ({manifest['rows']}행, {manifest['bytes']}바이트)"
+        )
+        return manifest
+
+    def create_incremental_backup(
+        self,
+        backup_type: str,
+        connection: Connection,
+        table_names: List[str],
+        watermark_column: str = "updated_at",
+        full: bool = False,
+    ) -> BackupResponse:
+        """
+        DB 테이블 증분 백업
+
+        같은 유형의 이전 백업에 기록된 테이블별 워터마크 이후(같은 값 포함)에 변경된
+        행만 서버 측 커서로 스트리밍해 기록합니다. 워터마크 컬럼이 없는 테이블과
+        이전 백업이 없는 경우는 전체를 기록합니다. 삭제된 행은 추적하지 않습니다.
+
+        Args:
+            backup_type: 백업 유형
+            connection: SQLAlchemy 연결
+            table_names: 백업할 테이블 이름 목록
+            watermark_column: 변경 시각 컬럼
+            full: 워터마크를 무시하고 전체 백업
+
+        Returns:
+            생성된 백업 정보
+        """
+        watermarks = {} if full else self.index.latest_watermarks(backup_type)
+        parent_id = self.index.latest_id(backup_type) if watermarks else None
+        metadata = MetaData()
+
+        def table_sources():
+            for name in table_names:
+                table = Table(name, metadata, autoload_with=connection)
+                stmt = select(table)
+                if watermark_column in table.c:
+                    column = table.c[watermark_column]
+                    if watermarks.get(name) is not None:
+                        stmt = stmt.where(column >= _parse_watermark(watermarks[name]))
+                    stmt = stmt.order_by(column)
+                result = connection.execution_options(
+                    stream_results=True, yield_per=self.chunk_rows
+                ).execute(stmt)
+                yield (
+                    name,
+                    (dict(row._mapping) for row in result),
+                    {"columns": list(table.c.keys())},
+                )
+
+        try:
+            manifest = self.create_stream_backup(
+                backup_type, table_sources(), watermark_column, parent_id
+            )
+            return BackupResponse(
+                backup_id=manifest["id"],
+                type=backup_type,
+                created_at=manifest["created_at"],
+                message=(
+                    f"{'증분' if parent_id else '전체'} 백업이 생성되었습니다 "
+                    f"({manifest['rows']}행)."
+                ),
+            )
+        except Exception as e:
+            self.logger.error(f"증분 백업 생성 실패: {str(e)}")
+            raise RuntimeError(f"증분 백업 생성 중 오류 발생: {str(e)}")
+
     def list_backups(
         self, backup_type: Optional[str] = None, limit: int = 100
     ) -> BackupList:
@@ -92,21 +243,10 @@ class BackupService:
             limit: 반환할 최대 백업 수
 
         Returns:
-            백업 목록
+            백업 목록 (생성 날짜 기준 최신순)
         """
         try:
-            meta_list = self._get_backup_meta_list()
-
-            # 유형으로 필터링 (필요한 경우)
-            if backup_type:
-                meta_list = [m for m in meta_list if m.get("type") == backup_type]
-
-            # 생성 날짜 기준 정렬 (최신순)
-            meta_list.sort(key=lambda x: x.get("created_at", ""), reverse=True)
-
-            # 요청된 수 제한
-            meta_list = meta_list[:limit]
-
+            meta_list = self.index.list(backup_type=backup_type, limit=limit)
             return BackupList(backups=meta_list, count=len(meta_list))
         except Exception as e:
             self.logger.error(f"백업 목록 조회 실패: {str(e)}")
@@ -116,13 +256,30 @@ class BackupService:
         """
         특정 백업 상세 조회
 
+        요청 본문 백업은 원래 데이터를, DB 백업은 데이터 대신 매니페스트를 돌려줍니다.
+
         Args:
             backup_id: 조회할 백업 ID
 
         Returns:
             백업 상세 정보
         """
+        _validate_backup_id(backup_id)
         try:
+            stream_path = os.path.join(self.backup_dir, backup_id)
+            if os.path.isfile(os.path.join(stream_path, MANIFEST_FILENAME)):
+                manifest = read_manifest(stream_path)
+                if manifest.get("source") == "document":
+                    data = self._read_document(stream_path, manifest)
+                else:
+                    data = {"manifest": manifest}
+                return BackupDetail(
+                    id=manifest["id"],
+                    type=manifest["type"],
+                    created_at=manifest["created_at"],
+                    data=data,
+                )
+
             backup_path = os.path.join(self.backup_dir, f"{backup_id}.json")
 
             if not os.path.exists(backup_path):
@@ -147,23 +304,54 @@ class BackupService:
             self.logger.error(f"백업 조회 실패: {str(e)}")
             raise RuntimeError(f"백업 조회 중 오류 발생: {str(e)}")
 
-    def restore_backup(self, backup_id: str) -> BackupRestoreResponse:
+    def iter_backup_rows(
+        self, backup_id: str, table: str, verify: bool = True
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        스트리밍 백업의 테이블 행 읽기 (청크 체크섬 검증)
+
+        Args:
+            backup_id: 백업 ID
+            table: 테이블 이름
+            verify: 청크 체크섬 검증 여부
+
+        Yields:
+            행
+        """
+        stream_path = self._stream_path(backup_id)
+        yield from iter_table_rows(stream_path, read_manifest(stream_path), table, verify)
+
+    def restore_backup(
+        self,
+        backup_id: str,
+        apply_batch: Optional[Callable[[str, List[Dict[str, Any]]], None]] = None,
+        batch_size: int = DEFAULT_RESTORE_BATCH,
+    ) -> BackupRestoreResponse:
         """
         백업에서 데이터 복원
 
+        ``apply_batch`` 를 주면 스트리밍 백업을 (증분이면 기준 백업부터 차례로)
+        ``batch_size`` 행씩 넘겨 복원하고, 결과에는 테이블별 복원 행 수를 담습니다.
+        같은 행이 여러 백업에 있을 수 있으므로 ``apply_batch`` 는 upsert 여야 합니다.
+
         Args:
             backup_id: 복원할 백업 ID
+            apply_batch: (테이블 이름, 행 배치)를 받아 저장하는 함수
+            batch_size: 배치당 행 수
 
         Returns:
             복원 결과 정보
         """
         try:
-            # 백업 데이터 가져오기
-            backup_detail = self.get_backup(backup_id)
-            backup_data = backup_detail.data
-
-            # 여기서 실제 데이터 복원 로직을 구현
-            # (이 예제에서는 데이터를 반환만 하고 실제 복원은 구현하지 않음)
+            if apply_batch is not None:
+                backup_data = {
+                    "restored_rows": self.restore_stream_backup(
+                        backup_id, apply_batch, batch_size
+                    )
+                }
+            else:
+                # 백업 데이터 가져오기
+                backup_data = self.get_backup(backup_id).data
 
             self.logger.info(f"백업 {backup_id} 복원 완료")
 
@@ -177,6 +365,32 @@ class BackupService:
             self.logger.error(f"백업 복원 실패: {str(e)}")
             raise RuntimeError(f"백업 복원 중 오류 발생: {str(e)}")
 
+    def restore_stream_backup(
+        self,
+        backup_id: str,
+        apply_batch: Callable[[str, List[Dict[str, Any]]], None],
+        batch_size: int = DEFAULT_RESTORE_BATCH,
+    ) -> Dict[str, int]:
+        """
+        스트리밍 백업 복원 (메모리 사용량은 배치 하나로 제한)
+
+        Args:
+            backup_id: 복원할 백업 ID
+            apply_batch: (테이블 이름, 행 배치)를 받아 저장하는 함수
+            batch_size: 배치당 행 수
+
+        Returns:
+            테이블별 복원 행 수
+        """
+        restored: Dict[str, int] = {}
+        for chain_id in self._backup_chain(backup_id):
+            stream_path = self._stream_path(chain_id)
+            manifest = read_manifest(stream_path)
+            for table, batch in iter_row_batches(stream_path, manifest, batch_size):
+                apply_batch(table, batch)
+                restored[table] = restored.get(table, 0) + len(batch)
+        return restored
+
     def delete_backup(self, backup_id: str) -> BackupDeleteResponse:
         """
         백업 삭제
@@ -187,18 +401,21 @@ class BackupService:
         Returns:
             삭제 결과 정보
         """
+        _validate_backup_id(backup_id)
         try:
+            stream_path = os.path.join(self.backup_dir, backup_id)
             backup_path = os.path.join(self.backup_dir, f"{backup_id}.json")
 
-            if not os.path.exists(backup_path):
+            if os.path.isdir(stream_path):
+                shutil.rmtree(stream_path)
+            elif os.path.exists(backup_path):
+                os.remove(backup_path)
+            else:
                 self.logger.error(f"삭제할 백업을 찾을 수 없음: {backup_id}")
                 raise ValueError(f"백업 ID {backup_id}를 찾을 수 없습니다.")
 
-            # 백업 파일 삭제
-            os.remove(backup_path)
-
             # 메타데이터 인덱스에서 삭제
-            self._remove_from_meta_index(backup_id)
+            self.index.remove(backup_id)
 
             self.logger.info(f"백업 삭제 완료: {backup_id}")
 
@@ -219,6 +436,8 @@ class BackupService:
         """
         오래된 백업 정리
 
+        유지하는 증분 백업의 기준 백업은 삭제하지 않습니다.
+
         Args:
             backup_type: 정리할 백업 유형 (선택 사항)
             keep_count: 유지할 최신 백업 수
@@ -227,21 +446,25 @@ class BackupService:
             정리 결과 정보
         """
         try:
-            # 백업 목록 가져오기
-            backup_list = self.list_backups(backup_type=backup_type, limit=1000)
-            backups = backup_list.backups
-
-            # 생성 날짜 기준 정렬 (최신순)
-            backups.sort(key=lambda x: x.get("created_at", ""), reverse=True)
+            # 백업 목록 가져오기 (최신순)
+            backups = self.index.list(backup_type=backup_type, limit=1000)
 
             # 보존해야 할 백업과 삭제할 백업 분리
             to_keep = backups[:keep_count]
             to_delete = backups[keep_count:]
+            required = {
+                chain_id
+                for backup in to_keep
+                if backup.get("incremental")
+                for chain_id in self._backup_chain(backup["id"])
+            }
 
             # 삭제 처리
             deleted_count = 0
             for backup in to_delete:
                 backup_id = backup.get("id")
+                if backup_id in required:
+                    continue
                 try:
                     self.delete_backup(backup_id)
                     deleted_count += 1
@@ -259,69 +482,88 @@ class BackupService:
             self.logger.error(f"백업 정리 실패: {str(e)}")
             raise RuntimeError(f"백업 정리 중 오류 발생: {str(e)}")
 
-    def _get_backup_meta_list(self) -> List[Dict[str, Any]]:
-        """백업 메타데이터 목록 가져오기"""
-        meta_list = []
+    def _stream_path(self, backup_id: str) -> str:
+        """스트리밍 백업 디렉토리 (없으면 ValueError)"""
+        _validate_backup_id(backup_id)
+        stream_path = os.path.join(self.backup_dir, backup_id)
+        if not os.path.isfile(os.path.join(stream_path, MANIFEST_FILENAME)):
+            raise ValueError(f"스트리밍 백업 ID {backup_id}를 찾을 수 없습니다.")
+        return stream_path
+
+    def _backup_chain(self, backup_id: str) -> List[str]:
+        """기준 백업부터 지정 백업까지의 증분 체인 (오래된 순)"""
+        chain = []
+        current: Optional[str] = backup_id
+        while current is not None:
+            if current in chain:
+                raise ValueError(f"백업 체인에 순환이 있습니다: {current}")
+            chain.append(current)
+            meta = self.index.get(current)
+            if meta is None:
+                raise ValueError(f"기준 백업 {current}를 찾을 수 없습니다.")
+            current = meta.get("parent_id")
+        return list(reversed(chain))
+
+    def _read_document(
+        self, stream_path: str, manifest: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """요청 본문 백업을 원래 형태로 읽기"""
+        data: Dict[str, Any] = {}
+        for name, table in manifest["tables"].items():
+            rows = list(iter_table_rows(stream_path, manifest, name))
+            if table.get(SCALAR_TABLE):
+                data[name] = rows[0]["value"] if rows else None
+            elif table.get(WRAPPED_TABLE):
+                data[name] = [row["value"] for row in rows]
+            else:
+                data[name] = rows
+        return data
 
-        # 백업 디렉토리 내 모든 JSON 파일 스캔
+    def _import_existing_backups(self) -> None:
+        """인덱스가 비어 있을 때 디렉토리의 기존 백업 메타데이터 등록 (최초 1회)"""
         for filename in os.listdir(self.backup_dir):
-            if not filename.endswith(".json"):
-                continue
-
-            if filename == "backup_index.json":
-                continue
-
+            path = os.path.join(self.backup_dir, filename)
             try:
-                with open(os.path.join(self.backup_dir, filename), "r") as f:
-                    backup_content = json.load(f)
-                    meta = backup_content.get("meta", {})
+                if filename.endswith(".json") and filename != "backup_index.json":
+                    with open(path, "r") as f:
+                        meta = json.load(f).get("meta", {})
                     if meta:
-                        meta_list.append(meta)
+                        self.index.add({**meta, "format": "json"})
+                elif os.path.isfile(os.path.join(path, MANIFEST_FILENAME)):
+                    manifest = read_manifest(path)
+                    self.index.add(
+                        {**manifest, "filename": f"{filename}/{MANIFEST_FILENAME}"},
+                        {
+                            name: table
+                            for name, table in manifest["tables"].items()
+                            if table.get("watermark_column")
+                        },
+                    )
             except Exception as e:
                 self.logger.warning(f"백업 메타데이터 추출 실패 ({filename}): {str(e)}")
 
-        return meta_list
-
-    def _update_meta_index(self, meta: Dict[str, Any]) -> None:
-        """백업 메타데이터 인덱스 업데이트"""
-        index_path = os.path.join(self.backup_dir, "backup_index.json")
 
-        try:
-            # 기존 인덱스 로드 또는 새로 생성
-            if os.path.exists(index_path):
-                with open(index_path, "r") as f:
-                    index_data = json.load(f)
-            else:
-                index_data = {"backups": []}
-
-            # 새 메타데이터 추가
-            index_data["backups"].append(meta)
-
-            # 인덱스 저장
-            with open(index_path, "w") as f:
-                json.dump(index_data, f, indent=2)
-        except Exception as e:
-            self.logger.warning(f"메타데이터 인덱스 업데이트 실패: {str(e)}")
-
-    def _remove_from_meta_index(self, backup_id: str) -> None:
-        """백업 메타데이터 인덱스에서 항목 제거"""
-        index_path = os.path.join(self.backup_dir, "backup_index.json")
+def _validate_backup_id(backup_id: str) -> None:
+    """
+    백업 ID 형식 확인 (파일 경로에 쓰기 전에 호출)
 
-        if not os.path.exists(index_path):
-            return
+    백업 ID 는 항상 ``uuid4`` 문자열이므로 그 외의 값(``.``, ``..``, 경로 구분자 등)은
+    백업 디렉토리 밖을 가리킬 수 있어 거부합니다.
 
-        try:
-            # 인덱스 로드
-            with open(index_path, "r") as f:
-                index_data = json.load(f)
-
-            # 해당 백업 ID 제거
-            index_data["backups"] = [
-                b for b in index_data.get("backups", []) if b.get("id") != backup_id
-            ]
-
-            # 인덱스 저장
-            with open(index_path, "w") as f:
-                json.dump(index_data, f, indent=2)
-        except Exception as e:
-            self.logger.warning(f"메타데이터 인덱스에서 항목 제거 실패: {str(e)}")
+    Raises:
+        ValueError: UUID 형식이 아닌 경우
+    """
+    try:
+        valid = str(uuid.UUID(backup_id)) == backup_id.lower()
+    except (ValueError, AttributeError, TypeError):
+        valid = False
+    if not valid:
+        raise ValueError(f"백업 ID {backup_id}를 찾을 수 없습니다.")
+
+
+def _parse_watermark(value: str) -> Any:
+    """ISO 형식 워터마크는 datetime 으로, 그 외는 그대로 비교"""
+    try:
+        return datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        return value
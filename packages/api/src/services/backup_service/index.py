@@ -0,0 +1,197 @@
+"""
+백업 메타데이터 인덱스 모듈
+
+백업 목록을 SQLite 파일 하나에 보관합니다. 백업을 추가/삭제할 때 인덱스 전체를
+다시 쓰지 않고 행 하나만 갱신하며, 목록 조회는 (유형, 생성 시각) 인덱스를 사용합니다.
+증분 백업용 테이블별 워터마크도 함께 저장합니다.
+"""
+
+import sqlite3
+from contextlib import closing
+from typing import Any, Dict, List, Optional
+
+# 인덱스 파일명
+INDEX_FILENAME = "backup_index.db"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS backups (
+    id TEXT PRIMARY KEY,
+    type TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    filename TEXT NOT NULL,
+    format TEXT NOT NULL DEFAULT 'json',
+    parent_id TEXT,
+    incremental INTEGER NOT NULL DEFAULT 0,
+    rows INTEGER NOT NULL DEFAULT 0,
+    bytes INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS ix_backups_type_created ON backups (type, created_at);
+CREATE INDEX IF NOT EXISTS ix_backups_created ON backups (created_at);
+CREATE TABLE IF NOT EXISTS backup_watermarks (
+    backup_id TEXT NOT NULL REFERENCES backups (id) ON DELETE CASCADE,
+    table_name TEXT NOT NULL,
+    watermark_column TEXT NOT NULL,
+    watermark TEXT,
+    PRIMARY KEY (backup_id, table_name)
+);
+"""
+
+_COLUMNS = (
+    "id",
+    "type",
+    "created_at",
+    "filename",
+    "format",
+    "parent_id",
+    "incremental",
+    "rows",
+    "bytes",
+)
+
+
+class BackupIndex:
+    """SQLite 백업 메타데이터 인덱스"""
+
+    def __init__(self, path: str):
+        """
+        인덱스 초기화 (파일과 스키마가 없으면 생성)
+
+        Args:
+            path: SQLite 파일 경로
+        """
+        self.path = path
+        with closing(self._connect()) as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, timeout=30)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA foreign_keys=ON")
+        return conn
+
+    def is_empty(self) -> bool:
+        """등록된 백업이 없는지 확인"""
+        with closing(self._connect()) as conn:
+            return conn.execute("SELECT 1 FROM backups LIMIT 1").fetchone() is None
+
+    def add(self, meta: Dict[str, Any], watermarks: Optional[Dict[str, Any]] = None):
+        """
+        백업 등록
+
+        Args:
+            meta: 백업 메타데이터 (``id``, ``type``, ``created_at``, ``filename`` 필수)
+            watermarks: 테이블별 ``{"watermark_column": ..., "watermark": ...}``
+        """
+        values = {
+            "format": "json",
+            "parent_id": None,
+            "incremental": 0,
+            "rows": 0,
+            "bytes": 0,
+            **{k: meta[k] for k in _COLUMNS if k in meta},
+        }
+        values["incremental"] = int(bool(values["incremental"]))
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                f"INSERT OR REPLACE INTO backups ({', '.join(_COLUMNS)}) "
+                f"VALUES ({', '.join('?' for _ in _COLUMNS)})",
+                [values[k] for k in _COLUMNS],
+            )
+            conn.executemany(
+                "INSERT OR REPLACE INTO backup_watermarks "
+                "(backup_id, table_name, watermark_column, watermark) "
+                "VALUES (?, ?, ?, ?)",
+                [
+                    (meta["id"], table, wm["watermark_column"], wm.get("watermark"))
+                    for table, wm in (watermarks or {}).items()
+                ],
+            )
+
+    def remove(self, backup_id: str) -> bool:
+        """
+        백업 제거
+
+        Args:
+            backup_id: 백업 ID
+
+        Returns:
+            bool: 제거 여부
+        """
+        with closing(self._connect()) as conn, conn:
+            return (
+                conn.execute("DELETE FROM backups WHERE id = ?", (backup_id,)).rowcount
+                > 0
+            )
+
+    def get(self, backup_id: str) -> Optional[Dict[str, Any]]:
+        """백업 메타데이터 조회"""
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                "SELECT * FROM backups WHERE id = ?", (backup_id,)
+            ).fetchone()
+        return self._to_meta(row) if row else None
+
+    def list(
+        self, backup_type: Optional[str] = None, limit: int = 100, offset: int = 0
+    ) -> List[Dict[str, Any]]:
+        """
+        백업 목록 조회 (최신순)
+
+        Args:
+            backup_type: 백업 유형 필터
+            limit: 최대 개수
+            offset: 건너뛸 개수
+
+        Returns:
+            List[Dict[str, Any]]: 메타데이터 목록
+        """
+        query = "SELECT * FROM backups"
+        params: List[Any] = []
+        if backup_type:
+            query += " WHERE type = ?"
+            params.append(backup_type)
+        query += " ORDER BY created_at DESC LIMIT ? OFFSET ?"
+        params.extend([limit, offset])
+        with closing(self._connect()) as conn:
+            return [self._to_meta(row) for row in conn.execute(query, params)]
+
+    def latest_watermarks(self, backup_type: str) -> Dict[str, Any]:
+        """
+        유형별 테이블 최신 워터마크 조회
+
+        Args:
+            backup_type: 백업 유형
+
+        Returns:
+            Dict[str, Any]: 테이블 이름 -> 가장 최근 백업의 워터마크
+        """
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                "SELECT w.table_name, w.watermark FROM backup_watermarks w "
+                "JOIN backups b ON b.id = w.backup_id "
+                "WHERE b.type = ? AND w.watermark IS NOT NULL "
+                "ORDER BY b.created_at",
+                (backup_type,),
+            ).fetchall()
+        # 시간순으로 덮어써 테이블별 가장 최근 값만 남김
+        watermarks: Dict[str, Any] = {}
+        for row in rows:
+            watermarks[row["table_name"]] = row["watermark"]
+        return watermarks
+
+    def latest_id(self, backup_type: str) -> Optional[str]:
+        """유형별 가장 최근 백업 ID"""
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                "SELECT id FROM backups WHERE type = ? "
+                "ORDER BY created_at DESC LIMIT 1",
+                (backup_type,),
+            ).fetchone()
+        return row["id"] if row else None
+
+    @staticmethod
+    def _to_meta(row: sqlite3.Row) -> Dict[str, Any]:
+        meta = dict(row)
+        meta["incremental"] = bool(meta["incremental"])
+        return meta
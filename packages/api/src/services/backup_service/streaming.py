@@ -0,0 +1,380 @@
+"""
+스트리밍 백업 형식 모듈
+
+백업 하나는 디렉토리 하나이며, 테이블별 행을 NDJSON(한 줄에 JSON 하나)으로
+``chunk_rows`` 행씩 나눠 zstd 로 압축한 청크 파일과 매니페스트로 구성됩니다.
+
+    {backup_id}/
+        manifest.json
+        {table}.00000.ndjson.zst
+        {table}.00001.ndjson.zst
+        ...
+
+- 쓰기와 읽기 모두 행 단위 스트리밍이라 메모리 사용량은 청크 크기와 무관합니다.
+- 매니페스트에는 청크별 행 수, 크기, SHA-256 이 기록되고 읽기 전에 검증됩니다.
+- 증분 백업은 테이블별 ``updated_at`` 워터마크(마지막으로 백업한 최대값)를
+  매니페스트에 남기고, 다음 백업은 그 이후 변경된 행만 담습니다.
+- ``zstandard`` 가 설치되지 않은 환경에서는 gzip 으로 기록하며 코덱은 매니페스트에
+  남으므로 읽을 때 자동으로 선택됩니다.
+"""
+
+import gzip
+import hashlib
+import io
+import json
+import os
+import shutil
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - 선택 의존성
+    zstandard = None
+
+# 백업 형식 식별자
+STREAM_FORMAT = "ndjson-chunks/v1"
+
+# 매니페스트 파일명
+MANIFEST_FILENAME = "manifest.json"
+
+# 청크당 기본 행 수
+DEFAULT_CHUNK_ROWS = 10000
+
+# zstd 압축 레벨 (속도 우선)
+DEFAULT_ZSTD_LEVEL = 3
+
+# 체크섬 계산/검증 시 읽기 단위
+READ_BLOCK_SIZE = 1024 * 1024
+
+CODEC_EXTENSIONS = {"zstd": "zst", "gzip": "gz"}
+
+
+class BackupIntegrityError(Exception):
+    """청크 체크섬이나 행 수가 매니페스트와 다른 경우"""
+
+
+def default_codec() -> str:
+    """사용 가능한 압축 코덱 (zstd 우선)"""
+    return "zstd" if zstandard is not None else "gzip"
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, bytes):
+        return value.hex()
+    return str(value)
+
+
+def encode_row(row: Dict[str, Any]) -> bytes:
+    """행을 NDJSON 한 줄로 직렬화"""
+    return (
+        json.dumps(row, default=_json_default, ensure_ascii=False, separators=(",", ":"))
+        + "\n"
+    ).encode("utf-8")
+
+
+class _HashingWriter(io.RawIOBase):
+    """기록되는 압축 바이트의 SHA-256 과 크기를 계산하는 파일 래퍼"""
+
+    def __init__(self, raw: io.BufferedWriter):
+        self.raw = raw
+        self.sha256 = hashlib.sha256()
+        self.size = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self.sha256.update(data)
+        self.size += len(data)
+        return self.raw.write(data)
+
+    def flush(self) -> None:
+        self.raw.flush()
+
+
+class ChunkWriter:
+    """테이블 하나의 청크 파일 기록기"""
+
+    def __init__(
+        self,
+        directory: str,
+        table: str,
+        codec: str,
+        chunk_rows: int = DEFAULT_CHUNK_ROWS,
+        level: int = DEFAULT_ZSTD_LEVEL,
+    ):
+        self.directory = directory
+        self.table = table
+        self.codec = codec
+        self.chunk_rows = chunk_rows
+        self.level = level
+        self.chunks: List[Dict[str, Any]] = []
+        self.rows = 0
+        self._file = None
+        self._hasher: Optional[_HashingWriter] = None
+        self._stream = None
+        self._chunk_rows = 0
+
+    def _open_chunk(self) -> None:
+        filename = (
+            f"{self.table}.{len(self.chunks):05d}.ndjson."
+            f"{CODEC_EXTENSIONS[self.codec]}"
+        )
+        self._file = open(os.path.join(self.directory, filename), "wb")
+        self._hasher = _HashingWriter(self._file)
+        if self.codec == "zstd":
+            self._stream = zstandard.ZstdCompressor(level=self.level).stream_writer(
+                self._hasher, closefd=False
+            )
+        else:
+            self._stream = gzip.GzipFile(
+                filename="", mode="wb", fileobj=self._hasher, mtime=0
+            )
+        self._chunk_rows = 0
+        self.chunks.append({"file": filename})
+
+    def _close_chunk(self) -> None:
+        if self._stream is None:
+            return
+        self._stream.close()
+        self._hasher.flush()
+        self._file.close()
+        self.chunks[-1].update(
+            {
+                "rows": self._chunk_rows,
+                "bytes": self._hasher.size,
+                "sha256": self._hasher.sha256.hexdigest(),
+            }
+        )
+        self._stream = self._hasher = self._file = None
+
+    def write(self, row: Dict[str, Any]) -> None:
+        """행 기록 (청크가 가득 차면 다음 청크로 넘어감)"""
+        if self._stream is None:
+            self._open_chunk()
+        self._stream.write(encode_row(row))
+        self._chunk_rows += 1
+        self.rows += 1
+        if self._chunk_rows >= self.chunk_rows:
+            self._close_chunk()
+
+    def close(self) -> Dict[str, Any]:
+        """
+        마지막 청크를 닫고 매니페스트 항목 반환
+
+        Returns:
+            Dict[str, Any]: 행 수, 청크 목록
+        """
+        self._close_chunk()
+        return {"rows": self.rows, "chunks": self.chunks}
+
+
+class StreamBackupWriter:
+    """스트리밍 백업 기록기
+
+    임시 디렉토리에 기록한 뒤 ``commit`` 에서 매니페스트를 쓰고 최종 위치로 옮기므로
+    중간에 실패한 백업은 목록에 나타나지 않습니다.
+    """
+
+    def __init__(
+        self,
+        backup_dir: str,
+        backup_id: str,
+        codec: Optional[str] = None,
+        chunk_rows: int = DEFAULT_CHUNK_ROWS,
+    ):
+        """
+        기록기 초기화
+
+        Args:
+            backup_dir: 백업 루트 디렉토리
+            backup_id: 백업 ID
+            codec: 압축 코덱 (``zstd`` 또는 ``gzip``, 기본값: 사용 가능한 코덱)
+            chunk_rows: 청크당 행 수
+        """
+        self.codec = codec or default_codec()
+        if self.codec == "zstd" and zstandard is None:
+            raise RuntimeError("zstd 코덱에는 zstandard 패키지가 필요합니다")
+        self.backup_id = backup_id
+        self.final_path = os.path.join(backup_dir, backup_id)
+        self.path = os.path.join(backup_dir, f".{backup_id}.partial")
+        self.chunk_rows = chunk_rows
+        self.tables: Dict[str, Dict[str, Any]] = {}
+        os.makedirs(self.path, exist_ok=True)
+
+    def write_table(
+        self,
+        table: str,
+        rows: Iterable[Dict[str, Any]],
+        watermark_column: Optional[str] = None,
+        **table_meta: Any,
+    ) -> Dict[str, Any]:
+        """
+        테이블 행 스트리밍 기록
+
+        Args:
+            table: 테이블 이름
+            rows: 행 이터러블 (한 번에 하나씩 소비)
+            watermark_column: 최대값을 워터마크로 기록할 컬럼 (예: ``updated_at``)
+            **table_meta: 매니페스트 테이블 항목에 추가할 값
+
+        Returns:
+            Dict[str, Any]: 매니페스트 테이블 항목
+        """
+        writer = ChunkWriter(self.path, table, self.codec, self.chunk_rows)
+        watermark = None
+        try:
+            for row in rows:
+                writer.write(row)
+                if watermark_column is not None:
+                    value = row.get(watermark_column)
+                    if value is not None and (watermark is None or value > watermark):
+                        watermark = value
+        finally:
+            entry = writer.close()
+        if watermark_column is not None:
+            entry["watermark_column"] = watermark_column
+            entry["watermark"] = (
+                _json_default(watermark) if watermark is not None else None
+            )
+        entry.update(table_meta)
+        self.tables[table] = entry
+        return entry
+
+    def commit(self, meta: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        매니페스트 기록 후 백업 확정
+
+        Args:
+            meta: 매니페스트에 포함할 백업 메타데이터
+
+        Returns:
+            Dict[str, Any]: 매니페스트
+        """
+        manifest = {
+            **meta,
+            "format": STREAM_FORMAT,
+            "codec": self.codec,
+            "tables": self.tables,
+            "rows": sum(t["rows"] for t in self.tables.values()),
+            "bytes": sum(
+                c["bytes"] for t in self.tables.values() for c in t["chunks"]
+            ),
+        }
+        with open(os.path.join(self.path, MANIFEST_FILENAME), "w") as f:
+            json.dump(manifest, f, default=_json_default)
+        os.replace(self.path, self.final_path)
+        return manifest
+
+    def abort(self) -> None:
+        """기록 중인 백업 삭제"""
+        shutil.rmtree(self.path, ignore_errors=True)
+
+
+def read_manifest(backup_path: str) -> Dict[str, Any]:
+    """
+    매니페스트 읽기
+
+    Args:
+        backup_path: 백업 디렉토리
+
+    Returns:
+        Dict[str, Any]: 매니페스트
+    """
+    with open(os.path.join(backup_path, MANIFEST_FILENAME), "r") as f:
+        return json.load(f)
+
+
+def verify_chunk(backup_path: str, chunk: Dict[str, Any]) -> None:
+    """
+    청크 체크섬 검증 (블록 단위로 읽음)
+
+    Raises:
+        BackupIntegrityError: 크기나 체크섬이 다른 경우
+    """
+    sha256 = hashlib.sha256()
+    size = 0
+    with open(os.path.join(backup_path, chunk["file"]), "rb") as f:
+        for block in iter(lambda: f.read(READ_BLOCK_SIZE), b""):
+            sha256.update(block)
+            size += len(block)
+    if size != chunk["bytes"] or sha256.hexdigest() != chunk["sha256"]:
+        raise BackupIntegrityError(f"청크 체크섬 불일치: {chunk['file']}")
+
+
+def _open_chunk_lines(path: str, codec: str):
+    raw = open(path, "rb")
+    if codec == "zstd":
+        if zstandard is None:
+            raw.close()
+            raise RuntimeError("zstd 백업을 읽으려면 zstandard 패키지가 필요합니다")
+        stream = zstandard.ZstdDecompressor().stream_reader(raw, closefd=True)
+    else:
+        stream = gzip.GzipFile(fileobj=raw, mode="rb")
+    return io.TextIOWrapper(io.BufferedReader(stream), encoding="utf-8")
+
+
+def iter_table_rows(
+    backup_path: str,
+    manifest: Dict[str, Any],
+    table: str,
+    verify: bool = True,
+) -> Iterator[Dict[str, Any]]:
+    """
+    테이블 행 스트리밍 읽기
+
+    Args:
+        backup_path: 백업 디렉토리
+        manifest: 매니페스트
+        table: 테이블 이름
+        verify: 청크를 읽기 전에 체크섬 검증
+
+    Yields:
+        Dict[str, Any]: 행
+
+    Raises:
+        BackupIntegrityError: 체크섬이나 행 수가 다른 경우
+    """
+    for chunk in manifest["tables"][table]["chunks"]:
+        if verify:
+            verify_chunk(backup_path, chunk)
+        count = 0
+        with _open_chunk_lines(
+            os.path.join(backup_path, chunk["file"]), manifest["codec"]
+        ) as lines:
+            for line in lines:
+                if line.strip():
+                    count += 1
+                    yield json.loads(line)
+        if count != chunk["rows"]:
+            raise BackupIntegrityError(f"청크 행 수 불일치: {chunk['file']}")
+
+
+def iter_row_batches(
+    backup_path: str,
+    manifest: Dict[str, Any],
+    batch_size: int,
+    tables: Optional[Iterable[str]] = None,
+    verify: bool = True,
+) -> Iterator[Tuple[str, List[Dict[str, Any]]]]:
+    """
+    테이블별 행을 ``batch_size`` 단위로 읽기 (메모리 사용량은 배치 하나로 제한)
+
+    Yields:
+        Tuple[str, List[Dict[str, Any]]]: (테이블 이름, 행 배치)
+    """
+    for table in tables or manifest["tables"].keys():
+        batch: List[Dict[str, Any]] = []
+        for row in iter_table_rows(backup_path, manifest, table, verify):
+            batch.append(row)
+            if len(batch) >= batch_size:
+                yield table, batch
+                batch = []
+        if batch:
+            yield table, batch
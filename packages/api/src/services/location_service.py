@@ -7,7 +7,6 @@ import asyncio
 import datetime
 import json
 import logging
-import uuid
 from typing import Dict, List, Optional, Tuple, Any
 
 import aiohttp
@@ -16,10 +15,11 @@ from fastapi import Depends, HTTPException
 from sqlalchemy import func, desc
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, aliased
 from sqlalchemy.exc import SQLAlchemyError
 
 from src.config import settings
+from src.core.partitioning import vehicle_location_partitions
 from src.db.session import get_db
 from src.models.vehicle_location import VehicleLocation, VehicleLocationStatus
 from src.schemas.vehicle_location import (
@@ -41,6 +41,9 @@ GEOCODING_API_URL = "https://maps.googleapis.com/maps/api/geocode/json"
 DIRECTIONS_API_URL = "https://maps.googleapis.com/maps/api/directions/json"
 ELEVATION_API_URL = "https://maps.googleapis.com/maps/api/elevation/json"
 
+# 위치 이력 파티션 단위 (daily / monthly)
+LOCATION_PARTITION_GRANULARITY = getattr(settings, "LOCATION_PARTITION_GRANULARITY", "monthly")
+
 # 사용자 정의 예외
 class LocationServiceError(Exception):
     """위치 서비스 관련 기본 예외"""
@@ -69,6 +72,38 @@ class LocationService:
         self.db = db
         self._http_session = None
         self._is_async_session = isinstance(db, AsyncSession)
+        self._partitions = vehicle_location_partitions(LOCATION_PARTITION_GRANULARITY)
+
+    def _location_entity(self, connection, start=None, end=None, **filters):
+        """조회 범위에 해당하는 파티션만 대상으로 하는 VehicleLocation 엔티티 반환
+
+        Args:
+            connection: 동기 데이터베이스 연결
+            start: 조회 시작 시각 (없으면 제한 없음)
+            end: 조회 종료 시각 (없으면 제한 없음)
+            filters: 각 파티션 분기에 미리 적용할 컬럼 일치 조건
+
+        Returns:
+            VehicleLocation 또는 파티션 UNION 에 매핑된 별칭 엔티티
+        """
+        source = self._partitions.range_source(connection, start, end, filters)
+        if source is VehicleLocation.__table__:
+            return VehicleLocation
+        return aliased(VehicleLocation, source, adapt_on_names=True)
+
+    def _insert_location(self, values: Dict[str, Any]) -> VehicleLocation:
+        """위치 레코드를 시간 파티션에 저장 (동기 세션)"""
+        now = datetime.datetime.utcnow()
+        values = {"created_at": now, "updated_at": now, **values}
+        values.setdefault("timestamp", now)
+        # 세션이 이미 트랜잭션을 자동 시작했을 수 있으므로 begin() 대신 직접 커밋
+        try:
+            location_id = self._partitions.insert(self.db.connection(), values)
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        return VehicleLocation(id=location_id, **values)
 
     @property
     def http_session(self) -> aiohttp.ClientSession:
@@ -113,30 +148,40 @@ class LocationService:
             else:
                 status = VehicleLocationStatus.STOPPED
 
-            # 데이터베이스에 위치 정보 저장
-            location = VehicleLocation(
-                id=str(uuid.uuid4()),
-                vehicle_id=location_data.vehicle_id,
-                latitude=location_data.latitude,
-                longitude=location_data.longitude,
-                speed=location_data.speed,
-                heading=location_data.heading,
-                status=status.value,
-                address=location_data.address,
-                timestamp=location_data.timestamp,
-            )
+            # 데이터베이스에 위치 정보 저장 (타임스탬프에 해당하는 파티션으로 라우팅)
+            values = {
+                "vehicle_id": location_data.vehicle_id,
+                "latitude": location_data.latitude,
+                "longitude": location_data.longitude,
+                "speed": location_data.speed,
+                "heading": location_data.heading,
+                "status": status.value,
+                "address": location_data.address,
+                "timestamp": location_data.timestamp,
+            }
+            values = {
+                key: value
+                for key, value in values.items()
+                if key in VehicleLocation.__table__.c
+            }
 
             # 세션 타입에 따른 처리
             if self._is_async_session:
                 # 비동기 세션
-                async with self.db.begin():
-                    self.db.add(location)
-                await self.db.refresh(location)
+                now = datetime.datetime.utcnow()
+                values = {"created_at": now, "updated_at": now, **values}
+                try:
+                    location_id = await self.db.run_sync(
+                        lambda session: self._partitions.insert(session.connection(), values)
+                    )
+                    await self.db.commit()
+                except Exception:
+                    await self.db.rollback()
+                    raise
+                location = VehicleLocation(id=location_id, **values)
             else:
                 # 동기 세션
-                with self.db.begin():
-                    self.db.add(location)
-                self.db.refresh(location)
+                location = self._insert_location(values)
 
             # 로깅
             logger.info(
@@ -159,14 +204,18 @@ class LocationService:
         Returns:
             최신 위치 정보
         """
-        try:
-            result = await self.db.execute(
-                select(VehicleLocation)
-                .filter(VehicleLocation.vehicle_id == vehicle_id)
-                .order_by(VehicleLocation.timestamp.desc())
+        def _query(session):
+            entity = self._location_entity(session.connection(), vehicle_id=vehicle_id)
+            result = session.execute(
+                select(entity)
+                .filter(entity.vehicle_id == vehicle_id)
+                .order_by(entity.timestamp.desc())
                 .limit(1)
             )
             return result.scalar_one_or_none()
+
+        try:
+            return await self.db.run_sync(_query)
         except Exception as e:
             logger.error(f"차량 위치 조회 실패: {str(e)}")
             raise DatabaseError(f"차량 위치를 조회할 수 없습니다: {str(e)}") from e
@@ -185,17 +234,24 @@ class LocationService:
         Returns:
             위치 이력 목록
         """
-        try:
-            result = await self.db.execute(
-                select(VehicleLocation)
+        def _query(session):
+            # 조회 범위에 걸치는 파티션만 대상으로 함
+            entity = self._location_entity(
+                session.connection(), start_date, end_date, vehicle_id=vehicle_id
+            )
+            result = session.execute(
+                select(entity)
                 .filter(
-                    VehicleLocation.vehicle_id == vehicle_id,
-                    VehicleLocation.timestamp >= start_date,
-                    VehicleLocation.timestamp <= end_date,
+                    entity.vehicle_id == vehicle_id,
+                    entity.timestamp >= start_date,
+                    entity.timestamp <= end_date,
                 )
-                .order_by(VehicleLocation.timestamp)
+                .order_by(entity.timestamp)
             )
             return result.scalars().all()
+
+        try:
+            return await self.db.run_sync(_query)
         except Exception as e:
             logger.error(f"차량 위치 이력 조회 실패: {str(e)}")
             raise DatabaseError(f"차량 위치 이력을 조회할 수 없습니다: {str(e)}") from e
@@ -207,30 +263,33 @@ class LocationService:
         Returns:
             차량 ID를 키로 하는 위치 정보 딕셔너리
         """
-        try:
+        def _query(session):
+            entity = self._location_entity(session.connection())
+
             # 서브쿼리: 각 차량의 가장 최근 위치 타임스탬프 조회
             subquery = (
                 select(
-                    VehicleLocation.vehicle_id,
-                    func.max(VehicleLocation.timestamp).label("max_timestamp"),
+                    entity.vehicle_id,
+                    func.max(entity.timestamp).label("max_timestamp"),
                 )
-                .group_by(VehicleLocation.vehicle_id)
+                .group_by(entity.vehicle_id)
                 .subquery()
             )
 
             # 메인 쿼리: 가장 최근 위치 정보 조회
             query = (
-                select(VehicleLocation)
+                select(entity)
                 .join(
                     subquery,
-                    (VehicleLocation.vehicle_id == subquery.c.vehicle_id)
-                    & (VehicleLocation.timestamp == subquery.c.max_timestamp),
+                    (entity.vehicle_id == subquery.c.vehicle_id)
+                    & (entity.timestamp == subquery.c.max_timestamp),
                 )
-                .order_by(VehicleLocation.vehicle_id)
+                .order_by(entity.vehicle_id)
             )
+            return session.execute(query).scalars().all()
 
-            result = await self.db.execute(query)
-            locations = result.scalars().all()
+        try:
+            locations = await self.db.run_sync(_query)
 
             # 결과를 딕셔너리로 변환
             return {location.vehicle_id: location for location in locations}
@@ -539,10 +598,7 @@ class LocationService:
             DatabaseError: 데이터베이스 오류 발생 시
         """
         try:
-            vehicle_location = VehicleLocation(**vehicle_location_data.dict())
-            self.db.add(vehicle_location)
-            self.db.commit()
-            self.db.refresh(vehicle_location)
+            vehicle_location = self._insert_location(vehicle_location_data.dict())
             return VehicleLocationRead.from_orm(vehicle_location)
         except SQLAlchemyError as e:
             self.db.rollback()
@@ -558,10 +614,11 @@ class LocationService:
         Returns:
             최신 위치 정보 또는 None
         """
+        entity = self._location_entity(self.db.connection(), vehicle_id=vehicle_id)
         vehicle_location = (
-            self.db.query(VehicleLocation)
-            .filter(VehicleLocation.vehicle_id == vehicle_id)
-            .order_by(desc(VehicleLocation.timestamp))
+            self.db.query(entity)
+            .filter(entity.vehicle_id == vehicle_id)
+            .order_by(desc(entity.timestamp))
             .first()
         )
         if vehicle_location:
@@ -574,23 +631,25 @@ class LocationService:
         Returns:
             차량별 최신 위치 정보 목록
         """
+        entity = self._location_entity(self.db.connection())
+
         # 서브쿼리로 각 차량의 최신 타임스탬프 구하기
         latest_timestamps = (
             self.db.query(
-                VehicleLocation.vehicle_id,
-                func.max(VehicleLocation.timestamp).label("max_timestamp")
+                entity.vehicle_id,
+                func.max(entity.timestamp).label("max_timestamp")
             )
-            .group_by(VehicleLocation.vehicle_id)
+            .group_by(entity.vehicle_id)
             .subquery()
         )
         
         # 최신 타임스탬프와 일치하는 위치 정보 조회
         latest_locations = (
-            self.db.query(VehicleLocation)
+            self.db.query(entity)
             .join(
                 latest_timestamps,
-                (VehicleLocation.vehicle_id == latest_timestamps.c.vehicle_id) &
-                (VehicleLocation.timestamp == latest_timestamps.c.max_timestamp)
+                (entity.vehicle_id == latest_timestamps.c.vehicle_id) &
+                (entity.timestamp == latest_timestamps.c.max_timestamp)
             )
             .all()
         )
@@ -620,14 +679,18 @@ class LocationService:
         if not end_time:
             end_time = datetime.utcnow()
             
+        # 조회 범위에 걸치는 파티션만 대상으로 함
+        entity = self._location_entity(
+            self.db.connection(), start_time, end_time, vehicle_id=vehicle_id
+        )
         locations = (
-            self.db.query(VehicleLocation)
+            self.db.query(entity)
             .filter(
-                VehicleLocation.vehicle_id == vehicle_id,
-                VehicleLocation.timestamp >= start_time,
-                VehicleLocation.timestamp <= end_time
+                entity.vehicle_id == vehicle_id,
+                entity.timestamp >= start_time,
+                entity.timestamp <= end_time
             )
-            .order_by(desc(VehicleLocation.timestamp))
+            .order_by(desc(entity.timestamp))
             .limit(limit)
             .all()
         )
@@ -637,6 +700,9 @@ class LocationService:
     def delete_old_vehicle_locations(self, days: int = 30) -> int:
         """오래된 차량 위치 데이터 삭제
         
+        보관 기간이 지난 시간 파티션을 통째로 삭제합니다. 기준 시각이 걸쳐 있는
+        파티션은 파티션 전체가 만료될 때까지 유지됩니다.
+        
         Args:
             days: 보관 기간 (일)
             
@@ -647,12 +713,8 @@ class LocationService:
             DatabaseError: 데이터베이스 오류 발생 시
         """
         try:
-            cutoff_date = datetime.utcnow() - datetime.timedelta(days=days)
-            deleted_count = (
-                self.db.query(VehicleLocation)
-                .filter(VehicleLocation.timestamp < cutoff_date)
-                .delete()
-            )
+            cutoff_date = datetime.datetime.utcnow() - datetime.timedelta(days=days)
+            deleted_count = self._partitions.drop_before(self.db.connection(), cutoff_date)
             self.db.commit()
             return deleted_count
         except SQLAlchemyError as e:
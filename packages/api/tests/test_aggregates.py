@@ -0,0 +1,115 @@
+"""
+집계 통계 유틸리티(aggregates)에 대한 테스트 모듈
+
+SQLite 세션으로 여러 분포 컬럼과 조건부 건수 집계, 통계 캐시가 쓰기 커밋 후에만
+무효화되고 롤백되면 유지되는지 확인합니다.
+"""
+
+import importlib.util
+import os
+import sys
+import unittest
+
+from sqlalchemy import Column, Integer, String, create_engine
+from sqlalchemy.orm import Session, declarative_base
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "src")
+
+Base = declarative_base()
+
+
+class Job(Base):
+    """집계 대상 테이블"""
+
+    __tablename__ = "jobs"
+
+    id = Column(Integer, primary_key=True)
+    status = Column(String(20), nullable=False)
+    type = Column(String(20), nullable=False)
+    cost = Column(Integer, nullable=False, default=0)
+
+
+def load(path, alias):
+    """src 아래 모듈을 파일에서 로드해 다른 모듈이 import 하는 이름으로 등록 (한 번만)"""
+    if alias in sys.modules:
+        return sys.modules[alias]
+    spec = importlib.util.spec_from_file_location(alias, os.path.join(SRC_DIR, path))
+    loaded = importlib.util.module_from_spec(spec)
+    sys.modules[alias] = loaded
+    spec.loader.exec_module(loaded)
+    return loaded
+
+
+aggregates = load("core/aggregates.py", "packagescore.aggregates")
+
+
+class TestAggregates(unittest.TestCase):
+    """aggregate_statistics 와 StatsCache 테스트"""
+
+    def setUp(self):
+        """테스트 셋업"""
+        self.engine = create_engine("sqlite://")
+        Base.metadata.create_all(self.engine)
+        self.db = Session(self.engine)
+        self.db.add_all(
+            [
+                Job(status="open", type="oil", cost=10),
+                Job(status="open", type="tire", cost=200),
+                Job(status="open", type="tire", cost=300),
+                Job(status="done", type="oil", cost=50),
+            ]
+        )
+        self.db.commit()
+
+    def tearDown(self):
+        """테스트 정리"""
+        self.db.close()
+        self.engine.dispose()
+
+    def test_distributions_and_conditions(self):
+        """분포끼리 섞이지 않고 조건부 건수가 전체 기준으로 집계되는지 테스트"""
+        stats = aggregates.aggregate_statistics(
+            self.db,
+            Job,
+            group_by={"by_status": Job.status, "by_type": Job.type},
+            conditions={"expensive": Job.cost >= 100},
+        )
+        self.assertEqual(stats["total_count"], 4)
+        self.assertEqual(stats["by_status"], {"open": 3, "done": 1})
+        self.assertEqual(stats["by_type"], {"oil": 2, "tire": 2})
+        self.assertEqual(stats["expensive"], 2)
+
+        filtered = aggregates.aggregate_statistics(
+            self.db,
+            Job,
+            group_by={"by_type": Job.type},
+            filters=[Job.status == "open"],
+        )
+        self.assertEqual(filtered["total_count"], 3)
+        self.assertEqual(filtered["by_type"], {"oil": 1, "tire": 2})
+
+    def test_cache_invalidated_after_commit_only(self):
+        """flush 로는 무효화하지 않고 커밋 후 무효화, 롤백되면 유지되는지 테스트"""
+        cache = aggregates.StatsCache(ttl=60)
+        cache.watch(Job, "jobs")
+
+        def count():
+            return cache.get_or_compute("jobs", "count", self.db.query(Job).count)
+
+        self.assertEqual(count(), 4)
+        self.db.add(Job(status="open", type="oil"))
+        self.db.flush()
+        self.assertEqual(cache.get("jobs", "count"), 4)
+        self.db.rollback()
+        self.assertEqual(count(), 4)
+
+        self.db.add(Job(status="open", type="oil"))
+        self.db.flush()
+        self.assertEqual(cache.get("jobs", "count"), 4)
+        self.db.commit()
+        self.assertIsNone(cache.get("jobs", "count"))
+        self.assertEqual(count(), 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,128 @@
+"""
+집합 기반 아카이버(archiver)에 대한 테스트 모듈
+
+SQLite 세션으로 배치 이동과 체크포인트, 중단 후 재개 시 체크포인트 키보다 작은
+키의 행이 새로 대상이 되어도 빠지지 않는지 확인합니다.
+"""
+
+import importlib.util
+import os
+import sys
+import unittest
+
+from sqlalchemy import Column, DateTime, Integer, String, create_engine, select
+from sqlalchemy.orm import Session, declarative_base
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "src")
+
+Base = declarative_base()
+
+
+class Record(Base):
+    """원본 테이블"""
+
+    __tablename__ = "records"
+
+    id = Column(String(36), primary_key=True)
+    status = Column(String(20), nullable=False)
+
+
+class ArchivedRecord(Base):
+    """아카이브 테이블"""
+
+    __tablename__ = "records_archive"
+
+    id = Column(String(36), primary_key=True)
+    record_id = Column(String(36), nullable=False)
+    status = Column(String(20), nullable=False)
+
+
+class ArchiveCheckpoint(Base):
+    """아카이브 체크포인트 (database.models.ArchiveCheckpoint 와 같은 컬럼)"""
+
+    __tablename__ = "archive_checkpoints"
+
+    job_name = Column(String(100), primary_key=True)
+    last_key = Column(String(100))
+    processed_count = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime)
+
+
+def load(path, alias):
+    """src 아래 모듈을 파일에서 로드해 다른 모듈이 import 하는 이름으로 등록 (한 번만)"""
+    if alias in sys.modules:
+        return sys.modules[alias]
+    spec = importlib.util.spec_from_file_location(alias, os.path.join(SRC_DIR, path))
+    loaded = importlib.util.module_from_spec(spec)
+    sys.modules[alias] = loaded
+    spec.loader.exec_module(loaded)
+    return loaded
+
+
+archiver_module = load("core/archiver.py", "packagescore.archiver")
+
+
+class TestSetBasedArchiver(unittest.TestCase):
+    """SetBasedArchiver 테스트"""
+
+    def setUp(self):
+        """테스트 셋업 (키 순서와 무관하게 일부만 아카이브 대상)"""
+        self.engine = create_engine("sqlite://")
+        Base.metadata.create_all(self.engine)
+        self.db = Session(self.engine)
+        self.db.add_all(
+            [
+                Record(id=f"k{i}", status="done" if i % 2 else "open")
+                for i in range(1, 9)
+            ]
+        )
+        self.db.commit()
+        self.moved_batches = []
+        columns = Record.__table__.c
+        self.archiver = archiver_module.SetBasedArchiver(
+            Record,
+            ArchivedRecord,
+            {"id": columns.id, "record_id": columns.id, "status": columns.status},
+            key_column=columns.id,
+            archive_key="record_id",
+            checkpoints=archiver_module.ArchiveCheckpointStore(ArchiveCheckpoint),
+            after_move=lambda db, keys: self.moved_batches.append(
+                sorted(db.execute(keys).scalars())
+            ),
+        )
+        self.condition = Record.status == "done"
+
+    def tearDown(self):
+        """테스트 정리"""
+        self.db.close()
+        self.engine.dispose()
+
+    def _archived(self):
+        return sorted(self.db.execute(select(ArchivedRecord.record_id)).scalars())
+
+    def test_resume_picks_up_rows_behind_checkpoint(self):
+        """재개 시 체크포인트 키보다 작은 키의 새 대상 행도 아카이브하는지 테스트"""
+        moved = self.archiver.run(
+            self.db, self.condition, job_name="job", batch_size=2, max_batches=1
+        )
+        self.assertEqual(moved, 2)
+        self.assertEqual(self._archived(), ["k1", "k3"])
+        checkpoint = self.db.get(ArchiveCheckpoint, "job")
+        self.assertEqual((checkpoint.last_key, checkpoint.processed_count), ("k3", 2))
+
+        # 체크포인트 이후 키가 더 작은 행이 아카이브 대상이 됨
+        self.db.get(Record, "k2").status = "done"
+        self.db.commit()
+
+        moved = self.archiver.run(self.db, self.condition, job_name="job", batch_size=2)
+        self.assertEqual(moved, 3)
+        self.assertEqual(self._archived(), ["k1", "k2", "k3", "k5", "k7"])
+        self.assertEqual(
+            sorted(self.db.execute(select(Record.id)).scalars()), ["k4", "k6", "k8"]
+        )
+        self.assertIsNone(self.db.get(ArchiveCheckpoint, "job"))
+        self.assertIn("k2", self.moved_batches[1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,263 @@
+"""
+스트리밍 백업(backup_service, streaming, index)에 대한 테스트 모듈
+
+청크 분할 기록/읽기와 체크섬·행 수 검증, 실패한 백업 정리, 백업 ID 형식 검사,
+요청 본문 백업 복원과 SQLite 테이블 증분 백업/체인 복원을 확인합니다.
+"""
+
+import importlib.util
+import json
+import os
+import shutil
+import sys
+import tempfile
+import types
+import unittest
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, Integer, String, create_engine
+from sqlalchemy.orm import declarative_base
+
+# 앱 설정(환경 변수/DB) 없이 백업 서비스와 필요한 모듈만 로드
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "src")
+sys.modules.setdefault(
+    "src.config.settings",
+    types.SimpleNamespace(settings=types.SimpleNamespace(DATA_DIR=tempfile.mkdtemp())),
+)
+
+Base = declarative_base()
+
+
+class Vehicle(Base):
+    """증분 백업 대상 테이블"""
+
+    __tablename__ = "vehicles"
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String(50), nullable=False)
+    updated_at = Column(DateTime, nullable=False)
+
+
+def load(path, alias):
+    """src 아래 모듈을 파일에서 로드해 다른 모듈이 import 하는 이름으로 등록 (한 번만)"""
+    if alias in sys.modules:
+        return sys.modules[alias]
+    spec = importlib.util.spec_from_file_location(alias, os.path.join(SRC_DIR, path))
+    loaded = importlib.util.module_from_spec(spec)
+    sys.modules[alias] = loaded
+    spec.loader.exec_module(loaded)
+    return loaded
+
+
+load("schemas/backup/backup_schemas.py", "src.schemas.backup.backup_schemas")
+load("services/backup_service/index.py", "src.services.backup_service.index")
+streaming = load(
+    "services/backup_service/streaming.py", "src.services.backup_service.streaming"
+)
+backup_service = load(
+    "services/backup_service/backup_service.py",
+    "src.services.backup_service.backup_service",
+)
+
+
+class TestStreamingFormat(unittest.TestCase):
+    """청크 기록/읽기와 무결성 검증 테스트"""
+
+    def setUp(self):
+        """테스트 셋업 (3행씩 gzip 청크)"""
+        self.root = tempfile.mkdtemp()
+        writer = streaming.StreamBackupWriter(
+            self.root, "backup", codec="gzip", chunk_rows=3
+        )
+        writer.write_table(
+            "items",
+            ({"id": i, "updated_at": datetime(2024, 1, i + 1)} for i in range(7)),
+            watermark_column="updated_at",
+        )
+        self.manifest = writer.commit({"id": "backup"})
+        self.path = os.path.join(self.root, "backup")
+
+    def tearDown(self):
+        """테스트 정리"""
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def test_round_trip_in_chunks(self):
+        """청크 분할, 워터마크 기록, 배치 단위 읽기 테스트"""
+        table = self.manifest["tables"]["items"]
+        self.assertEqual([chunk["rows"] for chunk in table["chunks"]], [3, 3, 1])
+        self.assertEqual(table["watermark"], "2024-01-07T00:00:00")
+        self.assertEqual(self.manifest["rows"], 7)
+        self.assertFalse(os.path.exists(os.path.join(self.root, ".backup.partial")))
+
+        batches = list(streaming.iter_row_batches(self.path, self.manifest, 5))
+        self.assertEqual([len(batch) for _, batch in batches], [5, 2])
+        self.assertEqual(batches[1][1][-1]["id"], 6)
+
+    def test_corrupted_chunk_is_rejected(self):
+        """청크 내용이 바뀌면 읽기 전에 체크섬 오류를 내는지 테스트"""
+        chunk = os.path.join(
+            self.path, self.manifest["tables"]["items"]["chunks"][1]["file"]
+        )
+        with open(chunk, "r+b") as f:
+            f.seek(12)
+            byte = f.read(1)
+            f.seek(12)
+            f.write(bytes([byte[0] ^ 0xFF]))
+        rows = streaming.iter_table_rows(self.path, self.manifest, "items")
+        with self.assertRaises(streaming.BackupIntegrityError):
+            list(rows)
+
+    def test_row_count_mismatch_is_rejected(self):
+        """청크 행 수가 매니페스트와 다르면 오류를 내는지 테스트"""
+        self.manifest["tables"]["items"]["chunks"][0]["rows"] = 4
+        with self.assertRaises(streaming.BackupIntegrityError):
+            list(streaming.iter_table_rows(self.path, self.manifest, "items"))
+
+    def test_failed_table_leaves_no_backup(self):
+        """행 생성 중 실패하면 abort 로 임시 디렉토리가 지워지는지 테스트"""
+
+        def rows():
+            yield {"id": 1}
+            raise RuntimeError("source failed")
+
+        writer = streaming.StreamBackupWriter(self.root, "broken", codec="gzip")
+        with self.assertRaises(RuntimeError):
+            writer.write_table("items", rows())
+        writer.abort()
+        self.assertEqual(sorted(os.listdir(self.root)), ["backup"])
+
+
+class TestBackupService(unittest.TestCase):
+    """BackupService 테스트"""
+
+    def setUp(self):
+        """테스트 셋업 (테스트마다 새 데이터 디렉토리)"""
+        self.data_dir = tempfile.mkdtemp()
+        backup_service.settings.DATA_DIR = self.data_dir
+        self.service = backup_service.BackupService(chunk_rows=2)
+
+    def tearDown(self):
+        """테스트 정리"""
+        shutil.rmtree(self.data_dir, ignore_errors=True)
+
+    def test_invalid_backup_ids_are_rejected(self):
+        """UUID 가 아닌 백업 ID 는 파일 경로에 쓰기 전에 거부하는지 테스트"""
+        for backup_id in ("..", "../backups", "abc", "", None):
+            with self.assertRaises(ValueError):
+                self.service.get_backup(backup_id)
+            with self.assertRaises(ValueError):
+                self.service.delete_backup(backup_id)
+            with self.assertRaises(ValueError):
+                list(self.service.iter_backup_rows(backup_id, "items"))
+        with self.assertRaises(RuntimeError):
+            self.service.restore_backup("..", apply_batch=lambda table, rows: None)
+        self.assertTrue(os.path.isdir(self.service.backup_dir))
+
+    def test_document_backup_round_trip(self):
+        """요청 본문 백업이 원래 형태로 조회되고 삭제 후 찾을 수 없는지 테스트"""
+        data = {
+            "items": [{"id": 1}, {"id": 2}, {"id": 3}],
+            "tags": ["a", "b"],
+            "version": 3,
+        }
+        created = self.service.create_backup(
+            backup_service.BackupCreate(type="maintenance", data=data)
+        )
+        self.assertEqual(self.service.get_backup(created.backup_id).data, data)
+        self.assertEqual(self.service.list_backups().count, 1)
+
+        self.assertTrue(self.service.delete_backup(created.backup_id).deleted)
+        with self.assertRaises(ValueError):
+            self.service.get_backup(created.backup_id)
+        self.assertEqual(self.service.list_backups().count, 0)
+
+    def test_failed_backup_is_not_registered(self):
+        """기록 중 실패한 백업은 디렉토리와 인덱스에 남지 않는지 테스트"""
+
+        def rows():
+            yield {"id": 1}
+            raise RuntimeError("source failed")
+
+        with self.assertRaises(RuntimeError):
+            self.service.create_stream_backup("vehicle", [("items", rows(), {})])
+        leftovers = [
+            name
+            for name in os.listdir(self.service.backup_dir)
+            if not name.startswith(backup_service.INDEX_FILENAME)
+        ]
+        self.assertEqual(leftovers, [])
+        self.assertEqual(self.service.list_backups().count, 0)
+
+    def test_incremental_backup_and_chain_restore(self):
+        """워터마크 이후(같은 값 포함) 행만 증분 백업하고 기준 백업부터 복원하는지 테스트"""
+        engine = create_engine("sqlite://")
+        Base.metadata.create_all(engine)
+        with engine.begin() as conn:
+            conn.execute(
+                Vehicle.__table__.insert(),
+                [
+                    {"id": i, "name": f"v{i}", "updated_at": datetime(2024, 1, i)}
+                    for i in range(1, 4)
+                ],
+            )
+            full = self.service.create_incremental_backup("vehicle", conn, ["vehicles"])
+            conn.execute(
+                Vehicle.__table__.update()
+                .where(Vehicle.id == 2)
+                .values(name="v2-new", updated_at=datetime(2024, 2, 1))
+            )
+            incremental = self.service.create_incremental_backup(
+                "vehicle", conn, ["vehicles"]
+            )
+        engine.dispose()
+
+        rows = list(self.service.iter_backup_rows(incremental.backup_id, "vehicles"))
+        self.assertEqual([row["name"] for row in rows], ["v3", "v2-new"])
+        self.assertEqual(
+            self.service.index.get(incremental.backup_id)["parent_id"], full.backup_id
+        )
+
+        applied = []
+        restored = self.service.restore_backup(
+            incremental.backup_id,
+            apply_batch=lambda table, batch: applied.extend(
+                row["name"] for row in batch
+            ),
+        )
+        self.assertEqual(restored.data["restored_rows"], {"vehicles": 5})
+        self.assertEqual(applied, ["v1", "v2", "v3", "v3", "v2-new"])
+
+        # 유지하는 증분 백업의 기준 백업은 정리하지 않음
+        self.assertEqual(self.service.cleanup_old_backups(keep_count=1).deleted_count, 0)
+
+        # 기준 백업이 사라진 증분 백업은 복원할 수 없음
+        self.service.index.remove(full.backup_id)
+        with self.assertRaises(RuntimeError):
+            self.service.restore_backup(
+                incremental.backup_id, apply_batch=lambda table, batch: None
+            )
+
+    def test_existing_backups_are_indexed(self):
+        """인덱스가 비어 있으면 기존 JSON/스트리밍 백업을 등록하는지 테스트"""
+        created = self.service.create_backup(
+            backup_service.BackupCreate(type="vehicle", data={"items": [{"id": 1}]})
+        )
+        legacy = {
+            "id": "legacy",
+            "type": "vehicle",
+            "created_at": "2024-01-01",
+            "filename": "legacy.json",
+        }
+        with open(os.path.join(self.service.backup_dir, "legacy.json"), "w") as f:
+            json.dump({"meta": legacy, "data": {}}, f)
+        with open(os.path.join(self.service.backup_dir, "broken.json"), "w") as f:
+            f.write("{not json")
+        os.remove(os.path.join(self.service.backup_dir, "backup_index.db"))
+
+        service = backup_service.BackupService()
+        ids = {meta["id"] for meta in service.list_backups().backups}
+        self.assertEqual(ids, {created.backup_id, "legacy"})
+
+
+if __name__ == "__main__":
+    unittest.main()
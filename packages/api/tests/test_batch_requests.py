@@ -0,0 +1,180 @@
+"""
+배치 요청 처리(batch_requests, BatchRequestMiddleware)에 대한 테스트 모듈
+
+압축 미들웨어를 거치는 작은 Starlette 앱으로 하위 요청 헤더 처리, 압축된 하위
+응답 인코딩, 배치 경로 일치, 의존 항목 치환/실패를 확인합니다.
+"""
+
+import base64
+import gzip
+import importlib.util
+import json
+import os
+import sys
+import tempfile
+import types
+import unittest
+
+from starlette.applications import Starlette
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+# 앱 설정(환경 변수/DB) 없이 미들웨어 모듈만 로드
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "src")
+os.environ.setdefault("LOG_DIR", tempfile.mkdtemp())
+sys.modules.setdefault(
+    "packages.api.src.coreconfig",
+    types.SimpleNamespace(settings=types.SimpleNamespace()),
+)
+for name, attrs in {
+    "packages.api.src.corelogger": {"logger": None},
+    "packages.api.src.coremonitoring.middleware": {"MonitoringMiddleware": object},
+    "packages.api.src.corerate_limiter": {"RateLimiter": object},
+    "packages.api.src.coresecurity": {
+        "SecurityService": object,
+        "get_security_service": lambda: None,
+    },
+}.items():
+    # 배치/압축과 관계없는 미들웨어 의존 모듈 대체
+    sys.modules.setdefault(name, types.SimpleNamespace(**attrs))
+
+
+def load(module, *aliases):
+    """core 모듈을 파일에서 로드해 다른 모듈이 import 하는 이름으로 등록 (한 번만)"""
+    if aliases and aliases[0] in sys.modules:
+        return sys.modules[aliases[0]]
+    spec = importlib.util.spec_from_file_location(
+        module, os.path.join(SRC_DIR, "core", f"{module}.py")
+    )
+    loaded = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(loaded)
+    for alias in aliases:
+        sys.modules.setdefault(alias, loaded)
+    return loaded
+
+
+batch_requests = load("batch_requests", "packages.api.src.corebatch_requests")
+load("compression", "packages.api.src.corecompression")
+load("executor_pools", "packages.api.src.coreexecutor_pools")
+middleware = load("middleware", "packages.api.src.coremiddleware")
+
+PAYLOAD = {"items": [{"id": i, "name": f"item-{i}"} for i in range(200)]}
+
+
+async def list_items(request):
+    return JSONResponse(PAYLOAD)
+
+
+async def get_item(request):
+    return JSONResponse({"id": int(request.path_params["item_id"])})
+
+
+async def vehicles_batch(request):
+    return JSONResponse({"created": len(await request.json())}, status_code=201)
+
+
+async def precompressed(request):
+    """이미 압축된 본문을 보내는 라우트"""
+    response = JSONResponse({"ok": True})
+    response.body = gzip.compress(response.body)
+    response.headers["content-encoding"] = "gzip"
+    response.headers["content-length"] = str(len(response.body))
+    return response
+
+
+def make_client():
+    """배치 미들웨어 → 압축 미들웨어 → 라우트 순서의 앱 클라이언트"""
+    app = Starlette(
+        routes=[
+            Route("/items", list_items),
+            Route("/items/{item_id}", get_item),
+            Route("/vehicles/batch", vehicles_batch, methods=["POST"]),
+            Route("/precompressed", precompressed),
+        ]
+    )
+    wrapped = middleware.BatchRequestMiddleware(
+        middleware.CompressionMiddleware(app, minimum_size=100),
+        paths=["/batch", "/api/v1/batch"],
+    )
+    return TestClient(wrapped)
+
+
+class TestBatchRequests(unittest.TestCase):
+    """배치 요청 처리 테스트"""
+
+    def setUp(self):
+        """테스트 셋업"""
+        self.client = make_client()
+
+    def _batch(self, items, path="/batch"):
+        response = self.client.post(path, json=items)
+        self.assertEqual(response.status_code, 200)
+        return json.loads(response.content)
+
+    def test_item_accept_encoding_is_not_forwarded(self):
+        """항목 헤더의 accept-encoding 때문에 배치 응답이 깨지지 않는지 테스트"""
+        results = self._batch(
+            [{"method": "GET", "path": "/items", "headers": {"accept-encoding": "gzip"}}]
+        )
+        self.assertEqual(results[0]["status"], 200)
+        self.assertNotIn("content-encoding", results[0]["headers"])
+        self.assertEqual(results[0]["body"], PAYLOAD)
+
+    def test_encoded_sub_response_is_base64(self):
+        """content-encoding 이 있는 하위 응답 본문을 base64 로 담는지 테스트"""
+        result = self._batch([{"method": "GET", "path": "/precompressed"}])[0]
+        self.assertEqual(result["body_encoding"], "base64")
+        self.assertEqual(
+            json.loads(gzip.decompress(base64.b64decode(result["body"]))), {"ok": True}
+        )
+
+    def test_only_exact_batch_path_is_intercepted(self):
+        """'/vehicles/batch' 는 가로채지 않고 하위 요청으로도 허용되는지 테스트"""
+        response = self.client.post("/vehicles/batch", json=[{"plate": "12가3456"}])
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.json(), {"created": 1})
+
+        results = self._batch(
+            [
+                {"method": "POST", "path": "/vehicles/batch", "body": [{}, {}]},
+                {"method": "POST", "path": "/api/v1/batch/", "body": []},
+            ],
+            path="/api/v1/batch",
+        )
+        self.assertEqual(results[0]["status"], 201)
+        self.assertEqual(results[0]["body"], {"created": 2})
+        self.assertEqual(results[1]["status"], 400)
+
+    def test_references_and_failed_dependency(self):
+        """의존 항목 응답 값 치환과 의존 항목 실패 시 424 를 테스트"""
+        results = self._batch(
+            [
+                {"id": "a", "method": "GET", "path": "/items/7"},
+                {"id": "b", "method": "GET", "path": "/items/${a.body.id}"},
+                {"id": "c", "method": "GET", "path": "/missing"},
+                {"id": "d", "method": "GET", "path": "/items/1", "depends_on": ["c"]},
+            ]
+        )
+        self.assertEqual(results[1]["body"], {"id": 7})
+        self.assertEqual(results[2]["status"], 404)
+        self.assertEqual(results[3]["status"], 424)
+
+    def test_invalid_batches(self):
+        """잘못된 본문/순환 의존 처리 테스트"""
+        response = self.client.post("/batch", json={"not": "a list"})
+        self.assertEqual(response.status_code, 400)
+
+        items = batch_requests.parse_batch(
+            [
+                {"id": "a", "method": "GET", "path": "/items/1", "depends_on": "b"},
+                {"id": "b", "method": "GET", "path": "/items/2", "depends_on": "a"},
+                {"method": "TRACE", "path": "/items"},
+            ]
+        )
+        self.assertEqual([item.error for item in items[:2]], ["순환 의존이 있습니다"] * 2)
+        self.assertIn("TRACE", items[2].error)
+
+
+if __name__ == "__main__":
+    unittest.main()
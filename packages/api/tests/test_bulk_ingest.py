@@ -0,0 +1,155 @@
+"""
+대량 적재(bulk_ingest)에 대한 테스트 모듈
+
+SQLite 세션으로 숫자 변환 오류(오버플로/무한대), DB 오류 행 격리, atomic 롤백,
+NDJSON 해석 오류 행 보고와 세션별 라우팅 적재를 확인합니다.
+"""
+
+import importlib.util
+import io
+import os
+import sys
+import unittest
+
+from sqlalchemy import (CheckConstraint, Column, Float, Integer, String,
+                        create_engine, event)
+from sqlalchemy.orm import Session, declarative_base
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "src")
+
+Base = declarative_base()
+
+
+class Reading(Base):
+    """적재 대상 테이블 (DB 제약으로 기록 오류를 만들 수 있는 컬럼 포함)"""
+
+    __tablename__ = "readings"
+    __table_args__ = (CheckConstraint("count < 1000", name="ck_count"),)
+
+    id = Column(String(36), primary_key=True)
+    name = Column(String(10), nullable=False)
+    count = Column(Integer)
+    value = Column(Float)
+
+
+def load(path, alias):
+    """src 아래 모듈을 파일에서 로드해 다른 모듈이 import 하는 이름으로 등록 (한 번만)"""
+    if alias in sys.modules:
+        return sys.modules[alias]
+    spec = importlib.util.spec_from_file_location(alias, os.path.join(SRC_DIR, path))
+    loaded = importlib.util.module_from_spec(spec)
+    sys.modules[alias] = loaded
+    spec.loader.exec_module(loaded)
+    return loaded
+
+
+bulk_ingest = load("core/bulk_ingest.py", "packagescore.bulk_ingest")
+
+
+def sqlite_engine():
+    """SAVEPOINT 가 바깥 트랜잭션 안에서 동작하도록 BEGIN 을 직접 보내는 SQLite 엔진"""
+    engine = create_engine("sqlite://")
+
+    @event.listens_for(engine, "connect")
+    def disable_pysqlite_transactions(connection, record):
+        connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def begin(connection):
+        connection.exec_driver_sql("BEGIN")
+
+    Base.metadata.create_all(engine)
+    return engine
+
+
+class TestBulkIngest(unittest.TestCase):
+    """BulkIngestor 오류 처리 테스트"""
+
+    def setUp(self):
+        """테스트 셋업"""
+        self.engine = sqlite_engine()
+        self.db = Session(self.engine)
+        self.ingestor = bulk_ingest.BulkIngestor(Reading)
+
+    def tearDown(self):
+        """테스트 정리"""
+        self.db.close()
+        self.engine.dispose()
+
+    def _names(self, db=None):
+        db = db or self.db
+        return sorted(row.name for row in db.query(Reading))
+
+    def test_non_finite_numbers_are_row_errors(self):
+        """'1e400'/'nan'/'inf' 가 예외 없이 해당 행의 형식 오류로 보고되는지 테스트"""
+        report = self.ingestor.ingest(
+            self.db,
+            [
+                {"name": "ok", "count": "3", "value": "1.5"},
+                {"name": "big", "count": "1e400"},
+                {"name": "nan", "value": "nan"},
+                {"name": "inf", "count": float("inf")},
+                {"name": "frac", "count": "1.5"},
+            ],
+        )
+        self.assertEqual((report.inserted, report.failed), (1, 4))
+        self.assertEqual([error.row_number for error in report.errors], [2, 3, 4, 5])
+        self.assertIn("유한한 숫자가 아닙니다", report.errors[0].errors[0])
+        self.assertEqual(self._names(), ["ok"])
+
+    def test_database_error_isolates_row(self):
+        """DB 제약 위반 행만 실패로 보고하고 나머지 행은 적재하는지 테스트"""
+        records = [{"name": f"row-{i}", "count": i} for i in range(6)]
+        records[4]["count"] = 5000
+        report = self.ingestor.ingest(self.db, records, batch_size=3)
+        self.assertEqual((report.inserted, report.failed), (5, 1))
+        self.assertEqual(report.errors[0].row_number, 5)
+        self.assertEqual(len(self._names()), 5)
+
+    def test_atomic_rolls_back_everything(self):
+        """atomic 적재에서 오류가 있으면 아무것도 적재하지 않는지 테스트"""
+        records = [{"name": "first"}, {"name": "too-long-name"}, {"name": "third"}]
+        with self.assertRaises(bulk_ingest.BulkIngestError) as caught:
+            self.ingestor.ingest(self.db, records, batch_size=1, atomic=True)
+        self.assertEqual(caught.exception.report.inserted, 0)
+        self.assertEqual(caught.exception.report.errors[0].row_number, 2)
+        self.assertEqual(self._names(), [])
+
+    def test_malformed_ndjson_lines(self):
+        """해석할 수 없는 NDJSON 줄과 객체가 아닌 줄을 행 번호와 함께 보고하는지 테스트"""
+        source = io.StringIO('{"name": "a"}\n{"name": \n[1, 2]\n\n{"name": "b"}\n')
+        report = self.ingestor.ingest(
+            self.db, bulk_ingest.iter_records(source, "ndjson")
+        )
+        self.assertEqual((report.total, report.inserted, report.failed), (4, 2, 2))
+        self.assertEqual([error.row_number for error in report.errors], [2, 3])
+        with self.assertRaises(ValueError):
+            bulk_ingest.iter_records(source, "xml")
+
+    def test_routed_ingest_writes_each_row_to_its_session(self):
+        """행마다 고른 세션에 적재하고 오류를 입력 순서로 보고하는지 테스트"""
+        other_engine = sqlite_engine()
+        other = Session(other_engine)
+        try:
+            report = self.ingestor.ingest_routed(
+                {"a": self.db, "b": other},
+                lambda record: "a" if record["name"].startswith("a") else "b",
+                [
+                    {"name": "a1"},
+                    {"name": "b1", "count": "1e400"},
+                    {"name": "b2"},
+                    {"name": "a2", "count": 5000},
+                ],
+                batch_size=1,
+            )
+            self.assertEqual((report.inserted, report.failed), (2, 2))
+            self.assertEqual([error.row_number for error in report.errors], [2, 4])
+            self.assertEqual(self._names(), ["a1"])
+            self.assertEqual(self._names(other), ["b2"])
+        finally:
+            other.close()
+            other_engine.dispose()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,220 @@
+"""
+응답 압축(compression, CompressionMiddleware)에 대한 테스트 모듈
+
+코덱 협상과 크기별 레벨 선택, 증분 압축기의 flush/finish 블록 복원과 압축
+미들웨어의 일반/스트리밍/작은 응답 처리를 확인합니다.
+"""
+
+import gzip
+import importlib.util
+import os
+import sys
+import tempfile
+import types
+import unittest
+import zlib
+
+from starlette.applications import Starlette
+from starlette.responses import JSONResponse, PlainTextResponse, StreamingResponse
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+# 앱 설정(환경 변수/DB) 없이 압축 모듈과 미들웨어만 로드
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "src")
+os.environ.setdefault("LOG_DIR", tempfile.mkdtemp())
+sys.modules.setdefault(
+    "packages.api.src.coreconfig",
+    types.SimpleNamespace(settings=types.SimpleNamespace()),
+)
+for name, attrs in {
+    "packages.api.src.corelogger": {"logger": None},
+    "packages.api.src.coremonitoring.middleware": {"MonitoringMiddleware": object},
+    "packages.api.src.corerate_limiter": {"RateLimiter": object},
+    "packages.api.src.coresecurity": {
+        "SecurityService": object,
+        "get_security_service": lambda: None,
+    },
+}.items():
+    # 압축과 관계없는 미들웨어 의존 모듈 대체
+    sys.modules.setdefault(name, types.SimpleNamespace(**attrs))
+
+
+def load(module, *aliases):
+    """core 모듈을 파일에서 로드해 다른 모듈이 import 하는 이름으로 등록 (한 번만)"""
+    if aliases and aliases[0] in sys.modules:
+        return sys.modules[aliases[0]]
+    spec = importlib.util.spec_from_file_location(
+        module, os.path.join(SRC_DIR, "core", f"{module}.py")
+    )
+    loaded = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(loaded)
+    for alias in aliases:
+        sys.modules.setdefault(alias, loaded)
+    return loaded
+
+
+load("batch_requests", "packages.api.src.corebatch_requests")
+compression = load("compression", "packages.api.src.corecompression")
+load("executor_pools", "packages.api.src.coreexecutor_pools")
+middleware = load("middleware", "packages.api.src.coremiddleware")
+
+PAYLOAD = {"items": [{"id": i, "name": f"item-{i}"} for i in range(500)]}
+LINES = [f'{{"id": {i}, "name": "row-{i}"}}\n' for i in range(2000)]
+
+
+async def large_json(request):
+    return JSONResponse(PAYLOAD)
+
+
+async def small_text(request):
+    return PlainTextResponse("ok")
+
+
+async def stream(request):
+    async def rows():
+        for line in LINES:
+            yield line.encode()
+
+    return StreamingResponse(rows(), media_type="application/x-ndjson")
+
+
+async def image(request):
+    return PlainTextResponse("x" * 5000, media_type="image/png")
+
+
+def make_client():
+    """압축 미들웨어 → 라우트 순서의 앱 클라이언트"""
+    app = Starlette(
+        routes=[
+            Route("/large", large_json),
+            Route("/small", small_text),
+            Route("/stream", stream),
+            Route("/image", image),
+        ]
+    )
+    return TestClient(middleware.CompressionMiddleware(app, minimum_size=100))
+
+
+class TestNegotiation(unittest.TestCase):
+    """코덱 협상과 레벨 선택 테스트"""
+
+    SUPPORTED = ("zstd", "br", "gzip")
+
+    def test_quality_values(self):
+        """q 값, 동순위 서버 선호, q=0 거부, 와일드카드, 잘못된 q 값 처리 테스트"""
+        negotiate = compression.negotiate_encoding
+        self.assertEqual(negotiate("gzip, br;q=0.5", self.SUPPORTED), "gzip")
+        self.assertEqual(negotiate("gzip, br, zstd", self.SUPPORTED), "zstd")
+        self.assertEqual(negotiate("*, zstd;q=0", self.SUPPORTED), "br")
+        self.assertIsNone(negotiate("gzip;q=0", self.SUPPORTED))
+        self.assertIsNone(negotiate("gzip;q=abc, identity", self.SUPPORTED))
+        self.assertIsNone(negotiate("", self.SUPPORTED))
+        self.assertEqual(negotiate("br, gzip", ("gzip",)), "gzip")
+
+    def test_level_by_size(self):
+        """응답 크기 구간별 레벨과 크기를 모를 때 가장 낮은 레벨을 쓰는지 테스트"""
+        small, medium, large = compression.COMPRESSION_LEVELS["gzip"]
+        self.assertEqual(compression.choose_level("gzip", 10), small)
+        self.assertEqual(
+            compression.choose_level("gzip", compression.SMALL_RESPONSE_SIZE + 1), medium
+        )
+        self.assertEqual(
+            compression.choose_level("gzip", compression.MEDIUM_RESPONSE_SIZE + 1), large
+        )
+        self.assertEqual(compression.choose_level("gzip", None), large)
+        with self.assertRaises(KeyError):
+            compression.choose_level("deflate", 10)
+
+
+class TestCompressors(unittest.TestCase):
+    """증분 압축기 테스트"""
+
+    def test_interface_is_abstract(self):
+        """압축기 인터페이스와 메서드를 빠뜨린 구현은 생성할 수 없는지 테스트"""
+        with self.assertRaises(TypeError):
+            compression.Compressor()
+
+        class Partial(compression.Compressor):
+            def compress(self, data):
+                return data
+
+        with self.assertRaises(TypeError):
+            Partial()
+
+    def test_gzip_flush_blocks_are_decodable(self):
+        """flush 한 블록까지 풀 수 있고 finish 후 전체가 복원되는지 테스트"""
+        compressor = compression.create_compressor("gzip")
+        decoder = zlib.decompressobj(31)
+        first = compressor.compress(b"hello ") + compressor.flush()
+        self.assertEqual(decoder.decompress(first), b"hello ")
+        rest = compressor.compress(b"world") + compressor.finish()
+        self.assertEqual(decoder.decompress(rest), b"world")
+        self.assertTrue(decoder.eof)
+
+    @unittest.skipIf(compression.zstandard is None, "zstandard 미설치")
+    def test_zstd_round_trip(self):
+        """zstd 압축기 블록 복원 테스트"""
+        compressor = compression.create_compressor("zstd", 10)
+        data = compressor.compress(b"x" * 1000) + compressor.finish()
+        decoded = compression.zstandard.ZstdDecompressor().decompressobj().decompress(data)
+        self.assertEqual(decoded, b"x" * 1000)
+
+    @unittest.skipIf(compression.brotli is None, "brotli 미설치")
+    def test_brotli_round_trip(self):
+        """brotli 압축기 블록 복원 테스트"""
+        compressor = compression.create_compressor("br", 10)
+        data = compressor.compress(b"x" * 1000) + compressor.finish()
+        self.assertEqual(compression.brotli.decompress(data), b"x" * 1000)
+
+    def test_unsupported_encoding(self):
+        """지원하지 않는 코덱 요청 시 예외 테스트"""
+        with self.assertRaises(KeyError):
+            compression.create_compressor("deflate")
+
+
+class TestCompressionMiddleware(unittest.TestCase):
+    """압축 미들웨어 테스트"""
+
+    def setUp(self):
+        """테스트 셋업"""
+        self.client = make_client()
+
+    def _get(self, path, accept_encoding="gzip"):
+        return self.client.get(path, headers={"accept-encoding": accept_encoding})
+
+    def test_complete_response_is_compressed(self):
+        """본문이 한 번에 오는 응답의 압축과 Content-Length 테스트"""
+        response = self._get("/large")
+        self.assertEqual(response.headers["content-encoding"], "gzip")
+        self.assertEqual(response.headers["vary"], "Accept-Encoding")
+        self.assertEqual(response.json(), PAYLOAD)
+        self.assertLess(int(response.headers["content-length"]), len(str(PAYLOAD)))
+
+    def test_streaming_response_is_compressed(self):
+        """스트리밍 응답을 길이 없이 청크 단위로 압축하는지 테스트"""
+        with self.client.stream(
+            "GET", "/stream", headers={"accept-encoding": "gzip"}
+        ) as response:
+            raw = b"".join(response.iter_raw())
+            headers = response.headers
+        self.assertEqual(headers["content-encoding"], "gzip")
+        self.assertNotIn("content-length", headers)
+        self.assertEqual(gzip.decompress(raw).decode(), "".join(LINES))
+
+    def test_small_and_unsupported_responses_pass_through(self):
+        """작은 응답, 압축 대상이 아닌 타입, 코덱 미지원 요청은 그대로 보내는지 테스트"""
+        small = self._get("/small")
+        self.assertNotIn("content-encoding", small.headers)
+        self.assertEqual(small.headers["vary"], "Accept-Encoding")
+        self.assertEqual(small.text, "ok")
+
+        self.assertNotIn("content-encoding", self._get("/image").headers)
+
+        identity = self._get("/large", accept_encoding="identity")
+        self.assertNotIn("content-encoding", identity.headers)
+        self.assertEqual(identity.headers["vary"], "Accept-Encoding")
+        self.assertEqual(identity.json(), PAYLOAD)
+
+
+if __name__ == "__main__":
+    unittest.main()
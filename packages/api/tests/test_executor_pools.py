@@ -0,0 +1,143 @@
+"""
+공유 실행기 풀(executor_pools)에 대한 테스트 모듈
+
+대기 상한 도달 시 백프레셔와 거부, 작업 실패 후 자리 복구, 통계와 종료,
+CPU 프로세스 풀 지연 생성을 확인합니다.
+"""
+
+import asyncio
+import importlib.util
+import os
+import sys
+import tempfile
+import threading
+import types
+import unittest
+
+# 앱 설정(환경 변수/DB) 없이 실행기 풀 모듈만 로드
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "src")
+os.environ.setdefault("LOG_DIR", tempfile.mkdtemp())
+sys.modules.setdefault(
+    "packages.api.src.coreconfig",
+    types.SimpleNamespace(settings=types.SimpleNamespace()),
+)
+
+
+def load(module, *aliases):
+    """core 모듈을 파일에서 로드해 다른 모듈이 import 하는 이름으로 등록 (한 번만)"""
+    if aliases and aliases[0] in sys.modules:
+        return sys.modules[aliases[0]]
+    spec = importlib.util.spec_from_file_location(
+        module, os.path.join(SRC_DIR, "core", f"{module}.py")
+    )
+    loaded = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(loaded)
+    for alias in aliases:
+        sys.modules.setdefault(alias, loaded)
+    return loaded
+
+
+executor_pools = load("executor_pools", "packages.api.src.coreexecutor_pools")
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+class TestManagedExecutor(unittest.TestCase):
+    """ManagedExecutor 테스트"""
+
+    def setUp(self):
+        """테스트 셋업 (작업자 1, 대기 상한 1)"""
+        self.pool = executor_pools.ManagedExecutor(
+            "test", max_workers=1, max_pending=1, acquire_timeout=0.05
+        )
+
+    def tearDown(self):
+        """테스트 정리"""
+        self.pool.shutdown(wait=True)
+
+    def test_full_pool_rejects_after_timeout(self):
+        """상한에 도달하면 기다렸다가 제한 시간이 지나면 거부하는지 테스트"""
+        release = threading.Event()
+
+        async def scenario():
+            busy = asyncio.create_task(self.pool.run(release.wait, 5))
+            await asyncio.sleep(0.01)
+            stats = self.pool.get_stats()
+            with self.assertRaises(executor_pools.ExecutorPoolOverloaded) as caught:
+                await self.pool.run(len, "x")
+            release.set()
+            await busy
+            return stats, caught.exception, await self.pool.run(len, "ok")
+
+        stats, error, result = run(scenario())
+        self.assertEqual((stats["pending"], stats["active"], stats["queued"]), (1, 1, 0))
+        self.assertEqual(stats["utilization"], 1.0)
+        self.assertEqual((error.pool, error.pending), ("test", 1))
+        self.assertEqual(result, 2)
+        stats = self.pool.get_stats()
+        self.assertEqual(
+            (stats["completed"], stats["rejected"], stats["pending"]), (2, 1, 0)
+        )
+
+    def test_queued_job_waits_for_slot(self):
+        """자리가 제한 시간 안에 나면 거부하지 않고 실행하는지 테스트"""
+        self.pool.acquire_timeout = 5
+
+        async def scenario():
+            first = asyncio.create_task(self.pool.run(sum, [1, 2]))
+            second = asyncio.create_task(self.pool.run(sum, [3, 4]))
+            return await asyncio.gather(first, second)
+
+        self.assertEqual(run(scenario()), [3, 7])
+        self.assertEqual(self.pool.rejected, 0)
+
+    def test_failed_job_releases_slot(self):
+        """작업이 예외로 끝나도 자리가 복구되고 실패 수가 늘어나는지 테스트"""
+
+        async def scenario():
+            with self.assertRaises(ZeroDivisionError):
+                await self.pool.run(divmod, 1, 0)
+            return await self.pool.run(divmod, 7, 2)
+
+        self.assertEqual(run(scenario()), (3, 1))
+        stats = self.pool.get_stats()
+        self.assertEqual((stats["failed"], stats["completed"], stats["pending"]), (1, 1, 0))
+
+    def test_shutdown_resets_pool(self):
+        """종료 후 다음 사용 시 풀을 새로 만드는지 테스트"""
+        self.assertFalse(self.pool.get_stats()["started"])
+        run(self.pool.run(len, "x"))
+        self.assertTrue(self.pool.get_stats()["started"])
+        self.pool.shutdown()
+        self.assertFalse(self.pool.get_stats()["started"])
+        self.assertEqual(run(self.pool.run(len, "xy")), 2)
+
+
+class TestExecutorPools(unittest.TestCase):
+    """ExecutorPools 테스트"""
+
+    def test_cpu_pool_is_created_lazily(self):
+        """시작 시 I/O 풀만 만들고 CPU 풀은 예열하지 않으면 생성하지 않는지 테스트"""
+        pools = executor_pools.ExecutorPools(
+            io_workers=1, cpu_workers=2, start_method="spawn"
+        )
+        try:
+            self.assertIs(pools.get(), pools.io)
+            self.assertIs(pools.get(use_process_pool=True), pools.cpu)
+            run(pools.start())
+            stats = pools.get_stats()
+            self.assertTrue(stats["io"]["started"])
+            self.assertFalse(stats["cpu"]["started"])
+            self.assertEqual(stats["cpu"]["executor"], "process")
+            self.assertEqual(stats["cpu"]["start_method"], "spawn")
+            self.assertEqual(
+                stats["cpu"]["max_pending"], 2 * executor_pools.DEFAULT_PENDING_PER_WORKER
+            )
+        finally:
+            pools.shutdown(wait=True)
+
+
+if __name__ == "__main__":
+    unittest.main()
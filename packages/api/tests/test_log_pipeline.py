@@ -0,0 +1,194 @@
+"""
+비동기 로깅 파이프라인(log_pipeline)에 대한 테스트 모듈
+
+큐가 가득 찼을 때 버리기, 작성 스레드 종료 시 남은 레코드 기록, JSON 포맷터,
+표본 추출/속도 제한 필터와 회전 파일의 백그라운드 압축을 확인합니다.
+"""
+
+import gzip
+import importlib.util
+import json
+import logging
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from datetime import datetime
+from unittest.mock import patch
+
+# 앱 설정(환경 변수/DB) 없이 로깅 파이프라인 모듈만 로드
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "src")
+
+
+def load(module, *aliases):
+    """core 모듈을 파일에서 로드해 다른 모듈이 import 하는 이름으로 등록 (한 번만)"""
+    if aliases and aliases[0] in sys.modules:
+        return sys.modules[aliases[0]]
+    spec = importlib.util.spec_from_file_location(
+        module, os.path.join(SRC_DIR, "core", f"{module}.py")
+    )
+    loaded = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(loaded)
+    for alias in aliases:
+        sys.modules.setdefault(alias, loaded)
+    return loaded
+
+
+log_pipeline = load("log_pipeline", "core.log_pipeline")
+
+
+class ListHandler(logging.Handler):
+    """받은 레코드를 보관하는 핸들러"""
+
+    def __init__(self):
+        super().__init__()
+        self.records = []
+        self.closed = False
+
+    def emit(self, record):
+        self.records.append(record)
+
+    def close(self):
+        self.closed = True
+        super().close()
+
+
+def make_record(
+    msg="hello %s", args=("world",), level=logging.INFO, lineno=10, **extra
+):
+    """테스트용 로그 레코드 (extra 값은 레코드 속성으로)"""
+    record = logging.LogRecord("test", level, "app.py", lineno, msg, args, None)
+    record.__dict__.update(extra)
+    return record
+
+
+def dropped(reason):
+    return log_pipeline.LOG_DROPPED.labels(reason)._value.get()
+
+
+class TestAsyncLogPipeline(unittest.TestCase):
+    """큐 핸들러와 작성 스레드 테스트"""
+
+    def test_full_queue_drops_without_blocking(self):
+        """큐가 가득 차면 호출 스레드가 기다리지 않고 레코드를 버리는지 테스트"""
+        pipeline = log_pipeline.AsyncLogPipeline(queue_size=1)
+        before = dropped("queue_full")
+        pipeline.handler.handle(make_record())
+        pipeline.handler.handle(make_record())
+        self.assertEqual(dropped("queue_full") - before, 1)
+        self.assertEqual(pipeline.get_stats()["queued"], 1)
+
+        queued = pipeline.queue.get_nowait()
+        self.assertEqual((queued.msg, queued.args), ("hello world", None))
+
+    def test_stop_flushes_queued_records(self):
+        """종료 시 큐에 남은 레코드를 모두 기록하고 핸들러를 닫는지 테스트"""
+        pipeline = log_pipeline.AsyncLogPipeline(queue_size=100)
+        target = ListHandler()
+        pipeline.start([target])
+        pipeline.start([ListHandler()])
+        self.assertTrue(pipeline.get_stats()["running"])
+        for i in range(50):
+            pipeline.handler.handle(make_record(args=(i,)))
+        pipeline.stop()
+        pipeline.stop()
+
+        self.assertEqual(len(target.records), 50)
+        self.assertEqual(target.records[-1].getMessage(), "hello 49")
+        self.assertTrue(target.closed)
+        self.assertFalse(pipeline.running)
+
+
+class TestFastJsonFormatter(unittest.TestCase):
+    """FastJsonFormatter 테스트"""
+
+    def test_extra_fields_and_exception(self):
+        """extra 값, 고정 필드, 직렬화할 수 없는 값, 예외 정보 기록 테스트"""
+        formatter = log_pipeline.FastJsonFormatter({"service": "api"})
+        record = make_record(
+            request_id="r1", when=datetime(2024, 1, 1), _private="hidden"
+        )
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            record.exc_info = sys.exc_info()
+
+        entry = formatter.to_dict(record)
+        self.assertEqual(entry["message"], "hello world")
+        self.assertEqual((entry["service"], entry["request_id"]), ("api", "r1"))
+        self.assertNotIn("_private", entry)
+        self.assertEqual(entry["exception"]["type"], "ValueError")
+        formatted = json.loads(formatter.format(record))
+        self.assertTrue(formatted["when"].startswith("2024-01-01"))
+
+
+class TestFilters(unittest.TestCase):
+    """표본 추출/속도 제한 필터 테스트"""
+
+    def test_sampling(self):
+        """지정한 레벨만 표본 추출하는지 테스트"""
+        sampler = log_pipeline.SamplingFilter({logging.DEBUG: 0.0})
+        before = dropped("sampled")
+        self.assertFalse(sampler.filter(make_record(level=logging.DEBUG)))
+        self.assertTrue(sampler.filter(make_record(level=logging.INFO)))
+        self.assertEqual(dropped("sampled") - before, 1)
+
+    def test_rate_limit_per_call_site(self):
+        """위치별로 제한하고, 버려진 건수를 다음 레코드에 붙이며, 경고는 제한하지 않는지 테스트"""
+        limiter = log_pipeline.RateLimitFilter(rate=1.0, burst=2)
+        with patch.object(log_pipeline.time, "monotonic", return_value=100.0):
+            results = [limiter.filter(make_record()) for _ in range(4)]
+            self.assertTrue(limiter.filter(make_record(lineno=20)))
+            self.assertTrue(limiter.filter(make_record(level=logging.WARNING)))
+        self.assertEqual(results, [True, True, False, False])
+
+        with patch.object(log_pipeline.time, "monotonic", return_value=101.0):
+            record = make_record()
+            self.assertTrue(limiter.filter(record))
+        self.assertEqual(record.suppressed, 2)
+
+
+class TestBackgroundCompressingRotatingFileHandler(unittest.TestCase):
+    """회전 파일 핸들러 테스트"""
+
+    def setUp(self):
+        """테스트 셋업"""
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, "app.log")
+
+    def tearDown(self):
+        """테스트 정리"""
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def _write(self, handler, count):
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        for i in range(count):
+            handler.handle(make_record(msg="line %d " + "x" * 40, args=(i,)))
+        handler.close()
+
+    def test_rotated_files_are_compressed(self):
+        """연속 회전에도 압축이 끝난 뒤 번호를 옮기고 모든 백업이 gzip 인지 테스트"""
+        handler = log_pipeline.BackgroundCompressingRotatingFileHandler(
+            self.path, max_bytes=200, backup_count=3
+        )
+        self._write(handler, 20)
+
+        files = sorted(os.listdir(self.directory))
+        self.assertEqual(
+            files, ["app.log", "app.log.1.gz", "app.log.2.gz", "app.log.3.gz"]
+        )
+        with gzip.open(os.path.join(self.directory, "app.log.1.gz"), "rt") as f:
+            self.assertTrue(f.read().startswith("line "))
+
+    def test_compression_disabled(self):
+        """압축을 끄면 이름만 바꾸는지 테스트"""
+        handler = log_pipeline.BackgroundCompressingRotatingFileHandler(
+            self.path, max_bytes=200, backup_count=1, compress=False
+        )
+        self._write(handler, 10)
+        self.assertEqual(sorted(os.listdir(self.directory)), ["app.log", "app.log.1"])
+
+
+if __name__ == "__main__":
+    unittest.main()
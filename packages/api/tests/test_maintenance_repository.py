@@ -0,0 +1,362 @@
+"""
+MaintenanceRepository 샤드 라우팅에 대한 테스트 모듈
+
+SQLite 파일 두 개를 샤드 노드로 등록하고, 차량 담당 샤드에 생성한 정비 기록을
+ID 로 조회/수정/삭제하는 흐름과 상태/태그 조회의 scatter-gather 를 확인합니다.
+"""
+
+import asyncio
+import importlib.util
+import os
+import shutil
+import sys
+import tempfile
+import types
+import unittest
+from datetime import datetime
+
+from sqlalchemy import JSON, Column, DateTime, Float, String, create_engine, text
+from sqlalchemy.orm import Session, declarative_base
+
+# 앱 설정(환경 변수/DB) 없이 리포지토리와 필요한 core 모듈만 로드
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "src")
+os.environ.setdefault("LOG_DIR", tempfile.mkdtemp())
+sys.modules.setdefault(
+    "packages.api.src.coreconfig",
+    types.SimpleNamespace(settings=types.SimpleNamespace(DB_SHARD_URLS=None)),
+)
+
+Base = declarative_base()
+
+
+class Maintenance(Base):
+    """정비 기록 (리포지토리가 사용하는 컬럼만)"""
+
+    __tablename__ = "maintenance"
+
+    id = Column(String(36), primary_key=True)
+    vehicle_id = Column(String(36), nullable=False)
+    service_type = Column(String(100))
+    type = Column(String(50))
+    description = Column(String)
+    notes = Column(String)
+    performed_by = Column(String(100))
+    provider = Column(String(100))
+    date = Column(DateTime, nullable=False)
+    status = Column(String(20), nullable=False, default="scheduled")
+    cost = Column(Float)
+    tags = Column(JSON)
+    created_at = Column(DateTime)
+    updated_at = Column(DateTime)
+
+
+class EntityTag(Base):
+    """엔티티 태그 인덱스 (database.models.EntityTag 와 같은 컬럼)"""
+
+    __tablename__ = "entity_tags"
+
+    entity_type = Column(String(50), primary_key=True)
+    entity_id = Column(String(36), primary_key=True)
+    tag = Column(String(100), primary_key=True)
+    created_at = Column(DateTime)
+
+
+class Vehicle(Base):
+    """차량 (대량 적재 차량 존재 검증에 쓰는 컬럼만)"""
+
+    __tablename__ = "vehicles"
+
+    id = Column(String(36), primary_key=True)
+
+
+def load(path, *aliases):
+    """src 아래 모듈을 파일에서 로드해 다른 모듈이 import 하는 이름으로 등록"""
+    name = os.path.splitext(os.path.basename(path))[0]
+    spec = importlib.util.spec_from_file_location(name, os.path.join(SRC_DIR, path))
+    loaded = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(loaded)
+    for alias in aliases:
+        sys.modules.setdefault(alias, loaded)
+    return loaded
+
+
+def stub(name, **attrs):
+    """프로메테우스/psutil 이 필요한 모듈, 예외 모듈과 앱 모델 모듈 대체"""
+    sys.modules.setdefault(name, types.SimpleNamespace(**attrs))
+
+
+class Placeholder:
+    """리포지토리 임포트에만 필요한 모델/스키마"""
+
+
+stub("packagescore.metrics", track_db_query_time=lambda func: func)
+stub("packagescore.metrics_collector", metrics_collector=None)
+stub(
+    "packagesmodels.schemas",
+    MaintenanceCreate=Placeholder,
+    MaintenanceFilter=Placeholder,
+    MaintenanceUpdate=Placeholder,
+)
+stub(
+    "packagesdatabase.models",
+    ArchiveCheckpoint=Placeholder,
+    EntityTag=EntityTag,
+    Maintenance=Maintenance,
+    Shop=Placeholder,
+    Todo=Placeholder,
+    User=Placeholder,
+    Vehicle=Vehicle,
+)
+stub("packagesmodels.maintenance", MaintenanceArchiveModel=Placeholder)
+stub("packagescore.exceptions", ValidationException=ValueError)
+
+load("core/logging.py", "packages.api.src.corelogging", "packagescore.logging")
+load("core/resilience.py", "packages.api.src.coreresilience")
+load("core/replication.py", "packages.api.src.corereplication")
+load("core/aggregates.py", "packages.api.src.coreaggregates", "packagescore.aggregates")
+load("core/pagination.py", "packagescore.pagination")
+load("core/archiver.py", "packagescore.archiver")
+load("core/bulk_ingest.py", "packagescore.bulk_ingest")
+load("core/full_text.py", "packagescore.full_text")
+load("core/tag_index.py", "packagescore.tag_index")
+base_repository = load("core/base_repository.py", "packagescore.base_repository")
+sharding = load("core/sharding.py")
+maintenance_repository = load("repositories/maintenance_repository.py")
+
+
+class MissCache:
+    """항상 캐시 미스인 캐시"""
+
+    async def get(self, key):
+        return None
+
+    async def set(self, key, value, ttl=None):
+        pass
+
+    async def keys(self, pattern):
+        return []
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+class TestShardedMaintenanceRepository(unittest.TestCase):
+    """샤드 노드 두 개를 등록한 MaintenanceRepository 테스트"""
+
+    SHARDS = ("shard1", "shard2")
+
+    def setUp(self):
+        """테스트 셋업 (샤드마다 차량이 하나 이상 배정되도록 차량 ID 선택)"""
+        self.tmpdir = tempfile.mkdtemp()
+        self.manager = sharding.ShardingManager()
+        self.manager.initialize({"strategy": "consistent_hashing"})
+        self.manager.register_nodes(
+            [
+                {"name": name, "url": f"sqlite:///{os.path.join(self.tmpdir, name)}.db"}
+                for name in self.SHARDS
+            ]
+        )
+        self.manager.set_shard_key("vehicle_id")
+        for name in self.SHARDS:
+            Base.metadata.create_all(self.manager.get_engine(name))
+
+        self.vehicles = {}
+        for i in range(100):
+            self.vehicles.setdefault(self.manager.shard_for(f"vehicle-{i}"), f"vehicle-{i}")
+        self.assertEqual(set(self.vehicles), set(self.SHARDS))
+
+        repository = maintenance_repository.MaintenanceRepository
+        self.repo = repository.__new__(repository)
+        self.repo.db = None  # 샤딩 중에는 주 세션을 사용하지 않아야 함
+        self.repo.model = Maintenance
+        self.repo.sharding_manager = self.manager
+        self.repo.cache = MissCache()
+        self.repo.event_emitter = maintenance_repository.EventEmitter()
+        self.repo.encryption_service = maintenance_repository.EncryptionService()
+        self.repo.tag_index = maintenance_repository.TagIndex(EntityTag, "maintenance")
+
+    def tearDown(self):
+        """테스트 정리"""
+        self.manager.dispose()
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def _create(self, shard, **fields):
+        data = {
+            "vehicle_id": self.vehicles[shard],
+            "service_type": "oil_change",
+            "date": datetime(2024, 1, 1),
+            "status": "scheduled",
+            "cost": 100.0,
+        }
+        data.update(fields)
+        return run(self.repo.create_maintenance(data))
+
+    def _count_on(self, shard, model):
+        with self.manager.session(shard) as db:
+            return db.query(model).count()
+
+    def test_create_get_update_delete_on_owning_shard(self):
+        """차량 담당 샤드에 생성한 기록을 ID 로 조회/수정/삭제하는지 테스트"""
+        created = self._create("shard2", tags=["engine"])
+        record_id = created["id"]
+        self.assertEqual(self._count_on("shard2", Maintenance), 1)
+        self.assertEqual(self._count_on("shard1", Maintenance), 0)
+
+        fetched = run(self.repo.get_maintenance_by_id(record_id))
+        self.assertEqual(fetched["vehicle_id"], self.vehicles["shard2"])
+
+        updated = run(
+            self.repo.update_maintenance(record_id, {"cost": 250.0, "tags": ["brake"]})
+        )
+        self.assertEqual(updated["cost"], 250.0)
+        self.assertEqual(run(self.repo.get_maintenance_by_id(record_id))["cost"], 250.0)
+        with self.manager.session("shard2") as db:
+            tags = [row.tag for row in db.query(EntityTag)]
+        self.assertEqual(tags, ["brake"])
+        self.assertEqual(self._count_on("shard1", EntityTag), 0)
+
+        self.assertTrue(run(self.repo.delete_maintenance(record_id)))
+        self.assertIsNone(run(self.repo.get_maintenance_by_id(record_id)))
+        self.assertEqual(self._count_on("shard2", Maintenance), 0)
+        self.assertEqual(self._count_on("shard2", EntityTag), 0)
+
+    def test_missing_record(self):
+        """어느 샤드에도 없는 ID 의 조회/수정/삭제 처리 테스트"""
+        self.assertIsNone(run(self.repo.get_maintenance_by_id("missing")))
+        self.assertFalse(run(self.repo.delete_maintenance("missing")))
+        with self.assertRaises(ValueError):
+            run(self.repo.update_maintenance("missing", {"cost": 1.0}))
+
+    def test_status_and_tag_queries_span_shards(self):
+        """상태/태그 조회가 모든 샤드의 기록을 병합하는지 테스트"""
+        first = self._create("shard1", date=datetime(2024, 1, 1), tags=["engine"])
+        second = self._create("shard2", date=datetime(2024, 2, 1), tags=["engine", "tire"])
+        self._create("shard2", status="completed", tags=["tire"])
+
+        scheduled = run(self.repo.get_maintenance_by_status("scheduled"))
+        self.assertEqual([item["id"] for item in scheduled], [second["id"], first["id"]])
+        self.assertEqual(len(run(self.repo.get_maintenance_by_status("scheduled", 1))), 1)
+
+        engine = self.repo.search_by_tags(["engine"])
+        self.assertEqual({item["id"] for item in engine}, {first["id"], second["id"]})
+        both = self.repo.search_by_tags(["engine", "tire"], match_all=True)
+        self.assertEqual([item["id"] for item in both], [second["id"]])
+
+    def test_batch_delete_clears_tags_on_each_shard(self):
+        """일괄 삭제가 샤드마다 기록과 태그 인덱스를 함께 지우는지 테스트"""
+        first = self._create("shard1", tags=["engine"])
+        second = self._create("shard2", tags=["tire"])
+        kept = self._create("shard2", tags=["tire"])
+
+        self.assertEqual(
+            self.repo.batch_delete_maintenance([first["id"], second["id"]]), 2
+        )
+        self.assertEqual(self._count_on("shard1", Maintenance), 0)
+        self.assertEqual(self._count_on("shard1", EntityTag), 0)
+        with self.manager.session("shard2") as db:
+            self.assertEqual([row.entity_id for row in db.query(EntityTag)], [kept["id"]])
+        self.assertEqual(
+            [item["id"] for item in self.repo.search_by_tags(["tire"])], [kept["id"]]
+        )
+
+    def test_bulk_insert_routes_rows_and_reports_rejected(self):
+        """대량 삽입이 행마다 차량 담당 샤드에 기록하고 거부된 행을 반환하는지 테스트"""
+        for shard, vehicle_id in self.vehicles.items():
+            with self.manager.session(shard) as db:
+                db.add(Vehicle(id=vehicle_id))
+                db.commit()
+        rows = [
+            {
+                "vehicle_id": self.vehicles[shard],
+                "date": "2024-01-01T00:00:00",
+                "status": "scheduled",
+                "cost": cost,
+                "tags": ["engine"],
+            }
+            for shard, cost in (("shard1", "10"), ("shard2", "20"), ("shard2", "1e400"))
+        ]
+        rows.append({"date": "2024-01-01T00:00:00", "status": "scheduled"})
+
+        report = self.repo.bulk_insert_maintenance(rows)
+        self.assertEqual((report.inserted, report.failed), (2, 2))
+        self.assertEqual([error.row_number for error in report.errors], [3, 4])
+        self.assertEqual(self._count_on("shard1", Maintenance), 1)
+        self.assertEqual(self._count_on("shard2", Maintenance), 1)
+        self.assertEqual(self._count_on("shard2", EntityTag), 1)
+
+        created = self.repo.batch_create_maintenance(rows[:2])
+        self.assertEqual(
+            sorted(item["vehicle_id"] for item in created),
+            sorted([self.vehicles["shard1"], self.vehicles["shard2"]]),
+        )
+
+
+class TestMaintenanceSearch(unittest.TestCase):
+    """샤딩 없이 SQLite 주 세션을 쓰는 정비 기록 검색 테스트"""
+
+    def setUp(self):
+        """테스트 셋업"""
+        self.tmpdir = tempfile.mkdtemp()
+        self.engine = create_engine(f"sqlite:///{os.path.join(self.tmpdir, 'app.db')}")
+        Base.metadata.create_all(self.engine)
+        self.db = Session(self.engine)
+        self.db.add_all(
+            [
+                Maintenance(
+                    id="brake",
+                    vehicle_id="vehicle-1",
+                    description="Brake pads replaced",
+                    date=datetime(2024, 1, 1),
+                    updated_at=datetime(2024, 1, 1),
+                ),
+                Maintenance(
+                    id="oil",
+                    vehicle_id="vehicle-1",
+                    description="Oil change",
+                    notes="brake fluid checked",
+                    date=datetime(2024, 2, 1),
+                    updated_at=datetime(2024, 2, 1),
+                ),
+            ]
+        )
+        self.db.commit()
+
+        repository = maintenance_repository.MaintenanceRepository
+        self.repo = repository.__new__(repository)
+        self.repo.db = self.db
+        self.repo.model = Maintenance
+        self.repo.sharding_manager = sharding.ShardingManager()
+        self.repo.encryption_service = maintenance_repository.EncryptionService()
+        self.repo.search_index = maintenance_repository.maintenance_search_index()
+
+    def tearDown(self):
+        """테스트 정리"""
+        self.db.close()
+        self.engine.dispose()
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def test_like_fallback_without_index(self):
+        """전문 검색 인덱스 설치 전에는 ILIKE 검색 결과를 반환하는지 테스트"""
+        results = self.repo.search_maintenance("brake")
+        self.assertEqual([item["id"] for item in results], ["oil", "brake"])
+        self.assertNotIn("rank", results[0])
+
+    def test_full_text_search_with_index(self):
+        """인덱스가 있으면 관련도와 하이라이트 스니펫을 포함하는지 테스트"""
+        with self.engine.begin() as connection:
+            self.repo.search_index.install(connection)
+        results = self.repo.search_maintenance("brak", fields=["description"])
+        self.assertEqual([item["id"] for item in results], ["brake"])
+        self.assertEqual(results[0]["snippet"], "<mark>Brake</mark> pads replaced")
+
+    def test_database_error_is_raised(self):
+        """DB 오류를 빈 결과로 숨기지 않고 DatabaseOperationError 로 알리는지 테스트"""
+        with self.engine.begin() as connection:
+            connection.execute(text("DROP TABLE maintenance"))
+        with self.assertRaises(base_repository.DatabaseOperationError):
+            self.repo.search_maintenance("brake")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,181 @@
+"""
+예약 알림 스케줄러(notification_scheduler)에 대한 테스트 모듈
+
+같은 저널 파일을 공유하는 두 스케줄러(워커)로 리더 선출과 장애 조치, 리더가 아닌
+워커의 예약 추가/취소 반영, 저널 복원과 압축을 확인합니다.
+"""
+
+import asyncio
+import importlib.util
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from datetime import datetime, timedelta, timezone
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "src")
+
+
+def load(path, alias):
+    """src 아래 모듈을 파일에서 로드해 다른 모듈이 import 하는 이름으로 등록 (한 번만)"""
+    if alias in sys.modules:
+        return sys.modules[alias]
+    spec = importlib.util.spec_from_file_location(alias, os.path.join(SRC_DIR, path))
+    loaded = importlib.util.module_from_spec(spec)
+    sys.modules[alias] = loaded
+    spec.loader.exec_module(loaded)
+    return loaded
+
+
+load("core/base_model.py", "src.core.base_model")
+load("core/reminder_queue.py", "src.core.reminder_queue")
+models = load("modules/notification/models.py", "src.modules.notification.models")
+scheduler_module = load(
+    "modules/notification/notification_scheduler.py",
+    "src.modules.notification.notification_scheduler",
+)
+# 테스트에서는 잠금 갱신/저널 확인 주기를 짧게
+scheduler_module.LEADER_RENEW_INTERVAL = 0.1
+scheduler_module.JOURNAL_POLL_INTERVAL = 0.05
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+def in_seconds(seconds):
+    return datetime.now(timezone.utc) + timedelta(seconds=seconds)
+
+
+class TestNotificationScheduler(unittest.TestCase):
+    """공유 저널을 쓰는 NotificationScheduler 테스트"""
+
+    def setUp(self):
+        """테스트 셋업"""
+        self.tmpdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmpdir, "schedules.jsonl")
+        self.sent = {}
+
+    def tearDown(self):
+        """테스트 정리"""
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def _scheduler(self, name):
+        """같은 저널과 파일 리더 잠금을 쓰는 워커 스케줄러"""
+        self.sent[name] = []
+
+        async def dispatch(batch):
+            self.sent[name].extend(s.notification.title for s in batch)
+
+        return scheduler_module.NotificationScheduler(
+            dispatch,
+            journal=scheduler_module.ScheduleJournal(self.path),
+            leader_lock=scheduler_module.create_leader_lock(None, self.path),
+        )
+
+    def _schedule(self, title, seconds):
+        return scheduler_module.ScheduledNotification(
+            models.NotificationCreate(title=title, message=title, type="info"),
+            1,
+            in_seconds(seconds),
+        )
+
+    @unittest.skipIf(scheduler_module.fcntl is None, "flock 미지원 환경")
+    def test_single_leader_and_follower_changes(self):
+        """리더만 발송하고, 리더가 아닌 워커의 추가/취소가 반영되는지 테스트"""
+
+        async def scenario():
+            leader, follower = self._scheduler("leader"), self._scheduler("follower")
+            await leader.start()
+            await asyncio.sleep(0.05)
+            await follower.start()
+            await asyncio.sleep(0.1)
+            leaders = (leader.is_leader, follower.is_leader)
+
+            await follower.add(self._schedule("sent", 0.2))
+            cancelled = await follower.add(self._schedule("cancelled", 0.4))
+            # 리더가 저널에서 읽은 예약을 리더가 아닌 다른 워커 인스턴스가 취소
+            other = self._scheduler("other")
+            cancel_result = await other.cancel(cancelled.schedule_id)
+            await asyncio.sleep(0.7)
+            await follower.stop()
+            await leader.stop()
+            return leaders, cancel_result
+
+        leaders, cancel_result = run(scenario())
+        self.assertEqual(leaders, (True, False))
+        self.assertTrue(cancel_result)
+        self.assertEqual(self.sent["leader"], ["sent"])
+        self.assertEqual(self.sent["follower"], [])
+
+    @unittest.skipIf(scheduler_module.fcntl is None, "flock 미지원 환경")
+    def test_failover_after_leader_stops(self):
+        """리더가 중지되면 다른 워커가 이어받아 남은 예약을 발송하는지 테스트"""
+
+        async def scenario():
+            first, second = self._scheduler("first"), self._scheduler("second")
+            await first.start()
+            await asyncio.sleep(0.05)
+            await second.start()
+            await second.add(self._schedule("after-failover", 0.3))
+            await asyncio.sleep(0.05)
+            await first.stop()
+            await asyncio.sleep(0.6)
+            leader = second.is_leader
+            await second.stop()
+            return leader
+
+        self.assertTrue(run(scenario()))
+        self.assertEqual(self.sent["first"], [])
+        self.assertEqual(self.sent["second"], ["after-failover"])
+
+    def test_add_during_reload_is_kept(self):
+        """저널을 다시 읽는 도중 추가한 예약이 사라지지 않는지 테스트"""
+
+        async def scenario():
+            scheduler = self._scheduler("worker")
+            await scheduler.add(self._schedule("first", 60))
+            reload = asyncio.create_task(scheduler._reload())
+            await asyncio.sleep(0)
+            added = await scheduler.add(self._schedule("second", 60))
+            await reload
+            return added.schedule_id in scheduler.schedules
+
+        self.assertTrue(run(scenario()))
+
+    def test_journal_restore_and_compaction(self):
+        """저널에서 살아 있는 예약만 복원하고 무효 레코드가 많으면 압축하는지 테스트"""
+        journal = scheduler_module.ScheduleJournal(self.path)
+        kept = self._schedule("kept", 60)
+        dropped = [self._schedule(f"dropped-{i}", 60) for i in range(3)]
+        journal.write(put=[kept, *dropped])
+        journal.write(delete=[s.schedule_id for s in dropped])
+        with open(self.path, "a", encoding="utf-8") as handle:
+            handle.write('{"op": "put", "sched')  # 비정상 종료로 잘린 줄
+
+        restored = journal.load()
+        self.assertEqual([s.schedule_id for s in restored], [kept.schedule_id])
+        with open(self.path, encoding="utf-8") as handle:
+            self.assertEqual(len(handle.readlines()), 1)
+
+    def test_cancel_without_journal(self):
+        """저널이 없으면 이 스케줄러의 예약일 때만 취소에 성공하는지 테스트"""
+
+        async def scenario():
+            async def dispatch(batch):
+                pass
+
+            scheduler = scheduler_module.NotificationScheduler(dispatch)
+            scheduled = await scheduler.add(self._schedule("memory", 60))
+            return (
+                await scheduler.cancel(scheduled.schedule_id),
+                await scheduler.cancel("unknown"),
+                len(scheduler),
+            )
+
+        self.assertEqual(run(scenario()), (True, False, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
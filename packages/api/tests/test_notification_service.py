@@ -0,0 +1,228 @@
+"""
+NotificationService 의 배치 알림 생성과 발송에 대한 테스트 모듈
+
+SQLite(aiosqlite) 세션과 기록용 이메일 서비스로, 예약 알림이 발송될 때 사용자
+연락처 조회와 구독/채널 설정 확인을 거쳐 알림 저장과 이메일 발송이 이뤄지는지
+확인합니다.
+"""
+
+import asyncio
+import importlib.util
+import os
+import shutil
+import sys
+import tempfile
+import types
+import unittest
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import JSON, Boolean, Column, DateTime, Integer, String
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import declarative_base
+
+# 앱 설정(환경 변수/DB) 없이 알림 서비스와 필요한 모듈만 로드
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "src")
+
+Base = declarative_base()
+
+
+class User(Base):
+    """사용자 (서비스가 조회하는 컬럼만)"""
+
+    __tablename__ = "users"
+
+    id = Column(Integer, primary_key=True)
+    email = Column(String, nullable=False)
+    is_active = Column(Boolean, default=True)
+
+
+class Notification(Base):
+    """알림 (notification_model.Notification 과 같은 컬럼)"""
+
+    __tablename__ = "notifications"
+
+    id = Column(Integer, primary_key=True)
+    user_id = Column(Integer, nullable=False)
+    content = Column(String, nullable=False)
+    notification_type = Column(String, nullable=False)
+    priority = Column(Integer, nullable=False)
+    category = Column(String, nullable=False)
+    is_read = Column(Boolean, nullable=False, default=False)
+    created_at = Column(DateTime(timezone=True), nullable=False)
+    read_at = Column(DateTime(timezone=True))
+    meta = Column("metadata", JSON)
+
+
+def load(path, alias):
+    """src 아래 모듈을 파일에서 로드해 다른 모듈이 import 하는 이름으로 등록 (한 번만)"""
+    if alias in sys.modules:
+        return sys.modules[alias]
+    spec = importlib.util.spec_from_file_location(alias, os.path.join(SRC_DIR, path))
+    loaded = importlib.util.module_from_spec(spec)
+    sys.modules[alias] = loaded
+    spec.loader.exec_module(loaded)
+    return loaded
+
+
+for name, attrs in {
+    "packages.apiuser.user_model": {"User": User},
+    "src.core.config": {"Settings": object},
+    "src.core.database": {
+        "AsyncSession": AsyncSession,
+        "Base": Base,
+        "get_db": lambda: None,
+    },
+    "src.core.metrics": {"metrics_collector": None},
+    "src.core.security": {"SecurityService": object},
+    "src.modules.notification.notification_repository": {
+        "NotificationRepository": lambda db: None
+    },
+    "src.modules.notification.notification_model": {"Notification": Notification},
+}.items():
+    # DB 엔진/보안/메트릭 설정이 필요한 모듈과 앱 모델 모듈 대체
+    sys.modules.setdefault(name, types.SimpleNamespace(**attrs))
+
+load("core/base_model.py", "src.core.base_model")
+load("core/reminder_queue.py", "src.core.reminder_queue")
+models = load("modules/notification/models.py", "src.modules.notification.models")
+delivery_module = load(
+    "modules/notification/notification_delivery.py",
+    "src.modules.notification.notification_delivery",
+)
+scheduler_module = load(
+    "modules/notification/notification_scheduler.py",
+    "src.modules.notification.notification_scheduler",
+)
+scheduler_module.LEADER_RENEW_INTERVAL = 0.1
+scheduler_module.JOURNAL_POLL_INTERVAL = 0.05
+service_module = load(
+    "modules/notification/notification_service.py",
+    "src.modules.notification.notification_service",
+)
+
+
+class RecordingEmailService:
+    """보낸 이메일을 기록하는 이메일 서비스"""
+
+    def __init__(self):
+        self.sent = []
+
+    async def send_email(self, email, title, body):
+        self.sent.append((email, title))
+        return True
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+class TestNotificationServiceDelivery(unittest.TestCase):
+    """예약/배치 알림의 저장과 발송 테스트"""
+
+    def setUp(self):
+        """테스트 셋업"""
+        self.tmpdir = tempfile.mkdtemp()
+        self.email = RecordingEmailService()
+
+    def tearDown(self):
+        """테스트 정리"""
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    async def _session(self):
+        """사용자 4명이 있는 SQLite 세션"""
+        engine = create_async_engine(
+            f"sqlite+aiosqlite:///{os.path.join(self.tmpdir, 'app.db')}"
+        )
+        async with engine.begin() as connection:
+            await connection.run_sync(Base.metadata.create_all)
+        session = AsyncSession(engine)
+        session.add_all(
+            [
+                User(id=1, email="one@example.com"),
+                User(id=2, email="two@example.com"),
+                User(id=3, email="three@example.com", is_active=False),
+                User(id=4, email="four@example.com"),
+            ]
+        )
+        await session.commit()
+        return engine, session
+
+    def _service(self, session):
+        return service_module.NotificationService(
+            session,
+            schedule_journal=scheduler_module.ScheduleJournal(
+                os.path.join(self.tmpdir, "schedules.jsonl")
+            ),
+            delivery=delivery_module.NotificationDelivery(email_service=self.email),
+        )
+
+    def _notification(self, title):
+        return models.NotificationCreate(title=title, message="본문", type="alert")
+
+    async def _stored_user_ids(self, session):
+        result = await session.execute(
+            Notification.__table__.select().order_by(Notification.user_id)
+        )
+        return [row.user_id for row in result]
+
+    def test_scheduled_notification_is_delivered(self):
+        """예약 알림이 연락처 조회와 구독/채널 설정 확인을 거쳐 발송되는지 테스트"""
+
+        async def scenario():
+            engine, session = await self._session()
+            service = self._service(session)
+            await service.subscribe(
+                2, {service_module.NotificationCategory.SYSTEM}, {"email": False}
+            )
+            await service.subscribe(4, {service_module.NotificationCategory.MARKETING})
+            await service.start_scheduler()
+            due = datetime.now(timezone.utc) + timedelta(seconds=0.1)
+            for user_id in (1, 2, 3, 4):
+                await service.schedule_notification(
+                    self._notification("정비 예정"), user_id, due
+                )
+            for _ in range(50):
+                await asyncio.sleep(0.05)
+                if not service.scheduled_notifications:
+                    break
+            await service.stop_scheduler()
+            await service.wait_for_deliveries()
+            stored = await self._stored_user_ids(session)
+            await session.close()
+            await engine.dispose()
+            return stored
+
+        stored = run(scenario())
+        # 4번은 시스템 카테고리를 구독하지 않아 저장도 하지 않음
+        self.assertEqual(stored, [1, 2, 3])
+        # 2번은 이메일 수신을 껐고 3번은 비활성 사용자
+        self.assertEqual(self.email.sent, [("one@example.com", "정비 예정")])
+
+    def test_explicit_contacts_skip_lookup(self):
+        """전달받은 연락처로 발송하고 구독 설정은 그대로 적용하는지 테스트"""
+
+        async def scenario():
+            engine, session = await self._session()
+            service = self._service(session)
+            await service.subscribe(
+                2, {service_module.NotificationCategory.SYSTEM}, {"email": False}
+            )
+            contacts = {
+                1: delivery_module.DeliveryContact(email="custom@example.com"),
+                2: delivery_module.DeliveryContact(email="two@example.com"),
+            }
+            created = await service.create_notifications_batch(
+                [self._notification("안내")], [1, 2], contacts=contacts
+            )
+            await service.wait_for_deliveries()
+            await session.close()
+            await engine.dispose()
+            return created
+
+        created = run(scenario())
+        self.assertEqual([record.user_id for record in created], [1, 2])
+        self.assertEqual(self.email.sent, [("custom@example.com", "안내")])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,171 @@
+"""
+커서 기반(keyset) 페이지네이션에 대한 테스트 모듈
+
+SQLite 에서 NULL 이 섞인 정렬 컬럼의 전체 순회와, 다른 정렬 방향/필터 구조로
+재사용하거나 변조한 커서의 거부, 필터 값이 바뀌는 요청의 커서 재사용, 캐시된 개수의
+무효화를 확인합니다.
+"""
+
+import importlib.util
+import os
+import sys
+import types
+import unittest
+from datetime import datetime, timedelta
+
+from sqlalchemy import Column, DateTime, String, create_engine
+from sqlalchemy.orm import Session, declarative_base
+
+# 앱 설정(환경 변수/DB) 없이 페이지네이션 모듈만 로드
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "src")
+sys.modules.setdefault(
+    "packages.api.src.coreconfig",
+    types.SimpleNamespace(settings=types.SimpleNamespace()),
+)
+
+
+def load(module, *aliases):
+    """core 모듈을 파일에서 로드해 다른 모듈이 import 하는 이름으로 등록"""
+    spec = importlib.util.spec_from_file_location(
+        module, os.path.join(SRC_DIR, "core", f"{module}.py")
+    )
+    loaded = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(loaded)
+    for alias in aliases:
+        sys.modules.setdefault(alias, loaded)
+    return loaded
+
+
+load("aggregates", "packages.api.src.coreaggregates", "packagescore.aggregates")
+pagination = load("pagination")
+
+Base = declarative_base()
+
+
+class Item(Base):
+    """페이지네이션 대상 (created_at 은 NULL 허용)"""
+
+    __tablename__ = "items"
+
+    id = Column(String, primary_key=True)
+    status = Column(String, nullable=False)
+    created_at = Column(DateTime)
+
+
+class TestKeysetPagination(unittest.TestCase):
+    """paginate_query 테스트"""
+
+    def setUp(self):
+        """테스트 셋업 (created_at 이 같은 행, NULL 인 행 포함 20건)"""
+        self.engine = create_engine("sqlite://")
+        Base.metadata.create_all(self.engine)
+        self.db = Session(self.engine)
+        base = datetime(2024, 1, 1)
+        for i in range(20):
+            created_at = None if i % 5 == 0 else base + timedelta(hours=i // 2)
+            status = "open" if i % 2 else "done"
+            self.db.add(Item(id=f"item-{i:02d}", status=status, created_at=created_at))
+        self.db.commit()
+
+    def tearDown(self):
+        """테스트 정리"""
+        self.db.close()
+        self.engine.dispose()
+
+    def _walk(self, query, descending=True, limit=3):
+        """모든 페이지를 순회해 ID 목록 반환"""
+        ids, cursor = [], None
+        while True:
+            page = pagination.paginate_query(
+                query, Item.created_at, Item.id, cursor, limit, descending
+            )
+            ids.extend(item.id for item in page.items)
+            if not page.has_next:
+                return ids
+            cursor = page.next_cursor
+
+    def test_walk_with_null_sort_values(self):
+        """NULL 정렬 값이 있어도 모든 행을 한 번씩, NULL 은 마지막에 반환하는지 테스트"""
+        for descending in (True, False):
+            ids = self._walk(self.db.query(Item), descending)
+            self.assertEqual(sorted(ids), sorted(f"item-{i:02d}" for i in range(20)))
+            nulls = [f"item-{i:02d}" for i in range(0, 20, 5)]
+            self.assertEqual(sorted(ids[-4:]), nulls)
+
+    def test_cursor_rejected_for_other_filters_or_direction(self):
+        """다른 필터 구조/정렬 방향으로 재사용한 커서를 거부하는지 테스트"""
+        open_items = self.db.query(Item).filter(Item.status == "open")
+        page = pagination.paginate_query(open_items, Item.created_at, Item.id, limit=2)
+
+        other_filter = self.db.query(Item).filter(
+            Item.status == "open", Item.created_at.isnot(None)
+        )
+        with self.assertRaises(pagination.InvalidCursorError):
+            pagination.paginate_query(
+                other_filter, Item.created_at, Item.id, page.next_cursor, 2
+            )
+        with self.assertRaises(pagination.InvalidCursorError):
+            pagination.paginate_query(
+                open_items, Item.created_at, Item.id, page.next_cursor, 2, False
+            )
+
+        same_filter = self.db.query(Item).filter(Item.status == "open")
+        next_page = pagination.paginate_query(
+            same_filter, Item.created_at, Item.id, page.next_cursor, 2
+        )
+        self.assertTrue(next_page.items)
+
+    def test_cursor_survives_changing_filter_values(self):
+        """요청마다 값이 달라지는 필터(현재 시각 기준 기간)로도 다음 페이지를 조회하는지 테스트"""
+
+        def recent(now):
+            return self.db.query(Item).filter(
+                Item.created_at >= now - timedelta(days=30)
+            )
+
+        now = datetime(2024, 1, 20)
+        page = pagination.paginate_query(
+            recent(now), Item.created_at, Item.id, limit=2
+        )
+        next_page = pagination.paginate_query(
+            recent(now + timedelta(seconds=5)),
+            Item.created_at,
+            Item.id,
+            page.next_cursor,
+            2,
+        )
+        self.assertTrue(next_page.items)
+        self.assertFalse({i.id for i in page.items} & {i.id for i in next_page.items})
+
+    def test_cached_count_invalidated_by_orm_writes(self):
+        """캐시된 개수가 ORM 으로 행을 추가/삭제하면 다시 계산되는지 테스트"""
+
+        def cached_total():
+            return pagination.count_query(
+                self.db.query(Item), pagination.CountMode.CACHED
+            )
+
+        self.assertEqual(cached_total(), (20, True))
+        self.db.add(Item(id="item-20", status="open"))
+        self.db.commit()
+        self.assertEqual(cached_total(), (21, True))
+        self.db.delete(self.db.get(Item, "item-20"))
+        self.db.commit()
+        self.assertEqual(cached_total(), (20, True))
+
+    def test_tampered_cursor_rejected(self):
+        """서명이 맞지 않는 커서를 거부하는지 테스트"""
+        page = pagination.paginate_query(
+            self.db.query(Item), Item.created_at, Item.id, limit=2
+        )
+        body, signature = page.next_cursor.split(".")
+        forged = pagination.encode_cursor("created_at", None, "item-99").split(".")[0]
+        for cursor in (f"{forged}.{signature}", body, "not-a-cursor"):
+            with self.assertRaises(pagination.InvalidCursorError):
+                pagination.paginate_query(
+                    self.db.query(Item), Item.created_at, Item.id, cursor, 2
+                )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,148 @@
+"""
+비동기 비밀번호 해시(password_hashing)에 대한 테스트 모듈
+
+낮은 bcrypt cost 로 검증/재해시, 잘못된 해시 처리, 대기열 상한 초과 시 로드 셰딩과
+작업 실패 후 대기 작업 수 복구를 확인합니다.
+"""
+
+import asyncio
+import importlib.util
+import os
+import sys
+import tempfile
+import threading
+import types
+import unittest
+
+# 앱 설정(환경 변수/DB) 없이 해시 모듈만 로드
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "src")
+os.environ.setdefault("LOG_DIR", tempfile.mkdtemp())
+sys.modules.setdefault(
+    "packages.api.src.coreconfig",
+    types.SimpleNamespace(settings=types.SimpleNamespace()),
+)
+
+
+def load(module, *aliases):
+    """core 모듈을 파일에서 로드해 다른 모듈이 import 하는 이름으로 등록 (한 번만)"""
+    if aliases and aliases[0] in sys.modules:
+        return sys.modules[aliases[0]]
+    spec = importlib.util.spec_from_file_location(
+        module, os.path.join(SRC_DIR, "core", f"{module}.py")
+    )
+    loaded = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(loaded)
+    for alias in aliases:
+        sys.modules.setdefault(alias, loaded)
+    return loaded
+
+
+password_hashing = load("password_hashing", "packages.api.src.corepassword_hashing")
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+class TestPasswordHasher(unittest.TestCase):
+    """PasswordHasher 테스트 (bcrypt 최소 cost 사용)"""
+
+    def setUp(self):
+        """테스트 셋업"""
+        self.hasher = password_hashing.PasswordHasher(
+            rounds=4, max_workers=1, max_pending=1
+        )
+
+    def tearDown(self):
+        """테스트 정리"""
+        self.hasher.shutdown()
+
+    def _old_hash(self, password):
+        """현재 설정보다 cost 가 높은 이전 해시"""
+        old = password_hashing.PasswordHasher(rounds=5, max_workers=1)
+        try:
+            return run(old.hash(password))
+        finally:
+            old.shutdown()
+
+    def test_verify_and_invalid_hashes(self):
+        """일치/불일치 검증과 bcrypt 가 아닌 해시는 풀에 제출하지 않고 거부하는지 테스트"""
+
+        async def scenario():
+            hashed = await self.hasher.hash("secret")
+            return (
+                await self.hasher.verify("secret", hashed),
+                await self.hasher.verify("wrong", hashed),
+                await self.hasher.verify("secret", "plain-text"),
+                await self.hasher.verify("secret", ""),
+                await self.hasher.verify("secret", "$2b$04$broken"),
+            )
+
+        self.assertEqual(run(scenario()), (True, False, False, False, False))
+
+    def test_long_passwords_are_truncated_consistently(self):
+        """72바이트를 넘는 비밀번호도 예외 없이 같은 방식으로 잘라 검증하는지 테스트"""
+
+        async def scenario():
+            hashed = await self.hasher.hash("가" * 40)
+            return await self.hasher.verify("가" * 40, hashed)
+
+        self.assertTrue(run(scenario()))
+
+    def test_rehash_on_cost_change(self):
+        """저장된 해시의 cost 가 다르면 검증 성공 시 새 해시를 돌려주는지 테스트"""
+        old_hash = self._old_hash("secret")
+        valid, new_hash = run(self.hasher.verify_and_update("secret", old_hash))
+        self.assertTrue(valid)
+        self.assertEqual(password_hashing.get_hash_rounds(new_hash), 4)
+        self.assertEqual(
+            run(self.hasher.verify_and_update("wrong", old_hash)), (False, None)
+        )
+        self.assertEqual(run(self.hasher.verify_and_update("secret", new_hash))[1], None)
+
+    def test_overload_is_rejected(self):
+        """대기열 상한을 넘는 요청은 즉시 거부하고, 재해시 거부는 로그인을 막지 않는지 테스트"""
+        release = threading.Event()
+
+        def blocking(_):
+            release.wait(5)
+            return None, 0.0
+
+        async def scenario():
+            busy = asyncio.create_task(self.hasher._submit("test", blocking, None))
+            await asyncio.sleep(0.05)
+            with self.assertRaises(password_hashing.PasswordHasherOverloaded) as caught:
+                await self.hasher.hash("secret")
+            release.set()
+            await busy
+            return caught.exception
+
+        error = run(scenario())
+        self.assertEqual(error.pending, 1)
+        self.assertEqual(self.hasher.rejected, 1)
+        self.assertEqual(self.hasher.pending, 0)
+
+        old_hash = self._old_hash("secret")
+
+        async def rejected_rehash(password):
+            raise password_hashing.PasswordHasherOverloaded(1)
+
+        self.hasher.hash = rejected_rehash
+        self.assertEqual(
+            run(self.hasher.verify_and_update("secret", old_hash)), (True, None)
+        )
+
+    def test_failed_job_releases_slot(self):
+        """작업이 예외로 끝나도 대기 작업 수가 복구되는지 테스트"""
+
+        def failing():
+            raise RuntimeError("worker failed")
+
+        with self.assertRaises(RuntimeError):
+            run(self.hasher._submit("test", failing))
+        self.assertEqual(self.hasher.pending, 0)
+        self.assertTrue(run(self.hasher.verify("x", run(self.hasher.hash("x")))))
+
+
+if __name__ == "__main__":
+    unittest.main()
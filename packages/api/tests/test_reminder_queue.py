@@ -0,0 +1,154 @@
+"""
+리마인더 대기열(reminder_queue)에 대한 테스트 모듈
+
+SQLite 파일 하나를 두 세션(워커)이 함께 사용해 선점, 트랜잭션 경계,
+엔티티 유형 범위, 실패 재시도와 ``DueTimeQueue`` 순서를 확인합니다.
+"""
+
+import importlib.util
+import os
+import shutil
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+
+from sqlalchemy import JSON, Column, DateTime, Integer, String, create_engine
+from sqlalchemy.orm import Session, declarative_base
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "src")
+spec = importlib.util.spec_from_file_location(
+    "reminder_queue", os.path.join(SRC_DIR, "core", "reminder_queue.py")
+)
+reminder_queue = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(reminder_queue)
+
+Base = declarative_base()
+
+
+class ReminderQueueItem(Base):
+    """리마인더 대기열 (database.models.ReminderQueueItem 과 같은 컬럼)"""
+
+    __tablename__ = "reminder_queue"
+
+    id = Column(String(36), primary_key=True)
+    entity_type = Column(String(50), nullable=False)
+    entity_id = Column(String(36), nullable=False)
+    fire_at = Column(DateTime, nullable=False)
+    status = Column(String(20), nullable=False, default="pending")
+    reminder_type = Column(String(50), nullable=False, default="notification")
+    payload = Column(JSON, nullable=True)
+    claimed_by = Column(String(100), nullable=True)
+    claimed_at = Column(DateTime, nullable=True)
+    attempts = Column(Integer, nullable=False, default=0)
+    created_at = Column(DateTime)
+    processed_at = Column(DateTime, nullable=True)
+
+
+class TestReminderQueue(unittest.TestCase):
+    """ReminderQueue 선점 테스트"""
+
+    def setUp(self):
+        """테스트 셋업 (발송 시각이 지난 todo 리마인더 3건, 일정 리마인더 1건)"""
+        self.tmpdir = tempfile.mkdtemp()
+        self.engine = create_engine(
+            f"sqlite:///{os.path.join(self.tmpdir, 'queue.db')}"
+        )
+        Base.metadata.create_all(self.engine)
+        self.queue = reminder_queue.ReminderQueue(ReminderQueueItem, "todo")
+        self.past = datetime.utcnow() - timedelta(minutes=1)
+        with Session(self.engine) as db:
+            self.ids = [
+                self.queue.enqueue(
+                    db, f"todo-{i}", self.past + timedelta(seconds=i)
+                ).id
+                for i in range(3)
+            ]
+            other = reminder_queue.ReminderQueue(ReminderQueueItem, "schedule")
+            self.other_id = other.enqueue(db, "schedule-1", self.past).id
+            db.commit()
+
+    def tearDown(self):
+        """테스트 정리"""
+        self.engine.dispose()
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def _statuses(self):
+        with Session(self.engine) as db:
+            return {item.id: item.status for item in db.query(ReminderQueueItem)}
+
+    def test_claim_leaves_transaction_to_caller(self):
+        """claim_due 가 커밋하지 않아 호출 측 롤백으로 선점이 취소되는지 테스트"""
+        with Session(self.engine) as db:
+            claimed = self.queue.claim_due(db, "worker-1")
+            self.assertEqual([item.id for item in claimed], self.ids)
+            db.rollback()
+        self.assertEqual(set(self._statuses().values()), {"pending"})
+
+    def test_claim_only_popped_ids_and_entity_type(self):
+        """지정한 ID 와 현재 엔티티 유형의 리마인더만 선점하는지 테스트"""
+        with Session(self.engine) as db:
+            claimed = self.queue.claim_due(
+                db, "worker-1", ids=[self.ids[1], self.other_id]
+            )
+            self.assertEqual([item.id for item in claimed], [self.ids[1]])
+            db.commit()
+        statuses = self._statuses()
+        self.assertEqual(statuses[self.ids[1]], "processing")
+        self.assertEqual(statuses[self.ids[0]], "pending")
+        self.assertEqual(statuses[self.other_id], "pending")
+
+    def test_committed_claim_is_not_claimed_twice(self):
+        """커밋된 선점은 다른 워커가 다시 선점하지 못하는지 테스트"""
+        with Session(self.engine) as first, Session(self.engine) as second:
+            self.assertEqual(len(self.queue.claim_due(first, "worker-1", limit=2)), 2)
+            first.commit()
+            claimed = self.queue.claim_due(second, "worker-2")
+            self.assertEqual([item.id for item in claimed], [self.ids[2]])
+            second.commit()
+
+    def test_fail_retries_then_fails(self):
+        """실패한 리마인더가 시도 한도까지 대기 상태로 돌아가는지 테스트"""
+        reminder_id = self.ids[0]
+        for attempt in range(1, 4):
+            with Session(self.engine) as db:
+                claimed = self.queue.claim_due(db, "worker-1", ids=[reminder_id])
+                self.assertEqual(len(claimed), 1)
+                self.queue.fail(db, [reminder_id], max_attempts=3)
+                db.commit()
+            expected = "failed" if attempt == 3 else "pending"
+            self.assertEqual(self._statuses()[reminder_id], expected)
+
+    def test_complete_and_discard(self):
+        """완료/취소 기록이 선점한 리마인더에 반영되는지 테스트"""
+        with Session(self.engine) as db:
+            self.queue.claim_due(db, "worker-1", ids=self.ids[:2])
+            self.queue.complete(db, [self.ids[0]])
+            self.queue.discard(db, [self.ids[1], self.ids[2]])
+            db.commit()
+        statuses = self._statuses()
+        self.assertEqual(statuses[self.ids[0]], "sent")
+        self.assertEqual(statuses[self.ids[1]], "cancelled")
+        self.assertEqual(statuses[self.ids[2]], "pending")
+
+
+class TestDueTimeQueue(unittest.TestCase):
+    """DueTimeQueue 테스트"""
+
+    def test_pop_due_in_order_with_limit(self):
+        """발송 시각 순으로 limit 만큼 꺼내고 갱신/제거를 반영하는지 테스트"""
+        now = datetime(2024, 1, 1, 12, 0)
+        queue = reminder_queue.DueTimeQueue()
+        for i, key in enumerate("abcd"):
+            queue.push(key, now - timedelta(minutes=4 - i))
+        queue.push("e", now + timedelta(minutes=1))
+        queue.push("a", now - timedelta(seconds=30))
+        queue.remove("c")
+
+        self.assertEqual(queue.pop_due(now, limit=2), ["b", "d"])
+        self.assertEqual(queue.pop_due(now), ["a"])
+        self.assertEqual(queue.seconds_until_next(30, now), 30)
+        self.assertEqual(queue.seconds_until_next(120, now), 60)
+
+
+if __name__ == "__main__":
+    unittest.main()
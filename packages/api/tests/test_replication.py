@@ -0,0 +1,304 @@
+"""
+ReplicationManager 와 BaseRepository 읽기 라우팅에 대한 테스트 모듈
+
+주 데이터베이스와 복제본을 별도 SQLite 파일로 만들어 복제본 라우팅,
+쓰기 후 주 데이터베이스 고정, 회로 차단기 동작을 확인합니다.
+"""
+
+import asyncio
+import importlib.util
+import os
+import shutil
+import sys
+import tempfile
+import time
+import types
+import unittest
+
+from sqlalchemy import Column, DateTime, ForeignKey, String, create_engine, text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import declarative_base, relationship
+
+# 앱 설정(환경 변수/DB) 없이 복제/리포지토리 모듈만 로드
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "src")
+LOG_DIR = tempfile.mkdtemp()
+os.environ.setdefault("LOG_DIR", LOG_DIR)
+sys.modules.setdefault(
+    "packages.api.src.coreconfig",
+    types.SimpleNamespace(settings=types.SimpleNamespace()),
+)
+
+
+def load(module, *aliases):
+    """core 모듈을 파일에서 로드해 다른 모듈이 import 하는 이름으로 등록"""
+    spec = importlib.util.spec_from_file_location(
+        module, os.path.join(SRC_DIR, "core", f"{module}.py")
+    )
+    loaded = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(loaded)
+    for alias in aliases:
+        sys.modules.setdefault(alias, loaded)
+    return loaded
+
+
+load("resilience", "packages.api.src.coreresilience")
+replication = load("replication", "packages.api.src.corereplication")
+aggregates = load(
+    "aggregates", "packages.api.src.coreaggregates", "packagescore.aggregates"
+)
+load("logging", "packages.api.src.corelogging")
+load("pagination", "packages.api.src.corepagination", "packagescore.pagination")
+base_repository = load("base_repository")
+
+Base = declarative_base()
+
+
+class Owner(Base):
+    """소유자 (지연 로딩 관계 확인용)"""
+
+    __tablename__ = "owners"
+
+    id = Column(String, primary_key=True)
+    name = Column(String, nullable=False)
+
+
+class Vehicle(Base):
+    """차량"""
+
+    __tablename__ = "vehicles"
+
+    id = Column(String, primary_key=True)
+    owner_id = Column(String, ForeignKey("owners.id"))
+    created_at = Column(DateTime)
+    owner = relationship(Owner)
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+class ReplicationTestCase(unittest.TestCase):
+    """주 데이터베이스/복제본 SQLite 픽스처"""
+
+    def setUp(self):
+        """테스트 셋업 (복제본에만 있는 행으로 라우팅 대상을 구분)"""
+        self.tmpdir = tempfile.mkdtemp()
+        self.primary_path = os.path.join(self.tmpdir, "primary.db")
+        self.replica_path = os.path.join(self.tmpdir, "replica.db")
+        for path, vehicle_ids in (
+            (self.primary_path, ["v1"]),
+            (self.replica_path, ["v1", "replica-only"]),
+        ):
+            engine = create_engine(f"sqlite:///{path}")
+            Base.metadata.create_all(engine)
+            with engine.begin() as connection:
+                connection.execute(
+                    text("INSERT INTO owners (id, name) VALUES ('o1', 'kim')")
+                )
+                for vehicle_id in vehicle_ids:
+                    connection.execute(
+                        text("INSERT INTO vehicles (id, owner_id) VALUES (:id, 'o1')"),
+                        {"id": vehicle_id},
+                    )
+            engine.dispose()
+
+        self.manager = replication.ReplicationManager()
+        self.manager.breaker_config.failure_threshold = 2
+        self.replica_url = f"sqlite+aiosqlite:///{self.replica_path}"
+        self.manager.register_nodes([{"url": self.replica_url, "name": "replica"}])
+        self.primary_engine = create_async_engine(
+            f"sqlite+aiosqlite:///{self.primary_path}"
+        )
+        self.manager.watch_writes(AsyncSession.sync_session_class)
+        # 전역 매니저 대신 테스트 매니저로 라우팅
+        self._global = base_repository.replication_manager
+        base_repository.replication_manager = self.manager
+        replication._primary_until.set(0.0)
+
+    def tearDown(self):
+        """테스트 정리"""
+        base_repository.replication_manager = self._global
+        run(self._dispose())
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    async def _dispose(self):
+        await self.manager.stop()
+        await self.primary_engine.dispose()
+
+    def _repository(self, session):
+        return base_repository.BaseRepository(session, Vehicle)
+
+
+class TestReplicaRouting(ReplicationTestCase):
+    """읽기 라우팅 테스트"""
+
+    def test_reads_use_healthy_replica(self):
+        """정상 복제본이 있으면 복제본에서 읽는지 테스트"""
+
+        async def scenario():
+            self.assertEqual(await self.manager.check_all(), 1)
+            async with AsyncSession(self.primary_engine) as session:
+                rows = await self._repository(session).find_all()
+                return sorted(vehicle.id for vehicle in rows)
+
+        self.assertEqual(run(scenario()), ["replica-only", "v1"])
+
+    def test_unchecked_replica_is_not_used(self):
+        """상태 확인 전 복제본으로는 라우팅하지 않는지 테스트"""
+
+        async def scenario():
+            async with AsyncSession(self.primary_engine) as session:
+                rows = await self._repository(session).find_all()
+                return [vehicle.id for vehicle in rows]
+
+        self.assertEqual(run(scenario()), ["v1"])
+
+    def test_replica_rows_are_attached_to_primary_session(self):
+        """복제본에서 읽은 객체가 주 세션에 연결되어 관계 로딩이 되는지 테스트"""
+
+        async def scenario():
+            await self.manager.check_all()
+            async with AsyncSession(self.primary_engine) as session:
+                rows = await self._repository(session).find_all(filters={"id": "v1"})
+                vehicle = rows[0]
+                self.assertIn(vehicle, session)
+                owner = await session.run_sync(lambda _: vehicle.owner)
+                return owner.name
+
+        self.assertEqual(run(scenario()), "kim")
+
+    def test_write_pins_reads_to_primary(self):
+        """세션 쓰기 후 read-your-writes 창 동안 주 데이터베이스에서 읽는지 테스트"""
+
+        async def scenario():
+            await self.manager.check_all()
+            async with AsyncSession(self.primary_engine) as session:
+                repository = self._repository(session)
+                await repository.create(Vehicle(id="v2", owner_id="o1"))
+                self.assertTrue(self.manager.is_pinned_to_primary())
+                return sorted(vehicle.id for vehicle in await repository.find_all())
+
+        self.assertEqual(run(scenario()), ["v1", "v2"])
+
+    def test_dml_execute_pins_reads_to_primary(self):
+        """ORM 밖의 DML 실행도 쓰기로 기록하는지 테스트"""
+
+        async def scenario():
+            await self.manager.check_all()
+            async with AsyncSession(self.primary_engine) as session:
+                await session.execute(text("DELETE FROM vehicles WHERE id = 'v1'"))
+                await session.commit()
+            return self.manager.is_pinned_to_primary()
+
+        self.assertTrue(run(scenario()))
+
+    def test_read_only_commit_does_not_pin(self):
+        """조회만 한 세션의 커밋은 고정하지 않는지 테스트"""
+
+        async def scenario():
+            async with AsyncSession(self.primary_engine) as session:
+                await session.execute(text("SELECT 1"))
+                await session.commit()
+            return self.manager.is_pinned_to_primary()
+
+        self.assertFalse(run(scenario()))
+
+
+class TestRecentWrites(ReplicationTestCase):
+    """키별 고정 정리 테스트"""
+
+    def test_expired_keys_are_evicted(self):
+        """창이 지난 키가 다음 쓰기 때 정리되는지 테스트"""
+        self.manager.read_your_writes_window = 0.01
+        for i in range(100):
+            self.manager.mark_write(f"user-{i}")
+        self.assertTrue(self.manager.is_pinned_to_primary("user-99"))
+        time.sleep(0.02)
+        self.manager.mark_write("latest")
+        self.assertEqual(list(self.manager._recent_writes), ["latest"])
+
+
+class TestCircuitBreaker(ReplicationTestCase):
+    """복제본 장애 시 회로 차단기 테스트"""
+
+    def test_failing_replica_opens_circuit_and_falls_back(self):
+        """연속 실패 시 회로가 열리고 읽기가 주 데이터베이스로 가는지 테스트"""
+        node = self.manager.replicas[self.replica_url]
+        node.lag_query = "SELECT lag FROM missing_table"
+
+        async def scenario():
+            for _ in range(3):
+                self.assertEqual(await self.manager.check_all(), 0)
+            self.assertEqual(node.breaker.state, replication.CircuitState.OPEN)
+            self.assertIsNone(self.manager.choose_replica())
+            async with AsyncSession(self.primary_engine) as session:
+                rows = await self._repository(session).find_all()
+                return [vehicle.id for vehicle in rows]
+
+        self.assertEqual(run(scenario()), ["v1"])
+
+    def test_circuit_recovers_after_timeout(self):
+        """복구 대기 시간이 지나면 복제본을 다시 사용하는지 테스트"""
+        self.manager.breaker_config.recovery_timeout = 0.01
+        node = self.manager.replicas[self.replica_url]
+        node.lag_query = "SELECT lag FROM missing_table"
+
+        async def scenario():
+            for _ in range(2):
+                await self.manager.check_all()
+            self.assertEqual(node.breaker.state, replication.CircuitState.OPEN)
+            node.lag_query = None
+            await asyncio.sleep(0.02)
+            return await self.manager.check_all()
+
+        self.assertEqual(run(scenario()), 1)
+        self.assertIs(self.manager.choose_replica(), node)
+
+
+class TestReplicaFailures(ReplicationTestCase):
+    """복제 지연, 연결 오류, 잘못된 노드 설정 처리 테스트"""
+
+    def test_lagging_replica_is_not_used(self):
+        """복제 지연이 임계값을 넘는 복제본은 비정상으로 보고 주 데이터베이스에서 읽는지 테스트"""
+        node = self.manager.replicas[self.replica_url]
+        node.lag_query = f"SELECT {self.manager.replication_lag_threshold + 60}"
+
+        async def scenario():
+            self.assertEqual(await self.manager.check_all(), 0)
+            async with AsyncSession(self.primary_engine) as session:
+                rows = await self._repository(session).find_all()
+                return [vehicle.id for vehicle in rows]
+
+        self.assertEqual(run(scenario()), ["v1"])
+        self.assertFalse(node.healthy)
+        self.assertIn("복제 지연", node.last_error)
+
+    def test_connection_error_marks_replica_unhealthy(self):
+        """복제본 세션의 연결 오류는 전달하고 다음 확인 전까지 라우팅에서 제외하는지 테스트"""
+        node = self.manager.replicas[self.replica_url]
+
+        async def scenario():
+            await self.manager.check_all()
+            async with AsyncSession(self.primary_engine) as primary:
+                with self.assertRaises(DBAPIError):
+                    async with self.manager.read_session(primary) as session:
+                        self.assertIsNot(session, primary)
+                        raise DBAPIError("SELECT 1", {}, OSError("connection reset"))
+                async with self.manager.read_session(primary) as session:
+                    return session is primary
+
+        self.assertTrue(run(scenario()))
+        self.assertFalse(node.healthy)
+        self.assertEqual(node.in_flight, 0)
+
+    def test_invalid_node_configuration(self):
+        """잘못된 노드 설정은 등록 실패로 반환하는지 테스트"""
+        self.assertFalse(
+            self.manager.register_nodes([{"url": "sqlite+aiosqlite://", "weight": "x"}])
+        )
+        self.assertEqual(list(self.manager.replicas), [self.replica_url])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,133 @@
+"""
+RouteMetrics 에 대한 테스트 모듈
+
+flush() 는 히스토그램 자식의 내부 속성(``_buckets``, ``_sum``)에 증가분을 직접
+더하므로, prometheus_client 가 바뀌어도 ``observe()`` 와 같은 결과가 나오는지
+확인합니다.
+"""
+
+import importlib.util
+import os
+import unittest
+
+from prometheus_client import CollectorRegistry, Histogram
+
+# 앱 패키지 초기화(설정/DB) 없이 요청 메트릭 모듈만 로드
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "src")
+spec = importlib.util.spec_from_file_location(
+    "request_metrics", os.path.join(SRC_DIR, "core", "request_metrics.py")
+)
+request_metrics = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(request_metrics)
+
+
+class FakeRoute:
+    """매칭된 라우트 (템플릿만 필요)"""
+
+    def __init__(self, path_format):
+        self.path_format = path_format
+
+
+def samples(registry, name):
+    """메트릭 이름별 샘플 값 (레이블 포함)"""
+    return {
+        (sample.name, tuple(sorted(sample.labels.items()))): sample.value
+        for metric in registry.collect()
+        if metric.name == name
+        for sample in metric.samples
+        if not sample.name.endswith("_created")
+    }
+
+
+class TestRouteMetrics(unittest.TestCase):
+    """RouteMetrics 클래스 테스트"""
+
+    DURATIONS = [0.001, 0.004, 0.03, 0.2, 0.2, 1.5, 7.0, 30.0]
+
+    def setUp(self):
+        """테스트 셋업"""
+        self.registry = CollectorRegistry()
+        self.metrics = request_metrics.RouteMetrics(registry=self.registry)
+
+    def test_flush_matches_observe(self):
+        """flush 로 반영한 히스토그램이 observe() 결과와 같은지 테스트"""
+        expected_registry = CollectorRegistry()
+        expected = Histogram(
+            "http_route_request_duration_seconds",
+            "",
+            ["method", "route"],
+            registry=expected_registry,
+        )
+        for duration in self.DURATIONS:
+            self.metrics.observe("GET", "/vehicles/{vehicle_id}", 200, duration)
+            expected.labels(method="GET", route="/vehicles/{vehicle_id}").observe(
+                duration
+            )
+
+        self.assertEqual(self.metrics.flush(), len(self.DURATIONS))
+        name = "http_route_request_duration_seconds"
+        self.assertEqual(
+            samples(self.registry, name), samples(expected_registry, name)
+        )
+
+    def test_flush_accumulates_across_calls(self):
+        """여러 번 반영해도 값이 누적되는지 테스트"""
+        for _ in range(2):
+            self.metrics.observe("GET", "/todos/{todo_id}", 200, 0.01)
+            self.metrics.observe("GET", "/todos/{todo_id}", 500, 0.02)
+            self.metrics.flush()
+
+        counts = samples(self.registry, "http_route_requests")
+        labels = (("method", "GET"), ("route", "/todos/{todo_id}"))
+        self.assertEqual(
+            counts[("http_route_requests_total", labels + (("status", "200"),))], 2
+        )
+        self.assertEqual(
+            counts[("http_route_requests_total", labels + (("status", "500"),))], 2
+        )
+        histogram = samples(self.registry, "http_route_request_duration_seconds")
+        self.assertEqual(
+            histogram[("http_route_request_duration_seconds_count", labels)], 4
+        )
+        self.assertAlmostEqual(
+            histogram[("http_route_request_duration_seconds_sum", labels)], 0.06
+        )
+
+    def test_observe_scope_uses_route_template(self):
+        """경로 대신 라우트 템플릿으로 기록하는지 테스트"""
+        scope = {"method": "PUT", "route": FakeRoute("/maintenance/{record_id}")}
+        self.metrics.observe_scope(scope, 204, 0.05)
+        self.metrics.observe_scope({"method": "BREW"}, 404, 0.05)
+        self.metrics.flush()
+
+        counts = samples(self.registry, "http_route_requests")
+        self.assertEqual(
+            counts[
+                (
+                    "http_route_requests_total",
+                    (
+                        ("method", "PUT"),
+                        ("route", "/maintenance/{record_id}"),
+                        ("status", "204"),
+                    ),
+                )
+            ],
+            1,
+        )
+        self.assertEqual(
+            counts[
+                (
+                    "http_route_requests_total",
+                    (
+                        ("method", request_metrics.OTHER_METHOD),
+                        ("route", request_metrics.UNMATCHED_ROUTE),
+                        ("status", "404"),
+                    ),
+                )
+            ],
+            1,
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
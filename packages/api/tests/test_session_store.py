@@ -0,0 +1,153 @@
+"""
+세션 저장소(session_store)에 대한 테스트 모듈
+
+fakeredis 정렬 집합과 메모리 저장소로 세션 추가/조회/제거, 만료 세션 정리,
+이전 형식 키의 WRONGTYPE 처리와 동시 로그인에서 세션이 유실되지 않는지 확인합니다.
+"""
+
+import importlib.util
+import os
+import sys
+import tempfile
+import threading
+import time
+import types
+import unittest
+
+import fakeredis
+
+# 앱 설정(환경 변수/DB) 없이 세션 저장소 모듈만 로드
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "src")
+os.environ.setdefault("LOG_DIR", tempfile.mkdtemp())
+sys.modules.setdefault(
+    "packages.api.src.coreconfig",
+    types.SimpleNamespace(settings=types.SimpleNamespace()),
+)
+
+
+def load(module, *aliases):
+    """core 모듈을 파일에서 로드해 다른 모듈이 import 하는 이름으로 등록 (한 번만)"""
+    if aliases and aliases[0] in sys.modules:
+        return sys.modules[aliases[0]]
+    spec = importlib.util.spec_from_file_location(
+        module, os.path.join(SRC_DIR, "core", f"{module}.py")
+    )
+    loaded = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(loaded)
+    for alias in aliases:
+        sys.modules.setdefault(alias, loaded)
+    return loaded
+
+
+session_store = load("session_store", "packages.api.src.coresession_store")
+
+
+class SessionStoreCases:
+    """저장소 구현 공통 테스트"""
+
+    def make_store(self):
+        raise NotImplementedError
+
+    def setUp(self):
+        """테스트 셋업"""
+        self.store = self.make_store()
+        self.now = time.time()
+
+    def test_add_contains_remove(self):
+        """세션 추가/확인/제거와 사용자 단위 제거 테스트"""
+        self.store.add("1", "a", self.now + 60)
+        self.store.add("1", "b", self.now + 30)
+        self.assertTrue(self.store.contains("1", "a"))
+        self.assertFalse(self.store.contains("1", "missing"))
+        self.assertFalse(self.store.contains("2", "a"))
+        self.assertEqual(self.store.active("1"), ["b", "a"])
+
+        self.assertTrue(self.store.remove("1", "a"))
+        self.assertFalse(self.store.remove("1", "a"))
+        self.assertEqual(self.store.remove_all("1"), 1)
+        self.assertEqual(self.store.remove_all("1"), 0)
+        self.assertEqual(self.store.active("1"), [])
+
+    def test_expired_sessions_are_pruned(self):
+        """만료된 세션은 유효하지 않고 추가/조회 시 정리되는지 테스트"""
+        self.store.add("1", "old", self.now - 1)
+        self.assertFalse(self.store.contains("1", "old"))
+        self.store.add("1", "new", self.now + 60)
+        self.assertEqual(self.store.active("1"), ["new"])
+
+    def test_concurrent_logins_are_kept(self):
+        """동시에 추가한 세션이 하나도 유실되지 않는지 테스트"""
+        threads = [
+            threading.Thread(
+                target=self.store.add, args=("1", f"jti-{i}", self.now + 60)
+            )
+            for i in range(20)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(self.store.active("1")), 20)
+
+
+class TestRedisSessionStore(SessionStoreCases, unittest.TestCase):
+    """RedisSessionStore 테스트"""
+
+    def make_store(self):
+        self.redis = fakeredis.FakeRedis()
+        return session_store.RedisSessionStore(self.redis)
+
+    def test_key_expires_with_latest_session(self):
+        """키 만료 시각이 가장 늦은 세션에 맞춰 연장만 되는지 테스트"""
+        key = self.store.key("1")
+        self.store.add("1", "late", self.now + 600)
+        self.store.add("1", "early", self.now + 60)
+        self.assertGreater(self.redis.ttl(key), 500)
+
+    def test_legacy_key_is_replaced(self):
+        """이전 형식(문자열) 키는 조회 시 무효로, 추가 시 새 형식으로 바꾸는지 테스트"""
+        key = self.store.key("1")
+        self.redis.set(key, '["a"]')
+        self.assertFalse(self.store.contains("1", "a"))
+        self.store.add("1", "b", self.now + 60)
+        self.assertEqual(self.store.active("1"), ["b"])
+
+    def test_other_redis_errors_propagate(self):
+        """WRONGTYPE 이 아닌 Redis 오류는 숨기지 않는지 테스트"""
+
+        class DownRedis:
+            def zscore(self, key, member):
+                raise ConnectionError("redis unavailable")
+
+        store = session_store.RedisSessionStore(DownRedis())
+        with self.assertRaises(ConnectionError):
+            store.contains("1", "a")
+
+    def test_parse_check(self):
+        """파이프라인 결과 해석 테스트 (없음/오류/만료/유효)"""
+        parse = session_store.RedisSessionStore.parse_check
+        self.assertFalse(parse(None))
+        self.assertFalse(parse(ValueError("WRONGTYPE")))
+        self.assertFalse(parse(str(self.now - 1)))
+        self.assertTrue(parse(self.now + 60))
+
+
+class TestInMemorySessionStore(SessionStoreCases, unittest.TestCase):
+    """InMemorySessionStore 테스트"""
+
+    def make_store(self):
+        return session_store.InMemorySessionStore()
+
+    def test_factory(self):
+        """Redis 유무에 따른 저장소 선택 테스트"""
+        self.assertIs(
+            session_store.create_session_store(), session_store.memory_session_store
+        )
+        self.assertIsInstance(
+            session_store.create_session_store(fakeredis.FakeRedis()),
+            session_store.RedisSessionStore,
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,158 @@
+"""
+ShardingManager 에 대한 테스트 모듈
+
+여러 SQLite 파일을 샤드로 등록해 vehicle_id 기준 라우팅, 노드 재등록,
+scatter-gather 병합을 확인합니다.
+"""
+
+import importlib.util
+import os
+import shutil
+import sys
+import tempfile
+import types
+import unittest
+
+from sqlalchemy import Column, Float, String, func
+from sqlalchemy.orm import declarative_base
+
+# 앱 설정(환경 변수/DB) 없이 샤딩 모듈만 로드
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "src")
+config = sys.modules.setdefault(
+    "packages.api.src.coreconfig",
+    types.SimpleNamespace(settings=types.SimpleNamespace(DB_SHARD_URLS=None)),
+)
+test_settings = config.settings
+spec = importlib.util.spec_from_file_location(
+    "sharding", os.path.join(SRC_DIR, "core", "sharding.py")
+)
+sharding = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(sharding)
+
+Base = declarative_base()
+
+
+class Record(Base):
+    """샤드 테이블 (정비 기록 축약)"""
+
+    __tablename__ = "maintenance"
+
+    id = Column(String, primary_key=True)
+    vehicle_id = Column(String, nullable=False)
+    cost = Column(Float, nullable=False)
+
+
+class TestShardingManager(unittest.TestCase):
+    """다중 SQLite 샤드 테스트"""
+
+    SHARDS = ("shard1", "shard2", "shard3")
+
+    def setUp(self):
+        """테스트 셋업"""
+        self.tmpdir = tempfile.mkdtemp()
+        self.nodes = [
+            {"name": name, "url": f"sqlite:///{os.path.join(self.tmpdir, name)}.db"}
+            for name in self.SHARDS
+        ]
+        self.manager = sharding.ShardingManager()
+        self.manager.initialize({"strategy": "consistent_hashing"})
+        self.manager.register_nodes(self.nodes)
+        self.manager.set_shard_key("vehicle_id")
+        for name in self.SHARDS:
+            Base.metadata.create_all(self.manager.get_engine(name))
+
+    def tearDown(self):
+        """테스트 정리"""
+        self.manager.dispose()
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def _insert(self, count):
+        """차량별 기록을 담당 샤드에 저장"""
+        for i in range(count):
+            vehicle_id = f"vehicle-{i}"
+            with self.manager.session_for(vehicle_id) as db:
+                db.add(Record(id=f"m-{i}", vehicle_id=vehicle_id, cost=float(i)))
+                db.commit()
+
+    def test_records_routed_by_vehicle_id(self):
+        """기록이 vehicle_id 담당 샤드에만 저장되는지 테스트"""
+        self._insert(60)
+
+        counts = self.manager.scatter(lambda db: db.query(Record).count())
+        self.assertEqual(sum(counts.values()), 60)
+        self.assertTrue(all(counts.values()), counts)
+
+        for i in range(60):
+            vehicle_id = f"vehicle-{i}"
+            owner = self.manager.shard_for({"vehicle_id": vehicle_id})
+            found = self.manager.scatter(
+                lambda db: db.query(Record).filter_by(vehicle_id=vehicle_id).count()
+            )
+            self.assertEqual({name for name, n in found.items() if n}, {owner})
+
+    def test_query_all_merges_shards(self):
+        """샤드별 정렬 결과를 병합해 페이지 단위로 반환하는지 테스트"""
+        self._insert(30)
+
+        def build(db, fetch):
+            query = db.query(Record.id, Record.cost).order_by(Record.cost.desc())
+            return [row._asdict() for row in query.limit(fetch)]
+
+        page = self.manager.query_all(
+            build, order_by=[("cost", True)], skip=5, limit=10
+        )
+        self.assertEqual([row["cost"] for row in page], list(range(24, 14, -1)))
+        total = self.manager.aggregate(
+            lambda db: db.query(func.sum(Record.cost)).scalar()
+        )
+        self.assertEqual(total, sum(range(30)))
+
+    def test_register_same_nodes_is_noop(self):
+        """같은 노드를 다시 등록하면 엔진이 유지되는지 테스트"""
+        engine = self.manager.get_engine("shard1")
+        self.assertTrue(self.manager.register_nodes(list(self.nodes)))
+        self.assertIs(self.manager.get_engine("shard1"), engine)
+
+        self.manager.register_nodes(self.nodes[:2])
+        self.assertIsNot(self.manager.get_engine("shard1"), engine)
+        self.assertEqual(self.manager.shard_names, ["shard1", "shard2"])
+
+    def test_unregistered_shard_raises_routing_error(self):
+        """범위 규칙이 등록되지 않은 샤드를 가리키면 명확한 오류를 내는지 테스트"""
+        self.manager.initialize({"strategy": "range"})
+        self.manager.set_distribution_strategy(
+            {
+                "type": "range",
+                "ranges": [{"min": "00000000", "max": "ffffffff", "shard": "shard9"}],
+            }
+        )
+        shard_key = self.manager.get_shard_key("vehicle-1")
+        with self.assertRaises(sharding.ShardRoutingError):
+            self.manager.get_shard_id(shard_key)
+
+        empty = sharding.ShardingManager()
+        empty.register_nodes([])
+        with self.assertRaises(sharding.ShardRoutingError):
+            empty.shard_for("vehicle-1")
+
+    def test_shard_nodes_from_settings(self):
+        """DB_SHARD_URLS 설정을 노드 목록으로 변환하는지 테스트"""
+        test_settings.DB_SHARD_URLS = (
+            "east=sqlite:///east.db, sqlite:///second.db,,west=sqlite:///west.db"
+        )
+        try:
+            nodes = self.manager.shard_nodes_from_settings()
+        finally:
+            test_settings.DB_SHARD_URLS = None
+        self.assertEqual(
+            nodes,
+            [
+                {"name": "east", "url": "sqlite:///east.db"},
+                {"name": "shard2", "url": "sqlite:///second.db"},
+                {"name": "west", "url": "sqlite:///west.db"},
+            ],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
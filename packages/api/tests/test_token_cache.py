@@ -0,0 +1,172 @@
+"""
+검증 토큰 캐시(token_cache)에 대한 테스트 모듈
+
+캐시 적중 조건(같은 토큰 문자열, 만료 전), LRU 제한, jti/사용자 단위 무효화와
+fakeredis pub/sub 로 다른 워커 캐시에 무효화가 전파되는지, 전파/구독 오류 시
+로컬 캐시를 안전하게 처리하는지 확인합니다.
+"""
+
+import asyncio
+import importlib.util
+import os
+import sys
+import tempfile
+import time
+import types
+import unittest
+
+import fakeredis
+
+# 앱 설정(환경 변수/DB) 없이 토큰 캐시 모듈만 로드
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "src")
+os.environ.setdefault("LOG_DIR", tempfile.mkdtemp())
+sys.modules.setdefault(
+    "packages.api.src.coreconfig",
+    types.SimpleNamespace(settings=types.SimpleNamespace()),
+)
+
+
+def load(module, *aliases):
+    """core 모듈을 파일에서 로드해 다른 모듈이 import 하는 이름으로 등록 (한 번만)"""
+    if aliases and aliases[0] in sys.modules:
+        return sys.modules[aliases[0]]
+    spec = importlib.util.spec_from_file_location(
+        module, os.path.join(SRC_DIR, "core", f"{module}.py")
+    )
+    loaded = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(loaded)
+    for alias in aliases:
+        sys.modules.setdefault(alias, loaded)
+    return loaded
+
+
+token_cache = load("token_cache", "packages.api.src.coretoken_cache")
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+def claims(jti, sub="1", exp_in=3600):
+    return {"jti": jti, "sub": sub, "exp": time.time() + exp_in}
+
+
+class BrokenRedis:
+    """publish 가 항상 실패하는 Redis 클라이언트"""
+
+    def publish(self, channel, message):
+        raise ConnectionError("redis unavailable")
+
+
+class BrokenPubSub:
+    """구독 중 연결이 끊기는 pub/sub"""
+
+    async def subscribe(self, channel):
+        pass
+
+    async def listen(self):
+        yield {"type": "subscribe", "data": 1}
+        raise ConnectionError("connection lost")
+
+    async def aclose(self):
+        pass
+
+
+class TestVerifiedTokenCache(unittest.TestCase):
+    """VerifiedTokenCache 테스트"""
+
+    def setUp(self):
+        """테스트 셋업"""
+        self.cache = token_cache.VerifiedTokenCache(max_size=2, ttl=60)
+
+    def test_hit_requires_same_token_and_unexpired_entry(self):
+        """같은 jti 라도 토큰 문자열이 다르거나 만료되었으면 적중하지 않는지 테스트"""
+        self.cache.put("token-a", claims("a"))
+        self.assertEqual(self.cache.get("a", "token-a")["jti"], "a")
+        self.assertIsNone(self.cache.get("a", "forged"))
+
+        self.cache.put("token-b", claims("b", exp_in=-1))
+        self.assertIsNone(self.cache.get("b", "token-b"))
+        self.assertEqual(len(self.cache), 1)
+        self.assertEqual(self.cache.get_stats()["hits"], 1)
+        self.assertEqual(self.cache.get_stats()["misses"], 2)
+
+    def test_lru_limit(self):
+        """최대 수를 넘으면 가장 오래 사용하지 않은 토큰을 제거하는지 테스트"""
+        self.cache.put("token-a", claims("a"))
+        self.cache.put("token-b", claims("b"))
+        self.cache.get("a", "token-a")
+        self.cache.put("token-c", claims("c"))
+        self.assertIsNone(self.cache.get("b", "token-b"))
+        self.assertIsNotNone(self.cache.get("a", "token-a"))
+
+    def test_revoke_by_jti_and_subject(self):
+        """jti/사용자 단위 무효화 메시지 적용 테스트"""
+        cache = token_cache.VerifiedTokenCache(max_size=10)
+        cache.put("token-a", claims("a", sub="1"))
+        cache.put("token-b", claims("b", sub="1"))
+        cache.put("token-c", claims("c", sub="2"))
+        cache.apply({"jti": "c"})
+        self.assertIsNone(cache.get("c", "token-c"))
+        cache.apply({"sub": 1})
+        self.assertEqual(len(cache), 0)
+        cache.apply({})
+
+
+class TestTokenRevocationBus(unittest.TestCase):
+    """TokenRevocationBus 테스트"""
+
+    def test_revocation_reaches_other_worker(self):
+        """한 워커의 무효화가 pub/sub 로 다른 워커 캐시에 적용되는지 테스트"""
+        server = fakeredis.FakeServer()
+        publisher = token_cache.TokenRevocationBus(token_cache.VerifiedTokenCache())
+        worker_cache = token_cache.VerifiedTokenCache()
+        subscriber = token_cache.TokenRevocationBus(worker_cache)
+        worker_cache.put("token-a", claims("a"))
+        worker_cache.put("token-b", claims("b"))
+
+        async def scenario():
+            await subscriber.start(fakeredis.FakeAsyncRedis(server=server))
+            redis_client = fakeredis.FakeRedis(server=server)
+            # 해석할 수 없는 메시지는 무시하고 계속 구독
+            redis_client.publish(token_cache.REVOCATION_CHANNEL, "not-json")
+            publisher.publish(redis_client, {"jti": "a"})
+            for _ in range(50):
+                await asyncio.sleep(0.01)
+                if len(worker_cache) == 1:
+                    break
+            listening = subscriber.listening
+            await subscriber.stop()
+            return listening
+
+        self.assertTrue(run(scenario()))
+        self.assertIsNone(worker_cache.get("a", "token-a"))
+        self.assertIsNotNone(worker_cache.get("b", "token-b"))
+
+    def test_publish_failure_still_revokes_locally(self):
+        """Redis 전파가 실패해도 로컬 캐시에서는 제거하는지 테스트"""
+        cache = token_cache.VerifiedTokenCache()
+        cache.put("token-a", claims("a"))
+        token_cache.TokenRevocationBus(cache).publish(BrokenRedis(), {"jti": "a"})
+        self.assertEqual(len(cache), 0)
+
+    def test_listener_failure_clears_cache(self):
+        """구독이 끊기면 무효화를 받을 수 없으므로 캐시를 비우는지 테스트"""
+        cache = token_cache.VerifiedTokenCache()
+        cache.put("token-a", claims("a"))
+        bus = token_cache.TokenRevocationBus(cache)
+        redis_client = types.SimpleNamespace(pubsub=BrokenPubSub)
+
+        async def scenario():
+            await bus.start(redis_client)
+            await asyncio.sleep(0.01)
+            listening = bus.listening
+            await bus.stop()
+            return listening
+
+        self.assertFalse(run(scenario()))
+        self.assertEqual(len(cache), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,144 @@
+"""
+웹소켓 팬아웃(websocket_fanout)에 대한 테스트 모듈
+
+가상 웹소켓으로 한 번 직렬화한 프레임 전달, 느린 소비자 축출,
+같은 키로 재연결한 뒤의 축출 범위와 미전송 프레임 기록을 확인합니다.
+"""
+
+import asyncio
+import importlib.util
+import os
+import unittest
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "src")
+spec = importlib.util.spec_from_file_location(
+    "websocket_fanout", os.path.join(SRC_DIR, "core", "websocket_fanout.py")
+)
+websocket_fanout = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(websocket_fanout)
+
+
+class FakeWebSocket:
+    """전송 지연을 흉내 내는 가상 웹소켓"""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.frames = []
+        self.close_code = None
+
+    async def send_text(self, data: str) -> None:
+        await asyncio.sleep(self.delay)
+        self.frames.append(data)
+
+    async def close(self, code: int = 1000) -> None:
+        self.close_code = code
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+class TestFanoutHub(unittest.TestCase):
+    """FanoutHub 테스트"""
+
+    def test_publish_sends_same_frame_to_all(self):
+        """모든 연결이 같은 직렬화 프레임을 받고 전송 완료 콜백이 호출되는지 테스트"""
+
+        async def scenario():
+            hub = websocket_fanout.FanoutHub()
+            sockets = {key: FakeWebSocket() for key in range(3)}
+            for key, websocket in sockets.items():
+                hub.add(key, websocket)
+            sent = []
+            enqueued = hub.publish({"type": "hello", "data": "안녕"}, [0, 1, 2, 9], sent.append)
+            await hub.drain(timeout=1)
+            await hub.close()
+            return enqueued, sockets, sorted(sent), hub.metrics.snapshot()
+
+        enqueued, sockets, sent, metrics = run(scenario())
+        self.assertEqual(enqueued, 3)
+        self.assertEqual(sent, [0, 1, 2])
+        frames = {websocket.frames[0] for websocket in sockets.values()}
+        self.assertEqual(frames, {'{"type":"hello","data":"안녕"}'})
+        self.assertEqual(metrics["frames_sent"], 3)
+
+    def test_full_queue_evicts_slow_consumer(self):
+        """전송 큐가 가득 찬 연결만 축출되고 미전송 프레임이 기록되는지 테스트"""
+
+        async def scenario():
+            evicted = []
+
+            async def on_evict(key):
+                evicted.append(key)
+
+            hub = websocket_fanout.FanoutHub(max_queue=2, on_evict=on_evict)
+            fast = FakeWebSocket()
+            hub.add("fast", fast)
+            hub.add("slow", FakeWebSocket(delay=10))
+            for i in range(5):
+                hub.publish({"n": i}, ["fast", "slow"])
+                await asyncio.sleep(0)
+            await hub.drain(timeout=1)
+            await hub.close()
+            return evicted, fast, hub.metrics.snapshot()
+
+        evicted, fast, metrics = run(scenario())
+        self.assertEqual(evicted, ["slow"])
+        self.assertEqual(len(fast.frames), 5)
+        self.assertEqual(metrics["evictions"], 1)
+        self.assertGreater(metrics["frames_discarded"], 0)
+
+    def test_stale_sender_does_not_evict_reconnected_client(self):
+        """재연결 후 이전 연결의 전송 제한 시간 초과가 새 연결을 끊지 않는지 테스트"""
+
+        async def scenario():
+            evicted = []
+
+            async def on_evict(key):
+                evicted.append(key)
+
+            hub = websocket_fanout.FanoutHub(send_timeout=0.05, on_evict=on_evict)
+            stale = FakeWebSocket(delay=10)
+            old_sender = hub.add("user", stale)
+            hub.publish({"n": 1}, ["user"])
+            await asyncio.sleep(0)
+
+            fresh = FakeWebSocket()
+            new_sender = hub.add("user", fresh)
+            # 교체 직후 이전 전송기가 축출을 시도해도 새 전송기는 유지
+            hub.evict(old_sender, "전송 제한 시간 초과")
+            await asyncio.sleep(0.1)
+            hub.publish({"n": 2}, ["user"])
+            await hub.drain(timeout=1)
+            still_registered = hub.senders.get("user") is new_sender
+            await hub.close()
+            return evicted, fresh, still_registered, hub.metrics.evictions
+
+        evicted, fresh, still_registered, evictions = run(scenario())
+        self.assertTrue(still_registered)
+        self.assertEqual(evicted, [])
+        self.assertEqual(evictions, 0)
+        self.assertEqual(fresh.frames, ['{"n":2}'])
+
+    def test_send_timeout_evicts_and_closes(self):
+        """전송 제한 시간을 넘으면 축출하고 느린 소비자 코드로 연결을 닫는지 테스트"""
+
+        async def scenario():
+            hub = websocket_fanout.FanoutHub(send_timeout=0.05)
+            websocket = FakeWebSocket(delay=10)
+            hub.add("user", websocket)
+            hub.publish({"n": 1}, ["user"])
+            await asyncio.sleep(0.2)
+            await hub.close()
+            return websocket, hub
+
+        websocket, hub = run(scenario())
+        self.assertNotIn("user", hub)
+        self.assertEqual(
+            websocket.close_code, websocket_fanout.SLOW_CONSUMER_CLOSE_CODE
+        )
+        self.assertEqual(hub.metrics.frames_discarded, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,129 @@
+"""
+웹소켓 매니저의 워커 간 이벤트 수신과 오프라인 파일 큐에 대한 테스트 모듈
+
+가짜 Redis(fakeredis) 채널로 ``websocket_events`` 수신 루프의 처리량을, 임시
+디렉터리로 파일 큐의 워커 전용 디렉터리 선점을 확인합니다.
+"""
+
+import asyncio
+import importlib.util
+import os
+import shutil
+import sys
+import tempfile
+import time
+import types
+import unittest
+
+import fakeredis.aioredis
+
+# 앱 설정(환경 변수/Redis) 없이 웹소켓 모듈만 로드
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "src")
+os.environ.setdefault("LOG_DIR", tempfile.mkdtemp())
+sys.modules.setdefault(
+    "packages.api.src.coreconfig",
+    types.SimpleNamespace(settings=types.SimpleNamespace()),
+)
+sys.modules.setdefault(
+    "packages.api.src.coremetrics",
+    types.SimpleNamespace(
+        metrics_collector=types.SimpleNamespace(update_connection_count=lambda n: None)
+    ),
+)
+
+
+def load(module, *aliases):
+    """core 모듈을 파일에서 로드해 다른 모듈이 import 하는 이름으로 등록"""
+    spec = importlib.util.spec_from_file_location(
+        module, os.path.join(SRC_DIR, "core", f"{module}.py")
+    )
+    loaded = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(loaded)
+    for alias in aliases:
+        sys.modules.setdefault(alias, loaded)
+    return loaded
+
+
+load("logging", "packages.api.src.corelogging")
+load("websocket_fanout", "packages.api.src.corewebsocket_fanout")
+offline_queue = load(
+    "websocket_offline_queue", "packages.api.src.corewebsocket_offline_queue"
+)
+websocket_manager = load("websocket_manager")
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+class TestRedisEventListener(unittest.TestCase):
+    """websocket_events 수신 루프 테스트"""
+
+    def test_events_not_throttled_per_message(self):
+        """메시지마다 대기하지 않고 연속 이벤트를 바로 처리하는지 테스트"""
+
+        async def scenario():
+            redis = fakeredis.aioredis.FakeRedis(decode_responses=True)
+            manager = websocket_manager.WebSocketManager()
+            manager.redis = redis
+            manager.pubsub = redis.pubsub()
+            await manager.pubsub.subscribe(websocket_manager.EVENTS_CHANNEL)
+
+            received = []
+
+            async def handler(data):
+                received.append(data["n"])
+
+            manager.register_event_handler("test", handler)
+            manager._listener_task = asyncio.create_task(
+                manager._redis_message_handler()
+            )
+            started = time.monotonic()
+            for n in range(50):
+                await redis.publish(
+                    websocket_manager.EVENTS_CHANNEL,
+                    f'{{"event_type": "test", "data": {{"n": {n}}}}}',
+                )
+            while len(received) < 50 and time.monotonic() - started < 5:
+                await asyncio.sleep(0.01)
+            elapsed = time.monotonic() - started
+            await manager.close()
+            return received, elapsed
+
+        received, elapsed = run(scenario())
+        self.assertEqual(received, list(range(50)))
+        self.assertLess(elapsed, 2)
+
+
+class TestFileMessageQueueWorkerSlots(unittest.TestCase):
+    """FileMessageQueue.for_worker 테스트"""
+
+    def setUp(self):
+        """테스트 셋업"""
+        self.tmpdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """테스트 정리"""
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    @unittest.skipIf(offline_queue.fcntl is None, "flock 미지원 환경")
+    def test_workers_get_separate_directories(self):
+        """워커마다 다른 디렉터리를 쓰고 해제된 슬롯을 다시 쓰는지 테스트"""
+        first = offline_queue.FileMessageQueue.for_worker(self.tmpdir)
+        second = offline_queue.FileMessageQueue.for_worker(self.tmpdir)
+        self.assertNotEqual(first.base_dir, second.base_dir)
+
+        self.assertEqual(run(first.append("user", {"n": 1})), "1")
+        self.assertEqual(run(second.append("user", {"n": 2})), "1")
+        self.assertEqual(run(first.read("user")), [("1", {"n": 1})])
+
+        first.close()
+        reused = offline_queue.FileMessageQueue.for_worker(self.tmpdir)
+        self.assertEqual(reused.base_dir, first.base_dir)
+        self.assertEqual(run(reused.read("user")), [("1", {"n": 1})])
+        second.close()
+        reused.close()
+
+
+if __name__ == "__main__":
+    unittest.main()